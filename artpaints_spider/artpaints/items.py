@@ -19,3 +19,5 @@ class ArtPaintsItem(scrapy.Item):
     r = scrapy.Field()
     g = scrapy.Field()
     b = scrapy.Field()
+    # Names of the sets the color appears in (Unison)
+    sets = scrapy.Field()
@@ -88,3 +88,19 @@ ROBOTSTXT_OBEY = True
 #HTTPCACHE_DIR = 'httpcache'
 #HTTPCACHE_IGNORE_HTTP_CODES = []
 #HTTPCACHE_STORAGE = 'scrapy.extensions.httpcache.FilesystemCacheStorage'
+
+# Per-request crawl telemetry (artpaints/telemetry.py). The components
+# are inactive unless CRAWL_TELEMETRY_JSONL or CRAWL_TELEMETRY_PORT is set,
+# e.g. with -s CRAWL_TELEMETRY_JSONL=telemetry.jsonl -s CRAWL_TELEMETRY_PORT=9108
+CRAWL_TELEMETRY_JSONL = None
+CRAWL_TELEMETRY_PORT = 0
+CRAWL_TELEMETRY_SUMMARY_INTERVAL = 60
+SPIDER_MIDDLEWARES = {
+    'artpaints.telemetry.CrawlTelemetrySpiderMiddleware': 10,
+}
+DOWNLOADER_MIDDLEWARES = {
+    'artpaints.telemetry.CrawlTelemetryDownloaderMiddleware': 950,
+}
+EXTENSIONS = {
+    'artpaints.telemetry.CrawlTelemetryExtension': 500,
+}
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+import collections
+import urllib.parse
+
 import scrapy
 from artpaints.items import ArtPaintsItem
 
@@ -8,6 +11,18 @@ def list_of_numbers(str):
     return [int(x.strip()) for x in str.split(',')]
 
 
+def set_name_of(url):
+    '''Set page url -> set name, e.g. 'Starter-36' or 'Soft'.'''
+    parts = urllib.parse.urlsplit(url).path.strip('/').split('/')
+    return parts[-2] if len(parts) >= 2 else parts[-1]
+
+
+def color_key(url):
+    '''Detail page url -> key identifying the color across sets.'''
+    url = urllib.parse.urlsplit(url)
+    return url.path.lower().rstrip('/')
+
+
 class UnisonSpider(scrapy.Spider):
     name = 'unison'
     allowed_domains = ['art-paints.com']
@@ -22,24 +37,53 @@ class UnisonSpider(scrapy.Spider):
         'http://www.art-paints.com/Paints/Pastel/Unison/Portrait/Unison-Portrait.html',
         'http://www.art-paints.com/Paints/Pastel/Unison/Portrait-18/Unison-Portrait-18.html' ]
 
+    def start_requests(self):
+        # Detail pages are requested once every set page has been read,
+        # so that each color is fetched once with all of its sets.
+        self.set_urls = self.start_urls + self.other_urls
+        self.pending_sets = len(self.set_urls)
+        self.color_links = dict()  # color key -> (detail url, name)
+        self.color_sets = collections.defaultdict(set)  # color key -> set names
+        for url in self.set_urls:
+            yield scrapy.Request(url, callback=self.parse, errback=self.set_failed)
+
     def parse(self, response):
+        set_name = set_name_of(response.url)
         table = response.xpath('//center/table[5]')
         if table:
             for link in table.xpath('.//a[not(descendant::img)]'):
                 name = " ".join(link.xpath('text()').getall()).strip()
                 next_page = link.attrib['href']
                 if name != '' and next_page != '':
-                    yield scrapy.Request(
-                        response.urljoin(next_page),
-                        callback=self.parse_color,
-                        flags=[ {'name': name} ]
-                    )
+                    url = response.urljoin(next_page)
+                    key = color_key(url)
+                    self.color_links.setdefault(key, (url, name))
+                    self.color_sets[key].add(set_name)
+        yield from self.set_done()
+
+    def set_failed(self, failure):
+        self.logger.error(f'Set page {failure.request.url} failed: {failure.value!r}')
+        yield from self.set_done()
+
+    def set_done(self):
+        self.pending_sets -= 1
+        if self.pending_sets > 0:
+            return
+        self.logger.info(f'{len(self.color_links)} colors in {len(self.set_urls)} sets')
+        for key, (url, name) in self.color_links.items():
+            yield scrapy.Request(
+                url,
+                callback=self.parse_color,
+                flags=[ {'name': name} ],
+                cb_kwargs={'sets': sorted(self.color_sets[key])}
+            )
 
-    def parse_color(self, response):
+    def parse_color(self, response, sets=()):
         flags = response.request.flags
         strongs = response.xpath('//center/table[5]//table[1]//tr[2]/td[1]/table[1]//tr[1]/td[3]/table//tr[1]/td[1]/strong')
         texts = [strong.xpath('.//text()').get() for strong in strongs]
         cmyk = list_of_numbers(texts[3])
         rgb = list_of_numbers(texts[4])
         yield ArtPaintsItem(name=texts[0], identifier=texts[1],
-            html=texts[2], c=cmyk[0], m=cmyk[1], y=cmyk[2], k=cmyk[3], r=rgb[0], g=rgb[1], b=rgb[2])
+            html=texts[2], c=cmyk[0], m=cmyk[1], y=cmyk[2], k=cmyk[3], r=rgb[0], g=rgb[1], b=rgb[2],
+            sets=list(sets))
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+
+# Per-request crawl telemetry (see ../../utilities/crawl_telemetry.py).
+#
+# Enabled when CRAWL_TELEMETRY_JSONL (a JSONL file to append to) or
+# CRAWL_TELEMETRY_PORT (a local port serving Prometheus /metrics) is set:
+#
+#     scrapy crawl unison -s CRAWL_TELEMETRY_JSONL=unison_telemetry.jsonl -s CRAWL_TELEMETRY_PORT=9108
+#
+# The downloader middleware times each download attempt (so retries show
+# up as separate records, with their retry count). Error statuses and
+# download exceptions are recorded there; successful responses are
+# recorded by the spider middleware once the callback has run, with the
+# time spent in the callback as the parse time.
+
+import os
+import sys
+import time
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'utilities'))
+from crawl_telemetry import CrawlTelemetry
+
+
+def get_telemetry(crawler):
+    '''The crawler's CrawlTelemetry, created on first use. Raises
+    NotConfigured if telemetry is not enabled in the settings.
+    '''
+    telemetry = getattr(crawler, 'crawl_telemetry', None)
+    if telemetry is None:
+        jsonl_path = crawler.settings.get('CRAWL_TELEMETRY_JSONL')
+        if not jsonl_path and not crawler.settings.getint('CRAWL_TELEMETRY_PORT'):
+            raise NotConfigured
+        telemetry = CrawlTelemetry(
+            crawler.spidercls.name, jsonl_path,
+            summary_interval=crawler.settings.getfloat('CRAWL_TELEMETRY_SUMMARY_INTERVAL', 60.))
+        crawler.crawl_telemetry = telemetry
+    return telemetry
+
+
+class CrawlTelemetryExtension(object):
+    def __init__(self, telemetry, port):
+        self.telemetry = telemetry
+        self.port = port
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        ext = cls(get_telemetry(crawler), crawler.settings.getint('CRAWL_TELEMETRY_PORT'))
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        if self.port:
+            self.telemetry.serve(self.port)
+
+    def spider_closed(self, spider):
+        self.telemetry.close()
+
+
+def elapsed(request):
+    start = request.meta.get('telemetry_start')
+    return time.perf_counter() - start if start is not None else 0.
+
+
+class CrawlTelemetryDownloaderMiddleware(object):
+    def __init__(self, telemetry):
+        self.telemetry = telemetry
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(get_telemetry(crawler))
+
+    def process_request(self, request, spider):
+        request.meta['telemetry_start'] = time.perf_counter()
+        return None
+
+    def process_response(self, request, response, spider):
+        fetch_seconds = request.meta.get('download_latency')
+        if fetch_seconds is None:
+            fetch_seconds = elapsed(request)
+        fetch = (response.status, fetch_seconds, len(response.body), request.meta.get('retry_times', 0))
+        if 200 <= response.status < 300:
+            request.meta['telemetry_fetch'] = fetch
+        else:
+            status, fetch_seconds, size, retries = fetch
+            self.telemetry.record(response.url, status, fetch_seconds, 0., size, retries)
+        return response
+
+    def process_exception(self, request, exception, spider):
+        self.telemetry.record(request.url, 0, elapsed(request), 0., 0, request.meta.get('retry_times', 0),
+                              f'{type(exception).__name__}: {exception}')
+        return None
+
+
+class CrawlTelemetrySpiderMiddleware(object):
+    def __init__(self, telemetry):
+        self.telemetry = telemetry
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(get_telemetry(crawler))
+
+    def process_spider_output(self, response, result, spider):
+        fetch = response.meta.get('telemetry_fetch')
+        if fetch is None:
+            yield from result
+            return
+        status, fetch_seconds, size, retries = fetch
+        # Only count the time spent inside the callback
+        parse_seconds = 0.
+        error = None
+        results = iter(result)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    item = next(results)
+                except StopIteration:
+                    break
+                finally:
+                    parse_seconds += time.perf_counter() - start
+                yield item
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            self.telemetry.record(response.url, status, fetch_seconds, parse_seconds, size, retries, error)
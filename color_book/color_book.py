@@ -1,17 +1,25 @@
 #!/usr/bin/python3
 
+import time
+_START_TIME = time.perf_counter()
+
 from abc import ABC
 import csv
+import functools
 import itertools
 import math
 import operator
+import os
+import re
 import sys
-import colour
 from PIL import Image, ImageDraw, ImageFont
 
-import colour
-from colour.notation import munsell as cnm
-import munsellkit as mkit
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from hue_tables import PAGE_LABELS, page_ring
+from munsell_notation import HUE_FAMILY_PATTERN, NUMBER_PATTERN, match_notation
+from text_stamps import draw_text, draw_text_ralign
+
+_IMPORT_TIME = time.perf_counter() - _START_TIME
 
 
 # Column headers from UEF tables
@@ -33,50 +41,10 @@ munsell_colnames = [
 gamma = 0.5
 
 
-# Page (color wheel) order
-ORDERED_HUES = [
-    'N',
-    '2.5R',
-    '5R',
-    '7.5R',
-    '10R',
-    '2.5YR',
-    '5YR',
-    '7.5YR',
-    '10YR',
-    '2.5Y',
-    '5Y',
-    '7.5Y',
-    '10Y',
-    '2.5GY',
-    '5GY',
-    '7.5GY',
-    '10GY',
-    '2.5G',
-    '5G',
-    '7.5G',
-    '10G',
-    '2.5BG',
-    '5BG',
-    '7.5BG',
-    '10BG',
-    '2.5B',
-    '5B',
-    '7.5B',
-    '10B',
-    '2.5PB',
-    '5PB',
-    '7.5PB',
-    '10PB',
-    '2.5P',
-    '5P',
-    '7.5P',
-    '10P',
-    '2.5RP',
-    '5RP',
-    '7.5RP',
-    '10RP'
-]
+# Page (color wheel) order: 'N', then '2.5R' (page 1) to '10RP' (page 40)
+ORDERED_HUES = ['N'] + PAGE_LABELS[1:] + [PAGE_LABELS[0]]
+# Index of each hue in ORDERED_HUES; printed page numbers are this + 1
+HUE_PAGES = {hue: page for page, hue in enumerate(ORDERED_HUES)}
 
 
 def cast(row, filter):
@@ -109,6 +77,50 @@ def rit_filter(k, v):
         return float(v)
 
 
+# (label, seconds) for each lazily loaded dependency, see --profile-startup
+startup_timings = [('import color_book', _IMPORT_TIME)]
+
+def timed_load(label):
+    '''Decorates a loader so that it runs once, on first use, and
+    records how long it took in `startup_timings`.
+    '''
+    def decorator(loader):
+        @functools.lru_cache(maxsize=None)
+        @functools.wraps(loader)
+        def wrapper(*args):
+            start = time.perf_counter()
+            result = loader(*args)
+            startup_timings.append((label.format(*args), time.perf_counter() - start))
+            return result
+        return wrapper
+    return decorator
+
+# colour-science takes about a second to import, and is only needed by
+# ScienceColorSource, so it and munsellkit are imported on first use.
+@timed_load('import colour')
+def load_cnm():
+    from colour.notation import munsell as cnm
+    return cnm
+
+@timed_load('import munsellkit')
+def load_mkit():
+    import munsellkit as mkit
+    return mkit
+
+@timed_load('load font {0} {1}')
+def load_font(path, size):
+    return ImageFont.truetype(path, size)
+
+class LazyFont:
+    '''Class attribute for a font that is only opened when first used.'''
+    def __init__(self, path, size):
+        self.path = path
+        self.size = size
+
+    def __get__(self, obj, owner=None):
+        return load_font(self.path, self.size)
+
+
 def new_color_source(name):
     if name == 'uef':
         return UEFColorSource(name)
@@ -117,12 +129,6 @@ def new_color_source(name):
     return ScienceColorSource(name)
 
 
-def draw_text_ralign(draw, xy, text, font):
-    (w, h) = draw.textsize(text, font=font)
-    (x, y) = xy
-    draw.text((x - w, y), text, font=font, fill='#000000')
-
-
 
 
 # Munsell value (*10) and dRGB value
@@ -149,6 +155,10 @@ NEUTRALS = [
     ( 95, 241 )
 ]
 
+class ColorNotFound(LookupError):
+    '''A color source has no chip for the requested hue, value and chroma.'''
+
+
 class ColorSource(ABC):
     def __init__(self, name):
         self.name = name
@@ -195,16 +205,9 @@ class ColorSource(ABC):
         return None
 
     def get_bracket_colors(self, hue, value, chroma, num):
-        idx_last = len(ORDERED_HUES) - 1
-        idx = ORDERED_HUES.index(hue)
         colors = []
-        for offset in range(-num, num + 1):
-            i = idx + offset
-            if i < 1:
-                i = i + idx_last
-            elif i > idx_last:
-                i = i - idx_last
-            target_hue = ORDERED_HUES[i]
+        for page in page_ring(HUE_PAGES[hue], num):
+            target_hue = ORDERED_HUES[page or 40]
             max_chroma = self.find_highest_chroma(target_hue, value, chroma)
             colors.append({'h': target_hue, 'V': value, 'C': min(chroma, max_chroma)})
         return colors
@@ -238,7 +241,7 @@ class ScienceColorSource(ColorSource):
 
     def rgb(self, color):
         spec = self._to_colorlab(color['h'], color['V']/10, color['C'])
-        rgb = mkit.munsell_specification_to_rgb(spec)
+        rgb = load_mkit().munsell_specification_to_rgb(spec)
         return [min(255, max(0, int(round(v * 255)))) for v in rgb]
 
     def find_nearest(self, hue, value, chroma):
@@ -273,7 +276,7 @@ class ScienceColorSource(ColorSource):
 
     def find_highest_chroma(self, hue, value, chroma):
         spec = self._to_colorlab(hue, value/10, chroma)
-        max_chroma = cnm.maximum_chroma_from_renotation(spec[0], spec[1], spec[3])
+        max_chroma = load_cnm().maximum_chroma_from_renotation(spec[0], spec[1], spec[3])
         return max_chroma
 
     def _to_colorlab(self, hue, value, chroma):
@@ -282,7 +285,7 @@ class ScienceColorSource(ColorSource):
             munsell_color = f'N{value}'
         else:
             munsell_color = f'{hue} {value}/{chroma}'
-        return cnm.parse_munsell_colour(munsell_color)
+        return load_cnm().parse_munsell_colour(munsell_color)
 
 
 class LegacyColorSource(ColorSource):
@@ -312,6 +315,11 @@ class LegacyColorSource(ColorSource):
         chromas.sort(key=lambda x: x['C'])
         return chromas[-max:]
 
+    def get_bracket_colors(self, hue, value, chroma, num):
+        # Look up the data rows, which carry the RGB values
+        colors = super(LegacyColorSource, self).get_bracket_colors(hue, value, chroma, num)
+        return [self.find_nearest(c['h'], c['V'], c['C']) for c in colors]
+
     def find_highest_chroma(self, hue, value, chroma):
         highest_chroma = -2
         for color in self.data:
@@ -319,7 +327,7 @@ class LegacyColorSource(ColorSource):
                 highest_chroma = color['C']
 
         if highest_chroma < 0:
-            raise Exception(f'No chroma found for {self.hvc_label(hue, value, chroma)}')
+            raise ColorNotFound(f'No chroma found for {self.hvc_label(hue, value, chroma)}')
         return highest_chroma
 
     def print_colors(self):
@@ -425,10 +433,8 @@ class MunsellPage:
 
     small_font_size = 18
     large_font_size = 32
-    small_font = ImageFont.truetype(
-        './RobotoMono-BoldItalic.ttf', small_font_size)
-    large_font = ImageFont.truetype(
-        './RobotoMono-BoldItalic.ttf', large_font_size)
+    small_font = LazyFont('./RobotoMono-BoldItalic.ttf', small_font_size)
+    large_font = LazyFont('./RobotoMono-BoldItalic.ttf', large_font_size)
 
     patch_x0 = 100
     value_label_x0 = patch_x0 - 50
@@ -447,29 +453,42 @@ class MunsellPage:
         if hue is None:
             self.page_num = 1
         else:
-            self.page_num = ORDERED_HUES.index(hue) + 1
+            self.page_num = HUE_PAGES[hue] + 1
         self.init_image()
 
+    # Static page frames (axis labels), by (source name, neutral page)
+    frames = dict()
+
     def init_image(self):
-        self.img = Image.new(
-            'RGB', (self.image_w, self.image_h), color='white')
+        key = (self.source.name, self.hue == 'N')
+        frame = self.frames.get(key)
+        if frame is None:
+            frame = self.build_frame()
+            self.frames[key] = frame
+        self.img = frame.copy()
         self.draw = ImageDraw.Draw(self.img)
 
         x0 = self.patch_x0 + ((len(self.source.chroma_labels) + 1) * self.patch_w_stride)
         y0 = self.patch_y0 - (len(self.source.value_labels) * self.patch_h_stride)
-        draw_text_ralign(self.draw, (x0, y0), self.hue, self.large_font)
-        draw_text_ralign(self.draw, (x0, y0 + 40), f'p. {self.page_num}', self.small_font)
+        draw_text_ralign(self.img, (x0, y0), self.hue, self.large_font)
+        draw_text_ralign(self.img, (x0, y0 + 40), f'p. {self.page_num}', self.small_font)
+
+    def build_frame(self):
+        '''Draws the value and chroma labels that every page of this
+        source shares.
+        '''
+        img = Image.new(
+            'RGB', (self.image_w, self.image_h), color='white')
 
         for (y, v, label) in self.source.value_labels:
             y0 = self.patch_y0 - self.patch_h - (y * self.patch_h_stride)
-            self.draw.text((self.value_label_x0, y0),
-                           label, font=self.small_font, fill='#000000', align='left')
+            draw_text(img, (self.value_label_x0, y0), label, self.small_font)
 
         if self.hue != 'N':
             for (x, c, label) in self.source.chroma_labels:
                 x0 = self.patch_x0 + (x * self.patch_w_stride)
-                self.draw.text((x0, self.chroma_label_y0),
-                               label, font=self.small_font, fill='#000000', align='left')
+                draw_text(img, (x0, self.chroma_label_y0), label, self.small_font)
+        return img
 
     def add_patch(self, color):
         location = self.source.location_on_page(color)
@@ -479,7 +498,7 @@ class MunsellPage:
             y0 = self.patch_y0 - (y * self.patch_h_stride)
             x1 = x0 + self.patch_w
             y1 = y0 - self.patch_h
-            xy = [x0, y0, x1, y1]
+            xy = [x0, y1, x1, y0]
             r, g, b = self.source.rgb(color)
             fill = f'#{r:02X}{g:02X}{b:02X}'
             self.draw.rectangle(xy, fill=fill)
@@ -487,6 +506,15 @@ class MunsellPage:
             label = self.source.label(color)
             print(f'Patch {label} will not be printed')
 
+    def render(self, format=None, **options):
+        '''Returns the page image, or its bytes encoded as `format`
+        ('png', 'png8' or 'webp', see image_buffers.encode_image).
+        '''
+        if format is None:
+            return self.img
+        from image_buffers import encode_image
+        return encode_image(self.img, format, dpi=(self.dpi, self.dpi), **options)
+
     def print(self):
         file_name = f'{self.source.name}_{self.page_num:02d}_{self.hue}.png'
         self.img.save(file_name, dpi=(self.dpi, self.dpi))
@@ -510,8 +538,7 @@ class MunsellCard:
     max_patches = patch_rows * patches_per_row
 
     small_font_size = 14
-    small_font = ImageFont.truetype(
-        './RobotoMono-BoldItalic.ttf', small_font_size)
+    small_font = LazyFont('./RobotoMono-BoldItalic.ttf', small_font_size)
 
     patch_x0 = 40
     patch_w = 120
@@ -585,7 +612,7 @@ class MunsellCard:
             y0 = self.patch_y0 - (y * self.patch_h_stride)
             x1 = x0 + self.patch_w
             y1 = y0 - self.patch_h
-            xy = [x0, y0, x1, y1]
+            xy = [x0, y1, x1, y0]
 
             r, g, b = self.source.rgb(color)
             fill = f'#{r:02X}{g:02X}{b:02X}'
@@ -600,14 +627,21 @@ class MunsellCard:
             label_y = y0 + 6
             label2_y = label_y + self.small_font_size + 2
             self.draw.rectangle(xy, fill=fill)
-            self.draw.text((x0, label_y), label, font=self.small_font,
-                           fill='#000000', align='left')
+            draw_text(self.img, (x0, label_y), label, self.small_font)
             if label2 is not None:
-                self.draw.text((x0, label2_y), label2, font=self.small_font,
-                           fill='#000000', align='left')
+                draw_text(self.img, (x0, label2_y), label2, self.small_font)
             return True
         return False
 
+    def render(self, format=None, **options):
+        '''Returns the card image, or its bytes encoded as `format`
+        ('png', 'png8' or 'webp', see image_buffers.encode_image).
+        '''
+        if format is None:
+            return self.img
+        from image_buffers import encode_image
+        return encode_image(self.img, format, dpi=(self.dpi, self.dpi), **options)
+
     def print(self, page_num=1, prefix=''):
         if self.mode == 'chips':
             if prefix is None or prefix == '':
@@ -617,7 +651,7 @@ class MunsellCard:
             else:
                 file_name = f'{prefix}_{page_num}.png'
         else:
-            page_num = ORDERED_HUES.index(self.hue) + 1
+            page_num = HUE_PAGES[self.hue] + 1
             if self.mode == 'chroma':
                 file_name = f'card_{self.hue}_{self.value:02d}.png'
             else:
@@ -641,11 +675,12 @@ class MunsellWheel:
     degrees_per_patch = 360 / max_patches
 
     small_font_size = 14
-    small_font = ImageFont.truetype(
-        './RobotoMono-BoldItalic.ttf', small_font_size)
+    small_font = LazyFont('./RobotoMono-BoldItalic.ttf', small_font_size)
 
     def __init__(self, source):
-        self.source = sourceall_colorssource.data
+        self.source = source
+        self.init_image()
+
     def init_image(self):
         self.img = Image.new(
             'RGB', (self.image_w, self.image_h), color='white')
@@ -671,6 +706,15 @@ class MunsellWheel:
 
         return False
 
+    def render(self, format=None, **options):
+        '''Returns the wheel image, or its bytes encoded as `format`
+        ('png', 'png8' or 'webp', see image_buffers.encode_image).
+        '''
+        if format is None:
+            return self.img
+        from image_buffers import encode_image
+        return encode_image(self.img, format, dpi=(self.dpi, self.dpi), **options)
+
     def print(self, prefix=''):
         if prefix is None or prefix == '':
             prefix = 'wheel'
@@ -682,6 +726,13 @@ class Munsell:
     def __init__(self, source_name='rit'):
         self.source = new_color_source(source_name)
 
+    def card(self, mode, color):
+        '''Returns a card with its patches drawn, or None if the card has no patches.'''
+        card = MunsellCard(self.source, mode, color)
+        if not card.add_patches():
+            return None
+        return card
+
     def print_card(self, mode, color):
         card = MunsellCard(self.source, mode, color)
         card.add_patches()
@@ -759,72 +810,51 @@ class Munsell:
         if idx > 0:
             wheel.print(prefix)
 
-def parse_neutral(spec):
-    m = re.match(
-        r'N\s*([.0-9]+)', spec)
-    if m:
-        hue = 'N'
-        value = int(round(float(m.group(1)) * 10.0))
-        return {'spec': spec, 'h': hue, 'V': value, 'C': None}
-    return None
+# Page and card names ("10YR", "10YR8") are not full notations, but use
+# the number and hue family patterns of munsell_notation.
+HUE_RE = re.compile(r'(' + NUMBER_PATTERN + r')\s*(' + HUE_FAMILY_PATTERN + r')')
+HUE_VALUE_RE = re.compile(r'(' + NUMBER_PATTERN + r')\s*(' + HUE_FAMILY_PATTERN + r')\s*(' + NUMBER_PATTERN + r')')
 
 def parse_hue(spec):
-    m = re.match('N', spec)
-    if m:
-        return m.group(1)
-    m = re.match(
-        r'([.0-9]+)\s*([BGPRY]{1,2})', spec)
+    if spec.startswith('N'):
+        return 'N'
+    m = HUE_RE.match(spec)
     if m:
         return m.group(1) + m.group(2)
     return None
 
 def parse_hue_value(spec):
-    m = re.match(
-        r'([.0-9]+)\s*([BGPRY]{1,2})\s*([.0-9]+)', spec)
+    m = HUE_VALUE_RE.match(spec)
     if m:
         hue = m.group(1) + m.group(2)
         value = int(round(float(m.group(3)) * 10.0))
         return {'spec': spec, 'h': hue, 'V': value, 'C': None}
     return None
 
-def parse_hue_value_chroma(spec):
-    m = re.match(
-        r'([.0-9]+)\s*([BGPRY]{1,2})\s*([.0-9]+)[ /]+([0-9]+)', spec)
-    if m:
-        hue = m.group(1) + m.group(2)
-        value = int(round(float(m.group(3)) * 10.0))
-        chroma = int(m.group(4))
-        return {'spec': spec, 'h': hue, 'V': value, 'C': chroma}
-    return None
-
 def parse_color(arg):
     arg = arg.strip()
     if arg == '' or arg[0] == '#':
         return None
 
-    if ':' in arg:
-        name, spec = arg.split(':', 1)
-        name = name.strip()
-        if name == '':
-            name = None
-    else:
-        name = None
-        spec = arg
-
-    parsed = parse_neutral(spec)
-    if parsed is None:
-        parsed = parse_hue_value_chroma(spec)
-    if parsed:
-        parsed['name'] = name
-        return parsed
+    spec = arg.split(':', 1)[-1].strip()
+    matched = match_notation(arg)
+    if matched:
+        name, hue, value, chroma = matched
+        return {'spec': spec, 'h': hue, 'V': int(round(value * 10.0)),
+                'C': None if chroma is None else int(round(chroma)), 'name': name or None}
 
     print(f'Notation {spec} could not be parsed')
     return None
 
+def print_startup_timings():
+    total = time.perf_counter() - _START_TIME
+    for label, seconds in startup_timings:
+        print(f'{1000 * seconds:8.1f} ms  {label}', file=sys.stderr)
+    print(f'{1000 * total:8.1f} ms  total', file=sys.stderr)
+
 
 if __name__ == '__main__':
     import argparse
-    import re
 
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -845,7 +875,12 @@ if __name__ == '__main__':
     parser.add_argument(
         '--prefix', help='prefix for chip file names', default='chips'
     )
+    parser.add_argument(
+        '--profile-startup', help='print import, loading and run times to stderr', action='store_true')
     args = parser.parse_args()
+    if args.profile_startup:
+        import atexit
+        atexit.register(print_startup_timings)
 
     if args.book:
         Munsell(args.source).print_book()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+
+'''Samples the Munsell solid on a fine hue, value and chroma grid.
+
+Every chromatic color inside the renotation gamut (as given by
+`maximum_chroma_from_renotation`, the same bound ScienceColorSource uses)
+is converted to xyY (illuminant C) and unclipped sRGB. colour-science's
+munsell_specification_to_xyY takes an array but converts it one color
+at a time in Python, so the conversion is only parallel across
+processes: hues are split into chunks that are converted across a
+process pool (-j), and each chunk is written as a compressed .npz file next to a manifest.json, so an
+interrupted run picks up where it stopped. When all chunks are done,
+they are consolidated into .npy arrays that can be memory-mapped:
+
+    specs.npy   (N, 4) float32  hue shade, value, chroma, hue code
+    xyY.npy     (N, 3) float32  CIE xyY, illuminant C
+    srgb.npy    (N, 3) float32  sRGB (D65), 0 to 1, unclipped
+    rows.npy    (H, V, 2) int64 start and count of each hue/value row
+
+    python3 dense_solid.py --hue-step 0.5 --value-step 0.1 --chroma-step 0.5 -j 8
+
+    solid = DenseSolid('dense_solid')
+    i = solid.index(astm_hue=12.5, value=4.3, chroma=6.5)
+    print(solid.specs[i], solid.srgb[i])
+'''
+
+import argparse
+import json
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+import colour
+from colour.notation import munsell as cnm
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from munsell_hues import hue_specification
+
+
+ILLUMINANT_C = colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['C']
+
+MANIFEST = 'manifest.json'
+ARRAYS = ['specs', 'xyY', 'srgb']
+
+# Renotation values covered by the sampling
+VALUE_MIN = 1.
+VALUE_MAX = 9.
+
+
+def steps(start, stop, step):
+    '''Inclusive range, rounded to the step's precision.'''
+    n = int(np.floor((stop - start) / step + 1e-6)) + 1
+    return np.round(start + step * np.arange(n), 6)
+
+
+def grid_hues(hue_step):
+    '''ASTM hues (step, 2 * step, ... 100), 100 being 10RP.'''
+    return steps(hue_step, 100., hue_step)
+
+
+def grid_values(value_step):
+    return steps(VALUE_MIN, VALUE_MAX, value_step)
+
+
+def specs_to_srgb(xyY):
+    XYZ = colour.xyY_to_XYZ(xyY)
+    return colour.XYZ_to_sRGB(XYZ, ILLUMINANT_C, chromatic_adaptation_transform='Bradford')
+
+
+def sample_chunk(hues, values, chroma_step):
+    '''Converts every in-gamut color of the given hues and values.
+
+    Returns a dict of the ARRAYS plus 'counts', the number of chromas
+    in each (hue, value) row, shape (len(hues), len(values)).
+    '''
+    specs = []
+    counts = np.zeros((len(hues), len(values)), dtype=np.int64)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for i, astm_hue in enumerate(hues):
+            shade, code = hue_specification(astm_hue)
+            for j, value in enumerate(values):
+                max_chroma = cnm.maximum_chroma_from_renotation(shade, value, code)
+                chromas = steps(chroma_step, max_chroma, chroma_step) if max_chroma >= chroma_step else []
+                counts[i, j] = len(chromas)
+                specs += [(shade, value, chroma, code) for chroma in chromas]
+        specs = np.array(specs, dtype=float).reshape(-1, 4)
+        xyY = cnm.munsell_specification_to_xyY(specs) if len(specs) else np.zeros((0, 3))
+        srgb = specs_to_srgb(xyY) if len(specs) else np.zeros((0, 3))
+    return {
+        'specs': specs.astype(np.float32),
+        'xyY': np.asarray(xyY, dtype=np.float32).reshape(-1, 3),
+        'srgb': np.asarray(srgb, dtype=np.float32).reshape(-1, 3),
+        'counts': counts
+    }
+
+
+def chunk_file(out_dir, chunk):
+    return os.path.join(out_dir, f'chunk_{chunk:05d}.npz')
+
+
+def write_chunk(out_dir, chunk, hues, values, chroma_step):
+    '''Worker: samples one chunk and saves it. Returns (chunk, count).'''
+    data = sample_chunk(hues, values, chroma_step)
+    path = chunk_file(out_dir, chunk)
+    tmp_path = path + '.tmp.npz'
+    np.savez_compressed(tmp_path, **data)
+    os.replace(tmp_path, path)
+    return (chunk, len(data['specs']))
+
+
+def read_manifest(out_dir):
+    path = os.path.join(out_dir, MANIFEST)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def write_manifest(out_dir, manifest):
+    path = os.path.join(out_dir, MANIFEST)
+    with open(path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(path + '.tmp', path)
+
+
+def generate(out_dir, hue_step=0.5, value_step=0.1, chroma_step=0.5, hues_per_chunk=4, jobs=None):
+    '''Samples all chunks not already in the manifest of `out_dir`.
+    Returns the manifest.
+    '''
+    os.makedirs(out_dir, exist_ok=True)
+    params = {'hue_step': hue_step, 'value_step': value_step, 'chroma_step': chroma_step,
+              'hues_per_chunk': hues_per_chunk}
+    manifest = read_manifest(out_dir)
+    if manifest is None:
+        manifest = {'params': params, 'chunks': {}, 'consolidated': False}
+    elif manifest['params'] != params:
+        raise ValueError(f'{out_dir} was started with {manifest["params"]}, not {params}')
+
+    hues = grid_hues(hue_step)
+    values = grid_values(value_step)
+    chunks = [hues[i:i + hues_per_chunk] for i in range(0, len(hues), hues_per_chunk)]
+    todo = [c for c in range(len(chunks))
+            if str(c) not in manifest['chunks'] or not os.path.exists(chunk_file(out_dir, c))]
+    print(f'{len(hues)} hues x {len(values)} values: {len(chunks)} chunks, {len(todo)} to do')
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(write_chunk, out_dir, c, chunks[c], values, chroma_step)
+                   for c in todo]
+        for done, future in enumerate(as_completed(futures), start=1):
+            chunk, count = future.result()
+            manifest['chunks'][str(chunk)] = {
+                'file': os.path.basename(chunk_file(out_dir, chunk)),
+                'hues': [float(chunks[chunk][0]), float(chunks[chunk][-1])],
+                'count': count
+            }
+            manifest['consolidated'] = False
+            write_manifest(out_dir, manifest)
+            print(f'Chunk {chunk}: {count} colors ({done}/{len(todo)})')
+    return manifest
+
+
+def chunk_count(params):
+    '''The number of chunks of a sampling run.'''
+    n_hues = len(grid_hues(params['hue_step']))
+    return -(-n_hues // params['hues_per_chunk'])
+
+
+def consolidate(out_dir):
+    '''Joins the chunks, in hue order, into memory-mappable .npy files.
+    Raises ValueError if any chunk of the run is missing.
+    '''
+    manifest = read_manifest(out_dir)
+    if manifest is None:
+        raise ValueError(f'{out_dir} has no {MANIFEST}')
+    n_chunks = chunk_count(manifest['params'])
+    missing = [c for c in range(n_chunks)
+               if str(c) not in manifest['chunks'] or not os.path.exists(chunk_file(out_dir, c))]
+    if missing:
+        raise ValueError(f'{out_dir} is missing {len(missing)} of {n_chunks} chunks, '
+                         f'starting with chunk {missing[0]}; run it again to sample them')
+    total = sum(manifest['chunks'][str(c)]['count'] for c in range(n_chunks))
+    outputs = {name: np.lib.format.open_memmap(
+        os.path.join(out_dir, f'{name}.npy'), mode='w+', dtype=np.float32,
+        shape=(total, 4 if name == 'specs' else 3)) for name in ARRAYS}
+
+    counts = []
+    start = 0
+    for chunk in range(n_chunks):
+        with np.load(chunk_file(out_dir, chunk)) as data:
+            n = len(data['specs'])
+            for name in ARRAYS:
+                outputs[name][start:start + n] = data[name]
+            counts.append(data['counts'])
+        start += n
+    for array in outputs.values():
+        array.flush()
+
+    counts = np.concatenate(counts)
+    starts = np.concatenate([[0], np.cumsum(counts.reshape(-1))[:-1]]).reshape(counts.shape)
+    np.save(os.path.join(out_dir, 'rows.npy'), np.stack([starts, counts], axis=-1))
+
+    manifest['consolidated'] = True
+    manifest['count'] = total
+    write_manifest(out_dir, manifest)
+    print(f'Consolidated {total} colors in {out_dir}')
+
+
+class DenseSolid:
+    '''Read-only, memory-mapped view of a consolidated dense solid.'''
+
+    def __init__(self, out_dir):
+        manifest = read_manifest(out_dir)
+        if manifest is None or not manifest.get('consolidated'):
+            raise ValueError(f'{out_dir} does not hold a consolidated dense solid')
+        self.params = manifest['params']
+        self.hue_step = self.params['hue_step']
+        self.value_step = self.params['value_step']
+        self.chroma_step = self.params['chroma_step']
+        for name in ARRAYS + ['rows']:
+            setattr(self, name, np.load(os.path.join(out_dir, f'{name}.npy'), mmap_mode='r'))
+
+    def __len__(self):
+        return len(self.specs)
+
+    def index(self, astm_hue, value, chroma):
+        '''Indices of the grid colors nearest to the given ASTM hues,
+        values and chromas, or -1 where the chroma is out of gamut.
+        '''
+        astm_hue = np.asarray(astm_hue, dtype=float) % 100.
+        h = np.rint(astm_hue / self.hue_step).astype(np.int64) - 1
+        h = np.where(h < 0, self.rows.shape[0] - 1, h)
+        v = np.rint((np.asarray(value, dtype=float) - VALUE_MIN) / self.value_step).astype(np.int64)
+        v = np.clip(v, 0, self.rows.shape[1] - 1)
+        c = np.rint(np.asarray(chroma, dtype=float) / self.chroma_step).astype(np.int64) - 1
+        start, count = self.rows[h, v, 0], self.rows[h, v, 1]
+        return np.where((c >= 0) & (c < count), start + c, -1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Sample the Munsell solid on a fine grid.')
+    parser.add_argument(
+        '--hue-step', help='ASTM hue step (2.5 is one book page)', type=float, default=0.5)
+    parser.add_argument(
+        '--value-step', help='value step', type=float, default=0.1)
+    parser.add_argument(
+        '--chroma-step', help='chroma step', type=float, default=0.5)
+    parser.add_argument(
+        '--hues-per-chunk', help='number of hues converted per chunk', type=int, default=4)
+    parser.add_argument(
+        '-j', '--jobs', help='number of worker processes', type=int, default=None)
+    parser.add_argument(
+        '--output', help='output directory', default='dense_solid')
+    parser.add_argument(
+        '--no-consolidate', help='only write the chunks', action='store_true')
+    args = parser.parse_args()
+
+    generate(args.output, args.hue_step, args.value_step, args.chroma_step,
+             args.hues_per_chunk, args.jobs)
+    if not args.no_consolidate:
+        consolidate(args.output)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+
+'''Exports the color_space Munsell solid as a glTF 2.0 scene.
+
+Every chip is an instance of one cube mesh, placed the same way as in
+color_space/src/ColorWheel.elm: the hue sets the angle around the
+neutral axis, the chroma sets the distance from it, and the value sets
+the height. The Elm scene is Z-up; glTF is Y-up, so the value runs
+along +Y and the Elm (x, y, z) becomes (x, z, -y). The cube vertices (position and normal) are one interleaved
+Float32 buffer, and the per-chip translation, rotation, scale and color
+are a second interleaved Float32 buffer, read with the
+EXT_mesh_gpu_instancing extension, so a viewer only has to upload the
+two buffers.
+
+Level 0 is the chips of the color source (the book chips). Denser
+levels of detail are sampled from the renotation data with
+colour-science at finer hue, value and chroma steps:
+
+    python3 export_mesh.py --source rit
+    python3 export_mesh.py --source sci --lod 1.25,0.5,1 --lod 0.625,0.25,0.5 --glb
+'''
+
+import argparse
+import json
+import struct
+
+import numpy as np
+
+from colour.notation import munsell as cnm
+import munsellkit as mkit
+
+from color_book import HUE_PAGES, ORDERED_HUES, new_color_source
+from munsell_hues import hue_specification
+
+
+# Layout, in centimeters, from ColorWheel.elm
+CYLINDER_RADIUS = 60.
+CUBE_SIZE = 40.
+R0 = CYLINDER_RADIUS + CUBE_SIZE + 20.
+R_SPACING = 50.
+Z_SPACING = 90.
+
+CUBE_SCALES = {2: 0.35, 4: 0.5, 6: 0.7, 8: 0.9, 14: 1.4, 16: 1.4}
+
+# glTF constants
+ARRAY_BUFFER = 34962
+ELEMENT_ARRAY_BUFFER = 34963
+FLOAT = 5126
+UNSIGNED_SHORT = 5123
+
+VERTEX_STRIDE = 6 * 4  # position, normal
+INSTANCE_STRIDE = 13 * 4  # translation, rotation (xyzw), scale, color
+
+
+def cube_scale(chroma):
+    return CUBE_SCALES.get(int(round(chroma)), 1.)
+
+
+def book_chips(source):
+    '''Yields (hue, value, chroma, (r, g, b)) for the chromatic chips of a
+    color source, with hue in the Elm units (0 to 975, 0 = 10RP).
+    '''
+    for hue in ORDERED_HUES[1:]:
+        elm_hue = (HUE_PAGES[hue] % 40) * 25
+        for color in source.get_hue_colors(hue):
+            if color['V'] % 10 != 0 or color['C'] % 2 != 0:
+                continue
+            yield (elm_hue, color['V'] // 10, color['C'], source.rgb(color))
+
+
+def sampled_chips(hue_step, value_step, chroma_step):
+    '''Yields (hue, value, chroma, (r, g, b)) for colors sampled at the given
+    steps (in ASTM hue, value and chroma units) inside the renotation gamut.
+    '''
+    for astm_hue in np.arange(hue_step, 100. + hue_step / 2, hue_step):
+        shade, code = hue_specification(astm_hue)
+        for value in np.arange(1., 9. + value_step / 2, value_step):
+            max_chroma = cnm.maximum_chroma_from_renotation(shade, value, code)
+            for chroma in np.arange(chroma_step, max_chroma + 1e-6, chroma_step):
+                rgb = mkit.munsell_specification_to_rgb(np.array([shade, value, chroma, code]))
+                rgb = [min(255, max(0, int(round(v * 255)))) for v in rgb]
+                yield ((astm_hue % 100.) * 10., value, chroma, rgb)
+
+
+def srgb_to_linear(rgb):
+    c = np.asarray(rgb, dtype=np.float32) / 255.
+    return np.where(c <= 0.04045, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+
+
+def instance_buffer(chips, size_factor=1.):
+    '''Returns an (N, 13) float32 array of interleaved translation (meters,
+    Y-up), rotation quaternion, scale and linear RGB color for the chips.
+    '''
+    chips = list(chips)
+    hues = np.array([c[0] for c in chips], dtype=float)
+    values = np.array([c[1] for c in chips], dtype=float)
+    chromas = np.array([c[2] for c in chips], dtype=float)
+    rgbs = np.array([c[3] for c in chips], dtype=float).reshape(-1, 3)
+
+    theta = np.radians(hues * 360. / 1000.)
+    r = (R0 + (chromas / 2. - 1.) * R_SPACING) / 100.
+    z = (values - 5.) * Z_SPACING / 100.
+    size = np.array([cube_scale(c) for c in chromas]) * CUBE_SIZE / 100. * size_factor
+
+    data = np.zeros((len(chips), 13), dtype=np.float32)
+    # The Elm (x, y, z) is (x, z, -y) in glTF, and its rotation about
+    # +Z is a rotation about +Y.
+    data[:, 0] = r * np.cos(theta)
+    data[:, 1] = z
+    data[:, 2] = -r * np.sin(theta)
+    data[:, 4] = np.sin(theta / 2.)
+    data[:, 6] = np.cos(theta / 2.)
+    data[:, 7:10] = size[:, np.newaxis]
+    data[:, 10:13] = srgb_to_linear(rgbs)
+    return data
+
+
+def unit_cube():
+    '''Returns (vertices, indices) for a unit cube centered on the origin,
+    with interleaved position and normal, four vertices per face.
+    '''
+    vertices = []
+    indices = []
+    for axis in range(3):
+        for sign in [-1., 1.]:
+            normal = [0., 0., 0.]
+            normal[axis] = sign
+            u, v = [(axis + 1) % 3, (axis + 2) % 3]
+            if sign < 0:
+                u, v = v, u
+            base = len(vertices)
+            for du, dv in [(-1, -1), (1, -1), (1, 1), (-1, 1)]:
+                p = [0., 0., 0.]
+                p[axis] = sign * 0.5
+                p[u] = du * 0.5
+                p[v] = dv * 0.5
+                vertices.append(p + normal)
+            indices += [base, base + 1, base + 2, base, base + 2, base + 3]
+    return (np.array(vertices, dtype=np.float32), np.array(indices, dtype=np.uint16))
+
+
+def pad4(data, fill=b'\x00'):
+    return data + fill * (-len(data) % 4)
+
+
+def build_gltf(instances, name='munsell'):
+    '''Returns (gltf dict, binary buffer) for a cube mesh and its instances.'''
+    vertices, indices = unit_cube()
+    vertex_bytes = vertices.tobytes()
+    index_bytes = pad4(indices.tobytes())
+    instance_bytes = instances.astype(np.float32).tobytes()
+    buffer = vertex_bytes + index_bytes + instance_bytes
+    n = len(instances)
+
+    def attribute(view, offset, count, kind, minmax=None):
+        accessor = {'bufferView': view, 'byteOffset': offset, 'componentType': FLOAT,
+                    'count': count, 'type': kind}
+        if minmax is not None:
+            accessor['min'], accessor['max'] = minmax
+        return accessor
+
+    accessors = [
+        attribute(0, 0, len(vertices), 'VEC3', ([-0.5] * 3, [0.5] * 3)),
+        attribute(0, 12, len(vertices), 'VEC3'),
+        {'bufferView': 1, 'componentType': UNSIGNED_SHORT, 'count': len(indices), 'type': 'SCALAR'},
+    ]
+    mesh_node = {'mesh': 0, 'name': name}
+    if n > 0:
+        accessors += [
+            attribute(2, 0, n, 'VEC3', (instances[:, 0:3].min(axis=0).tolist(),
+                                        instances[:, 0:3].max(axis=0).tolist())),
+            attribute(2, 12, n, 'VEC4'),
+            attribute(2, 28, n, 'VEC3'),
+            attribute(2, 40, n, 'VEC3'),
+        ]
+        mesh_node['extensions'] = {'EXT_mesh_gpu_instancing': {'attributes': {
+            'TRANSLATION': 3, 'ROTATION': 4, 'SCALE': 5, '_COLOR_0': 6}}}
+
+    gltf = {
+        'asset': {'version': '2.0', 'generator': 'munsell export_mesh.py'},
+        'extensionsUsed': ['EXT_mesh_gpu_instancing'],
+        'extensionsRequired': ['EXT_mesh_gpu_instancing'],
+        'scene': 0,
+        'scenes': [{'nodes': [0]}],
+        'nodes': [mesh_node],
+        'meshes': [{'primitives': [{
+            'attributes': {'POSITION': 0, 'NORMAL': 1},
+            'indices': 2,
+            'material': 0}]}],
+        'materials': [{'name': 'matte', 'pbrMetallicRoughness': {
+            'baseColorFactor': [1., 1., 1., 1.], 'metallicFactor': 0., 'roughnessFactor': 1.}}],
+        'buffers': [{'byteLength': len(buffer)}],
+        'bufferViews': [
+            {'buffer': 0, 'byteOffset': 0, 'byteLength': len(vertex_bytes),
+             'byteStride': VERTEX_STRIDE, 'target': ARRAY_BUFFER},
+            {'buffer': 0, 'byteOffset': len(vertex_bytes), 'byteLength': len(indices) * 2,
+             'target': ELEMENT_ARRAY_BUFFER},
+            {'buffer': 0, 'byteOffset': len(vertex_bytes) + len(index_bytes),
+             'byteLength': len(instance_bytes), 'byteStride': INSTANCE_STRIDE},
+        ],
+        'accessors': accessors
+    }
+    return (gltf, buffer)
+
+
+def write_gltf(gltf, buffer, prefix):
+    bin_name = f'{prefix}.bin'
+    gltf['buffers'][0]['uri'] = bin_name
+    with open(bin_name, 'wb') as f:
+        f.write(buffer)
+    with open(f'{prefix}.gltf', 'w') as f:
+        json.dump(gltf, f)
+    return f'{prefix}.gltf'
+
+
+def write_glb(gltf, buffer, prefix):
+    json_chunk = pad4(json.dumps(gltf, separators=(',', ':')).encode('utf-8'), b' ')
+    bin_chunk = pad4(buffer)
+    length = 12 + 8 + len(json_chunk) + 8 + len(bin_chunk)
+    with open(f'{prefix}.glb', 'wb') as f:
+        f.write(struct.pack('<4sII', b'glTF', 2, length))
+        f.write(struct.pack('<I4s', len(json_chunk), b'JSON'))
+        f.write(json_chunk)
+        f.write(struct.pack('<I4s', len(bin_chunk), b'BIN\x00'))
+        f.write(bin_chunk)
+    return f'{prefix}.glb'
+
+
+def parse_lod(arg):
+    '''Parses "hue_step,value_step,chroma_step".'''
+    steps = [float(s) for s in arg.split(',')]
+    if len(steps) != 3 or min(steps) <= 0:
+        raise argparse.ArgumentTypeError(f'LOD {arg} must be three positive steps: hue,value,chroma')
+    return tuple(steps)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export the Munsell solid as glTF.')
+    parser.add_argument(
+        '--source', help='data source for level 0: "sci", "rit" or "uef"', default='rit')
+    parser.add_argument(
+        '--lod', help='extra level of detail sampled at ASTM hue, value and chroma steps, e.g. 1.25,0.5,1',
+        type=parse_lod, action='append', default=[])
+    parser.add_argument(
+        '--prefix', help='output file prefix', default='munsell_solid')
+    parser.add_argument(
+        '--glb', help='write binary .glb files instead of .gltf + .bin', action='store_true')
+    args = parser.parse_args()
+
+    write = write_glb if args.glb else write_gltf
+    source = new_color_source(args.source)
+    levels = [(list(book_chips(source)), 1.)]
+    for hue_step, value_step, chroma_step in args.lod:
+        # Shrink the cubes with the spacing, relative to the 2.5 hue, 1 value, 2 chroma book steps.
+        size_factor = min(1., hue_step / 2.5, value_step, chroma_step / 2.)
+        levels.append((list(sampled_chips(hue_step, value_step, chroma_step)), size_factor))
+
+    for lod, (chips, size_factor) in enumerate(levels):
+        gltf, buffer = build_gltf(instance_buffer(chips, size_factor), name=f'{args.source} lod {lod}')
+        prefix = args.prefix if lod == 0 else f'{args.prefix}_lod{lod}'
+        file_name = write(gltf, buffer, prefix)
+        print(f'Wrote {len(chips)} chips to {file_name}')
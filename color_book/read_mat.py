@@ -1,14 +1,20 @@
 #!/usr/bin/python3
 
+import argparse
+import os
+import sys
 from scipy.io import loadmat
 import numpy as np
+import pyarrow as pa
 import re
 import yaml
 
-# From http://cs.joensuu.fi/~spectral/databases/programs.htm
-# Convert Matlab formats into csv files.
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from columnar import FORMATS, CatalogWriter
+from munsell_hues import HUE_CODES, parse_hue
 
-data = loadmat('munsell400_700_5.mat')
+# From http://cs.joensuu.fi/~spectral/databases/programs.htm
+# Convert Matlab formats into csv files, or one Parquet or Feather file.
 
 def parse_spectrum(s):
     # 10rpV40C12.NM5
@@ -49,9 +55,41 @@ munsell_colnames = [
     '{}'.format(wavelength) for wavelength in range(400, 700+5, 5)
 ]
 
-print_shape(data, 'C')
-print_shape(data, 'S')
-print_shape(data, 'munsell')
-write_list('munsell400_700_5.s.csv', data['S'].tolist(), ','.join(s_colnames))
-np.savetxt('munsell400_700_5.c.csv', np.transpose(data['C']), delimiter = ',', header = ','.join(c_colnames), comments = '')
-np.savetxt('munsell400_700_5.munsell.csv', np.transpose(data['munsell']), delimiter = ',', header = ','.join(munsell_colnames), comments = '')
+def write_columnar(file_name, format, spectrum_list, c, munsell):
+    '''Writes the chips as catalog rows, with the colorimetric data (c_colnames)
+    and the reflectance spectrum (400 to 700 nm in 5 nm steps) as extra fields.
+    '''
+    extra_fields = [(name, pa.float32()) for name in c_colnames]
+    extra_fields.append(('reflectance', pa.list_(pa.float32(), len(munsell_colnames))))
+    with CatalogWriter(file_name, format, extra_fields=extra_fields) as writer:
+        for s, c_row, spectrum in zip(spectrum_list, c, munsell):
+            hue, value, chroma = parse_spectrum(s)
+            # The chip names give values times 10 (V40 is 4/)
+            value = int(value) / 10.
+            m = re.match(r'([.0-9]+)(.+)', hue)
+            record = {
+                'brand': 'UEF', 'identifier': s.strip(), 'notation': f'{hue} {value:g}/{chroma}',
+                'hue_shade': float(m.group(1)), 'hue_code': HUE_CODES[m.group(2)], 'astm_hue': parse_hue(hue),
+                'value': value, 'chroma': float(chroma), 'reflectance': spectrum.tolist()
+            }
+            record.update(zip(c_colnames, c_row.tolist()))
+            writer.writerow(record)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Convert the UEF Munsell Matlab data.')
+    parser.add_argument('--format', choices=FORMATS, default='csv',
+                        help='csv (three files) or a typed, columnar .parquet or .feather file')
+    args = parser.parse_args()
+
+    data = loadmat('munsell400_700_5.mat')
+    print_shape(data, 'C')
+    print_shape(data, 'S')
+    print_shape(data, 'munsell')
+    if args.format == 'csv':
+        write_list('munsell400_700_5.s.csv', data['S'].tolist(), ','.join(s_colnames))
+        np.savetxt('munsell400_700_5.c.csv', np.transpose(data['C']), delimiter = ',', header = ','.join(c_colnames), comments = '')
+        np.savetxt('munsell400_700_5.munsell.csv', np.transpose(data['munsell']), delimiter = ',', header = ','.join(munsell_colnames), comments = '')
+    else:
+        write_columnar(f'munsell400_700_5.{args.format}', args.format, data['S'].tolist(),
+                       np.transpose(data['C']), np.transpose(data['munsell']))
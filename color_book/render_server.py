@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+
+'''HTTP server that renders color_book cards as PNG or WebP images.
+
+A pool of worker processes each keeps a `Munsell` instance per color
+source, so colour-science, the color data and the fonts are loaded once
+per worker rather than once per card. Rendered image bytes are kept in an
+LRU cache keyed on the normalized request, and concurrent requests for
+the same card share a single render.
+
+    python3 render_server.py --port 8765 --workers 4 --prewarm rit
+
+    GET /hues?color=5R+4/8&source=rit   card of hues around a color (like --hues)
+    GET /card?card=5R4&source=sci       card of chromas for a hue and value (like --card)
+    GET /card?card=N                    card of neutrals
+    &format=png8 or &format=webp        smaller palette PNG or WebP images
+    GET /stats                          cache statistics, as JSON
+'''
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import sys
+import time
+import urllib.parse
+from concurrent.futures import ProcessPoolExecutor
+
+from color_book import (HUE_PAGES, ORDERED_HUES, ColorNotFound, Munsell, new_color_source, parse_color,
+                        parse_hue_value)
+from http_loop import RequestError, serve_connection
+from image_buffers import CONTENT_TYPES, FORMATS
+
+
+DATA_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCES = ['sci', 'rit', 'uef']
+
+
+# Worker process state
+
+_munsells = dict()
+
+def init_worker(data_dir):
+    # Fonts and color data files are read from the color_book directory
+    os.chdir(data_dir)
+
+
+def render_card(source_name, mode, color, format='png'):
+    '''Worker: returns the encoded card, or None if it has no patches or
+    the source has no chip for the color.
+    '''
+    munsell = _munsells.get(source_name)
+    if munsell is None:
+        munsell = _munsells[source_name] = Munsell(source_name)
+    try:
+        card = munsell.card(mode, color)
+    except ColorNotFound:
+        return None
+    if card is None:
+        return None
+    return card.render(format)
+
+
+# Server process
+
+def card_request(path, query):
+    '''Returns (cache key, mode, color) for a card request.'''
+    params = urllib.parse.parse_qs(query)
+    source = params.get('source', ['sci'])[0]
+    if source not in SOURCES:
+        raise RequestError(400, f'Unknown source {source}')
+    format = params.get('format', ['png'])[0]
+    if format not in FORMATS:
+        raise RequestError(400, f'Unknown format {format}')
+
+    if path == '/hues':
+        arg = params.get('color', [''])[0]
+        color = parse_color(arg)
+        if color is None or color['h'] == 'N':
+            raise RequestError(400, f'Cannot parse color {arg}')
+        mode = 'hue'
+    elif path == '/card':
+        arg = params.get('card', [''])[0].strip()
+        if arg == 'N':
+            color = {'h': 'N', 'V': 0, 'C': None}
+        else:
+            color = parse_hue_value(arg)
+            if color is None:
+                raise RequestError(400, f'Cannot parse hue and value {arg}')
+        mode = 'chroma'
+    else:
+        raise RequestError(404, f'No such path {path}')
+    if color['h'] not in HUE_PAGES:
+        raise RequestError(404, f'No page for hue {color["h"]}')
+
+    color = {'h': color['h'], 'V': color['V'], 'C': color['C']}
+    key = (source, mode, color['h'], color['V'], color['C'], format)
+    return (key, mode, color)
+
+
+class RenderServer:
+    def __init__(self, workers=None, cache_size=4096, data_dir=DATA_DIR):
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers, initializer=init_worker, initargs=(data_dir,))
+        self.cache_size = cache_size
+        self.cache = collections.OrderedDict()
+        self.pending = dict()
+        self.hits = 0
+        self.shared = 0
+        self.misses = 0
+        self.render_seconds = 0.
+
+    async def _render(self, key, mode, color):
+        '''Renders a card in the pool and caches it. Runs as a task of its
+        own, so a requester going away does not cancel it for the others.
+        '''
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        try:
+            png = await loop.run_in_executor(self.executor, render_card, key[0], mode, color, key[5])
+        finally:
+            del self.pending[key]
+        self.render_seconds += time.perf_counter() - start
+        if png is not None:
+            self.cache[key] = png
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return png
+
+    async def render(self, key, mode, color):
+        png = self.cache.get(key)
+        if png is not None:
+            self.cache.move_to_end(key)
+            self.hits += 1
+            return png
+
+        # Requests for a card being rendered share that render
+        task = self.pending.get(key)
+        if task is None:
+            self.misses += 1
+            task = self.pending[key] = asyncio.ensure_future(self._render(key, mode, color))
+        else:
+            self.shared += 1
+        png = await asyncio.shield(task)
+        if png is None:
+            raise RequestError(404, f'No patches for {key[2]} {key[3]}')
+        return png
+
+    async def prewarm(self, source_name, data_dir=DATA_DIR, format='png'):
+        '''Renders the chroma card and hue card of every chip in a source.'''
+        cwd = os.getcwd()
+        os.chdir(data_dir)
+        try:
+            source = new_color_source(source_name)
+            requests = [((source_name, 'chroma', 'N', 0, None, format), 'chroma', {'h': 'N', 'V': 0, 'C': None})]
+            for hue in ORDERED_HUES[1:]:
+                colors = list(source.get_hue_colors(hue))
+                for value in sorted(set(color['V'] for color in colors)):
+                    requests.append(((source_name, 'chroma', hue, value, None, format), 'chroma',
+                                     {'h': hue, 'V': value, 'C': None}))
+                for color in colors:
+                    requests.append(((source_name, 'hue', hue, color['V'], color['C'], format), 'hue',
+                                     {'h': hue, 'V': color['V'], 'C': color['C']}))
+        finally:
+            os.chdir(cwd)
+
+        requests = requests[:self.cache_size]
+        start = time.perf_counter()
+        limit = asyncio.Semaphore(2 * self.workers)
+
+        async def render_one(request):
+            async with limit:
+                try:
+                    await self.render(*request)
+                except RequestError:
+                    pass
+
+        await asyncio.gather(*[render_one(request) for request in requests])
+        print(f'Prewarmed {len(requests)} {source_name} cards in {time.perf_counter() - start:.1f}s',
+              file=sys.stderr)
+
+    def stats(self):
+        requests = self.hits + self.shared + self.misses
+        return {
+            'requests': requests,
+            'hits': self.hits,
+            'shared': self.shared,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.shared) / requests if requests else 0.,
+            'cached': len(self.cache),
+            'cached_bytes': sum(len(png) for png in self.cache.values()),
+            'render_seconds': self.render_seconds
+        }
+
+    async def respond(self, method, target, body=b''):
+        '''Returns (status, content type, body).'''
+        if method != 'GET':
+            raise RequestError(405, f'Method {method} not allowed')
+        url = urllib.parse.urlsplit(target)
+        if url.path == '/stats':
+            return (200, 'application/json', json.dumps(self.stats()).encode('utf-8'))
+        key, mode, color = card_request(url.path, url.query)
+        return (200, CONTENT_TYPES[key[5]], await self.render(key, mode, color))
+
+    async def handle(self, reader, writer):
+        await serve_connection(reader, writer, self.respond)
+
+    async def serve(self, host, port, prewarm=(), data_dir=DATA_DIR):
+        server = await asyncio.start_server(self.handle, host, port)
+        print(f'Serving cards on http://{host}:{port}/', file=sys.stderr)
+        for source_name in prewarm:
+            asyncio.create_task(self.prewarm(source_name, data_dir))
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve color_book cards as PNG images.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument(
+        '--workers', help='number of render processes', type=int, default=None)
+    parser.add_argument(
+        '--cache-size', help='number of rendered cards kept in memory', type=int, default=4096)
+    parser.add_argument(
+        '--prewarm', help='render all the cards of a source at startup', choices=SOURCES,
+        action='append', default=[])
+    parser.add_argument(
+        '--data-dir', help='directory with the fonts and color data', default=DATA_DIR)
+    args = parser.parse_args()
+
+    server = RenderServer(args.workers, args.cache_size, args.data_dir)
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.prewarm, args.data_dir))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.executor.shutdown()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+'''Generates src/MunsellColors.elm, a pre-parsed Munsell color table for the
+color_space app, from the RIT or colour-science data used by color_book.
+
+Each chip is packed into one integer,
+
+    ((hue_page * 16 + value) * 32 + chroma / 2) * 2^24 + 0xRRGGBB
+
+where hue_page is 0 for 10RP, 1 for 2.5R, ... 39 for 7.5RP, so the app
+only has to unpack integers at startup instead of parsing CSV text.
+The same chips can also be written as a base64 binary blob (6 bytes per
+chip: hue_page, value, chroma, R, G, B) with an index by hue and value,
+for use outside of Elm.
+
+    python3 gen_munsell_colors.py --source rit
+    python3 gen_munsell_colors.py --source sci --blob public/munsell_colors.json
+'''
+
+import argparse
+import base64
+import contextlib
+import itertools
+import json
+import os
+import struct
+import sys
+
+COLOR_BOOK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'color_book')
+
+RGB_SCALE = 1 << 24
+
+
+@contextlib.contextmanager
+def working_directory(path):
+    cwd = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+def load_chips(source_name, data_dir=COLOR_BOOK_DIR):
+    '''Returns a sorted list of (hue_page, value, chroma, r, g, b) for the
+    chromatic chips with integer values and even chromas.
+    '''
+    sys.path.append(COLOR_BOOK_DIR)
+    with working_directory(COLOR_BOOK_DIR):
+        # color_book loads its page fonts from the current directory.
+        import color_book
+
+    with working_directory(data_dir):
+        source = color_book.new_color_source(source_name)
+        if hasattr(source, 'data'):
+            colors = source.data
+        else:
+            colors = itertools.chain.from_iterable(
+                source.get_hue_colors(hue) for hue in color_book.ORDERED_HUES[1:])
+
+        chips = set()
+        for color in colors:
+            hue, value_10, chroma = color['h'], color['V'], color['C']
+            if hue == 'N' or value_10 % 10 != 0 or chroma % 2 != 0:
+                continue
+            hue_page = color_book.HUE_PAGES[hue] % 40
+            r, g, b = source.rgb(color)
+            chips.add((hue_page, value_10 // 10, chroma, r, g, b))
+    return sorted(chips)
+
+
+def pack_chip(hue_page, value, chroma, r, g, b):
+    key = (hue_page * 16 + value) * 32 + chroma // 2
+    return key * RGB_SCALE + ((r << 16) | (g << 8) | b)
+
+
+def chip_index(chips):
+    '''Returns {(hue_page, value): (offset, count)} for sorted chips.'''
+    index = dict()
+    for i, (hue_page, value, *_) in enumerate(chips):
+        offset, count = index.get((hue_page, value), (i, 0))
+        index[(hue_page, value)] = (offset, count + 1)
+    return index
+
+
+ELM_TEMPLATE = '''module MunsellColors exposing (chipIndex, chipsForHueValue, munsellColors, packedChips)
+
+{{-| Generated by gen_munsell_colors.py from the "{source}" color source.
+Do not edit by hand.
+
+Each chip is packed into one Int:
+((huePage \\* 16 + value) \\* 32 + chroma / 2) \\* 2^24 + 0xRRGGBB,
+where huePage is Munsell hue / 25 (0 = 10RP, 1 = 2.5R, ...).
+
+-}}
+
+import Array exposing (Array)
+import Color
+import Dict exposing (Dict)
+import Munsell exposing (ColorDict, MunsellColor)
+
+
+rgbScale : Float
+rgbScale =
+    16777216
+
+
+unpackChip : Int -> MunsellColor
+unpackChip packed =
+    let
+        key =
+            floor (toFloat packed / rgbScale)
+
+        rgb =
+            packed - key * 16777216
+
+        hue =
+            25 * (key // 512)
+
+        value =
+            modBy 16 (key // 32)
+
+        chroma =
+            2 * modBy 32 key
+
+        hueName =
+            Munsell.munsellHueName hue |> Maybe.withDefault ""
+
+        name =
+            hueName ++ " " ++ String.fromInt value ++ "/" ++ String.fromInt chroma
+    in
+    {{ name = name
+    , hue = hueName
+    , value = value
+    , chroma = chroma
+    , color = Color.rgb255 (rgb // 65536) (modBy 256 (rgb // 256)) (modBy 256 rgb)
+    }}
+
+
+munsellColors : ColorDict
+munsellColors =
+    packedChips
+        |> Array.foldl
+            (\\packed acc ->
+                let
+                    chip =
+                        unpackChip packed
+                in
+                Dict.insert chip.name chip acc
+            )
+            Dict.empty
+
+
+{{-| Chips with the given Munsell hue (0 to 975) and value, by increasing chroma.
+-}}
+chipsForHueValue : Int -> Int -> List MunsellColor
+chipsForHueValue hue value =
+    case Dict.get (hue * 10 + value) chipIndex of
+        Just ( offset, count ) ->
+            Array.slice offset (offset + count) packedChips
+                |> Array.toList
+                |> List.map unpackChip
+
+        Nothing ->
+            []
+
+
+{{-| Munsell hue \\* 10 + value -> ( offset, count ) in packedChips
+-}}
+chipIndex : Dict Int ( Int, Int )
+chipIndex =
+    Dict.fromList
+{index}
+
+
+packedChips : Array Int
+packedChips =
+    Array.fromList
+{packed}
+'''
+
+
+def elm_list(items, indent=8):
+    pad = ' ' * indent
+    if len(items) == 0:
+        return pad + '[]'
+    lines = [f'{pad}[ {items[0]}'] + [f'{pad}, {item}' for item in items[1:]]
+    return '\n'.join(lines + [f'{pad}]'])
+
+
+def write_elm_module(chips, path, source_name):
+    index = chip_index(chips)
+    index_items = [f'( {hue_page * 250 + value}, ( {offset}, {count} ) )'
+                   for (hue_page, value), (offset, count) in sorted(index.items())]
+    packed_items = [str(pack_chip(*chip)) for chip in chips]
+    with open(path, 'w') as f:
+        f.write(ELM_TEMPLATE.format(
+            source=source_name,
+            index=elm_list(index_items),
+            packed=elm_list(packed_items)))
+
+
+def write_blob(chips, path, source_name):
+    blob = b''.join(struct.pack('6B', *chip) for chip in chips)
+    index = chip_index(chips)
+    with open(path, 'w') as f:
+        json.dump({
+            'source': source_name,
+            'format': 'hue_page, value, chroma, R, G, B as uint8',
+            'count': len(chips),
+            'index': {f'{hue_page},{value}': [offset, count]
+                      for (hue_page, value), (offset, count) in sorted(index.items())},
+            'data': base64.b64encode(blob).decode('ascii')
+        }, f)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generate the MunsellColors.elm table.')
+    parser.add_argument(
+        '--source', help='data source: "sci" or "rit"', choices=['sci', 'rit'], default='rit')
+    parser.add_argument(
+        '--data-dir', help='directory with the source data files', default=COLOR_BOOK_DIR)
+    parser.add_argument(
+        '--output', help='Elm module to write', default=os.path.join('src', 'MunsellColors.elm'))
+    parser.add_argument(
+        '--blob', help='also write the chips as base64 JSON to this file', metavar='JSON')
+    args = parser.parse_args()
+
+    chips = load_chips(args.source, args.data_dir)
+    write_elm_module(chips, args.output, args.source)
+    print(f'Wrote {len(chips)} chips to {args.output}')
+    if args.blob:
+        write_blob(chips, args.blob, args.source)
+        print(f'Wrote {len(chips)} chips to {args.blob}')
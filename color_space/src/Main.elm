@@ -23,6 +23,7 @@ import HueGrid
 import Json.Decode as Decode exposing (Decoder)
 import Length exposing (Length, Meters)
 import Munsell exposing (ColorDict)
+import MunsellColors
 import Pixels
 import Point3d
 import Quantity
@@ -140,7 +141,7 @@ init : Flags -> ( Model, Cmd Msg )
 init _ =
     let
         colors =
-            Munsell.loadColors
+            MunsellColors.munsellColors
     in
     ( { windowSize = { width = initialWidth, height = initialWidth }
       , azimuth = Angle.degrees initialAzimuthDegrees
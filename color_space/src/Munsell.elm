@@ -4,7 +4,6 @@ module Munsell exposing
     , chromaRange
     , findColor
     , hueRange
-    , loadColors
     , munsellColorName
     , munsellHueName
     , neutralColor
@@ -13,7 +12,6 @@ module Munsell exposing
 
 import Array exposing (Array)
 import Color exposing (Color)
-import Csv exposing (..)
 import Dict exposing (Dict)
 
 
@@ -110,1687 +108,3 @@ chromaRange : List Int
 chromaRange =
     List.range 1 8
         |> List.map ((*) 2)
-
-
-{-| Color data in color files is specified by RGB in range 0 to 1.
--}
-recordToColorEntry : List String -> List String -> Result String ( String, MunsellColor )
-recordToColorEntry _ record =
-    case record of
-        fileOrder :: hue :: value :: chroma :: x :: y :: bigY :: xC :: yC :: zC :: xD65 :: yD65 :: zD65 :: r :: g :: b :: _ ->
-            let
-                name =
-                    hue ++ " " ++ value ++ "/" ++ chroma
-
-                red =
-                    String.toFloat r |> Maybe.withDefault 0
-
-                green =
-                    String.toFloat g |> Maybe.withDefault 0
-
-                blue =
-                    String.toFloat b |> Maybe.withDefault 0
-            in
-            Ok
-                ( name
-                , { name = name
-                  , hue = hue
-                  , value = String.toInt value |> Maybe.withDefault 0
-                  , chroma = String.toInt chroma |> Maybe.withDefault 0
-                  , color = Color.rgb red green blue
-                  }
-                )
-
-        _ ->
-            Err "line failed"
-
-
-loadColors : ColorDict
-loadColors =
-    let
-        csv =
-            Csv.parseWith "," rawData
-    in
-    csv.records
-        |> List.foldl
-            (\r acc ->
-                case recordToColorEntry csv.headers r of
-                    Ok entry ->
-                        entry :: acc
-
-                    Err _ ->
-                        acc
-            )
-            []
-        |> Dict.fromList
-
-
-rawData : String
-rawData =
-    """file order,h,V,C,x,y,Y,X_C,Y_C,Z_C,X_D65,Y_D65,Z_D65,R,G,B,dR,dG,dB
-1,10RP,1,2,0.3629,0.271,1.21,0.0162,0.0121,0.0163,0.0158,0.012,0.0151,0.1725,0.0855,0.1249,44,22,32
-2,10RP,1,4,0.392,0.2423,1.21,0.0196,0.0121,0.0183,0.0191,0.012,0.0168,0.2066,0.0578,0.1353,53,15,35
-3,10RP,1,6,0.4151,0.2169,1.21,0.0232,0.0121,0.0205,0.0227,0.012,0.0189,0.2367,0.01,0.1465,60,3,37
-7,2.5R,1,2,0.3768,0.2816,1.21,0.0162,0.0121,0.0147,0.0158,0.0121,0.0135,0.1755,0.0851,0.1161,45,22,30
-8,2.5R,1,4,0.4166,0.2569,1.21,0.0196,0.0121,0.0154,0.0192,0.012,0.0142,0.2114,0.0561,0.1209,54,14,31
-9,2.5R,1,6,0.4515,0.2329,1.21,0.0235,0.0121,0.0164,0.023,0.012,0.0151,0.2446,-0.0016,0.1273,62,0,32
-12,5R,1,2,0.3908,0.2929,1.21,0.0161,0.0121,0.0131,0.0158,0.0121,0.012,0.1778,0.0849,0.1069,45,22,27
-13,5R,1,4,0.442,0.2728,1.21,0.0196,0.0121,0.0127,0.0192,0.012,0.0116,0.2153,0.0551,0.1057,55,14,27
-17,7.5R,1,2,0.402,0.3034,1.21,0.016,0.0121,0.0117,0.0157,0.0121,0.0108,0.1789,0.0853,0.0988,46,22,25
-18,7.5R,1,4,0.466,0.2888,1.21,0.0195,0.0121,0.0103,0.0192,0.012,0.0095,0.2179,0.0549,0.0904,56,14,23
-22,10R,1,2,0.4128,0.3154,1.21,0.0158,0.0121,0.0104,0.0155,0.0121,0.0096,0.1789,0.0863,0.09,46,22,23
-23,10R,1,4,0.4933,0.3068,1.21,0.0195,0.0121,0.0079,0.0192,0.0121,0.0072,0.2207,0.0546,0.0725,56,14,18
-27,2.5YR,1,2,0.4258,0.3344,1.21,0.0154,0.0121,0.0087,0.0151,0.0121,0.008,0.177,0.0889,0.0769,45,23,20
-28,2.5YR,1,4,0.5311,0.3371,1.21,0.0191,0.0121,0.0047,0.0188,0.0121,0.0043,0.2215,0.0572,0.041,56,15,10
-29,2.5YR,1,6,0.6048,0.327,1.21,0.0224,0.0121,0.0025,0.0221,0.0121,0.0023,0.253,0.0104,0.0093,65,3,2
-31,5YR,1,2,0.4377,0.358,1.21,0.0148,0.0121,0.0069,0.0145,0.0121,0.0063,0.1728,0.0926,0.0615,44,24,16
-33,7.5YR,1,2,0.443,0.3775,1.21,0.0142,0.0121,0.0058,0.0139,0.0121,0.0053,0.1676,0.0962,0.0495,43,25,13
-34,10YR,1,2,0.4446,0.3982,1.21,0.0135,0.0121,0.0048,0.0133,0.0121,0.0044,0.1607,0.1004,0.0375,41,26,10
-35,2.5Y,1,2,0.4362,0.4177,1.21,0.0126,0.0121,0.0042,0.0124,0.0121,0.0039,0.1498,0.1057,0.0292,38,27,7
-36,5Y,1,2,0.423,0.4265,1.21,0.012,0.0121,0.0043,0.0118,0.0121,0.0039,0.1405,0.1095,0.0292,36,28,7
-37,7.5Y,1,2,0.4042,0.4287,1.21,0.0114,0.0121,0.0047,0.0112,0.0122,0.0043,0.1301,0.113,0.035,33,29,9
-38,10Y,1,2,0.3802,0.4212,1.21,0.0109,0.0121,0.0057,0.0107,0.0122,0.0052,0.1193,0.1159,0.0468,30,30,12
-39,2.5GY,1,2,0.354,0.4088,1.21,0.0105,0.0121,0.007,0.0102,0.0121,0.0065,0.1072,0.1187,0.0602,27,30,15
-40,5GY,1,2,0.3359,0.3982,1.21,0.0102,0.0121,0.0081,0.0099,0.0121,0.0074,0.0984,0.1204,0.0696,25,31,18
-42,7.5GY,1,2,0.3154,0.384,1.21,0.0099,0.0121,0.0095,0.0096,0.0121,0.0087,0.0877,0.1221,0.0806,22,31,21
-43,7.5GY,1,4,0.3133,0.538,1.21,0.007,0.0121,0.0033,0.0068,0.0122,0.0031,0.0217,0.1353,0.0075,6,35,2
-44,10GY,1,2,0.3006,0.372,1.21,0.0098,0.0121,0.0106,0.0095,0.0121,0.0098,0.0794,0.1232,0.0891,20,31,23
-47,2.5G,1,2,0.291,0.3634,1.21,0.0097,0.0121,0.0115,0.0094,0.0121,0.0106,0.0736,0.1238,0.0948,19,32,24
-51,5G,1,2,0.2833,0.3564,1.21,0.0096,0.0121,0.0122,0.0093,0.0121,0.0113,0.0686,0.1244,0.0995,17,32,25
-55,7.5G,1,2,0.2758,0.3484,1.21,0.0096,0.0121,0.0131,0.0092,0.0121,0.012,0.0637,0.1247,0.1045,16,32,27
-59,10G,1,2,0.2689,0.3407,1.21,0.0096,0.0121,0.0139,0.0092,0.0121,0.0128,0.059,0.1251,0.1093,15,32,28
-63,2.5BG,1,2,0.26,0.3289,1.21,0.0096,0.0121,0.0151,0.0092,0.0121,0.0139,0.0531,0.1253,0.1164,14,32,30
-67,5BG,1,2,0.25,0.3141,1.21,0.0096,0.0121,0.0168,0.0092,0.0121,0.0155,0.0463,0.1253,0.1252,12,32,32
-70,7.5BG,1,2,0.243,0.3023,1.21,0.0097,0.0121,0.0182,0.0093,0.0121,0.0168,0.0416,0.1251,0.1322,11,32,34
-73,10BG,1,2,0.2362,0.2882,1.21,0.0099,0.0121,0.02,0.0095,0.0121,0.0184,0.0384,0.1245,0.1405,10,32,36
-76,2.5B,1,2,0.2322,0.2781,1.21,0.0101,0.0121,0.0213,0.0097,0.0121,0.0196,0.0377,0.1238,0.1465,10,32,37
-79,5B,1,2,0.2291,0.2677,1.21,0.0104,0.0121,0.0227,0.0099,0.0121,0.0209,0.0391,0.1228,0.1527,10,31,39
-82,7.5B,1,2,0.2291,0.2579,1.21,0.0107,0.0121,0.0241,0.0103,0.0121,0.0222,0.0468,0.121,0.1582,12,31,40
-86,10B,1,2,0.2309,0.2491,1.21,0.0112,0.0121,0.0253,0.0107,0.0121,0.0233,0.0569,0.1188,0.163,15,30,42
-90,2.5PB,1,2,0.236,0.242,1.21,0.0118,0.0121,0.0261,0.0113,0.012,0.024,0.0707,0.1158,0.1664,18,30,42
-94,5PB,1,2,0.2427,0.2368,1.21,0.0124,0.0121,0.0266,0.0119,0.012,0.0245,0.0844,0.1126,0.1684,22,29,43
-95,5PB,1,4,0.2012,0.1867,1.21,0.013,0.0121,0.0397,0.0123,0.012,0.0365,0.0437,0.112,0.2117,11,29,54
-99,7.5PB,1,2,0.2547,0.231,1.21,0.0133,0.0121,0.0269,0.0128,0.012,0.0248,0.104,0.1072,0.1699,27,27,43
-100,7.5PB,1,4,0.2232,0.1821,1.21,0.0148,0.0121,0.0395,0.0141,0.0119,0.0364,0.0952,0.1013,0.2116,24,26,54
-101,7.5PB,1,6,0.2,0.1422,1.21,0.017,0.0121,0.056,0.0161,0.0118,0.0516,0.0881,0.0915,0.2552,22,23,65
-102,7.5PB,1,8,0.1872,0.1141,1.21,0.0199,0.0121,0.0741,0.0187,0.0117,0.0683,0.09,0.0762,0.2951,23,19,75
-103,7.5PB,1,10,0.1804,0.095,1.21,0.023,0.0121,0.0923,0.0216,0.0116,0.0851,0.098,0.0549,0.3295,25,14,84
-104,7.5PB,1,12,0.1763,0.0804,1.21,0.0265,0.0121,0.1119,0.0249,0.0115,0.1031,0.1097,0.019,0.3624,28,5,92
-118,10PB,1,2,0.2677,0.228,1.21,0.0142,0.0121,0.0268,0.0137,0.012,0.0247,0.1208,0.1018,0.1694,31,26,43
-119,10PB,1,4,0.2459,0.1828,1.21,0.0163,0.0121,0.0378,0.0156,0.0119,0.0348,0.1275,0.0913,0.2068,33,23,53
-120,10PB,1,6,0.229,0.147,1.21,0.0188,0.0121,0.0514,0.018,0.0119,0.0473,0.1358,0.0765,0.2443,35,20,62
-121,10PB,1,8,0.219,0.1228,1.21,0.0216,0.0121,0.0649,0.0205,0.0118,0.0598,0.146,0.0574,0.276,37,15,70
-122,10PB,1,10,0.212,0.1029,1.21,0.0249,0.0121,0.0806,0.0237,0.0117,0.0742,0.1594,0.0239,0.3083,41,6,79
-133,2.5P,1,2,0.2808,0.2296,1.21,0.0148,0.0121,0.0258,0.0143,0.012,0.0238,0.1331,0.0978,0.1659,34,25,42
-134,2.5P,1,4,0.2668,0.1874,1.21,0.0172,0.0121,0.0352,0.0166,0.0119,0.0325,0.1481,0.0838,0.199,38,21,51
-135,2.5P,1,6,0.257,0.1559,1.21,0.0199,0.0121,0.0456,0.0192,0.0119,0.042,0.1638,0.0652,0.2294,42,17,58
-136,2.5P,1,8,0.2496,0.1303,1.21,0.0232,0.0121,0.0576,0.0222,0.0118,0.0531,0.181,0.0355,0.2599,46,9,66
-146,5P,1,2,0.2936,0.233,1.21,0.0152,0.0121,0.0246,0.0147,0.012,0.0226,0.1429,0.0946,0.1613,36,24,41
-147,5P,1,4,0.2854,0.1927,1.21,0.0179,0.0121,0.0328,0.0173,0.012,0.0302,0.1627,0.0777,0.1912,41,20,49
-148,5P,1,6,0.2794,0.1628,1.21,0.0208,0.0121,0.0415,0.02,0.0119,0.0382,0.1814,0.0556,0.2182,46,14,56
-149,5P,1,8,0.2742,0.1375,1.21,0.0241,0.0121,0.0518,0.0233,0.0118,0.0477,0.2011,0.0168,0.246,51,4,63
-157,7.5P,1,2,0.303,0.2361,1.21,0.0155,0.0121,0.0236,0.015,0.012,0.0218,0.1491,0.0924,0.1575,38,24,40
-158,7.5P,1,4,0.2991,0.1974,1.21,0.0183,0.0121,0.0309,0.0177,0.012,0.0284,0.1716,0.0737,0.1849,44,19,47
-159,7.5P,1,6,0.296,0.1682,1.21,0.0213,0.0121,0.0385,0.0206,0.0119,0.0355,0.1923,0.0487,0.2098,49,12,53
-167,10P,1,2,0.3132,0.2404,1.21,0.0158,0.0121,0.0225,0.0153,0.012,0.0207,0.1548,0.0904,0.1529,39,23,39
-168,10P,1,4,0.3132,0.2032,1.21,0.0187,0.0121,0.0288,0.0181,0.012,0.0265,0.1792,0.0704,0.1778,46,18,45
-169,10P,1,6,0.3126,0.1737,1.21,0.0218,0.0121,0.0358,0.0211,0.0119,0.033,0.2019,0.0418,0.2016,51,11,51
-176,2.5RP,1,2,0.324,0.2459,1.21,0.0159,0.0121,0.0212,0.0155,0.012,0.0195,0.1599,0.0888,0.1474,41,23,38
-177,2.5RP,1,4,0.329,0.2095,1.21,0.019,0.0121,0.0267,0.0185,0.012,0.0246,0.187,0.0665,0.1701,48,17,43
-178,2.5RP,1,6,0.3321,0.1811,1.21,0.0222,0.0121,0.0325,0.0216,0.0119,0.03,0.211,0.0346,0.1912,54,9,49
-184,5RP,1,2,0.3378,0.2542,1.21,0.0161,0.0121,0.0194,0.0156,0.012,0.0179,0.1651,0.0873,0.1397,42,22,36
-185,5RP,1,4,0.3503,0.2196,1.21,0.0193,0.0121,0.0237,0.0188,0.012,0.0218,0.1952,0.0626,0.1587,50,16,40
-186,5RP,1,6,0.3588,0.192,1.21,0.0226,0.0121,0.0283,0.022,0.0119,0.0261,0.2212,0.0258,0.1769,56,7,45
-191,7.5RP,1,2,0.3498,0.2617,1.21,0.0162,0.0121,0.018,0.0158,0.012,0.0165,0.1691,0.0862,0.1329,43,22,34
-192,7.5RP,1,4,0.3705,0.23,1.21,0.0195,0.0121,0.021,0.019,0.012,0.0194,0.2015,0.0598,0.1476,51,15,38
-193,7.5RP,1,6,0.3865,0.2036,1.21,0.023,0.0121,0.0244,0.0225,0.0119,0.0224,0.2299,0.0169,0.1622,59,4,41
-197,10RP,2,2,0.3532,0.2957,3.126,0.0373,0.0313,0.0371,0.0364,0.0312,0.0342,0.255,0.1707,0.1957,65,44,50
-198,10RP,2,4,0.385,0.2778,3.126,0.0433,0.0313,0.0379,0.0423,0.0311,0.0349,0.2973,0.1466,0.1994,76,37,51
-199,10RP,2,6,0.4139,0.2608,3.126,0.0496,0.0313,0.039,0.0486,0.0311,0.0359,0.3351,0.116,0.2038,85,30,52
-200,10RP,2,8,0.4428,0.2419,3.126,0.0572,0.0313,0.0407,0.0562,0.031,0.0375,0.3745,0.0635,0.2105,95,16,54
-204,2.5R,2,2,0.3614,0.3033,3.126,0.0372,0.0313,0.0346,0.0363,0.0312,0.0318,0.2573,0.1706,0.1873,66,44,48
-205,2.5R,2,4,0.4021,0.29,3.126,0.0433,0.0313,0.0332,0.0424,0.0312,0.0305,0.3022,0.1456,0.1839,77,37,47
-206,2.5R,2,6,0.439,0.276,3.126,0.0497,0.0313,0.0323,0.0488,0.0311,0.0297,0.3415,0.1138,0.182,87,29,46
-207,2.5R,2,8,0.4776,0.2593,3.126,0.0576,0.0313,0.0317,0.0566,0.031,0.0292,0.3831,0.0565,0.1817,98,14,46
-211,5R,2,2,0.3692,0.3111,3.126,0.0371,0.0313,0.0321,0.0362,0.0312,0.0296,0.259,0.1708,0.1789,66,44,46
-212,5R,2,4,0.4184,0.3032,3.126,0.0431,0.0313,0.0287,0.0423,0.0312,0.0264,0.3053,0.1457,0.1677,78,37,43
-213,5R,2,6,0.4642,0.2934,3.126,0.0495,0.0313,0.0258,0.0486,0.0311,0.0238,0.3455,0.1138,0.1579,88,29,40
-214,5R,2,8,0.5143,0.28,3.126,0.0574,0.0313,0.023,0.0566,0.0311,0.0211,0.3887,0.0543,0.1479,99,14,38
-218,7.5R,2,2,0.3751,0.3181,3.126,0.0369,0.0313,0.0301,0.036,0.0312,0.0277,0.2595,0.1714,0.1717,66,44,44
-219,7.5R,2,4,0.4335,0.3169,3.126,0.0428,0.0313,0.0246,0.042,0.0312,0.0227,0.3069,0.1466,0.1513,78,37,39
-220,7.5R,2,6,0.4875,0.3123,3.126,0.0488,0.0313,0.02,0.048,0.0312,0.0184,0.3467,0.1161,0.1323,88,30,34
-221,7.5R,2,8,0.5433,0.3027,3.126,0.0561,0.0313,0.0159,0.0554,0.0311,0.0146,0.3876,0.0642,0.1131,99,16,29
-225,10R,2,2,0.3811,0.3274,3.126,0.0364,0.0313,0.0278,0.0355,0.0313,0.0256,0.2586,0.1728,0.1628,66,44,42
-226,10R,2,4,0.4481,0.333,3.126,0.0421,0.0313,0.0205,0.0413,0.0312,0.0189,0.3064,0.1489,0.1329,78,38,34
-227,10R,2,6,0.5095,0.3331,3.126,0.0478,0.0313,0.0148,0.0471,0.0312,0.0136,0.3457,0.1202,0.1037,88,31,26
-228,10R,2,8,0.5713,0.3259,3.126,0.0548,0.0313,0.0099,0.0542,0.0312,0.009,0.3857,0.0734,0.072,98,19,18
-232,2.5YR,2,2,0.3852,0.3365,3.126,0.0358,0.0313,0.0259,0.035,0.0313,0.0238,0.2562,0.1747,0.1547,65,45,39
-233,2.5YR,2,4,0.4598,0.3508,3.126,0.041,0.0313,0.0169,0.0403,0.0313,0.0155,0.3029,0.1529,0.1136,77,39,29
-234,2.5YR,2,6,0.528,0.3581,3.126,0.0461,0.0313,0.0099,0.0455,0.0313,0.0091,0.3402,0.1281,0.0684,87,33,17
-236,5YR,2,2,0.388,0.3476,3.126,0.0349,0.0313,0.0238,0.0341,0.0313,0.0219,0.2516,0.1776,0.1457,64,45,37
-237,5YR,2,4,0.4674,0.3738,3.126,0.0391,0.0313,0.0133,0.0384,0.0313,0.0122,0.2941,0.16,0.0908,75,41,23
-238,5YR,2,6,0.5426,0.3925,3.126,0.0432,0.0313,0.0052,0.0427,0.0313,0.0047,0.3278,0.1409,0.0038,84,36,1
-239,7.5YR,2,2,0.3889,0.359,3.126,0.0339,0.0313,0.022,0.0331,0.0313,0.0202,0.2455,0.181,0.1372,63,46,35
-240,7.5YR,2,4,0.469,0.3964,3.126,0.037,0.0313,0.0106,0.0364,0.0313,0.0097,0.2824,0.1678,0.0695,72,43,18
-242,10YR,2,2,0.3872,0.3688,3.126,0.0328,0.0313,0.0207,0.0321,0.0313,0.019,0.2383,0.1844,0.1309,61,47,33
-243,10YR,2,4,0.4676,0.4168,3.126,0.0351,0.0313,0.0087,0.0345,0.0314,0.0079,0.2707,0.1746,0.0499,69,45,13
-244,2.5Y,2,2,0.3825,0.3785,3.126,0.0316,0.0313,0.0197,0.0309,0.0313,0.0182,0.2288,0.1885,0.1258,58,48,32
-245,2.5Y,2,4,0.4627,0.4392,3.126,0.0329,0.0313,0.007,0.0324,0.0314,0.0064,0.2563,0.182,0.0267,65,46,7
-246,5Y,2,2,0.3757,0.3839,3.126,0.0306,0.0313,0.0196,0.0299,0.0313,0.018,0.2199,0.1918,0.1247,56,49,32
-247,5Y,2,4,0.4543,0.4573,3.126,0.0311,0.0313,0.006,0.0305,0.0314,0.0055,0.2422,0.1883,0.0075,62,48,2
-248,7.5Y,2,2,0.366,0.3858,3.126,0.0297,0.0313,0.0201,0.0289,0.0314,0.0185,0.2101,0.1949,0.1271,54,50,32
-249,7.5Y,2,4,0.4401,0.4723,3.126,0.0291,0.0313,0.0058,0.0286,0.0314,0.0053,0.2257,0.1947,-0.0014,58,50,0
-250,10Y,2,2,0.3556,0.3848,3.126,0.0289,0.0313,0.0211,0.0281,0.0314,0.0194,0.2008,0.1975,0.1317,51,50,34
-251,10Y,2,4,0.4188,0.4789,3.126,0.0273,0.0313,0.0067,0.0268,0.0314,0.0061,0.2073,0.2006,0.016,53,51,4
-252,2.5GY,2,2,0.3421,0.3803,3.126,0.0281,0.0313,0.0228,0.0274,0.0314,0.021,0.1897,0.2002,0.1396,48,51,36
-253,2.5GY,2,4,0.3881,0.4752,3.126,0.0255,0.0313,0.009,0.025,0.0314,0.0082,0.1843,0.2065,0.0472,47,53,12
-254,5GY,2,2,0.3309,0.3743,3.126,0.0276,0.0313,0.0246,0.0269,0.0313,0.0227,0.1812,0.202,0.1475,46,52,38
-255,5GY,2,4,0.3582,0.465,3.126,0.0241,0.0313,0.0119,0.0235,0.0314,0.0109,0.1612,0.2112,0.0738,41,54,19
-257,7.5GY,2,2,0.3165,0.365,3.126,0.0271,0.0313,0.0273,0.0263,0.0313,0.0251,0.17,0.204,0.1584,43,52,40
-258,7.5GY,2,4,0.3248,0.4457,3.126,0.0228,0.0313,0.0161,0.0221,0.0314,0.0148,0.1332,0.2155,0.1028,34,55,26
-259,7.5GY,2,6,0.326,0.5379,3.126,0.0189,0.0313,0.0079,0.0184,0.0315,0.0072,0.0827,0.2254,0.0283,21,57,7
-261,10GY,2,2,0.3069,0.358,3.126,0.0268,0.0313,0.0293,0.026,0.0313,0.0269,0.1622,0.2052,0.1661,41,52,42
-262,10GY,2,4,0.2986,0.424,3.126,0.022,0.0313,0.0205,0.0213,0.0314,0.0188,0.1081,0.2183,0.1266,28,56,32
-263,10GY,2,6,0.2852,0.4972,3.126,0.0179,0.0313,0.0137,0.0173,0.0315,0.0126,0.0134,0.2289,0.0848,3,58,22
-267,2.5G,2,2,0.2978,0.3507,3.126,0.0265,0.0313,0.0313,0.0257,0.0313,0.0288,0.1546,0.2062,0.1738,39,53,44
-268,2.5G,2,4,0.2763,0.3998,3.126,0.0216,0.0313,0.0253,0.0208,0.0314,0.0233,0.0831,0.22,0.149,21,56,38
-275,5G,2,2,0.2918,0.345,3.126,0.0264,0.0313,0.0329,0.0256,0.0313,0.0303,0.1498,0.2067,0.1794,38,53,46
-276,5G,2,4,0.264,0.3845,3.126,0.0215,0.0313,0.0286,0.0206,0.0314,0.0263,0.066,0.2208,0.1623,17,56,41
-283,7.5G,2,2,0.2869,0.34,3.126,0.0264,0.0313,0.0343,0.0255,0.0313,0.0316,0.1459,0.2071,0.1842,37,53,47
-284,7.5G,2,4,0.254,0.3705,3.126,0.0214,0.0313,0.0317,0.0206,0.0314,0.0292,0.0495,0.2213,0.174,13,56,44
-291,10G,2,2,0.282,0.3341,3.126,0.0264,0.0313,0.0359,0.0255,0.0313,0.0331,0.1424,0.2073,0.1897,36,53,48
-292,10G,2,4,0.2442,0.3559,3.126,0.0214,0.0313,0.0351,0.0205,0.0314,0.0323,0.0282,0.2216,0.1861,7,57,47
-299,2.5BG,2,2,0.2765,0.3271,3.126,0.0264,0.0313,0.0379,0.0255,0.0313,0.0349,0.1384,0.2074,0.1961,35,53,50
-300,2.5BG,2,4,0.2343,0.3378,3.126,0.0217,0.0313,0.0396,0.0207,0.0313,0.0365,-0.0009,0.2215,0.2006,0,56,51
-306,5BG,2,2,0.2697,0.3175,3.126,0.0266,0.0313,0.0406,0.0256,0.0313,0.0374,0.1339,0.2074,0.2047,34,53,52
-312,7.5BG,2,2,0.2651,0.3098,3.126,0.0267,0.0313,0.0429,0.0257,0.0313,0.0395,0.1316,0.2071,0.2115,34,53,54
-318,10BG,2,2,0.2606,0.301,3.126,0.0271,0.0313,0.0455,0.026,0.0313,0.0419,0.1302,0.2065,0.2191,33,53,56
-323,2.5B,2,2,0.2578,0.294,3.126,0.0274,0.0313,0.0477,0.0263,0.0312,0.0439,0.1306,0.2057,0.2251,33,52,57
-328,5B,2,2,0.2559,0.2874,3.126,0.0278,0.0313,0.0497,0.0267,0.0312,0.0457,0.1324,0.2046,0.2307,34,52,59
-333,7.5B,2,2,0.2545,0.2799,3.126,0.0284,0.0313,0.052,0.0273,0.0312,0.0479,0.1362,0.2031,0.2369,35,52,60
-334,7.5B,2,4,0.2063,0.24,3.126,0.0269,0.0313,0.0721,0.0255,0.0311,0.0664,0.0173,0.2104,0.2834,4,54,72
-338,10B,2,2,0.2558,0.2725,3.126,0.0293,0.0313,0.0541,0.0282,0.0312,0.0498,0.1452,0.2005,0.2424,37,51,62
-339,10B,2,4,0.2102,0.2313,3.126,0.0284,0.0313,0.0755,0.027,0.0311,0.0695,0.0605,0.2062,0.2906,15,53,74
-343,2.5PB,2,2,0.2592,0.2675,3.126,0.0303,0.0313,0.0553,0.0291,0.0312,0.0509,0.156,0.1977,0.2455,40,50,63
-344,2.5PB,2,4,0.2175,0.2245,3.126,0.0303,0.0313,0.0777,0.0288,0.0311,0.0716,0.0995,0.2007,0.2953,25,51,75
-349,5PB,2,2,0.2638,0.2624,3.126,0.0314,0.0313,0.0564,0.0302,0.0312,0.052,0.1686,0.1941,0.2485,43,49,63
-350,5PB,2,4,0.2263,0.2192,3.126,0.0323,0.0313,0.0791,0.0308,0.031,0.0728,0.132,0.1945,0.2983,34,50,76
-351,5PB,2,6,0.1942,0.1811,3.126,0.0335,0.0313,0.1078,0.0317,0.0309,0.0993,0.0665,0.1944,0.35,17,50,89
-356,7.5PB,2,2,0.2712,0.2582,3.126,0.0328,0.0313,0.057,0.0316,0.0311,0.0525,0.1844,0.1896,0.25,47,48,64
-357,7.5PB,2,4,0.242,0.2148,3.126,0.0352,0.0313,0.0791,0.0337,0.031,0.0728,0.173,0.1846,0.2986,44,47,76
-358,7.5PB,2,6,0.2189,0.179,3.126,0.0382,0.0313,0.1051,0.0364,0.0309,0.0969,0.1609,0.1779,0.346,41,45,88
-359,7.5PB,2,8,0.2005,0.1495,3.126,0.0419,0.0313,0.1359,0.0397,0.0307,0.1252,0.1475,0.169,0.3935,38,43,100
-360,7.5PB,2,10,0.1882,0.1258,3.126,0.0468,0.0313,0.1705,0.0441,0.0304,0.1571,0.1415,0.1556,0.4395,36,40,112
-361,7.5PB,2,12,0.1813,0.1094,3.126,0.0518,0.0313,0.2027,0.0487,0.0302,0.1868,0.1436,0.1396,0.4777,37,36,122
-362,7.5PB,2,14,0.1762,0.0955,3.126,0.0577,0.0313,0.2384,0.0541,0.03,0.2197,0.1501,0.1177,0.516,38,30,132
-363,7.5PB,2,16,0.1728,0.0839,3.126,0.0644,0.0313,0.2769,0.0603,0.0298,0.2552,0.1617,0.086,0.5536,41,22,141
-364,7.5PB,2,18,0.1701,0.0742,3.126,0.0717,0.0313,0.3184,0.067,0.0295,0.2934,0.1741,0.0325,0.5907,44,8,151
-375,10PB,2,2,0.2803,0.2567,3.126,0.0341,0.0313,0.0564,0.0329,0.0311,0.0519,0.1996,0.1851,0.2487,51,47,63
-376,10PB,2,4,0.26,0.2162,3.126,0.0376,0.0313,0.0757,0.0361,0.031,0.0698,0.2049,0.1757,0.2922,52,45,75
-377,10PB,2,6,0.244,0.184,3.126,0.0415,0.0313,0.0972,0.0397,0.0309,0.0895,0.2109,0.1646,0.3328,54,42,85
-378,10PB,2,8,0.2294,0.1551,3.126,0.0462,0.0313,0.1241,0.0441,0.0307,0.1143,0.2177,0.1497,0.3765,56,38,96
-379,10PB,2,10,0.22,0.133,3.126,0.0517,0.0313,0.1521,0.0492,0.0305,0.1401,0.2289,0.1299,0.4164,58,33,106
-380,10PB,2,12,0.2139,0.117,3.126,0.0571,0.0313,0.1788,0.0543,0.0303,0.1647,0.241,0.1064,0.4504,61,27,115
-381,10PB,2,14,0.2087,0.1026,3.126,0.0636,0.0313,0.2098,0.0604,0.0301,0.1934,0.2551,0.0702,0.4863,65,18,124
-392,2.5P,2,2,0.2892,0.2583,3.126,0.035,0.0313,0.0548,0.0338,0.0311,0.0504,0.2108,0.1818,0.2449,54,46,62
-393,2.5P,2,4,0.2758,0.2208,3.126,0.039,0.0313,0.0713,0.0376,0.031,0.0656,0.2254,0.1696,0.2831,57,43,72
-394,2.5P,2,6,0.2661,0.1921,3.126,0.0433,0.0313,0.0882,0.0417,0.0309,0.0812,0.2403,0.1557,0.3169,61,40,81
-395,2.5P,2,8,0.257,0.1635,3.126,0.0491,0.0313,0.1108,0.0472,0.0307,0.1021,0.2597,0.134,0.3563,66,34,91
-396,2.5P,2,10,0.2501,0.1422,3.126,0.055,0.0313,0.1336,0.0527,0.0306,0.1231,0.2775,0.108,0.3912,71,28,100
-397,2.5P,2,12,0.2449,0.1245,3.126,0.0615,0.0313,0.1583,0.0589,0.0304,0.1459,0.2965,0.0696,0.4253,76,18,108
-407,5P,2,2,0.2984,0.2612,3.126,0.0357,0.0313,0.0527,0.0346,0.0311,0.0485,0.2207,0.179,0.2398,56,46,61
-408,5P,2,4,0.2908,0.2261,3.126,0.0402,0.0313,0.0668,0.0389,0.031,0.0615,0.2416,0.1645,0.2736,62,42,70
-409,5P,2,6,0.285,0.1992,3.126,0.0447,0.0313,0.0809,0.0432,0.0309,0.0746,0.2607,0.1484,0.3034,66,38,77
-410,5P,2,8,0.2791,0.1707,3.126,0.0511,0.0313,0.1008,0.0493,0.0308,0.0928,0.2854,0.1219,0.3399,73,31,87
-411,5P,2,10,0.2748,0.15,3.126,0.0573,0.0313,0.1199,0.0552,0.0306,0.1104,0.3071,0.0897,0.3712,78,23,95
-412,5P,2,12,0.2709,0.132,3.126,0.0642,0.0313,0.1414,0.0618,0.0304,0.1303,0.3292,0.0334,0.403,84,9,103
-421,7.5P,2,2,0.3071,0.2647,3.126,0.0363,0.0313,0.0506,0.0351,0.0311,0.0466,0.2287,0.1767,0.2343,58,45,60
-422,7.5P,2,4,0.3048,0.2321,3.126,0.0411,0.0313,0.0624,0.0398,0.031,0.0574,0.254,0.1604,0.2639,65,41,67
-423,7.5P,2,6,0.3025,0.2058,3.126,0.0459,0.0313,0.0747,0.0445,0.0309,0.0688,0.2769,0.1418,0.2911,71,36,74
-424,7.5P,2,8,0.3,0.1781,3.126,0.0527,0.0313,0.0916,0.051,0.0308,0.0844,0.305,0.1113,0.3241,78,28,83
-425,7.5P,2,10,0.2979,0.1569,3.126,0.0594,0.0313,0.1086,0.0574,0.0306,0.1001,0.3302,0.07,0.3537,84,18,90
-433,10P,2,2,0.3161,0.2691,3.126,0.0367,0.0313,0.0482,0.0356,0.0311,0.0444,0.2359,0.1747,0.2281,60,45,58
-434,10P,2,4,0.3189,0.239,3.126,0.0417,0.0313,0.0578,0.0405,0.0311,0.0533,0.2645,0.157,0.2533,67,40,65
-435,10P,2,6,0.3207,0.2132,3.126,0.047,0.0313,0.0683,0.0456,0.031,0.0629,0.2912,0.1355,0.2779,74,35,71
-436,10P,2,8,0.3219,0.1862,3.126,0.054,0.0313,0.0826,0.0525,0.0308,0.0761,0.3222,0.1007,0.3076,82,26,78
-437,10P,2,10,0.323,0.1659,3.126,0.0609,0.0313,0.0963,0.0591,0.0307,0.0887,0.3494,0.0505,0.3333,89,13,85
-444,2.5RP,2,2,0.3279,0.2754,3.126,0.0372,0.0313,0.045,0.0362,0.0312,0.0415,0.2442,0.1724,0.2194,62,44,56
-445,2.5RP,2,4,0.3382,0.2496,3.126,0.0424,0.0313,0.0516,0.0412,0.0311,0.0475,0.2763,0.1532,0.238,70,39,61
-446,2.5RP,2,6,0.347,0.2259,3.126,0.048,0.0313,0.0591,0.0468,0.031,0.0544,0.307,0.1288,0.2572,78,33,66
-447,2.5RP,2,8,0.3555,0.2003,3.126,0.0555,0.0313,0.0693,0.0541,0.0309,0.0639,0.3423,0.0873,0.2811,87,22,72
-448,2.5RP,2,10,0.3617,0.18,3.126,0.0628,0.0313,0.0796,0.0613,0.0308,0.0733,0.373,0.0126,0.3028,95,3,77
-454,5RP,2,2,0.3383,0.2829,3.126,0.0374,0.0313,0.0419,0.0364,0.0312,0.0385,0.2495,0.1713,0.2103,64,44,54
-455,5RP,2,4,0.3558,0.2597,3.126,0.0428,0.0313,0.0463,0.0417,0.0311,0.0426,0.2854,0.1503,0.2238,73,38,57
-456,5RP,2,6,0.3708,0.238,3.126,0.0487,0.0313,0.0514,0.0475,0.031,0.0473,0.3186,0.1237,0.2383,81,32,61
-457,5RP,2,8,0.3858,0.214,3.126,0.0564,0.0313,0.0585,0.0551,0.0309,0.0538,0.3561,0.0773,0.2569,91,20,66
-463,7.5RP,2,2,0.3459,0.2892,3.126,0.0374,0.0313,0.0394,0.0364,0.0312,0.0363,0.2526,0.1708,0.203,64,44,52
-464,7.5RP,2,4,0.3702,0.2683,3.126,0.0431,0.0313,0.0421,0.0421,0.0311,0.0388,0.2918,0.1482,0.2121,74,38,54
-465,7.5RP,2,6,0.3918,0.249,3.126,0.0492,0.0313,0.0451,0.0481,0.031,0.0415,0.3272,0.1197,0.2216,83,31,57
-466,7.5RP,2,8,0.4137,0.2276,3.126,0.0568,0.0313,0.0493,0.0557,0.031,0.0454,0.3659,0.0703,0.2341,93,18,60
-471,10RP,3,2,0.3526,0.3068,6.555,0.0753,0.0655,0.0728,0.0734,0.0655,0.067,0.3555,0.2588,0.2752,91,66,70
-472,10RP,3,4,0.3889,0.2969,6.555,0.0859,0.0655,0.0694,0.0839,0.0654,0.0638,0.4096,0.232,0.269,104,59,69
-473,10RP,3,6,0.4218,0.2864,6.555,0.0965,0.0655,0.0668,0.0946,0.0653,0.0615,0.4561,0.2008,0.2646,116,51,67
-474,10RP,3,8,0.4552,0.2741,6.555,0.1089,0.0655,0.0647,0.107,0.0652,0.0596,0.5028,0.1565,0.2616,128,40,67
-475,10RP,3,10,0.4851,0.2618,6.555,0.1215,0.0655,0.0634,0.1195,0.0651,0.0583,0.5452,0.091,0.2601,139,23,66
-479,2.5R,3,2,0.3591,0.313,6.555,0.0752,0.0655,0.0687,0.0733,0.0655,0.0632,0.3581,0.2587,0.266,91,66,68
-480,2.5R,3,4,0.4021,0.3076,6.555,0.0857,0.0655,0.0619,0.0839,0.0654,0.0569,0.4139,0.2316,0.2515,106,59,64
-481,2.5R,3,6,0.4409,0.3009,6.555,0.096,0.0655,0.0562,0.0943,0.0654,0.0518,0.4604,0.201,0.2391,117,51,61
-482,2.5R,3,8,0.4821,0.2918,6.555,0.1083,0.0655,0.0508,0.1066,0.0653,0.0467,0.5082,0.1564,0.2266,130,40,58
-483,2.5R,3,10,0.5191,0.2811,6.555,0.121,0.0655,0.0466,0.1194,0.0652,0.0429,0.5519,0.0889,0.217,141,23,55
-487,5R,3,2,0.3645,0.319,6.555,0.0749,0.0655,0.065,0.0731,0.0655,0.0599,0.3594,0.2591,0.2576,92,66,66
-488,5R,3,4,0.4148,0.319,6.555,0.0852,0.0655,0.0547,0.0835,0.0655,0.0503,0.4167,0.2321,0.2334,106,59,60
-489,5R,3,6,0.4592,0.3168,6.555,0.095,0.0655,0.0463,0.0934,0.0654,0.0426,0.4623,0.2029,0.2118,118,52,54
-490,5R,3,8,0.5064,0.3114,6.555,0.1066,0.0655,0.0384,0.105,0.0654,0.0353,0.5089,0.1612,0.189,130,41,48
-491,5R,3,10,0.55,0.3024,6.555,0.1192,0.0655,0.032,0.1177,0.0653,0.0294,0.5531,0.0972,0.1692,141,25,43
-495,7.5R,3,2,0.369,0.3248,6.555,0.0745,0.0655,0.0618,0.0727,0.0655,0.0569,0.3598,0.2598,0.2498,92,66,64
-496,7.5R,3,4,0.424,0.3302,6.555,0.0842,0.0655,0.0488,0.0825,0.0655,0.0449,0.416,0.2342,0.2171,106,60,55
-497,7.5R,3,6,0.4738,0.3316,6.555,0.0937,0.0655,0.0385,0.0921,0.0655,0.0354,0.4617,0.206,0.1869,118,53,48
-498,7.5R,3,8,0.5251,0.3297,6.555,0.1044,0.0655,0.0289,0.103,0.0654,0.0265,0.5063,0.1682,0.1535,129,43,39
-499,7.5R,3,10,0.573,0.324,6.555,0.1159,0.0655,0.0208,0.1146,0.0654,0.0191,0.5481,0.1142,0.1191,140,29,30
-503,10R,3,2,0.3728,0.3314,6.555,0.0737,0.0655,0.0585,0.072,0.0656,0.0538,0.3585,0.2612,0.2415,91,67,62
-504,10R,3,4,0.4308,0.3412,6.555,0.0828,0.0655,0.0438,0.0812,0.0655,0.0403,0.4131,0.2374,0.202,105,61,52
-505,10R,3,6,0.4854,0.3467,6.555,0.0918,0.0655,0.0317,0.0903,0.0655,0.0292,0.4583,0.2109,0.1621,117,54,41
-506,10R,3,8,0.5393,0.3477,6.555,0.1017,0.0655,0.0213,0.1003,0.0655,0.0195,0.5008,0.1771,0.1171,128,45,30
-507,10R,3,10,0.5871,0.344,6.555,0.1119,0.0655,0.0131,0.1106,0.0654,0.012,0.539,0.1335,0.0658,137,34,17
-510,2.5YR,3,2,0.3757,0.3391,6.555,0.0726,0.0655,0.0551,0.0709,0.0656,0.0507,0.3553,0.2634,0.2326,91,67,59
-511,2.5YR,3,4,0.436,0.3563,6.555,0.0802,0.0655,0.0382,0.0787,0.0656,0.0351,0.4054,0.2433,0.1833,103,62,47
-512,2.5YR,3,6,0.4954,0.3692,6.555,0.088,0.0655,0.024,0.0866,0.0656,0.0221,0.4478,0.221,0.1272,114,56,32
-513,2.5YR,3,8,0.5475,0.3771,6.555,0.0952,0.0655,0.0131,0.094,0.0656,0.012,0.4819,0.198,0.0563,123,50,14
-515,5YR,3,2,0.3771,0.3476,6.555,0.0711,0.0655,0.0519,0.0694,0.0656,0.0478,0.3498,0.2666,0.2237,89,68,57
-516,5YR,3,4,0.4376,0.3715,6.555,0.0772,0.0655,0.0337,0.0758,0.0656,0.031,0.3947,0.2503,0.1663,101,64,42
-517,5YR,3,6,0.4966,0.3908,6.555,0.0833,0.0655,0.0189,0.082,0.0657,0.0173,0.4318,0.2332,0.0964,110,59,25
-519,7.5YR,3,2,0.3771,0.3549,6.555,0.0697,0.0655,0.0495,0.068,0.0656,0.0455,0.3438,0.2697,0.2166,88,69,55
-520,7.5YR,3,4,0.4378,0.3865,6.555,0.0743,0.0655,0.0298,0.0729,0.0657,0.0274,0.3833,0.2571,0.1499,98,66,38
-521,7.5YR,3,6,0.493,0.4116,6.555,0.0785,0.0655,0.0152,0.0773,0.0657,0.0139,0.4135,0.2452,0.0666,105,63,17
-523,10YR,3,2,0.3747,0.363,6.555,0.0677,0.0655,0.0474,0.0661,0.0657,0.0436,0.3343,0.2739,0.2101,85,70,54
-524,10YR,3,4,0.4341,0.4018,6.555,0.0708,0.0655,0.0268,0.0695,0.0657,0.0246,0.3684,0.2648,0.1355,94,68,35
-525,10YR,3,6,0.4872,0.4326,6.555,0.0738,0.0655,0.0122,0.0727,0.0658,0.0111,0.3941,0.2564,0.03,100,65,8
-527,2.5Y,3,2,0.3703,0.37,6.555,0.0656,0.0655,0.046,0.064,0.0657,0.0423,0.3234,0.2783,0.2057,82,71,52
-528,2.5Y,3,4,0.4277,0.4166,6.555,0.0673,0.0655,0.0245,0.066,0.0658,0.0225,0.3517,0.2726,0.1233,90,70,31
-530,5Y,3,2,0.3646,0.3748,6.555,0.0638,0.0655,0.0456,0.0622,0.0657,0.0419,0.3126,0.2822,0.204,80,72,52
-531,5Y,3,4,0.4191,0.4283,6.555,0.0641,0.0655,0.0234,0.0629,0.0658,0.0214,0.3351,0.2794,0.1163,85,71,30
-533,7.5Y,3,2,0.3589,0.3778,6.555,0.0623,0.0655,0.0457,0.0607,0.0657,0.042,0.303,0.2854,0.2041,77,73,52
-534,7.5Y,3,4,0.4086,0.4379,6.555,0.0612,0.0655,0.023,0.0599,0.0658,0.0211,0.3177,0.2857,0.1132,81,73,29
-536,10Y,3,2,0.3513,0.3789,6.555,0.0608,0.0655,0.0467,0.0592,0.0657,0.0429,0.292,0.2886,0.2068,74,74,53
-537,10Y,3,4,0.3961,0.4452,6.555,0.0583,0.0655,0.0234,0.057,0.0659,0.0214,0.2993,0.2917,0.1144,76,74,29
-539,2.5GY,3,2,0.3412,0.3768,6.555,0.0594,0.0655,0.0491,0.0577,0.0657,0.0451,0.2797,0.2918,0.2136,71,74,54
-540,2.5GY,3,4,0.3772,0.4484,6.555,0.0551,0.0655,0.0255,0.0538,0.0659,0.0234,0.2751,0.2983,0.1248,70,76,32
-542,5GY,3,2,0.3319,0.3729,6.555,0.0583,0.0655,0.0519,0.0567,0.0657,0.0477,0.2692,0.2941,0.2215,69,75,56
-543,5GY,3,4,0.3554,0.4429,6.555,0.0526,0.0655,0.0299,0.0512,0.0659,0.0274,0.2506,0.3037,0.1447,64,77,37
-544,5GY,3,6,0.375,0.5109,6.555,0.0481,0.0655,0.0146,0.047,0.066,0.0134,0.2322,0.3111,0.0428,59,79,11
-546,7.5GY,3,2,0.318,0.3644,6.555,0.0572,0.0655,0.0571,0.0555,0.0657,0.0526,0.2543,0.2968,0.2355,65,76,60
-547,7.5GY,3,4,0.327,0.4288,6.555,0.05,0.0655,0.0373,0.0485,0.0659,0.0343,0.2178,0.3094,0.1739,56,79,44
-548,7.5GY,3,6,0.3333,0.4967,6.555,0.044,0.0655,0.0224,0.0427,0.066,0.0206,0.1784,0.3195,0.1042,45,81,27
-551,10GY,3,2,0.3088,0.3578,6.555,0.0566,0.0655,0.0611,0.0548,0.0657,0.0562,0.2442,0.2984,0.2454,62,76,63
-552,10GY,3,4,0.3053,0.4123,6.555,0.0485,0.0655,0.0449,0.047,0.0659,0.0413,0.1914,0.3127,0.1991,49,80,51
-553,10GY,3,6,0.2992,0.4717,6.555,0.0416,0.0655,0.0318,0.0402,0.066,0.0293,0.1248,0.3246,0.1504,32,83,38
-558,2.5G,3,2,0.2999,0.35,6.555,0.0562,0.0655,0.0656,0.0544,0.0657,0.0603,0.235,0.2996,0.2563,60,76,65
-559,2.5G,3,4,0.2836,0.3915,6.555,0.0475,0.0655,0.0544,0.0458,0.0658,0.0501,0.1616,0.3155,0.2267,41,80,58
-560,2.5G,3,6,0.2642,0.4342,6.555,0.0399,0.0655,0.0455,0.0384,0.0659,0.0419,0.0252,0.3287,0.1995,6,84,51
-569,5G,3,2,0.2935,0.3439,6.555,0.0559,0.0655,0.0691,0.0541,0.0657,0.0636,0.2282,0.3004,0.2645,58,77,67
-570,5G,3,4,0.2711,0.378,6.555,0.047,0.0655,0.0609,0.0453,0.0658,0.056,0.1412,0.3169,0.2434,36,81,62
-580,7.5G,3,2,0.289,0.3391,6.555,0.0559,0.0655,0.0719,0.054,0.0657,0.0662,0.2237,0.3007,0.2707,57,77,69
-581,7.5G,3,4,0.2618,0.3667,6.555,0.0468,0.0655,0.0664,0.045,0.0658,0.0611,0.1243,0.3177,0.2569,32,81,66
-591,10G,3,2,0.2844,0.3337,6.555,0.0559,0.0655,0.075,0.0539,0.0656,0.0691,0.2193,0.301,0.2775,56,77,71
-592,10G,3,4,0.2525,0.3537,6.555,0.0468,0.0655,0.073,0.0449,0.0657,0.0672,0.1059,0.3182,0.2719,27,81,69
-602,2.5BG,3,2,0.2799,0.3271,6.555,0.0561,0.0655,0.0788,0.0541,0.0656,0.0725,0.216,0.3009,0.2855,55,77,73
-603,2.5BG,3,4,0.2437,0.3386,6.555,0.0472,0.0655,0.0809,0.0452,0.0657,0.0744,0.0884,0.3181,0.2888,23,81,74
-612,5BG,3,2,0.2742,0.3192,6.555,0.0563,0.0655,0.0835,0.0543,0.0656,0.0769,0.2111,0.3008,0.2952,54,77,75
-613,5BG,3,4,0.2343,0.32,6.555,0.048,0.0655,0.0913,0.0459,0.0656,0.0841,0.0686,0.3174,0.3095,17,81,79
-621,7.5BG,3,2,0.2699,0.312,6.555,0.0567,0.0655,0.0878,0.0546,0.0656,0.0809,0.2085,0.3004,0.3038,53,77,77
-622,7.5BG,3,4,0.2272,0.3041,6.555,0.049,0.0655,0.101,0.0467,0.0656,0.093,0.0528,0.3164,0.3274,13,81,83
-629,10BG,3,2,0.266,0.305,6.555,0.0572,0.0655,0.0922,0.055,0.0655,0.0849,0.2065,0.2999,0.3122,53,76,80
-630,10BG,3,4,0.2221,0.2886,6.555,0.0504,0.0655,0.1111,0.0481,0.0655,0.1024,0.0506,0.3144,0.3449,13,80,88
-636,2.5B,3,2,0.2636,0.2983,6.555,0.0579,0.0655,0.0963,0.0557,0.0655,0.0886,0.2079,0.2987,0.3198,53,76,82
-637,2.5B,3,4,0.2183,0.2748,6.555,0.0521,0.0655,0.1209,0.0496,0.0654,0.1114,0.0555,0.3121,0.3609,14,80,92
-642,5B,3,2,0.2617,0.2921,6.555,0.0587,0.0655,0.1001,0.0565,0.0655,0.0922,0.2101,0.2974,0.3269,54,76,83
-643,5B,3,4,0.2176,0.2632,6.555,0.0542,0.0655,0.1293,0.0516,0.0654,0.1191,0.08,0.3087,0.3741,20,79,95
-648,7.5B,3,2,0.2616,0.2857,6.555,0.06,0.0655,0.1039,0.0577,0.0655,0.0956,0.2171,0.2951,0.3335,55,75,85
-649,7.5B,3,4,0.22,0.2536,6.555,0.0569,0.0655,0.1361,0.0541,0.0653,0.1253,0.1152,0.3041,0.3843,29,78,98
-654,10B,3,2,0.2631,0.2801,6.555,0.0616,0.0655,0.1069,0.0592,0.0654,0.0984,0.2272,0.2922,0.3389,58,75,86
-655,10B,3,4,0.2246,0.2467,6.555,0.0597,0.0655,0.1405,0.0569,0.0653,0.1294,0.1495,0.2989,0.391,38,76,100
-661,2.5PB,3,2,0.2663,0.2756,6.555,0.0633,0.0655,0.109,0.061,0.0654,0.1003,0.24,0.2887,0.3426,61,74,87
-662,2.5PB,3,4,0.2312,0.2405,6.555,0.063,0.0655,0.144,0.0602,0.0652,0.1326,0.185,0.2924,0.3962,47,75,101
-663,2.5PB,3,6,0.2022,0.2101,6.555,0.0631,0.0655,0.1834,0.0597,0.065,0.1689,0.096,0.2957,0.4475,24,75,114
-668,5PB,3,2,0.2708,0.2719,6.555,0.0653,0.0655,0.1102,0.0629,0.0654,0.1015,0.2544,0.2848,0.3449,65,73,88
-669,5PB,3,4,0.2393,0.2361,6.555,0.0664,0.0655,0.1456,0.0636,0.0652,0.1342,0.2178,0.2855,0.3988,56,73,102
-670,5PB,3,6,0.2122,0.2052,6.555,0.0678,0.0655,0.1861,0.0644,0.065,0.1715,0.1654,0.2862,0.4511,42,73,115
-671,5PB,3,8,0.1908,0.1799,6.555,0.0695,0.0655,0.2293,0.0656,0.0647,0.2113,0.0835,0.2864,0.4997,21,73,127
-677,7.5PB,3,2,0.2777,0.2687,6.555,0.0677,0.0655,0.1107,0.0653,0.0654,0.1019,0.2727,0.2796,0.3458,70,71,88
-678,7.5PB,3,4,0.252,0.2319,6.555,0.0712,0.0655,0.1459,0.0684,0.0651,0.1344,0.2586,0.2752,0.3995,66,70,102
-679,7.5PB,3,6,0.2311,0.201,6.555,0.0754,0.0655,0.1852,0.072,0.0649,0.1706,0.2437,0.2697,0.4506,62,69,115
-680,7.5PB,3,8,0.2149,0.1761,6.555,0.08,0.0655,0.2267,0.0761,0.0647,0.2089,0.2292,0.2631,0.4976,58,67,127
-681,7.5PB,3,10,0.2005,0.1536,6.555,0.0856,0.0655,0.2756,0.081,0.0644,0.254,0.2118,0.2548,0.5467,54,65,139
-682,7.5PB,3,12,0.1903,0.1353,6.555,0.0922,0.0655,0.3267,0.087,0.0641,0.3011,0.2004,0.2437,0.5926,51,62,151
-683,7.5PB,3,14,0.1824,0.1188,6.555,0.1006,0.0655,0.3856,0.0946,0.0637,0.3553,0.1952,0.228,0.6405,50,58,163
-684,7.5PB,3,16,0.1765,0.1048,6.555,0.1104,0.0655,0.4495,0.1036,0.0633,0.4143,0.1956,0.2077,0.6877,50,53,175
-685,7.5PB,3,18,0.173,0.0948,6.555,0.1196,0.0655,0.5063,0.112,0.0629,0.4666,0.2019,0.1857,0.7264,51,47,185
-686,7.5PB,3,20,0.1702,0.0867,6.555,0.1287,0.0655,0.5618,0.1204,0.0626,0.5178,0.2082,0.1609,0.7619,53,41,194
-687,7.5PB,3,22,0.1677,0.0782,6.555,0.1406,0.0655,0.6321,0.1313,0.0621,0.5825,0.22,0.12,0.8039,56,31,205
-688,7.5PB,3,24,0.1658,0.0711,6.555,0.1529,0.0655,0.7035,0.1427,0.0616,0.6484,0.233,0.0536,0.8438,59,14,215
-694,10PB,3,2,0.2847,0.267,6.555,0.0699,0.0655,0.1101,0.0675,0.0653,0.1014,0.2886,0.2748,0.3451,74,70,88
-695,10PB,3,4,0.266,0.2319,6.555,0.0752,0.0655,0.1419,0.0724,0.0651,0.1307,0.2917,0.2659,0.3943,74,68,101
-696,10PB,3,6,0.2511,0.2031,6.555,0.081,0.0655,0.1762,0.0778,0.0649,0.1623,0.2961,0.2556,0.44,76,65,112
-697,10PB,3,8,0.2387,0.1786,6.555,0.0876,0.0655,0.2139,0.0838,0.0647,0.197,0.3016,0.2433,0.4842,77,62,123
-698,10PB,3,10,0.2278,0.1565,6.555,0.0954,0.0655,0.2579,0.0911,0.0644,0.2376,0.3088,0.2276,0.5302,79,58,135
-699,10PB,3,12,0.2206,0.1407,6.555,0.1028,0.0655,0.2976,0.0979,0.0641,0.2742,0.3171,0.2114,0.5677,81,54,145
-700,10PB,3,14,0.2142,0.125,6.555,0.1123,0.0655,0.3465,0.1068,0.0638,0.3193,0.3298,0.1877,0.6101,84,48,156
-701,10PB,3,16,0.2092,0.1118,6.555,0.1227,0.0655,0.3981,0.1165,0.0634,0.3669,0.344,0.1574,0.651,88,40,166
-702,10PB,3,18,0.206,0.102,6.555,0.1324,0.0655,0.4447,0.1256,0.0631,0.4098,0.3584,0.1216,0.6853,91,31,175
-703,10PB,3,20,0.203,0.093,6.555,0.1431,0.0655,0.4962,0.1356,0.0627,0.4573,0.3733,0.064,0.7207,95,16,184
-711,2.5P,3,2,0.2922,0.268,6.555,0.0715,0.0655,0.1076,0.0691,0.0653,0.0991,0.3016,0.2711,0.341,77,69,87
-712,2.5P,3,4,0.2792,0.2342,6.555,0.0781,0.0655,0.1362,0.0754,0.0651,0.1254,0.3164,0.2585,0.3864,81,66,99
-713,2.5P,3,6,0.2691,0.2072,6.555,0.0851,0.0655,0.1657,0.082,0.0649,0.1526,0.3314,0.2444,0.4271,85,62,109
-714,2.5P,3,8,0.2615,0.1845,6.555,0.0929,0.0655,0.1968,0.0893,0.0647,0.1813,0.3486,0.2275,0.4655,89,58,119
-715,2.5P,3,10,0.2548,0.1638,6.555,0.102,0.0655,0.2327,0.0979,0.0644,0.2144,0.3678,0.2056,0.5052,94,52,129
-716,2.5P,3,12,0.2498,0.148,6.555,0.1106,0.0655,0.2667,0.1061,0.0642,0.2457,0.3852,0.1819,0.5396,98,46,138
-717,2.5P,3,14,0.2449,0.1325,6.555,0.1212,0.0655,0.308,0.1161,0.0639,0.2838,0.4052,0.1478,0.578,103,38,147
-718,2.5P,3,16,0.241,0.1198,6.555,0.1319,0.0655,0.3497,0.1263,0.0636,0.3223,0.4246,0.1017,0.6136,108,26,156
-719,2.5P,3,18,0.238,0.1094,6.555,0.1426,0.0655,0.391,0.1365,0.0633,0.3603,0.4433,0.0138,0.6465,113,4,165
-728,5P,3,2,0.2997,0.27,6.555,0.0728,0.0655,0.1045,0.0704,0.0653,0.0962,0.3129,0.2679,0.3359,80,68,86
-729,5P,3,4,0.2928,0.2386,6.555,0.0804,0.0655,0.1287,0.0778,0.0651,0.1186,0.3367,0.2522,0.3755,86,64,96
-730,5P,3,6,0.287,0.2135,6.555,0.0881,0.0655,0.1534,0.0851,0.065,0.1413,0.3584,0.2354,0.4111,91,60,105
-731,5P,3,8,0.2819,0.191,6.555,0.0967,0.0655,0.1809,0.0934,0.0647,0.1666,0.3811,0.2147,0.4469,97,55,114
-732,5P,3,10,0.2772,0.1707,6.555,0.1064,0.0655,0.212,0.1027,0.0645,0.1953,0.4046,0.1884,0.4834,103,48,123
-733,5P,3,12,0.2739,0.1539,6.555,0.1167,0.0655,0.2437,0.1124,0.0642,0.2245,0.4284,0.1554,0.5174,109,40,132
-734,5P,3,14,0.2707,0.1397,6.555,0.127,0.0655,0.2767,0.1224,0.064,0.2549,0.4505,0.1123,0.5499,115,29,140
-735,5P,3,16,0.268,0.1272,6.555,0.1381,0.0655,0.3117,0.133,0.0637,0.2872,0.4729,0.0329,0.582,121,8,148
-744,7.5P,3,2,0.3088,0.274,6.555,0.0739,0.0655,0.0998,0.0716,0.0654,0.0919,0.324,0.2649,0.3279,83,68,84
-745,7.5P,3,4,0.3072,0.2448,6.555,0.0823,0.0655,0.12,0.0797,0.0652,0.1105,0.3542,0.2468,0.3622,90,63,92
-746,7.5P,3,6,0.3057,0.2208,6.555,0.0908,0.0655,0.1406,0.0879,0.065,0.1295,0.3817,0.2269,0.3937,97,58,100
-747,7.5P,3,8,0.3037,0.1981,6.555,0.1005,0.0655,0.1649,0.0973,0.0648,0.1519,0.4101,0.2013,0.4272,105,51,109
-748,7.5P,3,10,0.302,0.1794,6.555,0.1103,0.0655,0.1895,0.1068,0.0646,0.1746,0.4365,0.1712,0.4581,111,44,117
-749,7.5P,3,12,0.3003,0.1618,6.555,0.1217,0.0655,0.2179,0.1178,0.0643,0.2008,0.4645,0.1277,0.4908,118,33,125
-750,7.5P,3,14,0.2992,0.1475,6.555,0.133,0.0655,0.2459,0.1287,0.0641,0.2265,0.4908,0.0601,0.5206,125,15,133
-759,10P,3,2,0.317,0.279,6.555,0.0745,0.0655,0.0949,0.0723,0.0654,0.0874,0.332,0.263,0.3191,85,67,81
-760,10P,3,4,0.3214,0.2517,6.555,0.0837,0.0655,0.1112,0.0812,0.0652,0.1024,0.3688,0.2423,0.3483,94,62,89
-761,10P,3,6,0.3243,0.2293,6.555,0.0927,0.0655,0.1276,0.09,0.065,0.1175,0.4004,0.2199,0.3749,102,56,96
-762,10P,3,8,0.3269,0.2075,6.555,0.1033,0.0655,0.1471,0.1003,0.0648,0.1355,0.4339,0.1899,0.4038,111,48,103
-763,10P,3,10,0.3286,0.1889,6.555,0.114,0.0655,0.1674,0.1108,0.0646,0.1542,0.4647,0.153,0.4315,118,39,110
-764,10P,3,12,0.3301,0.1715,6.555,0.1262,0.0655,0.1905,0.1226,0.0644,0.1755,0.4965,0.0953,0.4604,127,24,117
-772,2.5RP,3,2,0.3272,0.2861,6.555,0.075,0.0655,0.0886,0.0728,0.0654,0.0816,0.3403,0.2613,0.3074,87,67,78
-773,2.5RP,3,4,0.34,0.2624,6.555,0.0849,0.0655,0.0993,0.0826,0.0653,0.0915,0.3839,0.2378,0.3282,98,61,84
-774,2.5RP,3,6,0.3501,0.2425,6.555,0.0946,0.0655,0.1101,0.0922,0.0651,0.1014,0.421,0.2122,0.3476,107,54,89
-775,2.5RP,3,8,0.3598,0.2233,6.555,0.1056,0.0655,0.1224,0.103,0.0649,0.1127,0.4586,0.1782,0.3681,117,45,94
-776,2.5RP,3,10,0.3681,0.2054,6.555,0.1175,0.0655,0.1361,0.1146,0.0648,0.1254,0.495,0.1315,0.3896,126,34,99
-777,2.5RP,3,12,0.3754,0.1898,6.555,0.1296,0.0655,0.1502,0.1266,0.0646,0.1383,0.5292,0.053,0.4101,135,14,105
-783,5RP,3,2,0.337,0.294,6.555,0.0751,0.0655,0.0823,0.0731,0.0654,0.0757,0.3466,0.2602,0.295,88,66,75
-784,5RP,3,4,0.3586,0.2742,6.555,0.0857,0.0655,0.0878,0.0836,0.0653,0.0808,0.3961,0.2344,0.307,101,60,78
-785,5RP,3,6,0.3765,0.2569,6.555,0.0961,0.0655,0.0935,0.0938,0.0652,0.0861,0.4378,0.2058,0.3189,112,52,81
-786,5RP,3,8,0.393,0.2395,6.555,0.1076,0.0655,0.1006,0.1052,0.065,0.0926,0.4786,0.1676,0.3327,122,43,85
-787,5RP,3,10,0.4073,0.2235,6.555,0.1195,0.0655,0.1083,0.117,0.0649,0.0997,0.5165,0.115,0.3469,132,29,88
-793,7.5RP,3,2,0.345,0.3001,6.555,0.0754,0.0655,0.0775,0.0734,0.0654,0.0714,0.3517,0.2592,0.2853,90,66,73
-794,7.5RP,3,4,0.3739,0.2851,6.555,0.086,0.0655,0.0784,0.0839,0.0653,0.0722,0.4038,0.2328,0.2884,103,59,74
-795,7.5RP,3,6,0.399,0.2708,6.555,0.0966,0.0655,0.0799,0.0945,0.0652,0.0736,0.4483,0.2024,0.2928,114,52,75
-796,7.5RP,3,8,0.4234,0.2556,6.555,0.1086,0.0655,0.0823,0.1065,0.0651,0.0758,0.4924,0.1607,0.299,126,41,76
-797,7.5RP,3,10,0.4445,0.2419,6.555,0.1205,0.0655,0.085,0.1183,0.065,0.0782,0.5315,0.1035,0.3056,136,26,78
-802,10RP,4,2,0.3417,0.3106,12,0.132,0.12,0.1343,0.1285,0.1199,0.1237,0.4496,0.3584,0.3709,115,91,95
-803,10RP,4,4,0.3715,0.3042,12,0.1465,0.12,0.1279,0.143,0.1198,0.1178,0.5071,0.3336,0.3623,129,85,92
-804,10RP,4,6,0.3999,0.2972,12,0.1615,0.12,0.1223,0.158,0.1197,0.1126,0.5582,0.3057,0.3548,142,78,90
-805,10RP,4,8,0.4282,0.289,12,0.1778,0.12,0.1174,0.1744,0.1196,0.1081,0.6075,0.2713,0.3484,155,69,89
-806,10RP,4,10,0.4528,0.2811,12,0.1933,0.12,0.1136,0.1899,0.1194,0.1045,0.6497,0.2332,0.3436,166,59,88
-807,10RP,4,12,0.4789,0.2717,12,0.2115,0.12,0.1102,0.2081,0.1193,0.1014,0.6947,0.1768,0.3396,177,45,87
-808,10RP,4,14,0.502,0.2623,12,0.2297,0.12,0.1078,0.2263,0.1191,0.0992,0.7358,0.0887,0.3375,188,23,86
-812,2.5R,4,2,0.3461,0.315,12,0.1318,0.12,0.1291,0.1284,0.1199,0.1188,0.4521,0.3584,0.3628,115,91,93
-813,2.5R,4,4,0.3806,0.3125,12,0.1462,0.12,0.1178,0.1428,0.1199,0.1085,0.511,0.3336,0.346,130,85,88
-814,2.5R,4,6,0.4141,0.3085,12,0.1611,0.12,0.1079,0.1578,0.1198,0.0993,0.5636,0.3053,0.3306,144,78,84
-815,2.5R,4,8,0.4472,0.3031,12,0.1771,0.12,0.0989,0.1739,0.1197,0.091,0.6131,0.2712,0.316,156,69,81
-816,2.5R,4,10,0.4774,0.2969,12,0.193,0.12,0.0912,0.1898,0.1196,0.0839,0.6573,0.2316,0.3033,168,59,77
-817,2.5R,4,12,0.5072,0.2897,12,0.2101,0.12,0.0841,0.207,0.1194,0.0774,0.7005,0.1779,0.2912,179,45,74
-818,2.5R,4,14,0.5369,0.281,12,0.2293,0.12,0.0778,0.2263,0.1193,0.0715,0.7446,0.0823,0.2803,190,21,71
-821,5R,4,2,0.3508,0.32,12,0.1316,0.12,0.1235,0.1281,0.12,0.1136,0.4543,0.3585,0.3538,116,91,90
-822,5R,4,4,0.3916,0.3223,12,0.1458,0.12,0.1065,0.1426,0.1199,0.098,0.5156,0.3334,0.3266,131,85,83
-823,5R,4,6,0.4299,0.3226,12,0.1599,0.12,0.0921,0.1568,0.1199,0.0847,0.5674,0.3062,0.3011,145,78,77
-824,5R,4,8,0.469,0.3209,12,0.1754,0.12,0.0786,0.1725,0.1198,0.0722,0.617,0.273,0.2752,157,70,70
-825,5R,4,10,0.5043,0.3176,12,0.1905,0.12,0.0673,0.1877,0.1197,0.0619,0.6603,0.2353,0.2514,168,60,64
-826,5R,4,12,0.5385,0.3129,12,0.2065,0.12,0.057,0.2038,0.1196,0.0524,0.7018,0.1864,0.2274,179,48,58
-827,5R,4,14,0.5734,0.3057,12,0.2251,0.12,0.0475,0.2225,0.1195,0.0436,0.7455,0.1022,0.2031,190,26,52
-830,7.5R,4,2,0.3538,0.3236,12,0.1312,0.12,0.1196,0.1278,0.12,0.1101,0.4552,0.3588,0.3475,116,91,89
-831,7.5R,4,4,0.399,0.33,12,0.1451,0.12,0.0985,0.142,0.12,0.0907,0.5173,0.334,0.3119,132,85,80
-832,7.5R,4,6,0.4415,0.334,12,0.1586,0.12,0.0807,0.1557,0.1199,0.0742,0.5687,0.3078,0.2776,145,78,71
-833,7.5R,4,8,0.485,0.3359,12,0.1733,0.12,0.064,0.1705,0.1199,0.0588,0.6172,0.2763,0.2406,157,70,61
-834,7.5R,4,10,0.5235,0.3351,12,0.1875,0.12,0.0506,0.1849,0.1198,0.0465,0.659,0.2415,0.206,168,62,53
-835,7.5R,4,12,0.5603,0.3321,12,0.2025,0.12,0.0389,0.2,0.1197,0.0357,0.6988,0.1974,0.1696,178,50,43
-836,7.5R,4,14,0.5959,0.3269,12,0.2187,0.12,0.0283,0.2164,0.1196,0.0259,0.7382,0.1324,0.1287,188,34,33
-840,10R,4,2,0.3582,0.3294,12,0.1305,0.12,0.1138,0.1272,0.12,0.1047,0.4559,0.3595,0.3377,116,92,86
-841,10R,4,4,0.4078,0.3412,12,0.1434,0.12,0.0883,0.1404,0.12,0.0812,0.517,0.3362,0.2916,132,86,74
-842,10R,4,6,0.4535,0.35,12,0.1555,0.12,0.0674,0.1527,0.12,0.0619,0.5653,0.3127,0.2465,144,80,63
-843,10R,4,8,0.4995,0.3557,12,0.1685,0.12,0.0489,0.166,0.12,0.0449,0.6106,0.2852,0.197,156,73,50
-844,10R,4,10,0.5418,0.358,12,0.1816,0.12,0.0336,0.1792,0.1199,0.0308,0.6508,0.2542,0.1431,166,65,36
-845,10R,4,12,0.5801,0.3588,12,0.194,0.12,0.0204,0.1918,0.1199,0.0187,0.6857,0.2204,0.0697,175,56,18
-848,2.5YR,4,2,0.3624,0.3367,12,0.1292,0.12,0.1072,0.1259,0.1201,0.0987,0.4546,0.3612,0.3261,116,92,83
-849,2.5YR,4,4,0.4141,0.3539,12,0.1404,0.12,0.0787,0.1375,0.1201,0.0723,0.5117,0.3407,0.2709,130,87,69
-850,2.5YR,4,6,0.4612,0.3674,12,0.1506,0.12,0.056,0.148,0.1201,0.0514,0.5559,0.3209,0.2154,142,82,55
-851,2.5YR,4,8,0.5071,0.3777,12,0.1611,0.12,0.0366,0.1587,0.1201,0.0336,0.5953,0.2993,0.1509,152,76,38
-852,2.5YR,4,10,0.5475,0.3856,12,0.1704,0.12,0.0208,0.1682,0.1201,0.019,0.627,0.2787,0.0607,160,71,15
-854,5YR,4,2,0.3651,0.3442,12,0.1273,0.12,0.1013,0.1242,0.1201,0.0933,0.4507,0.3638,0.3152,115,93,80
-855,5YR,4,4,0.4187,0.3679,12,0.1366,0.12,0.0696,0.1338,0.1202,0.064,0.5032,0.3465,0.2493,128,88,64
-856,5YR,4,6,0.4651,0.3859,12,0.1446,0.12,0.0463,0.1422,0.1202,0.0425,0.5417,0.331,0.1841,138,84,47
-857,5YR,4,8,0.507,0.3994,12,0.1523,0.12,0.0281,0.1501,0.1202,0.0258,0.5737,0.3156,0.1064,146,80,27
-860,7.5YR,4,2,0.3662,0.3504,12,0.1254,0.12,0.0971,0.1223,0.1202,0.0893,0.4458,0.3664,0.3069,114,93,78
-861,7.5YR,4,4,0.4208,0.3809,12,0.1326,0.12,0.0625,0.1299,0.1203,0.0574,0.4929,0.3526,0.2304,126,90,59
-862,7.5YR,4,6,0.4655,0.4029,12,0.1386,0.12,0.0392,0.1363,0.1203,0.036,0.5259,0.3409,0.1562,134,87,40
-863,7.5YR,4,8,0.5038,0.4204,12,0.1438,0.12,0.0216,0.1417,0.1204,0.0198,0.5509,0.3306,0.0533,140,84,14
-865,10YR,4,2,0.366,0.359,12,0.1223,0.12,0.0919,0.1193,0.1202,0.0846,0.4364,0.3709,0.2965,111,95,76
-866,10YR,4,4,0.4189,0.3948,12,0.1273,0.12,0.0566,0.1248,0.1203,0.052,0.477,0.3607,0.2133,122,92,54
-867,10YR,4,6,0.4618,0.4213,12,0.1315,0.12,0.0333,0.1293,0.1204,0.0305,0.5049,0.3523,0.1279,129,90,33
-870,2.5Y,4,2,0.3633,0.3654,12,0.1193,0.12,0.0891,0.1164,0.1202,0.082,0.4254,0.3753,0.2904,108,96,74
-871,2.5Y,4,4,0.4138,0.4076,12,0.1218,0.12,0.0526,0.1193,0.1204,0.0483,0.4584,0.3691,0.2001,117,94,51
-872,2.5Y,4,6,0.4542,0.4391,12,0.1241,0.12,0.0292,0.1219,0.1205,0.0267,0.4806,0.364,0.1027,123,93,26
-875,5Y,4,2,0.359,0.3701,12,0.1164,0.12,0.0878,0.1135,0.1203,0.0808,0.4135,0.3796,0.2875,105,97,73
-876,5Y,4,4,0.4069,0.4188,12,0.1166,0.12,0.0499,0.1141,0.1205,0.0459,0.439,0.3769,0.1907,112,96,49
-877,5Y,4,6,0.4451,0.455,12,0.1174,0.12,0.0263,0.1152,0.1206,0.0241,0.4566,0.3742,0.081,116,95,21
-879,7.5Y,4,2,0.3542,0.3727,12,0.114,0.12,0.0879,0.1111,0.1203,0.0809,0.4027,0.3831,0.2874,103,98,73
-880,7.5Y,4,4,0.3982,0.4272,12,0.1119,0.12,0.049,0.1094,0.1205,0.045,0.4194,0.384,0.1867,107,98,48
-881,7.5Y,4,6,0.4331,0.4688,12,0.1109,0.12,0.0251,0.1087,0.1206,0.023,0.4308,0.3839,0.0679,110,98,17
-883,10Y,4,2,0.3436,0.3732,12,0.1105,0.12,0.0911,0.1075,0.1203,0.0838,0.3836,0.3886,0.2934,98,99,75
-884,10Y,4,4,0.3871,0.4321,12,0.1075,0.12,0.0502,0.1051,0.1205,0.0461,0.399,0.3904,0.1898,102,100,48
-885,10Y,4,6,0.419,0.4795,12,0.1049,0.12,0.0254,0.1027,0.1207,0.0233,0.4042,0.3927,0.0673,103,100,17
-887,2.5GY,4,2,0.3382,0.3706,12,0.1095,0.12,0.0943,0.1065,0.1203,0.0867,0.3764,0.3902,0.2997,96,100,76
-888,2.5GY,4,4,0.3708,0.4329,12,0.1028,0.12,0.0544,0.1003,0.1206,0.05,0.3731,0.3974,0.2023,95,101,52
-889,2.5GY,4,6,0.3968,0.4857,12,0.098,0.12,0.029,0.0959,0.1207,0.0266,0.3685,0.4026,0.092,94,103,23
-891,5GY,4,2,0.3312,0.3678,12,0.1081,0.12,0.0982,0.105,0.1203,0.0904,0.366,0.3925,0.3071,93,100,78
-892,5GY,4,4,0.3538,0.4284,12,0.0991,0.12,0.061,0.0965,0.1206,0.0561,0.3484,0.403,0.2211,89,103,56
-893,5GY,4,6,0.3718,0.4852,12,0.092,0.12,0.0354,0.0897,0.1208,0.0324,0.33,0.4113,0.1266,84,105,32
-896,7.5GY,4,2,0.3185,0.3604,12,0.106,0.12,0.1069,0.1029,0.1203,0.0984,0.3483,0.3959,0.3231,89,101,82
-897,7.5GY,4,4,0.3281,0.4157,12,0.0947,0.12,0.074,0.092,0.1205,0.068,0.3112,0.4098,0.2538,79,104,65
-898,7.5GY,4,6,0.3355,0.4739,12,0.085,0.12,0.0483,0.0826,0.1208,0.0443,0.2714,0.4214,0.1786,69,107,46
-899,7.5GY,4,8,0.34,0.5348,12,0.0763,0.12,0.0281,0.0742,0.1209,0.0257,0.2257,0.4315,0.0757,58,110,19
-902,10GY,4,2,0.3109,0.355,12,0.1051,0.12,0.1129,0.1019,0.1203,0.1039,0.3378,0.3976,0.3336,86,101,85
-903,10GY,4,4,0.31,0.4018,12,0.0926,0.12,0.0861,0.0897,0.1205,0.0792,0.2849,0.4133,0.2808,73,105,72
-904,10GY,4,6,0.3069,0.455,12,0.0809,0.12,0.0628,0.0784,0.1207,0.0577,0.2199,0.4274,0.2231,56,109,57
-905,10GY,4,8,0.3008,0.5095,12,0.0708,0.12,0.0447,0.0685,0.1209,0.041,0.1324,0.4393,0.1622,34,112,41
-910,2.5G,4,2,0.3012,0.347,12,0.1042,0.12,0.1217,0.1008,0.1202,0.112,0.3247,0.3994,0.3483,83,102,89
-911,2.5G,4,4,0.2891,0.3821,12,0.0908,0.12,0.1033,0.0877,0.1204,0.095,0.252,0.4167,0.3147,64,106,80
-912,2.5G,4,6,0.2735,0.4215,12,0.0779,0.12,0.0868,0.075,0.1206,0.0799,0.1419,0.4327,0.2806,36,110,72
-923,5G,4,2,0.2959,0.3417,12,0.1039,0.12,0.1273,0.1005,0.1202,0.1171,0.318,0.4001,0.3573,81,102,91
-924,5G,4,4,0.2781,0.3704,12,0.0901,0.12,0.1139,0.0869,0.1204,0.1048,0.2326,0.4182,0.3337,59,107,85
-925,5G,4,6,0.2581,0.3992,12,0.0776,0.12,0.103,0.0745,0.1206,0.0948,0.0926,0.4339,0.3128,24,111,80
-936,7.5G,4,2,0.2919,0.3371,12,0.1039,0.12,0.1321,0.1004,0.1202,0.1216,0.3135,0.4004,0.3649,80,102,93
-937,7.5G,4,4,0.2702,0.3602,12,0.09,0.12,0.1231,0.0867,0.1203,0.1133,0.2191,0.4189,0.3493,56,107,89
-938,7.5G,4,6,0.2467,0.3822,12,0.0775,0.12,0.1165,0.0742,0.1205,0.1072,0.0213,0.4348,0.337,5,111,86
-949,10G,4,2,0.288,0.3327,12,0.1039,0.12,0.1368,0.1003,0.1202,0.1259,0.3088,0.4007,0.3722,79,102,95
-950,10G,4,4,0.2628,0.3498,12,0.0902,0.12,0.1329,0.0867,0.1203,0.1223,0.206,0.4192,0.3649,53,107,93
-962,2.5BG,4,2,0.284,0.327,12,0.1042,0.12,0.1428,0.1006,0.1201,0.1314,0.3052,0.4006,0.3811,78,102,97
-963,2.5BG,4,4,0.2552,0.3375,12,0.0907,0.12,0.1448,0.0871,0.1202,0.1333,0.1931,0.4191,0.383,49,107,98
-974,5BG,4,2,0.2799,0.3208,12,0.1047,0.12,0.1494,0.101,0.1201,0.1375,0.3018,0.4003,0.3908,77,102,100
-975,5BG,4,4,0.248,0.3232,12,0.0921,0.12,0.1592,0.0883,0.1202,0.1466,0.1837,0.4181,0.4035,47,107,103
-984,7.5BG,4,2,0.2764,0.3148,12,0.1054,0.12,0.1558,0.1016,0.12,0.1435,0.2997,0.3998,0.3999,76,102,102
-985,7.5BG,4,4,0.2429,0.3108,12,0.0938,0.12,0.1723,0.0898,0.1201,0.1587,0.1804,0.4166,0.4212,46,106,107
-993,10BG,4,2,0.274,0.3091,12,0.1064,0.12,0.1619,0.1025,0.12,0.149,0.3003,0.3987,0.4083,77,102,104
-994,10BG,4,4,0.2384,0.2984,12,0.0959,0.12,0.1863,0.0917,0.12,0.1715,0.1801,0.4146,0.4391,46,106,112
-1001,2.5B,4,2,0.2727,0.3038,12,0.1077,0.12,0.1673,0.1038,0.12,0.154,0.3037,0.3971,0.4157,77,101,106
-1002,2.5B,4,4,0.236,0.2872,12,0.0986,0.12,0.1992,0.0943,0.1199,0.1835,0.1888,0.4116,0.455,48,105,116
-1009,5B,4,2,0.2723,0.2992,12,0.1092,0.12,0.1719,0.1052,0.1199,0.1582,0.3088,0.3953,0.4218,79,101,108
-1010,5B,4,4,0.2363,0.2782,12,0.1019,0.12,0.2094,0.0975,0.1198,0.1929,0.2075,0.4077,0.4671,53,104,119
-1016,7.5B,4,2,0.2733,0.2947,12,0.1113,0.12,0.1759,0.1072,0.1199,0.162,0.3179,0.3926,0.4272,81,100,109
-1017,7.5B,4,4,0.2388,0.2704,12,0.106,0.12,0.2178,0.1014,0.1197,0.2006,0.2334,0.4026,0.4769,60,103,122
-1018,7.5B,4,6,0.2102,0.247,12,0.1021,0.12,0.2637,0.097,0.1195,0.2429,0.0953,0.4105,0.5248,24,105,134
-1023,10B,4,2,0.2753,0.291,12,0.1135,0.12,0.1788,0.1094,0.1199,0.1647,0.3287,0.3895,0.4311,84,99,110
-1024,10B,4,4,0.2429,0.2648,12,0.1101,0.12,0.2231,0.1054,0.1197,0.2055,0.2605,0.3971,0.483,66,101,123
-1025,10B,4,6,0.2157,0.2407,12,0.1075,0.12,0.271,0.1023,0.1195,0.2496,0.1653,0.4035,0.5323,42,103,136
-1031,2.5PB,4,2,0.2782,0.2876,12,0.1161,0.12,0.1812,0.1119,0.1198,0.1668,0.3413,0.3859,0.4342,87,98,111
-1032,2.5PB,4,4,0.2487,0.2597,12,0.1149,0.12,0.2272,0.1102,0.1196,0.2092,0.2911,0.3904,0.4877,74,100,124
-1033,2.5PB,4,6,0.2235,0.2343,12,0.1145,0.12,0.2777,0.1091,0.1194,0.2558,0.228,0.3941,0.5392,58,100,137
-1034,2.5PB,4,8,0.1995,0.2094,12,0.1143,0.12,0.3387,0.1082,0.1191,0.3121,0.1117,0.398,0.594,28,101,151
-1040,5PB,4,2,0.2816,0.2842,12,0.1189,0.12,0.1833,0.1147,0.1198,0.1688,0.355,0.3819,0.4371,91,97,111
-1041,5PB,4,4,0.2562,0.256,12,0.1201,0.12,0.2287,0.1153,0.1195,0.2106,0.3227,0.3829,0.4897,82,98,125
-1042,5PB,4,6,0.2325,0.23,12,0.1213,0.12,0.2804,0.1159,0.1193,0.2583,0.2792,0.3844,0.5422,71,98,138
-1043,5PB,4,8,0.2103,0.205,12,0.1231,0.12,0.3423,0.1169,0.119,0.3153,0.2172,0.3856,0.5974,55,98,152
-1044,5PB,4,10,0.1925,0.1843,12,0.1253,0.12,0.4058,0.1183,0.1186,0.3739,0.1265,0.3862,0.6481,32,98,165
-1050,7.5PB,4,2,0.2861,0.2819,12,0.1218,0.12,0.1839,0.1176,0.1198,0.1693,0.3697,0.3776,0.438,94,96,112
-1051,7.5PB,4,4,0.2657,0.2528,12,0.1261,0.12,0.2286,0.1214,0.1195,0.2105,0.3569,0.3739,0.49,91,95,125
-1052,7.5PB,4,6,0.2471,0.2266,12,0.1309,0.12,0.2787,0.1254,0.1192,0.2567,0.3411,0.3698,0.5411,87,94,138
-1053,7.5PB,4,8,0.2304,0.2023,12,0.1367,0.12,0.3365,0.1305,0.1189,0.31,0.3239,0.3646,0.5932,83,93,151
-1054,7.5PB,4,10,0.2158,0.1811,12,0.143,0.12,0.3996,0.136,0.1185,0.3682,0.3036,0.3587,0.6442,77,91,164
-1055,7.5PB,4,12,0.2037,0.1629,12,0.1501,0.12,0.4666,0.1422,0.1181,0.4299,0.2826,0.3518,0.6931,72,90,177
-1056,7.5PB,4,14,0.1941,0.1468,12,0.1587,0.12,0.5388,0.1499,0.1177,0.4964,0.2654,0.3425,0.7413,68,87,189
-1057,7.5PB,4,16,0.1861,0.1316,12,0.1697,0.12,0.6222,0.1598,0.1171,0.5733,0.2526,0.3295,0.7924,64,84,202
-1058,7.5PB,4,18,0.1798,0.1185,12,0.1821,0.12,0.7106,0.171,0.1166,0.6548,0.244,0.3136,0.8422,62,80,215
-1059,7.5PB,4,20,0.1742,0.1058,12,0.1976,0.12,0.8166,0.1851,0.1159,0.7526,0.2389,0.2919,0.8973,61,74,229
-1060,7.5PB,4,22,0.1713,0.098,12,0.2098,0.12,0.8947,0.1963,0.1154,0.8245,0.2416,0.2729,0.9352,62,70,238
-1061,7.5PB,4,24,0.1684,0.0899,12,0.2248,0.12,0.99,0.2101,0.1148,0.9124,0.2461,0.247,0.9789,63,63,250
-1062,7.5PB,4,26,0.1659,0.0825,12,0.2413,0.12,1.0932,0.2252,0.1141,1.0075,0.253,0.2141,1,65,55,255
-1063,10PB,4,2,0.2911,0.2804,12,0.1246,0.12,0.1834,0.1204,0.1197,0.1689,0.384,0.3733,0.4376,98,95,112
-1064,10PB,4,4,0.2759,0.2522,12,0.1313,0.12,0.2245,0.1266,0.1195,0.2068,0.3862,0.3656,0.4859,98,93,124
-1065,10PB,4,6,0.2618,0.2263,12,0.1388,0.12,0.2714,0.1335,0.1192,0.25,0.3882,0.3568,0.5345,99,91,136
-1066,10PB,4,8,0.2497,0.2038,12,0.147,0.12,0.3218,0.141,0.1188,0.2964,0.3908,0.3468,0.5811,100,88,148
-1067,10PB,4,10,0.2388,0.1837,12,0.156,0.12,0.3772,0.1493,0.1185,0.3476,0.3934,0.3354,0.6274,100,86,160
-1068,10PB,4,12,0.2298,0.1659,12,0.1662,0.12,0.4371,0.1587,0.1181,0.4027,0.3987,0.3217,0.673,102,82,172
-1069,10PB,4,14,0.222,0.1503,12,0.1772,0.12,0.5012,0.1689,0.1177,0.4618,0.4047,0.306,0.7176,103,78,183
-1070,10PB,4,16,0.217,0.1373,12,0.1897,0.12,0.5643,0.1805,0.1172,0.52,0.4173,0.2863,0.7584,106,73,193
-1071,10PB,4,18,0.212,0.1256,12,0.2025,0.12,0.6329,0.1925,0.1168,0.5832,0.4281,0.2643,0.7997,109,67,204
-1072,10PB,4,20,0.2075,0.114,12,0.2184,0.12,0.7142,0.2073,0.1162,0.6581,0.4427,0.2335,0.8453,113,60,216
-1073,10PB,4,22,0.2048,0.1064,12,0.231,0.12,0.7768,0.219,0.1158,0.7159,0.455,0.2052,0.8783,116,52,224
-1074,10PB,4,24,0.202,0.0985,12,0.2461,0.12,0.8522,0.2331,0.1153,0.7853,0.4692,0.1641,0.916,120,42,234
-1075,10PB,4,26,0.1994,0.0904,12,0.2647,0.12,0.9427,0.2505,0.1147,0.8688,0.4872,0.0892,0.9588,124,23,244
-1078,2.5P,4,2,0.2962,0.2807,12,0.1266,0.12,0.1809,0.1225,0.1197,0.1666,0.3956,0.37,0.4346,101,94,111
-1079,2.5P,4,4,0.2855,0.2531,12,0.1354,0.12,0.2188,0.1307,0.1195,0.2015,0.4093,0.3588,0.4799,104,91,122
-1080,2.5P,4,6,0.2763,0.23,12,0.1442,0.12,0.2576,0.139,0.1192,0.2373,0.4221,0.3471,0.5212,108,89,133
-1081,2.5P,4,8,0.2685,0.2089,12,0.1542,0.12,0.3002,0.1485,0.1189,0.2765,0.4374,0.3329,0.5623,112,85,143
-1082,2.5P,4,10,0.2619,0.1903,12,0.1651,0.12,0.3454,0.1588,0.1186,0.3182,0.4538,0.3166,0.6021,116,81,154
-1083,2.5P,4,12,0.2559,0.173,12,0.1775,0.12,0.3961,0.1705,0.1182,0.365,0.4718,0.2968,0.6431,120,76,164
-1084,2.5P,4,14,0.2509,0.1585,12,0.19,0.12,0.4471,0.1823,0.1178,0.412,0.4892,0.2751,0.6811,125,70,174
-1085,2.5P,4,16,0.2467,0.1452,12,0.2039,0.12,0.5026,0.1955,0.1174,0.4631,0.5085,0.248,0.7196,130,63,183
-1086,2.5P,4,18,0.243,0.1332,12,0.2189,0.12,0.562,0.2097,0.117,0.5178,0.5287,0.2143,0.7581,135,55,193
-1087,2.5P,4,20,0.2394,0.1221,12,0.2353,0.12,0.6275,0.2252,0.1165,0.5782,0.5491,0.1693,0.7977,140,43,203
-1088,2.5P,4,22,0.2371,0.1143,12,0.2489,0.12,0.6809,0.2381,0.1161,0.6275,0.566,0.1184,0.8282,144,30,211
-1094,5P,4,2,0.3022,0.2825,12,0.1284,0.12,0.1764,0.1243,0.1197,0.1624,0.4068,0.367,0.4291,104,94,109
-1095,5P,4,4,0.2958,0.2565,12,0.1384,0.12,0.2095,0.1338,0.1195,0.1929,0.4287,0.3532,0.4696,109,90,120
-1096,5P,4,6,0.2903,0.2347,12,0.1484,0.12,0.2429,0.1434,0.1192,0.2237,0.4493,0.3388,0.5065,115,86,129
-1097,5P,4,8,0.2855,0.215,12,0.1593,0.12,0.2788,0.1539,0.1189,0.2568,0.4706,0.3221,0.5427,120,82,138
-1098,5P,4,10,0.2814,0.1967,12,0.1717,0.12,0.3184,0.1657,0.1186,0.2933,0.4937,0.3019,0.5794,126,77,148
-1099,5P,4,12,0.2778,0.1808,12,0.1844,0.12,0.3593,0.1778,0.1183,0.331,0.5162,0.2792,0.6145,132,71,157
-1100,5P,4,14,0.2747,0.166,12,0.1986,0.12,0.4043,0.1914,0.118,0.3725,0.5403,0.2509,0.6502,138,64,166
-1101,5P,4,16,0.2718,0.152,12,0.2146,0.12,0.4549,0.2067,0.1176,0.4191,0.566,0.2138,0.6876,144,55,175
-1102,5P,4,18,0.2693,0.1408,12,0.2295,0.12,0.5028,0.221,0.1172,0.4632,0.5884,0.1713,0.7207,150,44,184
-1103,5P,4,20,0.267,0.13,12,0.2465,0.12,0.5566,0.2373,0.1168,0.5129,0.6128,0.1024,0.7557,156,26,193
-1110,7.5P,4,2,0.3093,0.2859,12,0.1298,0.12,0.1699,0.1258,0.1197,0.1564,0.4177,0.3643,0.4208,107,93,107
-1111,7.5P,4,4,0.3084,0.2622,12,0.1411,0.12,0.1965,0.1368,0.1195,0.181,0.4483,0.3478,0.4548,114,89,116
-1112,7.5P,4,6,0.3076,0.2416,12,0.1528,0.12,0.2239,0.148,0.1193,0.2062,0.4772,0.3298,0.4866,122,84,124
-1113,7.5P,4,8,0.3066,0.2228,12,0.1651,0.12,0.2535,0.16,0.119,0.2335,0.5054,0.3093,0.5183,129,79,132
-1114,7.5P,4,10,0.3056,0.206,12,0.178,0.12,0.2845,0.1724,0.1187,0.2621,0.5328,0.286,0.5492,136,73,140
-1115,7.5P,4,12,0.3045,0.1905,12,0.1918,0.12,0.3181,0.1858,0.1184,0.293,0.56,0.2585,0.5802,143,66,148
-1116,7.5P,4,14,0.3035,0.1755,12,0.2075,0.12,0.3562,0.201,0.1181,0.3282,0.5892,0.2222,0.6131,150,57,156
-1117,7.5P,4,16,0.3028,0.1621,12,0.2242,0.12,0.3961,0.2171,0.1178,0.3649,0.6184,0.1745,0.6452,158,44,165
-1118,7.5P,4,18,0.3016,0.15,12,0.2413,0.12,0.4387,0.2336,0.1174,0.4042,0.6461,0.1038,0.6773,165,26,173
-1126,10P,4,2,0.3162,0.2902,12,0.1308,0.12,0.1628,0.1268,0.1198,0.1499,0.4264,0.3624,0.4114,109,92,105
-1127,10P,4,4,0.321,0.2686,12,0.1434,0.12,0.1834,0.1392,0.1196,0.1688,0.4651,0.3431,0.439,119,87,112
-1128,10P,4,6,0.3248,0.2493,12,0.1563,0.12,0.205,0.1518,0.1193,0.1888,0.5004,0.3219,0.4657,128,82,119
-1129,10P,4,8,0.328,0.2318,12,0.1698,0.12,0.2279,0.165,0.1191,0.2099,0.534,0.298,0.492,136,76,125
-1130,10P,4,10,0.3306,0.2162,12,0.1835,0.12,0.2515,0.1783,0.1188,0.2317,0.5654,0.2711,0.5175,144,69,132
-1131,10P,4,12,0.3331,0.2014,12,0.1985,0.12,0.2774,0.1929,0.1186,0.2555,0.5975,0.2377,0.5436,152,61,139
-1132,10P,4,14,0.3351,0.1875,12,0.2145,0.12,0.3055,0.2086,0.1183,0.2815,0.6292,0.1948,0.5703,160,50,145
-1133,10P,4,16,0.337,0.1756,12,0.2303,0.12,0.3331,0.224,0.118,0.3068,0.6588,0.1384,0.595,168,35,152
-1141,2.5RP,4,2,0.3231,0.2951,12,0.1314,0.12,0.1553,0.1276,0.1198,0.1429,0.4339,0.3609,0.4013,111,92,102
-1142,2.5RP,4,4,0.334,0.277,12,0.1447,0.12,0.1685,0.1407,0.1196,0.1552,0.4784,0.3398,0.4202,122,87,107
-1143,2.5RP,4,6,0.3442,0.2595,12,0.1592,0.12,0.1833,0.1549,0.1194,0.1688,0.5214,0.315,0.44,133,80,112
-1144,2.5RP,4,8,0.3533,0.2438,12,0.1739,0.12,0.1983,0.1694,0.1192,0.1826,0.5609,0.2871,0.4591,143,73,117
-1145,2.5RP,4,10,0.3608,0.2301,12,0.1882,0.12,0.2134,0.1835,0.119,0.1965,0.5958,0.2567,0.4773,152,65,122
-1146,2.5RP,4,12,0.3683,0.2162,12,0.2044,0.12,0.2306,0.1995,0.1188,0.2124,0.6327,0.2159,0.4971,161,55,127
-1147,2.5RP,4,14,0.3748,0.2039,12,0.2206,0.12,0.2479,0.2154,0.1185,0.2284,0.6666,0.1645,0.5161,170,42,132
-1148,2.5RP,4,16,0.3807,0.1923,12,0.2376,0.12,0.2665,0.2321,0.1183,0.2454,0.7,0.0796,0.5353,179,20,137
-1154,5RP,4,2,0.331,0.301,12,0.132,0.12,0.1467,0.1282,0.1198,0.1351,0.4417,0.3594,0.3892,113,92,99
-1155,5RP,4,4,0.3491,0.2872,12,0.1459,0.12,0.152,0.142,0.1197,0.1399,0.4919,0.3366,0.3979,125,86,101
-1156,5RP,4,6,0.3671,0.2733,12,0.1612,0.12,0.1579,0.1573,0.1195,0.1454,0.5405,0.3091,0.4073,138,79,104
-1157,5RP,4,8,0.3833,0.26,12,0.1769,0.12,0.1646,0.1729,0.1193,0.1516,0.5849,0.2776,0.4175,149,71,106
-1158,5RP,4,10,0.396,0.2489,12,0.1909,0.12,0.1712,0.1868,0.1192,0.1576,0.6209,0.2456,0.4272,158,63,109
-1159,5RP,4,12,0.4104,0.2361,12,0.2086,0.12,0.1797,0.2043,0.119,0.1654,0.6627,0.1967,0.4391,169,50,112
-1160,5RP,4,14,0.4225,0.2249,12,0.2254,0.12,0.1881,0.221,0.1188,0.1732,0.6995,0.1326,0.4507,178,34,115
-1165,7.5RP,4,2,0.3371,0.3061,12,0.1322,0.12,0.1399,0.1285,0.1199,0.1288,0.4467,0.3586,0.3793,114,91,97
-1166,7.5RP,4,4,0.3612,0.2963,12,0.1463,0.12,0.1387,0.1426,0.1198,0.1277,0.5005,0.3349,0.3788,128,85,97
-1167,7.5RP,4,6,0.385,0.2859,12,0.1616,0.12,0.1381,0.1579,0.1196,0.1272,0.5512,0.3067,0.3793,141,78,97
-1168,7.5RP,4,8,0.4072,0.275,12,0.1777,0.12,0.1387,0.174,0.1195,0.1277,0.5983,0.2735,0.3815,153,70,97
-1169,7.5RP,4,10,0.4259,0.2651,12,0.1928,0.12,0.1399,0.189,0.1193,0.1288,0.6382,0.2374,0.3845,163,61,98
-1170,7.5RP,4,12,0.445,0.2541,12,0.2102,0.12,0.1421,0.2063,0.1191,0.1308,0.6802,0.1863,0.3892,173,48,99
-1171,7.5RP,4,14,0.4629,0.2437,12,0.2279,0.12,0.1445,0.2241,0.119,0.133,0.7199,0.1096,0.3941,184,28,100
-1175,10RP,5,2,0.3332,0.3131,19.77,0.2104,0.1977,0.2233,0.2045,0.1976,0.2056,0.5434,0.4626,0.4712,139,118,120
-1176,10RP,5,4,0.3594,0.309,19.77,0.2299,0.1977,0.2122,0.2242,0.1975,0.1953,0.6059,0.4383,0.4597,155,112,117
-1177,10RP,5,6,0.3851,0.3039,19.77,0.2505,0.1977,0.2023,0.2448,0.1973,0.1862,0.6631,0.4109,0.4495,169,105,115
-1178,10RP,5,8,0.4105,0.298,19.77,0.2723,0.1977,0.1934,0.2667,0.1972,0.178,0.7169,0.3793,0.4401,183,97,112
-1179,10RP,5,10,0.4332,0.2918,19.77,0.2935,0.1977,0.1863,0.2879,0.197,0.1715,0.7641,0.3453,0.4329,195,88,110
-1180,10RP,5,12,0.4579,0.2841,19.77,0.3186,0.1977,0.1795,0.3131,0.1968,0.1652,0.8151,0.2988,0.4261,208,76,109
-1181,10RP,5,14,0.4767,0.2776,19.77,0.3395,0.1977,0.175,0.334,0.1966,0.161,0.8542,0.2526,0.4218,218,64,108
-1182,10RP,5,16,0.4986,0.2695,19.77,0.3658,0.1977,0.1701,0.3603,0.1964,0.1565,0.9001,0.1751,0.4175,230,45,106
-1185,2.5R,5,2,0.336,0.3158,19.77,0.2103,0.1977,0.218,0.2045,0.1976,0.2007,0.5459,0.4624,0.4651,139,118,119
-1186,2.5R,5,4,0.366,0.3148,19.77,0.2299,0.1977,0.2005,0.2242,0.1975,0.1845,0.6105,0.4378,0.4457,156,112,114
-1187,2.5R,5,6,0.396,0.313,19.77,0.2501,0.1977,0.1838,0.2447,0.1974,0.1691,0.669,0.4104,0.4264,171,105,109
-1188,2.5R,5,8,0.4252,0.3101,19.77,0.2711,0.1977,0.1688,0.2658,0.1973,0.1553,0.7224,0.3796,0.4082,184,97,104
-1189,2.5R,5,10,0.4533,0.3058,19.77,0.2931,0.1977,0.1557,0.2879,0.1972,0.1433,0.7726,0.3438,0.3919,197,88,100
-1190,2.5R,5,12,0.482,0.3002,19.77,0.3174,0.1977,0.1434,0.3124,0.197,0.1319,0.8231,0.2982,0.376,210,76,96
-1191,2.5R,5,14,0.5047,0.295,19.77,0.3382,0.1977,0.1342,0.3333,0.1969,0.1234,0.8628,0.2515,0.3638,220,64,93
-1192,2.5R,5,16,0.53,0.288,19.77,0.3638,0.1977,0.1249,0.3589,0.1967,0.1149,0.9081,0.1752,0.3514,232,45,90
-1195,5R,5,2,0.3392,0.3192,19.77,0.2101,0.1977,0.2116,0.2044,0.1977,0.1947,0.5481,0.4624,0.4576,140,118,117
-1196,5R,5,4,0.374,0.322,19.77,0.2296,0.1977,0.1866,0.2242,0.1976,0.1718,0.6156,0.4374,0.4285,157,112,109
-1197,5R,5,6,0.4078,0.3238,19.77,0.249,0.1977,0.1639,0.2438,0.1975,0.1508,0.6735,0.4108,0.3997,172,105,102
-1198,5R,5,8,0.4413,0.324,19.77,0.2693,0.1977,0.1432,0.2643,0.1975,0.1317,0.7269,0.3807,0.3714,185,97,95
-1199,5R,5,10,0.4747,0.3227,19.77,0.2908,0.1977,0.1241,0.2861,0.1973,0.1141,0.7777,0.3454,0.3429,198,88,87
-1200,5R,5,12,0.5071,0.3194,19.77,0.3139,0.1977,0.1074,0.3093,0.1972,0.0987,0.8266,0.3022,0.3158,211,77,81
-1201,5R,5,14,0.5341,0.3158,19.77,0.3344,0.1977,0.094,0.3299,0.1971,0.0863,0.8667,0.2568,0.2922,221,65,75
-1202,5R,5,16,0.5637,0.3102,19.77,0.3593,0.1977,0.0804,0.3549,0.1969,0.0738,0.9117,0.1848,0.2662,232,47,68
-1203,5R,5,18,0.5918,0.3038,19.77,0.3851,0.1977,0.0679,0.3809,0.1968,0.0623,0.9551,0.0331,0.24,244,8,61
-1205,7.5R,5,2,0.3425,0.3229,19.77,0.2097,0.1977,0.2049,0.2041,0.1977,0.1886,0.5501,0.4625,0.4496,140,118,115
-1206,7.5R,5,4,0.3806,0.3294,19.77,0.2284,0.1977,0.1741,0.2231,0.1977,0.1602,0.6175,0.4382,0.4119,157,112,105
-1207,7.5R,5,6,0.418,0.3348,19.77,0.2468,0.1977,0.146,0.2419,0.1976,0.1343,0.6749,0.4127,0.3735,172,105,95
-1208,7.5R,5,8,0.4563,0.3387,19.77,0.2663,0.1977,0.1197,0.2617,0.1976,0.11,0.7283,0.3836,0.3328,186,98,85
-1209,7.5R,5,10,0.4927,0.3399,19.77,0.2866,0.1977,0.0974,0.2822,0.1975,0.0895,0.7774,0.3506,0.2934,198,89,75
-1210,7.5R,5,12,0.528,0.3389,19.77,0.308,0.1977,0.0776,0.3038,0.1974,0.0713,0.8241,0.3112,0.2528,210,79,64
-1211,7.5R,5,14,0.559,0.337,19.77,0.3279,0.1977,0.061,0.3239,0.1973,0.056,0.8642,0.2685,0.2119,220,68,54
-1212,7.5R,5,16,0.5901,0.3331,19.77,0.3502,0.1977,0.0456,0.3464,0.1972,0.0417,0.9056,0.2091,0.1648,231,53,42
-1213,7.5R,5,18,0.6161,0.3277,19.77,0.3717,0.1977,0.0339,0.3679,0.197,0.031,0.9424,0.1252,0.1179,240,32,30
-1215,10R,5,2,0.3465,0.3278,19.77,0.209,0.1977,0.1964,0.2034,0.1977,0.1808,0.5518,0.4629,0.4393,141,118,112
-1216,10R,5,4,0.3879,0.3398,19.77,0.2257,0.1977,0.1584,0.2206,0.1978,0.1458,0.6165,0.4408,0.3901,157,112,99
-1217,10R,5,6,0.4299,0.3499,19.77,0.2429,0.1977,0.1244,0.2382,0.1978,0.1144,0.6733,0.4168,0.3386,172,106,86
-1218,10R,5,8,0.4713,0.3575,19.77,0.2606,0.1977,0.0947,0.2563,0.1978,0.087,0.7242,0.3904,0.2847,185,100,73
-1219,10R,5,10,0.5113,0.363,19.77,0.2785,0.1977,0.0685,0.2744,0.1977,0.0628,0.7699,0.3617,0.2248,196,92,57
-1220,10R,5,12,0.5481,0.366,19.77,0.2961,0.1977,0.0464,0.2923,0.1977,0.0425,0.8107,0.3307,0.1554,207,84,40
-1221,10R,5,14,0.5771,0.3664,19.77,0.3114,0.1977,0.0305,0.3078,0.1976,0.0278,0.8433,0.3008,0.0722,215,77,18
-1224,2.5YR,5,2,0.3506,0.3337,19.77,0.2077,0.1977,0.187,0.2023,0.1978,0.1721,0.5523,0.4639,0.4274,141,118,109
-1225,2.5YR,5,4,0.3925,0.3494,19.77,0.2221,0.1977,0.146,0.2172,0.1979,0.1343,0.6119,0.4446,0.3714,156,113,95
-1226,2.5YR,5,6,0.4365,0.364,19.77,0.2371,0.1977,0.1084,0.2326,0.1979,0.0996,0.6651,0.4236,0.3092,170,108,79
-1227,2.5YR,5,8,0.4795,0.3758,19.77,0.2523,0.1977,0.0761,0.2482,0.1979,0.0699,0.7119,0.4012,0.2409,182,102,61
-1228,2.5YR,5,10,0.5175,0.3844,19.77,0.2662,0.1977,0.0505,0.2624,0.1979,0.0462,0.7503,0.3795,0.1645,191,97,42
-1229,2.5YR,5,12,0.5482,0.3909,19.77,0.2773,0.1977,0.0308,0.2737,0.1979,0.0281,0.7789,0.3611,0.0569,199,92,15
-1232,5YR,5,2,0.353,0.3395,19.77,0.2056,0.1977,0.1791,0.2003,0.1979,0.1648,0.5494,0.466,0.4168,140,119,106
-1233,5YR,5,4,0.3968,0.3614,19.77,0.2171,0.1977,0.1323,0.2123,0.198,0.1217,0.6039,0.4501,0.3492,154,115,89
-1234,5YR,5,6,0.442,0.3808,19.77,0.2295,0.1977,0.092,0.2252,0.1981,0.0845,0.6525,0.4325,0.275,166,110,70
-1235,5YR,5,8,0.483,0.396,19.77,0.2411,0.1977,0.0604,0.2373,0.1981,0.0554,0.6921,0.4155,0.1943,176,106,50
-1236,5YR,5,10,0.5161,0.4064,19.77,0.2511,0.1977,0.0377,0.2475,0.1981,0.0345,0.7222,0.4006,0.0986,184,102,25
-1239,7.5YR,5,2,0.354,0.3445,19.77,0.2032,0.1977,0.173,0.1979,0.1979,0.1592,0.5447,0.4685,0.4085,139,119,104
-1240,7.5YR,5,4,0.3991,0.3714,19.77,0.2124,0.1977,0.1222,0.2079,0.1981,0.1123,0.5953,0.4551,0.3317,152,116,85
-1241,7.5YR,5,6,0.444,0.3954,19.77,0.222,0.1977,0.0803,0.2179,0.1982,0.0737,0.6381,0.4413,0.2469,163,113,63
-1242,7.5YR,5,8,0.482,0.4141,19.77,0.2301,0.1977,0.0496,0.2264,0.1983,0.0455,0.6699,0.4294,0.1526,171,109,39
-1246,10YR,5,2,0.3546,0.3514,19.77,0.1995,0.1977,0.1654,0.1944,0.198,0.1522,0.5368,0.4724,0.3978,137,120,101
-1247,10YR,5,4,0.3995,0.384,19.77,0.2057,0.1977,0.1115,0.2012,0.1982,0.1025,0.5806,0.4626,0.3115,148,118,79
-1248,10YR,5,6,0.4428,0.4128,19.77,0.2121,0.1977,0.0692,0.2082,0.1983,0.0635,0.6164,0.4529,0.2157,157,115,55
-1249,10YR,5,8,0.477,0.4338,19.77,0.2174,0.1977,0.0407,0.2138,0.1984,0.0372,0.6417,0.445,0.1046,164,113,27
-1252,2.5Y,5,2,0.3534,0.357,19.77,0.1957,0.1977,0.1604,0.1907,0.198,0.1476,0.5269,0.4764,0.3903,134,121,100
-1253,2.5Y,5,4,0.3968,0.3954,19.77,0.1984,0.1977,0.1039,0.1941,0.1983,0.0955,0.5624,0.4707,0.296,143,120,75
-1254,2.5Y,5,6,0.438,0.4292,19.77,0.2018,0.1977,0.0612,0.198,0.1985,0.0561,0.5913,0.4647,0.1892,151,118,48
-1255,2.5Y,5,8,0.4685,0.4524,19.77,0.2047,0.1977,0.0346,0.2013,0.1986,0.0316,0.6108,0.4599,0.0517,156,117,13
-1258,5Y,5,2,0.35,0.362,19.77,0.1911,0.1977,0.1573,0.1861,0.1981,0.1447,0.5133,0.4814,0.3855,131,123,98
-1259,5Y,5,4,0.3915,0.4057,19.77,0.1908,0.1977,0.0988,0.1865,0.1984,0.0908,0.5412,0.4791,0.2848,138,122,73
-1260,5Y,5,6,0.4302,0.4435,19.77,0.1918,0.1977,0.0563,0.1881,0.1986,0.0516,0.5643,0.4759,0.1701,144,121,43
-1264,7.5Y,5,2,0.347,0.364,19.77,0.1885,0.1977,0.157,0.1835,0.1981,0.1444,0.5043,0.4844,0.3848,129,124,98
-1265,7.5Y,5,4,0.385,0.412,19.77,0.1847,0.1977,0.0974,0.1805,0.1985,0.0895,0.5223,0.4857,0.281,133,124,72
-1266,7.5Y,5,6,0.4199,0.4551,19.77,0.1824,0.1977,0.0543,0.1787,0.1987,0.0498,0.5361,0.4863,0.1602,137,124,41
-1270,10Y,5,2,0.3422,0.3648,19.77,0.1855,0.1977,0.1588,0.1804,0.1981,0.1461,0.4927,0.4878,0.3872,126,124,99
-1271,10Y,5,4,0.3762,0.4158,19.77,0.1789,0.1977,0.0989,0.1746,0.1985,0.0909,0.5016,0.4922,0.2834,128,126,72
-1272,10Y,5,6,0.4072,0.4621,19.77,0.1742,0.1977,0.0559,0.1705,0.1988,0.0513,0.508,0.4953,0.1647,130,126,42
-1276,2.5GY,5,2,0.3352,0.3636,19.77,0.1823,0.1977,0.1638,0.1772,0.1982,0.1507,0.4783,0.4915,0.394,122,125,100
-1277,2.5GY,5,4,0.3621,0.4143,19.77,0.1728,0.1977,0.1067,0.1685,0.1985,0.0981,0.4753,0.4991,0.2986,121,127,76
-1278,2.5GY,5,6,0.3879,0.4646,19.77,0.1651,0.1977,0.0628,0.1613,0.1988,0.0576,0.4713,0.5053,0.1873,120,129,48
-1282,5GY,5,2,0.3289,0.3612,19.77,0.18,0.1977,0.1696,0.1749,0.1981,0.1561,0.4665,0.4942,0.402,119,126,103
-1283,5GY,5,4,0.3482,0.4097,19.77,0.168,0.1977,0.1168,0.1636,0.1985,0.1074,0.4509,0.5046,0.3174,115,129,81
-1284,5GY,5,6,0.3663,0.4614,19.77,0.157,0.1977,0.0738,0.1531,0.1988,0.0678,0.4323,0.5142,0.2198,110,131,56
-1285,5GY,5,8,0.3815,0.5093,19.77,0.1481,0.1977,0.0424,0.1446,0.1991,0.0388,0.4147,0.5219,0.0895,106,133,23
-1288,7.5GY,5,2,0.3188,0.356,19.77,0.177,0.1977,0.1806,0.1718,0.1981,0.1662,0.4482,0.4979,0.4166,114,127,106
-1289,7.5GY,5,4,0.3274,0.3994,19.77,0.1621,0.1977,0.1352,0.1574,0.1985,0.1244,0.4141,0.5116,0.3488,106,130,89
-1290,7.5GY,5,6,0.3354,0.4483,19.77,0.1479,0.1977,0.0954,0.1438,0.1988,0.0877,0.3759,0.5243,0.2719,96,134,69
-1291,7.5GY,5,8,0.3412,0.4976,19.77,0.1356,0.1977,0.064,0.1319,0.1991,0.0588,0.3353,0.5352,0.1858,86,136,47
-1292,7.5GY,5,10,0.3451,0.549,19.77,0.1243,0.1977,0.0381,0.1209,0.1993,0.0349,0.2894,0.5451,0.0381,74,139,10
-1295,10GY,5,2,0.311,0.3508,19.77,0.1753,0.1977,0.1906,0.1699,0.1981,0.1754,0.4347,0.5002,0.4295,111,128,110
-1296,10GY,5,4,0.3111,0.3881,19.77,0.1585,0.1977,0.1532,0.1536,0.1984,0.141,0.3847,0.5161,0.3766,98,132,96
-1297,10GY,5,6,0.3108,0.4301,19.77,0.1429,0.1977,0.1191,0.1384,0.1987,0.1095,0.3292,0.5303,0.3189,84,135,81
-1298,10GY,5,8,0.308,0.4759,19.77,0.128,0.1977,0.0898,0.1239,0.199,0.0825,0.259,0.5436,0.2564,66,139,65
-1299,10GY,5,10,0.3028,0.5237,19.77,0.1143,0.1977,0.0655,0.1106,0.1993,0.0601,0.1609,0.5555,0.1865,41,142,48
-1304,2.5G,5,2,0.303,0.3445,19.77,0.1739,0.1977,0.2023,0.1683,0.198,0.1862,0.4213,0.5022,0.4439,107,128,113
-1305,2.5G,5,4,0.2943,0.3735,19.77,0.1558,0.1977,0.1758,0.1506,0.1983,0.1618,0.3533,0.5198,0.4086,90,133,104
-1306,2.5G,5,6,0.2841,0.4045,19.77,0.1389,0.1977,0.1522,0.134,0.1986,0.14,0.2698,0.5356,0.3733,69,137,95
-1307,2.5G,5,8,0.271,0.438,19.77,0.1223,0.1977,0.1313,0.1178,0.1989,0.1208,0.1321,0.5506,0.3383,34,140,86
-1318,5G,5,2,0.2978,0.3392,19.77,0.1736,0.1977,0.2116,0.1679,0.198,0.1947,0.4137,0.503,0.4551,105,128,116
-1319,5G,5,4,0.2841,0.3628,19.77,0.1548,0.1977,0.1924,0.1494,0.1983,0.1771,0.3339,0.5215,0.4302,85,133,110
-1320,5G,5,6,0.269,0.386,19.77,0.1378,0.1977,0.1767,0.1326,0.1985,0.1626,0.2309,0.5377,0.4083,59,137,104
-1332,7.5G,5,2,0.2945,0.3355,19.77,0.1735,0.1977,0.218,0.1678,0.198,0.2007,0.4091,0.5033,0.4627,104,128,118
-1333,7.5G,5,4,0.2775,0.3545,19.77,0.1548,0.1977,0.2052,0.1492,0.1982,0.1889,0.3221,0.5221,0.4462,82,133,114
-1334,7.5G,5,6,0.2598,0.3724,19.77,0.1379,0.1977,0.1953,0.1325,0.1984,0.1797,0.2056,0.5383,0.4326,52,137,110
-1346,10G,5,2,0.291,0.331,19.77,0.1738,0.1977,0.2258,0.168,0.1979,0.2078,0.405,0.5033,0.4716,103,128,120
-1347,10G,5,4,0.2711,0.3455,19.77,0.1551,0.1977,0.2194,0.1494,0.1981,0.202,0.3111,0.5223,0.463,79,133,118
-1348,10G,5,6,0.2519,0.3587,19.77,0.1388,0.1977,0.2146,0.1332,0.1983,0.1976,0.1839,0.5382,0.4563,47,137,116
-1360,2.5BG,5,2,0.288,0.327,19.77,0.1741,0.1977,0.2328,0.1682,0.1979,0.2143,0.4016,0.5033,0.4794,102,128,122
-1361,2.5BG,5,4,0.2659,0.3369,19.77,0.156,0.1977,0.2331,0.1501,0.1981,0.2146,0.3037,0.522,0.4786,77,133,122
-1362,2.5BG,5,6,0.2448,0.3452,19.77,0.1402,0.1977,0.2348,0.1343,0.1982,0.2162,0.1632,0.5377,0.4795,42,137,122
-1372,5BG,5,2,0.2841,0.321,19.77,0.175,0.1977,0.2432,0.1689,0.1978,0.2239,0.3982,0.5029,0.4909,102,128,125
-1373,5BG,5,4,0.2591,0.3246,19.77,0.1578,0.1977,0.2536,0.1516,0.1979,0.2334,0.2949,0.5211,0.5008,75,133,128
-1374,5BG,5,6,0.236,0.327,19.77,0.1427,0.1977,0.2642,0.1364,0.198,0.2433,0.1349,0.5365,0.511,34,137,130
-1383,7.5BG,5,2,0.2812,0.3161,19.77,0.1759,0.1977,0.2519,0.1697,0.1978,0.2319,0.3962,0.5023,0.5002,101,128,128
-1384,7.5BG,5,4,0.255,0.315,19.77,0.16,0.1977,0.2699,0.1537,0.1978,0.2485,0.2932,0.5195,0.5178,75,132,132
-1385,7.5BG,5,6,0.2292,0.3125,19.77,0.145,0.1977,0.2899,0.1384,0.1979,0.267,0.1071,0.5353,0.5366,27,137,137
-1392,10BG,5,2,0.2796,0.3111,19.77,0.1777,0.1977,0.2601,0.1714,0.1977,0.2395,0.3988,0.5008,0.5089,102,128,130
-1393,10BG,5,4,0.2512,0.304,19.77,0.1634,0.1977,0.2893,0.1567,0.1977,0.2664,0.2957,0.5169,0.537,75,132,137
-1394,10BG,5,6,0.2234,0.2952,19.77,0.1496,0.1977,0.3224,0.1426,0.1977,0.2969,0.1006,0.5321,0.5671,26,136,145
-1400,2.5B,5,2,0.2791,0.3071,19.77,0.1797,0.1977,0.2664,0.1733,0.1977,0.2453,0.4036,0.4989,0.5154,103,127,131
-1401,2.5B,5,4,0.2492,0.2954,19.77,0.1668,0.1977,0.3048,0.1599,0.1976,0.2807,0.3027,0.5141,0.5519,77,131,141
-1402,2.5B,5,6,0.221,0.2823,19.77,0.1548,0.1977,0.3478,0.1474,0.1975,0.3204,0.1248,0.5281,0.5896,32,135,150
-1408,5B,5,2,0.2794,0.3032,19.77,0.1822,0.1977,0.2722,0.1757,0.1976,0.2506,0.411,0.4965,0.5214,105,127,133
-1409,5B,5,4,0.2493,0.2879,19.77,0.1712,0.1977,0.3178,0.1642,0.1975,0.2927,0.3181,0.5101,0.5641,81,130,144
-1410,5B,5,6,0.2215,0.2701,19.77,0.1621,0.1977,0.3721,0.1544,0.1973,0.3427,0.1764,0.5217,0.6102,45,133,156
-1416,7.5B,5,2,0.2803,0.3,19.77,0.1847,0.1977,0.2766,0.1782,0.1976,0.2547,0.4193,0.494,0.5259,107,126,134
-1417,7.5B,5,4,0.2511,0.2808,19.77,0.1768,0.1977,0.3296,0.1696,0.1974,0.3035,0.3404,0.5048,0.5749,87,129,147
-1418,7.5B,5,6,0.2248,0.2612,19.77,0.1701,0.1977,0.389,0.1622,0.1971,0.3583,0.2319,0.5143,0.6242,59,131,159
-1424,10B,5,2,0.2821,0.2966,19.77,0.188,0.1977,0.2808,0.1815,0.1975,0.2586,0.4308,0.4906,0.5303,110,125,135
-1425,10B,5,4,0.2547,0.2757,19.77,0.1826,0.1977,0.3367,0.1754,0.1973,0.3101,0.3661,0.4989,0.5814,93,127,148
-1426,10B,5,6,0.2299,0.2548,19.77,0.1784,0.1977,0.3998,0.1703,0.197,0.3683,0.2836,0.5062,0.6331,72,129,161
-1427,10B,5,8,0.2067,0.2344,19.77,0.1743,0.1977,0.4714,0.1653,0.1967,0.4342,0.1377,0.5135,0.6858,35,131,175
-1433,2.5PB,5,2,0.2847,0.2942,19.77,0.1913,0.1977,0.283,0.1847,0.1975,0.2606,0.4431,0.4871,0.5325,113,124,136
-1434,2.5PB,5,4,0.26,0.272,19.77,0.189,0.1977,0.3402,0.1816,0.1972,0.3133,0.3948,0.4923,0.5847,101,126,149
-1435,2.5PB,5,6,0.2365,0.2488,19.77,0.1879,0.1977,0.409,0.1797,0.1969,0.3767,0.3351,0.4965,0.6406,85,127,163
-1436,2.5PB,5,8,0.2157,0.2278,19.77,0.1872,0.1977,0.483,0.178,0.1965,0.4449,0.2552,0.5006,0.6944,65,128,177
-1437,2.5PB,5,10,0.1968,0.2078,19.77,0.1872,0.1977,0.5665,0.177,0.1961,0.5219,0.1114,0.5043,0.7493,28,129,191
-1442,5PB,5,2,0.2882,0.2923,19.77,0.1949,0.1977,0.2837,0.1883,0.1974,0.2613,0.4571,0.4831,0.5335,117,123,136
-1443,5PB,5,4,0.2662,0.2687,19.77,0.1959,0.1977,0.3422,0.1885,0.1971,0.3152,0.4244,0.4848,0.5868,108,124,150
-1444,5PB,5,6,0.2447,0.2449,19.77,0.1975,0.1977,0.412,0.1893,0.1968,0.3795,0.3835,0.4862,0.6434,98,124,164
-1445,5PB,5,8,0.2255,0.2239,19.77,0.1991,0.1977,0.4862,0.1899,0.1964,0.4479,0.332,0.4879,0.6971,85,124,178
-1446,5PB,5,10,0.208,0.2041,19.77,0.2015,0.1977,0.5695,0.1912,0.196,0.5246,0.264,0.4891,0.7517,67,125,192
-1447,5PB,5,12,0.1918,0.1858,19.77,0.2041,0.1977,0.6623,0.1926,0.1955,0.6102,0.1489,0.4906,0.807,38,125,206
-1451,7.5PB,5,2,0.2918,0.2908,19.77,0.1984,0.1977,0.2838,0.1917,0.1974,0.2613,0.4704,0.4793,0.5337,120,122,136
-1452,7.5PB,5,4,0.2739,0.2666,19.77,0.2031,0.1977,0.3407,0.1957,0.1971,0.3138,0.4552,0.4766,0.5859,116,122,149
-1453,7.5PB,5,6,0.2563,0.2417,19.77,0.2096,0.1977,0.4106,0.2014,0.1967,0.3782,0.4387,0.4726,0.6428,112,121,164
-1454,7.5PB,5,8,0.2417,0.2204,19.77,0.2168,0.1977,0.4825,0.2076,0.1963,0.4445,0.4228,0.4678,0.6953,108,119,177
-1455,7.5PB,5,10,0.2285,0.202,19.77,0.2236,0.1977,0.5574,0.2134,0.1958,0.5135,0.4025,0.4635,0.745,103,118,190
-1456,7.5PB,5,12,0.2157,0.183,19.77,0.233,0.1977,0.6496,0.2216,0.1953,0.5985,0.3805,0.457,0.8008,97,117,204
-1457,7.5PB,5,14,0.2042,0.1661,19.77,0.243,0.1977,0.7495,0.2304,0.1947,0.6906,0.354,0.45,0.8559,90,115,218
-1458,7.5PB,5,16,0.1945,0.1511,19.77,0.2545,0.1977,0.8562,0.2404,0.1941,0.7889,0.3271,0.4415,0.9102,83,113,232
-1459,7.5PB,5,18,0.1862,0.1365,19.77,0.2697,0.1977,0.981,0.254,0.1933,0.9039,0.3039,0.4289,0.9686,77,109,247
-1460,7.5PB,5,20,0.1794,0.1239,19.77,0.2863,0.1977,1.1117,0.2688,0.1925,1.0244,0.2817,0.4143,1,72,106,255
-1461,10PB,5,2,0.2959,0.2905,19.77,0.2014,0.1977,0.2815,0.1948,0.1974,0.2592,0.4828,0.4758,0.5317,123,121,136
-1462,10PB,5,4,0.2821,0.2659,19.77,0.2097,0.1977,0.3361,0.2024,0.197,0.3095,0.4831,0.4688,0.5822,123,120,148
-1463,10PB,5,6,0.2686,0.2412,19.77,0.2202,0.1977,0.4018,0.212,0.1966,0.3701,0.4847,0.4599,0.6365,124,117,162
-1464,10PB,5,8,0.2572,0.2211,19.77,0.23,0.1977,0.4665,0.2209,0.1962,0.4297,0.4846,0.4514,0.6847,124,115,175
-1465,10PB,5,10,0.2478,0.203,19.77,0.2413,0.1977,0.5349,0.2314,0.1958,0.4927,0.4881,0.441,0.7312,124,112,186
-1466,10PB,5,12,0.2384,0.1857,19.77,0.2538,0.1977,0.6131,0.2428,0.1953,0.5649,0.4903,0.4294,0.7802,125,109,199
-1467,10PB,5,14,0.2299,0.1698,19.77,0.2677,0.1977,0.6989,0.2556,0.1947,0.644,0.4932,0.4159,0.8296,126,106,212
-1468,10PB,5,16,0.2224,0.1555,19.77,0.2828,0.1977,0.7909,0.2695,0.1941,0.7287,0.4972,0.4006,0.8786,127,102,224
-1469,10PB,5,18,0.2174,0.1444,19.77,0.2976,0.1977,0.8738,0.2833,0.1936,0.8051,0.5052,0.3842,0.9199,129,98,235
-1470,10PB,5,20,0.2121,0.1329,19.77,0.3155,0.1977,0.9744,0.2998,0.1929,0.8978,0.5141,0.3634,0.9669,131,93,247
-1471,10PB,5,22,0.2082,0.1225,19.77,0.336,0.1977,1.0802,0.3189,0.1922,0.9953,0.5288,0.3368,1,135,86,255
-1472,2.5P,5,2,0.3,0.2912,19.77,0.2037,0.1977,0.2775,0.1971,0.1974,0.2556,0.4933,0.473,0.5279,126,121,135
-1473,2.5P,5,4,0.2898,0.2667,19.77,0.2148,0.1977,0.3288,0.2076,0.197,0.3028,0.5052,0.4626,0.5761,129,118,147
-1474,2.5P,5,6,0.2806,0.2444,19.77,0.227,0.1977,0.3842,0.219,0.1966,0.3539,0.5179,0.4509,0.6231,132,115,159
-1475,2.5P,5,8,0.2728,0.224,19.77,0.2408,0.1977,0.4441,0.232,0.1962,0.4091,0.5333,0.437,0.6691,136,111,171
-1476,2.5P,5,10,0.2665,0.2075,19.77,0.2539,0.1977,0.5012,0.2444,0.1958,0.4617,0.5476,0.4232,0.7095,140,108,181
-1477,2.5P,5,12,0.2608,0.1913,19.77,0.2695,0.1977,0.5662,0.2591,0.1954,0.5216,0.5651,0.4059,0.7522,144,104,192
-1478,2.5P,5,14,0.256,0.1774,19.77,0.2853,0.1977,0.6314,0.274,0.1949,0.5817,0.5824,0.3874,0.792,149,99,202
-1479,2.5P,5,16,0.2515,0.1644,19.77,0.3024,0.1977,0.7024,0.2902,0.1944,0.6472,0.6005,0.3659,0.8326,153,93,212
-1480,2.5P,5,18,0.2476,0.1532,19.77,0.3195,0.1977,0.7732,0.3064,0.1939,0.7125,0.6177,0.343,0.8706,158,87,222
-1481,2.5P,5,20,0.2438,0.1419,19.77,0.3397,0.1977,0.8559,0.3254,0.1933,0.7886,0.6377,0.3132,0.9124,163,80,233
-1482,2.5P,5,22,0.2402,0.1315,19.77,0.3611,0.1977,0.9446,0.3457,0.1926,0.8704,0.6578,0.2773,0.9547,168,71,243
-1483,2.5P,5,24,0.2372,0.1223,19.77,0.3834,0.1977,1.0354,0.3668,0.192,0.9541,0.6784,0.2329,0.9955,173,59,254
-1484,2.5P,5,26,0.2348,0.114,19.77,0.4072,0.1977,1.1293,0.3893,0.1913,1.0406,0.7005,0.171,1,179,44,255
-1485,5P,5,2,0.3045,0.2928,19.77,0.2056,0.1977,0.2719,0.1991,0.1974,0.2504,0.5031,0.4705,0.5225,128,120,133
-1486,5P,5,4,0.2986,0.2699,19.77,0.2187,0.1977,0.3161,0.2116,0.1971,0.2911,0.5249,0.4573,0.565,134,117,144
-1487,5P,5,6,0.2932,0.2487,19.77,0.2331,0.1977,0.3642,0.2253,0.1967,0.3354,0.5475,0.4424,0.6071,140,113,155
-1488,5P,5,8,0.2885,0.2296,19.77,0.2484,0.1977,0.4149,0.24,0.1963,0.3822,0.5707,0.4256,0.6479,146,109,165
-1489,5P,5,10,0.2845,0.2137,19.77,0.2632,0.1977,0.4642,0.2541,0.1959,0.4276,0.5919,0.4087,0.6845,151,104,175
-1490,5P,5,12,0.2806,0.1977,19.77,0.2806,0.1977,0.5217,0.2708,0.1955,0.4806,0.6158,0.3875,0.7242,157,99,185
-1491,5P,5,14,0.2775,0.1847,19.77,0.297,0.1977,0.5757,0.2865,0.1951,0.5303,0.6375,0.3661,0.759,163,93,194
-1492,5P,5,16,0.2744,0.1718,19.77,0.3158,0.1977,0.6373,0.3044,0.1946,0.5871,0.6611,0.3396,0.7965,169,87,203
-1493,5P,5,18,0.2718,0.1604,19.77,0.335,0.1977,0.6998,0.3228,0.1941,0.6448,0.6844,0.3096,0.8322,175,79,212
-1494,5P,5,20,0.2694,0.1499,19.77,0.3553,0.1977,0.7659,0.3422,0.1936,0.7056,0.708,0.2736,0.8679,181,70,221
-1495,5P,5,22,0.2673,0.1398,19.77,0.378,0.1977,0.8385,0.3639,0.193,0.7725,0.7337,0.2251,0.9051,187,57,231
-1496,5P,5,24,0.2652,0.1304,19.77,0.4021,0.1977,0.9163,0.3869,0.1924,0.8443,0.7593,0.156,0.9428,194,40,240
-1497,5P,5,26,0.2635,0.1224,19.77,0.4256,0.1977,0.9919,0.4095,0.1918,0.914,0.7836,0.0036,0.9776,200,1,249
-1499,7.5P,5,2,0.3103,0.2959,19.77,0.2073,0.1977,0.2631,0.2009,0.1974,0.2422,0.5136,0.4681,0.5137,131,119,131
-1500,7.5P,5,4,0.31,0.275,19.77,0.2229,0.1977,0.2983,0.216,0.1971,0.2747,0.5468,0.4515,0.549,139,115,140
-1501,7.5P,5,6,0.3093,0.2555,19.77,0.2393,0.1977,0.3367,0.2319,0.1968,0.3101,0.5789,0.4331,0.5843,148,110,149
-1502,7.5P,5,8,0.3087,0.2375,19.77,0.257,0.1977,0.3778,0.249,0.1964,0.3479,0.611,0.4122,0.6193,156,105,158
-1503,7.5P,5,10,0.308,0.223,19.77,0.2731,0.1977,0.4158,0.2646,0.1961,0.383,0.6383,0.392,0.6496,163,100,166
-1504,7.5P,5,12,0.3071,0.208,19.77,0.2919,0.1977,0.4609,0.2828,0.1957,0.4245,0.6682,0.3666,0.6833,170,93,174
-1505,7.5P,5,14,0.3068,0.1951,19.77,0.3109,0.1977,0.5047,0.3012,0.1953,0.465,0.6973,0.3384,0.7141,178,86,182
-1506,7.5P,5,16,0.306,0.183,19.77,0.3306,0.1977,0.552,0.3203,0.1949,0.5086,0.7252,0.3061,0.7456,185,78,190
-1507,7.5P,5,18,0.3052,0.1711,19.77,0.3526,0.1977,0.6051,0.3416,0.1944,0.5575,0.7549,0.2643,0.7789,192,67,199
-1508,7.5P,5,20,0.3042,0.1606,19.77,0.3745,0.1977,0.6588,0.3627,0.1939,0.607,0.7825,0.2137,0.8108,200,54,207
-1509,7.5P,5,22,0.3038,0.15,19.77,0.4004,0.1977,0.7199,0.3878,0.1934,0.6633,0.8145,0.1259,0.8452,208,32,216
-1514,10P,5,2,0.3148,0.2986,19.77,0.2084,0.1977,0.256,0.2021,0.1975,0.2357,0.521,0.4665,0.5065,133,119,129
-1515,10P,5,4,0.3198,0.2807,19.77,0.2252,0.1977,0.2814,0.2186,0.1972,0.2591,0.5621,0.4477,0.5329,143,114,136
-1516,10P,5,6,0.3243,0.263,19.77,0.2438,0.1977,0.3102,0.2367,0.1969,0.2857,0.603,0.4259,0.5611,154,109,143
-1517,10P,5,8,0.328,0.2464,19.77,0.2632,0.1977,0.3415,0.2557,0.1965,0.3145,0.6419,0.4016,0.5896,164,102,150
-1518,10P,5,10,0.3308,0.2328,19.77,0.2809,0.1977,0.3706,0.273,0.1962,0.3413,0.6748,0.3776,0.6147,172,96,157
-1519,10P,5,12,0.3335,0.2187,19.77,0.3015,0.1977,0.4048,0.2931,0.1959,0.3728,0.7103,0.3473,0.6425,181,89,164
-1520,10P,5,14,0.336,0.2066,19.77,0.3215,0.1977,0.4377,0.3127,0.1955,0.4032,0.743,0.3142,0.6679,189,80,170
-1521,10P,5,16,0.3382,0.1951,19.77,0.3427,0.1977,0.4729,0.3334,0.1951,0.4356,0.7755,0.2742,0.6938,198,70,177
-1522,10P,5,18,0.3401,0.184,19.77,0.3654,0.1977,0.5113,0.3556,0.1947,0.471,0.8083,0.2219,0.7206,206,57,184
-1523,10P,5,20,0.3422,0.1735,19.77,0.3899,0.1977,0.5519,0.3795,0.1943,0.5084,0.8421,0.1423,0.7476,215,36,191
-1529,2.5RP,5,2,0.3199,0.3019,19.77,0.2095,0.1977,0.2477,0.2033,0.1975,0.228,0.5287,0.4648,0.4978,135,119,127
-1530,2.5RP,5,4,0.3298,0.2869,19.77,0.2273,0.1977,0.2641,0.2208,0.1972,0.2432,0.5759,0.4444,0.516,147,113,132
-1531,2.5RP,5,6,0.3396,0.2718,19.77,0.247,0.1977,0.2827,0.2403,0.197,0.2603,0.6231,0.4201,0.5354,159,107,137
-1532,2.5RP,5,8,0.349,0.257,19.77,0.2685,0.1977,0.3031,0.2615,0.1967,0.2791,0.6695,0.3917,0.5559,171,100,142
-1533,2.5RP,5,10,0.356,0.2452,19.77,0.287,0.1977,0.3215,0.2797,0.1964,0.2961,0.7063,0.365,0.5735,180,93,146
-1534,2.5RP,5,12,0.3635,0.2325,19.77,0.3091,0.1977,0.3435,0.3015,0.1961,0.3164,0.747,0.3297,0.5936,190,84,151
-1535,2.5RP,5,14,0.3703,0.2211,19.77,0.3311,0.1977,0.3654,0.3232,0.1958,0.3365,0.7849,0.2893,0.6128,200,74,156
-1536,2.5RP,5,16,0.3763,0.2108,19.77,0.3529,0.1977,0.3872,0.3447,0.1955,0.3566,0.8202,0.2414,0.6313,209,62,161
-1537,2.5RP,5,18,0.3821,0.2007,19.77,0.3764,0.1977,0.411,0.3678,0.1951,0.3785,0.856,0.1733,0.6505,218,44,166
-1538,2.5RP,5,20,0.3873,0.1909,19.77,0.4011,0.1977,0.4368,0.3921,0.1948,0.4023,0.8915,0.0262,0.6707,227,7,171
-1542,5RP,5,2,0.3256,0.3065,19.77,0.21,0.1977,0.2373,0.204,0.1975,0.2185,0.5355,0.4637,0.4867,137,118,124
-1543,5RP,5,4,0.3421,0.2954,19.77,0.229,0.1977,0.2426,0.2228,0.1973,0.2233,0.5902,0.4411,0.4937,151,112,126
-1544,5RP,5,6,0.3585,0.2842,19.77,0.2494,0.1977,0.2486,0.2431,0.1971,0.2288,0.6427,0.4151,0.5012,164,106,128
-1545,5RP,5,8,0.3748,0.2729,19.77,0.2715,0.1977,0.2552,0.2651,0.1969,0.235,0.6939,0.3844,0.5095,177,98,130
-1546,5RP,5,10,0.388,0.263,19.77,0.2917,0.1977,0.2623,0.2851,0.1967,0.2415,0.7362,0.3536,0.518,188,90,132
-1547,5RP,5,12,0.4022,0.2523,19.77,0.3152,0.1977,0.2707,0.3085,0.1964,0.2493,0.7818,0.313,0.5277,199,80,135
-1548,5RP,5,14,0.4142,0.2428,19.77,0.3373,0.1977,0.2793,0.3304,0.1961,0.2571,0.8216,0.2681,0.5373,210,68,137
-1549,5RP,5,16,0.4261,0.2331,19.77,0.3614,0.1977,0.289,0.3544,0.1959,0.2661,0.8622,0.2063,0.5479,220,53,140
-1550,5RP,5,18,0.4372,0.2242,19.77,0.3855,0.1977,0.2986,0.3783,0.1956,0.2749,0.9005,0.1105,0.5581,230,28,142
-1554,7.5RP,5,2,0.3296,0.3098,19.77,0.2103,0.1977,0.2301,0.2044,0.1976,0.2118,0.54,0.463,0.4789,138,118,122
-1555,7.5RP,5,4,0.3515,0.3024,19.77,0.2298,0.1977,0.2263,0.2238,0.1974,0.2083,0.5996,0.4392,0.4758,153,112,121
-1556,7.5RP,5,6,0.3726,0.2941,19.77,0.2505,0.1977,0.2241,0.2445,0.1972,0.2062,0.6548,0.4122,0.4747,167,105,121
-1557,7.5RP,5,8,0.3932,0.2852,19.77,0.2726,0.1977,0.2229,0.2666,0.197,0.2052,0.7074,0.3808,0.4749,180,97,121
-1558,7.5RP,5,10,0.4108,0.2773,19.77,0.2929,0.1977,0.2224,0.2869,0.1968,0.2047,0.7515,0.3488,0.4756,192,89,121
-1559,7.5RP,5,12,0.4303,0.2675,19.77,0.318,0.1977,0.2233,0.3119,0.1966,0.2056,0.8014,0.3037,0.4784,204,77,122
-1560,7.5RP,5,14,0.4454,0.2596,19.77,0.3392,0.1977,0.2247,0.3331,0.1964,0.2068,0.8402,0.2583,0.4812,214,66,123
-1561,7.5RP,5,16,0.4617,0.2506,19.77,0.3642,0.1977,0.227,0.358,0.1962,0.2089,0.8832,0.1888,0.4854,225,48,124
-1562,7.5RP,5,18,0.4761,0.2421,19.77,0.3888,0.1977,0.2301,0.3825,0.1959,0.2118,0.9225,0.0674,0.4904,235,17,125
-1565,10RP,6,2,0.3292,0.3141,30.05,0.3149,0.3005,0.3413,0.306,0.3004,0.3141,0.6447,0.5657,0.5729,164,144,146
-1566,10RP,6,4,0.3508,0.3112,30.05,0.3387,0.3005,0.3264,0.3299,0.3002,0.3004,0.7069,0.5429,0.5608,180,138,143
-1567,10RP,6,6,0.374,0.3074,30.05,0.3656,0.3005,0.3114,0.3569,0.3001,0.2867,0.7689,0.5157,0.5485,196,132,140
-1568,10RP,6,8,0.393,0.3038,30.05,0.3887,0.3005,0.2999,0.3802,0.2999,0.276,0.8172,0.4908,0.5388,208,125,137
-1569,10RP,6,10,0.415,0.2989,30.05,0.4172,0.3005,0.2876,0.4088,0.2997,0.2647,0.8714,0.4579,0.5285,222,117,135
-1570,10RP,6,12,0.436,0.2936,30.05,0.4462,0.3005,0.2768,0.4379,0.2995,0.2547,0.922,0.421,0.5194,235,107,132
-1571,10RP,6,14,0.4552,0.2881,30.05,0.4748,0.3005,0.2677,0.4665,0.2993,0.2464,0.968,0.3805,0.512,247,97,131
-1572,10RP,6,16,0.4781,0.2812,30.05,0.5109,0.3005,0.2572,0.5027,0.299,0.2367,1,0.3201,0.5033,255,82,128
-1573,10RP,6,18,0.4961,0.2751,30.05,0.5419,0.3005,0.2499,0.5337,0.2987,0.2299,1,0.2547,0.4976,255,65,127
-1574,2.5R,6,2,0.3318,0.3166,30.05,0.3149,0.3005,0.3337,0.3061,0.3004,0.3072,0.6475,0.5655,0.5662,165,144,144
-1575,2.5R,6,4,0.3566,0.3163,30.05,0.3388,0.3005,0.3108,0.3302,0.3003,0.286,0.7123,0.5423,0.5463,182,138,139
-1576,2.5R,6,6,0.3832,0.3158,30.05,0.3646,0.3005,0.2864,0.3563,0.3002,0.2636,0.7746,0.5157,0.5243,198,132,134
-1577,2.5R,6,8,0.4065,0.3144,30.05,0.3885,0.3005,0.2668,0.3804,0.3001,0.2455,0.8261,0.4895,0.5058,211,125,129
-1578,2.5R,6,10,0.432,0.3118,30.05,0.4163,0.3005,0.2469,0.4084,0.2999,0.2272,0.8804,0.4569,0.4864,225,117,124
-1579,2.5R,6,12,0.4568,0.3082,30.05,0.4454,0.3005,0.2291,0.4376,0.2997,0.2108,0.932,0.4195,0.4685,238,107,119
-1580,2.5R,6,14,0.479,0.3041,30.05,0.4733,0.3005,0.2143,0.4657,0.2995,0.1971,0.9779,0.3793,0.4531,249,97,116
-1581,2.5R,6,16,0.5041,0.2983,30.05,0.5078,0.3005,0.1991,0.5003,0.2993,0.183,1,0.3213,0.437,255,82,111
-1582,2.5R,6,18,0.5262,0.2928,30.05,0.54,0.3005,0.1858,0.5327,0.2991,0.1708,1,0.2527,0.4225,255,64,108
-1583,5R,6,2,0.3343,0.319,30.05,0.3149,0.3005,0.3266,0.3061,0.3005,0.3006,0.6502,0.5652,0.5597,166,144,143
-1584,5R,6,4,0.3628,0.3221,30.05,0.3385,0.3005,0.294,0.3301,0.3004,0.2706,0.7173,0.5419,0.5302,183,138,135
-1585,5R,6,6,0.3921,0.3244,30.05,0.3632,0.3005,0.2626,0.3552,0.3003,0.2416,0.779,0.5161,0.4999,199,132,127
-1586,5R,6,8,0.4187,0.3251,30.05,0.387,0.3005,0.2368,0.3793,0.3002,0.2179,0.8317,0.4898,0.4733,212,125,121
-1587,5R,6,10,0.448,0.325,30.05,0.4142,0.3005,0.2099,0.4068,0.3001,0.193,0.8863,0.4575,0.4436,226,117,113
-1588,5R,6,12,0.476,0.3234,30.05,0.4423,0.3005,0.1864,0.4351,0.3,0.1714,0.9374,0.4212,0.4158,239,107,106
-1589,5R,6,14,0.502,0.3212,30.05,0.4696,0.3005,0.1654,0.4627,0.2998,0.152,0.9834,0.3817,0.389,251,97,99
-1590,5R,6,16,0.5297,0.3179,30.05,0.5007,0.3005,0.1441,0.4939,0.2996,0.1324,1,0.33,0.3596,255,84,92
-1591,5R,6,18,0.5552,0.3138,30.05,0.5317,0.3005,0.1254,0.5251,0.2995,0.1152,1,0.2665,0.3317,255,68,85
-1592,7.5R,6,2,0.3381,0.3228,30.05,0.3147,0.3005,0.3157,0.3061,0.3005,0.2906,0.6539,0.5649,0.5496,167,144,140
-1593,7.5R,6,4,0.3692,0.3291,30.05,0.3371,0.3005,0.2755,0.329,0.3005,0.2535,0.7205,0.5425,0.5116,184,138,130
-1594,7.5R,6,6,0.4,0.334,30.05,0.3599,0.3005,0.2393,0.3521,0.3005,0.2202,0.7794,0.5185,0.4743,199,132,121
-1595,7.5R,6,8,0.4318,0.3383,30.05,0.3836,0.3005,0.2042,0.3762,0.3004,0.1878,0.8344,0.4921,0.4343,213,125,111
-1596,7.5R,6,10,0.4655,0.3412,30.05,0.41,0.3005,0.1702,0.403,0.3004,0.1565,0.8893,0.4606,0.3909,227,117,100
-1597,7.5R,6,12,0.4961,0.3428,30.05,0.4349,0.3005,0.1412,0.4283,0.3003,0.1297,0.9365,0.4284,0.3488,239,109,89
-1598,7.5R,6,14,0.5265,0.3431,30.05,0.4611,0.3005,0.1142,0.4548,0.3002,0.1048,0.9823,0.3911,0.3034,250,100,77
-1599,7.5R,6,16,0.556,0.342,30.05,0.4885,0.3005,0.0896,0.4825,0.3,0.0822,1,0.347,0.2541,255,88,65
-1600,7.5R,6,18,0.5829,0.3396,30.05,0.5158,0.3005,0.0686,0.51,0.2999,0.0628,1,0.2954,0.2015,255,75,51
-1601,10R,6,2,0.3417,0.3268,30.05,0.3142,0.3005,0.3048,0.3057,0.3006,0.2806,0.6567,0.565,0.5393,167,144,138
-1602,10R,6,4,0.3768,0.3381,30.05,0.3349,0.3005,0.2534,0.327,0.3006,0.2332,0.723,0.5437,0.4882,184,139,124
-1603,10R,6,6,0.4103,0.3473,30.05,0.355,0.3005,0.2097,0.3477,0.3007,0.1929,0.7787,0.5222,0.4391,199,133,112
-1604,10R,6,8,0.4449,0.355,30.05,0.3766,0.3005,0.1694,0.3697,0.3007,0.1557,0.8313,0.498,0.3869,212,127,99
-1605,10R,6,10,0.4812,0.3619,30.05,0.3996,0.3005,0.1303,0.3932,0.3006,0.1197,0.882,0.4708,0.3265,225,120,83
-1606,10R,6,12,0.515,0.3667,30.05,0.422,0.3005,0.0969,0.416,0.3006,0.0889,0.9269,0.4423,0.2621,236,113,67
-1607,10R,6,14,0.5468,0.3697,30.05,0.4445,0.3005,0.0679,0.4388,0.3005,0.0621,0.9681,0.4117,0.1856,247,105,47
-1608,10R,6,16,0.5741,0.3713,30.05,0.4646,0.3005,0.0442,0.4592,0.3005,0.0403,1,0.3816,0.0775,255,97,20
-1610,2.5YR,6,2,0.3453,0.3321,30.05,0.3124,0.3005,0.2919,0.3041,0.3007,0.2686,0.6572,0.5661,0.5267,168,144,134
-1611,2.5YR,6,4,0.3806,0.3467,30.05,0.3299,0.3005,0.2364,0.3222,0.3008,0.2175,0.7176,0.5478,0.469,183,140,120
-1612,2.5YR,6,6,0.418,0.36,30.05,0.3489,0.3005,0.1853,0.3419,0.3008,0.1704,0.7739,0.5272,0.4069,197,134,104
-1613,2.5YR,6,8,0.4533,0.3708,30.05,0.3674,0.3005,0.1426,0.3609,0.3009,0.131,0.8219,0.5066,0.3444,210,129,88
-1614,2.5YR,6,10,0.4891,0.3806,30.05,0.3862,0.3005,0.1029,0.3801,0.3009,0.0944,0.8662,0.4846,0.2707,221,124,69
-1615,2.5YR,6,12,0.5215,0.3887,30.05,0.4032,0.3005,0.0694,0.3975,0.3009,0.0636,0.9033,0.4636,0.1826,230,118,47
-1616,2.5YR,6,14,0.5488,0.3947,30.05,0.4178,0.3005,0.043,0.4125,0.3009,0.0392,0.9332,0.4447,0.0395,238,113,10
-1619,5YR,6,2,0.3474,0.3373,30.05,0.3095,0.3005,0.2809,0.3013,0.3007,0.2585,0.654,0.5684,0.5155,167,145,131
-1620,5YR,6,4,0.384,0.3564,30.05,0.3238,0.3005,0.2189,0.3164,0.3009,0.2013,0.7099,0.5528,0.448,181,141,114
-1621,5YR,6,6,0.4229,0.375,30.05,0.3389,0.3005,0.1619,0.3322,0.3011,0.1489,0.7608,0.5361,0.3725,194,137,95
-1622,5YR,6,8,0.4592,0.39,30.05,0.3538,0.3005,0.1162,0.3477,0.3011,0.1067,0.804,0.5194,0.2948,205,132,75
-1623,5YR,6,10,0.4921,0.4022,30.05,0.3677,0.3005,0.079,0.362,0.3012,0.0724,0.84,0.5034,0.2067,214,128,53
-1624,5YR,6,12,0.5199,0.4119,30.05,0.3793,0.3005,0.0498,0.374,0.3012,0.0454,0.8683,0.4897,0.0817,221,125,21
-1628,7.5YR,6,2,0.3487,0.3421,30.05,0.3063,0.3005,0.2716,0.2983,0.3008,0.2499,0.6496,0.5709,0.5058,166,146,129
-1629,7.5YR,6,4,0.386,0.3652,30.05,0.3176,0.3005,0.2047,0.3104,0.301,0.1883,0.7009,0.558,0.43,179,142,110
-1630,7.5YR,6,6,0.4242,0.3876,30.05,0.3289,0.3005,0.1459,0.3224,0.3012,0.1341,0.7451,0.5451,0.3462,190,139,88
-1631,7.5YR,6,8,0.4596,0.4064,30.05,0.3398,0.3005,0.0991,0.3339,0.3014,0.0909,0.7819,0.5326,0.2558,199,136,65
-1632,7.5YR,6,10,0.4904,0.422,30.05,0.3492,0.3005,0.0624,0.3438,0.3014,0.0571,0.8107,0.5218,0.1428,207,133,36
-1636,10YR,6,2,0.3491,0.3483,30.05,0.3012,0.3005,0.2611,0.2933,0.3009,0.2402,0.6407,0.5751,0.4944,163,147,126
-1637,10YR,6,4,0.3861,0.3767,30.05,0.308,0.3005,0.1892,0.301,0.3012,0.174,0.6841,0.5662,0.409,174,144,104
-1638,10YR,6,6,0.424,0.403,30.05,0.3162,0.3005,0.129,0.3099,0.3014,0.1185,0.7233,0.5564,0.3152,184,142,80
-1639,10YR,6,8,0.457,0.4249,30.05,0.3232,0.3005,0.0835,0.3175,0.3016,0.0766,0.753,0.548,0.2124,192,140,54
-1640,10YR,6,10,0.4843,0.4416,30.05,0.3296,0.3005,0.0504,0.3243,0.3017,0.0461,0.7762,0.5406,0.063,198,138,16
-1643,2.5Y,6,2,0.348,0.354,30.05,0.2954,0.3005,0.253,0.2876,0.301,0.2328,0.6289,0.5799,0.4852,160,148,124
-1644,2.5Y,6,4,0.384,0.3867,30.05,0.2984,0.3005,0.1782,0.2916,0.3013,0.1638,0.6651,0.5745,0.3929,170,146,100
-1645,2.5Y,6,6,0.4203,0.4176,30.05,0.3024,0.3005,0.1166,0.2964,0.3016,0.1071,0.6968,0.5685,0.2896,178,145,74
-1646,2.5Y,6,8,0.4517,0.4421,30.05,0.307,0.3005,0.0722,0.3015,0.3018,0.0661,0.7222,0.5626,0.1723,184,143,44
-1650,5Y,6,2,0.3457,0.358,30.05,0.2902,0.3005,0.2487,0.2825,0.3011,0.2288,0.6167,0.5843,0.4802,157,149,122
-1651,5Y,6,4,0.3794,0.3955,30.05,0.2883,0.3005,0.171,0.2815,0.3015,0.1572,0.6426,0.5831,0.3817,164,149,97
-1652,5Y,6,6,0.414,0.4305,30.05,0.289,0.3005,0.1085,0.2831,0.3018,0.0996,0.668,0.5802,0.2706,170,148,69
-1653,5Y,6,8,0.4426,0.4588,30.05,0.2899,0.3005,0.0646,0.2845,0.302,0.0591,0.686,0.5778,0.1369,175,147,35
-1657,7.5Y,6,2,0.3431,0.3601,30.05,0.2863,0.3005,0.2477,0.2786,0.3011,0.2279,0.6067,0.5876,0.4788,155,150,122
-1658,7.5Y,6,4,0.3745,0.4004,30.05,0.2811,0.3005,0.1689,0.2744,0.3016,0.1553,0.6247,0.5893,0.3779,159,150,96
-1659,7.5Y,6,6,0.406,0.44,30.05,0.2773,0.3005,0.1052,0.2714,0.3019,0.0965,0.6401,0.5903,0.2614,163,151,67
-1660,7.5Y,6,8,0.4321,0.4719,30.05,0.2752,0.3005,0.0611,0.2699,0.3021,0.0559,0.6516,0.5905,0.1151,166,151,29
-1664,10Y,6,2,0.3398,0.3611,30.05,0.2828,0.3005,0.2489,0.2751,0.3011,0.229,0.5963,0.5907,0.48,152,151,122
-1665,10Y,6,4,0.3679,0.4033,30.05,0.2741,0.3005,0.1705,0.2674,0.3016,0.1567,0.6054,0.5953,0.3796,154,152,97
-1666,10Y,6,6,0.396,0.4452,30.05,0.2673,0.3005,0.1072,0.2614,0.302,0.0984,0.613,0.5989,0.2647,156,153,67
-1667,10Y,6,8,0.4201,0.4812,30.05,0.2623,0.3005,0.0616,0.2571,0.3023,0.0564,0.6183,0.6014,0.1137,158,153,29
-1671,2.5GY,6,2,0.3342,0.3607,30.05,0.2784,0.3005,0.2542,0.2707,0.3012,0.2339,0.5816,0.5947,0.4855,148,152,124
-1672,2.5GY,6,4,0.3572,0.4038,30.05,0.2658,0.3005,0.1779,0.2591,0.3016,0.1635,0.5787,0.6026,0.3897,148,154,99
-1673,2.5GY,6,6,0.3799,0.447,30.05,0.2554,0.3005,0.1164,0.2494,0.302,0.1069,0.5755,0.6091,0.2833,147,155,72
-1674,2.5GY,6,8,0.4006,0.4885,30.05,0.2464,0.3005,0.0682,0.2411,0.3024,0.0625,0.5707,0.6149,0.1418,146,157,36
-1678,5GY,6,2,0.3288,0.3592,30.05,0.2751,0.3005,0.261,0.2672,0.3011,0.2402,0.5687,0.5978,0.4927,145,152,126
-1679,5GY,6,4,0.3461,0.4008,30.05,0.2595,0.3005,0.1898,0.2526,0.3016,0.1745,0.5543,0.6083,0.4058,141,155,103
-1680,5GY,6,6,0.3622,0.4438,30.05,0.2452,0.3005,0.1314,0.2391,0.3021,0.1207,0.5375,0.618,0.3119,137,158,80
-1681,5GY,6,8,0.3772,0.488,30.05,0.2323,0.3005,0.083,0.2268,0.3024,0.0761,0.519,0.6268,0.1944,132,160,50
-1685,7.5GY,6,2,0.3193,0.355,30.05,0.2703,0.3005,0.2757,0.2622,0.3011,0.2537,0.5473,0.6023,0.5078,140,154,129
-1686,7.5GY,6,4,0.3275,0.3922,30.05,0.2509,0.3005,0.2148,0.2437,0.3016,0.1976,0.5144,0.6162,0.4377,131,157,112
-1687,7.5GY,6,6,0.3351,0.4321,30.05,0.233,0.3005,0.1619,0.2265,0.302,0.1488,0.4796,0.6288,0.3629,122,160,93
-1688,7.5GY,6,8,0.3418,0.4768,30.05,0.2154,0.3005,0.1143,0.2096,0.3024,0.105,0.439,0.6411,0.2738,112,163,70
-1689,7.5GY,6,10,0.3463,0.5196,30.05,0.2003,0.3005,0.0776,0.1949,0.3028,0.0711,0.397,0.6515,0.1689,101,166,43
-1693,10GY,6,2,0.3112,0.3496,30.05,0.2675,0.3005,0.2916,0.2593,0.3011,0.2683,0.5307,0.6052,0.5237,135,154,134
-1694,10GY,6,4,0.3124,0.3822,30.05,0.2456,0.3005,0.2401,0.2381,0.3015,0.2209,0.4822,0.6214,0.4676,123,158,119
-1695,10GY,6,6,0.3128,0.4175,30.05,0.2251,0.3005,0.1941,0.2182,0.3019,0.1785,0.4289,0.6361,0.409,109,162,104
-1696,10GY,6,8,0.3116,0.4563,30.05,0.2052,0.3005,0.1529,0.1989,0.3023,0.1405,0.365,0.6501,0.3456,93,166,88
-1697,10GY,6,10,0.3086,0.4949,30.05,0.1874,0.3005,0.1193,0.1815,0.3027,0.1096,0.2898,0.6625,0.281,74,169,72
-1698,10GY,6,12,0.3037,0.5358,30.05,0.1703,0.3005,0.09,0.1649,0.303,0.0826,0.1806,0.6741,0.2049,46,172,52
-1703,2.5G,6,2,0.3039,0.3437,30.05,0.2657,0.3005,0.3081,0.2573,0.301,0.2836,0.5164,0.6073,0.5397,132,155,138
-1704,2.5G,6,4,0.2967,0.3695,30.05,0.2413,0.3005,0.2715,0.2334,0.3014,0.2498,0.4472,0.6259,0.5016,114,160,128
-1705,2.5G,6,6,0.2892,0.3963,30.05,0.2193,0.3005,0.2385,0.2118,0.3018,0.2194,0.3706,0.6421,0.4639,95,164,118
-1706,2.5G,6,8,0.2799,0.4239,30.05,0.1984,0.3005,0.21,0.1914,0.3021,0.1931,0.2704,0.6571,0.4278,69,168,109
-1707,2.5G,6,10,0.269,0.453,30.05,0.1784,0.3005,0.1844,0.1718,0.3024,0.1696,0.0796,0.6711,0.3917,20,171,100
-1717,5G,6,2,0.2988,0.3382,30.05,0.2655,0.3005,0.3225,0.2569,0.3009,0.2969,0.5083,0.608,0.5533,130,155,141
-1718,5G,6,4,0.2868,0.3595,30.05,0.2397,0.3005,0.2957,0.2315,0.3013,0.2721,0.4254,0.628,0.5261,108,160,134
-1719,5G,6,6,0.2748,0.3795,30.05,0.2176,0.3005,0.2737,0.2097,0.3016,0.2519,0.3323,0.6446,0.5026,85,164,128
-1720,5G,6,8,0.2612,0.399,30.05,0.1967,0.3005,0.2559,0.1891,0.3019,0.2355,0.1939,0.6598,0.4821,49,168,123
-1731,7.5G,6,2,0.2958,0.3344,30.05,0.2658,0.3005,0.3323,0.2571,0.3009,0.3059,0.5043,0.608,0.5623,129,155,143
-1732,7.5G,6,4,0.2807,0.3522,30.05,0.2395,0.3005,0.3132,0.231,0.3012,0.2883,0.4127,0.6287,0.5431,105,160,138
-1733,7.5G,6,6,0.2662,0.3672,30.05,0.2178,0.3005,0.3,0.2096,0.3015,0.2761,0.3096,0.6452,0.5292,79,165,135
-1734,7.5G,6,8,0.251,0.3829,30.05,0.197,0.3005,0.2873,0.1889,0.3017,0.2644,0.1362,0.6606,0.5153,35,168,131
-1745,10G,6,2,0.2929,0.3303,30.05,0.2665,0.3005,0.3428,0.2576,0.3008,0.3156,0.501,0.6079,0.5717,128,155,146
-1746,10G,6,4,0.2749,0.3443,30.05,0.2399,0.3005,0.3324,0.2312,0.3011,0.3059,0.4014,0.629,0.5609,102,160,143
-1747,10G,6,6,0.2591,0.3558,30.05,0.2188,0.3005,0.3252,0.2103,0.3014,0.2994,0.291,0.6453,0.5533,74,165,141
-1748,10G,6,8,0.242,0.3679,30.05,0.1977,0.3005,0.3186,0.1892,0.3016,0.2933,0.0431,0.6611,0.5459,11,169,139
-1758,2.5BG,6,2,0.2902,0.3268,30.05,0.2668,0.3005,0.3522,0.2578,0.3008,0.3242,0.4973,0.6079,0.58,127,155,148
-1759,2.5BG,6,4,0.2702,0.3369,30.05,0.241,0.3005,0.3504,0.2321,0.301,0.3226,0.3936,0.6288,0.5771,100,160,147
-1760,2.5BG,6,6,0.2526,0.3448,30.05,0.2201,0.3005,0.3509,0.2112,0.3012,0.323,0.2728,0.6451,0.5764,70,165,147
-1769,5BG,6,2,0.2872,0.3219,30.05,0.2681,0.3005,0.3649,0.2589,0.3007,0.3359,0.4949,0.6073,0.591,126,155,151
-1770,5BG,6,4,0.2648,0.3262,30.05,0.2439,0.3005,0.3768,0.2347,0.3009,0.3469,0.3885,0.6273,0.5998,99,160,153
-1771,5BG,6,6,0.2441,0.329,30.05,0.223,0.3005,0.3899,0.2135,0.301,0.359,0.2486,0.6442,0.6097,63,164,155
-1779,7.5BG,6,2,0.2849,0.3172,30.05,0.2699,0.3005,0.377,0.2606,0.3006,0.347,0.4948,0.6062,0.6013,126,155,153
-1780,7.5BG,6,4,0.2604,0.3169,30.05,0.2469,0.3005,0.4008,0.2373,0.3007,0.3691,0.3853,0.6258,0.6196,98,160,158
-1781,7.5BG,6,6,0.2384,0.3155,30.05,0.2271,0.3005,0.4249,0.2172,0.3008,0.3912,0.2386,0.6422,0.6376,61,164,163
-1788,10BG,6,2,0.2837,0.3132,30.05,0.2722,0.3005,0.3868,0.2627,0.3006,0.3561,0.4976,0.6046,0.6095,127,154,155
-1789,10BG,6,4,0.2578,0.3078,30.05,0.2517,0.3005,0.4241,0.2418,0.3006,0.3905,0.3912,0.6227,0.6382,100,159,163
-1790,10BG,6,6,0.2335,0.3015,30.05,0.2327,0.3005,0.4635,0.2224,0.3005,0.4268,0.2369,0.639,0.6668,60,163,170
-1797,2.5B,6,2,0.2835,0.3097,30.05,0.2751,0.3005,0.3947,0.2655,0.3005,0.3634,0.5035,0.6025,0.6161,128,154,157
-1798,2.5B,6,4,0.2571,0.3008,30.05,0.2568,0.3005,0.4417,0.2467,0.3004,0.4067,0.4029,0.6192,0.6517,103,158,166
-1799,2.5B,6,6,0.2312,0.2899,30.05,0.2397,0.3005,0.4964,0.2288,0.3003,0.4572,0.2528,0.6347,0.6906,64,162,176
-1805,5B,6,2,0.2842,0.3063,30.05,0.2788,0.3005,0.4017,0.2692,0.3004,0.3699,0.5127,0.5996,0.6219,131,153,159
-1806,5B,6,4,0.2579,0.2938,30.05,0.2638,0.3005,0.4585,0.2534,0.3003,0.4222,0.4224,0.6141,0.6646,108,157,169
-1807,5B,6,6,0.232,0.2789,30.05,0.25,0.3005,0.527,0.2387,0.3001,0.4853,0.2943,0.6276,0.7119,75,160,182
-1813,7.5B,6,2,0.2854,0.3037,30.05,0.2824,0.3005,0.4066,0.2727,0.3004,0.3743,0.5222,0.5967,0.6259,133,152,160
-1814,7.5B,6,4,0.2602,0.2881,30.05,0.2714,0.3005,0.4711,0.2609,0.3001,0.4339,0.4463,0.6082,0.674,114,155,172
-1815,7.5B,6,6,0.2352,0.2708,30.05,0.261,0.3005,0.5482,0.2495,0.2999,0.5049,0.342,0.6194,0.7263,87,158,185
-1816,7.5B,6,8,0.2132,0.2537,30.05,0.2525,0.3005,0.6314,0.24,0.2995,0.5816,0.18,0.629,0.7779,46,160,198
-1821,10B,6,2,0.2871,0.3012,30.05,0.2864,0.3005,0.4107,0.2766,0.3003,0.3782,0.5334,0.5934,0.6294,136,151,160
-1822,10B,6,4,0.2637,0.284,30.05,0.279,0.3005,0.4786,0.2684,0.3,0.4407,0.4716,0.6021,0.6797,120,154,173
-1823,10B,6,6,0.2399,0.265,30.05,0.272,0.3005,0.5614,0.2603,0.2997,0.5171,0.3888,0.6109,0.7353,99,156,188
-1824,10B,6,8,0.2189,0.2468,30.05,0.2665,0.3005,0.6506,0.2537,0.2993,0.5992,0.279,0.6184,0.7897,71,158,201
-1829,2.5PB,6,2,0.2897,0.2991,30.05,0.2911,0.3005,0.4131,0.2812,0.3002,0.3804,0.547,0.5896,0.6314,139,150,161
-1830,2.5PB,6,4,0.2684,0.2804,30.05,0.2876,0.3005,0.4835,0.2769,0.2999,0.4453,0.5002,0.595,0.6835,128,152,174
-1831,2.5PB,6,6,0.2465,0.2599,30.05,0.285,0.3005,0.5707,0.2732,0.2995,0.5256,0.4401,0.6004,0.7417,112,153,189
-1832,2.5PB,6,8,0.2274,0.2406,30.05,0.284,0.3005,0.6644,0.271,0.2991,0.612,0.3706,0.6045,0.7983,95,154,204
-1833,2.5PB,6,10,0.2095,0.2225,30.05,0.2829,0.3005,0.7671,0.2686,0.2986,0.7067,0.2695,0.609,0.8548,69,155,218
-1836,5PB,6,2,0.2923,0.2978,30.05,0.295,0.3005,0.4136,0.2851,0.3002,0.3808,0.5588,0.5862,0.632,142,149,161
-1837,5PB,6,4,0.2734,0.2778,30.05,0.2957,0.3005,0.4855,0.285,0.2998,0.4471,0.5267,0.5881,0.6852,134,150,175
-1838,5PB,6,6,0.2533,0.2558,30.05,0.2976,0.3005,0.5767,0.2856,0.2994,0.5311,0.4851,0.5899,0.746,124,150,190
-1839,5PB,6,8,0.236,0.2365,30.05,0.2999,0.3005,0.6702,0.2867,0.2989,0.6174,0.439,0.5913,0.8022,112,151,205
-1840,5PB,6,10,0.2197,0.2188,30.05,0.3017,0.3005,0.7712,0.2873,0.2984,0.7104,0.3782,0.5933,0.8576,96,151,219
-1841,5PB,6,12,0.2026,0.1999,30.05,0.3046,0.3005,0.8982,0.2885,0.2977,0.8275,0.2819,0.5955,0.9212,72,152,235
-1842,5PB,6,14,0.1873,0.1822,30.05,0.3089,0.3005,1.0399,0.291,0.297,0.9581,0.0918,0.5968,0.9859,23,152,251
-1843,7.5PB,6,2,0.2955,0.2963,30.05,0.2997,0.3005,0.414,0.2898,0.3002,0.3812,0.5728,0.5821,0.6325,146,148,161
-1844,7.5PB,6,4,0.2798,0.2752,30.05,0.3055,0.3005,0.4859,0.2947,0.2998,0.4475,0.5575,0.5796,0.686,142,148,175
-1845,7.5PB,6,6,0.2638,0.2531,30.05,0.3132,0.3005,0.5736,0.3013,0.2992,0.5283,0.5399,0.5761,0.7446,138,147,190
-1846,7.5PB,6,8,0.2505,0.2347,30.05,0.3207,0.3005,0.6591,0.3077,0.2988,0.6071,0.5221,0.5726,0.7965,133,146,203
-1847,7.5PB,6,10,0.2378,0.2168,30.05,0.3296,0.3005,0.756,0.3153,0.2982,0.6964,0.5023,0.5682,0.8504,128,145,217
-1848,7.5PB,6,12,0.2241,0.1975,30.05,0.341,0.3005,0.88,0.3251,0.2975,0.8108,0.4753,0.5627,0.9135,121,143,233
-1849,7.5PB,6,14,0.2119,0.1799,30.05,0.354,0.3005,1.0159,0.3363,0.2967,0.936,0.4454,0.5559,0.9766,114,142,249
-1850,10PB,6,2,0.2988,0.2961,30.05,0.3032,0.3005,0.4111,0.2934,0.3001,0.3785,0.5844,0.5789,0.6304,149,148,161
-1851,10PB,6,4,0.2863,0.2747,30.05,0.3132,0.3005,0.4802,0.3025,0.2997,0.4422,0.5829,0.5726,0.6823,149,146,174
-1852,10PB,6,6,0.274,0.2533,30.05,0.3251,0.3005,0.5608,0.3133,0.2992,0.5165,0.5818,0.5649,0.7369,148,144,188
-1853,10PB,6,8,0.2637,0.2352,30.05,0.3369,0.3005,0.6402,0.3241,0.2987,0.5897,0.5812,0.5571,0.786,148,142,200
-1854,10PB,6,10,0.254,0.2176,30.05,0.3508,0.3005,0.7297,0.3368,0.2981,0.6722,0.5819,0.5476,0.837,148,140,213
-1855,10PB,6,12,0.244,0.1998,30.05,0.367,0.3005,0.8365,0.3516,0.2974,0.7706,0.5819,0.5364,0.8929,148,137,228
-1856,10PB,6,14,0.2352,0.1839,30.05,0.3843,0.3005,0.9492,0.3674,0.2967,0.8745,0.5826,0.5239,0.9473,149,134,242
-1857,10PB,6,16,0.2265,0.1671,30.05,0.4073,0.3005,1.0905,0.3886,0.2958,1.0047,0.587,0.5065,1,150,129,255
-1858,2.5P,6,2,0.3016,0.296,30.05,0.3062,0.3005,0.4085,0.2964,0.3001,0.3761,0.594,0.5761,0.6285,151,147,160
-1859,2.5P,6,4,0.2932,0.2759,30.05,0.3193,0.3005,0.4693,0.3087,0.2997,0.4322,0.6049,0.5666,0.6747,154,144,172
-1860,2.5P,6,6,0.2842,0.255,30.05,0.3349,0.3005,0.543,0.3233,0.2992,0.5001,0.6168,0.5552,0.7258,157,142,185
-1861,2.5P,6,8,0.277,0.2372,30.05,0.3509,0.3005,0.6154,0.3384,0.2987,0.5669,0.6301,0.5429,0.7718,161,138,197
-1862,2.5P,6,10,0.2703,0.2204,30.05,0.3685,0.3005,0.6944,0.3549,0.2981,0.6396,0.6445,0.529,0.8181,164,135,209
-1863,2.5P,6,12,0.2647,0.2052,30.05,0.3876,0.3005,0.7763,0.373,0.2976,0.7151,0.6612,0.5132,0.8629,169,131,220
-1864,2.5P,6,14,0.2593,0.1909,30.05,0.4082,0.3005,0.8655,0.3923,0.2969,0.7973,0.678,0.4955,0.9083,173,126,232
-1865,2.5P,6,16,0.2548,0.1768,30.05,0.4331,0.3005,0.9661,0.4159,0.2962,0.8901,0.7004,0.4726,0.9563,179,121,244
-1866,2.5P,6,18,0.2504,0.1658,30.05,0.4538,0.3005,1.0581,0.4354,0.2955,0.9749,0.7157,0.4528,0.9975,183,115,254
-1867,5P,6,2,0.305,0.2967,30.05,0.3089,0.3005,0.4034,0.2992,0.3001,0.3714,0.6037,0.5735,0.6246,154,146,159
-1868,5P,6,4,0.3001,0.2778,30.05,0.3246,0.3005,0.4566,0.3142,0.2997,0.4204,0.6244,0.5613,0.6658,159,143,170
-1869,5P,6,6,0.295,0.2585,30.05,0.3429,0.3005,0.519,0.3316,0.2992,0.478,0.6471,0.5467,0.7102,165,139,181
-1870,5P,6,8,0.2905,0.2421,30.05,0.3606,0.3005,0.5801,0.3485,0.2988,0.5343,0.6678,0.5321,0.7505,170,136,191
-1871,5P,6,10,0.2862,0.226,30.05,0.3805,0.3005,0.6486,0.3675,0.2983,0.5974,0.6905,0.515,0.7924,176,131,202
-1872,5P,6,12,0.2829,0.2121,30.05,0.4008,0.3005,0.7155,0.3869,0.2977,0.6591,0.7135,0.4967,0.8308,182,127,212
-1873,5P,6,14,0.2794,0.1979,30.05,0.4243,0.3005,0.7937,0.4093,0.2971,0.7312,0.7387,0.4744,0.873,188,121,223
-1874,5P,6,16,0.2761,0.1852,30.05,0.448,0.3005,0.8741,0.432,0.2965,0.8052,0.7627,0.4505,0.9137,194,115,233
-1875,5P,6,18,0.2731,0.1738,30.05,0.4722,0.3005,0.9563,0.455,0.2959,0.881,0.7861,0.4245,0.9529,200,108,243
-1876,5P,6,20,0.2702,0.1621,30.05,0.5009,0.3005,1.0524,0.4825,0.2951,0.9696,0.8131,0.3906,0.9963,207,100,254
-1877,7.5P,6,2,0.3107,0.2993,30.05,0.3119,0.3005,0.3916,0.3023,0.3002,0.3605,0.6169,0.5704,0.6153,157,145,157
-1878,7.5P,6,4,0.3107,0.2831,30.05,0.3298,0.3005,0.4312,0.3197,0.2998,0.397,0.6477,0.5555,0.6471,165,142,165
-1879,7.5P,6,6,0.3101,0.265,30.05,0.3516,0.3005,0.4818,0.3408,0.2993,0.4437,0.6822,0.5368,0.685,174,137,175
-1880,7.5P,6,8,0.3099,0.2502,30.05,0.3722,0.3005,0.5283,0.3607,0.2989,0.4866,0.7131,0.5183,0.7176,182,132,183
-1881,7.5P,6,10,0.3092,0.235,30.05,0.3954,0.3005,0.5828,0.3832,0.2984,0.5368,0.7453,0.4965,0.7534,190,127,192
-1882,7.5P,6,12,0.309,0.2222,30.05,0.4179,0.3005,0.634,0.405,0.298,0.584,0.7755,0.474,0.7852,198,121,200
-1883,7.5P,6,14,0.3084,0.2095,30.05,0.4424,0.3005,0.6915,0.4287,0.2975,0.637,0.8061,0.448,0.819,206,114,209
-1884,7.5P,6,16,0.308,0.1976,30.05,0.4684,0.3005,0.7519,0.4539,0.2969,0.6926,0.8373,0.4181,0.8526,214,107,217
-1885,7.5P,6,18,0.3075,0.187,30.05,0.4941,0.3005,0.8123,0.4788,0.2964,0.7483,0.8666,0.3857,0.8845,221,98,226
-1886,7.5P,6,20,0.3069,0.1745,30.05,0.5285,0.3005,0.8931,0.5121,0.2957,0.8227,0.9037,0.3365,0.925,230,86,236
-1887,7.5P,6,22,0.3062,0.1638,30.05,0.5617,0.3005,0.9723,0.5442,0.295,0.8958,0.9374,0.2788,0.9626,239,71,245
-1888,7.5P,6,24,0.3058,0.1547,30.05,0.594,0.3005,1.048,0.5755,0.2943,0.9655,0.9691,0.2045,0.9967,247,52,254
-1889,10P,6,2,0.3146,0.3018,30.05,0.3132,0.3005,0.3819,0.3038,0.3002,0.3516,0.6243,0.5688,0.6075,159,145,155
-1890,10P,6,4,0.3181,0.2871,30.05,0.3329,0.3005,0.4132,0.323,0.2999,0.3805,0.6623,0.5519,0.6334,169,141,162
-1891,10P,6,6,0.3226,0.2716,30.05,0.3569,0.3005,0.449,0.3465,0.2995,0.4134,0.7059,0.5303,0.6616,180,135,169
-1892,10P,6,8,0.3259,0.2584,30.05,0.379,0.3005,0.4834,0.3681,0.2991,0.4452,0.7426,0.5094,0.6872,189,130,175
-1893,10P,6,10,0.3293,0.245,30.05,0.4039,0.3005,0.5221,0.3925,0.2987,0.4809,0.7815,0.4844,0.7147,199,124,182
-1894,10P,6,12,0.3321,0.2329,30.05,0.4285,0.3005,0.5613,0.4165,0.2982,0.5169,0.8173,0.4581,0.7411,208,117,189
-1895,10P,6,14,0.3349,0.2203,30.05,0.4568,0.3005,0.6067,0.4442,0.2978,0.5588,0.856,0.4253,0.7703,218,108,196
-1896,10P,6,16,0.337,0.2095,30.05,0.4834,0.3005,0.6505,0.4701,0.2973,0.5991,0.89,0.3915,0.797,227,100,203
-1897,10P,6,18,0.3388,0.1995,30.05,0.5103,0.3005,0.6954,0.4965,0.2968,0.6406,0.9227,0.3531,0.8234,235,90,210
-1898,10P,6,20,0.3409,0.1882,30.05,0.5443,0.3005,0.7519,0.5297,0.2962,0.6926,0.962,0.2958,0.8549,245,75,218
-1899,10P,6,22,0.3426,0.1785,30.05,0.5768,0.3005,0.8062,0.5613,0.2957,0.7427,0.9975,0.2252,0.8839,254,57,225
-1900,10P,6,24,0.3441,0.1698,30.05,0.609,0.3005,0.8603,0.5928,0.2951,0.7925,1,0.1123,0.9116,255,29,232
-1902,2.5RP,6,2,0.3188,0.3048,30.05,0.3143,0.3005,0.3711,0.305,0.3002,0.3416,0.6314,0.5675,0.5985,161,145,153
-1903,2.5RP,6,4,0.3272,0.2929,30.05,0.3357,0.3005,0.3898,0.3261,0.3,0.3588,0.6775,0.5484,0.6149,173,140,157
-1904,2.5RP,6,6,0.3362,0.2799,30.05,0.3609,0.3005,0.4122,0.351,0.2996,0.3795,0.7272,0.5247,0.6339,185,134,162
-1905,2.5RP,6,8,0.3437,0.2688,30.05,0.3842,0.3005,0.4332,0.374,0.2993,0.3989,0.7692,0.5017,0.651,196,128,166
-1906,2.5RP,6,10,0.3509,0.2578,30.05,0.409,0.3005,0.4561,0.3984,0.2989,0.42,0.8107,0.4756,0.669,207,121,171
-1907,2.5RP,6,12,0.3582,0.2462,30.05,0.4372,0.3005,0.4829,0.4262,0.2985,0.4446,0.8546,0.4436,0.6892,218,113,176
-1908,2.5RP,6,14,0.3652,0.2355,30.05,0.466,0.3005,0.5095,0.4546,0.2982,0.4692,0.8967,0.4076,0.7087,229,104,181
-1909,2.5RP,6,16,0.3718,0.2251,30.05,0.4963,0.3005,0.5381,0.4845,0.2977,0.4956,0.9383,0.3649,0.7288,239,93,186
-1910,2.5RP,6,18,0.3773,0.2158,30.05,0.5254,0.3005,0.5666,0.5131,0.2973,0.5218,0.9757,0.3174,0.7481,249,81,191
-1911,2.5RP,6,20,0.3833,0.2056,30.05,0.5602,0.3005,0.6009,0.5475,0.2968,0.5534,1,0.246,0.7704,255,63,196
-1912,2.5RP,6,22,0.3877,0.1978,30.05,0.589,0.3005,0.6297,0.5758,0.2964,0.58,1,0.1607,0.7886,255,41,201
-1914,5RP,6,2,0.3232,0.3085,30.05,0.3148,0.3005,0.3587,0.3056,0.3003,0.3303,0.6376,0.5665,0.5881,163,144,150
-1915,5RP,6,4,0.3371,0.3001,30.05,0.3375,0.3005,0.3633,0.3283,0.3001,0.3344,0.6914,0.5456,0.5931,176,139,151
-1916,5RP,6,6,0.352,0.2904,30.05,0.3642,0.3005,0.37,0.3548,0.2998,0.3407,0.7478,0.5196,0.6001,191,132,153
-1917,5RP,6,8,0.3648,0.282,30.05,0.3887,0.3005,0.3764,0.3792,0.2995,0.3465,0.7951,0.4943,0.6066,203,126,155
-1918,5RP,6,10,0.3769,0.2738,30.05,0.4137,0.3005,0.3834,0.404,0.2993,0.3529,0.8396,0.4668,0.6135,214,119,156
-1919,5RP,6,12,0.39,0.2646,30.05,0.4429,0.3005,0.3923,0.4331,0.2989,0.3611,0.888,0.4316,0.622,226,110,159
-1920,5RP,6,14,0.4023,0.2552,30.05,0.4737,0.3005,0.4033,0.4637,0.2986,0.3713,0.935,0.3905,0.6322,238,100,161
-1921,5RP,6,16,0.4136,0.2467,30.05,0.5038,0.3005,0.4138,0.4936,0.2983,0.381,0.9781,0.3442,0.6416,249,88,164
-1922,5RP,6,18,0.4245,0.2382,30.05,0.5355,0.3005,0.4255,0.5251,0.2979,0.3918,1,0.2857,0.6519,255,73,166
-1923,5RP,6,20,0.4368,0.2283,30.05,0.5749,0.3005,0.4408,0.5642,0.2975,0.4059,1,0.1834,0.665,255,47,170
-1924,5RP,6,22,0.4449,0.2219,30.05,0.6025,0.3005,0.4512,0.5916,0.2972,0.4155,1,0.0149,0.6737,255,4,172
-1925,7.5RP,6,2,0.3261,0.3113,30.05,0.3148,0.3005,0.35,0.3057,0.3003,0.3222,0.6409,0.5662,0.5806,163,144,148
-1926,7.5RP,6,4,0.3439,0.3056,30.05,0.3382,0.3005,0.3447,0.3291,0.3002,0.3173,0.6993,0.5442,0.5771,178,139,147
-1927,7.5RP,6,6,0.3635,0.2987,30.05,0.3657,0.3005,0.3398,0.3567,0.2999,0.3128,0.7603,0.5169,0.5743,194,132,146
-1928,7.5RP,6,8,0.3791,0.2929,30.05,0.3889,0.3005,0.3365,0.3799,0.2997,0.3098,0.8071,0.4923,0.5725,206,126,146
-1929,7.5RP,6,10,0.396,0.286,30.05,0.4161,0.3005,0.3341,0.407,0.2995,0.3076,0.8572,0.4615,0.5718,219,118,146
-1930,7.5RP,6,12,0.4125,0.2784,30.05,0.4452,0.3005,0.3336,0.4361,0.2992,0.3071,0.9065,0.4255,0.5729,231,109,146
-1931,7.5RP,6,14,0.4285,0.2705,30.05,0.476,0.3005,0.3344,0.4669,0.2989,0.3078,0.9546,0.3828,0.5752,243,98,147
-1932,7.5RP,6,16,0.4448,0.2622,30.05,0.5098,0.3005,0.3358,0.5005,0.2986,0.3091,1,0.3282,0.5782,255,84,147
-1933,7.5RP,6,18,0.4581,0.2549,30.05,0.5401,0.3005,0.3383,0.5307,0.2983,0.3114,1,0.2678,0.5819,255,68,148
-1934,7.5RP,6,20,0.4735,0.2464,30.05,0.5775,0.3005,0.3416,0.568,0.298,0.3144,1,0.1584,0.5867,255,40,150
-1935,10RP,7,2,0.3258,0.3148,43.06,0.4456,0.4306,0.4916,0.4328,0.4305,0.4525,0.7452,0.6703,0.676,190,171,172
-1936,10RP,7,4,0.3446,0.3125,43.06,0.4748,0.4306,0.4725,0.4622,0.4303,0.4349,0.8091,0.6479,0.6634,206,165,169
-1937,10RP,7,6,0.3648,0.3098,43.06,0.507,0.4306,0.4523,0.4946,0.4301,0.4163,0.8725,0.622,0.6498,222,159,166
-1938,10RP,7,8,0.3851,0.3067,43.06,0.5407,0.4306,0.4327,0.5284,0.4299,0.3982,0.9323,0.5934,0.6364,238,151,162
-1939,10RP,7,10,0.404,0.303,43.06,0.5741,0.4306,0.4164,0.562,0.4297,0.3832,0.9866,0.5632,0.6251,252,144,159
-1940,10RP,7,12,0.426,0.298,43.06,0.6156,0.4306,0.3988,0.6036,0.4294,0.367,1,0.5228,0.613,255,133,156
-1941,10RP,7,14,0.4456,0.2931,43.06,0.6546,0.4306,0.3839,0.6428,0.4291,0.3532,1,0.4808,0.6026,255,123,154
-1942,10RP,7,16,0.4648,0.2878,43.06,0.6954,0.4306,0.3702,0.6837,0.4288,0.3406,1,0.4314,0.5931,255,110,151
-1943,2.5R,7,2,0.3284,0.317,43.06,0.4461,0.4306,0.4817,0.4334,0.4305,0.4434,0.7493,0.6697,0.6689,191,171,171
-1944,2.5R,7,4,0.3499,0.3171,43.06,0.4751,0.4306,0.4522,0.4627,0.4304,0.4162,0.8155,0.647,0.6483,208,165,165
-1945,2.5R,7,6,0.3728,0.317,43.06,0.5064,0.4306,0.4214,0.4943,0.4303,0.3878,0.8793,0.6215,0.6259,224,158,160
-1946,2.5R,7,8,0.3961,0.316,43.06,0.5397,0.4306,0.3923,0.528,0.4301,0.361,0.9405,0.5928,0.604,240,151,154
-1947,2.5R,7,10,0.4183,0.3144,43.06,0.5729,0.4306,0.3661,0.5614,0.4299,0.3368,0.9958,0.5624,0.5835,254,143,149
-1948,2.5R,7,12,0.4435,0.3119,43.06,0.6123,0.4306,0.3377,0.6011,0.4297,0.3107,1,0.5235,0.5603,255,133,143
-1949,2.5R,7,14,0.466,0.3082,43.06,0.6511,0.4306,0.3155,0.6401,0.4294,0.2902,1,0.4816,0.5418,255,123,138
-1950,2.5R,7,16,0.4885,0.3039,43.06,0.6922,0.4306,0.2942,0.6814,0.4292,0.2705,1,0.4315,0.5234,255,110,133
-1951,5R,7,2,0.3306,0.319,43.06,0.4463,0.4306,0.473,0.4336,0.4306,0.4354,0.7524,0.6693,0.6626,192,171,169
-1952,5R,7,4,0.3552,0.3222,43.06,0.4747,0.4306,0.4311,0.4626,0.4305,0.3968,0.8206,0.6467,0.6321,209,165,161
-1953,5R,7,6,0.3805,0.3244,43.06,0.5051,0.4306,0.3917,0.4934,0.4304,0.3605,0.8847,0.6215,0.6018,226,158,153
-1954,5R,7,8,0.4067,0.3256,43.06,0.5379,0.4306,0.354,0.5266,0.4303,0.3257,0.9465,0.593,0.5711,241,151,146
-1955,5R,7,10,0.432,0.326,43.06,0.5706,0.4306,0.3196,0.5597,0.4302,0.294,1,0.5627,0.5412,255,143,138
-1956,5R,7,12,0.4595,0.3252,43.06,0.6084,0.4306,0.2851,0.5979,0.43,0.2622,1,0.5252,0.5092,255,134,130
-1957,5R,7,14,0.4848,0.3238,43.06,0.6447,0.4306,0.2545,0.6345,0.4298,0.234,1,0.4858,0.4789,255,124,122
-1958,7.5R,7,2,0.3335,0.322,43.06,0.446,0.4306,0.4607,0.4335,0.4306,0.424,0.7557,0.6691,0.6534,193,171,167
-1959,7.5R,7,4,0.3611,0.3282,43.06,0.4738,0.4306,0.4076,0.4619,0.4306,0.3751,0.8255,0.6467,0.6134,211,165,156
-1960,7.5R,7,6,0.3888,0.3336,43.06,0.5019,0.4306,0.3583,0.4906,0.4306,0.3297,0.8878,0.623,0.573,226,159,146
-1961,7.5R,7,8,0.4196,0.3382,43.06,0.5342,0.4306,0.3084,0.5236,0.4306,0.2836,0.9516,0.5944,0.5283,243,152,135
-1962,7.5R,7,10,0.447,0.3413,43.06,0.564,0.4306,0.2671,0.5538,0.4305,0.2456,1,0.5668,0.4874,255,145,124
-1963,7.5R,7,12,0.4777,0.3435,43.06,0.5988,0.4306,0.2241,0.5891,0.4304,0.206,1,0.5322,0.4401,255,136,112
-1964,7.5R,7,14,0.5059,0.345,43.06,0.6314,0.4306,0.1861,0.6221,0.4303,0.1709,1,0.4971,0.3923,255,127,100
-1965,7.5R,7,16,0.5341,0.3452,43.06,0.6662,0.4306,0.1506,0.6573,0.4301,0.1382,1,0.4561,0.3405,255,116,87
-1966,10R,7,2,0.336,0.3253,43.06,0.4448,0.4306,0.4483,0.4325,0.4307,0.4127,0.7571,0.6697,0.6441,193,171,164
-1967,10R,7,4,0.3671,0.336,43.06,0.4705,0.4306,0.3805,0.459,0.4308,0.3501,0.827,0.6483,0.5907,211,165,151
-1968,10R,7,6,0.3984,0.3452,43.06,0.497,0.4306,0.3198,0.4862,0.4308,0.2942,0.8894,0.6256,0.5373,227,160,137
-1969,10R,7,8,0.4308,0.3533,43.06,0.5251,0.4306,0.2631,0.515,0.4309,0.2419,0.9481,0.6006,0.4806,242,153,123
-1970,10R,7,10,0.46,0.3596,43.06,0.5508,0.4306,0.216,0.5413,0.4309,0.1985,0.9968,0.5766,0.4263,254,147,109
-1971,10R,7,12,0.493,0.3659,43.06,0.5802,0.4306,0.166,0.5712,0.4308,0.1525,1,0.5478,0.3576,255,140,91
-1972,10R,7,14,0.5234,0.37,43.06,0.6091,0.4306,0.1241,0.6007,0.4308,0.1137,1,0.5177,0.2845,255,132,73
-1973,10R,7,16,0.5519,0.3729,43.06,0.6373,0.4306,0.0868,0.6293,0.4307,0.0794,1,0.4862,0.1936,255,124,49
-1974,2.5YR,7,2,0.3392,0.3298,43.06,0.4429,0.4306,0.4322,0.4308,0.4308,0.3978,0.7582,0.6705,0.6315,193,171,161
-1975,2.5YR,7,4,0.3715,0.3439,43.06,0.4652,0.4306,0.3563,0.454,0.431,0.3279,0.824,0.6516,0.5693,210,166,145
-1976,2.5YR,7,6,0.4053,0.357,43.06,0.4889,0.4306,0.2867,0.4785,0.4311,0.2637,0.8843,0.631,0.5036,225,161,128
-1977,2.5YR,7,8,0.4371,0.3679,43.06,0.5116,0.4306,0.2282,0.502,0.4312,0.2098,0.9354,0.6106,0.4388,239,156,112
-1978,2.5YR,7,10,0.4671,0.3768,43.06,0.5338,0.4306,0.1784,0.5248,0.4312,0.1638,0.9804,0.5901,0.3725,250,150,95
-1979,2.5YR,7,12,0.5001,0.3861,43.06,0.5577,0.4306,0.1269,0.5494,0.4312,0.1164,1,0.5671,0.2842,255,145,72
-1980,2.5YR,7,14,0.5297,0.3938,43.06,0.5792,0.4306,0.0836,0.5713,0.4313,0.0765,1,0.5454,0.1707,255,139,44
-1984,5YR,7,2,0.3421,0.3349,43.06,0.4399,0.4306,0.4153,0.428,0.4309,0.3822,0.7573,0.6722,0.618,193,171,158
-1985,5YR,7,4,0.375,0.353,43.06,0.4574,0.4306,0.3318,0.4466,0.4312,0.3052,0.8166,0.6566,0.5464,208,167,139
-1986,5YR,7,6,0.4091,0.3701,43.06,0.476,0.4306,0.2569,0.4661,0.4314,0.2362,0.8701,0.6401,0.4704,222,163,120
-1987,5YR,7,8,0.4402,0.3842,43.06,0.4934,0.4306,0.1968,0.4842,0.4315,0.1808,0.9141,0.6244,0.396,233,159,101
-1988,5YR,7,10,0.4711,0.3972,43.06,0.5107,0.4306,0.1428,0.5022,0.4316,0.131,0.9541,0.6084,0.3102,243,155,79
-1989,5YR,7,12,0.5007,0.4081,43.06,0.5283,0.4306,0.0962,0.5204,0.4317,0.0881,0.9906,0.5919,0.203,253,151,52
-1994,7.5YR,7,2,0.3437,0.3397,43.06,0.4357,0.4306,0.4013,0.424,0.431,0.3693,0.753,0.6748,0.6064,192,172,155
-1995,7.5YR,7,4,0.3772,0.3613,43.06,0.4495,0.4306,0.3117,0.439,0.4313,0.2867,0.8075,0.6619,0.5266,206,169,134
-1996,7.5YR,7,6,0.4107,0.382,43.06,0.463,0.4306,0.2337,0.4534,0.4316,0.2148,0.8536,0.6493,0.442,218,166,113
-1997,7.5YR,7,8,0.4415,0.3996,43.06,0.4758,0.4306,0.1712,0.4669,0.4318,0.1572,0.8917,0.6374,0.356,227,163,91
-1998,7.5YR,7,10,0.4704,0.4151,43.06,0.488,0.4306,0.1188,0.4798,0.4319,0.1089,0.9244,0.6261,0.257,236,160,66
-1999,7.5YR,7,12,0.497,0.4282,43.06,0.4998,0.4306,0.0752,0.4922,0.432,0.0687,0.9531,0.615,0.1117,243,157,28
-2003,10YR,7,2,0.3443,0.3454,43.06,0.4292,0.4306,0.3868,0.4177,0.4311,0.356,0.7442,0.679,0.594,190,173,151
-2004,10YR,7,4,0.3778,0.3719,43.06,0.4374,0.4306,0.2898,0.4272,0.4315,0.2665,0.7906,0.6701,0.5037,202,171,128
-2005,10YR,7,6,0.4102,0.396,43.06,0.446,0.4306,0.2107,0.4368,0.4319,0.1937,0.8295,0.6613,0.4113,212,169,105
-2006,10YR,7,8,0.4399,0.4164,43.06,0.4549,0.4306,0.1486,0.4464,0.4321,0.1364,0.8621,0.6527,0.315,220,166,80
-2007,10YR,7,10,0.4667,0.4335,43.06,0.4636,0.4306,0.0991,0.4557,0.4323,0.0908,0.8897,0.6445,0.2002,227,164,51
-2012,2.5Y,7,2,0.3436,0.3507,43.06,0.4219,0.4306,0.3753,0.4106,0.4313,0.3454,0.7323,0.684,0.5838,187,174,149
-2013,2.5Y,7,4,0.3761,0.38,43.06,0.4262,0.4306,0.2764,0.4161,0.4317,0.2542,0.7724,0.6779,0.4887,197,173,125
-2014,2.5Y,7,6,0.4073,0.4073,43.06,0.4306,0.4306,0.196,0.4216,0.4321,0.1801,0.8049,0.6723,0.3896,205,171,99
-2015,2.5Y,7,8,0.4353,0.4312,43.06,0.4347,0.4306,0.1333,0.4265,0.4323,0.1223,0.8303,0.6673,0.2824,212,170,72
-2016,2.5Y,7,10,0.4606,0.4516,43.06,0.4392,0.4306,0.0837,0.4316,0.4326,0.0766,0.8518,0.6625,0.1369,217,169,35
-2020,5Y,7,2,0.3419,0.354,43.06,0.4159,0.4306,0.3699,0.4046,0.4313,0.3404,0.721,0.6881,0.5788,184,175,148
-2021,5Y,7,4,0.3718,0.3885,43.06,0.4121,0.4306,0.2657,0.4022,0.4319,0.2443,0.7468,0.6876,0.476,190,175,121
-2022,5Y,7,6,0.4009,0.4198,43.06,0.4112,0.4306,0.1839,0.4024,0.4323,0.1689,0.7706,0.6858,0.37,197,175,94
-2023,5Y,7,8,0.4271,0.4462,43.06,0.4122,0.4306,0.1223,0.4041,0.4326,0.1121,0.791,0.6833,0.2547,202,174,65
-2024,5Y,7,10,0.4509,0.4696,43.06,0.4135,0.4306,0.0729,0.406,0.4328,0.0666,0.8078,0.6809,0.0582,206,174,15
-2028,7.5Y,7,2,0.3396,0.3558,43.06,0.411,0.4306,0.3686,0.3998,0.4314,0.3392,0.7106,0.6915,0.5774,181,176,147
-2029,7.5Y,7,4,0.3677,0.3925,43.06,0.4034,0.4306,0.2631,0.3935,0.432,0.2419,0.7292,0.6937,0.4725,186,177,120
-2030,7.5Y,7,6,0.3943,0.4264,43.06,0.3982,0.4306,0.1811,0.3894,0.4325,0.1663,0.7446,0.6949,0.3644,190,177,93
-2031,7.5Y,7,8,0.4184,0.4568,43.06,0.3944,0.4306,0.1176,0.3864,0.4328,0.1079,0.7568,0.6957,0.2407,193,177,61
-2036,10Y,7,2,0.3369,0.3569,43.06,0.4065,0.4306,0.3694,0.3953,0.4314,0.3399,0.7001,0.6947,0.5779,179,177,147
-2037,10Y,7,4,0.3624,0.3951,43.06,0.395,0.4306,0.2643,0.3851,0.4321,0.243,0.7102,0.6996,0.4733,181,178,121
-2038,10Y,7,6,0.3864,0.4305,43.06,0.3865,0.4306,0.1831,0.3777,0.4325,0.1682,0.7188,0.7031,0.3665,183,179,93
-2039,10Y,7,8,0.409,0.4641,43.06,0.3795,0.4306,0.1177,0.3715,0.4329,0.1079,0.7252,0.706,0.2387,185,180,61
-2044,2.5GY,7,2,0.3328,0.3569,43.06,0.4015,0.4306,0.3744,0.3903,0.4315,0.3445,0.687,0.6982,0.5819,175,178,148
-2045,2.5GY,7,4,0.3534,0.3953,43.06,0.385,0.4306,0.2737,0.375,0.4321,0.2517,0.684,0.7067,0.4832,174,180,123
-2046,2.5GY,7,6,0.3728,0.4316,43.06,0.3719,0.4306,0.1951,0.363,0.4326,0.1793,0.6814,0.7133,0.3833,174,182,98
-2047,2.5GY,7,8,0.3919,0.4684,43.06,0.3603,0.4306,0.1284,0.3522,0.4331,0.1178,0.6778,0.7193,0.2619,173,183,67
-2048,2.5GY,7,10,0.4091,0.503,43.06,0.3502,0.4306,0.0752,0.3429,0.4334,0.0688,0.6731,0.7245,0.0435,172,185,11
-2052,5GY,7,2,0.3284,0.3559,43.06,0.3973,0.4306,0.382,0.386,0.4315,0.3515,0.6743,0.7014,0.5882,172,179,150
-2053,5GY,7,4,0.3437,0.3929,43.06,0.3767,0.4306,0.2887,0.3666,0.4321,0.2655,0.6586,0.7128,0.4988,168,182,127
-2054,5GY,7,6,0.3581,0.4291,43.06,0.3594,0.4306,0.2135,0.3502,0.4326,0.1963,0.6437,0.7223,0.4082,164,184,104
-2055,5GY,7,8,0.3722,0.4669,43.06,0.3433,0.4306,0.1484,0.335,0.4331,0.1362,0.6277,0.7311,0.3021,160,186,77
-2056,5GY,7,10,0.3852,0.5051,43.06,0.3284,0.4306,0.0935,0.3209,0.4335,0.0856,0.6102,0.7392,0.1514,156,188,39
-2060,7.5GY,7,2,0.319,0.3516,43.06,0.3907,0.4306,0.4034,0.3791,0.4314,0.3713,0.65,0.7065,0.6059,166,180,155
-2061,7.5GY,7,4,0.3267,0.3848,43.06,0.3656,0.4306,0.3228,0.355,0.432,0.297,0.6166,0.7212,0.5327,157,184,136
-2062,7.5GY,7,6,0.3341,0.4191,43.06,0.3433,0.4306,0.2536,0.3337,0.4326,0.2332,0.5838,0.7339,0.4575,149,187,117
-2063,7.5GY,7,8,0.3406,0.4558,43.06,0.3218,0.4306,0.1923,0.313,0.4331,0.1767,0.5472,0.7461,0.3748,140,190,96
-2064,7.5GY,7,10,0.3461,0.495,43.06,0.3011,0.4306,0.1382,0.293,0.4336,0.1268,0.5062,0.7577,0.2761,129,193,70
-2065,7.5GY,7,12,0.3502,0.5328,43.06,0.283,0.4306,0.0946,0.2756,0.4339,0.0866,0.4646,0.7677,0.1444,118,196,37
-2069,10GY,7,2,0.3117,0.3469,43.06,0.3869,0.4306,0.4238,0.375,0.4314,0.39,0.6325,0.7097,0.6223,161,181,159
-2070,10GY,7,4,0.3133,0.3764,43.06,0.3584,0.4306,0.355,0.3475,0.432,0.3266,0.5831,0.7268,0.5625,149,185,143
-2071,10GY,7,6,0.3142,0.4058,43.06,0.3334,0.4306,0.2971,0.3232,0.4325,0.2733,0.5336,0.7415,0.5049,136,189,129
-2072,10GY,7,8,0.314,0.4387,43.06,0.3082,0.4306,0.2427,0.2988,0.433,0.2232,0.4748,0.756,0.442,121,193,113
-2073,10GY,7,10,0.3123,0.4732,43.06,0.2842,0.4306,0.1952,0.2754,0.4334,0.1793,0.4057,0.7696,0.3757,103,196,96
-2074,10GY,7,12,0.3092,0.5095,43.06,0.2613,0.4306,0.1532,0.2531,0.4339,0.1407,0.3195,0.7824,0.3021,81,200,77
-2075,10GY,7,14,0.3047,0.5458,43.06,0.2404,0.4306,0.1179,0.2327,0.4342,0.1082,0.1987,0.7939,0.2171,51,202,55
-2080,2.5G,7,2,0.3047,0.3413,43.06,0.3844,0.4306,0.4466,0.3723,0.4313,0.4111,0.6167,0.712,0.64,157,182,163
-2081,2.5G,7,4,0.2992,0.3644,43.06,0.3536,0.4306,0.3975,0.3421,0.4318,0.3658,0.5491,0.7312,0.5992,140,186,153
-2082,2.5G,7,6,0.2933,0.3873,43.06,0.3261,0.4306,0.3551,0.3152,0.4323,0.3267,0.4778,0.7477,0.5608,122,191,143
-2083,2.5G,7,8,0.2861,0.4129,43.06,0.2984,0.4306,0.3139,0.2881,0.4327,0.2888,0.3876,0.764,0.52,99,195,133
-2084,2.5G,7,10,0.2775,0.4395,43.06,0.2719,0.4306,0.2773,0.2621,0.4331,0.255,0.2633,0.7792,0.4797,67,199,122
-2093,5G,7,2,0.3001,0.3366,43.06,0.3839,0.4306,0.4648,0.3715,0.4312,0.4278,0.6079,0.7129,0.6537,155,182,167
-2094,5G,7,4,0.2902,0.3548,43.06,0.3522,0.4306,0.4308,0.3403,0.4316,0.3965,0.5287,0.733,0.6262,135,187,160
-2095,5G,7,6,0.2801,0.3721,43.06,0.3241,0.4306,0.4025,0.3126,0.432,0.3704,0.4422,0.7502,0.6019,113,191,153
-2096,5G,7,8,0.2687,0.3901,43.06,0.2966,0.4306,0.3766,0.2855,0.4324,0.3466,0.3276,0.7667,0.5785,84,196,148
-2097,5G,7,10,0.2554,0.4087,43.06,0.2691,0.4306,0.3539,0.2583,0.4328,0.3256,0.0964,0.7828,0.5567,25,200,142
-2106,7.5G,7,2,0.2972,0.3333,43.06,0.384,0.4306,0.4774,0.3714,0.4311,0.4394,0.6027,0.7132,0.6631,154,182,169
-2107,7.5G,7,4,0.285,0.3482,43.06,0.3524,0.4306,0.4536,0.3402,0.4315,0.4175,0.518,0.7334,0.6439,132,187,164
-2108,7.5G,7,6,0.2728,0.3622,43.06,0.3243,0.4306,0.4339,0.3124,0.4319,0.3994,0.4228,0.7509,0.6274,108,191,160
-2109,7.5G,7,8,0.2595,0.3764,43.06,0.2969,0.4306,0.4165,0.2853,0.4322,0.3834,0.2909,0.7675,0.6122,74,196,156
-2119,10G,7,2,0.2945,0.3297,43.06,0.3846,0.4306,0.4908,0.3719,0.431,0.4518,0.5989,0.7131,0.6729,153,182,172
-2120,10G,7,4,0.2803,0.3415,43.06,0.3534,0.4306,0.4769,0.3409,0.4314,0.439,0.5094,0.7334,0.6614,130,187,169
-2121,10G,7,6,0.2662,0.3526,43.06,0.3251,0.4306,0.4655,0.3128,0.4317,0.4285,0.4049,0.7513,0.6517,103,192,166
-2122,10G,7,8,0.2513,0.3635,43.06,0.2977,0.4306,0.4563,0.2856,0.432,0.42,0.2525,0.7681,0.6435,64,196,164
-2131,2.5BG,7,2,0.2927,0.3269,43.06,0.3856,0.4306,0.5011,0.3727,0.431,0.4613,0.5971,0.7128,0.6803,152,182,173
-2132,2.5BG,7,4,0.2764,0.3354,43.06,0.3549,0.4306,0.4984,0.3421,0.4313,0.4588,0.503,0.7331,0.6771,128,187,173
-2133,2.5BG,7,6,0.2608,0.343,43.06,0.3274,0.4306,0.4974,0.3147,0.4315,0.4579,0.3932,0.7507,0.6752,100,191,172
-2134,2.5BG,7,8,0.2439,0.3508,43.06,0.2994,0.4306,0.4975,0.2867,0.4318,0.458,0.2122,0.7681,0.6741,54,196,172
-2142,5BG,7,2,0.2898,0.3225,43.06,0.3869,0.4306,0.5177,0.3739,0.4309,0.4766,0.594,0.7124,0.692,151,182,176
-2143,5BG,7,4,0.2712,0.3269,43.06,0.3572,0.4306,0.5294,0.3441,0.4311,0.4874,0.4948,0.7324,0.6989,126,187,178
-2144,5BG,7,6,0.2543,0.3302,43.06,0.3316,0.4306,0.5418,0.3183,0.4313,0.4989,0.3809,0.7492,0.7063,97,191,180
-2145,5BG,7,8,0.2354,0.3335,43.06,0.3039,0.4306,0.5566,0.2905,0.4315,0.5125,0.1627,0.7668,0.7151,41,196,182
-2152,7.5BG,7,2,0.2878,0.3182,43.06,0.3895,0.4306,0.5332,0.3762,0.4308,0.4909,0.5944,0.7111,0.7027,152,181,179
-2153,7.5BG,7,4,0.2671,0.3189,43.06,0.3607,0.4306,0.559,0.3471,0.4309,0.5147,0.4909,0.731,0.7189,125,186,183
-2154,7.5BG,7,6,0.249,0.3186,43.06,0.3365,0.4306,0.5844,0.3227,0.431,0.5381,0.3732,0.7472,0.7346,95,191,187
-2155,7.5BG,7,8,0.2292,0.3178,43.06,0.3106,0.4306,0.6138,0.2964,0.4311,0.5652,0.133,0.7642,0.7522,34,195,192
-2161,10BG,7,2,0.2869,0.3143,43.06,0.3931,0.4306,0.5464,0.3796,0.4307,0.503,0.5989,0.709,0.7118,153,181,182
-2162,10BG,7,4,0.2642,0.3109,43.06,0.3659,0.4306,0.5885,0.352,0.4307,0.5419,0.4937,0.7283,0.7383,126,186,188
-2163,10BG,7,6,0.2448,0.3069,43.06,0.3435,0.4306,0.629,0.329,0.4307,0.5792,0.374,0.744,0.7628,95,190,195
-2164,10BG,7,8,0.2235,0.3014,43.06,0.3193,0.4306,0.6788,0.3043,0.4307,0.6251,0.1138,0.7605,0.7916,29,194,202
-2169,2.5B,7,2,0.2867,0.311,43.06,0.397,0.4306,0.557,0.3833,0.4306,0.5128,0.6052,0.7067,0.719,154,180,183
-2170,2.5B,7,4,0.2629,0.3038,43.06,0.3726,0.4306,0.6142,0.3583,0.4305,0.5655,0.5036,0.7246,0.7547,128,185,192
-2171,2.5B,7,6,0.2418,0.296,43.06,0.3518,0.4306,0.6724,0.3368,0.4304,0.6192,0.3824,0.7398,0.789,98,189,201
-2172,2.5B,7,8,0.2208,0.2871,43.06,0.3312,0.4306,0.7381,0.3154,0.4303,0.6797,0.1582,0.7547,0.8257,40,192,211
-2177,5B,7,2,0.2875,0.3078,43.06,0.4022,0.4306,0.5662,0.3885,0.4305,0.5213,0.6157,0.7033,0.7252,157,179,185
-2178,5B,7,4,0.2633,0.2972,43.06,0.3815,0.4306,0.6368,0.3669,0.4303,0.5864,0.5221,0.7194,0.7689,133,183,196
-2179,5B,7,6,0.241,0.2854,43.06,0.3636,0.4306,0.7145,0.348,0.4301,0.658,0.408,0.7333,0.8136,104,187,207
-2180,5B,7,8,0.2204,0.2729,43.06,0.3478,0.4306,0.7995,0.3311,0.4298,0.7364,0.2352,0.7458,0.8592,60,190,219
-2184,7.5B,7,2,0.2888,0.3058,43.06,0.4067,0.4306,0.5708,0.3929,0.4304,0.5256,0.6257,0.7004,0.7285,160,179,186
-2185,7.5B,7,4,0.2651,0.2927,43.06,0.39,0.4306,0.6505,0.3752,0.4302,0.599,0.5429,0.7141,0.7775,138,182,198
-2186,7.5B,7,6,0.2436,0.2787,43.06,0.3764,0.4306,0.7381,0.3605,0.4299,0.6797,0.4473,0.7256,0.8271,114,185,211
-2187,7.5B,7,8,0.2225,0.2631,43.06,0.3642,0.4306,0.8419,0.347,0.4295,0.7754,0.3084,0.7364,0.8815,79,188,225
-2190,10B,7,2,0.2908,0.3039,43.06,0.412,0.4306,0.5743,0.3982,0.4304,0.5287,0.6383,0.6968,0.7309,163,178,186
-2191,10B,7,4,0.2685,0.2886,43.06,0.4006,0.4306,0.6608,0.3857,0.43,0.6085,0.5706,0.7072,0.7839,146,180,200
-2192,10B,7,6,0.2478,0.2728,43.06,0.3911,0.4306,0.7567,0.375,0.4297,0.6969,0.4925,0.7163,0.8378,126,183,214
-2193,10B,7,8,0.2277,0.2559,43.06,0.3831,0.4306,0.8689,0.3656,0.4292,0.8004,0.3898,0.7248,0.8956,99,185,228
-2194,10B,7,10,0.2078,0.2382,43.06,0.3756,0.4306,1.0015,0.3564,0.4286,0.9225,0.2093,0.7333,0.9582,53,187,244
-2196,2.5PB,7,2,0.2932,0.3025,43.06,0.4174,0.4306,0.5755,0.4035,0.4303,0.5299,0.6514,0.6931,0.7319,166,177,187
-2197,2.5PB,7,4,0.2729,0.2848,43.06,0.4126,0.4306,0.6687,0.3975,0.4299,0.6158,0.6016,0.6991,0.789,153,178,201
-2198,2.5PB,7,6,0.2538,0.2677,43.06,0.4082,0.4306,0.7697,0.3919,0.4294,0.7089,0.5433,0.7051,0.8453,139,180,216
-2199,2.5PB,7,8,0.2352,0.2498,43.06,0.4054,0.4306,0.8877,0.3876,0.4289,0.8177,0.4719,0.7104,0.9055,120,181,231
-2200,2.5PB,7,10,0.2162,0.2309,43.06,0.4032,0.4306,1.0311,0.3835,0.4282,0.9498,0.367,0.7159,0.9722,94,183,248
-2201,5PB,7,2,0.2952,0.3011,43.06,0.4222,0.4306,0.5773,0.4082,0.4303,0.5316,0.6626,0.6898,0.7333,169,176,187
-2202,5PB,7,4,0.2773,0.2828,43.06,0.4222,0.4306,0.6698,0.4071,0.4298,0.6168,0.6271,0.6925,0.79,160,177,201
-2203,5PB,7,6,0.2596,0.2643,43.06,0.4229,0.4306,0.7757,0.4065,0.4293,0.7144,0.5849,0.6951,0.849,149,177,216
-2204,5PB,7,8,0.2427,0.2458,43.06,0.4252,0.4306,0.8961,0.4072,0.4287,0.8253,0.5361,0.6971,0.9101,137,178,232
-2205,5PB,7,10,0.2254,0.2267,43.06,0.4281,0.4306,1.0407,0.4083,0.4279,0.9587,0.4699,0.6992,0.9771,120,178,249
-2206,7.5PB,7,2,0.2982,0.3003,43.06,0.4276,0.4306,0.5757,0.4137,0.4302,0.5301,0.6763,0.6859,0.7324,172,175,187
-2207,7.5PB,7,4,0.2833,0.2809,43.06,0.4343,0.4306,0.6681,0.4192,0.4297,0.6152,0.6585,0.6839,0.7893,168,174,201
-2208,7.5PB,7,6,0.2687,0.2612,43.06,0.443,0.4306,0.775,0.4265,0.4291,0.7137,0.6395,0.6809,0.8492,163,174,217
-2209,7.5PB,7,8,0.2546,0.2418,43.06,0.4534,0.4306,0.8968,0.4353,0.4284,0.826,0.6183,0.6771,0.9113,158,173,232
-2210,7.5PB,7,10,0.241,0.2224,43.06,0.4666,0.4306,1.0389,0.4467,0.4276,0.957,0.5953,0.6718,0.9773,152,171,249
-2211,10PB,7,2,0.3005,0.3,43.06,0.4313,0.4306,0.5734,0.4174,0.4302,0.528,0.6859,0.6832,0.7311,175,174,186
-2212,10PB,7,4,0.2886,0.2801,43.06,0.4437,0.4306,0.663,0.4286,0.4296,0.6106,0.6829,0.677,0.7867,174,173,201
-2213,10PB,7,6,0.2776,0.2612,43.06,0.4576,0.4306,0.7603,0.4413,0.429,0.7002,0.681,0.6698,0.8418,174,171,215
-2214,10PB,7,8,0.267,0.2425,43.06,0.4741,0.4306,0.871,0.4563,0.4283,0.8022,0.6802,0.6611,0.8993,173,169,229
-2215,10PB,7,10,0.2563,0.224,43.06,0.4927,0.4306,0.999,0.4732,0.4275,0.9203,0.6782,0.6512,0.9602,173,166,245
-2216,10PB,7,12,0.2465,0.2058,43.06,0.5158,0.4306,1.146,0.4944,0.4266,1.0557,0.6799,0.6382,1,173,163,255
-2217,2.5P,7,2,0.3031,0.3,43.06,0.435,0.4306,0.5697,0.4212,0.4302,0.5245,0.6959,0.6804,0.7288,177,174,186
-2218,2.5P,7,4,0.295,0.281,43.06,0.4521,0.4306,0.6497,0.4372,0.4296,0.5983,0.7069,0.6705,0.7792,180,171,199
-2219,2.5P,7,6,0.2873,0.2633,43.06,0.4698,0.4306,0.7349,0.4538,0.429,0.6768,0.7177,0.66,0.8284,183,168,211
-2220,2.5P,7,8,0.2799,0.2459,43.06,0.4901,0.4306,0.8304,0.4729,0.4284,0.7648,0.7304,0.6477,0.8794,186,165,224
-2221,2.5P,7,10,0.2729,0.2289,43.06,0.5134,0.4306,0.9372,0.4947,0.4276,0.8633,0.7453,0.6332,0.9323,190,161,238
-2222,2.5P,7,12,0.2664,0.2127,43.06,0.5393,0.4306,1.0545,0.5191,0.4268,0.9714,0.7621,0.6164,0.9861,194,157,251
-2223,5P,7,2,0.3059,0.301,43.06,0.4376,0.4306,0.5624,0.4239,0.4302,0.5178,0.7043,0.6783,0.7241,180,173,185
-2224,5P,7,4,0.3009,0.2831,43.06,0.4577,0.4306,0.6327,0.443,0.4297,0.5826,0.7251,0.6659,0.7692,185,170,196
-2225,5P,7,6,0.2961,0.2663,43.06,0.4788,0.4306,0.7076,0.4631,0.4291,0.6516,0.7459,0.6524,0.8135,190,166,207
-2226,5P,7,8,0.2918,0.2504,43.06,0.5018,0.4306,0.7873,0.485,0.4285,0.725,0.7684,0.6373,0.8575,196,163,219
-2227,5P,7,10,0.2872,0.2343,43.06,0.5278,0.4306,0.8794,0.5098,0.4278,0.81,0.7922,0.6197,0.905,202,158,231
-2228,5P,7,12,0.2833,0.2197,43.06,0.5553,0.4306,0.9741,0.536,0.4271,0.8973,0.817,0.6004,0.9505,208,153,242
-2229,5P,7,14,0.2801,0.2068,43.06,0.5832,0.4306,1.0684,0.5627,0.4263,0.9842,0.842,0.5797,0.9932,215,148,253
-2230,7.5P,7,2,0.3109,0.3037,43.06,0.4408,0.4306,0.5464,0.4273,0.4302,0.5031,0.7168,0.6755,0.7137,183,172,182
-2231,7.5P,7,4,0.3111,0.288,43.06,0.4651,0.4306,0.5994,0.4509,0.4298,0.5519,0.7518,0.6593,0.7489,192,168,191
-2232,7.5P,7,6,0.3111,0.273,43.06,0.4907,0.4306,0.656,0.4756,0.4292,0.6041,0.786,0.6417,0.7842,200,164,200
-2233,7.5P,7,8,0.3109,0.2584,43.06,0.5181,0.4306,0.7177,0.5022,0.4287,0.661,0.8203,0.6221,0.8205,209,159,209
-2234,7.5P,7,10,0.3108,0.2442,43.06,0.548,0.4306,0.7847,0.5312,0.4281,0.7227,0.856,0.5997,0.8576,218,153,219
-2235,7.5P,7,12,0.3104,0.232,43.06,0.5761,0.4306,0.8493,0.5584,0.4275,0.7823,0.8873,0.5778,0.8915,226,147,227
-2236,7.5P,7,14,0.3101,0.2192,43.06,0.6092,0.4306,0.9247,0.5904,0.4268,0.8517,0.9225,0.5506,0.929,235,140,237
-2237,7.5P,7,16,0.3099,0.2074,43.06,0.6434,0.4306,1.0022,0.6236,0.4261,0.9231,0.9573,0.5203,0.9656,244,133,246
-2238,7.5P,7,18,0.3093,0.1962,43.06,0.6788,0.4306,1.0853,0.6579,0.4254,0.9997,0.991,0.4867,1,253,124,255
-2239,10P,7,2,0.3138,0.3054,43.06,0.4424,0.4306,0.5369,0.429,0.4303,0.4943,0.7236,0.6741,0.7074,185,172,180
-2240,10P,7,4,0.3181,0.292,43.06,0.4691,0.4306,0.575,0.4551,0.4298,0.5294,0.7675,0.6556,0.7335,196,167,187
-2241,10P,7,6,0.3221,0.2786,43.06,0.4978,0.4306,0.6172,0.4833,0.4294,0.5683,0.811,0.6348,0.7611,207,162,194
-2242,10P,7,8,0.3256,0.2654,43.06,0.5283,0.4306,0.6636,0.5131,0.4289,0.6111,0.8536,0.612,0.79,218,156,201
-2243,10P,7,10,0.3288,0.2531,43.06,0.5594,0.4306,0.7113,0.5435,0.4283,0.655,0.8943,0.5874,0.8183,228,150,209
-2244,10P,7,12,0.3314,0.2423,43.06,0.5889,0.4306,0.7576,0.5724,0.4278,0.6977,0.9306,0.5628,0.8445,237,144,215
-2245,10P,7,14,0.3341,0.2308,43.06,0.6233,0.4306,0.8118,0.606,0.4272,0.7476,0.9706,0.5324,0.8739,248,136,223
-2246,10P,7,16,0.3368,0.2192,43.06,0.6616,0.4306,0.8722,0.6435,0.4266,0.8033,1,0.4957,0.9053,255,126,231
-2247,10P,7,18,0.3391,0.2088,43.06,0.6993,0.4306,0.9323,0.6803,0.4259,0.8588,1,0.4558,0.9351,255,116,238
-2248,10P,7,20,0.341,0.1988,43.06,0.7386,0.4306,0.9968,0.7187,0.4253,0.9182,1,0.4092,0.9657,255,104,246
-2249,10P,7,22,0.343,0.1883,43.06,0.7844,0.4306,1.0718,0.7634,0.4245,0.9873,1,0.3449,0.9998,255,88,255
-2250,2.5RP,7,2,0.317,0.3076,43.06,0.4438,0.4306,0.5255,0.4305,0.4303,0.4838,0.7302,0.6728,0.6997,186,172,178
-2251,2.5RP,7,4,0.3254,0.2971,43.06,0.4716,0.4306,0.5471,0.458,0.43,0.5037,0.781,0.6528,0.7154,199,166,182
-2252,2.5RP,7,6,0.3338,0.2854,43.06,0.5036,0.4306,0.5745,0.4896,0.4295,0.529,0.8337,0.6288,0.7345,213,160,187
-2253,2.5RP,7,8,0.3417,0.2745,43.06,0.536,0.4306,0.6021,0.5216,0.4291,0.5543,0.883,0.6034,0.7532,225,154,192
-2254,2.5RP,7,10,0.3487,0.2648,43.06,0.567,0.4306,0.6285,0.5522,0.4287,0.5787,0.927,0.5776,0.7705,236,147,196
-2255,2.5RP,7,12,0.3555,0.2545,43.06,0.6015,0.4306,0.6599,0.5862,0.4282,0.6076,0.9724,0.5473,0.7903,248,140,202
-2256,2.5RP,7,14,0.362,0.2448,43.06,0.6368,0.4306,0.6916,0.621,0.4277,0.6369,1,0.5138,0.8098,255,131,206
-2257,2.5RP,7,16,0.3688,0.2342,43.06,0.6781,0.4306,0.7299,0.6617,0.4271,0.6722,1,0.4707,0.8324,255,120,212
-2258,2.5RP,7,18,0.3751,0.2241,43.06,0.7207,0.4306,0.7701,0.7038,0.4265,0.7092,1,0.4204,0.8553,255,107,218
-2259,2.5RP,7,20,0.3811,0.2143,43.06,0.7658,0.4306,0.813,0.7482,0.4259,0.7487,1,0.3576,0.8788,255,91,224
-2260,5RP,7,2,0.3206,0.3104,43.06,0.4447,0.4306,0.5119,0.4316,0.4304,0.4712,0.7368,0.6716,0.6903,188,171,176
-2261,5RP,7,4,0.3332,0.3032,43.06,0.4732,0.4306,0.5164,0.46,0.4301,0.4754,0.7932,0.6506,0.6946,202,166,177
-2262,5RP,7,6,0.347,0.2949,43.06,0.5067,0.4306,0.5229,0.4933,0.4298,0.4814,0.8532,0.6247,0.7004,218,159,179
-2263,5RP,7,8,0.3603,0.2869,43.06,0.5408,0.4306,0.5295,0.5272,0.4294,0.4875,0.9091,0.5968,0.7063,232,152,180
-2264,5RP,7,10,0.3713,0.2798,43.06,0.5714,0.4306,0.5369,0.5577,0.4291,0.4943,0.9553,0.5703,0.7125,244,145,182
-2265,5RP,7,12,0.3841,0.271,43.06,0.6103,0.4306,0.548,0.5964,0.4287,0.5045,1,0.5343,0.7214,255,136,184
-2266,5RP,7,14,0.3958,0.2628,43.06,0.6485,0.4306,0.5594,0.6344,0.4283,0.515,1,0.4956,0.7303,255,126,186
-2267,5RP,7,16,0.4076,0.254,43.06,0.691,0.4306,0.5737,0.6766,0.4278,0.5282,1,0.4477,0.7411,255,114,189
-2268,5RP,7,18,0.4186,0.2459,43.06,0.733,0.4306,0.5875,0.7184,0.4273,0.5409,1,0.3929,0.7513,255,100,192
-2269,7.5RP,7,2,0.3232,0.3125,43.06,0.4453,0.4306,0.502,0.4324,0.4304,0.4621,0.7413,0.6709,0.6834,189,171,174
-2270,7.5RP,7,4,0.3389,0.3079,43.06,0.474,0.4306,0.494,0.461,0.4302,0.4547,0.8012,0.6493,0.6789,204,166,173
-2271,7.5RP,7,6,0.3562,0.3022,43.06,0.5075,0.4306,0.4867,0.4946,0.4299,0.4481,0.8643,0.6228,0.6752,220,159,172
-2272,7.5RP,7,8,0.3722,0.2963,43.06,0.5409,0.4306,0.4818,0.528,0.4296,0.4435,0.9209,0.595,0.673,235,152,172
-2273,7.5RP,7,10,0.3871,0.2906,43.06,0.5736,0.4306,0.4776,0.5607,0.4294,0.4396,0.9721,0.5661,0.6714,248,144,171
-2274,7.5RP,7,12,0.404,0.2834,43.06,0.6138,0.4306,0.475,0.6009,0.429,0.4372,1,0.5278,0.6712,255,135,171
-2275,7.5RP,7,14,0.4195,0.2762,43.06,0.654,0.4306,0.4744,0.641,0.4286,0.4367,1,0.4857,0.6725,255,124,171
-2276,7.5RP,7,16,0.4346,0.2689,43.06,0.6959,0.4306,0.4748,0.6828,0.4282,0.437,1,0.4364,0.6746,255,111,172
-2277,10RP,8,2,0.3218,0.3152,59.1,0.6034,0.591,0.6806,0.5857,0.5909,0.6266,0.8419,0.7778,0.7824,215,198,200
-2278,10RP,8,4,0.3412,0.3135,59.1,0.6432,0.591,0.6509,0.6258,0.5906,0.5992,0.9169,0.7525,0.7659,234,192,195
-2279,10RP,8,6,0.36,0.3112,59.1,0.6837,0.591,0.6244,0.6665,0.5904,0.5747,0.9848,0.7257,0.7511,251,185,192
-2280,10RP,8,8,0.38,0.3082,59.1,0.7287,0.591,0.5979,0.7118,0.5901,0.5503,1,0.6944,0.736,255,177,188
-2281,10RP,8,10,0.3983,0.3049,59.1,0.772,0.591,0.5753,0.7554,0.5898,0.5295,1,0.6625,0.723,255,169,184
-2282,2.5R,8,2,0.3236,0.3169,59.1,0.6035,0.591,0.6704,0.5859,0.5909,0.6172,0.8448,0.7775,0.7763,215,198,198
-2283,2.5R,8,4,0.346,0.3177,59.1,0.6436,0.591,0.6256,0.6266,0.5908,0.5758,0.9237,0.7516,0.7503,236,192,191
-2284,2.5R,8,6,0.3671,0.3175,59.1,0.6833,0.591,0.5871,0.6667,0.5906,0.5403,0.9925,0.7249,0.7272,253,185,185
-2285,2.5R,8,8,0.39,0.3171,59.1,0.7269,0.591,0.5459,0.7107,0.5904,0.5024,1,0.6942,0.7015,255,177,179
-2286,2.5R,8,10,0.4125,0.316,59.1,0.7715,0.591,0.5078,0.7557,0.5902,0.4672,1,0.6608,0.6767,255,169,173
-2287,5R,8,2,0.3254,0.3186,59.1,0.6036,0.591,0.6604,0.5862,0.591,0.6079,0.8478,0.7771,0.7702,216,198,196
-2288,5R,8,4,0.351,0.3224,59.1,0.6434,0.591,0.5987,0.6267,0.5909,0.551,0.9299,0.751,0.7332,237,192,187
-2289,5R,8,6,0.3743,0.3248,59.1,0.6811,0.591,0.5475,0.6649,0.5908,0.5039,0.9979,0.7253,0.7008,254,185,179
-2290,5R,8,8,0.4001,0.3263,59.1,0.7247,0.591,0.4955,0.7091,0.5907,0.4559,1,0.6942,0.6659,255,177,170
-2291,5R,8,10,0.4249,0.327,59.1,0.7679,0.591,0.4484,0.7529,0.5905,0.4125,1,0.6616,0.6322,255,169,161
-2292,7.5R,8,2,0.3277,0.3211,59.1,0.6031,0.591,0.6464,0.5859,0.591,0.595,0.8507,0.7771,0.7617,217,198,194
-2293,7.5R,8,4,0.3564,0.3279,59.1,0.6424,0.591,0.569,0.626,0.5911,0.5237,0.9353,0.7509,0.7137,239,191,182
-2294,7.5R,8,6,0.383,0.3335,59.1,0.6787,0.591,0.5024,0.6632,0.5911,0.4623,1,0.7256,0.6689,255,185,171
-2295,7.5R,8,8,0.4118,0.3385,59.1,0.719,0.591,0.436,0.7042,0.591,0.401,1,0.6964,0.6201,255,178,158
-2296,7.5R,8,10,0.4388,0.3419,59.1,0.7585,0.591,0.3791,0.7444,0.5909,0.3486,1,0.6664,0.5743,255,170,146
-2297,10R,8,2,0.3301,0.3237,59.1,0.6027,0.591,0.6321,0.5856,0.5911,0.5818,0.8537,0.777,0.7529,218,198,192
-2298,10R,8,4,0.3621,0.3349,59.1,0.639,0.591,0.5347,0.6231,0.5913,0.4921,0.9381,0.7521,0.6902,239,192,176
-2299,10R,8,6,0.391,0.3442,59.1,0.6714,0.591,0.4547,0.6564,0.5914,0.4183,1,0.7291,0.6327,255,186,161
-2300,10R,8,8,0.4212,0.3526,59.1,0.706,0.591,0.3791,0.692,0.5914,0.3487,1,0.7038,0.5716,255,179,146
-2301,10R,8,10,0.449,0.3589,59.1,0.7394,0.591,0.3163,0.7261,0.5914,0.2908,1,0.6785,0.5139,255,173,131
-2302,2.5YR,8,2,0.3334,0.3276,59.1,0.6015,0.591,0.6116,0.5846,0.5912,0.5629,0.8571,0.7772,0.7399,219,198,189
-2303,2.5YR,8,4,0.3667,0.3429,59.1,0.632,0.591,0.5005,0.6166,0.5915,0.4605,0.9353,0.7556,0.6655,239,193,170
-2304,2.5YR,8,6,0.396,0.3547,59.1,0.6598,0.591,0.4154,0.6454,0.5917,0.3821,0.9963,0.7356,0.6005,254,188,153
-2305,2.5YR,8,8,0.4275,0.3662,59.1,0.6899,0.591,0.3329,0.6765,0.5918,0.3061,1,0.7134,0.5276,255,182,135
-2306,2.5YR,8,10,0.4552,0.3761,59.1,0.7153,0.591,0.2651,0.7027,0.5919,0.2435,1,0.694,0.4563,255,177,116
-2307,2.5YR,8,12,0.4852,0.3847,59.1,0.7454,0.591,0.1999,0.7336,0.5919,0.1834,1,0.6705,0.3718,255,171,95
-2308,5YR,8,2,0.3373,0.333,59.1,0.5986,0.591,0.5851,0.5822,0.5914,0.5385,0.8591,0.7782,0.7227,219,198,184
-2309,5YR,8,4,0.369,0.351,59.1,0.6213,0.591,0.4715,0.6063,0.5917,0.4338,0.9255,0.7615,0.6434,236,194,164
-2310,5YR,8,6,0.3988,0.3663,59.1,0.6434,0.591,0.379,0.6295,0.592,0.3485,0.9805,0.7451,0.5682,250,190,145
-2311,5YR,8,8,0.431,0.382,59.1,0.6668,0.591,0.2893,0.654,0.5922,0.2659,1,0.7275,0.4807,255,186,123
-2312,5YR,8,10,0.4576,0.3938,59.1,0.6867,0.591,0.223,0.6748,0.5924,0.2047,1,0.7124,0.4004,255,182,102
-2313,5YR,8,12,0.4849,0.405,59.1,0.7076,0.591,0.1607,0.6964,0.5925,0.1473,1,0.6963,0.3007,255,178,77
-2314,5YR,8,14,0.5088,0.4145,59.1,0.7255,0.591,0.1094,0.7148,0.5926,0.1,1,0.6822,0.1704,255,174,43
-2315,7.5YR,8,2,0.3395,0.3379,59.1,0.5938,0.591,0.5642,0.5776,0.5915,0.5193,0.8562,0.7806,0.7086,218,199,181
-2316,7.5YR,8,4,0.3699,0.3586,59.1,0.6096,0.591,0.4475,0.5949,0.592,0.4116,0.9126,0.768,0.6241,233,196,159
-2317,7.5YR,8,6,0.4,0.377,59.1,0.6271,0.591,0.3496,0.6136,0.5923,0.3214,0.9628,0.7547,0.5401,246,192,138
-2318,7.5YR,8,8,0.4306,0.3952,59.1,0.6439,0.591,0.2605,0.6315,0.5926,0.2393,1,0.7416,0.4458,255,189,114
-2319,7.5YR,8,10,0.4568,0.41,59.1,0.6585,0.591,0.192,0.6469,0.5928,0.1762,1,0.7303,0.3514,255,186,90
-2320,7.5YR,8,12,0.4816,0.4232,59.1,0.6726,0.591,0.1329,0.6617,0.5929,0.1217,1,0.7194,0.2336,255,183,60
-2325,10YR,8,2,0.3407,0.3434,59.1,0.5864,0.591,0.5437,0.5704,0.5917,0.5003,0.8486,0.7845,0.6943,216,200,177
-2326,10YR,8,4,0.3701,0.3674,59.1,0.5953,0.591,0.4223,0.581,0.5922,0.3884,0.8956,0.7761,0.603,228,198,154
-2327,10YR,8,6,0.3994,0.3896,59.1,0.6059,0.591,0.3201,0.5928,0.5926,0.2942,0.9373,0.7671,0.5097,239,196,130
-2328,10YR,8,8,0.428,0.4102,59.1,0.6166,0.591,0.2331,0.6047,0.593,0.2141,0.9737,0.7581,0.4086,248,193,104
-2329,10YR,8,10,0.4527,0.4268,59.1,0.6269,0.591,0.1669,0.6157,0.5932,0.153,1,0.75,0.3035,255,191,77
-2330,10YR,8,12,0.4753,0.4414,59.1,0.6364,0.591,0.1115,0.6259,0.5934,0.102,1,0.7424,0.1585,255,189,40
-2335,2.5Y,8,2,0.3406,0.3484,59.1,0.5778,0.591,0.5276,0.5621,0.5919,0.4855,0.8376,0.7892,0.6827,214,201,174
-2336,2.5Y,8,4,0.3684,0.3751,59.1,0.5804,0.591,0.4041,0.5663,0.5925,0.3717,0.8752,0.7846,0.587,223,200,150
-2337,2.5Y,8,6,0.3969,0.4009,59.1,0.5851,0.591,0.2981,0.5723,0.5929,0.274,0.9097,0.7791,0.4851,232,199,124
-2338,2.5Y,8,8,0.4231,0.4231,59.1,0.591,0.591,0.2148,0.5793,0.5933,0.1972,0.939,0.7734,0.3806,239,197,97
-2339,2.5Y,8,10,0.4469,0.4423,59.1,0.5971,0.591,0.1481,0.5863,0.5936,0.1357,0.9639,0.768,0.26,246,196,66
-2340,2.5Y,8,12,0.4678,0.4589,59.1,0.6025,0.591,0.0944,0.5923,0.5938,0.0862,0.9838,0.7633,0.0384,251,195,10
-2345,5Y,8,2,0.3394,0.3518,59.1,0.5702,0.591,0.5188,0.5546,0.592,0.4774,0.8262,0.7935,0.6761,211,202,172
-2346,5Y,8,4,0.365,0.3826,59.1,0.5638,0.591,0.3899,0.5499,0.5927,0.3586,0.8501,0.794,0.5737,217,202,146
-2347,5Y,8,6,0.3913,0.4117,59.1,0.5617,0.591,0.2828,0.5492,0.5932,0.2599,0.8747,0.7926,0.4664,223,202,119
-2348,5Y,8,8,0.4158,0.4378,59.1,0.5613,0.591,0.1976,0.5499,0.5937,0.1814,0.8957,0.7908,0.3512,228,202,90
-2349,5Y,8,10,0.4376,0.4601,59.1,0.5621,0.591,0.1314,0.5515,0.594,0.1203,0.9134,0.7887,0.2113,233,201,54
-2354,7.5Y,8,2,0.3379,0.354,59.1,0.5641,0.591,0.5144,0.5486,0.5921,0.4733,0.8163,0.7969,0.6727,208,203,172
-2355,7.5Y,8,4,0.3622,0.3861,59.1,0.5544,0.591,0.3853,0.5406,0.5928,0.3543,0.8345,0.7994,0.5691,213,204,145
-2356,7.5Y,8,6,0.3862,0.4175,59.1,0.5467,0.591,0.2779,0.5343,0.5934,0.2553,0.8499,0.8013,0.4597,217,204,117
-2357,7.5Y,8,8,0.4088,0.4466,59.1,0.541,0.591,0.1914,0.5297,0.5939,0.1756,0.8629,0.8025,0.3388,220,205,86
-2358,7.5Y,8,10,0.4283,0.4712,59.1,0.5372,0.591,0.1261,0.5267,0.5942,0.1154,0.8735,0.8031,0.19,223,205,48
-2363,10Y,8,2,0.3359,0.3552,59.1,0.5589,0.591,0.514,0.5434,0.5921,0.4729,0.8065,0.8,0.6722,206,204,171
-2364,10Y,8,4,0.3581,0.3883,59.1,0.545,0.591,0.386,0.5312,0.5929,0.355,0.817,0.8049,0.5693,208,205,145
-2365,10Y,8,6,0.3803,0.4216,59.1,0.5331,0.591,0.2777,0.5207,0.5935,0.2552,0.8254,0.8091,0.4585,210,206,117
-2366,10Y,8,8,0.4008,0.452,59.1,0.5241,0.591,0.1925,0.5128,0.594,0.1766,0.8325,0.8122,0.339,212,207,86
-2367,10Y,8,10,0.419,0.4791,59.1,0.5169,0.591,0.1257,0.5064,0.5944,0.1151,0.8379,0.8147,0.1848,214,208,47
-2372,2.5GY,8,2,0.3327,0.3555,59.1,0.5531,0.591,0.5184,0.5376,0.5921,0.477,0.7942,0.8034,0.6751,203,205,172
-2373,2.5GY,8,4,0.3504,0.3887,59.1,0.5328,0.591,0.3967,0.5188,0.5929,0.3648,0.7906,0.8122,0.5781,202,207,147
-2374,2.5GY,8,6,0.369,0.423,59.1,0.5156,0.591,0.2906,0.503,0.5936,0.2671,0.7884,0.8194,0.4722,201,209,120
-2375,2.5GY,8,8,0.3858,0.455,59.1,0.5011,0.591,0.2068,0.4897,0.5942,0.1898,0.7851,0.8255,0.3602,200,211,92
-2376,2.5GY,8,10,0.4021,0.4869,59.1,0.4881,0.591,0.1347,0.4776,0.5946,0.1234,0.7809,0.831,0.2082,199,212,53
-2381,5GY,8,2,0.3284,0.3542,59.1,0.548,0.591,0.5296,0.5323,0.5921,0.4874,0.7807,0.8067,0.6829,199,206,174
-2382,5GY,8,4,0.3433,0.3872,59.1,0.524,0.591,0.4113,0.5099,0.5929,0.3784,0.7688,0.8175,0.5903,196,208,151
-2383,5GY,8,6,0.3573,0.4214,59.1,0.5011,0.591,0.3104,0.4883,0.5937,0.2853,0.7533,0.8279,0.493,192,211,126
-2384,5GY,8,8,0.3696,0.4542,59.1,0.4809,0.591,0.2293,0.4692,0.5942,0.2105,0.7368,0.8372,0.3922,188,213,100
-2385,5GY,8,10,0.3816,0.4879,59.1,0.4622,0.591,0.1581,0.4515,0.5948,0.1449,0.7197,0.8457,0.2648,184,216,68
-2391,7.5GY,8,2,0.3194,0.3502,59.1,0.539,0.591,0.5576,0.523,0.5921,0.5132,0.7541,0.8124,0.7019,192,207,179
-2392,7.5GY,8,4,0.3266,0.3809,59.1,0.5067,0.591,0.4538,0.4921,0.5929,0.4175,0.7188,0.8281,0.6244,183,211,159
-2393,7.5GY,8,6,0.3339,0.4129,59.1,0.4779,0.591,0.3624,0.4645,0.5936,0.3333,0.6848,0.8418,0.544,175,215,139
-2394,7.5GY,8,8,0.3408,0.4452,59.1,0.4524,0.591,0.2841,0.4401,0.5942,0.2611,0.6519,0.8538,0.4604,166,218,117
-2395,7.5GY,8,10,0.3463,0.4791,59.1,0.4272,0.591,0.2154,0.4158,0.5948,0.1977,0.6134,0.8656,0.3669,156,221,94
-2396,7.5GY,8,12,0.3511,0.5144,59.1,0.4034,0.591,0.1545,0.3928,0.5953,0.1417,0.5723,0.8766,0.2482,146,224,63
-2401,10GY,8,2,0.3121,0.3459,59.1,0.5332,0.591,0.5843,0.5169,0.592,0.5378,0.7333,0.8164,0.7196,187,208,183
-2402,10GY,8,4,0.314,0.3727,59.1,0.4979,0.591,0.4968,0.4828,0.5928,0.4571,0.6838,0.834,0.657,174,213,168
-2403,10GY,8,6,0.315,0.4014,59.1,0.4638,0.591,0.4176,0.4497,0.5935,0.3841,0.6291,0.8507,0.5926,160,217,151
-2404,10GY,8,8,0.3149,0.4284,59.1,0.4344,0.591,0.3541,0.4212,0.5941,0.3256,0.5744,0.8649,0.5336,146,221,136
-2405,10GY,8,10,0.314,0.4601,59.1,0.4033,0.591,0.2902,0.391,0.5947,0.2667,0.5064,0.8796,0.4641,129,224,118
-2406,10GY,8,12,0.3124,0.4926,59.1,0.3748,0.591,0.234,0.3633,0.5952,0.2149,0.4303,0.8929,0.3899,110,228,99
-2407,10GY,8,14,0.3091,0.5247,59.1,0.3482,0.591,0.1872,0.3373,0.5957,0.1718,0.3347,0.9052,0.311,85,231,79
-2408,10GY,8,16,0.3043,0.5578,59.1,0.3224,0.591,0.1461,0.3121,0.5961,0.1339,0.1836,0.9169,0.213,47,234,54
-2413,2.5G,8,2,0.3053,0.3404,59.1,0.5301,0.591,0.6151,0.5133,0.5919,0.5662,0.7162,0.8189,0.7395,183,209,189
-2414,2.5G,8,4,0.3009,0.3614,59.1,0.4921,0.591,0.5522,0.4762,0.5925,0.5082,0.6491,0.8385,0.6964,166,214,178
-2415,2.5G,8,6,0.2952,0.3851,59.1,0.453,0.591,0.4906,0.438,0.5932,0.4514,0.5681,0.8581,0.6504,145,219,166
-2416,2.5G,8,8,0.2896,0.4065,59.1,0.421,0.591,0.4418,0.4067,0.5937,0.4065,0.4876,0.8738,0.6107,124,223,156
-2417,2.5G,8,10,0.2829,0.4301,59.1,0.3887,0.591,0.3944,0.3751,0.5943,0.3627,0.3829,0.8893,0.5685,98,227,145
-2418,2.5G,8,12,0.2743,0.4554,59.1,0.356,0.591,0.3508,0.343,0.5948,0.3226,0.2098,0.9047,0.5258,53,231,134
-2425,5G,8,2,0.3009,0.3359,59.1,0.5294,0.591,0.639,0.5124,0.5918,0.5882,0.7066,0.8198,0.7545,180,209,192
-2426,5G,8,4,0.2924,0.3523,59.1,0.4905,0.591,0.596,0.4741,0.5923,0.5486,0.6281,0.8403,0.7257,160,214,185
-2427,5G,8,6,0.2822,0.3702,59.1,0.4505,0.591,0.5549,0.4347,0.5929,0.5107,0.5298,0.8609,0.6965,135,220,178
-2428,5G,8,8,0.2723,0.3865,59.1,0.4164,0.591,0.5217,0.4011,0.5934,0.4801,0.4211,0.8779,0.6717,107,224,171
-2429,5G,8,10,0.2613,0.4026,59.1,0.3836,0.591,0.4934,0.3687,0.5938,0.454,0.2614,0.894,0.6494,67,228,166
-2436,7.5G,8,2,0.2981,0.3326,59.1,0.5297,0.591,0.6562,0.5124,0.5917,0.6041,0.7013,0.8201,0.7651,179,209,195
-2437,7.5G,8,4,0.2874,0.3464,59.1,0.4903,0.591,0.6248,0.4736,0.5922,0.5751,0.616,0.8411,0.7441,157,214,190
-2438,7.5G,8,6,0.2754,0.3608,59.1,0.4511,0.591,0.5959,0.4348,0.5927,0.5485,0.511,0.8614,0.7241,130,220,185
-2439,7.5G,8,8,0.2639,0.3733,59.1,0.4178,0.591,0.5744,0.4018,0.5931,0.5286,0.3912,0.8783,0.7085,100,224,181
-2440,7.5G,8,10,0.2515,0.3867,59.1,0.3844,0.591,0.5529,0.3687,0.5935,0.5089,0.1854,0.8948,0.6925,47,228,177
-2446,10G,8,2,0.2957,0.3293,59.1,0.5307,0.591,0.673,0.5132,0.5916,0.6196,0.6978,0.8199,0.7753,178,209,198
-2447,10G,8,4,0.2828,0.3403,59.1,0.4911,0.591,0.6546,0.474,0.592,0.6025,0.6059,0.8413,0.7627,155,215,194
-2448,10G,8,6,0.2693,0.3512,59.1,0.4532,0.591,0.6386,0.4363,0.5925,0.5879,0.4956,0.8613,0.7515,126,220,192
-2449,10G,8,8,0.2564,0.3611,59.1,0.4196,0.591,0.626,0.403,0.5928,0.5762,0.3611,0.8785,0.7423,92,224,189
-2450,10G,8,10,0.243,0.371,59.1,0.3871,0.591,0.6149,0.3706,0.5932,0.566,0.0786,0.8948,0.734,20,228,187
-2456,2.5BG,8,2,0.294,0.3268,59.1,0.5317,0.591,0.6858,0.514,0.5915,0.6313,0.6956,0.8196,0.7829,177,209,200
-2457,2.5BG,8,4,0.2791,0.3351,59.1,0.4922,0.591,0.6804,0.4747,0.5919,0.6264,0.598,0.8413,0.7783,152,215,198
-2458,2.5BG,8,6,0.2647,0.3429,59.1,0.4562,0.591,0.6763,0.4388,0.5923,0.6226,0.4859,0.8605,0.7746,124,219,198
-2459,2.5BG,8,8,0.25,0.35,59.1,0.4221,0.591,0.6754,0.4048,0.5926,0.6218,0.3336,0.8783,0.7729,85,224,197
-2465,5BG,8,2,0.2919,0.3228,59.1,0.5344,0.591,0.7054,0.5165,0.5914,0.6494,0.6951,0.8186,0.7945,177,209,203
-2466,5BG,8,4,0.2752,0.3278,59.1,0.4962,0.591,0.7158,0.4782,0.5917,0.659,0.594,0.84,0.7992,151,214,204
-2467,5BG,8,6,0.2588,0.3318,59.1,0.461,0.591,0.7292,0.4429,0.5919,0.6714,0.4738,0.8592,0.8057,121,219,205
-2468,5BG,8,8,0.2419,0.3352,59.1,0.4265,0.591,0.7456,0.4083,0.5922,0.6865,0.2944,0.8775,0.8138,75,224,208
-2473,7.5BG,8,2,0.29,0.3183,59.1,0.5385,0.591,0.7273,0.5203,0.5912,0.6696,0.6967,0.8168,0.8072,178,208,206
-2474,7.5BG,8,4,0.2718,0.32,59.1,0.502,0.591,0.7539,0.4835,0.5914,0.6941,0.5941,0.8377,0.8209,151,214,209
-2475,7.5BG,8,6,0.2525,0.3198,59.1,0.4666,0.591,0.7904,0.4478,0.5916,0.7278,0.4599,0.8576,0.8398,117,219,214
-2476,7.5BG,8,8,0.2352,0.3198,59.1,0.4347,0.591,0.8224,0.4154,0.5917,0.7572,0.2697,0.875,0.8558,69,223,218
-2481,10BG,8,2,0.2894,0.3152,59.1,0.5426,0.591,0.7414,0.5243,0.5911,0.6826,0.7013,0.8148,0.8153,179,208,208
-2482,10BG,8,4,0.2686,0.313,59.1,0.5072,0.591,0.79,0.4882,0.5912,0.7274,0.5932,0.8357,0.8409,151,213,214
-2483,10BG,8,6,0.2489,0.3099,59.1,0.4747,0.591,0.8414,0.4551,0.5913,0.7748,0.461,0.8544,0.867,118,218,221
-2484,10BG,8,8,0.2302,0.3063,59.1,0.4442,0.591,0.8943,0.424,0.5913,0.8235,0.2589,0.8716,0.8929,66,222,228
-2488,2.5B,8,2,0.2897,0.3124,59.1,0.5481,0.591,0.7527,0.5295,0.591,0.693,0.7097,0.812,0.8218,181,207,210
-2489,2.5B,8,4,0.2668,0.3067,59.1,0.5141,0.591,0.8219,0.4948,0.591,0.7567,0.5991,0.8326,0.858,153,212,219
-2490,2.5B,8,6,0.2462,0.3,59.1,0.485,0.591,0.894,0.4648,0.5909,0.8232,0.4701,0.8501,0.8939,120,217,228
-2491,2.5B,8,8,0.2264,0.2923,59.1,0.4578,0.591,0.9731,0.4366,0.5908,0.8962,0.2712,0.8663,0.9314,69,221,238
-2494,5B,8,2,0.2908,0.3096,59.1,0.5551,0.591,0.7628,0.5364,0.5909,0.7023,0.7219,0.8082,0.8276,184,206,211
-2495,5B,8,4,0.2671,0.2998,59.1,0.5265,0.591,0.8538,0.5068,0.5907,0.7862,0.6198,0.8265,0.8749,158,211,223
-2496,5B,8,6,0.2457,0.2888,59.1,0.5028,0.591,0.9526,0.4818,0.5904,0.8773,0.5024,0.8418,0.923,128,215,235
-2497,5B,8,8,0.2237,0.2761,59.1,0.4788,0.591,1.0707,0.4564,0.5901,0.9861,0.3135,0.8573,0.9765,80,219,249
-2498,7.5B,8,2,0.2922,0.3077,59.1,0.5612,0.591,0.7685,0.5425,0.5908,0.7075,0.7333,0.8048,0.8309,187,205,212
-2499,7.5B,8,4,0.2688,0.2956,59.1,0.5374,0.591,0.8709,0.5174,0.5905,0.8019,0.6414,0.8208,0.8839,164,209,225
-2500,7.5B,8,6,0.2472,0.2821,59.1,0.5179,0.591,0.9861,0.4964,0.5901,0.9081,0.5358,0.8343,0.9392,137,213,239
-2501,7.5B,8,8,0.2252,0.2668,59.1,0.4989,0.591,1.1253,0.4756,0.5896,1.0364,0.3783,0.8479,1,96,216,255
-2502,10B,8,2,0.2935,0.3062,59.1,0.5665,0.591,0.7726,0.5477,0.5908,0.7114,0.7432,0.8019,0.8333,190,204,212
-2503,10B,8,4,0.2718,0.2911,59.1,0.5518,0.591,0.8874,0.5316,0.5903,0.8172,0.6709,0.8131,0.8926,171,207,228
-2504,10B,8,6,0.2512,0.276,59.1,0.5379,0.591,1.0124,0.5161,0.5898,0.9324,0.5845,0.8239,0.9518,149,210,243
-2505,10B,8,8,0.2294,0.2587,59.1,0.5241,0.591,1.1694,0.5002,0.5892,1.0771,0.4593,0.8352,1,117,213,255
-2506,2.5PB,8,2,0.2957,0.3047,59.1,0.5735,0.591,0.7751,0.5547,0.5907,0.7136,0.7571,0.7978,0.8349,193,203,213
-2507,2.5PB,8,4,0.2758,0.2879,59.1,0.5662,0.591,0.8956,0.5458,0.5901,0.8247,0.7016,0.805,0.8971,179,205,229
-2508,2.5PB,8,6,0.2562,0.2709,59.1,0.5589,0.591,1.0317,0.5368,0.5895,0.9501,0.6339,0.8125,0.9612,162,207,245
-2509,5PB,8,2,0.2974,0.3039,59.1,0.5784,0.591,0.7754,0.5595,0.5906,0.7139,0.7669,0.795,0.8352,196,203,213
-2510,5PB,8,4,0.2798,0.2861,59.1,0.578,0.591,0.8967,0.5576,0.59,0.8257,0.7275,0.7982,0.898,186,204,229
-2511,5PB,8,6,0.2614,0.267,59.1,0.5786,0.591,1.0439,0.5563,0.5893,0.9614,0.6781,0.8015,0.9672,173,204,247
-2512,7.5PB,8,2,0.3003,0.3034,59.1,0.585,0.591,0.772,0.5661,0.5906,0.7107,0.7811,0.7911,0.8336,199,202,213
-2513,7.5PB,8,4,0.2856,0.2846,59.1,0.5931,0.591,0.8925,0.5727,0.5899,0.8219,0.7606,0.7893,0.8964,194,201,229
-2514,7.5PB,8,6,0.2702,0.2648,59.1,0.6031,0.591,1.0378,0.5808,0.5891,0.9558,0.7353,0.787,0.9651,188,201,246
-2515,10PB,8,2,0.3027,0.3035,59.1,0.5894,0.591,0.7668,0.5707,0.5906,0.706,0.7914,0.7883,0.8309,202,201,212
-2516,10PB,8,4,0.2911,0.2848,59.1,0.6041,0.591,0.8801,0.5838,0.5899,0.8104,0.7864,0.7824,0.8905,201,200,227
-2517,10PB,8,6,0.2792,0.2649,59.1,0.6229,0.591,1.0171,0.6008,0.589,0.9367,0.7825,0.7745,0.9563,200,197,244
-2518,10PB,8,8,0.2677,0.2443,59.1,0.6476,0.591,1.1805,0.6234,0.588,1.0873,0.7823,0.7636,1,199,195,255
-2519,2.5P,8,2,0.3048,0.304,59.1,0.5926,0.591,0.7605,0.5738,0.5906,0.7002,0.7993,0.7863,0.8276,204,201,211
-2520,2.5P,8,4,0.2962,0.285,59.1,0.6142,0.591,0.8685,0.5941,0.5898,0.7997,0.8093,0.776,0.885,206,198,226
-2521,2.5P,8,6,0.2881,0.2671,59.1,0.6375,0.591,0.9842,0.6158,0.589,0.9064,0.8199,0.7648,0.9415,209,195,240
-2522,2.5P,8,8,0.28,0.2488,59.1,0.6651,0.591,1.1193,0.6417,0.5881,1.0309,0.833,0.7511,1,212,192,255
-2523,5P,8,2,0.3065,0.3047,59.1,0.5945,0.591,0.7541,0.5759,0.5906,0.6943,0.8049,0.785,0.8241,205,200,210
-2524,5P,8,4,0.3012,0.2868,59.1,0.6207,0.591,0.849,0.6008,0.5899,0.7817,0.8268,0.7716,0.8753,211,197,223
-2525,5P,8,6,0.2963,0.2704,59.1,0.6476,0.591,0.947,0.6264,0.5891,0.8721,0.8486,0.7575,0.9244,216,193,236
-2526,5P,8,8,0.2914,0.2534,59.1,0.6796,0.591,1.0617,0.6569,0.5883,0.9778,0.874,0.7403,0.9777,223,189,249
-2527,5P,8,10,0.287,0.238,59.1,0.7127,0.591,1.1795,0.6884,0.5874,1.0864,0.8993,0.722,1,229,184,255
-2528,7.5P,8,2,0.3107,0.307,59.1,0.5981,0.591,0.736,0.5797,0.5906,0.6776,0.8169,0.7823,0.8141,208,199,208
-2529,7.5P,8,4,0.3114,0.2915,59.1,0.6313,0.591,0.8051,0.612,0.59,0.7413,0.8579,0.7639,0.8528,219,195,217
-2530,7.5P,8,6,0.3114,0.2785,59.1,0.6608,0.591,0.8703,0.6406,0.5894,0.8013,0.8913,0.7472,0.8873,227,191,226
-2531,7.5P,8,8,0.3116,0.2626,59.1,0.7013,0.591,0.9583,0.6798,0.5886,0.8825,0.9349,0.7234,0.9312,238,184,237
-2532,7.5P,8,10,0.3116,0.2497,59.1,0.7375,0.591,1.0383,0.715,0.5879,0.9563,0.9715,0.7011,0.9689,248,179,247
-2533,7.5P,8,12,0.3117,0.237,59.1,0.7773,0.591,1.1254,0.7535,0.5871,1.0365,1,0.6756,1,255,172,255
-2534,10P,8,2,0.3131,0.3084,59.1,0.6,0.591,0.7253,0.5817,0.5907,0.6678,0.8234,0.7809,0.8081,210,199,206
-2535,10P,8,4,0.3175,0.2955,59.1,0.635,0.591,0.774,0.616,0.5901,0.7126,0.8724,0.7609,0.8363,222,194,213
-2536,10P,8,6,0.3213,0.2829,59.1,0.6712,0.591,0.8269,0.6515,0.5895,0.7613,0.919,0.7394,0.8654,234,189,221
-2537,10P,8,8,0.325,0.27,59.1,0.7114,0.591,0.8865,0.6908,0.5889,0.8163,0.967,0.7146,0.8968,247,182,229
-2538,10P,8,10,0.3282,0.2582,59.1,0.7512,0.591,0.9467,0.7298,0.5882,0.8718,1,0.6889,0.9271,255,176,236
-2539,10P,8,12,0.3312,0.247,59.1,0.7925,0.591,1.0092,0.7702,0.5875,0.9294,1,0.6609,0.9572,255,169,244
-2540,10P,8,14,0.3342,0.2349,59.1,0.8408,0.591,1.0841,0.8175,0.5867,0.9985,1,0.626,0.9917,255,160,253
-2541,2.5RP,8,2,0.3154,0.31,59.1,0.6013,0.591,0.7142,0.5832,0.5907,0.6575,0.8289,0.7799,0.8018,211,199,204
-2542,2.5RP,8,4,0.3239,0.3,59.1,0.6381,0.591,0.7409,0.6195,0.5903,0.6821,0.8861,0.7581,0.8182,226,193,209
-2543,2.5RP,8,6,0.3327,0.2898,59.1,0.6785,0.591,0.7698,0.6595,0.5897,0.7088,0.944,0.7331,0.8354,241,187,213
-2544,2.5RP,8,8,0.3406,0.2793,59.1,0.7207,0.591,0.8043,0.7012,0.5892,0.7405,0.9989,0.7059,0.8552,255,180,218
-2545,2.5RP,8,10,0.3479,0.2699,59.1,0.7618,0.591,0.8369,0.7418,0.5886,0.7706,1,0.6781,0.8734,255,173,223
-2546,2.5RP,8,12,0.3552,0.2594,59.1,0.8093,0.591,0.8781,0.7886,0.588,0.8085,1,0.644,0.8955,255,164,228
-2547,2.5RP,8,14,0.3621,0.2496,59.1,0.8574,0.591,0.9194,0.8361,0.5873,0.8466,1,0.6069,0.9171,255,155,234
-2548,5RP,8,2,0.318,0.312,59.1,0.6024,0.591,0.7009,0.5844,0.5908,0.6452,0.8345,0.7789,0.7942,213,199,203
-2549,5RP,8,4,0.3308,0.3052,59.1,0.6406,0.591,0.7049,0.6225,0.5904,0.6489,0.8993,0.7556,0.7978,229,193,203
-2550,5RP,8,6,0.344,0.2978,59.1,0.6827,0.591,0.7109,0.6644,0.59,0.6544,0.964,0.7288,0.8027,246,186,205
-2551,5RP,8,8,0.357,0.29,59.1,0.7275,0.591,0.7194,0.7091,0.5895,0.6623,1,0.6988,0.809,255,178,206
-2552,5RP,8,10,0.3685,0.2828,59.1,0.7701,0.591,0.7287,0.7515,0.5891,0.6709,1,0.6687,0.8157,255,171,208
-2553,5RP,8,12,0.3818,0.2742,59.1,0.8229,0.591,0.7414,0.804,0.5885,0.6826,1,0.6288,0.8245,255,160,210
-2554,7.5RP,8,2,0.32,0.3136,59.1,0.6031,0.591,0.6905,0.5852,0.5908,0.6357,0.8386,0.7782,0.7882,214,198,201
-2555,7.5RP,8,4,0.336,0.3092,59.1,0.6422,0.591,0.6782,0.6245,0.5905,0.6243,0.9087,0.7538,0.7822,232,192,199
-2556,7.5RP,8,6,0.3521,0.3042,59.1,0.6841,0.591,0.6677,0.6664,0.5902,0.6147,0.9757,0.7267,0.7775,249,185,198
-2557,7.5RP,8,8,0.3682,0.2983,59.1,0.7295,0.591,0.6607,0.7118,0.5898,0.6082,1,0.6957,0.7749,255,177,198
-2558,7.5RP,8,10,0.383,0.293,59.1,0.7725,0.591,0.6535,0.7549,0.5894,0.6016,1,0.6646,0.7721,255,169,197
-2559,7.5RP,8,12,0.4002,0.2859,59.1,0.8273,0.591,0.6489,0.8096,0.589,0.5973,1,0.6222,0.7713,255,159,197
-2560,10RP,9,2,0.3205,0.3155,78.66,0.7991,0.7866,0.9075,0.7755,0.7865,0.8354,0.9488,0.8852,0.889,242,226,227
-2561,10RP,9,4,0.34,0.314,78.66,0.8517,0.7866,0.8668,0.8286,0.7862,0.7979,1,0.857,0.8699,255,219,222
-2562,10RP,9,6,0.359,0.3118,78.66,0.9057,0.7866,0.8305,0.8829,0.7859,0.7644,1,0.8269,0.8526,255,211,217
-2563,2.5R,9,2,0.321,0.3168,78.66,0.797,0.7866,0.8993,0.7736,0.7865,0.8279,0.9476,0.8861,0.8848,242,226,226
-2564,2.5R,9,4,0.3445,0.3179,78.66,0.8524,0.7866,0.8353,0.8297,0.7863,0.7689,1,0.8559,0.8535,255,218,218
-2565,2.5R,9,6,0.3665,0.3183,78.66,0.9057,0.7866,0.7789,0.8836,0.7861,0.7169,1,0.8256,0.8247,255,211,210
-2566,5R,9,2,0.324,0.3188,78.66,0.7994,0.7866,0.8813,0.7762,0.7866,0.8113,0.9555,0.8845,0.8758,244,226,223
-2567,5R,9,4,0.3495,0.3226,78.66,0.8522,0.7866,0.7995,0.8299,0.7865,0.7359,1,0.8552,0.8343,255,218,213
-2568,5R,9,6,0.3734,0.3256,78.66,0.9021,0.7866,0.7272,0.8806,0.7864,0.6692,1,0.8264,0.7953,255,211,203
-2569,7.5R,9,2,0.3263,0.321,78.66,0.7996,0.7866,0.8643,0.7766,0.7867,0.7956,0.9596,0.884,0.867,245,225,221
-2570,7.5R,9,4,0.3551,0.3283,78.66,0.8508,0.7866,0.7586,0.829,0.7867,0.6981,1,0.8551,0.8116,255,218,207
-2571,7.5R,9,6,0.3812,0.3348,78.66,0.8956,0.7866,0.6672,0.8749,0.7868,0.6139,1,0.8286,0.7593,255,211,194
-2572,10R,9,2,0.3284,0.3233,78.66,0.799,0.7866,0.8474,0.7762,0.7868,0.78,0.9626,0.884,0.8582,245,225,219
-2573,10R,9,4,0.36,0.3348,78.66,0.8458,0.7866,0.7171,0.8246,0.787,0.6599,1,0.8568,0.7875,255,218,201
-2574,10R,9,6,0.388,0.3439,78.66,0.8875,0.7866,0.6132,0.8675,0.7871,0.5642,1,0.8319,0.7248,255,212,185
-2575,2.5YR,9,2,0.332,0.3273,78.66,0.7979,0.7866,0.8188,0.7755,0.7869,0.7537,0.9674,0.8839,0.843,247,225,215
-2576,2.5YR,9,4,0.3641,0.3422,78.66,0.8369,0.7866,0.6751,0.8163,0.7873,0.6212,1,0.8605,0.762,255,219,194
-2577,2.5YR,9,6,0.3927,0.355,78.66,0.8701,0.7866,0.559,0.8509,0.7875,0.5142,1,0.8401,0.6874,255,214,175
-2578,5YR,9,2,0.3353,0.3325,78.66,0.7932,0.7866,0.7859,0.7712,0.7871,0.7233,0.9679,0.8856,0.8249,247,226,210
-2579,5YR,9,4,0.3668,0.3509,78.66,0.8222,0.7866,0.6328,0.8021,0.7876,0.5822,1,0.8673,0.735,255,221,187
-2580,5YR,9,6,0.3948,0.3659,78.66,0.8487,0.7866,0.5144,0.8301,0.7879,0.4731,1,0.8507,0.6542,255,217,167
-2581,7.5YR,9,2,0.338,0.3377,78.66,0.7873,0.7866,0.7554,0.7657,0.7873,0.6952,0.966,0.888,0.8076,246,226,206
-2582,7.5YR,9,4,0.3679,0.3585,78.66,0.8072,0.7866,0.6003,0.7876,0.7879,0.5523,1,0.8744,0.7131,255,223,182
-2583,7.5YR,9,6,0.395,0.3763,78.66,0.8257,0.7866,0.4781,0.8076,0.7883,0.4396,1,0.8621,0.6252,255,220,159
-2584,7.5YR,9,8,0.422,0.393,78.66,0.8446,0.7866,0.3703,0.8279,0.7887,0.3402,1,0.8496,0.532,255,217,136
-2585,10YR,9,2,0.3392,0.343,78.66,0.7779,0.7866,0.7288,0.7566,0.7875,0.6707,0.9579,0.8921,0.792,244,227,202
-2586,10YR,9,4,0.3677,0.3668,78.66,0.7885,0.7866,0.5694,0.7693,0.7882,0.5237,1,0.8834,0.6913,255,225,176
-2587,10YR,9,6,0.3941,0.3877,78.66,0.7996,0.7866,0.4427,0.782,0.7888,0.407,1,0.8749,0.5951,255,223,152
-2588,10YR,9,8,0.4199,0.4069,78.66,0.8117,0.7866,0.3348,0.7955,0.7892,0.3075,1,0.8663,0.4938,255,221,126
-2589,2.5Y,9,2,0.339,0.3472,78.66,0.768,0.7866,0.7109,0.747,0.7877,0.6542,0.947,0.8967,0.7812,241,229,199
-2590,2.5Y,9,4,0.3655,0.3738,78.66,0.7691,0.7866,0.5486,0.7502,0.7885,0.5046,0.9855,0.8927,0.6758,251,228,172
-2591,2.5Y,9,6,0.391,0.3972,78.66,0.7743,0.7866,0.4194,0.757,0.7891,0.3855,1,0.8874,0.5737,255,226,146
-2592,2.5Y,9,8,0.4154,0.4186,78.66,0.7806,0.7866,0.3119,0.7647,0.7896,0.2865,1,0.8819,0.4664,255,225,119
-2593,2.5Y,9,10,0.437,0.4369,78.66,0.7868,0.7866,0.227,0.772,0.7899,0.2082,1,0.8769,0.3524,255,224,90
-2594,2.5Y,9,12,0.4569,0.4527,78.66,0.7939,0.7866,0.1571,0.78,0.7902,0.1437,1,0.8717,0.2033,255,222,52
-2595,5Y,9,2,0.3378,0.3504,78.66,0.7583,0.7866,0.6999,0.7375,0.7879,0.6441,0.9346,0.9013,0.7743,238,230,197
-2596,5Y,9,4,0.3621,0.3799,78.66,0.7497,0.7866,0.5342,0.731,0.7888,0.4913,0.9601,0.9021,0.6645,245,230,169
-2597,5Y,9,6,0.3858,0.4071,78.66,0.7454,0.7866,0.4002,0.7285,0.7895,0.3678,0.9839,0.9014,0.5547,251,230,141
-2598,5Y,9,8,0.408,0.4319,78.66,0.7431,0.7866,0.2916,0.7275,0.79,0.2677,1,0.9004,0.4396,255,230,112
-2599,5Y,9,10,0.4275,0.4529,78.66,0.7425,0.7866,0.2077,0.728,0.7905,0.1904,1,0.8989,0.3143,255,229,80
-2600,5Y,9,12,0.4455,0.4719,78.66,0.7426,0.7866,0.1377,0.729,0.7908,0.1258,1,0.8974,0.1138,255,229,29
-2605,7.5Y,9,2,0.3365,0.3527,78.66,0.7505,0.7866,0.6932,0.7297,0.788,0.6378,0.9239,0.9051,0.7699,236,231,196
-2606,7.5Y,9,4,0.3591,0.3832,78.66,0.7371,0.7866,0.529,0.7185,0.7889,0.4865,0.942,0.9082,0.6602,240,232,168
-2607,7.5Y,9,6,0.3811,0.4123,78.66,0.7271,0.7866,0.3942,0.7102,0.7897,0.3623,0.958,0.9104,0.5482,244,232,140
-2608,7.5Y,9,8,0.4019,0.4392,78.66,0.7198,0.7866,0.2846,0.7044,0.7903,0.2613,0.972,0.9117,0.4291,248,232,109
-2609,7.5Y,9,10,0.4201,0.4622,78.66,0.715,0.7866,0.2003,0.7006,0.7907,0.1836,0.9837,0.9123,0.297,251,233,76
-2610,7.5Y,9,12,0.4369,0.4829,78.66,0.7117,0.7866,0.1306,0.6982,0.7911,0.1194,0.9943,0.9125,0.0468,254,233,12
-2614,10Y,9,2,0.3349,0.3537,78.66,0.7448,0.7866,0.6925,0.7241,0.788,0.6373,0.9149,0.9078,0.7693,233,231,196
-2615,10Y,9,4,0.3558,0.3852,78.66,0.7266,0.7866,0.5289,0.708,0.789,0.4864,0.9255,0.9134,0.6596,236,233,168
-2616,10Y,9,6,0.3761,0.4155,78.66,0.712,0.7866,0.3945,0.6952,0.7898,0.3626,0.9347,0.9177,0.5477,238,234,140
-2617,10Y,9,8,0.3957,0.445,78.66,0.6995,0.7866,0.2816,0.6841,0.7905,0.2585,0.9419,0.9215,0.4237,240,235,108
-2618,10Y,9,10,0.412,0.4694,78.66,0.6904,0.7866,0.1987,0.6761,0.791,0.1821,0.9473,0.9242,0.2909,242,236,74
-2623,2.5GY,9,2,0.3321,0.3539,78.66,0.7381,0.7866,0.6979,0.7174,0.7881,0.6422,0.9029,0.9112,0.7724,230,232,197
-2624,2.5GY,9,4,0.3499,0.3866,78.66,0.7119,0.7866,0.5361,0.6933,0.7891,0.4931,0.9002,0.9207,0.6643,230,235,169
-2625,2.5GY,9,6,0.367,0.4178,78.66,0.691,0.7866,0.4052,0.674,0.7899,0.3724,0.8984,0.9281,0.5564,229,237,142
-2626,2.5GY,9,8,0.3834,0.449,78.66,0.6717,0.7866,0.2936,0.6562,0.7907,0.2696,0.8945,0.935,0.4369,228,238,111
-2627,2.5GY,9,10,0.3973,0.4761,78.66,0.6564,0.7866,0.2092,0.6421,0.7912,0.1917,0.8905,0.9405,0.3075,227,240,78
-2628,2.5GY,9,12,0.4108,0.5028,78.66,0.6427,0.7866,0.1352,0.6293,0.7917,0.1235,0.8863,0.9455,0.0519,226,241,13
-2632,5GY,9,2,0.3284,0.3534,78.66,0.731,0.7866,0.7083,0.7101,0.7881,0.6518,0.8884,0.9149,0.7783,227,233,198
-2633,5GY,9,4,0.3437,0.3861,78.66,0.7002,0.7866,0.5505,0.6814,0.7891,0.5063,0.877,0.9266,0.6742,224,236,172
-2634,5GY,9,6,0.3572,0.4179,78.66,0.6723,0.7866,0.4233,0.6552,0.79,0.3891,0.8623,0.9373,0.5718,220,239,146
-2635,5GY,9,8,0.3698,0.4497,78.66,0.6468,0.7866,0.3157,0.6311,0.7908,0.29,0.8462,0.9471,0.4617,216,242,118
-2636,5GY,9,10,0.381,0.4791,78.66,0.6255,0.7866,0.2297,0.611,0.7914,0.2107,0.8313,0.9553,0.3411,212,244,87
-2637,5GY,9,12,0.3911,0.5082,78.66,0.6054,0.7866,0.1559,0.5918,0.792,0.1426,0.8148,0.9631,0.1606,208,246,41
-2641,7.5GY,9,2,0.3198,0.35,78.66,0.7187,0.7866,0.7421,0.6974,0.788,0.683,0.8587,0.9216,0.7977,219,235,203
-2642,7.5GY,9,4,0.3274,0.3793,78.66,0.679,0.7866,0.6083,0.6595,0.7891,0.5596,0.8239,0.9378,0.7134,210,239,182
-2643,7.5GY,9,6,0.3351,0.4111,78.66,0.6412,0.7866,0.4856,0.6233,0.79,0.4466,0.7875,0.953,0.6226,201,243,159
-2644,7.5GY,9,8,0.3414,0.4415,78.66,0.6083,0.7866,0.3868,0.5917,0.7908,0.3555,0.7514,0.9662,0.5345,192,246,136
-2645,7.5GY,9,10,0.3471,0.4735,78.66,0.5766,0.7866,0.298,0.5613,0.7915,0.2737,0.7123,0.9787,0.4354,182,250,111
-2646,7.5GY,9,12,0.3518,0.5042,78.66,0.5488,0.7866,0.2247,0.5345,0.7922,0.206,0.6738,0.9896,0.3244,172,252,83
-2647,7.5GY,9,14,0.3551,0.5339,78.66,0.5232,0.7866,0.1635,0.5096,0.7927,0.1497,0.633,0.9997,0.1715,161,255,44
-2650,10GY,9,2,0.3124,0.3454,78.66,0.7114,0.7866,0.7793,0.6897,0.7879,0.7173,0.8357,0.9258,0.8186,213,236,209
-2651,10GY,9,4,0.3144,0.3711,78.66,0.6664,0.7866,0.6666,0.6462,0.7889,0.6134,0.783,0.9449,0.7506,200,241,191
-2652,10GY,9,6,0.3153,0.4008,78.66,0.6188,0.7866,0.5572,0.6,0.7899,0.5125,0.7185,0.9646,0.6756,183,246,172
-2653,10GY,9,8,0.3157,0.4259,78.66,0.5831,0.7866,0.4772,0.5654,0.7906,0.4388,0.6638,0.9792,0.6131,169,250,156
-2654,10GY,9,10,0.3155,0.4558,78.66,0.5445,0.7866,0.3947,0.5279,0.7914,0.3628,0.5957,0.9947,0.5385,152,254,137
-2655,10GY,9,12,0.3139,0.4829,78.66,0.5113,0.7866,0.331,0.4957,0.792,0.3041,0.5243,1,0.4701,134,255,120
-2656,10GY,9,14,0.3115,0.5129,78.66,0.4777,0.7866,0.2693,0.4629,0.7926,0.2472,0.4348,1,0.3891,111,255,99
-2657,10GY,9,16,0.3079,0.544,78.66,0.4452,0.7866,0.2141,0.4312,0.7932,0.1964,0.3136,1,0.2928,80,255,75
-2658,10GY,9,18,0.3032,0.5748,78.66,0.4149,0.7866,0.167,0.4016,0.7937,0.1529,0.0612,1,0.1601,16,255,41
-2659,2.5G,9,2,0.3058,0.34,78.66,0.7075,0.7866,0.8195,0.6852,0.7877,0.7543,0.8172,0.9285,0.8405,208,237,214
-2660,2.5G,9,4,0.3018,0.3606,78.66,0.6583,0.7866,0.7364,0.6372,0.7886,0.6777,0.745,0.95,0.7924,190,242,202
-2661,2.5G,9,6,0.2966,0.3846,78.66,0.6066,0.7866,0.652,0.5867,0.7895,0.5999,0.6564,0.972,0.7391,167,248,188
-2662,2.5G,9,8,0.2912,0.4054,78.66,0.565,0.7866,0.5887,0.546,0.7902,0.5416,0.5699,0.9892,0.6955,145,252,177
-2663,2.5G,9,10,0.2851,0.4275,78.66,0.5246,0.7866,0.5288,0.5064,0.7909,0.4864,0.4646,1,0.6507,118,255,166
-2664,2.5G,9,12,0.2786,0.4491,78.66,0.488,0.7866,0.4769,0.4705,0.7915,0.4386,0.3307,1,0.6083,84,255,155
-2667,5G,9,2,0.3017,0.3357,78.66,0.7069,0.7866,0.8496,0.6843,0.7876,0.7821,0.8076,0.9294,0.8565,206,237,218
-2668,5G,9,4,0.2933,0.3519,78.66,0.6556,0.7866,0.7931,0.6338,0.7883,0.73,0.7207,0.9523,0.8244,184,243,210
-2669,5G,9,6,0.2832,0.3697,78.66,0.6026,0.7866,0.7385,0.5815,0.7891,0.6797,0.6118,0.9754,0.7917,156,249,202
-2670,5G,9,8,0.2735,0.3854,78.66,0.5582,0.7866,0.6962,0.5378,0.7897,0.6407,0.4949,0.9942,0.7649,126,254,195
-2671,5G,9,10,0.2639,0.4001,78.66,0.5188,0.7866,0.6606,0.4989,0.7903,0.6078,0.3475,1,0.7413,89,255,189
-2673,7.5G,9,2,0.2987,0.3323,78.66,0.7071,0.7866,0.8735,0.6841,0.7875,0.8041,0.801,0.9298,0.8689,204,237,222
-2674,7.5G,9,4,0.2882,0.3461,78.66,0.655,0.7866,0.8311,0.6327,0.7882,0.765,0.7064,0.9534,0.8451,180,243,216
-2675,7.5G,9,6,0.2763,0.3607,78.66,0.6025,0.7866,0.7916,0.5808,0.7888,0.7286,0.5894,0.9764,0.8219,150,249,210
-2676,7.5G,9,8,0.2652,0.3738,78.66,0.5581,0.7866,0.7597,0.5368,0.7894,0.6992,0.4584,0.9954,0.8024,117,254,205
-2677,7.5G,9,10,0.2545,0.3855,78.66,0.5193,0.7866,0.7346,0.4985,0.7899,0.676,0.2806,1,0.7865,72,255,201
-2679,10G,9,2,0.2965,0.3293,78.66,0.7083,0.7866,0.8939,0.685,0.7874,0.8228,0.7973,0.9296,0.8794,203,237,224
-2680,10G,9,4,0.284,0.3402,78.66,0.6567,0.7866,0.8689,0.6338,0.788,0.7999,0.6971,0.9533,0.865,178,243,221
-2681,10G,9,6,0.2703,0.3513,78.66,0.6052,0.7866,0.8473,0.5828,0.7885,0.7799,0.5726,0.9763,0.8521,146,249,217
-2682,10G,9,8,0.2574,0.3618,78.66,0.5596,0.7866,0.8279,0.5375,0.7891,0.7621,0.4221,0.996,0.8403,108,254,214
-2683,10G,9,10,0.2457,0.3702,78.66,0.5221,0.7866,0.8161,0.5002,0.7895,0.7512,0.1987,1,0.8328,51,255,212
-2685,2.5BG,9,2,0.2947,0.3267,78.66,0.7096,0.7866,0.9116,0.6861,0.7873,0.8392,0.7946,0.9294,0.8884,203,237,227
-2686,2.5BG,9,4,0.2805,0.3349,78.66,0.6588,0.7866,0.9033,0.6356,0.7878,0.8316,0.6901,0.953,0.8827,176,243,225
-2687,2.5BG,9,6,0.2652,0.3433,78.66,0.6077,0.7866,0.897,0.5846,0.7883,0.8258,0.5572,0.9761,0.878,142,249,224
-2688,2.5BG,9,8,0.2509,0.3507,78.66,0.5628,0.7866,0.8936,0.5398,0.7887,0.8226,0.391,0.9958,0.8749,100,254,223
-2689,2.5BG,9,10,0.2382,0.3568,78.66,0.5251,0.7866,0.8929,0.5023,0.7891,0.8219,0.0592,1,0.8734,15,255,223
-2690,5BG,9,2,0.293,0.3232,78.66,0.7131,0.7866,0.9341,0.6893,0.7871,0.8599,0.7949,0.9281,0.8997,203,237,229
-2691,5BG,9,4,0.2768,0.3287,78.66,0.6624,0.7866,0.9441,0.6386,0.7875,0.8691,0.684,0.9521,0.9031,174,243,230
-2692,5BG,9,6,0.2599,0.3338,78.66,0.6125,0.7866,0.9574,0.5886,0.7879,0.8815,0.5436,0.9751,0.9082,139,249,232
-2693,5BG,9,8,0.2437,0.3378,78.66,0.5675,0.7866,0.9745,0.5435,0.7883,0.8972,0.3527,0.9953,0.9152,90,254,233
-2695,7.5BG,9,2,0.2911,0.3188,78.66,0.7183,0.7866,0.9625,0.6941,0.7869,0.8861,0.7965,0.9262,0.9137,203,236,233
-2696,7.5BG,9,4,0.2728,0.3208,78.66,0.6689,0.7866,0.9965,0.6444,0.7872,0.9174,0.6805,0.9501,0.9285,174,242,237
-2697,7.5BG,9,6,0.2543,0.322,78.66,0.6212,0.7866,1.035,0.5963,0.7875,0.953,0.5339,0.9726,0.9452,136,248,241
-2698,7.5BG,9,8,0.2361,0.3225,78.66,0.5759,0.7866,1.0766,0.5505,0.7877,0.9913,0.3113,0.9935,0.9629,79,253,246
-2700,10BG,9,2,0.2907,0.3159,78.66,0.7239,0.7866,0.9796,0.6995,0.7868,0.9019,0.8022,0.9239,0.922,205,236,235
-2701,10BG,9,4,0.27,0.314,78.66,0.6764,0.7866,1.0421,0.6513,0.7869,0.9595,0.6818,0.9476,0.95,174,242,242
-2702,10BG,9,6,0.2501,0.3118,78.66,0.6309,0.7866,1.1052,0.6051,0.787,1.0177,0.5309,0.9696,0.9772,135,247,249
-2703,2.5B,9,2,0.2909,0.3125,78.66,0.7322,0.7866,0.9983,0.7076,0.7866,0.9191,0.8127,0.9202,0.9311,207,235,237
-2704,2.5B,9,4,0.268,0.3073,78.66,0.686,0.7866,1.0871,0.6603,0.7866,1.001,0.6884,0.944,0.9706,176,241,248
-2705,5B,9,2,0.2919,0.3102,78.66,0.7402,0.7866,1.009,0.7154,0.7865,0.929,0.8245,0.9166,0.9364,210,234,239
-2706,5B,9,4,0.2675,0.3005,78.66,0.7002,0.7866,1.1308,0.674,0.7863,1.0413,0.7057,0.9382,0.9902,180,239,253
-2707,7.5B,9,2,0.2937,0.3087,78.66,0.7484,0.7866,1.0131,0.7235,0.7864,0.9328,0.8383,0.9127,0.9385,214,233,239
-2708,7.5B,9,4,0.2688,0.2961,78.66,0.7141,0.7866,1.1559,0.6875,0.786,1.0643,0.728,0.9321,1,186,238,255
-2709,10B,9,2,0.2949,0.3076,78.66,0.7541,0.7866,1.0165,0.7292,0.7863,0.9359,0.8476,0.91,0.9402,216,232,240
-2710,10B,9,4,0.2712,0.2924,78.66,0.7296,0.7866,1.174,0.7027,0.7858,1.081,0.7549,0.9251,1,192,236,255
-2711,2.5PB,9,2,0.2975,0.3063,78.66,0.764,0.7866,1.0175,0.7391,0.7862,0.9368,0.8647,0.9051,0.941,220,231,240
-2712,5PB,9,2,0.2991,0.3057,78.66,0.7696,0.7866,1.0169,0.7447,0.7862,0.9362,0.8745,0.9023,0.9409,223,230,240
-2713,7.5PB,9,2,0.3015,0.3052,78.66,0.7771,0.7866,1.0137,0.7522,0.7861,0.9333,0.8879,0.8986,0.9396,226,229,240
-2714,10PB,9,2,0.3038,0.3054,78.66,0.7825,0.7866,1.0066,0.7577,0.7861,0.9267,0.8987,0.8957,0.9364,229,228,239
-2715,10PB,9,4,0.291,0.285,78.66,0.8032,0.7866,1.1702,0.7762,0.7851,1.0776,0.8917,0.8888,1,227,227,255
-2716,2.5P,9,2,0.305,0.3051,78.66,0.7863,0.7866,1.0052,0.7615,0.7861,0.9255,0.9053,0.8937,0.9359,231,228,239
-2717,2.5P,9,4,0.2963,0.2865,78.66,0.8135,0.7866,1.1454,0.7868,0.7851,1.0547,0.9148,0.883,0.9993,233,225,255
-2718,5P,9,2,0.3067,0.306,78.66,0.7884,0.7866,0.9956,0.7637,0.7861,0.9166,0.911,0.8925,0.9314,232,228,238
-2719,5P,9,4,0.3003,0.287,78.66,0.8231,0.7866,1.1311,0.7966,0.7851,1.0415,0.9334,0.8778,0.9934,238,224,253
-2720,7.5P,9,2,0.3107,0.3081,78.66,0.7932,0.7866,0.9732,0.7688,0.7862,0.896,0.9242,0.8896,0.9209,236,227,235
-2721,7.5P,9,4,0.3117,0.2928,78.66,0.8374,0.7866,1.0625,0.8117,0.7853,0.9783,0.9711,0.8689,0.9635,248,222,246
-2722,7.5P,9,6,0.312,0.2788,78.66,0.8803,0.7866,1.1545,0.8534,0.7845,1.0631,1,0.8482,1,255,216,255
-2723,10P,9,2,0.3128,0.3094,78.66,0.7952,0.7866,0.9605,0.771,0.7862,0.8843,0.9304,0.8883,0.9149,237,227,233
-2724,10P,9,4,0.3176,0.2966,78.66,0.8423,0.7866,1.0232,0.8171,0.7855,0.942,0.9871,0.8654,0.9457,252,221,241
-2725,10P,9,6,0.3218,0.2845,78.66,0.8897,0.7866,1.0885,0.8637,0.7847,1.0023,1,0.8416,0.9765,255,215,249
-2726,2.5RP,9,2,0.3149,0.3108,78.66,0.797,0.7866,0.9473,0.7729,0.7863,0.8721,0.9363,0.8871,0.9086,239,226,232
-2727,2.5RP,9,4,0.3234,0.301,78.66,0.8451,0.7866,0.9816,0.8205,0.7857,0.9037,1,0.863,0.9264,255,220,236
-2728,2.5RP,9,6,0.3322,0.291,78.66,0.898,0.7866,1.0185,0.8728,0.785,0.9377,1,0.8355,0.9451,255,213,241
-2729,5RP,9,2,0.3172,0.3126,78.66,0.7982,0.7866,0.9315,0.7743,0.7863,0.8576,0.9419,0.8862,0.9009,240,226,230
-2730,5RP,9,4,0.3301,0.306,78.66,0.8486,0.7866,0.9354,0.8245,0.7859,0.8612,1,0.8602,0.9042,255,219,231
-2731,5RP,9,6,0.3431,0.2988,78.66,0.9032,0.7866,0.9427,0.879,0.7853,0.8679,1,0.8308,0.9094,255,212,232
-2732,7.5RP,9,2,0.319,0.3141,78.66,0.7989,0.7866,0.9188,0.7751,0.7864,0.8458,0.9459,0.8856,0.8946,241,226,228
-2733,7.5RP,9,4,0.335,0.3099,78.66,0.8503,0.7866,0.9013,0.8267,0.786,0.8297,1,0.8585,0.8874,255,219,226
-2734,7.5RP,9,6,0.3512,0.3052,78.66,0.9052,0.7866,0.8856,0.8817,0.7856,0.8152,1,0.8284,0.8811,255,211,225
-"""
@@ -1,1635 +1,2079 @@
-module MunsellColors exposing (munsellColors)
+module MunsellColors exposing (chipIndex, chipsForHueValue, munsellColors, packedChips)
 
-import Dict
-import Munsell exposing (ColorDict)
+{-| Generated by gen_munsell_colors.py from the "rit" color source.
+Do not edit by hand.
+
+Each chip is packed into one Int:
+((huePage \* 16 + value) \* 32 + chroma / 2) \* 2^24 + 0xRRGGBB,
+where huePage is Munsell hue / 25 (0 = 10RP, 1 = 2.5R, ...).
+
+-}
+
+import Array exposing (Array)
+import Color
+import Dict exposing (Dict)
+import Munsell exposing (ColorDict, MunsellColor)
+
+
+rgbScale : Float
+rgbScale =
+    16777216
+
+
+unpackChip : Int -> MunsellColor
+unpackChip packed =
+    let
+        key =
+            floor (toFloat packed / rgbScale)
+
+        rgb =
+            packed - key * 16777216
+
+        hue =
+            25 * (key // 512)
+
+        value =
+            modBy 16 (key // 32)
+
+        chroma =
+            2 * modBy 32 key
+
+        hueName =
+            Munsell.munsellHueName hue |> Maybe.withDefault ""
+
+        name =
+            hueName ++ " " ++ String.fromInt value ++ "/" ++ String.fromInt chroma
+    in
+    { name = name
+    , hue = hueName
+    , value = value
+    , chroma = chroma
+    , color = Color.rgb255 (rgb // 65536) (modBy 256 (rgb // 256)) (modBy 256 rgb)
+    }
 
 
 munsellColors : ColorDict
 munsellColors =
+    packedChips
+        |> Array.foldl
+            (\packed acc ->
+                let
+                    chip =
+                        unpackChip packed
+                in
+                Dict.insert chip.name chip acc
+            )
+            Dict.empty
+
+
+{-| Chips with the given Munsell hue (0 to 975) and value, by increasing chroma.
+-}
+chipsForHueValue : Int -> Int -> List MunsellColor
+chipsForHueValue hue value =
+    case Dict.get (hue * 10 + value) chipIndex of
+        Just ( offset, count ) ->
+            Array.slice offset (offset + count) packedChips
+                |> Array.toList
+                |> List.map unpackChip
+
+        Nothing ->
+            []
+
+
+{-| Munsell hue \* 10 + value -> ( offset, count ) in packedChips
+-}
+chipIndex : Dict Int ( Int, Int )
+chipIndex =
     Dict.fromList
-        [ ( "10B 1/2", { name = "10B 1/2", hue = "10B", value = 1, chroma = 2, red = 0.0569, green = 0.1188, blue = 0.163 } )
-        , ( "10B 2/2", { name = "10B 2/2", hue = "10B", value = 2, chroma = 2, red = 0.1452, green = 0.2005, blue = 0.2424 } )
-        , ( "10B 2/4", { name = "10B 2/4", hue = "10B", value = 2, chroma = 4, red = 0.0605, green = 0.2062, blue = 0.2906 } )
-        , ( "10B 3/2", { name = "10B 3/2", hue = "10B", value = 3, chroma = 2, red = 0.2272, green = 0.2922, blue = 0.3389 } )
-        , ( "10B 3/4", { name = "10B 3/4", hue = "10B", value = 3, chroma = 4, red = 0.1495, green = 0.2989, blue = 0.391 } )
-        , ( "10B 4/2", { name = "10B 4/2", hue = "10B", value = 4, chroma = 2, red = 0.3287, green = 0.3895, blue = 0.4311 } )
-        , ( "10B 4/4", { name = "10B 4/4", hue = "10B", value = 4, chroma = 4, red = 0.2605, green = 0.3971, blue = 0.483 } )
-        , ( "10B 4/6", { name = "10B 4/6", hue = "10B", value = 4, chroma = 6, red = 0.1653, green = 0.4035, blue = 0.5323 } )
-        , ( "10B 5/2", { name = "10B 5/2", hue = "10B", value = 5, chroma = 2, red = 0.4308, green = 0.4906, blue = 0.5303 } )
-        , ( "10B 5/4", { name = "10B 5/4", hue = "10B", value = 5, chroma = 4, red = 0.3661, green = 0.4989, blue = 0.5814 } )
-        , ( "10B 5/6", { name = "10B 5/6", hue = "10B", value = 5, chroma = 6, red = 0.2836, green = 0.5062, blue = 0.6331 } )
-        , ( "10B 5/8", { name = "10B 5/8", hue = "10B", value = 5, chroma = 8, red = 0.1377, green = 0.5135, blue = 0.6858 } )
-        , ( "10B 6/2", { name = "10B 6/2", hue = "10B", value = 6, chroma = 2, red = 0.5334, green = 0.5934, blue = 0.6294 } )
-        , ( "10B 6/4", { name = "10B 6/4", hue = "10B", value = 6, chroma = 4, red = 0.4716, green = 0.6021, blue = 0.6797 } )
-        , ( "10B 6/6", { name = "10B 6/6", hue = "10B", value = 6, chroma = 6, red = 0.3888, green = 0.6109, blue = 0.7353 } )
-        , ( "10B 6/8", { name = "10B 6/8", hue = "10B", value = 6, chroma = 8, red = 0.279, green = 0.6184, blue = 0.7897 } )
-        , ( "10B 7/10", { name = "10B 7/10", hue = "10B", value = 7, chroma = 10, red = 0.2093, green = 0.7333, blue = 0.9582 } )
-        , ( "10B 7/2", { name = "10B 7/2", hue = "10B", value = 7, chroma = 2, red = 0.6383, green = 0.6968, blue = 0.7309 } )
-        , ( "10B 7/4", { name = "10B 7/4", hue = "10B", value = 7, chroma = 4, red = 0.5706, green = 0.7072, blue = 0.7839 } )
-        , ( "10B 7/6", { name = "10B 7/6", hue = "10B", value = 7, chroma = 6, red = 0.4925, green = 0.7163, blue = 0.8378 } )
-        , ( "10B 7/8", { name = "10B 7/8", hue = "10B", value = 7, chroma = 8, red = 0.3898, green = 0.7248, blue = 0.8956 } )
-        , ( "10B 8/2", { name = "10B 8/2", hue = "10B", value = 8, chroma = 2, red = 0.7432, green = 0.8019, blue = 0.8333 } )
-        , ( "10B 8/4", { name = "10B 8/4", hue = "10B", value = 8, chroma = 4, red = 0.6709, green = 0.8131, blue = 0.8926 } )
-        , ( "10B 8/6", { name = "10B 8/6", hue = "10B", value = 8, chroma = 6, red = 0.5845, green = 0.8239, blue = 0.9518 } )
-        , ( "10B 8/8", { name = "10B 8/8", hue = "10B", value = 8, chroma = 8, red = 0.4593, green = 0.8352, blue = 1 } )
-        , ( "10B 9/2", { name = "10B 9/2", hue = "10B", value = 9, chroma = 2, red = 0.8476, green = 0.91, blue = 0.9402 } )
-        , ( "10B 9/4", { name = "10B 9/4", hue = "10B", value = 9, chroma = 4, red = 0.7549, green = 0.9251, blue = 1 } )
-        , ( "10BG 1/2", { name = "10BG 1/2", hue = "10BG", value = 1, chroma = 2, red = 0.0384, green = 0.1245, blue = 0.1405 } )
-        , ( "10BG 2/2", { name = "10BG 2/2", hue = "10BG", value = 2, chroma = 2, red = 0.1302, green = 0.2065, blue = 0.2191 } )
-        , ( "10BG 3/2", { name = "10BG 3/2", hue = "10BG", value = 3, chroma = 2, red = 0.2065, green = 0.2999, blue = 0.3122 } )
-        , ( "10BG 3/4", { name = "10BG 3/4", hue = "10BG", value = 3, chroma = 4, red = 0.0506, green = 0.3144, blue = 0.3449 } )
-        , ( "10BG 4/2", { name = "10BG 4/2", hue = "10BG", value = 4, chroma = 2, red = 0.3003, green = 0.3987, blue = 0.4083 } )
-        , ( "10BG 4/4", { name = "10BG 4/4", hue = "10BG", value = 4, chroma = 4, red = 0.1801, green = 0.4146, blue = 0.4391 } )
-        , ( "10BG 5/2", { name = "10BG 5/2", hue = "10BG", value = 5, chroma = 2, red = 0.3988, green = 0.5008, blue = 0.5089 } )
-        , ( "10BG 5/4", { name = "10BG 5/4", hue = "10BG", value = 5, chroma = 4, red = 0.2957, green = 0.5169, blue = 0.537 } )
-        , ( "10BG 5/6", { name = "10BG 5/6", hue = "10BG", value = 5, chroma = 6, red = 0.1006, green = 0.5321, blue = 0.5671 } )
-        , ( "10BG 6/2", { name = "10BG 6/2", hue = "10BG", value = 6, chroma = 2, red = 0.4976, green = 0.6046, blue = 0.6095 } )
-        , ( "10BG 6/4", { name = "10BG 6/4", hue = "10BG", value = 6, chroma = 4, red = 0.3912, green = 0.6227, blue = 0.6382 } )
-        , ( "10BG 6/6", { name = "10BG 6/6", hue = "10BG", value = 6, chroma = 6, red = 0.2369, green = 0.639, blue = 0.6668 } )
-        , ( "10BG 7/2", { name = "10BG 7/2", hue = "10BG", value = 7, chroma = 2, red = 0.5989, green = 0.709, blue = 0.7118 } )
-        , ( "10BG 7/4", { name = "10BG 7/4", hue = "10BG", value = 7, chroma = 4, red = 0.4937, green = 0.7283, blue = 0.7383 } )
-        , ( "10BG 7/6", { name = "10BG 7/6", hue = "10BG", value = 7, chroma = 6, red = 0.374, green = 0.744, blue = 0.7628 } )
-        , ( "10BG 7/8", { name = "10BG 7/8", hue = "10BG", value = 7, chroma = 8, red = 0.1138, green = 0.7605, blue = 0.7916 } )
-        , ( "10BG 8/2", { name = "10BG 8/2", hue = "10BG", value = 8, chroma = 2, red = 0.7013, green = 0.8148, blue = 0.8153 } )
-        , ( "10BG 8/4", { name = "10BG 8/4", hue = "10BG", value = 8, chroma = 4, red = 0.5932, green = 0.8357, blue = 0.8409 } )
-        , ( "10BG 8/6", { name = "10BG 8/6", hue = "10BG", value = 8, chroma = 6, red = 0.461, green = 0.8544, blue = 0.867 } )
-        , ( "10BG 8/8", { name = "10BG 8/8", hue = "10BG", value = 8, chroma = 8, red = 0.2589, green = 0.8716, blue = 0.8929 } )
-        , ( "10BG 9/2", { name = "10BG 9/2", hue = "10BG", value = 9, chroma = 2, red = 0.8022, green = 0.9239, blue = 0.922 } )
-        , ( "10BG 9/4", { name = "10BG 9/4", hue = "10BG", value = 9, chroma = 4, red = 0.6818, green = 0.9476, blue = 0.95 } )
-        , ( "10BG 9/6", { name = "10BG 9/6", hue = "10BG", value = 9, chroma = 6, red = 0.5309, green = 0.9696, blue = 0.9772 } )
-        , ( "10G 1/2", { name = "10G 1/2", hue = "10G", value = 1, chroma = 2, red = 0.059, green = 0.1251, blue = 0.1093 } )
-        , ( "10G 2/2", { name = "10G 2/2", hue = "10G", value = 2, chroma = 2, red = 0.1424, green = 0.2073, blue = 0.1897 } )
-        , ( "10G 2/4", { name = "10G 2/4", hue = "10G", value = 2, chroma = 4, red = 0.0282, green = 0.2216, blue = 0.1861 } )
-        , ( "10G 3/2", { name = "10G 3/2", hue = "10G", value = 3, chroma = 2, red = 0.2193, green = 0.301, blue = 0.2775 } )
-        , ( "10G 3/4", { name = "10G 3/4", hue = "10G", value = 3, chroma = 4, red = 0.1059, green = 0.3182, blue = 0.2719 } )
-        , ( "10G 4/2", { name = "10G 4/2", hue = "10G", value = 4, chroma = 2, red = 0.3088, green = 0.4007, blue = 0.3722 } )
-        , ( "10G 4/4", { name = "10G 4/4", hue = "10G", value = 4, chroma = 4, red = 0.206, green = 0.4192, blue = 0.3649 } )
-        , ( "10G 5/2", { name = "10G 5/2", hue = "10G", value = 5, chroma = 2, red = 0.405, green = 0.5033, blue = 0.4716 } )
-        , ( "10G 5/4", { name = "10G 5/4", hue = "10G", value = 5, chroma = 4, red = 0.3111, green = 0.5223, blue = 0.463 } )
-        , ( "10G 5/6", { name = "10G 5/6", hue = "10G", value = 5, chroma = 6, red = 0.1839, green = 0.5382, blue = 0.4563 } )
-        , ( "10G 6/2", { name = "10G 6/2", hue = "10G", value = 6, chroma = 2, red = 0.501, green = 0.6079, blue = 0.5717 } )
-        , ( "10G 6/4", { name = "10G 6/4", hue = "10G", value = 6, chroma = 4, red = 0.4014, green = 0.629, blue = 0.5609 } )
-        , ( "10G 6/6", { name = "10G 6/6", hue = "10G", value = 6, chroma = 6, red = 0.291, green = 0.6453, blue = 0.5533 } )
-        , ( "10G 6/8", { name = "10G 6/8", hue = "10G", value = 6, chroma = 8, red = 0.0431, green = 0.6611, blue = 0.5459 } )
-        , ( "10G 7/2", { name = "10G 7/2", hue = "10G", value = 7, chroma = 2, red = 0.5989, green = 0.7131, blue = 0.6729 } )
-        , ( "10G 7/4", { name = "10G 7/4", hue = "10G", value = 7, chroma = 4, red = 0.5094, green = 0.7334, blue = 0.6614 } )
-        , ( "10G 7/6", { name = "10G 7/6", hue = "10G", value = 7, chroma = 6, red = 0.4049, green = 0.7513, blue = 0.6517 } )
-        , ( "10G 7/8", { name = "10G 7/8", hue = "10G", value = 7, chroma = 8, red = 0.2525, green = 0.7681, blue = 0.6435 } )
-        , ( "10G 8/10", { name = "10G 8/10", hue = "10G", value = 8, chroma = 10, red = 0.0786, green = 0.8948, blue = 0.734 } )
-        , ( "10G 8/2", { name = "10G 8/2", hue = "10G", value = 8, chroma = 2, red = 0.6978, green = 0.8199, blue = 0.7753 } )
-        , ( "10G 8/4", { name = "10G 8/4", hue = "10G", value = 8, chroma = 4, red = 0.6059, green = 0.8413, blue = 0.7627 } )
-        , ( "10G 8/6", { name = "10G 8/6", hue = "10G", value = 8, chroma = 6, red = 0.4956, green = 0.8613, blue = 0.7515 } )
-        , ( "10G 8/8", { name = "10G 8/8", hue = "10G", value = 8, chroma = 8, red = 0.3611, green = 0.8785, blue = 0.7423 } )
-        , ( "10G 9/10", { name = "10G 9/10", hue = "10G", value = 9, chroma = 10, red = 0.1987, green = 1, blue = 0.8328 } )
-        , ( "10G 9/2", { name = "10G 9/2", hue = "10G", value = 9, chroma = 2, red = 0.7973, green = 0.9296, blue = 0.8794 } )
-        , ( "10G 9/4", { name = "10G 9/4", hue = "10G", value = 9, chroma = 4, red = 0.6971, green = 0.9533, blue = 0.865 } )
-        , ( "10G 9/6", { name = "10G 9/6", hue = "10G", value = 9, chroma = 6, red = 0.5726, green = 0.9763, blue = 0.8521 } )
-        , ( "10G 9/8", { name = "10G 9/8", hue = "10G", value = 9, chroma = 8, red = 0.4221, green = 0.996, blue = 0.8403 } )
-        , ( "10GY 1/2", { name = "10GY 1/2", hue = "10GY", value = 1, chroma = 2, red = 0.0794, green = 0.1232, blue = 0.0891 } )
-        , ( "10GY 2/2", { name = "10GY 2/2", hue = "10GY", value = 2, chroma = 2, red = 0.1622, green = 0.2052, blue = 0.1661 } )
-        , ( "10GY 2/4", { name = "10GY 2/4", hue = "10GY", value = 2, chroma = 4, red = 0.1081, green = 0.2183, blue = 0.1266 } )
-        , ( "10GY 2/6", { name = "10GY 2/6", hue = "10GY", value = 2, chroma = 6, red = 0.0134, green = 0.2289, blue = 0.0848 } )
-        , ( "10GY 3/2", { name = "10GY 3/2", hue = "10GY", value = 3, chroma = 2, red = 0.2442, green = 0.2984, blue = 0.2454 } )
-        , ( "10GY 3/4", { name = "10GY 3/4", hue = "10GY", value = 3, chroma = 4, red = 0.1914, green = 0.3127, blue = 0.1991 } )
-        , ( "10GY 3/6", { name = "10GY 3/6", hue = "10GY", value = 3, chroma = 6, red = 0.1248, green = 0.3246, blue = 0.1504 } )
-        , ( "10GY 4/2", { name = "10GY 4/2", hue = "10GY", value = 4, chroma = 2, red = 0.3378, green = 0.3976, blue = 0.3336 } )
-        , ( "10GY 4/4", { name = "10GY 4/4", hue = "10GY", value = 4, chroma = 4, red = 0.2849, green = 0.4133, blue = 0.2808 } )
-        , ( "10GY 4/6", { name = "10GY 4/6", hue = "10GY", value = 4, chroma = 6, red = 0.2199, green = 0.4274, blue = 0.2231 } )
-        , ( "10GY 4/8", { name = "10GY 4/8", hue = "10GY", value = 4, chroma = 8, red = 0.1324, green = 0.4393, blue = 0.1622 } )
-        , ( "10GY 5/10", { name = "10GY 5/10", hue = "10GY", value = 5, chroma = 10, red = 0.1609, green = 0.5555, blue = 0.1865 } )
-        , ( "10GY 5/2", { name = "10GY 5/2", hue = "10GY", value = 5, chroma = 2, red = 0.4347, green = 0.5002, blue = 0.4295 } )
-        , ( "10GY 5/4", { name = "10GY 5/4", hue = "10GY", value = 5, chroma = 4, red = 0.3847, green = 0.5161, blue = 0.3766 } )
-        , ( "10GY 5/6", { name = "10GY 5/6", hue = "10GY", value = 5, chroma = 6, red = 0.3292, green = 0.5303, blue = 0.3189 } )
-        , ( "10GY 5/8", { name = "10GY 5/8", hue = "10GY", value = 5, chroma = 8, red = 0.259, green = 0.5436, blue = 0.2564 } )
-        , ( "10GY 6/10", { name = "10GY 6/10", hue = "10GY", value = 6, chroma = 10, red = 0.2898, green = 0.6625, blue = 0.281 } )
-        , ( "10GY 6/12", { name = "10GY 6/12", hue = "10GY", value = 6, chroma = 12, red = 0.1806, green = 0.6741, blue = 0.2049 } )
-        , ( "10GY 6/2", { name = "10GY 6/2", hue = "10GY", value = 6, chroma = 2, red = 0.5307, green = 0.6052, blue = 0.5237 } )
-        , ( "10GY 6/4", { name = "10GY 6/4", hue = "10GY", value = 6, chroma = 4, red = 0.4822, green = 0.6214, blue = 0.4676 } )
-        , ( "10GY 6/6", { name = "10GY 6/6", hue = "10GY", value = 6, chroma = 6, red = 0.4289, green = 0.6361, blue = 0.409 } )
-        , ( "10GY 6/8", { name = "10GY 6/8", hue = "10GY", value = 6, chroma = 8, red = 0.365, green = 0.6501, blue = 0.3456 } )
-        , ( "10GY 7/10", { name = "10GY 7/10", hue = "10GY", value = 7, chroma = 10, red = 0.4057, green = 0.7696, blue = 0.3757 } )
-        , ( "10GY 7/12", { name = "10GY 7/12", hue = "10GY", value = 7, chroma = 12, red = 0.3195, green = 0.7824, blue = 0.3021 } )
-        , ( "10GY 7/14", { name = "10GY 7/14", hue = "10GY", value = 7, chroma = 14, red = 0.1987, green = 0.7939, blue = 0.2171 } )
-        , ( "10GY 7/2", { name = "10GY 7/2", hue = "10GY", value = 7, chroma = 2, red = 0.6325, green = 0.7097, blue = 0.6223 } )
-        , ( "10GY 7/4", { name = "10GY 7/4", hue = "10GY", value = 7, chroma = 4, red = 0.5831, green = 0.7268, blue = 0.5625 } )
-        , ( "10GY 7/6", { name = "10GY 7/6", hue = "10GY", value = 7, chroma = 6, red = 0.5336, green = 0.7415, blue = 0.5049 } )
-        , ( "10GY 7/8", { name = "10GY 7/8", hue = "10GY", value = 7, chroma = 8, red = 0.4748, green = 0.756, blue = 0.442 } )
-        , ( "10GY 8/10", { name = "10GY 8/10", hue = "10GY", value = 8, chroma = 10, red = 0.5064, green = 0.8796, blue = 0.4641 } )
-        , ( "10GY 8/12", { name = "10GY 8/12", hue = "10GY", value = 8, chroma = 12, red = 0.4303, green = 0.8929, blue = 0.3899 } )
-        , ( "10GY 8/14", { name = "10GY 8/14", hue = "10GY", value = 8, chroma = 14, red = 0.3347, green = 0.9052, blue = 0.311 } )
-        , ( "10GY 8/16", { name = "10GY 8/16", hue = "10GY", value = 8, chroma = 16, red = 0.1836, green = 0.9169, blue = 0.213 } )
-        , ( "10GY 8/2", { name = "10GY 8/2", hue = "10GY", value = 8, chroma = 2, red = 0.7333, green = 0.8164, blue = 0.7196 } )
-        , ( "10GY 8/4", { name = "10GY 8/4", hue = "10GY", value = 8, chroma = 4, red = 0.6838, green = 0.834, blue = 0.657 } )
-        , ( "10GY 8/6", { name = "10GY 8/6", hue = "10GY", value = 8, chroma = 6, red = 0.6291, green = 0.8507, blue = 0.5926 } )
-        , ( "10GY 8/8", { name = "10GY 8/8", hue = "10GY", value = 8, chroma = 8, red = 0.5744, green = 0.8649, blue = 0.5336 } )
-        , ( "10GY 9/10", { name = "10GY 9/10", hue = "10GY", value = 9, chroma = 10, red = 0.5957, green = 0.9947, blue = 0.5385 } )
-        , ( "10GY 9/12", { name = "10GY 9/12", hue = "10GY", value = 9, chroma = 12, red = 0.5243, green = 1, blue = 0.4701 } )
-        , ( "10GY 9/14", { name = "10GY 9/14", hue = "10GY", value = 9, chroma = 14, red = 0.4348, green = 1, blue = 0.3891 } )
-        , ( "10GY 9/16", { name = "10GY 9/16", hue = "10GY", value = 9, chroma = 16, red = 0.3136, green = 1, blue = 0.2928 } )
-        , ( "10GY 9/18", { name = "10GY 9/18", hue = "10GY", value = 9, chroma = 18, red = 0.0612, green = 1, blue = 0.1601 } )
-        , ( "10GY 9/2", { name = "10GY 9/2", hue = "10GY", value = 9, chroma = 2, red = 0.8357, green = 0.9258, blue = 0.8186 } )
-        , ( "10GY 9/4", { name = "10GY 9/4", hue = "10GY", value = 9, chroma = 4, red = 0.783, green = 0.9449, blue = 0.7506 } )
-        , ( "10GY 9/6", { name = "10GY 9/6", hue = "10GY", value = 9, chroma = 6, red = 0.7185, green = 0.9646, blue = 0.6756 } )
-        , ( "10GY 9/8", { name = "10GY 9/8", hue = "10GY", value = 9, chroma = 8, red = 0.6638, green = 0.9792, blue = 0.6131 } )
-        , ( "10P 1/2", { name = "10P 1/2", hue = "10P", value = 1, chroma = 2, red = 0.1548, green = 0.0904, blue = 0.1529 } )
-        , ( "10P 1/4", { name = "10P 1/4", hue = "10P", value = 1, chroma = 4, red = 0.1792, green = 0.0704, blue = 0.1778 } )
-        , ( "10P 1/6", { name = "10P 1/6", hue = "10P", value = 1, chroma = 6, red = 0.2019, green = 0.0418, blue = 0.2016 } )
-        , ( "10P 2/10", { name = "10P 2/10", hue = "10P", value = 2, chroma = 10, red = 0.3494, green = 0.0505, blue = 0.3333 } )
-        , ( "10P 2/2", { name = "10P 2/2", hue = "10P", value = 2, chroma = 2, red = 0.2359, green = 0.1747, blue = 0.2281 } )
-        , ( "10P 2/4", { name = "10P 2/4", hue = "10P", value = 2, chroma = 4, red = 0.2645, green = 0.157, blue = 0.2533 } )
-        , ( "10P 2/6", { name = "10P 2/6", hue = "10P", value = 2, chroma = 6, red = 0.2912, green = 0.1355, blue = 0.2779 } )
-        , ( "10P 2/8", { name = "10P 2/8", hue = "10P", value = 2, chroma = 8, red = 0.3222, green = 0.1007, blue = 0.3076 } )
-        , ( "10P 3/10", { name = "10P 3/10", hue = "10P", value = 3, chroma = 10, red = 0.4647, green = 0.153, blue = 0.4315 } )
-        , ( "10P 3/12", { name = "10P 3/12", hue = "10P", value = 3, chroma = 12, red = 0.4965, green = 0.0953, blue = 0.4604 } )
-        , ( "10P 3/2", { name = "10P 3/2", hue = "10P", value = 3, chroma = 2, red = 0.332, green = 0.263, blue = 0.3191 } )
-        , ( "10P 3/4", { name = "10P 3/4", hue = "10P", value = 3, chroma = 4, red = 0.3688, green = 0.2423, blue = 0.3483 } )
-        , ( "10P 3/6", { name = "10P 3/6", hue = "10P", value = 3, chroma = 6, red = 0.4004, green = 0.2199, blue = 0.3749 } )
-        , ( "10P 3/8", { name = "10P 3/8", hue = "10P", value = 3, chroma = 8, red = 0.4339, green = 0.1899, blue = 0.4038 } )
-        , ( "10P 4/10", { name = "10P 4/10", hue = "10P", value = 4, chroma = 10, red = 0.5654, green = 0.2711, blue = 0.5175 } )
-        , ( "10P 4/12", { name = "10P 4/12", hue = "10P", value = 4, chroma = 12, red = 0.5975, green = 0.2377, blue = 0.5436 } )
-        , ( "10P 4/14", { name = "10P 4/14", hue = "10P", value = 4, chroma = 14, red = 0.6292, green = 0.1948, blue = 0.5703 } )
-        , ( "10P 4/16", { name = "10P 4/16", hue = "10P", value = 4, chroma = 16, red = 0.6588, green = 0.1384, blue = 0.595 } )
-        , ( "10P 4/2", { name = "10P 4/2", hue = "10P", value = 4, chroma = 2, red = 0.4264, green = 0.3624, blue = 0.4114 } )
-        , ( "10P 4/4", { name = "10P 4/4", hue = "10P", value = 4, chroma = 4, red = 0.4651, green = 0.3431, blue = 0.439 } )
-        , ( "10P 4/6", { name = "10P 4/6", hue = "10P", value = 4, chroma = 6, red = 0.5004, green = 0.3219, blue = 0.4657 } )
-        , ( "10P 4/8", { name = "10P 4/8", hue = "10P", value = 4, chroma = 8, red = 0.534, green = 0.298, blue = 0.492 } )
-        , ( "10P 5/10", { name = "10P 5/10", hue = "10P", value = 5, chroma = 10, red = 0.6748, green = 0.3776, blue = 0.6147 } )
-        , ( "10P 5/12", { name = "10P 5/12", hue = "10P", value = 5, chroma = 12, red = 0.7103, green = 0.3473, blue = 0.6425 } )
-        , ( "10P 5/14", { name = "10P 5/14", hue = "10P", value = 5, chroma = 14, red = 0.743, green = 0.3142, blue = 0.6679 } )
-        , ( "10P 5/16", { name = "10P 5/16", hue = "10P", value = 5, chroma = 16, red = 0.7755, green = 0.2742, blue = 0.6938 } )
-        , ( "10P 5/18", { name = "10P 5/18", hue = "10P", value = 5, chroma = 18, red = 0.8083, green = 0.2219, blue = 0.7206 } )
-        , ( "10P 5/2", { name = "10P 5/2", hue = "10P", value = 5, chroma = 2, red = 0.521, green = 0.4665, blue = 0.5065 } )
-        , ( "10P 5/20", { name = "10P 5/20", hue = "10P", value = 5, chroma = 20, red = 0.8421, green = 0.1423, blue = 0.7476 } )
-        , ( "10P 5/4", { name = "10P 5/4", hue = "10P", value = 5, chroma = 4, red = 0.5621, green = 0.4477, blue = 0.5329 } )
-        , ( "10P 5/6", { name = "10P 5/6", hue = "10P", value = 5, chroma = 6, red = 0.603, green = 0.4259, blue = 0.5611 } )
-        , ( "10P 5/8", { name = "10P 5/8", hue = "10P", value = 5, chroma = 8, red = 0.6419, green = 0.4016, blue = 0.5896 } )
-        , ( "10P 6/10", { name = "10P 6/10", hue = "10P", value = 6, chroma = 10, red = 0.7815, green = 0.4844, blue = 0.7147 } )
-        , ( "10P 6/12", { name = "10P 6/12", hue = "10P", value = 6, chroma = 12, red = 0.8173, green = 0.4581, blue = 0.7411 } )
-        , ( "10P 6/14", { name = "10P 6/14", hue = "10P", value = 6, chroma = 14, red = 0.856, green = 0.4253, blue = 0.7703 } )
-        , ( "10P 6/16", { name = "10P 6/16", hue = "10P", value = 6, chroma = 16, red = 0.89, green = 0.3915, blue = 0.797 } )
-        , ( "10P 6/18", { name = "10P 6/18", hue = "10P", value = 6, chroma = 18, red = 0.9227, green = 0.3531, blue = 0.8234 } )
-        , ( "10P 6/2", { name = "10P 6/2", hue = "10P", value = 6, chroma = 2, red = 0.6243, green = 0.5688, blue = 0.6075 } )
-        , ( "10P 6/20", { name = "10P 6/20", hue = "10P", value = 6, chroma = 20, red = 0.962, green = 0.2958, blue = 0.8549 } )
-        , ( "10P 6/22", { name = "10P 6/22", hue = "10P", value = 6, chroma = 22, red = 0.9975, green = 0.2252, blue = 0.8839 } )
-        , ( "10P 6/24", { name = "10P 6/24", hue = "10P", value = 6, chroma = 24, red = 1, green = 0.1123, blue = 0.9116 } )
-        , ( "10P 6/4", { name = "10P 6/4", hue = "10P", value = 6, chroma = 4, red = 0.6623, green = 0.5519, blue = 0.6334 } )
-        , ( "10P 6/6", { name = "10P 6/6", hue = "10P", value = 6, chroma = 6, red = 0.7059, green = 0.5303, blue = 0.6616 } )
-        , ( "10P 6/8", { name = "10P 6/8", hue = "10P", value = 6, chroma = 8, red = 0.7426, green = 0.5094, blue = 0.6872 } )
-        , ( "10P 7/10", { name = "10P 7/10", hue = "10P", value = 7, chroma = 10, red = 0.8943, green = 0.5874, blue = 0.8183 } )
-        , ( "10P 7/12", { name = "10P 7/12", hue = "10P", value = 7, chroma = 12, red = 0.9306, green = 0.5628, blue = 0.8445 } )
-        , ( "10P 7/14", { name = "10P 7/14", hue = "10P", value = 7, chroma = 14, red = 0.9706, green = 0.5324, blue = 0.8739 } )
-        , ( "10P 7/16", { name = "10P 7/16", hue = "10P", value = 7, chroma = 16, red = 1, green = 0.4957, blue = 0.9053 } )
-        , ( "10P 7/18", { name = "10P 7/18", hue = "10P", value = 7, chroma = 18, red = 1, green = 0.4558, blue = 0.9351 } )
-        , ( "10P 7/2", { name = "10P 7/2", hue = "10P", value = 7, chroma = 2, red = 0.7236, green = 0.6741, blue = 0.7074 } )
-        , ( "10P 7/20", { name = "10P 7/20", hue = "10P", value = 7, chroma = 20, red = 1, green = 0.4092, blue = 0.9657 } )
-        , ( "10P 7/22", { name = "10P 7/22", hue = "10P", value = 7, chroma = 22, red = 1, green = 0.3449, blue = 0.9998 } )
-        , ( "10P 7/4", { name = "10P 7/4", hue = "10P", value = 7, chroma = 4, red = 0.7675, green = 0.6556, blue = 0.7335 } )
-        , ( "10P 7/6", { name = "10P 7/6", hue = "10P", value = 7, chroma = 6, red = 0.811, green = 0.6348, blue = 0.7611 } )
-        , ( "10P 7/8", { name = "10P 7/8", hue = "10P", value = 7, chroma = 8, red = 0.8536, green = 0.612, blue = 0.79 } )
-        , ( "10P 8/10", { name = "10P 8/10", hue = "10P", value = 8, chroma = 10, red = 1, green = 0.6889, blue = 0.9271 } )
-        , ( "10P 8/12", { name = "10P 8/12", hue = "10P", value = 8, chroma = 12, red = 1, green = 0.6609, blue = 0.9572 } )
-        , ( "10P 8/14", { name = "10P 8/14", hue = "10P", value = 8, chroma = 14, red = 1, green = 0.626, blue = 0.9917 } )
-        , ( "10P 8/2", { name = "10P 8/2", hue = "10P", value = 8, chroma = 2, red = 0.8234, green = 0.7809, blue = 0.8081 } )
-        , ( "10P 8/4", { name = "10P 8/4", hue = "10P", value = 8, chroma = 4, red = 0.8724, green = 0.7609, blue = 0.8363 } )
-        , ( "10P 8/6", { name = "10P 8/6", hue = "10P", value = 8, chroma = 6, red = 0.919, green = 0.7394, blue = 0.8654 } )
-        , ( "10P 8/8", { name = "10P 8/8", hue = "10P", value = 8, chroma = 8, red = 0.967, green = 0.7146, blue = 0.8968 } )
-        , ( "10P 9/2", { name = "10P 9/2", hue = "10P", value = 9, chroma = 2, red = 0.9304, green = 0.8883, blue = 0.9149 } )
-        , ( "10P 9/4", { name = "10P 9/4", hue = "10P", value = 9, chroma = 4, red = 0.9871, green = 0.8654, blue = 0.9457 } )
-        , ( "10P 9/6", { name = "10P 9/6", hue = "10P", value = 9, chroma = 6, red = 1, green = 0.8416, blue = 0.9765 } )
-        , ( "10PB 1/10", { name = "10PB 1/10", hue = "10PB", value = 1, chroma = 10, red = 0.1594, green = 0.0239, blue = 0.3083 } )
-        , ( "10PB 1/2", { name = "10PB 1/2", hue = "10PB", value = 1, chroma = 2, red = 0.1208, green = 0.1018, blue = 0.1694 } )
-        , ( "10PB 1/4", { name = "10PB 1/4", hue = "10PB", value = 1, chroma = 4, red = 0.1275, green = 0.0913, blue = 0.2068 } )
-        , ( "10PB 1/6", { name = "10PB 1/6", hue = "10PB", value = 1, chroma = 6, red = 0.1358, green = 0.0765, blue = 0.2443 } )
-        , ( "10PB 1/8", { name = "10PB 1/8", hue = "10PB", value = 1, chroma = 8, red = 0.146, green = 0.0574, blue = 0.276 } )
-        , ( "10PB 2/10", { name = "10PB 2/10", hue = "10PB", value = 2, chroma = 10, red = 0.2289, green = 0.1299, blue = 0.4164 } )
-        , ( "10PB 2/12", { name = "10PB 2/12", hue = "10PB", value = 2, chroma = 12, red = 0.241, green = 0.1064, blue = 0.4504 } )
-        , ( "10PB 2/14", { name = "10PB 2/14", hue = "10PB", value = 2, chroma = 14, red = 0.2551, green = 0.0702, blue = 0.4863 } )
-        , ( "10PB 2/2", { name = "10PB 2/2", hue = "10PB", value = 2, chroma = 2, red = 0.1996, green = 0.1851, blue = 0.2487 } )
-        , ( "10PB 2/4", { name = "10PB 2/4", hue = "10PB", value = 2, chroma = 4, red = 0.2049, green = 0.1757, blue = 0.2922 } )
-        , ( "10PB 2/6", { name = "10PB 2/6", hue = "10PB", value = 2, chroma = 6, red = 0.2109, green = 0.1646, blue = 0.3328 } )
-        , ( "10PB 2/8", { name = "10PB 2/8", hue = "10PB", value = 2, chroma = 8, red = 0.2177, green = 0.1497, blue = 0.3765 } )
-        , ( "10PB 3/10", { name = "10PB 3/10", hue = "10PB", value = 3, chroma = 10, red = 0.3088, green = 0.2276, blue = 0.5302 } )
-        , ( "10PB 3/12", { name = "10PB 3/12", hue = "10PB", value = 3, chroma = 12, red = 0.3171, green = 0.2114, blue = 0.5677 } )
-        , ( "10PB 3/14", { name = "10PB 3/14", hue = "10PB", value = 3, chroma = 14, red = 0.3298, green = 0.1877, blue = 0.6101 } )
-        , ( "10PB 3/16", { name = "10PB 3/16", hue = "10PB", value = 3, chroma = 16, red = 0.344, green = 0.1574, blue = 0.651 } )
-        , ( "10PB 3/18", { name = "10PB 3/18", hue = "10PB", value = 3, chroma = 18, red = 0.3584, green = 0.1216, blue = 0.6853 } )
-        , ( "10PB 3/2", { name = "10PB 3/2", hue = "10PB", value = 3, chroma = 2, red = 0.2886, green = 0.2748, blue = 0.3451 } )
-        , ( "10PB 3/20", { name = "10PB 3/20", hue = "10PB", value = 3, chroma = 20, red = 0.3733, green = 0.064, blue = 0.7207 } )
-        , ( "10PB 3/4", { name = "10PB 3/4", hue = "10PB", value = 3, chroma = 4, red = 0.2917, green = 0.2659, blue = 0.3943 } )
-        , ( "10PB 3/6", { name = "10PB 3/6", hue = "10PB", value = 3, chroma = 6, red = 0.2961, green = 0.2556, blue = 0.44 } )
-        , ( "10PB 3/8", { name = "10PB 3/8", hue = "10PB", value = 3, chroma = 8, red = 0.3016, green = 0.2433, blue = 0.4842 } )
-        , ( "10PB 4/10", { name = "10PB 4/10", hue = "10PB", value = 4, chroma = 10, red = 0.3934, green = 0.3354, blue = 0.6274 } )
-        , ( "10PB 4/12", { name = "10PB 4/12", hue = "10PB", value = 4, chroma = 12, red = 0.3987, green = 0.3217, blue = 0.673 } )
-        , ( "10PB 4/14", { name = "10PB 4/14", hue = "10PB", value = 4, chroma = 14, red = 0.4047, green = 0.306, blue = 0.7176 } )
-        , ( "10PB 4/16", { name = "10PB 4/16", hue = "10PB", value = 4, chroma = 16, red = 0.4173, green = 0.2863, blue = 0.7584 } )
-        , ( "10PB 4/18", { name = "10PB 4/18", hue = "10PB", value = 4, chroma = 18, red = 0.4281, green = 0.2643, blue = 0.7997 } )
-        , ( "10PB 4/2", { name = "10PB 4/2", hue = "10PB", value = 4, chroma = 2, red = 0.384, green = 0.3733, blue = 0.4376 } )
-        , ( "10PB 4/20", { name = "10PB 4/20", hue = "10PB", value = 4, chroma = 20, red = 0.4427, green = 0.2335, blue = 0.8453 } )
-        , ( "10PB 4/22", { name = "10PB 4/22", hue = "10PB", value = 4, chroma = 22, red = 0.455, green = 0.2052, blue = 0.8783 } )
-        , ( "10PB 4/24", { name = "10PB 4/24", hue = "10PB", value = 4, chroma = 24, red = 0.4692, green = 0.1641, blue = 0.916 } )
-        , ( "10PB 4/26", { name = "10PB 4/26", hue = "10PB", value = 4, chroma = 26, red = 0.4872, green = 0.0892, blue = 0.9588 } )
-        , ( "10PB 4/4", { name = "10PB 4/4", hue = "10PB", value = 4, chroma = 4, red = 0.3862, green = 0.3656, blue = 0.4859 } )
-        , ( "10PB 4/6", { name = "10PB 4/6", hue = "10PB", value = 4, chroma = 6, red = 0.3882, green = 0.3568, blue = 0.5345 } )
-        , ( "10PB 4/8", { name = "10PB 4/8", hue = "10PB", value = 4, chroma = 8, red = 0.3908, green = 0.3468, blue = 0.5811 } )
-        , ( "10PB 5/10", { name = "10PB 5/10", hue = "10PB", value = 5, chroma = 10, red = 0.4881, green = 0.441, blue = 0.7312 } )
-        , ( "10PB 5/12", { name = "10PB 5/12", hue = "10PB", value = 5, chroma = 12, red = 0.4903, green = 0.4294, blue = 0.7802 } )
-        , ( "10PB 5/14", { name = "10PB 5/14", hue = "10PB", value = 5, chroma = 14, red = 0.4932, green = 0.4159, blue = 0.8296 } )
-        , ( "10PB 5/16", { name = "10PB 5/16", hue = "10PB", value = 5, chroma = 16, red = 0.4972, green = 0.4006, blue = 0.8786 } )
-        , ( "10PB 5/18", { name = "10PB 5/18", hue = "10PB", value = 5, chroma = 18, red = 0.5052, green = 0.3842, blue = 0.9199 } )
-        , ( "10PB 5/2", { name = "10PB 5/2", hue = "10PB", value = 5, chroma = 2, red = 0.4828, green = 0.4758, blue = 0.5317 } )
-        , ( "10PB 5/20", { name = "10PB 5/20", hue = "10PB", value = 5, chroma = 20, red = 0.5141, green = 0.3634, blue = 0.9669 } )
-        , ( "10PB 5/22", { name = "10PB 5/22", hue = "10PB", value = 5, chroma = 22, red = 0.5288, green = 0.3368, blue = 1 } )
-        , ( "10PB 5/4", { name = "10PB 5/4", hue = "10PB", value = 5, chroma = 4, red = 0.4831, green = 0.4688, blue = 0.5822 } )
-        , ( "10PB 5/6", { name = "10PB 5/6", hue = "10PB", value = 5, chroma = 6, red = 0.4847, green = 0.4599, blue = 0.6365 } )
-        , ( "10PB 5/8", { name = "10PB 5/8", hue = "10PB", value = 5, chroma = 8, red = 0.4846, green = 0.4514, blue = 0.6847 } )
-        , ( "10PB 6/10", { name = "10PB 6/10", hue = "10PB", value = 6, chroma = 10, red = 0.5819, green = 0.5476, blue = 0.837 } )
-        , ( "10PB 6/12", { name = "10PB 6/12", hue = "10PB", value = 6, chroma = 12, red = 0.5819, green = 0.5364, blue = 0.8929 } )
-        , ( "10PB 6/14", { name = "10PB 6/14", hue = "10PB", value = 6, chroma = 14, red = 0.5826, green = 0.5239, blue = 0.9473 } )
-        , ( "10PB 6/16", { name = "10PB 6/16", hue = "10PB", value = 6, chroma = 16, red = 0.587, green = 0.5065, blue = 1 } )
-        , ( "10PB 6/2", { name = "10PB 6/2", hue = "10PB", value = 6, chroma = 2, red = 0.5844, green = 0.5789, blue = 0.6304 } )
-        , ( "10PB 6/4", { name = "10PB 6/4", hue = "10PB", value = 6, chroma = 4, red = 0.5829, green = 0.5726, blue = 0.6823 } )
-        , ( "10PB 6/6", { name = "10PB 6/6", hue = "10PB", value = 6, chroma = 6, red = 0.5818, green = 0.5649, blue = 0.7369 } )
-        , ( "10PB 6/8", { name = "10PB 6/8", hue = "10PB", value = 6, chroma = 8, red = 0.5812, green = 0.5571, blue = 0.786 } )
-        , ( "10PB 7/10", { name = "10PB 7/10", hue = "10PB", value = 7, chroma = 10, red = 0.6782, green = 0.6512, blue = 0.9602 } )
-        , ( "10PB 7/12", { name = "10PB 7/12", hue = "10PB", value = 7, chroma = 12, red = 0.6799, green = 0.6382, blue = 1 } )
-        , ( "10PB 7/2", { name = "10PB 7/2", hue = "10PB", value = 7, chroma = 2, red = 0.6859, green = 0.6832, blue = 0.7311 } )
-        , ( "10PB 7/4", { name = "10PB 7/4", hue = "10PB", value = 7, chroma = 4, red = 0.6829, green = 0.677, blue = 0.7867 } )
-        , ( "10PB 7/6", { name = "10PB 7/6", hue = "10PB", value = 7, chroma = 6, red = 0.681, green = 0.6698, blue = 0.8418 } )
-        , ( "10PB 7/8", { name = "10PB 7/8", hue = "10PB", value = 7, chroma = 8, red = 0.6802, green = 0.6611, blue = 0.8993 } )
-        , ( "10PB 8/2", { name = "10PB 8/2", hue = "10PB", value = 8, chroma = 2, red = 0.7914, green = 0.7883, blue = 0.8309 } )
-        , ( "10PB 8/4", { name = "10PB 8/4", hue = "10PB", value = 8, chroma = 4, red = 0.7864, green = 0.7824, blue = 0.8905 } )
-        , ( "10PB 8/6", { name = "10PB 8/6", hue = "10PB", value = 8, chroma = 6, red = 0.7825, green = 0.7745, blue = 0.9563 } )
-        , ( "10PB 8/8", { name = "10PB 8/8", hue = "10PB", value = 8, chroma = 8, red = 0.7823, green = 0.7636, blue = 1 } )
-        , ( "10PB 9/2", { name = "10PB 9/2", hue = "10PB", value = 9, chroma = 2, red = 0.8987, green = 0.8957, blue = 0.9364 } )
-        , ( "10PB 9/4", { name = "10PB 9/4", hue = "10PB", value = 9, chroma = 4, red = 0.8917, green = 0.8888, blue = 1 } )
-        , ( "10R 1/2", { name = "10R 1/2", hue = "10R", value = 1, chroma = 2, red = 0.1789, green = 0.0863, blue = 0.09 } )
-        , ( "10R 1/4", { name = "10R 1/4", hue = "10R", value = 1, chroma = 4, red = 0.2207, green = 0.0546, blue = 0.0725 } )
-        , ( "10R 2/2", { name = "10R 2/2", hue = "10R", value = 2, chroma = 2, red = 0.2586, green = 0.1728, blue = 0.1628 } )
-        , ( "10R 2/4", { name = "10R 2/4", hue = "10R", value = 2, chroma = 4, red = 0.3064, green = 0.1489, blue = 0.1329 } )
-        , ( "10R 2/6", { name = "10R 2/6", hue = "10R", value = 2, chroma = 6, red = 0.3457, green = 0.1202, blue = 0.1037 } )
-        , ( "10R 2/8", { name = "10R 2/8", hue = "10R", value = 2, chroma = 8, red = 0.3857, green = 0.0734, blue = 0.072 } )
-        , ( "10R 3/10", { name = "10R 3/10", hue = "10R", value = 3, chroma = 10, red = 0.539, green = 0.1335, blue = 0.0658 } )
-        , ( "10R 3/2", { name = "10R 3/2", hue = "10R", value = 3, chroma = 2, red = 0.3585, green = 0.2612, blue = 0.2415 } )
-        , ( "10R 3/4", { name = "10R 3/4", hue = "10R", value = 3, chroma = 4, red = 0.4131, green = 0.2374, blue = 0.202 } )
-        , ( "10R 3/6", { name = "10R 3/6", hue = "10R", value = 3, chroma = 6, red = 0.4583, green = 0.2109, blue = 0.1621 } )
-        , ( "10R 3/8", { name = "10R 3/8", hue = "10R", value = 3, chroma = 8, red = 0.5008, green = 0.1771, blue = 0.1171 } )
-        , ( "10R 4/10", { name = "10R 4/10", hue = "10R", value = 4, chroma = 10, red = 0.6508, green = 0.2542, blue = 0.1431 } )
-        , ( "10R 4/12", { name = "10R 4/12", hue = "10R", value = 4, chroma = 12, red = 0.6857, green = 0.2204, blue = 0.0697 } )
-        , ( "10R 4/2", { name = "10R 4/2", hue = "10R", value = 4, chroma = 2, red = 0.4559, green = 0.3595, blue = 0.3377 } )
-        , ( "10R 4/4", { name = "10R 4/4", hue = "10R", value = 4, chroma = 4, red = 0.517, green = 0.3362, blue = 0.2916 } )
-        , ( "10R 4/6", { name = "10R 4/6", hue = "10R", value = 4, chroma = 6, red = 0.5653, green = 0.3127, blue = 0.2465 } )
-        , ( "10R 4/8", { name = "10R 4/8", hue = "10R", value = 4, chroma = 8, red = 0.6106, green = 0.2852, blue = 0.197 } )
-        , ( "10R 5/10", { name = "10R 5/10", hue = "10R", value = 5, chroma = 10, red = 0.7699, green = 0.3617, blue = 0.2248 } )
-        , ( "10R 5/12", { name = "10R 5/12", hue = "10R", value = 5, chroma = 12, red = 0.8107, green = 0.3307, blue = 0.1554 } )
-        , ( "10R 5/14", { name = "10R 5/14", hue = "10R", value = 5, chroma = 14, red = 0.8433, green = 0.3008, blue = 0.0722 } )
-        , ( "10R 5/2", { name = "10R 5/2", hue = "10R", value = 5, chroma = 2, red = 0.5518, green = 0.4629, blue = 0.4393 } )
-        , ( "10R 5/4", { name = "10R 5/4", hue = "10R", value = 5, chroma = 4, red = 0.6165, green = 0.4408, blue = 0.3901 } )
-        , ( "10R 5/6", { name = "10R 5/6", hue = "10R", value = 5, chroma = 6, red = 0.6733, green = 0.4168, blue = 0.3386 } )
-        , ( "10R 5/8", { name = "10R 5/8", hue = "10R", value = 5, chroma = 8, red = 0.7242, green = 0.3904, blue = 0.2847 } )
-        , ( "10R 6/10", { name = "10R 6/10", hue = "10R", value = 6, chroma = 10, red = 0.882, green = 0.4708, blue = 0.3265 } )
-        , ( "10R 6/12", { name = "10R 6/12", hue = "10R", value = 6, chroma = 12, red = 0.9269, green = 0.4423, blue = 0.2621 } )
-        , ( "10R 6/14", { name = "10R 6/14", hue = "10R", value = 6, chroma = 14, red = 0.9681, green = 0.4117, blue = 0.1856 } )
-        , ( "10R 6/16", { name = "10R 6/16", hue = "10R", value = 6, chroma = 16, red = 1, green = 0.3816, blue = 0.0775 } )
-        , ( "10R 6/2", { name = "10R 6/2", hue = "10R", value = 6, chroma = 2, red = 0.6567, green = 0.565, blue = 0.5393 } )
-        , ( "10R 6/4", { name = "10R 6/4", hue = "10R", value = 6, chroma = 4, red = 0.723, green = 0.5437, blue = 0.4882 } )
-        , ( "10R 6/6", { name = "10R 6/6", hue = "10R", value = 6, chroma = 6, red = 0.7787, green = 0.5222, blue = 0.4391 } )
-        , ( "10R 6/8", { name = "10R 6/8", hue = "10R", value = 6, chroma = 8, red = 0.8313, green = 0.498, blue = 0.3869 } )
-        , ( "10R 7/10", { name = "10R 7/10", hue = "10R", value = 7, chroma = 10, red = 0.9968, green = 0.5766, blue = 0.4263 } )
-        , ( "10R 7/12", { name = "10R 7/12", hue = "10R", value = 7, chroma = 12, red = 1, green = 0.5478, blue = 0.3576 } )
-        , ( "10R 7/14", { name = "10R 7/14", hue = "10R", value = 7, chroma = 14, red = 1, green = 0.5177, blue = 0.2845 } )
-        , ( "10R 7/16", { name = "10R 7/16", hue = "10R", value = 7, chroma = 16, red = 1, green = 0.4862, blue = 0.1936 } )
-        , ( "10R 7/2", { name = "10R 7/2", hue = "10R", value = 7, chroma = 2, red = 0.7571, green = 0.6697, blue = 0.6441 } )
-        , ( "10R 7/4", { name = "10R 7/4", hue = "10R", value = 7, chroma = 4, red = 0.827, green = 0.6483, blue = 0.5907 } )
-        , ( "10R 7/6", { name = "10R 7/6", hue = "10R", value = 7, chroma = 6, red = 0.8894, green = 0.6256, blue = 0.5373 } )
-        , ( "10R 7/8", { name = "10R 7/8", hue = "10R", value = 7, chroma = 8, red = 0.9481, green = 0.6006, blue = 0.4806 } )
-        , ( "10R 8/10", { name = "10R 8/10", hue = "10R", value = 8, chroma = 10, red = 1, green = 0.6785, blue = 0.5139 } )
-        , ( "10R 8/2", { name = "10R 8/2", hue = "10R", value = 8, chroma = 2, red = 0.8537, green = 0.777, blue = 0.7529 } )
-        , ( "10R 8/4", { name = "10R 8/4", hue = "10R", value = 8, chroma = 4, red = 0.9381, green = 0.7521, blue = 0.6902 } )
-        , ( "10R 8/6", { name = "10R 8/6", hue = "10R", value = 8, chroma = 6, red = 1, green = 0.7291, blue = 0.6327 } )
-        , ( "10R 8/8", { name = "10R 8/8", hue = "10R", value = 8, chroma = 8, red = 1, green = 0.7038, blue = 0.5716 } )
-        , ( "10R 9/2", { name = "10R 9/2", hue = "10R", value = 9, chroma = 2, red = 0.9626, green = 0.884, blue = 0.8582 } )
-        , ( "10R 9/4", { name = "10R 9/4", hue = "10R", value = 9, chroma = 4, red = 1, green = 0.8568, blue = 0.7875 } )
-        , ( "10R 9/6", { name = "10R 9/6", hue = "10R", value = 9, chroma = 6, red = 1, green = 0.8319, blue = 0.7248 } )
-        , ( "10RP 1/2", { name = "10RP 1/2", hue = "10RP", value = 1, chroma = 2, red = 0.1725, green = 0.0855, blue = 0.1249 } )
-        , ( "10RP 1/4", { name = "10RP 1/4", hue = "10RP", value = 1, chroma = 4, red = 0.2066, green = 0.0578, blue = 0.1353 } )
-        , ( "10RP 1/6", { name = "10RP 1/6", hue = "10RP", value = 1, chroma = 6, red = 0.2367, green = 0.01, blue = 0.1465 } )
-        , ( "10RP 2/2", { name = "10RP 2/2", hue = "10RP", value = 2, chroma = 2, red = 0.255, green = 0.1707, blue = 0.1957 } )
-        , ( "10RP 2/4", { name = "10RP 2/4", hue = "10RP", value = 2, chroma = 4, red = 0.2973, green = 0.1466, blue = 0.1994 } )
-        , ( "10RP 2/6", { name = "10RP 2/6", hue = "10RP", value = 2, chroma = 6, red = 0.3351, green = 0.116, blue = 0.2038 } )
-        , ( "10RP 2/8", { name = "10RP 2/8", hue = "10RP", value = 2, chroma = 8, red = 0.3745, green = 0.0635, blue = 0.2105 } )
-        , ( "10RP 3/10", { name = "10RP 3/10", hue = "10RP", value = 3, chroma = 10, red = 0.5452, green = 0.091, blue = 0.2601 } )
-        , ( "10RP 3/2", { name = "10RP 3/2", hue = "10RP", value = 3, chroma = 2, red = 0.3555, green = 0.2588, blue = 0.2752 } )
-        , ( "10RP 3/4", { name = "10RP 3/4", hue = "10RP", value = 3, chroma = 4, red = 0.4096, green = 0.232, blue = 0.269 } )
-        , ( "10RP 3/6", { name = "10RP 3/6", hue = "10RP", value = 3, chroma = 6, red = 0.4561, green = 0.2008, blue = 0.2646 } )
-        , ( "10RP 3/8", { name = "10RP 3/8", hue = "10RP", value = 3, chroma = 8, red = 0.5028, green = 0.1565, blue = 0.2616 } )
-        , ( "10RP 4/10", { name = "10RP 4/10", hue = "10RP", value = 4, chroma = 10, red = 0.6497, green = 0.2332, blue = 0.3436 } )
-        , ( "10RP 4/12", { name = "10RP 4/12", hue = "10RP", value = 4, chroma = 12, red = 0.6947, green = 0.1768, blue = 0.3396 } )
-        , ( "10RP 4/14", { name = "10RP 4/14", hue = "10RP", value = 4, chroma = 14, red = 0.7358, green = 0.0887, blue = 0.3375 } )
-        , ( "10RP 4/2", { name = "10RP 4/2", hue = "10RP", value = 4, chroma = 2, red = 0.4496, green = 0.3584, blue = 0.3709 } )
-        , ( "10RP 4/4", { name = "10RP 4/4", hue = "10RP", value = 4, chroma = 4, red = 0.5071, green = 0.3336, blue = 0.3623 } )
-        , ( "10RP 4/6", { name = "10RP 4/6", hue = "10RP", value = 4, chroma = 6, red = 0.5582, green = 0.3057, blue = 0.3548 } )
-        , ( "10RP 4/8", { name = "10RP 4/8", hue = "10RP", value = 4, chroma = 8, red = 0.6075, green = 0.2713, blue = 0.3484 } )
-        , ( "10RP 5/10", { name = "10RP 5/10", hue = "10RP", value = 5, chroma = 10, red = 0.7641, green = 0.3453, blue = 0.4329 } )
-        , ( "10RP 5/12", { name = "10RP 5/12", hue = "10RP", value = 5, chroma = 12, red = 0.8151, green = 0.2988, blue = 0.4261 } )
-        , ( "10RP 5/14", { name = "10RP 5/14", hue = "10RP", value = 5, chroma = 14, red = 0.8542, green = 0.2526, blue = 0.4218 } )
-        , ( "10RP 5/16", { name = "10RP 5/16", hue = "10RP", value = 5, chroma = 16, red = 0.9001, green = 0.1751, blue = 0.4175 } )
-        , ( "10RP 5/2", { name = "10RP 5/2", hue = "10RP", value = 5, chroma = 2, red = 0.5434, green = 0.4626, blue = 0.4712 } )
-        , ( "10RP 5/4", { name = "10RP 5/4", hue = "10RP", value = 5, chroma = 4, red = 0.6059, green = 0.4383, blue = 0.4597 } )
-        , ( "10RP 5/6", { name = "10RP 5/6", hue = "10RP", value = 5, chroma = 6, red = 0.6631, green = 0.4109, blue = 0.4495 } )
-        , ( "10RP 5/8", { name = "10RP 5/8", hue = "10RP", value = 5, chroma = 8, red = 0.7169, green = 0.3793, blue = 0.4401 } )
-        , ( "10RP 6/10", { name = "10RP 6/10", hue = "10RP", value = 6, chroma = 10, red = 0.8714, green = 0.4579, blue = 0.5285 } )
-        , ( "10RP 6/12", { name = "10RP 6/12", hue = "10RP", value = 6, chroma = 12, red = 0.922, green = 0.421, blue = 0.5194 } )
-        , ( "10RP 6/14", { name = "10RP 6/14", hue = "10RP", value = 6, chroma = 14, red = 0.968, green = 0.3805, blue = 0.512 } )
-        , ( "10RP 6/16", { name = "10RP 6/16", hue = "10RP", value = 6, chroma = 16, red = 1, green = 0.3201, blue = 0.5033 } )
-        , ( "10RP 6/18", { name = "10RP 6/18", hue = "10RP", value = 6, chroma = 18, red = 1, green = 0.2547, blue = 0.4976 } )
-        , ( "10RP 6/2", { name = "10RP 6/2", hue = "10RP", value = 6, chroma = 2, red = 0.6447, green = 0.5657, blue = 0.5729 } )
-        , ( "10RP 6/4", { name = "10RP 6/4", hue = "10RP", value = 6, chroma = 4, red = 0.7069, green = 0.5429, blue = 0.5608 } )
-        , ( "10RP 6/6", { name = "10RP 6/6", hue = "10RP", value = 6, chroma = 6, red = 0.7689, green = 0.5157, blue = 0.5485 } )
-        , ( "10RP 6/8", { name = "10RP 6/8", hue = "10RP", value = 6, chroma = 8, red = 0.8172, green = 0.4908, blue = 0.5388 } )
-        , ( "10RP 7/10", { name = "10RP 7/10", hue = "10RP", value = 7, chroma = 10, red = 0.9866, green = 0.5632, blue = 0.6251 } )
-        , ( "10RP 7/12", { name = "10RP 7/12", hue = "10RP", value = 7, chroma = 12, red = 1, green = 0.5228, blue = 0.613 } )
-        , ( "10RP 7/14", { name = "10RP 7/14", hue = "10RP", value = 7, chroma = 14, red = 1, green = 0.4808, blue = 0.6026 } )
-        , ( "10RP 7/16", { name = "10RP 7/16", hue = "10RP", value = 7, chroma = 16, red = 1, green = 0.4314, blue = 0.5931 } )
-        , ( "10RP 7/2", { name = "10RP 7/2", hue = "10RP", value = 7, chroma = 2, red = 0.7452, green = 0.6703, blue = 0.676 } )
-        , ( "10RP 7/4", { name = "10RP 7/4", hue = "10RP", value = 7, chroma = 4, red = 0.8091, green = 0.6479, blue = 0.6634 } )
-        , ( "10RP 7/6", { name = "10RP 7/6", hue = "10RP", value = 7, chroma = 6, red = 0.8725, green = 0.622, blue = 0.6498 } )
-        , ( "10RP 7/8", { name = "10RP 7/8", hue = "10RP", value = 7, chroma = 8, red = 0.9323, green = 0.5934, blue = 0.6364 } )
-        , ( "10RP 8/10", { name = "10RP 8/10", hue = "10RP", value = 8, chroma = 10, red = 1, green = 0.6625, blue = 0.723 } )
-        , ( "10RP 8/2", { name = "10RP 8/2", hue = "10RP", value = 8, chroma = 2, red = 0.8419, green = 0.7778, blue = 0.7824 } )
-        , ( "10RP 8/4", { name = "10RP 8/4", hue = "10RP", value = 8, chroma = 4, red = 0.9169, green = 0.7525, blue = 0.7659 } )
-        , ( "10RP 8/6", { name = "10RP 8/6", hue = "10RP", value = 8, chroma = 6, red = 0.9848, green = 0.7257, blue = 0.7511 } )
-        , ( "10RP 8/8", { name = "10RP 8/8", hue = "10RP", value = 8, chroma = 8, red = 1, green = 0.6944, blue = 0.736 } )
-        , ( "10RP 9/2", { name = "10RP 9/2", hue = "10RP", value = 9, chroma = 2, red = 0.9488, green = 0.8852, blue = 0.889 } )
-        , ( "10RP 9/4", { name = "10RP 9/4", hue = "10RP", value = 9, chroma = 4, red = 1, green = 0.857, blue = 0.8699 } )
-        , ( "10RP 9/6", { name = "10RP 9/6", hue = "10RP", value = 9, chroma = 6, red = 1, green = 0.8269, blue = 0.8526 } )
-        , ( "10Y 1/2", { name = "10Y 1/2", hue = "10Y", value = 1, chroma = 2, red = 0.1193, green = 0.1159, blue = 0.0468 } )
-        , ( "10Y 2/2", { name = "10Y 2/2", hue = "10Y", value = 2, chroma = 2, red = 0.2008, green = 0.1975, blue = 0.1317 } )
-        , ( "10Y 2/4", { name = "10Y 2/4", hue = "10Y", value = 2, chroma = 4, red = 0.2073, green = 0.2006, blue = 0.016 } )
-        , ( "10Y 3/2", { name = "10Y 3/2", hue = "10Y", value = 3, chroma = 2, red = 0.292, green = 0.2886, blue = 0.2068 } )
-        , ( "10Y 3/4", { name = "10Y 3/4", hue = "10Y", value = 3, chroma = 4, red = 0.2993, green = 0.2917, blue = 0.1144 } )
-        , ( "10Y 4/2", { name = "10Y 4/2", hue = "10Y", value = 4, chroma = 2, red = 0.3836, green = 0.3886, blue = 0.2934 } )
-        , ( "10Y 4/4", { name = "10Y 4/4", hue = "10Y", value = 4, chroma = 4, red = 0.399, green = 0.3904, blue = 0.1898 } )
-        , ( "10Y 4/6", { name = "10Y 4/6", hue = "10Y", value = 4, chroma = 6, red = 0.4042, green = 0.3927, blue = 0.0673 } )
-        , ( "10Y 5/2", { name = "10Y 5/2", hue = "10Y", value = 5, chroma = 2, red = 0.4927, green = 0.4878, blue = 0.3872 } )
-        , ( "10Y 5/4", { name = "10Y 5/4", hue = "10Y", value = 5, chroma = 4, red = 0.5016, green = 0.4922, blue = 0.2834 } )
-        , ( "10Y 5/6", { name = "10Y 5/6", hue = "10Y", value = 5, chroma = 6, red = 0.508, green = 0.4953, blue = 0.1647 } )
-        , ( "10Y 6/2", { name = "10Y 6/2", hue = "10Y", value = 6, chroma = 2, red = 0.5963, green = 0.5907, blue = 0.48 } )
-        , ( "10Y 6/4", { name = "10Y 6/4", hue = "10Y", value = 6, chroma = 4, red = 0.6054, green = 0.5953, blue = 0.3796 } )
-        , ( "10Y 6/6", { name = "10Y 6/6", hue = "10Y", value = 6, chroma = 6, red = 0.613, green = 0.5989, blue = 0.2647 } )
-        , ( "10Y 6/8", { name = "10Y 6/8", hue = "10Y", value = 6, chroma = 8, red = 0.6183, green = 0.6014, blue = 0.1137 } )
-        , ( "10Y 7/2", { name = "10Y 7/2", hue = "10Y", value = 7, chroma = 2, red = 0.7001, green = 0.6947, blue = 0.5779 } )
-        , ( "10Y 7/4", { name = "10Y 7/4", hue = "10Y", value = 7, chroma = 4, red = 0.7102, green = 0.6996, blue = 0.4733 } )
-        , ( "10Y 7/6", { name = "10Y 7/6", hue = "10Y", value = 7, chroma = 6, red = 0.7188, green = 0.7031, blue = 0.3665 } )
-        , ( "10Y 7/8", { name = "10Y 7/8", hue = "10Y", value = 7, chroma = 8, red = 0.7252, green = 0.706, blue = 0.2387 } )
-        , ( "10Y 8/10", { name = "10Y 8/10", hue = "10Y", value = 8, chroma = 10, red = 0.8379, green = 0.8147, blue = 0.1848 } )
-        , ( "10Y 8/2", { name = "10Y 8/2", hue = "10Y", value = 8, chroma = 2, red = 0.8065, green = 0.8, blue = 0.6722 } )
-        , ( "10Y 8/4", { name = "10Y 8/4", hue = "10Y", value = 8, chroma = 4, red = 0.817, green = 0.8049, blue = 0.5693 } )
-        , ( "10Y 8/6", { name = "10Y 8/6", hue = "10Y", value = 8, chroma = 6, red = 0.8254, green = 0.8091, blue = 0.4585 } )
-        , ( "10Y 8/8", { name = "10Y 8/8", hue = "10Y", value = 8, chroma = 8, red = 0.8325, green = 0.8122, blue = 0.339 } )
-        , ( "10Y 9/10", { name = "10Y 9/10", hue = "10Y", value = 9, chroma = 10, red = 0.9473, green = 0.9242, blue = 0.2909 } )
-        , ( "10Y 9/2", { name = "10Y 9/2", hue = "10Y", value = 9, chroma = 2, red = 0.9149, green = 0.9078, blue = 0.7693 } )
-        , ( "10Y 9/4", { name = "10Y 9/4", hue = "10Y", value = 9, chroma = 4, red = 0.9255, green = 0.9134, blue = 0.6596 } )
-        , ( "10Y 9/6", { name = "10Y 9/6", hue = "10Y", value = 9, chroma = 6, red = 0.9347, green = 0.9177, blue = 0.5477 } )
-        , ( "10Y 9/8", { name = "10Y 9/8", hue = "10Y", value = 9, chroma = 8, red = 0.9419, green = 0.9215, blue = 0.4237 } )
-        , ( "10YR 1/2", { name = "10YR 1/2", hue = "10YR", value = 1, chroma = 2, red = 0.1607, green = 0.1004, blue = 0.0375 } )
-        , ( "10YR 2/2", { name = "10YR 2/2", hue = "10YR", value = 2, chroma = 2, red = 0.2383, green = 0.1844, blue = 0.1309 } )
-        , ( "10YR 2/4", { name = "10YR 2/4", hue = "10YR", value = 2, chroma = 4, red = 0.2707, green = 0.1746, blue = 0.0499 } )
-        , ( "10YR 3/2", { name = "10YR 3/2", hue = "10YR", value = 3, chroma = 2, red = 0.3343, green = 0.2739, blue = 0.2101 } )
-        , ( "10YR 3/4", { name = "10YR 3/4", hue = "10YR", value = 3, chroma = 4, red = 0.3684, green = 0.2648, blue = 0.1355 } )
-        , ( "10YR 3/6", { name = "10YR 3/6", hue = "10YR", value = 3, chroma = 6, red = 0.3941, green = 0.2564, blue = 0.03 } )
-        , ( "10YR 4/2", { name = "10YR 4/2", hue = "10YR", value = 4, chroma = 2, red = 0.4364, green = 0.3709, blue = 0.2965 } )
-        , ( "10YR 4/4", { name = "10YR 4/4", hue = "10YR", value = 4, chroma = 4, red = 0.477, green = 0.3607, blue = 0.2133 } )
-        , ( "10YR 4/6", { name = "10YR 4/6", hue = "10YR", value = 4, chroma = 6, red = 0.5049, green = 0.3523, blue = 0.1279 } )
-        , ( "10YR 5/2", { name = "10YR 5/2", hue = "10YR", value = 5, chroma = 2, red = 0.5368, green = 0.4724, blue = 0.3978 } )
-        , ( "10YR 5/4", { name = "10YR 5/4", hue = "10YR", value = 5, chroma = 4, red = 0.5806, green = 0.4626, blue = 0.3115 } )
-        , ( "10YR 5/6", { name = "10YR 5/6", hue = "10YR", value = 5, chroma = 6, red = 0.6164, green = 0.4529, blue = 0.2157 } )
-        , ( "10YR 5/8", { name = "10YR 5/8", hue = "10YR", value = 5, chroma = 8, red = 0.6417, green = 0.445, blue = 0.1046 } )
-        , ( "10YR 6/10", { name = "10YR 6/10", hue = "10YR", value = 6, chroma = 10, red = 0.7762, green = 0.5406, blue = 0.063 } )
-        , ( "10YR 6/2", { name = "10YR 6/2", hue = "10YR", value = 6, chroma = 2, red = 0.6407, green = 0.5751, blue = 0.4944 } )
-        , ( "10YR 6/4", { name = "10YR 6/4", hue = "10YR", value = 6, chroma = 4, red = 0.6841, green = 0.5662, blue = 0.409 } )
-        , ( "10YR 6/6", { name = "10YR 6/6", hue = "10YR", value = 6, chroma = 6, red = 0.7233, green = 0.5564, blue = 0.3152 } )
-        , ( "10YR 6/8", { name = "10YR 6/8", hue = "10YR", value = 6, chroma = 8, red = 0.753, green = 0.548, blue = 0.2124 } )
-        , ( "10YR 7/10", { name = "10YR 7/10", hue = "10YR", value = 7, chroma = 10, red = 0.8897, green = 0.6445, blue = 0.2002 } )
-        , ( "10YR 7/2", { name = "10YR 7/2", hue = "10YR", value = 7, chroma = 2, red = 0.7442, green = 0.679, blue = 0.594 } )
-        , ( "10YR 7/4", { name = "10YR 7/4", hue = "10YR", value = 7, chroma = 4, red = 0.7906, green = 0.6701, blue = 0.5037 } )
-        , ( "10YR 7/6", { name = "10YR 7/6", hue = "10YR", value = 7, chroma = 6, red = 0.8295, green = 0.6613, blue = 0.4113 } )
-        , ( "10YR 7/8", { name = "10YR 7/8", hue = "10YR", value = 7, chroma = 8, red = 0.8621, green = 0.6527, blue = 0.315 } )
-        , ( "10YR 8/10", { name = "10YR 8/10", hue = "10YR", value = 8, chroma = 10, red = 1, green = 0.75, blue = 0.3035 } )
-        , ( "10YR 8/12", { name = "10YR 8/12", hue = "10YR", value = 8, chroma = 12, red = 1, green = 0.7424, blue = 0.1585 } )
-        , ( "10YR 8/2", { name = "10YR 8/2", hue = "10YR", value = 8, chroma = 2, red = 0.8486, green = 0.7845, blue = 0.6943 } )
-        , ( "10YR 8/4", { name = "10YR 8/4", hue = "10YR", value = 8, chroma = 4, red = 0.8956, green = 0.7761, blue = 0.603 } )
-        , ( "10YR 8/6", { name = "10YR 8/6", hue = "10YR", value = 8, chroma = 6, red = 0.9373, green = 0.7671, blue = 0.5097 } )
-        , ( "10YR 8/8", { name = "10YR 8/8", hue = "10YR", value = 8, chroma = 8, red = 0.9737, green = 0.7581, blue = 0.4086 } )
-        , ( "10YR 9/2", { name = "10YR 9/2", hue = "10YR", value = 9, chroma = 2, red = 0.9579, green = 0.8921, blue = 0.792 } )
-        , ( "10YR 9/4", { name = "10YR 9/4", hue = "10YR", value = 9, chroma = 4, red = 1, green = 0.8834, blue = 0.6913 } )
-        , ( "10YR 9/6", { name = "10YR 9/6", hue = "10YR", value = 9, chroma = 6, red = 1, green = 0.8749, blue = 0.5951 } )
-        , ( "10YR 9/8", { name = "10YR 9/8", hue = "10YR", value = 9, chroma = 8, red = 1, green = 0.8663, blue = 0.4938 } )
-        , ( "2.5B 1/2", { name = "2.5B 1/2", hue = "2.5B", value = 1, chroma = 2, red = 0.0377, green = 0.1238, blue = 0.1465 } )
-        , ( "2.5B 2/2", { name = "2.5B 2/2", hue = "2.5B", value = 2, chroma = 2, red = 0.1306, green = 0.2057, blue = 0.2251 } )
-        , ( "2.5B 3/2", { name = "2.5B 3/2", hue = "2.5B", value = 3, chroma = 2, red = 0.2079, green = 0.2987, blue = 0.3198 } )
-        , ( "2.5B 3/4", { name = "2.5B 3/4", hue = "2.5B", value = 3, chroma = 4, red = 0.0555, green = 0.3121, blue = 0.3609 } )
-        , ( "2.5B 4/2", { name = "2.5B 4/2", hue = "2.5B", value = 4, chroma = 2, red = 0.3037, green = 0.3971, blue = 0.4157 } )
-        , ( "2.5B 4/4", { name = "2.5B 4/4", hue = "2.5B", value = 4, chroma = 4, red = 0.1888, green = 0.4116, blue = 0.455 } )
-        , ( "2.5B 5/2", { name = "2.5B 5/2", hue = "2.5B", value = 5, chroma = 2, red = 0.4036, green = 0.4989, blue = 0.5154 } )
-        , ( "2.5B 5/4", { name = "2.5B 5/4", hue = "2.5B", value = 5, chroma = 4, red = 0.3027, green = 0.5141, blue = 0.5519 } )
-        , ( "2.5B 5/6", { name = "2.5B 5/6", hue = "2.5B", value = 5, chroma = 6, red = 0.1248, green = 0.5281, blue = 0.5896 } )
-        , ( "2.5B 6/2", { name = "2.5B 6/2", hue = "2.5B", value = 6, chroma = 2, red = 0.5035, green = 0.6025, blue = 0.6161 } )
-        , ( "2.5B 6/4", { name = "2.5B 6/4", hue = "2.5B", value = 6, chroma = 4, red = 0.4029, green = 0.6192, blue = 0.6517 } )
-        , ( "2.5B 6/6", { name = "2.5B 6/6", hue = "2.5B", value = 6, chroma = 6, red = 0.2528, green = 0.6347, blue = 0.6906 } )
-        , ( "2.5B 7/2", { name = "2.5B 7/2", hue = "2.5B", value = 7, chroma = 2, red = 0.6052, green = 0.7067, blue = 0.719 } )
-        , ( "2.5B 7/4", { name = "2.5B 7/4", hue = "2.5B", value = 7, chroma = 4, red = 0.5036, green = 0.7246, blue = 0.7547 } )
-        , ( "2.5B 7/6", { name = "2.5B 7/6", hue = "2.5B", value = 7, chroma = 6, red = 0.3824, green = 0.7398, blue = 0.789 } )
-        , ( "2.5B 7/8", { name = "2.5B 7/8", hue = "2.5B", value = 7, chroma = 8, red = 0.1582, green = 0.7547, blue = 0.8257 } )
-        , ( "2.5B 8/2", { name = "2.5B 8/2", hue = "2.5B", value = 8, chroma = 2, red = 0.7097, green = 0.812, blue = 0.8218 } )
-        , ( "2.5B 8/4", { name = "2.5B 8/4", hue = "2.5B", value = 8, chroma = 4, red = 0.5991, green = 0.8326, blue = 0.858 } )
-        , ( "2.5B 8/6", { name = "2.5B 8/6", hue = "2.5B", value = 8, chroma = 6, red = 0.4701, green = 0.8501, blue = 0.8939 } )
-        , ( "2.5B 8/8", { name = "2.5B 8/8", hue = "2.5B", value = 8, chroma = 8, red = 0.2712, green = 0.8663, blue = 0.9314 } )
-        , ( "2.5B 9/2", { name = "2.5B 9/2", hue = "2.5B", value = 9, chroma = 2, red = 0.8127, green = 0.9202, blue = 0.9311 } )
-        , ( "2.5B 9/4", { name = "2.5B 9/4", hue = "2.5B", value = 9, chroma = 4, red = 0.6884, green = 0.944, blue = 0.9706 } )
-        , ( "2.5BG 1/2", { name = "2.5BG 1/2", hue = "2.5BG", value = 1, chroma = 2, red = 0.0531, green = 0.1253, blue = 0.1164 } )
-        , ( "2.5BG 2/2", { name = "2.5BG 2/2", hue = "2.5BG", value = 2, chroma = 2, red = 0.1384, green = 0.2074, blue = 0.1961 } )
-        , ( "2.5BG 2/4", { name = "2.5BG 2/4", hue = "2.5BG", value = 2, chroma = 4, red = -0.0009, green = 0.2215, blue = 0.2006 } )
-        , ( "2.5BG 3/2", { name = "2.5BG 3/2", hue = "2.5BG", value = 3, chroma = 2, red = 0.216, green = 0.3009, blue = 0.2855 } )
-        , ( "2.5BG 3/4", { name = "2.5BG 3/4", hue = "2.5BG", value = 3, chroma = 4, red = 0.0884, green = 0.3181, blue = 0.2888 } )
-        , ( "2.5BG 4/2", { name = "2.5BG 4/2", hue = "2.5BG", value = 4, chroma = 2, red = 0.3052, green = 0.4006, blue = 0.3811 } )
-        , ( "2.5BG 4/4", { name = "2.5BG 4/4", hue = "2.5BG", value = 4, chroma = 4, red = 0.1931, green = 0.4191, blue = 0.383 } )
-        , ( "2.5BG 5/2", { name = "2.5BG 5/2", hue = "2.5BG", value = 5, chroma = 2, red = 0.4016, green = 0.5033, blue = 0.4794 } )
-        , ( "2.5BG 5/4", { name = "2.5BG 5/4", hue = "2.5BG", value = 5, chroma = 4, red = 0.3037, green = 0.522, blue = 0.4786 } )
-        , ( "2.5BG 5/6", { name = "2.5BG 5/6", hue = "2.5BG", value = 5, chroma = 6, red = 0.1632, green = 0.5377, blue = 0.4795 } )
-        , ( "2.5BG 6/2", { name = "2.5BG 6/2", hue = "2.5BG", value = 6, chroma = 2, red = 0.4973, green = 0.6079, blue = 0.58 } )
-        , ( "2.5BG 6/4", { name = "2.5BG 6/4", hue = "2.5BG", value = 6, chroma = 4, red = 0.3936, green = 0.6288, blue = 0.5771 } )
-        , ( "2.5BG 6/6", { name = "2.5BG 6/6", hue = "2.5BG", value = 6, chroma = 6, red = 0.2728, green = 0.6451, blue = 0.5764 } )
-        , ( "2.5BG 7/2", { name = "2.5BG 7/2", hue = "2.5BG", value = 7, chroma = 2, red = 0.5971, green = 0.7128, blue = 0.6803 } )
-        , ( "2.5BG 7/4", { name = "2.5BG 7/4", hue = "2.5BG", value = 7, chroma = 4, red = 0.503, green = 0.7331, blue = 0.6771 } )
-        , ( "2.5BG 7/6", { name = "2.5BG 7/6", hue = "2.5BG", value = 7, chroma = 6, red = 0.3932, green = 0.7507, blue = 0.6752 } )
-        , ( "2.5BG 7/8", { name = "2.5BG 7/8", hue = "2.5BG", value = 7, chroma = 8, red = 0.2122, green = 0.7681, blue = 0.6741 } )
-        , ( "2.5BG 8/2", { name = "2.5BG 8/2", hue = "2.5BG", value = 8, chroma = 2, red = 0.6956, green = 0.8196, blue = 0.7829 } )
-        , ( "2.5BG 8/4", { name = "2.5BG 8/4", hue = "2.5BG", value = 8, chroma = 4, red = 0.598, green = 0.8413, blue = 0.7783 } )
-        , ( "2.5BG 8/6", { name = "2.5BG 8/6", hue = "2.5BG", value = 8, chroma = 6, red = 0.4859, green = 0.8605, blue = 0.7746 } )
-        , ( "2.5BG 8/8", { name = "2.5BG 8/8", hue = "2.5BG", value = 8, chroma = 8, red = 0.3336, green = 0.8783, blue = 0.7729 } )
-        , ( "2.5BG 9/10", { name = "2.5BG 9/10", hue = "2.5BG", value = 9, chroma = 10, red = 0.0592, green = 1, blue = 0.8734 } )
-        , ( "2.5BG 9/2", { name = "2.5BG 9/2", hue = "2.5BG", value = 9, chroma = 2, red = 0.7946, green = 0.9294, blue = 0.8884 } )
-        , ( "2.5BG 9/4", { name = "2.5BG 9/4", hue = "2.5BG", value = 9, chroma = 4, red = 0.6901, green = 0.953, blue = 0.8827 } )
-        , ( "2.5BG 9/6", { name = "2.5BG 9/6", hue = "2.5BG", value = 9, chroma = 6, red = 0.5572, green = 0.9761, blue = 0.878 } )
-        , ( "2.5BG 9/8", { name = "2.5BG 9/8", hue = "2.5BG", value = 9, chroma = 8, red = 0.391, green = 0.9958, blue = 0.8749 } )
-        , ( "2.5G 1/2", { name = "2.5G 1/2", hue = "2.5G", value = 1, chroma = 2, red = 0.0736, green = 0.1238, blue = 0.0948 } )
-        , ( "2.5G 2/2", { name = "2.5G 2/2", hue = "2.5G", value = 2, chroma = 2, red = 0.1546, green = 0.2062, blue = 0.1738 } )
-        , ( "2.5G 2/4", { name = "2.5G 2/4", hue = "2.5G", value = 2, chroma = 4, red = 0.0831, green = 0.22, blue = 0.149 } )
-        , ( "2.5G 3/2", { name = "2.5G 3/2", hue = "2.5G", value = 3, chroma = 2, red = 0.235, green = 0.2996, blue = 0.2563 } )
-        , ( "2.5G 3/4", { name = "2.5G 3/4", hue = "2.5G", value = 3, chroma = 4, red = 0.1616, green = 0.3155, blue = 0.2267 } )
-        , ( "2.5G 3/6", { name = "2.5G 3/6", hue = "2.5G", value = 3, chroma = 6, red = 0.0252, green = 0.3287, blue = 0.1995 } )
-        , ( "2.5G 4/2", { name = "2.5G 4/2", hue = "2.5G", value = 4, chroma = 2, red = 0.3247, green = 0.3994, blue = 0.3483 } )
-        , ( "2.5G 4/4", { name = "2.5G 4/4", hue = "2.5G", value = 4, chroma = 4, red = 0.252, green = 0.4167, blue = 0.3147 } )
-        , ( "2.5G 4/6", { name = "2.5G 4/6", hue = "2.5G", value = 4, chroma = 6, red = 0.1419, green = 0.4327, blue = 0.2806 } )
-        , ( "2.5G 5/2", { name = "2.5G 5/2", hue = "2.5G", value = 5, chroma = 2, red = 0.4213, green = 0.5022, blue = 0.4439 } )
-        , ( "2.5G 5/4", { name = "2.5G 5/4", hue = "2.5G", value = 5, chroma = 4, red = 0.3533, green = 0.5198, blue = 0.4086 } )
-        , ( "2.5G 5/6", { name = "2.5G 5/6", hue = "2.5G", value = 5, chroma = 6, red = 0.2698, green = 0.5356, blue = 0.3733 } )
-        , ( "2.5G 5/8", { name = "2.5G 5/8", hue = "2.5G", value = 5, chroma = 8, red = 0.1321, green = 0.5506, blue = 0.3383 } )
-        , ( "2.5G 6/10", { name = "2.5G 6/10", hue = "2.5G", value = 6, chroma = 10, red = 0.0796, green = 0.6711, blue = 0.3917 } )
-        , ( "2.5G 6/2", { name = "2.5G 6/2", hue = "2.5G", value = 6, chroma = 2, red = 0.5164, green = 0.6073, blue = 0.5397 } )
-        , ( "2.5G 6/4", { name = "2.5G 6/4", hue = "2.5G", value = 6, chroma = 4, red = 0.4472, green = 0.6259, blue = 0.5016 } )
-        , ( "2.5G 6/6", { name = "2.5G 6/6", hue = "2.5G", value = 6, chroma = 6, red = 0.3706, green = 0.6421, blue = 0.4639 } )
-        , ( "2.5G 6/8", { name = "2.5G 6/8", hue = "2.5G", value = 6, chroma = 8, red = 0.2704, green = 0.6571, blue = 0.4278 } )
-        , ( "2.5G 7/10", { name = "2.5G 7/10", hue = "2.5G", value = 7, chroma = 10, red = 0.2633, green = 0.7792, blue = 0.4797 } )
-        , ( "2.5G 7/2", { name = "2.5G 7/2", hue = "2.5G", value = 7, chroma = 2, red = 0.6167, green = 0.712, blue = 0.64 } )
-        , ( "2.5G 7/4", { name = "2.5G 7/4", hue = "2.5G", value = 7, chroma = 4, red = 0.5491, green = 0.7312, blue = 0.5992 } )
-        , ( "2.5G 7/6", { name = "2.5G 7/6", hue = "2.5G", value = 7, chroma = 6, red = 0.4778, green = 0.7477, blue = 0.5608 } )
-        , ( "2.5G 7/8", { name = "2.5G 7/8", hue = "2.5G", value = 7, chroma = 8, red = 0.3876, green = 0.764, blue = 0.52 } )
-        , ( "2.5G 8/10", { name = "2.5G 8/10", hue = "2.5G", value = 8, chroma = 10, red = 0.3829, green = 0.8893, blue = 0.5685 } )
-        , ( "2.5G 8/12", { name = "2.5G 8/12", hue = "2.5G", value = 8, chroma = 12, red = 0.2098, green = 0.9047, blue = 0.5258 } )
-        , ( "2.5G 8/2", { name = "2.5G 8/2", hue = "2.5G", value = 8, chroma = 2, red = 0.7162, green = 0.8189, blue = 0.7395 } )
-        , ( "2.5G 8/4", { name = "2.5G 8/4", hue = "2.5G", value = 8, chroma = 4, red = 0.6491, green = 0.8385, blue = 0.6964 } )
-        , ( "2.5G 8/6", { name = "2.5G 8/6", hue = "2.5G", value = 8, chroma = 6, red = 0.5681, green = 0.8581, blue = 0.6504 } )
-        , ( "2.5G 8/8", { name = "2.5G 8/8", hue = "2.5G", value = 8, chroma = 8, red = 0.4876, green = 0.8738, blue = 0.6107 } )
-        , ( "2.5G 9/10", { name = "2.5G 9/10", hue = "2.5G", value = 9, chroma = 10, red = 0.4646, green = 1, blue = 0.6507 } )
-        , ( "2.5G 9/12", { name = "2.5G 9/12", hue = "2.5G", value = 9, chroma = 12, red = 0.3307, green = 1, blue = 0.6083 } )
-        , ( "2.5G 9/2", { name = "2.5G 9/2", hue = "2.5G", value = 9, chroma = 2, red = 0.8172, green = 0.9285, blue = 0.8405 } )
-        , ( "2.5G 9/4", { name = "2.5G 9/4", hue = "2.5G", value = 9, chroma = 4, red = 0.745, green = 0.95, blue = 0.7924 } )
-        , ( "2.5G 9/6", { name = "2.5G 9/6", hue = "2.5G", value = 9, chroma = 6, red = 0.6564, green = 0.972, blue = 0.7391 } )
-        , ( "2.5G 9/8", { name = "2.5G 9/8", hue = "2.5G", value = 9, chroma = 8, red = 0.5699, green = 0.9892, blue = 0.6955 } )
-        , ( "2.5GY 1/2", { name = "2.5GY 1/2", hue = "2.5GY", value = 1, chroma = 2, red = 0.1072, green = 0.1187, blue = 0.0602 } )
-        , ( "2.5GY 2/2", { name = "2.5GY 2/2", hue = "2.5GY", value = 2, chroma = 2, red = 0.1897, green = 0.2002, blue = 0.1396 } )
-        , ( "2.5GY 2/4", { name = "2.5GY 2/4", hue = "2.5GY", value = 2, chroma = 4, red = 0.1843, green = 0.2065, blue = 0.0472 } )
-        , ( "2.5GY 3/2", { name = "2.5GY 3/2", hue = "2.5GY", value = 3, chroma = 2, red = 0.2797, green = 0.2918, blue = 0.2136 } )
-        , ( "2.5GY 3/4", { name = "2.5GY 3/4", hue = "2.5GY", value = 3, chroma = 4, red = 0.2751, green = 0.2983, blue = 0.1248 } )
-        , ( "2.5GY 4/2", { name = "2.5GY 4/2", hue = "2.5GY", value = 4, chroma = 2, red = 0.3764, green = 0.3902, blue = 0.2997 } )
-        , ( "2.5GY 4/4", { name = "2.5GY 4/4", hue = "2.5GY", value = 4, chroma = 4, red = 0.3731, green = 0.3974, blue = 0.2023 } )
-        , ( "2.5GY 4/6", { name = "2.5GY 4/6", hue = "2.5GY", value = 4, chroma = 6, red = 0.3685, green = 0.4026, blue = 0.092 } )
-        , ( "2.5GY 5/2", { name = "2.5GY 5/2", hue = "2.5GY", value = 5, chroma = 2, red = 0.4783, green = 0.4915, blue = 0.394 } )
-        , ( "2.5GY 5/4", { name = "2.5GY 5/4", hue = "2.5GY", value = 5, chroma = 4, red = 0.4753, green = 0.4991, blue = 0.2986 } )
-        , ( "2.5GY 5/6", { name = "2.5GY 5/6", hue = "2.5GY", value = 5, chroma = 6, red = 0.4713, green = 0.5053, blue = 0.1873 } )
-        , ( "2.5GY 6/2", { name = "2.5GY 6/2", hue = "2.5GY", value = 6, chroma = 2, red = 0.5816, green = 0.5947, blue = 0.4855 } )
-        , ( "2.5GY 6/4", { name = "2.5GY 6/4", hue = "2.5GY", value = 6, chroma = 4, red = 0.5787, green = 0.6026, blue = 0.3897 } )
-        , ( "2.5GY 6/6", { name = "2.5GY 6/6", hue = "2.5GY", value = 6, chroma = 6, red = 0.5755, green = 0.6091, blue = 0.2833 } )
-        , ( "2.5GY 6/8", { name = "2.5GY 6/8", hue = "2.5GY", value = 6, chroma = 8, red = 0.5707, green = 0.6149, blue = 0.1418 } )
-        , ( "2.5GY 7/10", { name = "2.5GY 7/10", hue = "2.5GY", value = 7, chroma = 10, red = 0.6731, green = 0.7245, blue = 0.0435 } )
-        , ( "2.5GY 7/2", { name = "2.5GY 7/2", hue = "2.5GY", value = 7, chroma = 2, red = 0.687, green = 0.6982, blue = 0.5819 } )
-        , ( "2.5GY 7/4", { name = "2.5GY 7/4", hue = "2.5GY", value = 7, chroma = 4, red = 0.684, green = 0.7067, blue = 0.4832 } )
-        , ( "2.5GY 7/6", { name = "2.5GY 7/6", hue = "2.5GY", value = 7, chroma = 6, red = 0.6814, green = 0.7133, blue = 0.3833 } )
-        , ( "2.5GY 7/8", { name = "2.5GY 7/8", hue = "2.5GY", value = 7, chroma = 8, red = 0.6778, green = 0.7193, blue = 0.2619 } )
-        , ( "2.5GY 8/10", { name = "2.5GY 8/10", hue = "2.5GY", value = 8, chroma = 10, red = 0.7809, green = 0.831, blue = 0.2082 } )
-        , ( "2.5GY 8/2", { name = "2.5GY 8/2", hue = "2.5GY", value = 8, chroma = 2, red = 0.7942, green = 0.8034, blue = 0.6751 } )
-        , ( "2.5GY 8/4", { name = "2.5GY 8/4", hue = "2.5GY", value = 8, chroma = 4, red = 0.7906, green = 0.8122, blue = 0.5781 } )
-        , ( "2.5GY 8/6", { name = "2.5GY 8/6", hue = "2.5GY", value = 8, chroma = 6, red = 0.7884, green = 0.8194, blue = 0.4722 } )
-        , ( "2.5GY 8/8", { name = "2.5GY 8/8", hue = "2.5GY", value = 8, chroma = 8, red = 0.7851, green = 0.8255, blue = 0.3602 } )
-        , ( "2.5GY 9/10", { name = "2.5GY 9/10", hue = "2.5GY", value = 9, chroma = 10, red = 0.8905, green = 0.9405, blue = 0.3075 } )
-        , ( "2.5GY 9/12", { name = "2.5GY 9/12", hue = "2.5GY", value = 9, chroma = 12, red = 0.8863, green = 0.9455, blue = 0.0519 } )
-        , ( "2.5GY 9/2", { name = "2.5GY 9/2", hue = "2.5GY", value = 9, chroma = 2, red = 0.9029, green = 0.9112, blue = 0.7724 } )
-        , ( "2.5GY 9/4", { name = "2.5GY 9/4", hue = "2.5GY", value = 9, chroma = 4, red = 0.9002, green = 0.9207, blue = 0.6643 } )
-        , ( "2.5GY 9/6", { name = "2.5GY 9/6", hue = "2.5GY", value = 9, chroma = 6, red = 0.8984, green = 0.9281, blue = 0.5564 } )
-        , ( "2.5GY 9/8", { name = "2.5GY 9/8", hue = "2.5GY", value = 9, chroma = 8, red = 0.8945, green = 0.935, blue = 0.4369 } )
-        , ( "2.5P 1/2", { name = "2.5P 1/2", hue = "2.5P", value = 1, chroma = 2, red = 0.1331, green = 0.0978, blue = 0.1659 } )
-        , ( "2.5P 1/4", { name = "2.5P 1/4", hue = "2.5P", value = 1, chroma = 4, red = 0.1481, green = 0.0838, blue = 0.199 } )
-        , ( "2.5P 1/6", { name = "2.5P 1/6", hue = "2.5P", value = 1, chroma = 6, red = 0.1638, green = 0.0652, blue = 0.2294 } )
-        , ( "2.5P 1/8", { name = "2.5P 1/8", hue = "2.5P", value = 1, chroma = 8, red = 0.181, green = 0.0355, blue = 0.2599 } )
-        , ( "2.5P 2/10", { name = "2.5P 2/10", hue = "2.5P", value = 2, chroma = 10, red = 0.2775, green = 0.108, blue = 0.3912 } )
-        , ( "2.5P 2/12", { name = "2.5P 2/12", hue = "2.5P", value = 2, chroma = 12, red = 0.2965, green = 0.0696, blue = 0.4253 } )
-        , ( "2.5P 2/2", { name = "2.5P 2/2", hue = "2.5P", value = 2, chroma = 2, red = 0.2108, green = 0.1818, blue = 0.2449 } )
-        , ( "2.5P 2/4", { name = "2.5P 2/4", hue = "2.5P", value = 2, chroma = 4, red = 0.2254, green = 0.1696, blue = 0.2831 } )
-        , ( "2.5P 2/6", { name = "2.5P 2/6", hue = "2.5P", value = 2, chroma = 6, red = 0.2403, green = 0.1557, blue = 0.3169 } )
-        , ( "2.5P 2/8", { name = "2.5P 2/8", hue = "2.5P", value = 2, chroma = 8, red = 0.2597, green = 0.134, blue = 0.3563 } )
-        , ( "2.5P 3/10", { name = "2.5P 3/10", hue = "2.5P", value = 3, chroma = 10, red = 0.3678, green = 0.2056, blue = 0.5052 } )
-        , ( "2.5P 3/12", { name = "2.5P 3/12", hue = "2.5P", value = 3, chroma = 12, red = 0.3852, green = 0.1819, blue = 0.5396 } )
-        , ( "2.5P 3/14", { name = "2.5P 3/14", hue = "2.5P", value = 3, chroma = 14, red = 0.4052, green = 0.1478, blue = 0.578 } )
-        , ( "2.5P 3/16", { name = "2.5P 3/16", hue = "2.5P", value = 3, chroma = 16, red = 0.4246, green = 0.1017, blue = 0.6136 } )
-        , ( "2.5P 3/18", { name = "2.5P 3/18", hue = "2.5P", value = 3, chroma = 18, red = 0.4433, green = 0.0138, blue = 0.6465 } )
-        , ( "2.5P 3/2", { name = "2.5P 3/2", hue = "2.5P", value = 3, chroma = 2, red = 0.3016, green = 0.2711, blue = 0.341 } )
-        , ( "2.5P 3/4", { name = "2.5P 3/4", hue = "2.5P", value = 3, chroma = 4, red = 0.3164, green = 0.2585, blue = 0.3864 } )
-        , ( "2.5P 3/6", { name = "2.5P 3/6", hue = "2.5P", value = 3, chroma = 6, red = 0.3314, green = 0.2444, blue = 0.4271 } )
-        , ( "2.5P 3/8", { name = "2.5P 3/8", hue = "2.5P", value = 3, chroma = 8, red = 0.3486, green = 0.2275, blue = 0.4655 } )
-        , ( "2.5P 4/10", { name = "2.5P 4/10", hue = "2.5P", value = 4, chroma = 10, red = 0.4538, green = 0.3166, blue = 0.6021 } )
-        , ( "2.5P 4/12", { name = "2.5P 4/12", hue = "2.5P", value = 4, chroma = 12, red = 0.4718, green = 0.2968, blue = 0.6431 } )
-        , ( "2.5P 4/14", { name = "2.5P 4/14", hue = "2.5P", value = 4, chroma = 14, red = 0.4892, green = 0.2751, blue = 0.6811 } )
-        , ( "2.5P 4/16", { name = "2.5P 4/16", hue = "2.5P", value = 4, chroma = 16, red = 0.5085, green = 0.248, blue = 0.7196 } )
-        , ( "2.5P 4/18", { name = "2.5P 4/18", hue = "2.5P", value = 4, chroma = 18, red = 0.5287, green = 0.2143, blue = 0.7581 } )
-        , ( "2.5P 4/2", { name = "2.5P 4/2", hue = "2.5P", value = 4, chroma = 2, red = 0.3956, green = 0.37, blue = 0.4346 } )
-        , ( "2.5P 4/20", { name = "2.5P 4/20", hue = "2.5P", value = 4, chroma = 20, red = 0.5491, green = 0.1693, blue = 0.7977 } )
-        , ( "2.5P 4/22", { name = "2.5P 4/22", hue = "2.5P", value = 4, chroma = 22, red = 0.566, green = 0.1184, blue = 0.8282 } )
-        , ( "2.5P 4/4", { name = "2.5P 4/4", hue = "2.5P", value = 4, chroma = 4, red = 0.4093, green = 0.3588, blue = 0.4799 } )
-        , ( "2.5P 4/6", { name = "2.5P 4/6", hue = "2.5P", value = 4, chroma = 6, red = 0.4221, green = 0.3471, blue = 0.5212 } )
-        , ( "2.5P 4/8", { name = "2.5P 4/8", hue = "2.5P", value = 4, chroma = 8, red = 0.4374, green = 0.3329, blue = 0.5623 } )
-        , ( "2.5P 5/10", { name = "2.5P 5/10", hue = "2.5P", value = 5, chroma = 10, red = 0.5476, green = 0.4232, blue = 0.7095 } )
-        , ( "2.5P 5/12", { name = "2.5P 5/12", hue = "2.5P", value = 5, chroma = 12, red = 0.5651, green = 0.4059, blue = 0.7522 } )
-        , ( "2.5P 5/14", { name = "2.5P 5/14", hue = "2.5P", value = 5, chroma = 14, red = 0.5824, green = 0.3874, blue = 0.792 } )
-        , ( "2.5P 5/16", { name = "2.5P 5/16", hue = "2.5P", value = 5, chroma = 16, red = 0.6005, green = 0.3659, blue = 0.8326 } )
-        , ( "2.5P 5/18", { name = "2.5P 5/18", hue = "2.5P", value = 5, chroma = 18, red = 0.6177, green = 0.343, blue = 0.8706 } )
-        , ( "2.5P 5/2", { name = "2.5P 5/2", hue = "2.5P", value = 5, chroma = 2, red = 0.4933, green = 0.473, blue = 0.5279 } )
-        , ( "2.5P 5/20", { name = "2.5P 5/20", hue = "2.5P", value = 5, chroma = 20, red = 0.6377, green = 0.3132, blue = 0.9124 } )
-        , ( "2.5P 5/22", { name = "2.5P 5/22", hue = "2.5P", value = 5, chroma = 22, red = 0.6578, green = 0.2773, blue = 0.9547 } )
-        , ( "2.5P 5/24", { name = "2.5P 5/24", hue = "2.5P", value = 5, chroma = 24, red = 0.6784, green = 0.2329, blue = 0.9955 } )
-        , ( "2.5P 5/26", { name = "2.5P 5/26", hue = "2.5P", value = 5, chroma = 26, red = 0.7005, green = 0.171, blue = 1 } )
-        , ( "2.5P 5/4", { name = "2.5P 5/4", hue = "2.5P", value = 5, chroma = 4, red = 0.5052, green = 0.4626, blue = 0.5761 } )
-        , ( "2.5P 5/6", { name = "2.5P 5/6", hue = "2.5P", value = 5, chroma = 6, red = 0.5179, green = 0.4509, blue = 0.6231 } )
-        , ( "2.5P 5/8", { name = "2.5P 5/8", hue = "2.5P", value = 5, chroma = 8, red = 0.5333, green = 0.437, blue = 0.6691 } )
-        , ( "2.5P 6/10", { name = "2.5P 6/10", hue = "2.5P", value = 6, chroma = 10, red = 0.6445, green = 0.529, blue = 0.8181 } )
-        , ( "2.5P 6/12", { name = "2.5P 6/12", hue = "2.5P", value = 6, chroma = 12, red = 0.6612, green = 0.5132, blue = 0.8629 } )
-        , ( "2.5P 6/14", { name = "2.5P 6/14", hue = "2.5P", value = 6, chroma = 14, red = 0.678, green = 0.4955, blue = 0.9083 } )
-        , ( "2.5P 6/16", { name = "2.5P 6/16", hue = "2.5P", value = 6, chroma = 16, red = 0.7004, green = 0.4726, blue = 0.9563 } )
-        , ( "2.5P 6/18", { name = "2.5P 6/18", hue = "2.5P", value = 6, chroma = 18, red = 0.7157, green = 0.4528, blue = 0.9975 } )
-        , ( "2.5P 6/2", { name = "2.5P 6/2", hue = "2.5P", value = 6, chroma = 2, red = 0.594, green = 0.5761, blue = 0.6285 } )
-        , ( "2.5P 6/4", { name = "2.5P 6/4", hue = "2.5P", value = 6, chroma = 4, red = 0.6049, green = 0.5666, blue = 0.6747 } )
-        , ( "2.5P 6/6", { name = "2.5P 6/6", hue = "2.5P", value = 6, chroma = 6, red = 0.6168, green = 0.5552, blue = 0.7258 } )
-        , ( "2.5P 6/8", { name = "2.5P 6/8", hue = "2.5P", value = 6, chroma = 8, red = 0.6301, green = 0.5429, blue = 0.7718 } )
-        , ( "2.5P 7/10", { name = "2.5P 7/10", hue = "2.5P", value = 7, chroma = 10, red = 0.7453, green = 0.6332, blue = 0.9323 } )
-        , ( "2.5P 7/12", { name = "2.5P 7/12", hue = "2.5P", value = 7, chroma = 12, red = 0.7621, green = 0.6164, blue = 0.9861 } )
-        , ( "2.5P 7/2", { name = "2.5P 7/2", hue = "2.5P", value = 7, chroma = 2, red = 0.6959, green = 0.6804, blue = 0.7288 } )
-        , ( "2.5P 7/4", { name = "2.5P 7/4", hue = "2.5P", value = 7, chroma = 4, red = 0.7069, green = 0.6705, blue = 0.7792 } )
-        , ( "2.5P 7/6", { name = "2.5P 7/6", hue = "2.5P", value = 7, chroma = 6, red = 0.7177, green = 0.66, blue = 0.8284 } )
-        , ( "2.5P 7/8", { name = "2.5P 7/8", hue = "2.5P", value = 7, chroma = 8, red = 0.7304, green = 0.6477, blue = 0.8794 } )
-        , ( "2.5P 8/2", { name = "2.5P 8/2", hue = "2.5P", value = 8, chroma = 2, red = 0.7993, green = 0.7863, blue = 0.8276 } )
-        , ( "2.5P 8/4", { name = "2.5P 8/4", hue = "2.5P", value = 8, chroma = 4, red = 0.8093, green = 0.776, blue = 0.885 } )
-        , ( "2.5P 8/6", { name = "2.5P 8/6", hue = "2.5P", value = 8, chroma = 6, red = 0.8199, green = 0.7648, blue = 0.9415 } )
-        , ( "2.5P 8/8", { name = "2.5P 8/8", hue = "2.5P", value = 8, chroma = 8, red = 0.833, green = 0.7511, blue = 1 } )
-        , ( "2.5P 9/2", { name = "2.5P 9/2", hue = "2.5P", value = 9, chroma = 2, red = 0.9053, green = 0.8937, blue = 0.9359 } )
-        , ( "2.5P 9/4", { name = "2.5P 9/4", hue = "2.5P", value = 9, chroma = 4, red = 0.9148, green = 0.883, blue = 0.9993 } )
-        , ( "2.5PB 1/2", { name = "2.5PB 1/2", hue = "2.5PB", value = 1, chroma = 2, red = 0.0707, green = 0.1158, blue = 0.1664 } )
-        , ( "2.5PB 2/2", { name = "2.5PB 2/2", hue = "2.5PB", value = 2, chroma = 2, red = 0.156, green = 0.1977, blue = 0.2455 } )
-        , ( "2.5PB 2/4", { name = "2.5PB 2/4", hue = "2.5PB", value = 2, chroma = 4, red = 0.0995, green = 0.2007, blue = 0.2953 } )
-        , ( "2.5PB 3/2", { name = "2.5PB 3/2", hue = "2.5PB", value = 3, chroma = 2, red = 0.24, green = 0.2887, blue = 0.3426 } )
-        , ( "2.5PB 3/4", { name = "2.5PB 3/4", hue = "2.5PB", value = 3, chroma = 4, red = 0.185, green = 0.2924, blue = 0.3962 } )
-        , ( "2.5PB 3/6", { name = "2.5PB 3/6", hue = "2.5PB", value = 3, chroma = 6, red = 0.096, green = 0.2957, blue = 0.4475 } )
-        , ( "2.5PB 4/2", { name = "2.5PB 4/2", hue = "2.5PB", value = 4, chroma = 2, red = 0.3413, green = 0.3859, blue = 0.4342 } )
-        , ( "2.5PB 4/4", { name = "2.5PB 4/4", hue = "2.5PB", value = 4, chroma = 4, red = 0.2911, green = 0.3904, blue = 0.4877 } )
-        , ( "2.5PB 4/6", { name = "2.5PB 4/6", hue = "2.5PB", value = 4, chroma = 6, red = 0.228, green = 0.3941, blue = 0.5392 } )
-        , ( "2.5PB 4/8", { name = "2.5PB 4/8", hue = "2.5PB", value = 4, chroma = 8, red = 0.1117, green = 0.398, blue = 0.594 } )
-        , ( "2.5PB 5/10", { name = "2.5PB 5/10", hue = "2.5PB", value = 5, chroma = 10, red = 0.1114, green = 0.5043, blue = 0.7493 } )
-        , ( "2.5PB 5/2", { name = "2.5PB 5/2", hue = "2.5PB", value = 5, chroma = 2, red = 0.4431, green = 0.4871, blue = 0.5325 } )
-        , ( "2.5PB 5/4", { name = "2.5PB 5/4", hue = "2.5PB", value = 5, chroma = 4, red = 0.3948, green = 0.4923, blue = 0.5847 } )
-        , ( "2.5PB 5/6", { name = "2.5PB 5/6", hue = "2.5PB", value = 5, chroma = 6, red = 0.3351, green = 0.4965, blue = 0.6406 } )
-        , ( "2.5PB 5/8", { name = "2.5PB 5/8", hue = "2.5PB", value = 5, chroma = 8, red = 0.2552, green = 0.5006, blue = 0.6944 } )
-        , ( "2.5PB 6/10", { name = "2.5PB 6/10", hue = "2.5PB", value = 6, chroma = 10, red = 0.2695, green = 0.609, blue = 0.8548 } )
-        , ( "2.5PB 6/2", { name = "2.5PB 6/2", hue = "2.5PB", value = 6, chroma = 2, red = 0.547, green = 0.5896, blue = 0.6314 } )
-        , ( "2.5PB 6/4", { name = "2.5PB 6/4", hue = "2.5PB", value = 6, chroma = 4, red = 0.5002, green = 0.595, blue = 0.6835 } )
-        , ( "2.5PB 6/6", { name = "2.5PB 6/6", hue = "2.5PB", value = 6, chroma = 6, red = 0.4401, green = 0.6004, blue = 0.7417 } )
-        , ( "2.5PB 6/8", { name = "2.5PB 6/8", hue = "2.5PB", value = 6, chroma = 8, red = 0.3706, green = 0.6045, blue = 0.7983 } )
-        , ( "2.5PB 7/10", { name = "2.5PB 7/10", hue = "2.5PB", value = 7, chroma = 10, red = 0.367, green = 0.7159, blue = 0.9722 } )
-        , ( "2.5PB 7/2", { name = "2.5PB 7/2", hue = "2.5PB", value = 7, chroma = 2, red = 0.6514, green = 0.6931, blue = 0.7319 } )
-        , ( "2.5PB 7/4", { name = "2.5PB 7/4", hue = "2.5PB", value = 7, chroma = 4, red = 0.6016, green = 0.6991, blue = 0.789 } )
-        , ( "2.5PB 7/6", { name = "2.5PB 7/6", hue = "2.5PB", value = 7, chroma = 6, red = 0.5433, green = 0.7051, blue = 0.8453 } )
-        , ( "2.5PB 7/8", { name = "2.5PB 7/8", hue = "2.5PB", value = 7, chroma = 8, red = 0.4719, green = 0.7104, blue = 0.9055 } )
-        , ( "2.5PB 8/2", { name = "2.5PB 8/2", hue = "2.5PB", value = 8, chroma = 2, red = 0.7571, green = 0.7978, blue = 0.8349 } )
-        , ( "2.5PB 8/4", { name = "2.5PB 8/4", hue = "2.5PB", value = 8, chroma = 4, red = 0.7016, green = 0.805, blue = 0.8971 } )
-        , ( "2.5PB 8/6", { name = "2.5PB 8/6", hue = "2.5PB", value = 8, chroma = 6, red = 0.6339, green = 0.8125, blue = 0.9612 } )
-        , ( "2.5PB 9/2", { name = "2.5PB 9/2", hue = "2.5PB", value = 9, chroma = 2, red = 0.8647, green = 0.9051, blue = 0.941 } )
-        , ( "2.5R 1/2", { name = "2.5R 1/2", hue = "2.5R", value = 1, chroma = 2, red = 0.1755, green = 0.0851, blue = 0.1161 } )
-        , ( "2.5R 1/4", { name = "2.5R 1/4", hue = "2.5R", value = 1, chroma = 4, red = 0.2114, green = 0.0561, blue = 0.1209 } )
-        , ( "2.5R 1/6", { name = "2.5R 1/6", hue = "2.5R", value = 1, chroma = 6, red = 0.2446, green = -0.0016, blue = 0.1273 } )
-        , ( "2.5R 2/2", { name = "2.5R 2/2", hue = "2.5R", value = 2, chroma = 2, red = 0.2573, green = 0.1706, blue = 0.1873 } )
-        , ( "2.5R 2/4", { name = "2.5R 2/4", hue = "2.5R", value = 2, chroma = 4, red = 0.3022, green = 0.1456, blue = 0.1839 } )
-        , ( "2.5R 2/6", { name = "2.5R 2/6", hue = "2.5R", value = 2, chroma = 6, red = 0.3415, green = 0.1138, blue = 0.182 } )
-        , ( "2.5R 2/8", { name = "2.5R 2/8", hue = "2.5R", value = 2, chroma = 8, red = 0.3831, green = 0.0565, blue = 0.1817 } )
-        , ( "2.5R 3/10", { name = "2.5R 3/10", hue = "2.5R", value = 3, chroma = 10, red = 0.5519, green = 0.0889, blue = 0.217 } )
-        , ( "2.5R 3/2", { name = "2.5R 3/2", hue = "2.5R", value = 3, chroma = 2, red = 0.3581, green = 0.2587, blue = 0.266 } )
-        , ( "2.5R 3/4", { name = "2.5R 3/4", hue = "2.5R", value = 3, chroma = 4, red = 0.4139, green = 0.2316, blue = 0.2515 } )
-        , ( "2.5R 3/6", { name = "2.5R 3/6", hue = "2.5R", value = 3, chroma = 6, red = 0.4604, green = 0.201, blue = 0.2391 } )
-        , ( "2.5R 3/8", { name = "2.5R 3/8", hue = "2.5R", value = 3, chroma = 8, red = 0.5082, green = 0.1564, blue = 0.2266 } )
-        , ( "2.5R 4/10", { name = "2.5R 4/10", hue = "2.5R", value = 4, chroma = 10, red = 0.6573, green = 0.2316, blue = 0.3033 } )
-        , ( "2.5R 4/12", { name = "2.5R 4/12", hue = "2.5R", value = 4, chroma = 12, red = 0.7005, green = 0.1779, blue = 0.2912 } )
-        , ( "2.5R 4/14", { name = "2.5R 4/14", hue = "2.5R", value = 4, chroma = 14, red = 0.7446, green = 0.0823, blue = 0.2803 } )
-        , ( "2.5R 4/2", { name = "2.5R 4/2", hue = "2.5R", value = 4, chroma = 2, red = 0.4521, green = 0.3584, blue = 0.3628 } )
-        , ( "2.5R 4/4", { name = "2.5R 4/4", hue = "2.5R", value = 4, chroma = 4, red = 0.511, green = 0.3336, blue = 0.346 } )
-        , ( "2.5R 4/6", { name = "2.5R 4/6", hue = "2.5R", value = 4, chroma = 6, red = 0.5636, green = 0.3053, blue = 0.3306 } )
-        , ( "2.5R 4/8", { name = "2.5R 4/8", hue = "2.5R", value = 4, chroma = 8, red = 0.6131, green = 0.2712, blue = 0.316 } )
-        , ( "2.5R 5/10", { name = "2.5R 5/10", hue = "2.5R", value = 5, chroma = 10, red = 0.7726, green = 0.3438, blue = 0.3919 } )
-        , ( "2.5R 5/12", { name = "2.5R 5/12", hue = "2.5R", value = 5, chroma = 12, red = 0.8231, green = 0.2982, blue = 0.376 } )
-        , ( "2.5R 5/14", { name = "2.5R 5/14", hue = "2.5R", value = 5, chroma = 14, red = 0.8628, green = 0.2515, blue = 0.3638 } )
-        , ( "2.5R 5/16", { name = "2.5R 5/16", hue = "2.5R", value = 5, chroma = 16, red = 0.9081, green = 0.1752, blue = 0.3514 } )
-        , ( "2.5R 5/2", { name = "2.5R 5/2", hue = "2.5R", value = 5, chroma = 2, red = 0.5459, green = 0.4624, blue = 0.4651 } )
-        , ( "2.5R 5/4", { name = "2.5R 5/4", hue = "2.5R", value = 5, chroma = 4, red = 0.6105, green = 0.4378, blue = 0.4457 } )
-        , ( "2.5R 5/6", { name = "2.5R 5/6", hue = "2.5R", value = 5, chroma = 6, red = 0.669, green = 0.4104, blue = 0.4264 } )
-        , ( "2.5R 5/8", { name = "2.5R 5/8", hue = "2.5R", value = 5, chroma = 8, red = 0.7224, green = 0.3796, blue = 0.4082 } )
-        , ( "2.5R 6/10", { name = "2.5R 6/10", hue = "2.5R", value = 6, chroma = 10, red = 0.8804, green = 0.4569, blue = 0.4864 } )
-        , ( "2.5R 6/12", { name = "2.5R 6/12", hue = "2.5R", value = 6, chroma = 12, red = 0.932, green = 0.4195, blue = 0.4685 } )
-        , ( "2.5R 6/14", { name = "2.5R 6/14", hue = "2.5R", value = 6, chroma = 14, red = 0.9779, green = 0.3793, blue = 0.4531 } )
-        , ( "2.5R 6/16", { name = "2.5R 6/16", hue = "2.5R", value = 6, chroma = 16, red = 1, green = 0.3213, blue = 0.437 } )
-        , ( "2.5R 6/18", { name = "2.5R 6/18", hue = "2.5R", value = 6, chroma = 18, red = 1, green = 0.2527, blue = 0.4225 } )
-        , ( "2.5R 6/2", { name = "2.5R 6/2", hue = "2.5R", value = 6, chroma = 2, red = 0.6475, green = 0.5655, blue = 0.5662 } )
-        , ( "2.5R 6/4", { name = "2.5R 6/4", hue = "2.5R", value = 6, chroma = 4, red = 0.7123, green = 0.5423, blue = 0.5463 } )
-        , ( "2.5R 6/6", { name = "2.5R 6/6", hue = "2.5R", value = 6, chroma = 6, red = 0.7746, green = 0.5157, blue = 0.5243 } )
-        , ( "2.5R 6/8", { name = "2.5R 6/8", hue = "2.5R", value = 6, chroma = 8, red = 0.8261, green = 0.4895, blue = 0.5058 } )
-        , ( "2.5R 7/10", { name = "2.5R 7/10", hue = "2.5R", value = 7, chroma = 10, red = 0.9958, green = 0.5624, blue = 0.5835 } )
-        , ( "2.5R 7/12", { name = "2.5R 7/12", hue = "2.5R", value = 7, chroma = 12, red = 1, green = 0.5235, blue = 0.5603 } )
-        , ( "2.5R 7/14", { name = "2.5R 7/14", hue = "2.5R", value = 7, chroma = 14, red = 1, green = 0.4816, blue = 0.5418 } )
-        , ( "2.5R 7/16", { name = "2.5R 7/16", hue = "2.5R", value = 7, chroma = 16, red = 1, green = 0.4315, blue = 0.5234 } )
-        , ( "2.5R 7/2", { name = "2.5R 7/2", hue = "2.5R", value = 7, chroma = 2, red = 0.7493, green = 0.6697, blue = 0.6689 } )
-        , ( "2.5R 7/4", { name = "2.5R 7/4", hue = "2.5R", value = 7, chroma = 4, red = 0.8155, green = 0.647, blue = 0.6483 } )
-        , ( "2.5R 7/6", { name = "2.5R 7/6", hue = "2.5R", value = 7, chroma = 6, red = 0.8793, green = 0.6215, blue = 0.6259 } )
-        , ( "2.5R 7/8", { name = "2.5R 7/8", hue = "2.5R", value = 7, chroma = 8, red = 0.9405, green = 0.5928, blue = 0.604 } )
-        , ( "2.5R 8/10", { name = "2.5R 8/10", hue = "2.5R", value = 8, chroma = 10, red = 1, green = 0.6608, blue = 0.6767 } )
-        , ( "2.5R 8/2", { name = "2.5R 8/2", hue = "2.5R", value = 8, chroma = 2, red = 0.8448, green = 0.7775, blue = 0.7763 } )
-        , ( "2.5R 8/4", { name = "2.5R 8/4", hue = "2.5R", value = 8, chroma = 4, red = 0.9237, green = 0.7516, blue = 0.7503 } )
-        , ( "2.5R 8/6", { name = "2.5R 8/6", hue = "2.5R", value = 8, chroma = 6, red = 0.9925, green = 0.7249, blue = 0.7272 } )
-        , ( "2.5R 8/8", { name = "2.5R 8/8", hue = "2.5R", value = 8, chroma = 8, red = 1, green = 0.6942, blue = 0.7015 } )
-        , ( "2.5R 9/2", { name = "2.5R 9/2", hue = "2.5R", value = 9, chroma = 2, red = 0.9476, green = 0.8861, blue = 0.8848 } )
-        , ( "2.5R 9/4", { name = "2.5R 9/4", hue = "2.5R", value = 9, chroma = 4, red = 1, green = 0.8559, blue = 0.8535 } )
-        , ( "2.5R 9/6", { name = "2.5R 9/6", hue = "2.5R", value = 9, chroma = 6, red = 1, green = 0.8256, blue = 0.8247 } )
-        , ( "2.5RP 1/2", { name = "2.5RP 1/2", hue = "2.5RP", value = 1, chroma = 2, red = 0.1599, green = 0.0888, blue = 0.1474 } )
-        , ( "2.5RP 1/4", { name = "2.5RP 1/4", hue = "2.5RP", value = 1, chroma = 4, red = 0.187, green = 0.0665, blue = 0.1701 } )
-        , ( "2.5RP 1/6", { name = "2.5RP 1/6", hue = "2.5RP", value = 1, chroma = 6, red = 0.211, green = 0.0346, blue = 0.1912 } )
-        , ( "2.5RP 2/10", { name = "2.5RP 2/10", hue = "2.5RP", value = 2, chroma = 10, red = 0.373, green = 0.0126, blue = 0.3028 } )
-        , ( "2.5RP 2/2", { name = "2.5RP 2/2", hue = "2.5RP", value = 2, chroma = 2, red = 0.2442, green = 0.1724, blue = 0.2194 } )
-        , ( "2.5RP 2/4", { name = "2.5RP 2/4", hue = "2.5RP", value = 2, chroma = 4, red = 0.2763, green = 0.1532, blue = 0.238 } )
-        , ( "2.5RP 2/6", { name = "2.5RP 2/6", hue = "2.5RP", value = 2, chroma = 6, red = 0.307, green = 0.1288, blue = 0.2572 } )
-        , ( "2.5RP 2/8", { name = "2.5RP 2/8", hue = "2.5RP", value = 2, chroma = 8, red = 0.3423, green = 0.0873, blue = 0.2811 } )
-        , ( "2.5RP 3/10", { name = "2.5RP 3/10", hue = "2.5RP", value = 3, chroma = 10, red = 0.495, green = 0.1315, blue = 0.3896 } )
-        , ( "2.5RP 3/12", { name = "2.5RP 3/12", hue = "2.5RP", value = 3, chroma = 12, red = 0.5292, green = 0.053, blue = 0.4101 } )
-        , ( "2.5RP 3/2", { name = "2.5RP 3/2", hue = "2.5RP", value = 3, chroma = 2, red = 0.3403, green = 0.2613, blue = 0.3074 } )
-        , ( "2.5RP 3/4", { name = "2.5RP 3/4", hue = "2.5RP", value = 3, chroma = 4, red = 0.3839, green = 0.2378, blue = 0.3282 } )
-        , ( "2.5RP 3/6", { name = "2.5RP 3/6", hue = "2.5RP", value = 3, chroma = 6, red = 0.421, green = 0.2122, blue = 0.3476 } )
-        , ( "2.5RP 3/8", { name = "2.5RP 3/8", hue = "2.5RP", value = 3, chroma = 8, red = 0.4586, green = 0.1782, blue = 0.3681 } )
-        , ( "2.5RP 4/10", { name = "2.5RP 4/10", hue = "2.5RP", value = 4, chroma = 10, red = 0.5958, green = 0.2567, blue = 0.4773 } )
-        , ( "2.5RP 4/12", { name = "2.5RP 4/12", hue = "2.5RP", value = 4, chroma = 12, red = 0.6327, green = 0.2159, blue = 0.4971 } )
-        , ( "2.5RP 4/14", { name = "2.5RP 4/14", hue = "2.5RP", value = 4, chroma = 14, red = 0.6666, green = 0.1645, blue = 0.5161 } )
-        , ( "2.5RP 4/16", { name = "2.5RP 4/16", hue = "2.5RP", value = 4, chroma = 16, red = 0.7, green = 0.0796, blue = 0.5353 } )
-        , ( "2.5RP 4/2", { name = "2.5RP 4/2", hue = "2.5RP", value = 4, chroma = 2, red = 0.4339, green = 0.3609, blue = 0.4013 } )
-        , ( "2.5RP 4/4", { name = "2.5RP 4/4", hue = "2.5RP", value = 4, chroma = 4, red = 0.4784, green = 0.3398, blue = 0.4202 } )
-        , ( "2.5RP 4/6", { name = "2.5RP 4/6", hue = "2.5RP", value = 4, chroma = 6, red = 0.5214, green = 0.315, blue = 0.44 } )
-        , ( "2.5RP 4/8", { name = "2.5RP 4/8", hue = "2.5RP", value = 4, chroma = 8, red = 0.5609, green = 0.2871, blue = 0.4591 } )
-        , ( "2.5RP 5/10", { name = "2.5RP 5/10", hue = "2.5RP", value = 5, chroma = 10, red = 0.7063, green = 0.365, blue = 0.5735 } )
-        , ( "2.5RP 5/12", { name = "2.5RP 5/12", hue = "2.5RP", value = 5, chroma = 12, red = 0.747, green = 0.3297, blue = 0.5936 } )
-        , ( "2.5RP 5/14", { name = "2.5RP 5/14", hue = "2.5RP", value = 5, chroma = 14, red = 0.7849, green = 0.2893, blue = 0.6128 } )
-        , ( "2.5RP 5/16", { name = "2.5RP 5/16", hue = "2.5RP", value = 5, chroma = 16, red = 0.8202, green = 0.2414, blue = 0.6313 } )
-        , ( "2.5RP 5/18", { name = "2.5RP 5/18", hue = "2.5RP", value = 5, chroma = 18, red = 0.856, green = 0.1733, blue = 0.6505 } )
-        , ( "2.5RP 5/2", { name = "2.5RP 5/2", hue = "2.5RP", value = 5, chroma = 2, red = 0.5287, green = 0.4648, blue = 0.4978 } )
-        , ( "2.5RP 5/20", { name = "2.5RP 5/20", hue = "2.5RP", value = 5, chroma = 20, red = 0.8915, green = 0.0262, blue = 0.6707 } )
-        , ( "2.5RP 5/4", { name = "2.5RP 5/4", hue = "2.5RP", value = 5, chroma = 4, red = 0.5759, green = 0.4444, blue = 0.516 } )
-        , ( "2.5RP 5/6", { name = "2.5RP 5/6", hue = "2.5RP", value = 5, chroma = 6, red = 0.6231, green = 0.4201, blue = 0.5354 } )
-        , ( "2.5RP 5/8", { name = "2.5RP 5/8", hue = "2.5RP", value = 5, chroma = 8, red = 0.6695, green = 0.3917, blue = 0.5559 } )
-        , ( "2.5RP 6/10", { name = "2.5RP 6/10", hue = "2.5RP", value = 6, chroma = 10, red = 0.8107, green = 0.4756, blue = 0.669 } )
-        , ( "2.5RP 6/12", { name = "2.5RP 6/12", hue = "2.5RP", value = 6, chroma = 12, red = 0.8546, green = 0.4436, blue = 0.6892 } )
-        , ( "2.5RP 6/14", { name = "2.5RP 6/14", hue = "2.5RP", value = 6, chroma = 14, red = 0.8967, green = 0.4076, blue = 0.7087 } )
-        , ( "2.5RP 6/16", { name = "2.5RP 6/16", hue = "2.5RP", value = 6, chroma = 16, red = 0.9383, green = 0.3649, blue = 0.7288 } )
-        , ( "2.5RP 6/18", { name = "2.5RP 6/18", hue = "2.5RP", value = 6, chroma = 18, red = 0.9757, green = 0.3174, blue = 0.7481 } )
-        , ( "2.5RP 6/2", { name = "2.5RP 6/2", hue = "2.5RP", value = 6, chroma = 2, red = 0.6314, green = 0.5675, blue = 0.5985 } )
-        , ( "2.5RP 6/20", { name = "2.5RP 6/20", hue = "2.5RP", value = 6, chroma = 20, red = 1, green = 0.246, blue = 0.7704 } )
-        , ( "2.5RP 6/22", { name = "2.5RP 6/22", hue = "2.5RP", value = 6, chroma = 22, red = 1, green = 0.1607, blue = 0.7886 } )
-        , ( "2.5RP 6/4", { name = "2.5RP 6/4", hue = "2.5RP", value = 6, chroma = 4, red = 0.6775, green = 0.5484, blue = 0.6149 } )
-        , ( "2.5RP 6/6", { name = "2.5RP 6/6", hue = "2.5RP", value = 6, chroma = 6, red = 0.7272, green = 0.5247, blue = 0.6339 } )
-        , ( "2.5RP 6/8", { name = "2.5RP 6/8", hue = "2.5RP", value = 6, chroma = 8, red = 0.7692, green = 0.5017, blue = 0.651 } )
-        , ( "2.5RP 7/10", { name = "2.5RP 7/10", hue = "2.5RP", value = 7, chroma = 10, red = 0.927, green = 0.5776, blue = 0.7705 } )
-        , ( "2.5RP 7/12", { name = "2.5RP 7/12", hue = "2.5RP", value = 7, chroma = 12, red = 0.9724, green = 0.5473, blue = 0.7903 } )
-        , ( "2.5RP 7/14", { name = "2.5RP 7/14", hue = "2.5RP", value = 7, chroma = 14, red = 1, green = 0.5138, blue = 0.8098 } )
-        , ( "2.5RP 7/16", { name = "2.5RP 7/16", hue = "2.5RP", value = 7, chroma = 16, red = 1, green = 0.4707, blue = 0.8324 } )
-        , ( "2.5RP 7/18", { name = "2.5RP 7/18", hue = "2.5RP", value = 7, chroma = 18, red = 1, green = 0.4204, blue = 0.8553 } )
-        , ( "2.5RP 7/2", { name = "2.5RP 7/2", hue = "2.5RP", value = 7, chroma = 2, red = 0.7302, green = 0.6728, blue = 0.6997 } )
-        , ( "2.5RP 7/20", { name = "2.5RP 7/20", hue = "2.5RP", value = 7, chroma = 20, red = 1, green = 0.3576, blue = 0.8788 } )
-        , ( "2.5RP 7/4", { name = "2.5RP 7/4", hue = "2.5RP", value = 7, chroma = 4, red = 0.781, green = 0.6528, blue = 0.7154 } )
-        , ( "2.5RP 7/6", { name = "2.5RP 7/6", hue = "2.5RP", value = 7, chroma = 6, red = 0.8337, green = 0.6288, blue = 0.7345 } )
-        , ( "2.5RP 7/8", { name = "2.5RP 7/8", hue = "2.5RP", value = 7, chroma = 8, red = 0.883, green = 0.6034, blue = 0.7532 } )
-        , ( "2.5RP 8/10", { name = "2.5RP 8/10", hue = "2.5RP", value = 8, chroma = 10, red = 1, green = 0.6781, blue = 0.8734 } )
-        , ( "2.5RP 8/12", { name = "2.5RP 8/12", hue = "2.5RP", value = 8, chroma = 12, red = 1, green = 0.644, blue = 0.8955 } )
-        , ( "2.5RP 8/14", { name = "2.5RP 8/14", hue = "2.5RP", value = 8, chroma = 14, red = 1, green = 0.6069, blue = 0.9171 } )
-        , ( "2.5RP 8/2", { name = "2.5RP 8/2", hue = "2.5RP", value = 8, chroma = 2, red = 0.8289, green = 0.7799, blue = 0.8018 } )
-        , ( "2.5RP 8/4", { name = "2.5RP 8/4", hue = "2.5RP", value = 8, chroma = 4, red = 0.8861, green = 0.7581, blue = 0.8182 } )
-        , ( "2.5RP 8/6", { name = "2.5RP 8/6", hue = "2.5RP", value = 8, chroma = 6, red = 0.944, green = 0.7331, blue = 0.8354 } )
-        , ( "2.5RP 8/8", { name = "2.5RP 8/8", hue = "2.5RP", value = 8, chroma = 8, red = 0.9989, green = 0.7059, blue = 0.8552 } )
-        , ( "2.5RP 9/2", { name = "2.5RP 9/2", hue = "2.5RP", value = 9, chroma = 2, red = 0.9363, green = 0.8871, blue = 0.9086 } )
-        , ( "2.5RP 9/4", { name = "2.5RP 9/4", hue = "2.5RP", value = 9, chroma = 4, red = 1, green = 0.863, blue = 0.9264 } )
-        , ( "2.5RP 9/6", { name = "2.5RP 9/6", hue = "2.5RP", value = 9, chroma = 6, red = 1, green = 0.8355, blue = 0.9451 } )
-        , ( "2.5Y 1/2", { name = "2.5Y 1/2", hue = "2.5Y", value = 1, chroma = 2, red = 0.1498, green = 0.1057, blue = 0.0292 } )
-        , ( "2.5Y 2/2", { name = "2.5Y 2/2", hue = "2.5Y", value = 2, chroma = 2, red = 0.2288, green = 0.1885, blue = 0.1258 } )
-        , ( "2.5Y 2/4", { name = "2.5Y 2/4", hue = "2.5Y", value = 2, chroma = 4, red = 0.2563, green = 0.182, blue = 0.0267 } )
-        , ( "2.5Y 3/2", { name = "2.5Y 3/2", hue = "2.5Y", value = 3, chroma = 2, red = 0.3234, green = 0.2783, blue = 0.2057 } )
-        , ( "2.5Y 3/4", { name = "2.5Y 3/4", hue = "2.5Y", value = 3, chroma = 4, red = 0.3517, green = 0.2726, blue = 0.1233 } )
-        , ( "2.5Y 4/2", { name = "2.5Y 4/2", hue = "2.5Y", value = 4, chroma = 2, red = 0.4254, green = 0.3753, blue = 0.2904 } )
-        , ( "2.5Y 4/4", { name = "2.5Y 4/4", hue = "2.5Y", value = 4, chroma = 4, red = 0.4584, green = 0.3691, blue = 0.2001 } )
-        , ( "2.5Y 4/6", { name = "2.5Y 4/6", hue = "2.5Y", value = 4, chroma = 6, red = 0.4806, green = 0.364, blue = 0.1027 } )
-        , ( "2.5Y 5/2", { name = "2.5Y 5/2", hue = "2.5Y", value = 5, chroma = 2, red = 0.5269, green = 0.4764, blue = 0.3903 } )
-        , ( "2.5Y 5/4", { name = "2.5Y 5/4", hue = "2.5Y", value = 5, chroma = 4, red = 0.5624, green = 0.4707, blue = 0.296 } )
-        , ( "2.5Y 5/6", { name = "2.5Y 5/6", hue = "2.5Y", value = 5, chroma = 6, red = 0.5913, green = 0.4647, blue = 0.1892 } )
-        , ( "2.5Y 5/8", { name = "2.5Y 5/8", hue = "2.5Y", value = 5, chroma = 8, red = 0.6108, green = 0.4599, blue = 0.0517 } )
-        , ( "2.5Y 6/2", { name = "2.5Y 6/2", hue = "2.5Y", value = 6, chroma = 2, red = 0.6289, green = 0.5799, blue = 0.4852 } )
-        , ( "2.5Y 6/4", { name = "2.5Y 6/4", hue = "2.5Y", value = 6, chroma = 4, red = 0.6651, green = 0.5745, blue = 0.3929 } )
-        , ( "2.5Y 6/6", { name = "2.5Y 6/6", hue = "2.5Y", value = 6, chroma = 6, red = 0.6968, green = 0.5685, blue = 0.2896 } )
-        , ( "2.5Y 6/8", { name = "2.5Y 6/8", hue = "2.5Y", value = 6, chroma = 8, red = 0.7222, green = 0.5626, blue = 0.1723 } )
-        , ( "2.5Y 7/10", { name = "2.5Y 7/10", hue = "2.5Y", value = 7, chroma = 10, red = 0.8518, green = 0.6625, blue = 0.1369 } )
-        , ( "2.5Y 7/2", { name = "2.5Y 7/2", hue = "2.5Y", value = 7, chroma = 2, red = 0.7323, green = 0.684, blue = 0.5838 } )
-        , ( "2.5Y 7/4", { name = "2.5Y 7/4", hue = "2.5Y", value = 7, chroma = 4, red = 0.7724, green = 0.6779, blue = 0.4887 } )
-        , ( "2.5Y 7/6", { name = "2.5Y 7/6", hue = "2.5Y", value = 7, chroma = 6, red = 0.8049, green = 0.6723, blue = 0.3896 } )
-        , ( "2.5Y 7/8", { name = "2.5Y 7/8", hue = "2.5Y", value = 7, chroma = 8, red = 0.8303, green = 0.6673, blue = 0.2824 } )
-        , ( "2.5Y 8/10", { name = "2.5Y 8/10", hue = "2.5Y", value = 8, chroma = 10, red = 0.9639, green = 0.768, blue = 0.26 } )
-        , ( "2.5Y 8/12", { name = "2.5Y 8/12", hue = "2.5Y", value = 8, chroma = 12, red = 0.9838, green = 0.7633, blue = 0.0384 } )
-        , ( "2.5Y 8/2", { name = "2.5Y 8/2", hue = "2.5Y", value = 8, chroma = 2, red = 0.8376, green = 0.7892, blue = 0.6827 } )
-        , ( "2.5Y 8/4", { name = "2.5Y 8/4", hue = "2.5Y", value = 8, chroma = 4, red = 0.8752, green = 0.7846, blue = 0.587 } )
-        , ( "2.5Y 8/6", { name = "2.5Y 8/6", hue = "2.5Y", value = 8, chroma = 6, red = 0.9097, green = 0.7791, blue = 0.4851 } )
-        , ( "2.5Y 8/8", { name = "2.5Y 8/8", hue = "2.5Y", value = 8, chroma = 8, red = 0.939, green = 0.7734, blue = 0.3806 } )
-        , ( "2.5Y 9/10", { name = "2.5Y 9/10", hue = "2.5Y", value = 9, chroma = 10, red = 1, green = 0.8769, blue = 0.3524 } )
-        , ( "2.5Y 9/12", { name = "2.5Y 9/12", hue = "2.5Y", value = 9, chroma = 12, red = 1, green = 0.8717, blue = 0.2033 } )
-        , ( "2.5Y 9/2", { name = "2.5Y 9/2", hue = "2.5Y", value = 9, chroma = 2, red = 0.947, green = 0.8967, blue = 0.7812 } )
-        , ( "2.5Y 9/4", { name = "2.5Y 9/4", hue = "2.5Y", value = 9, chroma = 4, red = 0.9855, green = 0.8927, blue = 0.6758 } )
-        , ( "2.5Y 9/6", { name = "2.5Y 9/6", hue = "2.5Y", value = 9, chroma = 6, red = 1, green = 0.8874, blue = 0.5737 } )
-        , ( "2.5Y 9/8", { name = "2.5Y 9/8", hue = "2.5Y", value = 9, chroma = 8, red = 1, green = 0.8819, blue = 0.4664 } )
-        , ( "2.5YR 1/2", { name = "2.5YR 1/2", hue = "2.5YR", value = 1, chroma = 2, red = 0.177, green = 0.0889, blue = 0.0769 } )
-        , ( "2.5YR 1/4", { name = "2.5YR 1/4", hue = "2.5YR", value = 1, chroma = 4, red = 0.2215, green = 0.0572, blue = 0.041 } )
-        , ( "2.5YR 1/6", { name = "2.5YR 1/6", hue = "2.5YR", value = 1, chroma = 6, red = 0.253, green = 0.0104, blue = 0.0093 } )
-        , ( "2.5YR 2/2", { name = "2.5YR 2/2", hue = "2.5YR", value = 2, chroma = 2, red = 0.2562, green = 0.1747, blue = 0.1547 } )
-        , ( "2.5YR 2/4", { name = "2.5YR 2/4", hue = "2.5YR", value = 2, chroma = 4, red = 0.3029, green = 0.1529, blue = 0.1136 } )
-        , ( "2.5YR 2/6", { name = "2.5YR 2/6", hue = "2.5YR", value = 2, chroma = 6, red = 0.3402, green = 0.1281, blue = 0.0684 } )
-        , ( "2.5YR 3/2", { name = "2.5YR 3/2", hue = "2.5YR", value = 3, chroma = 2, red = 0.3553, green = 0.2634, blue = 0.2326 } )
-        , ( "2.5YR 3/4", { name = "2.5YR 3/4", hue = "2.5YR", value = 3, chroma = 4, red = 0.4054, green = 0.2433, blue = 0.1833 } )
-        , ( "2.5YR 3/6", { name = "2.5YR 3/6", hue = "2.5YR", value = 3, chroma = 6, red = 0.4478, green = 0.221, blue = 0.1272 } )
-        , ( "2.5YR 3/8", { name = "2.5YR 3/8", hue = "2.5YR", value = 3, chroma = 8, red = 0.4819, green = 0.198, blue = 0.0563 } )
-        , ( "2.5YR 4/10", { name = "2.5YR 4/10", hue = "2.5YR", value = 4, chroma = 10, red = 0.627, green = 0.2787, blue = 0.0607 } )
-        , ( "2.5YR 4/2", { name = "2.5YR 4/2", hue = "2.5YR", value = 4, chroma = 2, red = 0.4546, green = 0.3612, blue = 0.3261 } )
-        , ( "2.5YR 4/4", { name = "2.5YR 4/4", hue = "2.5YR", value = 4, chroma = 4, red = 0.5117, green = 0.3407, blue = 0.2709 } )
-        , ( "2.5YR 4/6", { name = "2.5YR 4/6", hue = "2.5YR", value = 4, chroma = 6, red = 0.5559, green = 0.3209, blue = 0.2154 } )
-        , ( "2.5YR 4/8", { name = "2.5YR 4/8", hue = "2.5YR", value = 4, chroma = 8, red = 0.5953, green = 0.2993, blue = 0.1509 } )
-        , ( "2.5YR 5/10", { name = "2.5YR 5/10", hue = "2.5YR", value = 5, chroma = 10, red = 0.7503, green = 0.3795, blue = 0.1645 } )
-        , ( "2.5YR 5/12", { name = "2.5YR 5/12", hue = "2.5YR", value = 5, chroma = 12, red = 0.7789, green = 0.3611, blue = 0.0569 } )
-        , ( "2.5YR 5/2", { name = "2.5YR 5/2", hue = "2.5YR", value = 5, chroma = 2, red = 0.5523, green = 0.4639, blue = 0.4274 } )
-        , ( "2.5YR 5/4", { name = "2.5YR 5/4", hue = "2.5YR", value = 5, chroma = 4, red = 0.6119, green = 0.4446, blue = 0.3714 } )
-        , ( "2.5YR 5/6", { name = "2.5YR 5/6", hue = "2.5YR", value = 5, chroma = 6, red = 0.6651, green = 0.4236, blue = 0.3092 } )
-        , ( "2.5YR 5/8", { name = "2.5YR 5/8", hue = "2.5YR", value = 5, chroma = 8, red = 0.7119, green = 0.4012, blue = 0.2409 } )
-        , ( "2.5YR 6/10", { name = "2.5YR 6/10", hue = "2.5YR", value = 6, chroma = 10, red = 0.8662, green = 0.4846, blue = 0.2707 } )
-        , ( "2.5YR 6/12", { name = "2.5YR 6/12", hue = "2.5YR", value = 6, chroma = 12, red = 0.9033, green = 0.4636, blue = 0.1826 } )
-        , ( "2.5YR 6/14", { name = "2.5YR 6/14", hue = "2.5YR", value = 6, chroma = 14, red = 0.9332, green = 0.4447, blue = 0.0395 } )
-        , ( "2.5YR 6/2", { name = "2.5YR 6/2", hue = "2.5YR", value = 6, chroma = 2, red = 0.6572, green = 0.5661, blue = 0.5267 } )
-        , ( "2.5YR 6/4", { name = "2.5YR 6/4", hue = "2.5YR", value = 6, chroma = 4, red = 0.7176, green = 0.5478, blue = 0.469 } )
-        , ( "2.5YR 6/6", { name = "2.5YR 6/6", hue = "2.5YR", value = 6, chroma = 6, red = 0.7739, green = 0.5272, blue = 0.4069 } )
-        , ( "2.5YR 6/8", { name = "2.5YR 6/8", hue = "2.5YR", value = 6, chroma = 8, red = 0.8219, green = 0.5066, blue = 0.3444 } )
-        , ( "2.5YR 7/10", { name = "2.5YR 7/10", hue = "2.5YR", value = 7, chroma = 10, red = 0.9804, green = 0.5901, blue = 0.3725 } )
-        , ( "2.5YR 7/12", { name = "2.5YR 7/12", hue = "2.5YR", value = 7, chroma = 12, red = 1, green = 0.5671, blue = 0.2842 } )
-        , ( "2.5YR 7/14", { name = "2.5YR 7/14", hue = "2.5YR", value = 7, chroma = 14, red = 1, green = 0.5454, blue = 0.1707 } )
-        , ( "2.5YR 7/2", { name = "2.5YR 7/2", hue = "2.5YR", value = 7, chroma = 2, red = 0.7582, green = 0.6705, blue = 0.6315 } )
-        , ( "2.5YR 7/4", { name = "2.5YR 7/4", hue = "2.5YR", value = 7, chroma = 4, red = 0.824, green = 0.6516, blue = 0.5693 } )
-        , ( "2.5YR 7/6", { name = "2.5YR 7/6", hue = "2.5YR", value = 7, chroma = 6, red = 0.8843, green = 0.631, blue = 0.5036 } )
-        , ( "2.5YR 7/8", { name = "2.5YR 7/8", hue = "2.5YR", value = 7, chroma = 8, red = 0.9354, green = 0.6106, blue = 0.4388 } )
-        , ( "2.5YR 8/10", { name = "2.5YR 8/10", hue = "2.5YR", value = 8, chroma = 10, red = 1, green = 0.694, blue = 0.4563 } )
-        , ( "2.5YR 8/12", { name = "2.5YR 8/12", hue = "2.5YR", value = 8, chroma = 12, red = 1, green = 0.6705, blue = 0.3718 } )
-        , ( "2.5YR 8/2", { name = "2.5YR 8/2", hue = "2.5YR", value = 8, chroma = 2, red = 0.8571, green = 0.7772, blue = 0.7399 } )
-        , ( "2.5YR 8/4", { name = "2.5YR 8/4", hue = "2.5YR", value = 8, chroma = 4, red = 0.9353, green = 0.7556, blue = 0.6655 } )
-        , ( "2.5YR 8/6", { name = "2.5YR 8/6", hue = "2.5YR", value = 8, chroma = 6, red = 0.9963, green = 0.7356, blue = 0.6005 } )
-        , ( "2.5YR 8/8", { name = "2.5YR 8/8", hue = "2.5YR", value = 8, chroma = 8, red = 1, green = 0.7134, blue = 0.5276 } )
-        , ( "2.5YR 9/2", { name = "2.5YR 9/2", hue = "2.5YR", value = 9, chroma = 2, red = 0.9674, green = 0.8839, blue = 0.843 } )
-        , ( "2.5YR 9/4", { name = "2.5YR 9/4", hue = "2.5YR", value = 9, chroma = 4, red = 1, green = 0.8605, blue = 0.762 } )
-        , ( "2.5YR 9/6", { name = "2.5YR 9/6", hue = "2.5YR", value = 9, chroma = 6, red = 1, green = 0.8401, blue = 0.6874 } )
-        , ( "5B 1/2", { name = "5B 1/2", hue = "5B", value = 1, chroma = 2, red = 0.0391, green = 0.1228, blue = 0.1527 } )
-        , ( "5B 2/2", { name = "5B 2/2", hue = "5B", value = 2, chroma = 2, red = 0.1324, green = 0.2046, blue = 0.2307 } )
-        , ( "5B 3/2", { name = "5B 3/2", hue = "5B", value = 3, chroma = 2, red = 0.2101, green = 0.2974, blue = 0.3269 } )
-        , ( "5B 3/4", { name = "5B 3/4", hue = "5B", value = 3, chroma = 4, red = 0.08, green = 0.3087, blue = 0.3741 } )
-        , ( "5B 4/2", { name = "5B 4/2", hue = "5B", value = 4, chroma = 2, red = 0.3088, green = 0.3953, blue = 0.4218 } )
-        , ( "5B 4/4", { name = "5B 4/4", hue = "5B", value = 4, chroma = 4, red = 0.2075, green = 0.4077, blue = 0.4671 } )
-        , ( "5B 5/2", { name = "5B 5/2", hue = "5B", value = 5, chroma = 2, red = 0.411, green = 0.4965, blue = 0.5214 } )
-        , ( "5B 5/4", { name = "5B 5/4", hue = "5B", value = 5, chroma = 4, red = 0.3181, green = 0.5101, blue = 0.5641 } )
-        , ( "5B 5/6", { name = "5B 5/6", hue = "5B", value = 5, chroma = 6, red = 0.1764, green = 0.5217, blue = 0.6102 } )
-        , ( "5B 6/2", { name = "5B 6/2", hue = "5B", value = 6, chroma = 2, red = 0.5127, green = 0.5996, blue = 0.6219 } )
-        , ( "5B 6/4", { name = "5B 6/4", hue = "5B", value = 6, chroma = 4, red = 0.4224, green = 0.6141, blue = 0.6646 } )
-        , ( "5B 6/6", { name = "5B 6/6", hue = "5B", value = 6, chroma = 6, red = 0.2943, green = 0.6276, blue = 0.7119 } )
-        , ( "5B 7/2", { name = "5B 7/2", hue = "5B", value = 7, chroma = 2, red = 0.6157, green = 0.7033, blue = 0.7252 } )
-        , ( "5B 7/4", { name = "5B 7/4", hue = "5B", value = 7, chroma = 4, red = 0.5221, green = 0.7194, blue = 0.7689 } )
-        , ( "5B 7/6", { name = "5B 7/6", hue = "5B", value = 7, chroma = 6, red = 0.408, green = 0.7333, blue = 0.8136 } )
-        , ( "5B 7/8", { name = "5B 7/8", hue = "5B", value = 7, chroma = 8, red = 0.2352, green = 0.7458, blue = 0.8592 } )
-        , ( "5B 8/2", { name = "5B 8/2", hue = "5B", value = 8, chroma = 2, red = 0.7219, green = 0.8082, blue = 0.8276 } )
-        , ( "5B 8/4", { name = "5B 8/4", hue = "5B", value = 8, chroma = 4, red = 0.6198, green = 0.8265, blue = 0.8749 } )
-        , ( "5B 8/6", { name = "5B 8/6", hue = "5B", value = 8, chroma = 6, red = 0.5024, green = 0.8418, blue = 0.923 } )
-        , ( "5B 8/8", { name = "5B 8/8", hue = "5B", value = 8, chroma = 8, red = 0.3135, green = 0.8573, blue = 0.9765 } )
-        , ( "5B 9/2", { name = "5B 9/2", hue = "5B", value = 9, chroma = 2, red = 0.8245, green = 0.9166, blue = 0.9364 } )
-        , ( "5B 9/4", { name = "5B 9/4", hue = "5B", value = 9, chroma = 4, red = 0.7057, green = 0.9382, blue = 0.9902 } )
-        , ( "5BG 1/2", { name = "5BG 1/2", hue = "5BG", value = 1, chroma = 2, red = 0.0463, green = 0.1253, blue = 0.1252 } )
-        , ( "5BG 2/2", { name = "5BG 2/2", hue = "5BG", value = 2, chroma = 2, red = 0.1339, green = 0.2074, blue = 0.2047 } )
-        , ( "5BG 3/2", { name = "5BG 3/2", hue = "5BG", value = 3, chroma = 2, red = 0.2111, green = 0.3008, blue = 0.2952 } )
-        , ( "5BG 3/4", { name = "5BG 3/4", hue = "5BG", value = 3, chroma = 4, red = 0.0686, green = 0.3174, blue = 0.3095 } )
-        , ( "5BG 4/2", { name = "5BG 4/2", hue = "5BG", value = 4, chroma = 2, red = 0.3018, green = 0.4003, blue = 0.3908 } )
-        , ( "5BG 4/4", { name = "5BG 4/4", hue = "5BG", value = 4, chroma = 4, red = 0.1837, green = 0.4181, blue = 0.4035 } )
-        , ( "5BG 5/2", { name = "5BG 5/2", hue = "5BG", value = 5, chroma = 2, red = 0.3982, green = 0.5029, blue = 0.4909 } )
-        , ( "5BG 5/4", { name = "5BG 5/4", hue = "5BG", value = 5, chroma = 4, red = 0.2949, green = 0.5211, blue = 0.5008 } )
-        , ( "5BG 5/6", { name = "5BG 5/6", hue = "5BG", value = 5, chroma = 6, red = 0.1349, green = 0.5365, blue = 0.511 } )
-        , ( "5BG 6/2", { name = "5BG 6/2", hue = "5BG", value = 6, chroma = 2, red = 0.4949, green = 0.6073, blue = 0.591 } )
-        , ( "5BG 6/4", { name = "5BG 6/4", hue = "5BG", value = 6, chroma = 4, red = 0.3885, green = 0.6273, blue = 0.5998 } )
-        , ( "5BG 6/6", { name = "5BG 6/6", hue = "5BG", value = 6, chroma = 6, red = 0.2486, green = 0.6442, blue = 0.6097 } )
-        , ( "5BG 7/2", { name = "5BG 7/2", hue = "5BG", value = 7, chroma = 2, red = 0.594, green = 0.7124, blue = 0.692 } )
-        , ( "5BG 7/4", { name = "5BG 7/4", hue = "5BG", value = 7, chroma = 4, red = 0.4948, green = 0.7324, blue = 0.6989 } )
-        , ( "5BG 7/6", { name = "5BG 7/6", hue = "5BG", value = 7, chroma = 6, red = 0.3809, green = 0.7492, blue = 0.7063 } )
-        , ( "5BG 7/8", { name = "5BG 7/8", hue = "5BG", value = 7, chroma = 8, red = 0.1627, green = 0.7668, blue = 0.7151 } )
-        , ( "5BG 8/2", { name = "5BG 8/2", hue = "5BG", value = 8, chroma = 2, red = 0.6951, green = 0.8186, blue = 0.7945 } )
-        , ( "5BG 8/4", { name = "5BG 8/4", hue = "5BG", value = 8, chroma = 4, red = 0.594, green = 0.84, blue = 0.7992 } )
-        , ( "5BG 8/6", { name = "5BG 8/6", hue = "5BG", value = 8, chroma = 6, red = 0.4738, green = 0.8592, blue = 0.8057 } )
-        , ( "5BG 8/8", { name = "5BG 8/8", hue = "5BG", value = 8, chroma = 8, red = 0.2944, green = 0.8775, blue = 0.8138 } )
-        , ( "5BG 9/2", { name = "5BG 9/2", hue = "5BG", value = 9, chroma = 2, red = 0.7949, green = 0.9281, blue = 0.8997 } )
-        , ( "5BG 9/4", { name = "5BG 9/4", hue = "5BG", value = 9, chroma = 4, red = 0.684, green = 0.9521, blue = 0.9031 } )
-        , ( "5BG 9/6", { name = "5BG 9/6", hue = "5BG", value = 9, chroma = 6, red = 0.5436, green = 0.9751, blue = 0.9082 } )
-        , ( "5BG 9/8", { name = "5BG 9/8", hue = "5BG", value = 9, chroma = 8, red = 0.3527, green = 0.9953, blue = 0.9152 } )
-        , ( "5G 1/2", { name = "5G 1/2", hue = "5G", value = 1, chroma = 2, red = 0.0686, green = 0.1244, blue = 0.0995 } )
-        , ( "5G 2/2", { name = "5G 2/2", hue = "5G", value = 2, chroma = 2, red = 0.1498, green = 0.2067, blue = 0.1794 } )
-        , ( "5G 2/4", { name = "5G 2/4", hue = "5G", value = 2, chroma = 4, red = 0.066, green = 0.2208, blue = 0.1623 } )
-        , ( "5G 3/2", { name = "5G 3/2", hue = "5G", value = 3, chroma = 2, red = 0.2282, green = 0.3004, blue = 0.2645 } )
-        , ( "5G 3/4", { name = "5G 3/4", hue = "5G", value = 3, chroma = 4, red = 0.1412, green = 0.3169, blue = 0.2434 } )
-        , ( "5G 4/2", { name = "5G 4/2", hue = "5G", value = 4, chroma = 2, red = 0.318, green = 0.4001, blue = 0.3573 } )
-        , ( "5G 4/4", { name = "5G 4/4", hue = "5G", value = 4, chroma = 4, red = 0.2326, green = 0.4182, blue = 0.3337 } )
-        , ( "5G 4/6", { name = "5G 4/6", hue = "5G", value = 4, chroma = 6, red = 0.0926, green = 0.4339, blue = 0.3128 } )
-        , ( "5G 5/2", { name = "5G 5/2", hue = "5G", value = 5, chroma = 2, red = 0.4137, green = 0.503, blue = 0.4551 } )
-        , ( "5G 5/4", { name = "5G 5/4", hue = "5G", value = 5, chroma = 4, red = 0.3339, green = 0.5215, blue = 0.4302 } )
-        , ( "5G 5/6", { name = "5G 5/6", hue = "5G", value = 5, chroma = 6, red = 0.2309, green = 0.5377, blue = 0.4083 } )
-        , ( "5G 6/2", { name = "5G 6/2", hue = "5G", value = 6, chroma = 2, red = 0.5083, green = 0.608, blue = 0.5533 } )
-        , ( "5G 6/4", { name = "5G 6/4", hue = "5G", value = 6, chroma = 4, red = 0.4254, green = 0.628, blue = 0.5261 } )
-        , ( "5G 6/6", { name = "5G 6/6", hue = "5G", value = 6, chroma = 6, red = 0.3323, green = 0.6446, blue = 0.5026 } )
-        , ( "5G 6/8", { name = "5G 6/8", hue = "5G", value = 6, chroma = 8, red = 0.1939, green = 0.6598, blue = 0.4821 } )
-        , ( "5G 7/10", { name = "5G 7/10", hue = "5G", value = 7, chroma = 10, red = 0.0964, green = 0.7828, blue = 0.5567 } )
-        , ( "5G 7/2", { name = "5G 7/2", hue = "5G", value = 7, chroma = 2, red = 0.6079, green = 0.7129, blue = 0.6537 } )
-        , ( "5G 7/4", { name = "5G 7/4", hue = "5G", value = 7, chroma = 4, red = 0.5287, green = 0.733, blue = 0.6262 } )
-        , ( "5G 7/6", { name = "5G 7/6", hue = "5G", value = 7, chroma = 6, red = 0.4422, green = 0.7502, blue = 0.6019 } )
-        , ( "5G 7/8", { name = "5G 7/8", hue = "5G", value = 7, chroma = 8, red = 0.3276, green = 0.7667, blue = 0.5785 } )
-        , ( "5G 8/10", { name = "5G 8/10", hue = "5G", value = 8, chroma = 10, red = 0.2614, green = 0.894, blue = 0.6494 } )
-        , ( "5G 8/2", { name = "5G 8/2", hue = "5G", value = 8, chroma = 2, red = 0.7066, green = 0.8198, blue = 0.7545 } )
-        , ( "5G 8/4", { name = "5G 8/4", hue = "5G", value = 8, chroma = 4, red = 0.6281, green = 0.8403, blue = 0.7257 } )
-        , ( "5G 8/6", { name = "5G 8/6", hue = "5G", value = 8, chroma = 6, red = 0.5298, green = 0.8609, blue = 0.6965 } )
-        , ( "5G 8/8", { name = "5G 8/8", hue = "5G", value = 8, chroma = 8, red = 0.4211, green = 0.8779, blue = 0.6717 } )
-        , ( "5G 9/10", { name = "5G 9/10", hue = "5G", value = 9, chroma = 10, red = 0.3475, green = 1, blue = 0.7413 } )
-        , ( "5G 9/2", { name = "5G 9/2", hue = "5G", value = 9, chroma = 2, red = 0.8076, green = 0.9294, blue = 0.8565 } )
-        , ( "5G 9/4", { name = "5G 9/4", hue = "5G", value = 9, chroma = 4, red = 0.7207, green = 0.9523, blue = 0.8244 } )
-        , ( "5G 9/6", { name = "5G 9/6", hue = "5G", value = 9, chroma = 6, red = 0.6118, green = 0.9754, blue = 0.7917 } )
-        , ( "5G 9/8", { name = "5G 9/8", hue = "5G", value = 9, chroma = 8, red = 0.4949, green = 0.9942, blue = 0.7649 } )
-        , ( "5GY 1/2", { name = "5GY 1/2", hue = "5GY", value = 1, chroma = 2, red = 0.0984, green = 0.1204, blue = 0.0696 } )
-        , ( "5GY 2/2", { name = "5GY 2/2", hue = "5GY", value = 2, chroma = 2, red = 0.1812, green = 0.202, blue = 0.1475 } )
-        , ( "5GY 2/4", { name = "5GY 2/4", hue = "5GY", value = 2, chroma = 4, red = 0.1612, green = 0.2112, blue = 0.0738 } )
-        , ( "5GY 3/2", { name = "5GY 3/2", hue = "5GY", value = 3, chroma = 2, red = 0.2692, green = 0.2941, blue = 0.2215 } )
-        , ( "5GY 3/4", { name = "5GY 3/4", hue = "5GY", value = 3, chroma = 4, red = 0.2506, green = 0.3037, blue = 0.1447 } )
-        , ( "5GY 3/6", { name = "5GY 3/6", hue = "5GY", value = 3, chroma = 6, red = 0.2322, green = 0.3111, blue = 0.0428 } )
-        , ( "5GY 4/2", { name = "5GY 4/2", hue = "5GY", value = 4, chroma = 2, red = 0.366, green = 0.3925, blue = 0.3071 } )
-        , ( "5GY 4/4", { name = "5GY 4/4", hue = "5GY", value = 4, chroma = 4, red = 0.3484, green = 0.403, blue = 0.2211 } )
-        , ( "5GY 4/6", { name = "5GY 4/6", hue = "5GY", value = 4, chroma = 6, red = 0.33, green = 0.4113, blue = 0.1266 } )
-        , ( "5GY 5/2", { name = "5GY 5/2", hue = "5GY", value = 5, chroma = 2, red = 0.4665, green = 0.4942, blue = 0.402 } )
-        , ( "5GY 5/4", { name = "5GY 5/4", hue = "5GY", value = 5, chroma = 4, red = 0.4509, green = 0.5046, blue = 0.3174 } )
-        , ( "5GY 5/6", { name = "5GY 5/6", hue = "5GY", value = 5, chroma = 6, red = 0.4323, green = 0.5142, blue = 0.2198 } )
-        , ( "5GY 5/8", { name = "5GY 5/8", hue = "5GY", value = 5, chroma = 8, red = 0.4147, green = 0.5219, blue = 0.0895 } )
-        , ( "5GY 6/2", { name = "5GY 6/2", hue = "5GY", value = 6, chroma = 2, red = 0.5687, green = 0.5978, blue = 0.4927 } )
-        , ( "5GY 6/4", { name = "5GY 6/4", hue = "5GY", value = 6, chroma = 4, red = 0.5543, green = 0.6083, blue = 0.4058 } )
-        , ( "5GY 6/6", { name = "5GY 6/6", hue = "5GY", value = 6, chroma = 6, red = 0.5375, green = 0.618, blue = 0.3119 } )
-        , ( "5GY 6/8", { name = "5GY 6/8", hue = "5GY", value = 6, chroma = 8, red = 0.519, green = 0.6268, blue = 0.1944 } )
-        , ( "5GY 7/10", { name = "5GY 7/10", hue = "5GY", value = 7, chroma = 10, red = 0.6102, green = 0.7392, blue = 0.1514 } )
-        , ( "5GY 7/2", { name = "5GY 7/2", hue = "5GY", value = 7, chroma = 2, red = 0.6743, green = 0.7014, blue = 0.5882 } )
-        , ( "5GY 7/4", { name = "5GY 7/4", hue = "5GY", value = 7, chroma = 4, red = 0.6586, green = 0.7128, blue = 0.4988 } )
-        , ( "5GY 7/6", { name = "5GY 7/6", hue = "5GY", value = 7, chroma = 6, red = 0.6437, green = 0.7223, blue = 0.4082 } )
-        , ( "5GY 7/8", { name = "5GY 7/8", hue = "5GY", value = 7, chroma = 8, red = 0.6277, green = 0.7311, blue = 0.3021 } )
-        , ( "5GY 8/10", { name = "5GY 8/10", hue = "5GY", value = 8, chroma = 10, red = 0.7197, green = 0.8457, blue = 0.2648 } )
-        , ( "5GY 8/2", { name = "5GY 8/2", hue = "5GY", value = 8, chroma = 2, red = 0.7807, green = 0.8067, blue = 0.6829 } )
-        , ( "5GY 8/4", { name = "5GY 8/4", hue = "5GY", value = 8, chroma = 4, red = 0.7688, green = 0.8175, blue = 0.5903 } )
-        , ( "5GY 8/6", { name = "5GY 8/6", hue = "5GY", value = 8, chroma = 6, red = 0.7533, green = 0.8279, blue = 0.493 } )
-        , ( "5GY 8/8", { name = "5GY 8/8", hue = "5GY", value = 8, chroma = 8, red = 0.7368, green = 0.8372, blue = 0.3922 } )
-        , ( "5GY 9/10", { name = "5GY 9/10", hue = "5GY", value = 9, chroma = 10, red = 0.8313, green = 0.9553, blue = 0.3411 } )
-        , ( "5GY 9/12", { name = "5GY 9/12", hue = "5GY", value = 9, chroma = 12, red = 0.8148, green = 0.9631, blue = 0.1606 } )
-        , ( "5GY 9/2", { name = "5GY 9/2", hue = "5GY", value = 9, chroma = 2, red = 0.8884, green = 0.9149, blue = 0.7783 } )
-        , ( "5GY 9/4", { name = "5GY 9/4", hue = "5GY", value = 9, chroma = 4, red = 0.877, green = 0.9266, blue = 0.6742 } )
-        , ( "5GY 9/6", { name = "5GY 9/6", hue = "5GY", value = 9, chroma = 6, red = 0.8623, green = 0.9373, blue = 0.5718 } )
-        , ( "5GY 9/8", { name = "5GY 9/8", hue = "5GY", value = 9, chroma = 8, red = 0.8462, green = 0.9471, blue = 0.4617 } )
-        , ( "5P 1/2", { name = "5P 1/2", hue = "5P", value = 1, chroma = 2, red = 0.1429, green = 0.0946, blue = 0.1613 } )
-        , ( "5P 1/4", { name = "5P 1/4", hue = "5P", value = 1, chroma = 4, red = 0.1627, green = 0.0777, blue = 0.1912 } )
-        , ( "5P 1/6", { name = "5P 1/6", hue = "5P", value = 1, chroma = 6, red = 0.1814, green = 0.0556, blue = 0.2182 } )
-        , ( "5P 1/8", { name = "5P 1/8", hue = "5P", value = 1, chroma = 8, red = 0.2011, green = 0.0168, blue = 0.246 } )
-        , ( "5P 2/10", { name = "5P 2/10", hue = "5P", value = 2, chroma = 10, red = 0.3071, green = 0.0897, blue = 0.3712 } )
-        , ( "5P 2/12", { name = "5P 2/12", hue = "5P", value = 2, chroma = 12, red = 0.3292, green = 0.0334, blue = 0.403 } )
-        , ( "5P 2/2", { name = "5P 2/2", hue = "5P", value = 2, chroma = 2, red = 0.2207, green = 0.179, blue = 0.2398 } )
-        , ( "5P 2/4", { name = "5P 2/4", hue = "5P", value = 2, chroma = 4, red = 0.2416, green = 0.1645, blue = 0.2736 } )
-        , ( "5P 2/6", { name = "5P 2/6", hue = "5P", value = 2, chroma = 6, red = 0.2607, green = 0.1484, blue = 0.3034 } )
-        , ( "5P 2/8", { name = "5P 2/8", hue = "5P", value = 2, chroma = 8, red = 0.2854, green = 0.1219, blue = 0.3399 } )
-        , ( "5P 3/10", { name = "5P 3/10", hue = "5P", value = 3, chroma = 10, red = 0.4046, green = 0.1884, blue = 0.4834 } )
-        , ( "5P 3/12", { name = "5P 3/12", hue = "5P", value = 3, chroma = 12, red = 0.4284, green = 0.1554, blue = 0.5174 } )
-        , ( "5P 3/14", { name = "5P 3/14", hue = "5P", value = 3, chroma = 14, red = 0.4505, green = 0.1123, blue = 0.5499 } )
-        , ( "5P 3/16", { name = "5P 3/16", hue = "5P", value = 3, chroma = 16, red = 0.4729, green = 0.0329, blue = 0.582 } )
-        , ( "5P 3/2", { name = "5P 3/2", hue = "5P", value = 3, chroma = 2, red = 0.3129, green = 0.2679, blue = 0.3359 } )
-        , ( "5P 3/4", { name = "5P 3/4", hue = "5P", value = 3, chroma = 4, red = 0.3367, green = 0.2522, blue = 0.3755 } )
-        , ( "5P 3/6", { name = "5P 3/6", hue = "5P", value = 3, chroma = 6, red = 0.3584, green = 0.2354, blue = 0.4111 } )
-        , ( "5P 3/8", { name = "5P 3/8", hue = "5P", value = 3, chroma = 8, red = 0.3811, green = 0.2147, blue = 0.4469 } )
-        , ( "5P 4/10", { name = "5P 4/10", hue = "5P", value = 4, chroma = 10, red = 0.4937, green = 0.3019, blue = 0.5794 } )
-        , ( "5P 4/12", { name = "5P 4/12", hue = "5P", value = 4, chroma = 12, red = 0.5162, green = 0.2792, blue = 0.6145 } )
-        , ( "5P 4/14", { name = "5P 4/14", hue = "5P", value = 4, chroma = 14, red = 0.5403, green = 0.2509, blue = 0.6502 } )
-        , ( "5P 4/16", { name = "5P 4/16", hue = "5P", value = 4, chroma = 16, red = 0.566, green = 0.2138, blue = 0.6876 } )
-        , ( "5P 4/18", { name = "5P 4/18", hue = "5P", value = 4, chroma = 18, red = 0.5884, green = 0.1713, blue = 0.7207 } )
-        , ( "5P 4/2", { name = "5P 4/2", hue = "5P", value = 4, chroma = 2, red = 0.4068, green = 0.367, blue = 0.4291 } )
-        , ( "5P 4/20", { name = "5P 4/20", hue = "5P", value = 4, chroma = 20, red = 0.6128, green = 0.1024, blue = 0.7557 } )
-        , ( "5P 4/4", { name = "5P 4/4", hue = "5P", value = 4, chroma = 4, red = 0.4287, green = 0.3532, blue = 0.4696 } )
-        , ( "5P 4/6", { name = "5P 4/6", hue = "5P", value = 4, chroma = 6, red = 0.4493, green = 0.3388, blue = 0.5065 } )
-        , ( "5P 4/8", { name = "5P 4/8", hue = "5P", value = 4, chroma = 8, red = 0.4706, green = 0.3221, blue = 0.5427 } )
-        , ( "5P 5/10", { name = "5P 5/10", hue = "5P", value = 5, chroma = 10, red = 0.5919, green = 0.4087, blue = 0.6845 } )
-        , ( "5P 5/12", { name = "5P 5/12", hue = "5P", value = 5, chroma = 12, red = 0.6158, green = 0.3875, blue = 0.7242 } )
-        , ( "5P 5/14", { name = "5P 5/14", hue = "5P", value = 5, chroma = 14, red = 0.6375, green = 0.3661, blue = 0.759 } )
-        , ( "5P 5/16", { name = "5P 5/16", hue = "5P", value = 5, chroma = 16, red = 0.6611, green = 0.3396, blue = 0.7965 } )
-        , ( "5P 5/18", { name = "5P 5/18", hue = "5P", value = 5, chroma = 18, red = 0.6844, green = 0.3096, blue = 0.8322 } )
-        , ( "5P 5/2", { name = "5P 5/2", hue = "5P", value = 5, chroma = 2, red = 0.5031, green = 0.4705, blue = 0.5225 } )
-        , ( "5P 5/20", { name = "5P 5/20", hue = "5P", value = 5, chroma = 20, red = 0.708, green = 0.2736, blue = 0.8679 } )
-        , ( "5P 5/22", { name = "5P 5/22", hue = "5P", value = 5, chroma = 22, red = 0.7337, green = 0.2251, blue = 0.9051 } )
-        , ( "5P 5/24", { name = "5P 5/24", hue = "5P", value = 5, chroma = 24, red = 0.7593, green = 0.156, blue = 0.9428 } )
-        , ( "5P 5/26", { name = "5P 5/26", hue = "5P", value = 5, chroma = 26, red = 0.7836, green = 0.0036, blue = 0.9776 } )
-        , ( "5P 5/4", { name = "5P 5/4", hue = "5P", value = 5, chroma = 4, red = 0.5249, green = 0.4573, blue = 0.565 } )
-        , ( "5P 5/6", { name = "5P 5/6", hue = "5P", value = 5, chroma = 6, red = 0.5475, green = 0.4424, blue = 0.6071 } )
-        , ( "5P 5/8", { name = "5P 5/8", hue = "5P", value = 5, chroma = 8, red = 0.5707, green = 0.4256, blue = 0.6479 } )
-        , ( "5P 6/10", { name = "5P 6/10", hue = "5P", value = 6, chroma = 10, red = 0.6905, green = 0.515, blue = 0.7924 } )
-        , ( "5P 6/12", { name = "5P 6/12", hue = "5P", value = 6, chroma = 12, red = 0.7135, green = 0.4967, blue = 0.8308 } )
-        , ( "5P 6/14", { name = "5P 6/14", hue = "5P", value = 6, chroma = 14, red = 0.7387, green = 0.4744, blue = 0.873 } )
-        , ( "5P 6/16", { name = "5P 6/16", hue = "5P", value = 6, chroma = 16, red = 0.7627, green = 0.4505, blue = 0.9137 } )
-        , ( "5P 6/18", { name = "5P 6/18", hue = "5P", value = 6, chroma = 18, red = 0.7861, green = 0.4245, blue = 0.9529 } )
-        , ( "5P 6/2", { name = "5P 6/2", hue = "5P", value = 6, chroma = 2, red = 0.6037, green = 0.5735, blue = 0.6246 } )
-        , ( "5P 6/20", { name = "5P 6/20", hue = "5P", value = 6, chroma = 20, red = 0.8131, green = 0.3906, blue = 0.9963 } )
-        , ( "5P 6/4", { name = "5P 6/4", hue = "5P", value = 6, chroma = 4, red = 0.6244, green = 0.5613, blue = 0.6658 } )
-        , ( "5P 6/6", { name = "5P 6/6", hue = "5P", value = 6, chroma = 6, red = 0.6471, green = 0.5467, blue = 0.7102 } )
-        , ( "5P 6/8", { name = "5P 6/8", hue = "5P", value = 6, chroma = 8, red = 0.6678, green = 0.5321, blue = 0.7505 } )
-        , ( "5P 7/10", { name = "5P 7/10", hue = "5P", value = 7, chroma = 10, red = 0.7922, green = 0.6197, blue = 0.905 } )
-        , ( "5P 7/12", { name = "5P 7/12", hue = "5P", value = 7, chroma = 12, red = 0.817, green = 0.6004, blue = 0.9505 } )
-        , ( "5P 7/14", { name = "5P 7/14", hue = "5P", value = 7, chroma = 14, red = 0.842, green = 0.5797, blue = 0.9932 } )
-        , ( "5P 7/2", { name = "5P 7/2", hue = "5P", value = 7, chroma = 2, red = 0.7043, green = 0.6783, blue = 0.7241 } )
-        , ( "5P 7/4", { name = "5P 7/4", hue = "5P", value = 7, chroma = 4, red = 0.7251, green = 0.6659, blue = 0.7692 } )
-        , ( "5P 7/6", { name = "5P 7/6", hue = "5P", value = 7, chroma = 6, red = 0.7459, green = 0.6524, blue = 0.8135 } )
-        , ( "5P 7/8", { name = "5P 7/8", hue = "5P", value = 7, chroma = 8, red = 0.7684, green = 0.6373, blue = 0.8575 } )
-        , ( "5P 8/10", { name = "5P 8/10", hue = "5P", value = 8, chroma = 10, red = 0.8993, green = 0.722, blue = 1 } )
-        , ( "5P 8/2", { name = "5P 8/2", hue = "5P", value = 8, chroma = 2, red = 0.8049, green = 0.785, blue = 0.8241 } )
-        , ( "5P 8/4", { name = "5P 8/4", hue = "5P", value = 8, chroma = 4, red = 0.8268, green = 0.7716, blue = 0.8753 } )
-        , ( "5P 8/6", { name = "5P 8/6", hue = "5P", value = 8, chroma = 6, red = 0.8486, green = 0.7575, blue = 0.9244 } )
-        , ( "5P 8/8", { name = "5P 8/8", hue = "5P", value = 8, chroma = 8, red = 0.874, green = 0.7403, blue = 0.9777 } )
-        , ( "5P 9/2", { name = "5P 9/2", hue = "5P", value = 9, chroma = 2, red = 0.911, green = 0.8925, blue = 0.9314 } )
-        , ( "5P 9/4", { name = "5P 9/4", hue = "5P", value = 9, chroma = 4, red = 0.9334, green = 0.8778, blue = 0.9934 } )
-        , ( "5PB 1/2", { name = "5PB 1/2", hue = "5PB", value = 1, chroma = 2, red = 0.0844, green = 0.1126, blue = 0.1684 } )
-        , ( "5PB 1/4", { name = "5PB 1/4", hue = "5PB", value = 1, chroma = 4, red = 0.0437, green = 0.112, blue = 0.2117 } )
-        , ( "5PB 2/2", { name = "5PB 2/2", hue = "5PB", value = 2, chroma = 2, red = 0.1686, green = 0.1941, blue = 0.2485 } )
-        , ( "5PB 2/4", { name = "5PB 2/4", hue = "5PB", value = 2, chroma = 4, red = 0.132, green = 0.1945, blue = 0.2983 } )
-        , ( "5PB 2/6", { name = "5PB 2/6", hue = "5PB", value = 2, chroma = 6, red = 0.0665, green = 0.1944, blue = 0.35 } )
-        , ( "5PB 3/2", { name = "5PB 3/2", hue = "5PB", value = 3, chroma = 2, red = 0.2544, green = 0.2848, blue = 0.3449 } )
-        , ( "5PB 3/4", { name = "5PB 3/4", hue = "5PB", value = 3, chroma = 4, red = 0.2178, green = 0.2855, blue = 0.3988 } )
-        , ( "5PB 3/6", { name = "5PB 3/6", hue = "5PB", value = 3, chroma = 6, red = 0.1654, green = 0.2862, blue = 0.4511 } )
-        , ( "5PB 3/8", { name = "5PB 3/8", hue = "5PB", value = 3, chroma = 8, red = 0.0835, green = 0.2864, blue = 0.4997 } )
-        , ( "5PB 4/10", { name = "5PB 4/10", hue = "5PB", value = 4, chroma = 10, red = 0.1265, green = 0.3862, blue = 0.6481 } )
-        , ( "5PB 4/2", { name = "5PB 4/2", hue = "5PB", value = 4, chroma = 2, red = 0.355, green = 0.3819, blue = 0.4371 } )
-        , ( "5PB 4/4", { name = "5PB 4/4", hue = "5PB", value = 4, chroma = 4, red = 0.3227, green = 0.3829, blue = 0.4897 } )
-        , ( "5PB 4/6", { name = "5PB 4/6", hue = "5PB", value = 4, chroma = 6, red = 0.2792, green = 0.3844, blue = 0.5422 } )
-        , ( "5PB 4/8", { name = "5PB 4/8", hue = "5PB", value = 4, chroma = 8, red = 0.2172, green = 0.3856, blue = 0.5974 } )
-        , ( "5PB 5/10", { name = "5PB 5/10", hue = "5PB", value = 5, chroma = 10, red = 0.264, green = 0.4891, blue = 0.7517 } )
-        , ( "5PB 5/12", { name = "5PB 5/12", hue = "5PB", value = 5, chroma = 12, red = 0.1489, green = 0.4906, blue = 0.807 } )
-        , ( "5PB 5/2", { name = "5PB 5/2", hue = "5PB", value = 5, chroma = 2, red = 0.4571, green = 0.4831, blue = 0.5335 } )
-        , ( "5PB 5/4", { name = "5PB 5/4", hue = "5PB", value = 5, chroma = 4, red = 0.4244, green = 0.4848, blue = 0.5868 } )
-        , ( "5PB 5/6", { name = "5PB 5/6", hue = "5PB", value = 5, chroma = 6, red = 0.3835, green = 0.4862, blue = 0.6434 } )
-        , ( "5PB 5/8", { name = "5PB 5/8", hue = "5PB", value = 5, chroma = 8, red = 0.332, green = 0.4879, blue = 0.6971 } )
-        , ( "5PB 6/10", { name = "5PB 6/10", hue = "5PB", value = 6, chroma = 10, red = 0.3782, green = 0.5933, blue = 0.8576 } )
-        , ( "5PB 6/12", { name = "5PB 6/12", hue = "5PB", value = 6, chroma = 12, red = 0.2819, green = 0.5955, blue = 0.9212 } )
-        , ( "5PB 6/14", { name = "5PB 6/14", hue = "5PB", value = 6, chroma = 14, red = 0.0918, green = 0.5968, blue = 0.9859 } )
-        , ( "5PB 6/2", { name = "5PB 6/2", hue = "5PB", value = 6, chroma = 2, red = 0.5588, green = 0.5862, blue = 0.632 } )
-        , ( "5PB 6/4", { name = "5PB 6/4", hue = "5PB", value = 6, chroma = 4, red = 0.5267, green = 0.5881, blue = 0.6852 } )
-        , ( "5PB 6/6", { name = "5PB 6/6", hue = "5PB", value = 6, chroma = 6, red = 0.4851, green = 0.5899, blue = 0.746 } )
-        , ( "5PB 6/8", { name = "5PB 6/8", hue = "5PB", value = 6, chroma = 8, red = 0.439, green = 0.5913, blue = 0.8022 } )
-        , ( "5PB 7/10", { name = "5PB 7/10", hue = "5PB", value = 7, chroma = 10, red = 0.4699, green = 0.6992, blue = 0.9771 } )
-        , ( "5PB 7/2", { name = "5PB 7/2", hue = "5PB", value = 7, chroma = 2, red = 0.6626, green = 0.6898, blue = 0.7333 } )
-        , ( "5PB 7/4", { name = "5PB 7/4", hue = "5PB", value = 7, chroma = 4, red = 0.6271, green = 0.6925, blue = 0.79 } )
-        , ( "5PB 7/6", { name = "5PB 7/6", hue = "5PB", value = 7, chroma = 6, red = 0.5849, green = 0.6951, blue = 0.849 } )
-        , ( "5PB 7/8", { name = "5PB 7/8", hue = "5PB", value = 7, chroma = 8, red = 0.5361, green = 0.6971, blue = 0.9101 } )
-        , ( "5PB 8/2", { name = "5PB 8/2", hue = "5PB", value = 8, chroma = 2, red = 0.7669, green = 0.795, blue = 0.8352 } )
-        , ( "5PB 8/4", { name = "5PB 8/4", hue = "5PB", value = 8, chroma = 4, red = 0.7275, green = 0.7982, blue = 0.898 } )
-        , ( "5PB 8/6", { name = "5PB 8/6", hue = "5PB", value = 8, chroma = 6, red = 0.6781, green = 0.8015, blue = 0.9672 } )
-        , ( "5PB 9/2", { name = "5PB 9/2", hue = "5PB", value = 9, chroma = 2, red = 0.8745, green = 0.9023, blue = 0.9409 } )
-        , ( "5R 1/2", { name = "5R 1/2", hue = "5R", value = 1, chroma = 2, red = 0.1778, green = 0.0849, blue = 0.1069 } )
-        , ( "5R 1/4", { name = "5R 1/4", hue = "5R", value = 1, chroma = 4, red = 0.2153, green = 0.0551, blue = 0.1057 } )
-        , ( "5R 2/2", { name = "5R 2/2", hue = "5R", value = 2, chroma = 2, red = 0.259, green = 0.1708, blue = 0.1789 } )
-        , ( "5R 2/4", { name = "5R 2/4", hue = "5R", value = 2, chroma = 4, red = 0.3053, green = 0.1457, blue = 0.1677 } )
-        , ( "5R 2/6", { name = "5R 2/6", hue = "5R", value = 2, chroma = 6, red = 0.3455, green = 0.1138, blue = 0.1579 } )
-        , ( "5R 2/8", { name = "5R 2/8", hue = "5R", value = 2, chroma = 8, red = 0.3887, green = 0.0543, blue = 0.1479 } )
-        , ( "5R 3/10", { name = "5R 3/10", hue = "5R", value = 3, chroma = 10, red = 0.5531, green = 0.0972, blue = 0.1692 } )
-        , ( "5R 3/2", { name = "5R 3/2", hue = "5R", value = 3, chroma = 2, red = 0.3594, green = 0.2591, blue = 0.2576 } )
-        , ( "5R 3/4", { name = "5R 3/4", hue = "5R", value = 3, chroma = 4, red = 0.4167, green = 0.2321, blue = 0.2334 } )
-        , ( "5R 3/6", { name = "5R 3/6", hue = "5R", value = 3, chroma = 6, red = 0.4623, green = 0.2029, blue = 0.2118 } )
-        , ( "5R 3/8", { name = "5R 3/8", hue = "5R", value = 3, chroma = 8, red = 0.5089, green = 0.1612, blue = 0.189 } )
-        , ( "5R 4/10", { name = "5R 4/10", hue = "5R", value = 4, chroma = 10, red = 0.6603, green = 0.2353, blue = 0.2514 } )
-        , ( "5R 4/12", { name = "5R 4/12", hue = "5R", value = 4, chroma = 12, red = 0.7018, green = 0.1864, blue = 0.2274 } )
-        , ( "5R 4/14", { name = "5R 4/14", hue = "5R", value = 4, chroma = 14, red = 0.7455, green = 0.1022, blue = 0.2031 } )
-        , ( "5R 4/2", { name = "5R 4/2", hue = "5R", value = 4, chroma = 2, red = 0.4543, green = 0.3585, blue = 0.3538 } )
-        , ( "5R 4/4", { name = "5R 4/4", hue = "5R", value = 4, chroma = 4, red = 0.5156, green = 0.3334, blue = 0.3266 } )
-        , ( "5R 4/6", { name = "5R 4/6", hue = "5R", value = 4, chroma = 6, red = 0.5674, green = 0.3062, blue = 0.3011 } )
-        , ( "5R 4/8", { name = "5R 4/8", hue = "5R", value = 4, chroma = 8, red = 0.617, green = 0.273, blue = 0.2752 } )
-        , ( "5R 5/10", { name = "5R 5/10", hue = "5R", value = 5, chroma = 10, red = 0.7777, green = 0.3454, blue = 0.3429 } )
-        , ( "5R 5/12", { name = "5R 5/12", hue = "5R", value = 5, chroma = 12, red = 0.8266, green = 0.3022, blue = 0.3158 } )
-        , ( "5R 5/14", { name = "5R 5/14", hue = "5R", value = 5, chroma = 14, red = 0.8667, green = 0.2568, blue = 0.2922 } )
-        , ( "5R 5/16", { name = "5R 5/16", hue = "5R", value = 5, chroma = 16, red = 0.9117, green = 0.1848, blue = 0.2662 } )
-        , ( "5R 5/18", { name = "5R 5/18", hue = "5R", value = 5, chroma = 18, red = 0.9551, green = 0.0331, blue = 0.24 } )
-        , ( "5R 5/2", { name = "5R 5/2", hue = "5R", value = 5, chroma = 2, red = 0.5481, green = 0.4624, blue = 0.4576 } )
-        , ( "5R 5/4", { name = "5R 5/4", hue = "5R", value = 5, chroma = 4, red = 0.6156, green = 0.4374, blue = 0.4285 } )
-        , ( "5R 5/6", { name = "5R 5/6", hue = "5R", value = 5, chroma = 6, red = 0.6735, green = 0.4108, blue = 0.3997 } )
-        , ( "5R 5/8", { name = "5R 5/8", hue = "5R", value = 5, chroma = 8, red = 0.7269, green = 0.3807, blue = 0.3714 } )
-        , ( "5R 6/10", { name = "5R 6/10", hue = "5R", value = 6, chroma = 10, red = 0.8863, green = 0.4575, blue = 0.4436 } )
-        , ( "5R 6/12", { name = "5R 6/12", hue = "5R", value = 6, chroma = 12, red = 0.9374, green = 0.4212, blue = 0.4158 } )
-        , ( "5R 6/14", { name = "5R 6/14", hue = "5R", value = 6, chroma = 14, red = 0.9834, green = 0.3817, blue = 0.389 } )
-        , ( "5R 6/16", { name = "5R 6/16", hue = "5R", value = 6, chroma = 16, red = 1, green = 0.33, blue = 0.3596 } )
-        , ( "5R 6/18", { name = "5R 6/18", hue = "5R", value = 6, chroma = 18, red = 1, green = 0.2665, blue = 0.3317 } )
-        , ( "5R 6/2", { name = "5R 6/2", hue = "5R", value = 6, chroma = 2, red = 0.6502, green = 0.5652, blue = 0.5597 } )
-        , ( "5R 6/4", { name = "5R 6/4", hue = "5R", value = 6, chroma = 4, red = 0.7173, green = 0.5419, blue = 0.5302 } )
-        , ( "5R 6/6", { name = "5R 6/6", hue = "5R", value = 6, chroma = 6, red = 0.779, green = 0.5161, blue = 0.4999 } )
-        , ( "5R 6/8", { name = "5R 6/8", hue = "5R", value = 6, chroma = 8, red = 0.8317, green = 0.4898, blue = 0.4733 } )
-        , ( "5R 7/10", { name = "5R 7/10", hue = "5R", value = 7, chroma = 10, red = 1, green = 0.5627, blue = 0.5412 } )
-        , ( "5R 7/12", { name = "5R 7/12", hue = "5R", value = 7, chroma = 12, red = 1, green = 0.5252, blue = 0.5092 } )
-        , ( "5R 7/14", { name = "5R 7/14", hue = "5R", value = 7, chroma = 14, red = 1, green = 0.4858, blue = 0.4789 } )
-        , ( "5R 7/2", { name = "5R 7/2", hue = "5R", value = 7, chroma = 2, red = 0.7524, green = 0.6693, blue = 0.6626 } )
-        , ( "5R 7/4", { name = "5R 7/4", hue = "5R", value = 7, chroma = 4, red = 0.8206, green = 0.6467, blue = 0.6321 } )
-        , ( "5R 7/6", { name = "5R 7/6", hue = "5R", value = 7, chroma = 6, red = 0.8847, green = 0.6215, blue = 0.6018 } )
-        , ( "5R 7/8", { name = "5R 7/8", hue = "5R", value = 7, chroma = 8, red = 0.9465, green = 0.593, blue = 0.5711 } )
-        , ( "5R 8/10", { name = "5R 8/10", hue = "5R", value = 8, chroma = 10, red = 1, green = 0.6616, blue = 0.6322 } )
-        , ( "5R 8/2", { name = "5R 8/2", hue = "5R", value = 8, chroma = 2, red = 0.8478, green = 0.7771, blue = 0.7702 } )
-        , ( "5R 8/4", { name = "5R 8/4", hue = "5R", value = 8, chroma = 4, red = 0.9299, green = 0.751, blue = 0.7332 } )
-        , ( "5R 8/6", { name = "5R 8/6", hue = "5R", value = 8, chroma = 6, red = 0.9979, green = 0.7253, blue = 0.7008 } )
-        , ( "5R 8/8", { name = "5R 8/8", hue = "5R", value = 8, chroma = 8, red = 1, green = 0.6942, blue = 0.6659 } )
-        , ( "5R 9/2", { name = "5R 9/2", hue = "5R", value = 9, chroma = 2, red = 0.9555, green = 0.8845, blue = 0.8758 } )
-        , ( "5R 9/4", { name = "5R 9/4", hue = "5R", value = 9, chroma = 4, red = 1, green = 0.8552, blue = 0.8343 } )
-        , ( "5R 9/6", { name = "5R 9/6", hue = "5R", value = 9, chroma = 6, red = 1, green = 0.8264, blue = 0.7953 } )
-        , ( "5RP 1/2", { name = "5RP 1/2", hue = "5RP", value = 1, chroma = 2, red = 0.1651, green = 0.0873, blue = 0.1397 } )
-        , ( "5RP 1/4", { name = "5RP 1/4", hue = "5RP", value = 1, chroma = 4, red = 0.1952, green = 0.0626, blue = 0.1587 } )
-        , ( "5RP 1/6", { name = "5RP 1/6", hue = "5RP", value = 1, chroma = 6, red = 0.2212, green = 0.0258, blue = 0.1769 } )
-        , ( "5RP 2/2", { name = "5RP 2/2", hue = "5RP", value = 2, chroma = 2, red = 0.2495, green = 0.1713, blue = 0.2103 } )
-        , ( "5RP 2/4", { name = "5RP 2/4", hue = "5RP", value = 2, chroma = 4, red = 0.2854, green = 0.1503, blue = 0.2238 } )
-        , ( "5RP 2/6", { name = "5RP 2/6", hue = "5RP", value = 2, chroma = 6, red = 0.3186, green = 0.1237, blue = 0.2383 } )
-        , ( "5RP 2/8", { name = "5RP 2/8", hue = "5RP", value = 2, chroma = 8, red = 0.3561, green = 0.0773, blue = 0.2569 } )
-        , ( "5RP 3/10", { name = "5RP 3/10", hue = "5RP", value = 3, chroma = 10, red = 0.5165, green = 0.115, blue = 0.3469 } )
-        , ( "5RP 3/2", { name = "5RP 3/2", hue = "5RP", value = 3, chroma = 2, red = 0.3466, green = 0.2602, blue = 0.295 } )
-        , ( "5RP 3/4", { name = "5RP 3/4", hue = "5RP", value = 3, chroma = 4, red = 0.3961, green = 0.2344, blue = 0.307 } )
-        , ( "5RP 3/6", { name = "5RP 3/6", hue = "5RP", value = 3, chroma = 6, red = 0.4378, green = 0.2058, blue = 0.3189 } )
-        , ( "5RP 3/8", { name = "5RP 3/8", hue = "5RP", value = 3, chroma = 8, red = 0.4786, green = 0.1676, blue = 0.3327 } )
-        , ( "5RP 4/10", { name = "5RP 4/10", hue = "5RP", value = 4, chroma = 10, red = 0.6209, green = 0.2456, blue = 0.4272 } )
-        , ( "5RP 4/12", { name = "5RP 4/12", hue = "5RP", value = 4, chroma = 12, red = 0.6627, green = 0.1967, blue = 0.4391 } )
-        , ( "5RP 4/14", { name = "5RP 4/14", hue = "5RP", value = 4, chroma = 14, red = 0.6995, green = 0.1326, blue = 0.4507 } )
-        , ( "5RP 4/2", { name = "5RP 4/2", hue = "5RP", value = 4, chroma = 2, red = 0.4417, green = 0.3594, blue = 0.3892 } )
-        , ( "5RP 4/4", { name = "5RP 4/4", hue = "5RP", value = 4, chroma = 4, red = 0.4919, green = 0.3366, blue = 0.3979 } )
-        , ( "5RP 4/6", { name = "5RP 4/6", hue = "5RP", value = 4, chroma = 6, red = 0.5405, green = 0.3091, blue = 0.4073 } )
-        , ( "5RP 4/8", { name = "5RP 4/8", hue = "5RP", value = 4, chroma = 8, red = 0.5849, green = 0.2776, blue = 0.4175 } )
-        , ( "5RP 5/10", { name = "5RP 5/10", hue = "5RP", value = 5, chroma = 10, red = 0.7362, green = 0.3536, blue = 0.518 } )
-        , ( "5RP 5/12", { name = "5RP 5/12", hue = "5RP", value = 5, chroma = 12, red = 0.7818, green = 0.313, blue = 0.5277 } )
-        , ( "5RP 5/14", { name = "5RP 5/14", hue = "5RP", value = 5, chroma = 14, red = 0.8216, green = 0.2681, blue = 0.5373 } )
-        , ( "5RP 5/16", { name = "5RP 5/16", hue = "5RP", value = 5, chroma = 16, red = 0.8622, green = 0.2063, blue = 0.5479 } )
-        , ( "5RP 5/18", { name = "5RP 5/18", hue = "5RP", value = 5, chroma = 18, red = 0.9005, green = 0.1105, blue = 0.5581 } )
-        , ( "5RP 5/2", { name = "5RP 5/2", hue = "5RP", value = 5, chroma = 2, red = 0.5355, green = 0.4637, blue = 0.4867 } )
-        , ( "5RP 5/4", { name = "5RP 5/4", hue = "5RP", value = 5, chroma = 4, red = 0.5902, green = 0.4411, blue = 0.4937 } )
-        , ( "5RP 5/6", { name = "5RP 5/6", hue = "5RP", value = 5, chroma = 6, red = 0.6427, green = 0.4151, blue = 0.5012 } )
-        , ( "5RP 5/8", { name = "5RP 5/8", hue = "5RP", value = 5, chroma = 8, red = 0.6939, green = 0.3844, blue = 0.5095 } )
-        , ( "5RP 6/10", { name = "5RP 6/10", hue = "5RP", value = 6, chroma = 10, red = 0.8396, green = 0.4668, blue = 0.6135 } )
-        , ( "5RP 6/12", { name = "5RP 6/12", hue = "5RP", value = 6, chroma = 12, red = 0.888, green = 0.4316, blue = 0.622 } )
-        , ( "5RP 6/14", { name = "5RP 6/14", hue = "5RP", value = 6, chroma = 14, red = 0.935, green = 0.3905, blue = 0.6322 } )
-        , ( "5RP 6/16", { name = "5RP 6/16", hue = "5RP", value = 6, chroma = 16, red = 0.9781, green = 0.3442, blue = 0.6416 } )
-        , ( "5RP 6/18", { name = "5RP 6/18", hue = "5RP", value = 6, chroma = 18, red = 1, green = 0.2857, blue = 0.6519 } )
-        , ( "5RP 6/2", { name = "5RP 6/2", hue = "5RP", value = 6, chroma = 2, red = 0.6376, green = 0.5665, blue = 0.5881 } )
-        , ( "5RP 6/20", { name = "5RP 6/20", hue = "5RP", value = 6, chroma = 20, red = 1, green = 0.1834, blue = 0.665 } )
-        , ( "5RP 6/22", { name = "5RP 6/22", hue = "5RP", value = 6, chroma = 22, red = 1, green = 0.0149, blue = 0.6737 } )
-        , ( "5RP 6/4", { name = "5RP 6/4", hue = "5RP", value = 6, chroma = 4, red = 0.6914, green = 0.5456, blue = 0.5931 } )
-        , ( "5RP 6/6", { name = "5RP 6/6", hue = "5RP", value = 6, chroma = 6, red = 0.7478, green = 0.5196, blue = 0.6001 } )
-        , ( "5RP 6/8", { name = "5RP 6/8", hue = "5RP", value = 6, chroma = 8, red = 0.7951, green = 0.4943, blue = 0.6066 } )
-        , ( "5RP 7/10", { name = "5RP 7/10", hue = "5RP", value = 7, chroma = 10, red = 0.9553, green = 0.5703, blue = 0.7125 } )
-        , ( "5RP 7/12", { name = "5RP 7/12", hue = "5RP", value = 7, chroma = 12, red = 1, green = 0.5343, blue = 0.7214 } )
-        , ( "5RP 7/14", { name = "5RP 7/14", hue = "5RP", value = 7, chroma = 14, red = 1, green = 0.4956, blue = 0.7303 } )
-        , ( "5RP 7/16", { name = "5RP 7/16", hue = "5RP", value = 7, chroma = 16, red = 1, green = 0.4477, blue = 0.7411 } )
-        , ( "5RP 7/18", { name = "5RP 7/18", hue = "5RP", value = 7, chroma = 18, red = 1, green = 0.3929, blue = 0.7513 } )
-        , ( "5RP 7/2", { name = "5RP 7/2", hue = "5RP", value = 7, chroma = 2, red = 0.7368, green = 0.6716, blue = 0.6903 } )
-        , ( "5RP 7/4", { name = "5RP 7/4", hue = "5RP", value = 7, chroma = 4, red = 0.7932, green = 0.6506, blue = 0.6946 } )
-        , ( "5RP 7/6", { name = "5RP 7/6", hue = "5RP", value = 7, chroma = 6, red = 0.8532, green = 0.6247, blue = 0.7004 } )
-        , ( "5RP 7/8", { name = "5RP 7/8", hue = "5RP", value = 7, chroma = 8, red = 0.9091, green = 0.5968, blue = 0.7063 } )
-        , ( "5RP 8/10", { name = "5RP 8/10", hue = "5RP", value = 8, chroma = 10, red = 1, green = 0.6687, blue = 0.8157 } )
-        , ( "5RP 8/12", { name = "5RP 8/12", hue = "5RP", value = 8, chroma = 12, red = 1, green = 0.6288, blue = 0.8245 } )
-        , ( "5RP 8/2", { name = "5RP 8/2", hue = "5RP", value = 8, chroma = 2, red = 0.8345, green = 0.7789, blue = 0.7942 } )
-        , ( "5RP 8/4", { name = "5RP 8/4", hue = "5RP", value = 8, chroma = 4, red = 0.8993, green = 0.7556, blue = 0.7978 } )
-        , ( "5RP 8/6", { name = "5RP 8/6", hue = "5RP", value = 8, chroma = 6, red = 0.964, green = 0.7288, blue = 0.8027 } )
-        , ( "5RP 8/8", { name = "5RP 8/8", hue = "5RP", value = 8, chroma = 8, red = 1, green = 0.6988, blue = 0.809 } )
-        , ( "5RP 9/2", { name = "5RP 9/2", hue = "5RP", value = 9, chroma = 2, red = 0.9419, green = 0.8862, blue = 0.9009 } )
-        , ( "5RP 9/4", { name = "5RP 9/4", hue = "5RP", value = 9, chroma = 4, red = 1, green = 0.8602, blue = 0.9042 } )
-        , ( "5RP 9/6", { name = "5RP 9/6", hue = "5RP", value = 9, chroma = 6, red = 1, green = 0.8308, blue = 0.9094 } )
-        , ( "5Y 1/2", { name = "5Y 1/2", hue = "5Y", value = 1, chroma = 2, red = 0.1405, green = 0.1095, blue = 0.0292 } )
-        , ( "5Y 2/2", { name = "5Y 2/2", hue = "5Y", value = 2, chroma = 2, red = 0.2199, green = 0.1918, blue = 0.1247 } )
-        , ( "5Y 2/4", { name = "5Y 2/4", hue = "5Y", value = 2, chroma = 4, red = 0.2422, green = 0.1883, blue = 0.0075 } )
-        , ( "5Y 3/2", { name = "5Y 3/2", hue = "5Y", value = 3, chroma = 2, red = 0.3126, green = 0.2822, blue = 0.204 } )
-        , ( "5Y 3/4", { name = "5Y 3/4", hue = "5Y", value = 3, chroma = 4, red = 0.3351, green = 0.2794, blue = 0.1163 } )
-        , ( "5Y 4/2", { name = "5Y 4/2", hue = "5Y", value = 4, chroma = 2, red = 0.4135, green = 0.3796, blue = 0.2875 } )
-        , ( "5Y 4/4", { name = "5Y 4/4", hue = "5Y", value = 4, chroma = 4, red = 0.439, green = 0.3769, blue = 0.1907 } )
-        , ( "5Y 4/6", { name = "5Y 4/6", hue = "5Y", value = 4, chroma = 6, red = 0.4566, green = 0.3742, blue = 0.081 } )
-        , ( "5Y 5/2", { name = "5Y 5/2", hue = "5Y", value = 5, chroma = 2, red = 0.5133, green = 0.4814, blue = 0.3855 } )
-        , ( "5Y 5/4", { name = "5Y 5/4", hue = "5Y", value = 5, chroma = 4, red = 0.5412, green = 0.4791, blue = 0.2848 } )
-        , ( "5Y 5/6", { name = "5Y 5/6", hue = "5Y", value = 5, chroma = 6, red = 0.5643, green = 0.4759, blue = 0.1701 } )
-        , ( "5Y 6/2", { name = "5Y 6/2", hue = "5Y", value = 6, chroma = 2, red = 0.6167, green = 0.5843, blue = 0.4802 } )
-        , ( "5Y 6/4", { name = "5Y 6/4", hue = "5Y", value = 6, chroma = 4, red = 0.6426, green = 0.5831, blue = 0.3817 } )
-        , ( "5Y 6/6", { name = "5Y 6/6", hue = "5Y", value = 6, chroma = 6, red = 0.668, green = 0.5802, blue = 0.2706 } )
-        , ( "5Y 6/8", { name = "5Y 6/8", hue = "5Y", value = 6, chroma = 8, red = 0.686, green = 0.5778, blue = 0.1369 } )
-        , ( "5Y 7/10", { name = "5Y 7/10", hue = "5Y", value = 7, chroma = 10, red = 0.8078, green = 0.6809, blue = 0.0582 } )
-        , ( "5Y 7/2", { name = "5Y 7/2", hue = "5Y", value = 7, chroma = 2, red = 0.721, green = 0.6881, blue = 0.5788 } )
-        , ( "5Y 7/4", { name = "5Y 7/4", hue = "5Y", value = 7, chroma = 4, red = 0.7468, green = 0.6876, blue = 0.476 } )
-        , ( "5Y 7/6", { name = "5Y 7/6", hue = "5Y", value = 7, chroma = 6, red = 0.7706, green = 0.6858, blue = 0.37 } )
-        , ( "5Y 7/8", { name = "5Y 7/8", hue = "5Y", value = 7, chroma = 8, red = 0.791, green = 0.6833, blue = 0.2547 } )
-        , ( "5Y 8/10", { name = "5Y 8/10", hue = "5Y", value = 8, chroma = 10, red = 0.9134, green = 0.7887, blue = 0.2113 } )
-        , ( "5Y 8/2", { name = "5Y 8/2", hue = "5Y", value = 8, chroma = 2, red = 0.8262, green = 0.7935, blue = 0.6761 } )
-        , ( "5Y 8/4", { name = "5Y 8/4", hue = "5Y", value = 8, chroma = 4, red = 0.8501, green = 0.794, blue = 0.5737 } )
-        , ( "5Y 8/6", { name = "5Y 8/6", hue = "5Y", value = 8, chroma = 6, red = 0.8747, green = 0.7926, blue = 0.4664 } )
-        , ( "5Y 8/8", { name = "5Y 8/8", hue = "5Y", value = 8, chroma = 8, red = 0.8957, green = 0.7908, blue = 0.3512 } )
-        , ( "5Y 9/10", { name = "5Y 9/10", hue = "5Y", value = 9, chroma = 10, red = 1, green = 0.8989, blue = 0.3143 } )
-        , ( "5Y 9/12", { name = "5Y 9/12", hue = "5Y", value = 9, chroma = 12, red = 1, green = 0.8974, blue = 0.1138 } )
-        , ( "5Y 9/2", { name = "5Y 9/2", hue = "5Y", value = 9, chroma = 2, red = 0.9346, green = 0.9013, blue = 0.7743 } )
-        , ( "5Y 9/4", { name = "5Y 9/4", hue = "5Y", value = 9, chroma = 4, red = 0.9601, green = 0.9021, blue = 0.6645 } )
-        , ( "5Y 9/6", { name = "5Y 9/6", hue = "5Y", value = 9, chroma = 6, red = 0.9839, green = 0.9014, blue = 0.5547 } )
-        , ( "5Y 9/8", { name = "5Y 9/8", hue = "5Y", value = 9, chroma = 8, red = 1, green = 0.9004, blue = 0.4396 } )
-        , ( "5YR 1/2", { name = "5YR 1/2", hue = "5YR", value = 1, chroma = 2, red = 0.1728, green = 0.0926, blue = 0.0615 } )
-        , ( "5YR 2/2", { name = "5YR 2/2", hue = "5YR", value = 2, chroma = 2, red = 0.2516, green = 0.1776, blue = 0.1457 } )
-        , ( "5YR 2/4", { name = "5YR 2/4", hue = "5YR", value = 2, chroma = 4, red = 0.2941, green = 0.16, blue = 0.0908 } )
-        , ( "5YR 2/6", { name = "5YR 2/6", hue = "5YR", value = 2, chroma = 6, red = 0.3278, green = 0.1409, blue = 0.0038 } )
-        , ( "5YR 3/2", { name = "5YR 3/2", hue = "5YR", value = 3, chroma = 2, red = 0.3498, green = 0.2666, blue = 0.2237 } )
-        , ( "5YR 3/4", { name = "5YR 3/4", hue = "5YR", value = 3, chroma = 4, red = 0.3947, green = 0.2503, blue = 0.1663 } )
-        , ( "5YR 3/6", { name = "5YR 3/6", hue = "5YR", value = 3, chroma = 6, red = 0.4318, green = 0.2332, blue = 0.0964 } )
-        , ( "5YR 4/2", { name = "5YR 4/2", hue = "5YR", value = 4, chroma = 2, red = 0.4507, green = 0.3638, blue = 0.3152 } )
-        , ( "5YR 4/4", { name = "5YR 4/4", hue = "5YR", value = 4, chroma = 4, red = 0.5032, green = 0.3465, blue = 0.2493 } )
-        , ( "5YR 4/6", { name = "5YR 4/6", hue = "5YR", value = 4, chroma = 6, red = 0.5417, green = 0.331, blue = 0.1841 } )
-        , ( "5YR 4/8", { name = "5YR 4/8", hue = "5YR", value = 4, chroma = 8, red = 0.5737, green = 0.3156, blue = 0.1064 } )
-        , ( "5YR 5/10", { name = "5YR 5/10", hue = "5YR", value = 5, chroma = 10, red = 0.7222, green = 0.4006, blue = 0.0986 } )
-        , ( "5YR 5/2", { name = "5YR 5/2", hue = "5YR", value = 5, chroma = 2, red = 0.5494, green = 0.466, blue = 0.4168 } )
-        , ( "5YR 5/4", { name = "5YR 5/4", hue = "5YR", value = 5, chroma = 4, red = 0.6039, green = 0.4501, blue = 0.3492 } )
-        , ( "5YR 5/6", { name = "5YR 5/6", hue = "5YR", value = 5, chroma = 6, red = 0.6525, green = 0.4325, blue = 0.275 } )
-        , ( "5YR 5/8", { name = "5YR 5/8", hue = "5YR", value = 5, chroma = 8, red = 0.6921, green = 0.4155, blue = 0.1943 } )
-        , ( "5YR 6/10", { name = "5YR 6/10", hue = "5YR", value = 6, chroma = 10, red = 0.84, green = 0.5034, blue = 0.2067 } )
-        , ( "5YR 6/12", { name = "5YR 6/12", hue = "5YR", value = 6, chroma = 12, red = 0.8683, green = 0.4897, blue = 0.0817 } )
-        , ( "5YR 6/2", { name = "5YR 6/2", hue = "5YR", value = 6, chroma = 2, red = 0.654, green = 0.5684, blue = 0.5155 } )
-        , ( "5YR 6/4", { name = "5YR 6/4", hue = "5YR", value = 6, chroma = 4, red = 0.7099, green = 0.5528, blue = 0.448 } )
-        , ( "5YR 6/6", { name = "5YR 6/6", hue = "5YR", value = 6, chroma = 6, red = 0.7608, green = 0.5361, blue = 0.3725 } )
-        , ( "5YR 6/8", { name = "5YR 6/8", hue = "5YR", value = 6, chroma = 8, red = 0.804, green = 0.5194, blue = 0.2948 } )
-        , ( "5YR 7/10", { name = "5YR 7/10", hue = "5YR", value = 7, chroma = 10, red = 0.9541, green = 0.6084, blue = 0.3102 } )
-        , ( "5YR 7/12", { name = "5YR 7/12", hue = "5YR", value = 7, chroma = 12, red = 0.9906, green = 0.5919, blue = 0.203 } )
-        , ( "5YR 7/2", { name = "5YR 7/2", hue = "5YR", value = 7, chroma = 2, red = 0.7573, green = 0.6722, blue = 0.618 } )
-        , ( "5YR 7/4", { name = "5YR 7/4", hue = "5YR", value = 7, chroma = 4, red = 0.8166, green = 0.6566, blue = 0.5464 } )
-        , ( "5YR 7/6", { name = "5YR 7/6", hue = "5YR", value = 7, chroma = 6, red = 0.8701, green = 0.6401, blue = 0.4704 } )
-        , ( "5YR 7/8", { name = "5YR 7/8", hue = "5YR", value = 7, chroma = 8, red = 0.9141, green = 0.6244, blue = 0.396 } )
-        , ( "5YR 8/10", { name = "5YR 8/10", hue = "5YR", value = 8, chroma = 10, red = 1, green = 0.7124, blue = 0.4004 } )
-        , ( "5YR 8/12", { name = "5YR 8/12", hue = "5YR", value = 8, chroma = 12, red = 1, green = 0.6963, blue = 0.3007 } )
-        , ( "5YR 8/14", { name = "5YR 8/14", hue = "5YR", value = 8, chroma = 14, red = 1, green = 0.6822, blue = 0.1704 } )
-        , ( "5YR 8/2", { name = "5YR 8/2", hue = "5YR", value = 8, chroma = 2, red = 0.8591, green = 0.7782, blue = 0.7227 } )
-        , ( "5YR 8/4", { name = "5YR 8/4", hue = "5YR", value = 8, chroma = 4, red = 0.9255, green = 0.7615, blue = 0.6434 } )
-        , ( "5YR 8/6", { name = "5YR 8/6", hue = "5YR", value = 8, chroma = 6, red = 0.9805, green = 0.7451, blue = 0.5682 } )
-        , ( "5YR 8/8", { name = "5YR 8/8", hue = "5YR", value = 8, chroma = 8, red = 1, green = 0.7275, blue = 0.4807 } )
-        , ( "5YR 9/2", { name = "5YR 9/2", hue = "5YR", value = 9, chroma = 2, red = 0.9679, green = 0.8856, blue = 0.8249 } )
-        , ( "5YR 9/4", { name = "5YR 9/4", hue = "5YR", value = 9, chroma = 4, red = 1, green = 0.8673, blue = 0.735 } )
-        , ( "5YR 9/6", { name = "5YR 9/6", hue = "5YR", value = 9, chroma = 6, red = 1, green = 0.8507, blue = 0.6542 } )
-        , ( "7.5B 1/2", { name = "7.5B 1/2", hue = "7.5B", value = 1, chroma = 2, red = 0.0468, green = 0.121, blue = 0.1582 } )
-        , ( "7.5B 2/2", { name = "7.5B 2/2", hue = "7.5B", value = 2, chroma = 2, red = 0.1362, green = 0.2031, blue = 0.2369 } )
-        , ( "7.5B 2/4", { name = "7.5B 2/4", hue = "7.5B", value = 2, chroma = 4, red = 0.0173, green = 0.2104, blue = 0.2834 } )
-        , ( "7.5B 3/2", { name = "7.5B 3/2", hue = "7.5B", value = 3, chroma = 2, red = 0.2171, green = 0.2951, blue = 0.3335 } )
-        , ( "7.5B 3/4", { name = "7.5B 3/4", hue = "7.5B", value = 3, chroma = 4, red = 0.1152, green = 0.3041, blue = 0.3843 } )
-        , ( "7.5B 4/2", { name = "7.5B 4/2", hue = "7.5B", value = 4, chroma = 2, red = 0.3179, green = 0.3926, blue = 0.4272 } )
-        , ( "7.5B 4/4", { name = "7.5B 4/4", hue = "7.5B", value = 4, chroma = 4, red = 0.2334, green = 0.4026, blue = 0.4769 } )
-        , ( "7.5B 4/6", { name = "7.5B 4/6", hue = "7.5B", value = 4, chroma = 6, red = 0.0953, green = 0.4105, blue = 0.5248 } )
-        , ( "7.5B 5/2", { name = "7.5B 5/2", hue = "7.5B", value = 5, chroma = 2, red = 0.4193, green = 0.494, blue = 0.5259 } )
-        , ( "7.5B 5/4", { name = "7.5B 5/4", hue = "7.5B", value = 5, chroma = 4, red = 0.3404, green = 0.5048, blue = 0.5749 } )
-        , ( "7.5B 5/6", { name = "7.5B 5/6", hue = "7.5B", value = 5, chroma = 6, red = 0.2319, green = 0.5143, blue = 0.6242 } )
-        , ( "7.5B 6/2", { name = "7.5B 6/2", hue = "7.5B", value = 6, chroma = 2, red = 0.5222, green = 0.5967, blue = 0.6259 } )
-        , ( "7.5B 6/4", { name = "7.5B 6/4", hue = "7.5B", value = 6, chroma = 4, red = 0.4463, green = 0.6082, blue = 0.674 } )
-        , ( "7.5B 6/6", { name = "7.5B 6/6", hue = "7.5B", value = 6, chroma = 6, red = 0.342, green = 0.6194, blue = 0.7263 } )
-        , ( "7.5B 6/8", { name = "7.5B 6/8", hue = "7.5B", value = 6, chroma = 8, red = 0.18, green = 0.629, blue = 0.7779 } )
-        , ( "7.5B 7/2", { name = "7.5B 7/2", hue = "7.5B", value = 7, chroma = 2, red = 0.6257, green = 0.7004, blue = 0.7285 } )
-        , ( "7.5B 7/4", { name = "7.5B 7/4", hue = "7.5B", value = 7, chroma = 4, red = 0.5429, green = 0.7141, blue = 0.7775 } )
-        , ( "7.5B 7/6", { name = "7.5B 7/6", hue = "7.5B", value = 7, chroma = 6, red = 0.4473, green = 0.7256, blue = 0.8271 } )
-        , ( "7.5B 7/8", { name = "7.5B 7/8", hue = "7.5B", value = 7, chroma = 8, red = 0.3084, green = 0.7364, blue = 0.8815 } )
-        , ( "7.5B 8/2", { name = "7.5B 8/2", hue = "7.5B", value = 8, chroma = 2, red = 0.7333, green = 0.8048, blue = 0.8309 } )
-        , ( "7.5B 8/4", { name = "7.5B 8/4", hue = "7.5B", value = 8, chroma = 4, red = 0.6414, green = 0.8208, blue = 0.8839 } )
-        , ( "7.5B 8/6", { name = "7.5B 8/6", hue = "7.5B", value = 8, chroma = 6, red = 0.5358, green = 0.8343, blue = 0.9392 } )
-        , ( "7.5B 8/8", { name = "7.5B 8/8", hue = "7.5B", value = 8, chroma = 8, red = 0.3783, green = 0.8479, blue = 1 } )
-        , ( "7.5B 9/2", { name = "7.5B 9/2", hue = "7.5B", value = 9, chroma = 2, red = 0.8383, green = 0.9127, blue = 0.9385 } )
-        , ( "7.5B 9/4", { name = "7.5B 9/4", hue = "7.5B", value = 9, chroma = 4, red = 0.728, green = 0.9321, blue = 1 } )
-        , ( "7.5BG 1/2", { name = "7.5BG 1/2", hue = "7.5BG", value = 1, chroma = 2, red = 0.0416, green = 0.1251, blue = 0.1322 } )
-        , ( "7.5BG 2/2", { name = "7.5BG 2/2", hue = "7.5BG", value = 2, chroma = 2, red = 0.1316, green = 0.2071, blue = 0.2115 } )
-        , ( "7.5BG 3/2", { name = "7.5BG 3/2", hue = "7.5BG", value = 3, chroma = 2, red = 0.2085, green = 0.3004, blue = 0.3038 } )
-        , ( "7.5BG 3/4", { name = "7.5BG 3/4", hue = "7.5BG", value = 3, chroma = 4, red = 0.0528, green = 0.3164, blue = 0.3274 } )
-        , ( "7.5BG 4/2", { name = "7.5BG 4/2", hue = "7.5BG", value = 4, chroma = 2, red = 0.2997, green = 0.3998, blue = 0.3999 } )
-        , ( "7.5BG 4/4", { name = "7.5BG 4/4", hue = "7.5BG", value = 4, chroma = 4, red = 0.1804, green = 0.4166, blue = 0.4212 } )
-        , ( "7.5BG 5/2", { name = "7.5BG 5/2", hue = "7.5BG", value = 5, chroma = 2, red = 0.3962, green = 0.5023, blue = 0.5002 } )
-        , ( "7.5BG 5/4", { name = "7.5BG 5/4", hue = "7.5BG", value = 5, chroma = 4, red = 0.2932, green = 0.5195, blue = 0.5178 } )
-        , ( "7.5BG 5/6", { name = "7.5BG 5/6", hue = "7.5BG", value = 5, chroma = 6, red = 0.1071, green = 0.5353, blue = 0.5366 } )
-        , ( "7.5BG 6/2", { name = "7.5BG 6/2", hue = "7.5BG", value = 6, chroma = 2, red = 0.4948, green = 0.6062, blue = 0.6013 } )
-        , ( "7.5BG 6/4", { name = "7.5BG 6/4", hue = "7.5BG", value = 6, chroma = 4, red = 0.3853, green = 0.6258, blue = 0.6196 } )
-        , ( "7.5BG 6/6", { name = "7.5BG 6/6", hue = "7.5BG", value = 6, chroma = 6, red = 0.2386, green = 0.6422, blue = 0.6376 } )
-        , ( "7.5BG 7/2", { name = "7.5BG 7/2", hue = "7.5BG", value = 7, chroma = 2, red = 0.5944, green = 0.7111, blue = 0.7027 } )
-        , ( "7.5BG 7/4", { name = "7.5BG 7/4", hue = "7.5BG", value = 7, chroma = 4, red = 0.4909, green = 0.731, blue = 0.7189 } )
-        , ( "7.5BG 7/6", { name = "7.5BG 7/6", hue = "7.5BG", value = 7, chroma = 6, red = 0.3732, green = 0.7472, blue = 0.7346 } )
-        , ( "7.5BG 7/8", { name = "7.5BG 7/8", hue = "7.5BG", value = 7, chroma = 8, red = 0.133, green = 0.7642, blue = 0.7522 } )
-        , ( "7.5BG 8/2", { name = "7.5BG 8/2", hue = "7.5BG", value = 8, chroma = 2, red = 0.6967, green = 0.8168, blue = 0.8072 } )
-        , ( "7.5BG 8/4", { name = "7.5BG 8/4", hue = "7.5BG", value = 8, chroma = 4, red = 0.5941, green = 0.8377, blue = 0.8209 } )
-        , ( "7.5BG 8/6", { name = "7.5BG 8/6", hue = "7.5BG", value = 8, chroma = 6, red = 0.4599, green = 0.8576, blue = 0.8398 } )
-        , ( "7.5BG 8/8", { name = "7.5BG 8/8", hue = "7.5BG", value = 8, chroma = 8, red = 0.2697, green = 0.875, blue = 0.8558 } )
-        , ( "7.5BG 9/2", { name = "7.5BG 9/2", hue = "7.5BG", value = 9, chroma = 2, red = 0.7965, green = 0.9262, blue = 0.9137 } )
-        , ( "7.5BG 9/4", { name = "7.5BG 9/4", hue = "7.5BG", value = 9, chroma = 4, red = 0.6805, green = 0.9501, blue = 0.9285 } )
-        , ( "7.5BG 9/6", { name = "7.5BG 9/6", hue = "7.5BG", value = 9, chroma = 6, red = 0.5339, green = 0.9726, blue = 0.9452 } )
-        , ( "7.5BG 9/8", { name = "7.5BG 9/8", hue = "7.5BG", value = 9, chroma = 8, red = 0.3113, green = 0.9935, blue = 0.9629 } )
-        , ( "7.5G 1/2", { name = "7.5G 1/2", hue = "7.5G", value = 1, chroma = 2, red = 0.0637, green = 0.1247, blue = 0.1045 } )
-        , ( "7.5G 2/2", { name = "7.5G 2/2", hue = "7.5G", value = 2, chroma = 2, red = 0.1459, green = 0.2071, blue = 0.1842 } )
-        , ( "7.5G 2/4", { name = "7.5G 2/4", hue = "7.5G", value = 2, chroma = 4, red = 0.0495, green = 0.2213, blue = 0.174 } )
-        , ( "7.5G 3/2", { name = "7.5G 3/2", hue = "7.5G", value = 3, chroma = 2, red = 0.2237, green = 0.3007, blue = 0.2707 } )
-        , ( "7.5G 3/4", { name = "7.5G 3/4", hue = "7.5G", value = 3, chroma = 4, red = 0.1243, green = 0.3177, blue = 0.2569 } )
-        , ( "7.5G 4/2", { name = "7.5G 4/2", hue = "7.5G", value = 4, chroma = 2, red = 0.3135, green = 0.4004, blue = 0.3649 } )
-        , ( "7.5G 4/4", { name = "7.5G 4/4", hue = "7.5G", value = 4, chroma = 4, red = 0.2191, green = 0.4189, blue = 0.3493 } )
-        , ( "7.5G 4/6", { name = "7.5G 4/6", hue = "7.5G", value = 4, chroma = 6, red = 0.0213, green = 0.4348, blue = 0.337 } )
-        , ( "7.5G 5/2", { name = "7.5G 5/2", hue = "7.5G", value = 5, chroma = 2, red = 0.4091, green = 0.5033, blue = 0.4627 } )
-        , ( "7.5G 5/4", { name = "7.5G 5/4", hue = "7.5G", value = 5, chroma = 4, red = 0.3221, green = 0.5221, blue = 0.4462 } )
-        , ( "7.5G 5/6", { name = "7.5G 5/6", hue = "7.5G", value = 5, chroma = 6, red = 0.2056, green = 0.5383, blue = 0.4326 } )
-        , ( "7.5G 6/2", { name = "7.5G 6/2", hue = "7.5G", value = 6, chroma = 2, red = 0.5043, green = 0.608, blue = 0.5623 } )
-        , ( "7.5G 6/4", { name = "7.5G 6/4", hue = "7.5G", value = 6, chroma = 4, red = 0.4127, green = 0.6287, blue = 0.5431 } )
-        , ( "7.5G 6/6", { name = "7.5G 6/6", hue = "7.5G", value = 6, chroma = 6, red = 0.3096, green = 0.6452, blue = 0.5292 } )
-        , ( "7.5G 6/8", { name = "7.5G 6/8", hue = "7.5G", value = 6, chroma = 8, red = 0.1362, green = 0.6606, blue = 0.5153 } )
-        , ( "7.5G 7/2", { name = "7.5G 7/2", hue = "7.5G", value = 7, chroma = 2, red = 0.6027, green = 0.7132, blue = 0.6631 } )
-        , ( "7.5G 7/4", { name = "7.5G 7/4", hue = "7.5G", value = 7, chroma = 4, red = 0.518, green = 0.7334, blue = 0.6439 } )
-        , ( "7.5G 7/6", { name = "7.5G 7/6", hue = "7.5G", value = 7, chroma = 6, red = 0.4228, green = 0.7509, blue = 0.6274 } )
-        , ( "7.5G 7/8", { name = "7.5G 7/8", hue = "7.5G", value = 7, chroma = 8, red = 0.2909, green = 0.7675, blue = 0.6122 } )
-        , ( "7.5G 8/10", { name = "7.5G 8/10", hue = "7.5G", value = 8, chroma = 10, red = 0.1854, green = 0.8948, blue = 0.6925 } )
-        , ( "7.5G 8/2", { name = "7.5G 8/2", hue = "7.5G", value = 8, chroma = 2, red = 0.7013, green = 0.8201, blue = 0.7651 } )
-        , ( "7.5G 8/4", { name = "7.5G 8/4", hue = "7.5G", value = 8, chroma = 4, red = 0.616, green = 0.8411, blue = 0.7441 } )
-        , ( "7.5G 8/6", { name = "7.5G 8/6", hue = "7.5G", value = 8, chroma = 6, red = 0.511, green = 0.8614, blue = 0.7241 } )
-        , ( "7.5G 8/8", { name = "7.5G 8/8", hue = "7.5G", value = 8, chroma = 8, red = 0.3912, green = 0.8783, blue = 0.7085 } )
-        , ( "7.5G 9/10", { name = "7.5G 9/10", hue = "7.5G", value = 9, chroma = 10, red = 0.2806, green = 1, blue = 0.7865 } )
-        , ( "7.5G 9/2", { name = "7.5G 9/2", hue = "7.5G", value = 9, chroma = 2, red = 0.801, green = 0.9298, blue = 0.8689 } )
-        , ( "7.5G 9/4", { name = "7.5G 9/4", hue = "7.5G", value = 9, chroma = 4, red = 0.7064, green = 0.9534, blue = 0.8451 } )
-        , ( "7.5G 9/6", { name = "7.5G 9/6", hue = "7.5G", value = 9, chroma = 6, red = 0.5894, green = 0.9764, blue = 0.8219 } )
-        , ( "7.5G 9/8", { name = "7.5G 9/8", hue = "7.5G", value = 9, chroma = 8, red = 0.4584, green = 0.9954, blue = 0.8024 } )
-        , ( "7.5GY 1/2", { name = "7.5GY 1/2", hue = "7.5GY", value = 1, chroma = 2, red = 0.0877, green = 0.1221, blue = 0.0806 } )
-        , ( "7.5GY 1/4", { name = "7.5GY 1/4", hue = "7.5GY", value = 1, chroma = 4, red = 0.0217, green = 0.1353, blue = 0.0075 } )
-        , ( "7.5GY 2/2", { name = "7.5GY 2/2", hue = "7.5GY", value = 2, chroma = 2, red = 0.17, green = 0.204, blue = 0.1584 } )
-        , ( "7.5GY 2/4", { name = "7.5GY 2/4", hue = "7.5GY", value = 2, chroma = 4, red = 0.1332, green = 0.2155, blue = 0.1028 } )
-        , ( "7.5GY 2/6", { name = "7.5GY 2/6", hue = "7.5GY", value = 2, chroma = 6, red = 0.0827, green = 0.2254, blue = 0.0283 } )
-        , ( "7.5GY 3/2", { name = "7.5GY 3/2", hue = "7.5GY", value = 3, chroma = 2, red = 0.2543, green = 0.2968, blue = 0.2355 } )
-        , ( "7.5GY 3/4", { name = "7.5GY 3/4", hue = "7.5GY", value = 3, chroma = 4, red = 0.2178, green = 0.3094, blue = 0.1739 } )
-        , ( "7.5GY 3/6", { name = "7.5GY 3/6", hue = "7.5GY", value = 3, chroma = 6, red = 0.1784, green = 0.3195, blue = 0.1042 } )
-        , ( "7.5GY 4/2", { name = "7.5GY 4/2", hue = "7.5GY", value = 4, chroma = 2, red = 0.3483, green = 0.3959, blue = 0.3231 } )
-        , ( "7.5GY 4/4", { name = "7.5GY 4/4", hue = "7.5GY", value = 4, chroma = 4, red = 0.3112, green = 0.4098, blue = 0.2538 } )
-        , ( "7.5GY 4/6", { name = "7.5GY 4/6", hue = "7.5GY", value = 4, chroma = 6, red = 0.2714, green = 0.4214, blue = 0.1786 } )
-        , ( "7.5GY 4/8", { name = "7.5GY 4/8", hue = "7.5GY", value = 4, chroma = 8, red = 0.2257, green = 0.4315, blue = 0.0757 } )
-        , ( "7.5GY 5/10", { name = "7.5GY 5/10", hue = "7.5GY", value = 5, chroma = 10, red = 0.2894, green = 0.5451, blue = 0.0381 } )
-        , ( "7.5GY 5/2", { name = "7.5GY 5/2", hue = "7.5GY", value = 5, chroma = 2, red = 0.4482, green = 0.4979, blue = 0.4166 } )
-        , ( "7.5GY 5/4", { name = "7.5GY 5/4", hue = "7.5GY", value = 5, chroma = 4, red = 0.4141, green = 0.5116, blue = 0.3488 } )
-        , ( "7.5GY 5/6", { name = "7.5GY 5/6", hue = "7.5GY", value = 5, chroma = 6, red = 0.3759, green = 0.5243, blue = 0.2719 } )
-        , ( "7.5GY 5/8", { name = "7.5GY 5/8", hue = "7.5GY", value = 5, chroma = 8, red = 0.3353, green = 0.5352, blue = 0.1858 } )
-        , ( "7.5GY 6/10", { name = "7.5GY 6/10", hue = "7.5GY", value = 6, chroma = 10, red = 0.397, green = 0.6515, blue = 0.1689 } )
-        , ( "7.5GY 6/2", { name = "7.5GY 6/2", hue = "7.5GY", value = 6, chroma = 2, red = 0.5473, green = 0.6023, blue = 0.5078 } )
-        , ( "7.5GY 6/4", { name = "7.5GY 6/4", hue = "7.5GY", value = 6, chroma = 4, red = 0.5144, green = 0.6162, blue = 0.4377 } )
-        , ( "7.5GY 6/6", { name = "7.5GY 6/6", hue = "7.5GY", value = 6, chroma = 6, red = 0.4796, green = 0.6288, blue = 0.3629 } )
-        , ( "7.5GY 6/8", { name = "7.5GY 6/8", hue = "7.5GY", value = 6, chroma = 8, red = 0.439, green = 0.6411, blue = 0.2738 } )
-        , ( "7.5GY 7/10", { name = "7.5GY 7/10", hue = "7.5GY", value = 7, chroma = 10, red = 0.5062, green = 0.7577, blue = 0.2761 } )
-        , ( "7.5GY 7/12", { name = "7.5GY 7/12", hue = "7.5GY", value = 7, chroma = 12, red = 0.4646, green = 0.7677, blue = 0.1444 } )
-        , ( "7.5GY 7/2", { name = "7.5GY 7/2", hue = "7.5GY", value = 7, chroma = 2, red = 0.65, green = 0.7065, blue = 0.6059 } )
-        , ( "7.5GY 7/4", { name = "7.5GY 7/4", hue = "7.5GY", value = 7, chroma = 4, red = 0.6166, green = 0.7212, blue = 0.5327 } )
-        , ( "7.5GY 7/6", { name = "7.5GY 7/6", hue = "7.5GY", value = 7, chroma = 6, red = 0.5838, green = 0.7339, blue = 0.4575 } )
-        , ( "7.5GY 7/8", { name = "7.5GY 7/8", hue = "7.5GY", value = 7, chroma = 8, red = 0.5472, green = 0.7461, blue = 0.3748 } )
-        , ( "7.5GY 8/10", { name = "7.5GY 8/10", hue = "7.5GY", value = 8, chroma = 10, red = 0.6134, green = 0.8656, blue = 0.3669 } )
-        , ( "7.5GY 8/12", { name = "7.5GY 8/12", hue = "7.5GY", value = 8, chroma = 12, red = 0.5723, green = 0.8766, blue = 0.2482 } )
-        , ( "7.5GY 8/2", { name = "7.5GY 8/2", hue = "7.5GY", value = 8, chroma = 2, red = 0.7541, green = 0.8124, blue = 0.7019 } )
-        , ( "7.5GY 8/4", { name = "7.5GY 8/4", hue = "7.5GY", value = 8, chroma = 4, red = 0.7188, green = 0.8281, blue = 0.6244 } )
-        , ( "7.5GY 8/6", { name = "7.5GY 8/6", hue = "7.5GY", value = 8, chroma = 6, red = 0.6848, green = 0.8418, blue = 0.544 } )
-        , ( "7.5GY 8/8", { name = "7.5GY 8/8", hue = "7.5GY", value = 8, chroma = 8, red = 0.6519, green = 0.8538, blue = 0.4604 } )
-        , ( "7.5GY 9/10", { name = "7.5GY 9/10", hue = "7.5GY", value = 9, chroma = 10, red = 0.7123, green = 0.9787, blue = 0.4354 } )
-        , ( "7.5GY 9/12", { name = "7.5GY 9/12", hue = "7.5GY", value = 9, chroma = 12, red = 0.6738, green = 0.9896, blue = 0.3244 } )
-        , ( "7.5GY 9/14", { name = "7.5GY 9/14", hue = "7.5GY", value = 9, chroma = 14, red = 0.633, green = 0.9997, blue = 0.1715 } )
-        , ( "7.5GY 9/2", { name = "7.5GY 9/2", hue = "7.5GY", value = 9, chroma = 2, red = 0.8587, green = 0.9216, blue = 0.7977 } )
-        , ( "7.5GY 9/4", { name = "7.5GY 9/4", hue = "7.5GY", value = 9, chroma = 4, red = 0.8239, green = 0.9378, blue = 0.7134 } )
-        , ( "7.5GY 9/6", { name = "7.5GY 9/6", hue = "7.5GY", value = 9, chroma = 6, red = 0.7875, green = 0.953, blue = 0.6226 } )
-        , ( "7.5GY 9/8", { name = "7.5GY 9/8", hue = "7.5GY", value = 9, chroma = 8, red = 0.7514, green = 0.9662, blue = 0.5345 } )
-        , ( "7.5P 1/2", { name = "7.5P 1/2", hue = "7.5P", value = 1, chroma = 2, red = 0.1491, green = 0.0924, blue = 0.1575 } )
-        , ( "7.5P 1/4", { name = "7.5P 1/4", hue = "7.5P", value = 1, chroma = 4, red = 0.1716, green = 0.0737, blue = 0.1849 } )
-        , ( "7.5P 1/6", { name = "7.5P 1/6", hue = "7.5P", value = 1, chroma = 6, red = 0.1923, green = 0.0487, blue = 0.2098 } )
-        , ( "7.5P 2/10", { name = "7.5P 2/10", hue = "7.5P", value = 2, chroma = 10, red = 0.3302, green = 0.07, blue = 0.3537 } )
-        , ( "7.5P 2/2", { name = "7.5P 2/2", hue = "7.5P", value = 2, chroma = 2, red = 0.2287, green = 0.1767, blue = 0.2343 } )
-        , ( "7.5P 2/4", { name = "7.5P 2/4", hue = "7.5P", value = 2, chroma = 4, red = 0.254, green = 0.1604, blue = 0.2639 } )
-        , ( "7.5P 2/6", { name = "7.5P 2/6", hue = "7.5P", value = 2, chroma = 6, red = 0.2769, green = 0.1418, blue = 0.2911 } )
-        , ( "7.5P 2/8", { name = "7.5P 2/8", hue = "7.5P", value = 2, chroma = 8, red = 0.305, green = 0.1113, blue = 0.3241 } )
-        , ( "7.5P 3/10", { name = "7.5P 3/10", hue = "7.5P", value = 3, chroma = 10, red = 0.4365, green = 0.1712, blue = 0.4581 } )
-        , ( "7.5P 3/12", { name = "7.5P 3/12", hue = "7.5P", value = 3, chroma = 12, red = 0.4645, green = 0.1277, blue = 0.4908 } )
-        , ( "7.5P 3/14", { name = "7.5P 3/14", hue = "7.5P", value = 3, chroma = 14, red = 0.4908, green = 0.0601, blue = 0.5206 } )
-        , ( "7.5P 3/2", { name = "7.5P 3/2", hue = "7.5P", value = 3, chroma = 2, red = 0.324, green = 0.2649, blue = 0.3279 } )
-        , ( "7.5P 3/4", { name = "7.5P 3/4", hue = "7.5P", value = 3, chroma = 4, red = 0.3542, green = 0.2468, blue = 0.3622 } )
-        , ( "7.5P 3/6", { name = "7.5P 3/6", hue = "7.5P", value = 3, chroma = 6, red = 0.3817, green = 0.2269, blue = 0.3937 } )
-        , ( "7.5P 3/8", { name = "7.5P 3/8", hue = "7.5P", value = 3, chroma = 8, red = 0.4101, green = 0.2013, blue = 0.4272 } )
-        , ( "7.5P 4/10", { name = "7.5P 4/10", hue = "7.5P", value = 4, chroma = 10, red = 0.5328, green = 0.286, blue = 0.5492 } )
-        , ( "7.5P 4/12", { name = "7.5P 4/12", hue = "7.5P", value = 4, chroma = 12, red = 0.56, green = 0.2585, blue = 0.5802 } )
-        , ( "7.5P 4/14", { name = "7.5P 4/14", hue = "7.5P", value = 4, chroma = 14, red = 0.5892, green = 0.2222, blue = 0.6131 } )
-        , ( "7.5P 4/16", { name = "7.5P 4/16", hue = "7.5P", value = 4, chroma = 16, red = 0.6184, green = 0.1745, blue = 0.6452 } )
-        , ( "7.5P 4/18", { name = "7.5P 4/18", hue = "7.5P", value = 4, chroma = 18, red = 0.6461, green = 0.1038, blue = 0.6773 } )
-        , ( "7.5P 4/2", { name = "7.5P 4/2", hue = "7.5P", value = 4, chroma = 2, red = 0.4177, green = 0.3643, blue = 0.4208 } )
-        , ( "7.5P 4/4", { name = "7.5P 4/4", hue = "7.5P", value = 4, chroma = 4, red = 0.4483, green = 0.3478, blue = 0.4548 } )
-        , ( "7.5P 4/6", { name = "7.5P 4/6", hue = "7.5P", value = 4, chroma = 6, red = 0.4772, green = 0.3298, blue = 0.4866 } )
-        , ( "7.5P 4/8", { name = "7.5P 4/8", hue = "7.5P", value = 4, chroma = 8, red = 0.5054, green = 0.3093, blue = 0.5183 } )
-        , ( "7.5P 5/10", { name = "7.5P 5/10", hue = "7.5P", value = 5, chroma = 10, red = 0.6383, green = 0.392, blue = 0.6496 } )
-        , ( "7.5P 5/12", { name = "7.5P 5/12", hue = "7.5P", value = 5, chroma = 12, red = 0.6682, green = 0.3666, blue = 0.6833 } )
-        , ( "7.5P 5/14", { name = "7.5P 5/14", hue = "7.5P", value = 5, chroma = 14, red = 0.6973, green = 0.3384, blue = 0.7141 } )
-        , ( "7.5P 5/16", { name = "7.5P 5/16", hue = "7.5P", value = 5, chroma = 16, red = 0.7252, green = 0.3061, blue = 0.7456 } )
-        , ( "7.5P 5/18", { name = "7.5P 5/18", hue = "7.5P", value = 5, chroma = 18, red = 0.7549, green = 0.2643, blue = 0.7789 } )
-        , ( "7.5P 5/2", { name = "7.5P 5/2", hue = "7.5P", value = 5, chroma = 2, red = 0.5136, green = 0.4681, blue = 0.5137 } )
-        , ( "7.5P 5/20", { name = "7.5P 5/20", hue = "7.5P", value = 5, chroma = 20, red = 0.7825, green = 0.2137, blue = 0.8108 } )
-        , ( "7.5P 5/22", { name = "7.5P 5/22", hue = "7.5P", value = 5, chroma = 22, red = 0.8145, green = 0.1259, blue = 0.8452 } )
-        , ( "7.5P 5/4", { name = "7.5P 5/4", hue = "7.5P", value = 5, chroma = 4, red = 0.5468, green = 0.4515, blue = 0.549 } )
-        , ( "7.5P 5/6", { name = "7.5P 5/6", hue = "7.5P", value = 5, chroma = 6, red = 0.5789, green = 0.4331, blue = 0.5843 } )
-        , ( "7.5P 5/8", { name = "7.5P 5/8", hue = "7.5P", value = 5, chroma = 8, red = 0.611, green = 0.4122, blue = 0.6193 } )
-        , ( "7.5P 6/10", { name = "7.5P 6/10", hue = "7.5P", value = 6, chroma = 10, red = 0.7453, green = 0.4965, blue = 0.7534 } )
-        , ( "7.5P 6/12", { name = "7.5P 6/12", hue = "7.5P", value = 6, chroma = 12, red = 0.7755, green = 0.474, blue = 0.7852 } )
-        , ( "7.5P 6/14", { name = "7.5P 6/14", hue = "7.5P", value = 6, chroma = 14, red = 0.8061, green = 0.448, blue = 0.819 } )
-        , ( "7.5P 6/16", { name = "7.5P 6/16", hue = "7.5P", value = 6, chroma = 16, red = 0.8373, green = 0.4181, blue = 0.8526 } )
-        , ( "7.5P 6/18", { name = "7.5P 6/18", hue = "7.5P", value = 6, chroma = 18, red = 0.8666, green = 0.3857, blue = 0.8845 } )
-        , ( "7.5P 6/2", { name = "7.5P 6/2", hue = "7.5P", value = 6, chroma = 2, red = 0.6169, green = 0.5704, blue = 0.6153 } )
-        , ( "7.5P 6/20", { name = "7.5P 6/20", hue = "7.5P", value = 6, chroma = 20, red = 0.9037, green = 0.3365, blue = 0.925 } )
-        , ( "7.5P 6/22", { name = "7.5P 6/22", hue = "7.5P", value = 6, chroma = 22, red = 0.9374, green = 0.2788, blue = 0.9626 } )
-        , ( "7.5P 6/24", { name = "7.5P 6/24", hue = "7.5P", value = 6, chroma = 24, red = 0.9691, green = 0.2045, blue = 0.9967 } )
-        , ( "7.5P 6/4", { name = "7.5P 6/4", hue = "7.5P", value = 6, chroma = 4, red = 0.6477, green = 0.5555, blue = 0.6471 } )
-        , ( "7.5P 6/6", { name = "7.5P 6/6", hue = "7.5P", value = 6, chroma = 6, red = 0.6822, green = 0.5368, blue = 0.685 } )
-        , ( "7.5P 6/8", { name = "7.5P 6/8", hue = "7.5P", value = 6, chroma = 8, red = 0.7131, green = 0.5183, blue = 0.7176 } )
-        , ( "7.5P 7/10", { name = "7.5P 7/10", hue = "7.5P", value = 7, chroma = 10, red = 0.856, green = 0.5997, blue = 0.8576 } )
-        , ( "7.5P 7/12", { name = "7.5P 7/12", hue = "7.5P", value = 7, chroma = 12, red = 0.8873, green = 0.5778, blue = 0.8915 } )
-        , ( "7.5P 7/14", { name = "7.5P 7/14", hue = "7.5P", value = 7, chroma = 14, red = 0.9225, green = 0.5506, blue = 0.929 } )
-        , ( "7.5P 7/16", { name = "7.5P 7/16", hue = "7.5P", value = 7, chroma = 16, red = 0.9573, green = 0.5203, blue = 0.9656 } )
-        , ( "7.5P 7/18", { name = "7.5P 7/18", hue = "7.5P", value = 7, chroma = 18, red = 0.991, green = 0.4867, blue = 1 } )
-        , ( "7.5P 7/2", { name = "7.5P 7/2", hue = "7.5P", value = 7, chroma = 2, red = 0.7168, green = 0.6755, blue = 0.7137 } )
-        , ( "7.5P 7/4", { name = "7.5P 7/4", hue = "7.5P", value = 7, chroma = 4, red = 0.7518, green = 0.6593, blue = 0.7489 } )
-        , ( "7.5P 7/6", { name = "7.5P 7/6", hue = "7.5P", value = 7, chroma = 6, red = 0.786, green = 0.6417, blue = 0.7842 } )
-        , ( "7.5P 7/8", { name = "7.5P 7/8", hue = "7.5P", value = 7, chroma = 8, red = 0.8203, green = 0.6221, blue = 0.8205 } )
-        , ( "7.5P 8/10", { name = "7.5P 8/10", hue = "7.5P", value = 8, chroma = 10, red = 0.9715, green = 0.7011, blue = 0.9689 } )
-        , ( "7.5P 8/12", { name = "7.5P 8/12", hue = "7.5P", value = 8, chroma = 12, red = 1, green = 0.6756, blue = 1 } )
-        , ( "7.5P 8/2", { name = "7.5P 8/2", hue = "7.5P", value = 8, chroma = 2, red = 0.8169, green = 0.7823, blue = 0.8141 } )
-        , ( "7.5P 8/4", { name = "7.5P 8/4", hue = "7.5P", value = 8, chroma = 4, red = 0.8579, green = 0.7639, blue = 0.8528 } )
-        , ( "7.5P 8/6", { name = "7.5P 8/6", hue = "7.5P", value = 8, chroma = 6, red = 0.8913, green = 0.7472, blue = 0.8873 } )
-        , ( "7.5P 8/8", { name = "7.5P 8/8", hue = "7.5P", value = 8, chroma = 8, red = 0.9349, green = 0.7234, blue = 0.9312 } )
-        , ( "7.5P 9/2", { name = "7.5P 9/2", hue = "7.5P", value = 9, chroma = 2, red = 0.9242, green = 0.8896, blue = 0.9209 } )
-        , ( "7.5P 9/4", { name = "7.5P 9/4", hue = "7.5P", value = 9, chroma = 4, red = 0.9711, green = 0.8689, blue = 0.9635 } )
-        , ( "7.5P 9/6", { name = "7.5P 9/6", hue = "7.5P", value = 9, chroma = 6, red = 1, green = 0.8482, blue = 1 } )
-        , ( "7.5PB 1/10", { name = "7.5PB 1/10", hue = "7.5PB", value = 1, chroma = 10, red = 0.098, green = 0.0549, blue = 0.3295 } )
-        , ( "7.5PB 1/12", { name = "7.5PB 1/12", hue = "7.5PB", value = 1, chroma = 12, red = 0.1097, green = 0.019, blue = 0.3624 } )
-        , ( "7.5PB 1/2", { name = "7.5PB 1/2", hue = "7.5PB", value = 1, chroma = 2, red = 0.104, green = 0.1072, blue = 0.1699 } )
-        , ( "7.5PB 1/4", { name = "7.5PB 1/4", hue = "7.5PB", value = 1, chroma = 4, red = 0.0952, green = 0.1013, blue = 0.2116 } )
-        , ( "7.5PB 1/6", { name = "7.5PB 1/6", hue = "7.5PB", value = 1, chroma = 6, red = 0.0881, green = 0.0915, blue = 0.2552 } )
-        , ( "7.5PB 1/8", { name = "7.5PB 1/8", hue = "7.5PB", value = 1, chroma = 8, red = 0.09, green = 0.0762, blue = 0.2951 } )
-        , ( "7.5PB 2/10", { name = "7.5PB 2/10", hue = "7.5PB", value = 2, chroma = 10, red = 0.1415, green = 0.1556, blue = 0.4395 } )
-        , ( "7.5PB 2/12", { name = "7.5PB 2/12", hue = "7.5PB", value = 2, chroma = 12, red = 0.1436, green = 0.1396, blue = 0.4777 } )
-        , ( "7.5PB 2/14", { name = "7.5PB 2/14", hue = "7.5PB", value = 2, chroma = 14, red = 0.1501, green = 0.1177, blue = 0.516 } )
-        , ( "7.5PB 2/16", { name = "7.5PB 2/16", hue = "7.5PB", value = 2, chroma = 16, red = 0.1617, green = 0.086, blue = 0.5536 } )
-        , ( "7.5PB 2/18", { name = "7.5PB 2/18", hue = "7.5PB", value = 2, chroma = 18, red = 0.1741, green = 0.0325, blue = 0.5907 } )
-        , ( "7.5PB 2/2", { name = "7.5PB 2/2", hue = "7.5PB", value = 2, chroma = 2, red = 0.1844, green = 0.1896, blue = 0.25 } )
-        , ( "7.5PB 2/4", { name = "7.5PB 2/4", hue = "7.5PB", value = 2, chroma = 4, red = 0.173, green = 0.1846, blue = 0.2986 } )
-        , ( "7.5PB 2/6", { name = "7.5PB 2/6", hue = "7.5PB", value = 2, chroma = 6, red = 0.1609, green = 0.1779, blue = 0.346 } )
-        , ( "7.5PB 2/8", { name = "7.5PB 2/8", hue = "7.5PB", value = 2, chroma = 8, red = 0.1475, green = 0.169, blue = 0.3935 } )
-        , ( "7.5PB 3/10", { name = "7.5PB 3/10", hue = "7.5PB", value = 3, chroma = 10, red = 0.2118, green = 0.2548, blue = 0.5467 } )
-        , ( "7.5PB 3/12", { name = "7.5PB 3/12", hue = "7.5PB", value = 3, chroma = 12, red = 0.2004, green = 0.2437, blue = 0.5926 } )
-        , ( "7.5PB 3/14", { name = "7.5PB 3/14", hue = "7.5PB", value = 3, chroma = 14, red = 0.1952, green = 0.228, blue = 0.6405 } )
-        , ( "7.5PB 3/16", { name = "7.5PB 3/16", hue = "7.5PB", value = 3, chroma = 16, red = 0.1956, green = 0.2077, blue = 0.6877 } )
-        , ( "7.5PB 3/18", { name = "7.5PB 3/18", hue = "7.5PB", value = 3, chroma = 18, red = 0.2019, green = 0.1857, blue = 0.7264 } )
-        , ( "7.5PB 3/2", { name = "7.5PB 3/2", hue = "7.5PB", value = 3, chroma = 2, red = 0.2727, green = 0.2796, blue = 0.3458 } )
-        , ( "7.5PB 3/20", { name = "7.5PB 3/20", hue = "7.5PB", value = 3, chroma = 20, red = 0.2082, green = 0.1609, blue = 0.7619 } )
-        , ( "7.5PB 3/22", { name = "7.5PB 3/22", hue = "7.5PB", value = 3, chroma = 22, red = 0.22, green = 0.12, blue = 0.8039 } )
-        , ( "7.5PB 3/24", { name = "7.5PB 3/24", hue = "7.5PB", value = 3, chroma = 24, red = 0.233, green = 0.0536, blue = 0.8438 } )
-        , ( "7.5PB 3/4", { name = "7.5PB 3/4", hue = "7.5PB", value = 3, chroma = 4, red = 0.2586, green = 0.2752, blue = 0.3995 } )
-        , ( "7.5PB 3/6", { name = "7.5PB 3/6", hue = "7.5PB", value = 3, chroma = 6, red = 0.2437, green = 0.2697, blue = 0.4506 } )
-        , ( "7.5PB 3/8", { name = "7.5PB 3/8", hue = "7.5PB", value = 3, chroma = 8, red = 0.2292, green = 0.2631, blue = 0.4976 } )
-        , ( "7.5PB 4/10", { name = "7.5PB 4/10", hue = "7.5PB", value = 4, chroma = 10, red = 0.3036, green = 0.3587, blue = 0.6442 } )
-        , ( "7.5PB 4/12", { name = "7.5PB 4/12", hue = "7.5PB", value = 4, chroma = 12, red = 0.2826, green = 0.3518, blue = 0.6931 } )
-        , ( "7.5PB 4/14", { name = "7.5PB 4/14", hue = "7.5PB", value = 4, chroma = 14, red = 0.2654, green = 0.3425, blue = 0.7413 } )
-        , ( "7.5PB 4/16", { name = "7.5PB 4/16", hue = "7.5PB", value = 4, chroma = 16, red = 0.2526, green = 0.3295, blue = 0.7924 } )
-        , ( "7.5PB 4/18", { name = "7.5PB 4/18", hue = "7.5PB", value = 4, chroma = 18, red = 0.244, green = 0.3136, blue = 0.8422 } )
-        , ( "7.5PB 4/2", { name = "7.5PB 4/2", hue = "7.5PB", value = 4, chroma = 2, red = 0.3697, green = 0.3776, blue = 0.438 } )
-        , ( "7.5PB 4/20", { name = "7.5PB 4/20", hue = "7.5PB", value = 4, chroma = 20, red = 0.2389, green = 0.2919, blue = 0.8973 } )
-        , ( "7.5PB 4/22", { name = "7.5PB 4/22", hue = "7.5PB", value = 4, chroma = 22, red = 0.2416, green = 0.2729, blue = 0.9352 } )
-        , ( "7.5PB 4/24", { name = "7.5PB 4/24", hue = "7.5PB", value = 4, chroma = 24, red = 0.2461, green = 0.247, blue = 0.9789 } )
-        , ( "7.5PB 4/26", { name = "7.5PB 4/26", hue = "7.5PB", value = 4, chroma = 26, red = 0.253, green = 0.2141, blue = 1 } )
-        , ( "7.5PB 4/4", { name = "7.5PB 4/4", hue = "7.5PB", value = 4, chroma = 4, red = 0.3569, green = 0.3739, blue = 0.49 } )
-        , ( "7.5PB 4/6", { name = "7.5PB 4/6", hue = "7.5PB", value = 4, chroma = 6, red = 0.3411, green = 0.3698, blue = 0.5411 } )
-        , ( "7.5PB 4/8", { name = "7.5PB 4/8", hue = "7.5PB", value = 4, chroma = 8, red = 0.3239, green = 0.3646, blue = 0.5932 } )
-        , ( "7.5PB 5/10", { name = "7.5PB 5/10", hue = "7.5PB", value = 5, chroma = 10, red = 0.4025, green = 0.4635, blue = 0.745 } )
-        , ( "7.5PB 5/12", { name = "7.5PB 5/12", hue = "7.5PB", value = 5, chroma = 12, red = 0.3805, green = 0.457, blue = 0.8008 } )
-        , ( "7.5PB 5/14", { name = "7.5PB 5/14", hue = "7.5PB", value = 5, chroma = 14, red = 0.354, green = 0.45, blue = 0.8559 } )
-        , ( "7.5PB 5/16", { name = "7.5PB 5/16", hue = "7.5PB", value = 5, chroma = 16, red = 0.3271, green = 0.4415, blue = 0.9102 } )
-        , ( "7.5PB 5/18", { name = "7.5PB 5/18", hue = "7.5PB", value = 5, chroma = 18, red = 0.3039, green = 0.4289, blue = 0.9686 } )
-        , ( "7.5PB 5/2", { name = "7.5PB 5/2", hue = "7.5PB", value = 5, chroma = 2, red = 0.4704, green = 0.4793, blue = 0.5337 } )
-        , ( "7.5PB 5/20", { name = "7.5PB 5/20", hue = "7.5PB", value = 5, chroma = 20, red = 0.2817, green = 0.4143, blue = 1 } )
-        , ( "7.5PB 5/4", { name = "7.5PB 5/4", hue = "7.5PB", value = 5, chroma = 4, red = 0.4552, green = 0.4766, blue = 0.5859 } )
-        , ( "7.5PB 5/6", { name = "7.5PB 5/6", hue = "7.5PB", value = 5, chroma = 6, red = 0.4387, green = 0.4726, blue = 0.6428 } )
-        , ( "7.5PB 5/8", { name = "7.5PB 5/8", hue = "7.5PB", value = 5, chroma = 8, red = 0.4228, green = 0.4678, blue = 0.6953 } )
-        , ( "7.5PB 6/10", { name = "7.5PB 6/10", hue = "7.5PB", value = 6, chroma = 10, red = 0.5023, green = 0.5682, blue = 0.8504 } )
-        , ( "7.5PB 6/12", { name = "7.5PB 6/12", hue = "7.5PB", value = 6, chroma = 12, red = 0.4753, green = 0.5627, blue = 0.9135 } )
-        , ( "7.5PB 6/14", { name = "7.5PB 6/14", hue = "7.5PB", value = 6, chroma = 14, red = 0.4454, green = 0.5559, blue = 0.9766 } )
-        , ( "7.5PB 6/2", { name = "7.5PB 6/2", hue = "7.5PB", value = 6, chroma = 2, red = 0.5728, green = 0.5821, blue = 0.6325 } )
-        , ( "7.5PB 6/4", { name = "7.5PB 6/4", hue = "7.5PB", value = 6, chroma = 4, red = 0.5575, green = 0.5796, blue = 0.686 } )
-        , ( "7.5PB 6/6", { name = "7.5PB 6/6", hue = "7.5PB", value = 6, chroma = 6, red = 0.5399, green = 0.5761, blue = 0.7446 } )
-        , ( "7.5PB 6/8", { name = "7.5PB 6/8", hue = "7.5PB", value = 6, chroma = 8, red = 0.5221, green = 0.5726, blue = 0.7965 } )
-        , ( "7.5PB 7/10", { name = "7.5PB 7/10", hue = "7.5PB", value = 7, chroma = 10, red = 0.5953, green = 0.6718, blue = 0.9773 } )
-        , ( "7.5PB 7/2", { name = "7.5PB 7/2", hue = "7.5PB", value = 7, chroma = 2, red = 0.6763, green = 0.6859, blue = 0.7324 } )
-        , ( "7.5PB 7/4", { name = "7.5PB 7/4", hue = "7.5PB", value = 7, chroma = 4, red = 0.6585, green = 0.6839, blue = 0.7893 } )
-        , ( "7.5PB 7/6", { name = "7.5PB 7/6", hue = "7.5PB", value = 7, chroma = 6, red = 0.6395, green = 0.6809, blue = 0.8492 } )
-        , ( "7.5PB 7/8", { name = "7.5PB 7/8", hue = "7.5PB", value = 7, chroma = 8, red = 0.6183, green = 0.6771, blue = 0.9113 } )
-        , ( "7.5PB 8/2", { name = "7.5PB 8/2", hue = "7.5PB", value = 8, chroma = 2, red = 0.7811, green = 0.7911, blue = 0.8336 } )
-        , ( "7.5PB 8/4", { name = "7.5PB 8/4", hue = "7.5PB", value = 8, chroma = 4, red = 0.7606, green = 0.7893, blue = 0.8964 } )
-        , ( "7.5PB 8/6", { name = "7.5PB 8/6", hue = "7.5PB", value = 8, chroma = 6, red = 0.7353, green = 0.787, blue = 0.9651 } )
-        , ( "7.5PB 9/2", { name = "7.5PB 9/2", hue = "7.5PB", value = 9, chroma = 2, red = 0.8879, green = 0.8986, blue = 0.9396 } )
-        , ( "7.5R 1/2", { name = "7.5R 1/2", hue = "7.5R", value = 1, chroma = 2, red = 0.1789, green = 0.0853, blue = 0.0988 } )
-        , ( "7.5R 1/4", { name = "7.5R 1/4", hue = "7.5R", value = 1, chroma = 4, red = 0.2179, green = 0.0549, blue = 0.0904 } )
-        , ( "7.5R 2/2", { name = "7.5R 2/2", hue = "7.5R", value = 2, chroma = 2, red = 0.2595, green = 0.1714, blue = 0.1717 } )
-        , ( "7.5R 2/4", { name = "7.5R 2/4", hue = "7.5R", value = 2, chroma = 4, red = 0.3069, green = 0.1466, blue = 0.1513 } )
-        , ( "7.5R 2/6", { name = "7.5R 2/6", hue = "7.5R", value = 2, chroma = 6, red = 0.3467, green = 0.1161, blue = 0.1323 } )
-        , ( "7.5R 2/8", { name = "7.5R 2/8", hue = "7.5R", value = 2, chroma = 8, red = 0.3876, green = 0.0642, blue = 0.1131 } )
-        , ( "7.5R 3/10", { name = "7.5R 3/10", hue = "7.5R", value = 3, chroma = 10, red = 0.5481, green = 0.1142, blue = 0.1191 } )
-        , ( "7.5R 3/2", { name = "7.5R 3/2", hue = "7.5R", value = 3, chroma = 2, red = 0.3598, green = 0.2598, blue = 0.2498 } )
-        , ( "7.5R 3/4", { name = "7.5R 3/4", hue = "7.5R", value = 3, chroma = 4, red = 0.416, green = 0.2342, blue = 0.2171 } )
-        , ( "7.5R 3/6", { name = "7.5R 3/6", hue = "7.5R", value = 3, chroma = 6, red = 0.4617, green = 0.206, blue = 0.1869 } )
-        , ( "7.5R 3/8", { name = "7.5R 3/8", hue = "7.5R", value = 3, chroma = 8, red = 0.5063, green = 0.1682, blue = 0.1535 } )
-        , ( "7.5R 4/10", { name = "7.5R 4/10", hue = "7.5R", value = 4, chroma = 10, red = 0.659, green = 0.2415, blue = 0.206 } )
-        , ( "7.5R 4/12", { name = "7.5R 4/12", hue = "7.5R", value = 4, chroma = 12, red = 0.6988, green = 0.1974, blue = 0.1696 } )
-        , ( "7.5R 4/14", { name = "7.5R 4/14", hue = "7.5R", value = 4, chroma = 14, red = 0.7382, green = 0.1324, blue = 0.1287 } )
-        , ( "7.5R 4/2", { name = "7.5R 4/2", hue = "7.5R", value = 4, chroma = 2, red = 0.4552, green = 0.3588, blue = 0.3475 } )
-        , ( "7.5R 4/4", { name = "7.5R 4/4", hue = "7.5R", value = 4, chroma = 4, red = 0.5173, green = 0.334, blue = 0.3119 } )
-        , ( "7.5R 4/6", { name = "7.5R 4/6", hue = "7.5R", value = 4, chroma = 6, red = 0.5687, green = 0.3078, blue = 0.2776 } )
-        , ( "7.5R 4/8", { name = "7.5R 4/8", hue = "7.5R", value = 4, chroma = 8, red = 0.6172, green = 0.2763, blue = 0.2406 } )
-        , ( "7.5R 5/10", { name = "7.5R 5/10", hue = "7.5R", value = 5, chroma = 10, red = 0.7774, green = 0.3506, blue = 0.2934 } )
-        , ( "7.5R 5/12", { name = "7.5R 5/12", hue = "7.5R", value = 5, chroma = 12, red = 0.8241, green = 0.3112, blue = 0.2528 } )
-        , ( "7.5R 5/14", { name = "7.5R 5/14", hue = "7.5R", value = 5, chroma = 14, red = 0.8642, green = 0.2685, blue = 0.2119 } )
-        , ( "7.5R 5/16", { name = "7.5R 5/16", hue = "7.5R", value = 5, chroma = 16, red = 0.9056, green = 0.2091, blue = 0.1648 } )
-        , ( "7.5R 5/18", { name = "7.5R 5/18", hue = "7.5R", value = 5, chroma = 18, red = 0.9424, green = 0.1252, blue = 0.1179 } )
-        , ( "7.5R 5/2", { name = "7.5R 5/2", hue = "7.5R", value = 5, chroma = 2, red = 0.5501, green = 0.4625, blue = 0.4496 } )
-        , ( "7.5R 5/4", { name = "7.5R 5/4", hue = "7.5R", value = 5, chroma = 4, red = 0.6175, green = 0.4382, blue = 0.4119 } )
-        , ( "7.5R 5/6", { name = "7.5R 5/6", hue = "7.5R", value = 5, chroma = 6, red = 0.6749, green = 0.4127, blue = 0.3735 } )
-        , ( "7.5R 5/8", { name = "7.5R 5/8", hue = "7.5R", value = 5, chroma = 8, red = 0.7283, green = 0.3836, blue = 0.3328 } )
-        , ( "7.5R 6/10", { name = "7.5R 6/10", hue = "7.5R", value = 6, chroma = 10, red = 0.8893, green = 0.4606, blue = 0.3909 } )
-        , ( "7.5R 6/12", { name = "7.5R 6/12", hue = "7.5R", value = 6, chroma = 12, red = 0.9365, green = 0.4284, blue = 0.3488 } )
-        , ( "7.5R 6/14", { name = "7.5R 6/14", hue = "7.5R", value = 6, chroma = 14, red = 0.9823, green = 0.3911, blue = 0.3034 } )
-        , ( "7.5R 6/16", { name = "7.5R 6/16", hue = "7.5R", value = 6, chroma = 16, red = 1, green = 0.347, blue = 0.2541 } )
-        , ( "7.5R 6/18", { name = "7.5R 6/18", hue = "7.5R", value = 6, chroma = 18, red = 1, green = 0.2954, blue = 0.2015 } )
-        , ( "7.5R 6/2", { name = "7.5R 6/2", hue = "7.5R", value = 6, chroma = 2, red = 0.6539, green = 0.5649, blue = 0.5496 } )
-        , ( "7.5R 6/4", { name = "7.5R 6/4", hue = "7.5R", value = 6, chroma = 4, red = 0.7205, green = 0.5425, blue = 0.5116 } )
-        , ( "7.5R 6/6", { name = "7.5R 6/6", hue = "7.5R", value = 6, chroma = 6, red = 0.7794, green = 0.5185, blue = 0.4743 } )
-        , ( "7.5R 6/8", { name = "7.5R 6/8", hue = "7.5R", value = 6, chroma = 8, red = 0.8344, green = 0.4921, blue = 0.4343 } )
-        , ( "7.5R 7/10", { name = "7.5R 7/10", hue = "7.5R", value = 7, chroma = 10, red = 1, green = 0.5668, blue = 0.4874 } )
-        , ( "7.5R 7/12", { name = "7.5R 7/12", hue = "7.5R", value = 7, chroma = 12, red = 1, green = 0.5322, blue = 0.4401 } )
-        , ( "7.5R 7/14", { name = "7.5R 7/14", hue = "7.5R", value = 7, chroma = 14, red = 1, green = 0.4971, blue = 0.3923 } )
-        , ( "7.5R 7/16", { name = "7.5R 7/16", hue = "7.5R", value = 7, chroma = 16, red = 1, green = 0.4561, blue = 0.3405 } )
-        , ( "7.5R 7/2", { name = "7.5R 7/2", hue = "7.5R", value = 7, chroma = 2, red = 0.7557, green = 0.6691, blue = 0.6534 } )
-        , ( "7.5R 7/4", { name = "7.5R 7/4", hue = "7.5R", value = 7, chroma = 4, red = 0.8255, green = 0.6467, blue = 0.6134 } )
-        , ( "7.5R 7/6", { name = "7.5R 7/6", hue = "7.5R", value = 7, chroma = 6, red = 0.8878, green = 0.623, blue = 0.573 } )
-        , ( "7.5R 7/8", { name = "7.5R 7/8", hue = "7.5R", value = 7, chroma = 8, red = 0.9516, green = 0.5944, blue = 0.5283 } )
-        , ( "7.5R 8/10", { name = "7.5R 8/10", hue = "7.5R", value = 8, chroma = 10, red = 1, green = 0.6664, blue = 0.5743 } )
-        , ( "7.5R 8/2", { name = "7.5R 8/2", hue = "7.5R", value = 8, chroma = 2, red = 0.8507, green = 0.7771, blue = 0.7617 } )
-        , ( "7.5R 8/4", { name = "7.5R 8/4", hue = "7.5R", value = 8, chroma = 4, red = 0.9353, green = 0.7509, blue = 0.7137 } )
-        , ( "7.5R 8/6", { name = "7.5R 8/6", hue = "7.5R", value = 8, chroma = 6, red = 1, green = 0.7256, blue = 0.6689 } )
-        , ( "7.5R 8/8", { name = "7.5R 8/8", hue = "7.5R", value = 8, chroma = 8, red = 1, green = 0.6964, blue = 0.6201 } )
-        , ( "7.5R 9/2", { name = "7.5R 9/2", hue = "7.5R", value = 9, chroma = 2, red = 0.9596, green = 0.884, blue = 0.867 } )
-        , ( "7.5R 9/4", { name = "7.5R 9/4", hue = "7.5R", value = 9, chroma = 4, red = 1, green = 0.8551, blue = 0.8116 } )
-        , ( "7.5R 9/6", { name = "7.5R 9/6", hue = "7.5R", value = 9, chroma = 6, red = 1, green = 0.8286, blue = 0.7593 } )
-        , ( "7.5RP 1/2", { name = "7.5RP 1/2", hue = "7.5RP", value = 1, chroma = 2, red = 0.1691, green = 0.0862, blue = 0.1329 } )
-        , ( "7.5RP 1/4", { name = "7.5RP 1/4", hue = "7.5RP", value = 1, chroma = 4, red = 0.2015, green = 0.0598, blue = 0.1476 } )
-        , ( "7.5RP 1/6", { name = "7.5RP 1/6", hue = "7.5RP", value = 1, chroma = 6, red = 0.2299, green = 0.0169, blue = 0.1622 } )
-        , ( "7.5RP 2/2", { name = "7.5RP 2/2", hue = "7.5RP", value = 2, chroma = 2, red = 0.2526, green = 0.1708, blue = 0.203 } )
-        , ( "7.5RP 2/4", { name = "7.5RP 2/4", hue = "7.5RP", value = 2, chroma = 4, red = 0.2918, green = 0.1482, blue = 0.2121 } )
-        , ( "7.5RP 2/6", { name = "7.5RP 2/6", hue = "7.5RP", value = 2, chroma = 6, red = 0.3272, green = 0.1197, blue = 0.2216 } )
-        , ( "7.5RP 2/8", { name = "7.5RP 2/8", hue = "7.5RP", value = 2, chroma = 8, red = 0.3659, green = 0.0703, blue = 0.2341 } )
-        , ( "7.5RP 3/10", { name = "7.5RP 3/10", hue = "7.5RP", value = 3, chroma = 10, red = 0.5315, green = 0.1035, blue = 0.3056 } )
-        , ( "7.5RP 3/2", { name = "7.5RP 3/2", hue = "7.5RP", value = 3, chroma = 2, red = 0.3517, green = 0.2592, blue = 0.2853 } )
-        , ( "7.5RP 3/4", { name = "7.5RP 3/4", hue = "7.5RP", value = 3, chroma = 4, red = 0.4038, green = 0.2328, blue = 0.2884 } )
-        , ( "7.5RP 3/6", { name = "7.5RP 3/6", hue = "7.5RP", value = 3, chroma = 6, red = 0.4483, green = 0.2024, blue = 0.2928 } )
-        , ( "7.5RP 3/8", { name = "7.5RP 3/8", hue = "7.5RP", value = 3, chroma = 8, red = 0.4924, green = 0.1607, blue = 0.299 } )
-        , ( "7.5RP 4/10", { name = "7.5RP 4/10", hue = "7.5RP", value = 4, chroma = 10, red = 0.6382, green = 0.2374, blue = 0.3845 } )
-        , ( "7.5RP 4/12", { name = "7.5RP 4/12", hue = "7.5RP", value = 4, chroma = 12, red = 0.6802, green = 0.1863, blue = 0.3892 } )
-        , ( "7.5RP 4/14", { name = "7.5RP 4/14", hue = "7.5RP", value = 4, chroma = 14, red = 0.7199, green = 0.1096, blue = 0.3941 } )
-        , ( "7.5RP 4/2", { name = "7.5RP 4/2", hue = "7.5RP", value = 4, chroma = 2, red = 0.4467, green = 0.3586, blue = 0.3793 } )
-        , ( "7.5RP 4/4", { name = "7.5RP 4/4", hue = "7.5RP", value = 4, chroma = 4, red = 0.5005, green = 0.3349, blue = 0.3788 } )
-        , ( "7.5RP 4/6", { name = "7.5RP 4/6", hue = "7.5RP", value = 4, chroma = 6, red = 0.5512, green = 0.3067, blue = 0.3793 } )
-        , ( "7.5RP 4/8", { name = "7.5RP 4/8", hue = "7.5RP", value = 4, chroma = 8, red = 0.5983, green = 0.2735, blue = 0.3815 } )
-        , ( "7.5RP 5/10", { name = "7.5RP 5/10", hue = "7.5RP", value = 5, chroma = 10, red = 0.7515, green = 0.3488, blue = 0.4756 } )
-        , ( "7.5RP 5/12", { name = "7.5RP 5/12", hue = "7.5RP", value = 5, chroma = 12, red = 0.8014, green = 0.3037, blue = 0.4784 } )
-        , ( "7.5RP 5/14", { name = "7.5RP 5/14", hue = "7.5RP", value = 5, chroma = 14, red = 0.8402, green = 0.2583, blue = 0.4812 } )
-        , ( "7.5RP 5/16", { name = "7.5RP 5/16", hue = "7.5RP", value = 5, chroma = 16, red = 0.8832, green = 0.1888, blue = 0.4854 } )
-        , ( "7.5RP 5/18", { name = "7.5RP 5/18", hue = "7.5RP", value = 5, chroma = 18, red = 0.9225, green = 0.0674, blue = 0.4904 } )
-        , ( "7.5RP 5/2", { name = "7.5RP 5/2", hue = "7.5RP", value = 5, chroma = 2, red = 0.54, green = 0.463, blue = 0.4789 } )
-        , ( "7.5RP 5/4", { name = "7.5RP 5/4", hue = "7.5RP", value = 5, chroma = 4, red = 0.5996, green = 0.4392, blue = 0.4758 } )
-        , ( "7.5RP 5/6", { name = "7.5RP 5/6", hue = "7.5RP", value = 5, chroma = 6, red = 0.6548, green = 0.4122, blue = 0.4747 } )
-        , ( "7.5RP 5/8", { name = "7.5RP 5/8", hue = "7.5RP", value = 5, chroma = 8, red = 0.7074, green = 0.3808, blue = 0.4749 } )
-        , ( "7.5RP 6/10", { name = "7.5RP 6/10", hue = "7.5RP", value = 6, chroma = 10, red = 0.8572, green = 0.4615, blue = 0.5718 } )
-        , ( "7.5RP 6/12", { name = "7.5RP 6/12", hue = "7.5RP", value = 6, chroma = 12, red = 0.9065, green = 0.4255, blue = 0.5729 } )
-        , ( "7.5RP 6/14", { name = "7.5RP 6/14", hue = "7.5RP", value = 6, chroma = 14, red = 0.9546, green = 0.3828, blue = 0.5752 } )
-        , ( "7.5RP 6/16", { name = "7.5RP 6/16", hue = "7.5RP", value = 6, chroma = 16, red = 1, green = 0.3282, blue = 0.5782 } )
-        , ( "7.5RP 6/18", { name = "7.5RP 6/18", hue = "7.5RP", value = 6, chroma = 18, red = 1, green = 0.2678, blue = 0.5819 } )
-        , ( "7.5RP 6/2", { name = "7.5RP 6/2", hue = "7.5RP", value = 6, chroma = 2, red = 0.6409, green = 0.5662, blue = 0.5806 } )
-        , ( "7.5RP 6/20", { name = "7.5RP 6/20", hue = "7.5RP", value = 6, chroma = 20, red = 1, green = 0.1584, blue = 0.5867 } )
-        , ( "7.5RP 6/4", { name = "7.5RP 6/4", hue = "7.5RP", value = 6, chroma = 4, red = 0.6993, green = 0.5442, blue = 0.5771 } )
-        , ( "7.5RP 6/6", { name = "7.5RP 6/6", hue = "7.5RP", value = 6, chroma = 6, red = 0.7603, green = 0.5169, blue = 0.5743 } )
-        , ( "7.5RP 6/8", { name = "7.5RP 6/8", hue = "7.5RP", value = 6, chroma = 8, red = 0.8071, green = 0.4923, blue = 0.5725 } )
-        , ( "7.5RP 7/10", { name = "7.5RP 7/10", hue = "7.5RP", value = 7, chroma = 10, red = 0.9721, green = 0.5661, blue = 0.6714 } )
-        , ( "7.5RP 7/12", { name = "7.5RP 7/12", hue = "7.5RP", value = 7, chroma = 12, red = 1, green = 0.5278, blue = 0.6712 } )
-        , ( "7.5RP 7/14", { name = "7.5RP 7/14", hue = "7.5RP", value = 7, chroma = 14, red = 1, green = 0.4857, blue = 0.6725 } )
-        , ( "7.5RP 7/16", { name = "7.5RP 7/16", hue = "7.5RP", value = 7, chroma = 16, red = 1, green = 0.4364, blue = 0.6746 } )
-        , ( "7.5RP 7/2", { name = "7.5RP 7/2", hue = "7.5RP", value = 7, chroma = 2, red = 0.7413, green = 0.6709, blue = 0.6834 } )
-        , ( "7.5RP 7/4", { name = "7.5RP 7/4", hue = "7.5RP", value = 7, chroma = 4, red = 0.8012, green = 0.6493, blue = 0.6789 } )
-        , ( "7.5RP 7/6", { name = "7.5RP 7/6", hue = "7.5RP", value = 7, chroma = 6, red = 0.8643, green = 0.6228, blue = 0.6752 } )
-        , ( "7.5RP 7/8", { name = "7.5RP 7/8", hue = "7.5RP", value = 7, chroma = 8, red = 0.9209, green = 0.595, blue = 0.673 } )
-        , ( "7.5RP 8/10", { name = "7.5RP 8/10", hue = "7.5RP", value = 8, chroma = 10, red = 1, green = 0.6646, blue = 0.7721 } )
-        , ( "7.5RP 8/12", { name = "7.5RP 8/12", hue = "7.5RP", value = 8, chroma = 12, red = 1, green = 0.6222, blue = 0.7713 } )
-        , ( "7.5RP 8/2", { name = "7.5RP 8/2", hue = "7.5RP", value = 8, chroma = 2, red = 0.8386, green = 0.7782, blue = 0.7882 } )
-        , ( "7.5RP 8/4", { name = "7.5RP 8/4", hue = "7.5RP", value = 8, chroma = 4, red = 0.9087, green = 0.7538, blue = 0.7822 } )
-        , ( "7.5RP 8/6", { name = "7.5RP 8/6", hue = "7.5RP", value = 8, chroma = 6, red = 0.9757, green = 0.7267, blue = 0.7775 } )
-        , ( "7.5RP 8/8", { name = "7.5RP 8/8", hue = "7.5RP", value = 8, chroma = 8, red = 1, green = 0.6957, blue = 0.7749 } )
-        , ( "7.5RP 9/2", { name = "7.5RP 9/2", hue = "7.5RP", value = 9, chroma = 2, red = 0.9459, green = 0.8856, blue = 0.8946 } )
-        , ( "7.5RP 9/4", { name = "7.5RP 9/4", hue = "7.5RP", value = 9, chroma = 4, red = 1, green = 0.8585, blue = 0.8874 } )
-        , ( "7.5RP 9/6", { name = "7.5RP 9/6", hue = "7.5RP", value = 9, chroma = 6, red = 1, green = 0.8284, blue = 0.8811 } )
-        , ( "7.5Y 1/2", { name = "7.5Y 1/2", hue = "7.5Y", value = 1, chroma = 2, red = 0.1301, green = 0.113, blue = 0.035 } )
-        , ( "7.5Y 2/2", { name = "7.5Y 2/2", hue = "7.5Y", value = 2, chroma = 2, red = 0.2101, green = 0.1949, blue = 0.1271 } )
-        , ( "7.5Y 2/4", { name = "7.5Y 2/4", hue = "7.5Y", value = 2, chroma = 4, red = 0.2257, green = 0.1947, blue = -0.0014 } )
-        , ( "7.5Y 3/2", { name = "7.5Y 3/2", hue = "7.5Y", value = 3, chroma = 2, red = 0.303, green = 0.2854, blue = 0.2041 } )
-        , ( "7.5Y 3/4", { name = "7.5Y 3/4", hue = "7.5Y", value = 3, chroma = 4, red = 0.3177, green = 0.2857, blue = 0.1132 } )
-        , ( "7.5Y 4/2", { name = "7.5Y 4/2", hue = "7.5Y", value = 4, chroma = 2, red = 0.4027, green = 0.3831, blue = 0.2874 } )
-        , ( "7.5Y 4/4", { name = "7.5Y 4/4", hue = "7.5Y", value = 4, chroma = 4, red = 0.4194, green = 0.384, blue = 0.1867 } )
-        , ( "7.5Y 4/6", { name = "7.5Y 4/6", hue = "7.5Y", value = 4, chroma = 6, red = 0.4308, green = 0.3839, blue = 0.0679 } )
-        , ( "7.5Y 5/2", { name = "7.5Y 5/2", hue = "7.5Y", value = 5, chroma = 2, red = 0.5043, green = 0.4844, blue = 0.3848 } )
-        , ( "7.5Y 5/4", { name = "7.5Y 5/4", hue = "7.5Y", value = 5, chroma = 4, red = 0.5223, green = 0.4857, blue = 0.281 } )
-        , ( "7.5Y 5/6", { name = "7.5Y 5/6", hue = "7.5Y", value = 5, chroma = 6, red = 0.5361, green = 0.4863, blue = 0.1602 } )
-        , ( "7.5Y 6/2", { name = "7.5Y 6/2", hue = "7.5Y", value = 6, chroma = 2, red = 0.6067, green = 0.5876, blue = 0.4788 } )
-        , ( "7.5Y 6/4", { name = "7.5Y 6/4", hue = "7.5Y", value = 6, chroma = 4, red = 0.6247, green = 0.5893, blue = 0.3779 } )
-        , ( "7.5Y 6/6", { name = "7.5Y 6/6", hue = "7.5Y", value = 6, chroma = 6, red = 0.6401, green = 0.5903, blue = 0.2614 } )
-        , ( "7.5Y 6/8", { name = "7.5Y 6/8", hue = "7.5Y", value = 6, chroma = 8, red = 0.6516, green = 0.5905, blue = 0.1151 } )
-        , ( "7.5Y 7/2", { name = "7.5Y 7/2", hue = "7.5Y", value = 7, chroma = 2, red = 0.7106, green = 0.6915, blue = 0.5774 } )
-        , ( "7.5Y 7/4", { name = "7.5Y 7/4", hue = "7.5Y", value = 7, chroma = 4, red = 0.7292, green = 0.6937, blue = 0.4725 } )
-        , ( "7.5Y 7/6", { name = "7.5Y 7/6", hue = "7.5Y", value = 7, chroma = 6, red = 0.7446, green = 0.6949, blue = 0.3644 } )
-        , ( "7.5Y 7/8", { name = "7.5Y 7/8", hue = "7.5Y", value = 7, chroma = 8, red = 0.7568, green = 0.6957, blue = 0.2407 } )
-        , ( "7.5Y 8/10", { name = "7.5Y 8/10", hue = "7.5Y", value = 8, chroma = 10, red = 0.8735, green = 0.8031, blue = 0.19 } )
-        , ( "7.5Y 8/2", { name = "7.5Y 8/2", hue = "7.5Y", value = 8, chroma = 2, red = 0.8163, green = 0.7969, blue = 0.6727 } )
-        , ( "7.5Y 8/4", { name = "7.5Y 8/4", hue = "7.5Y", value = 8, chroma = 4, red = 0.8345, green = 0.7994, blue = 0.5691 } )
-        , ( "7.5Y 8/6", { name = "7.5Y 8/6", hue = "7.5Y", value = 8, chroma = 6, red = 0.8499, green = 0.8013, blue = 0.4597 } )
-        , ( "7.5Y 8/8", { name = "7.5Y 8/8", hue = "7.5Y", value = 8, chroma = 8, red = 0.8629, green = 0.8025, blue = 0.3388 } )
-        , ( "7.5Y 9/10", { name = "7.5Y 9/10", hue = "7.5Y", value = 9, chroma = 10, red = 0.9837, green = 0.9123, blue = 0.297 } )
-        , ( "7.5Y 9/12", { name = "7.5Y 9/12", hue = "7.5Y", value = 9, chroma = 12, red = 0.9943, green = 0.9125, blue = 0.0468 } )
-        , ( "7.5Y 9/2", { name = "7.5Y 9/2", hue = "7.5Y", value = 9, chroma = 2, red = 0.9239, green = 0.9051, blue = 0.7699 } )
-        , ( "7.5Y 9/4", { name = "7.5Y 9/4", hue = "7.5Y", value = 9, chroma = 4, red = 0.942, green = 0.9082, blue = 0.6602 } )
-        , ( "7.5Y 9/6", { name = "7.5Y 9/6", hue = "7.5Y", value = 9, chroma = 6, red = 0.958, green = 0.9104, blue = 0.5482 } )
-        , ( "7.5Y 9/8", { name = "7.5Y 9/8", hue = "7.5Y", value = 9, chroma = 8, red = 0.972, green = 0.9117, blue = 0.4291 } )
-        , ( "7.5YR 1/2", { name = "7.5YR 1/2", hue = "7.5YR", value = 1, chroma = 2, red = 0.1676, green = 0.0962, blue = 0.0495 } )
-        , ( "7.5YR 2/2", { name = "7.5YR 2/2", hue = "7.5YR", value = 2, chroma = 2, red = 0.2455, green = 0.181, blue = 0.1372 } )
-        , ( "7.5YR 2/4", { name = "7.5YR 2/4", hue = "7.5YR", value = 2, chroma = 4, red = 0.2824, green = 0.1678, blue = 0.0695 } )
-        , ( "7.5YR 3/2", { name = "7.5YR 3/2", hue = "7.5YR", value = 3, chroma = 2, red = 0.3438, green = 0.2697, blue = 0.2166 } )
-        , ( "7.5YR 3/4", { name = "7.5YR 3/4", hue = "7.5YR", value = 3, chroma = 4, red = 0.3833, green = 0.2571, blue = 0.1499 } )
-        , ( "7.5YR 3/6", { name = "7.5YR 3/6", hue = "7.5YR", value = 3, chroma = 6, red = 0.4135, green = 0.2452, blue = 0.0666 } )
-        , ( "7.5YR 4/2", { name = "7.5YR 4/2", hue = "7.5YR", value = 4, chroma = 2, red = 0.4458, green = 0.3664, blue = 0.3069 } )
-        , ( "7.5YR 4/4", { name = "7.5YR 4/4", hue = "7.5YR", value = 4, chroma = 4, red = 0.4929, green = 0.3526, blue = 0.2304 } )
-        , ( "7.5YR 4/6", { name = "7.5YR 4/6", hue = "7.5YR", value = 4, chroma = 6, red = 0.5259, green = 0.3409, blue = 0.1562 } )
-        , ( "7.5YR 4/8", { name = "7.5YR 4/8", hue = "7.5YR", value = 4, chroma = 8, red = 0.5509, green = 0.3306, blue = 0.0533 } )
-        , ( "7.5YR 5/2", { name = "7.5YR 5/2", hue = "7.5YR", value = 5, chroma = 2, red = 0.5447, green = 0.4685, blue = 0.4085 } )
-        , ( "7.5YR 5/4", { name = "7.5YR 5/4", hue = "7.5YR", value = 5, chroma = 4, red = 0.5953, green = 0.4551, blue = 0.3317 } )
-        , ( "7.5YR 5/6", { name = "7.5YR 5/6", hue = "7.5YR", value = 5, chroma = 6, red = 0.6381, green = 0.4413, blue = 0.2469 } )
-        , ( "7.5YR 5/8", { name = "7.5YR 5/8", hue = "7.5YR", value = 5, chroma = 8, red = 0.6699, green = 0.4294, blue = 0.1526 } )
-        , ( "7.5YR 6/10", { name = "7.5YR 6/10", hue = "7.5YR", value = 6, chroma = 10, red = 0.8107, green = 0.5218, blue = 0.1428 } )
-        , ( "7.5YR 6/2", { name = "7.5YR 6/2", hue = "7.5YR", value = 6, chroma = 2, red = 0.6496, green = 0.5709, blue = 0.5058 } )
-        , ( "7.5YR 6/4", { name = "7.5YR 6/4", hue = "7.5YR", value = 6, chroma = 4, red = 0.7009, green = 0.558, blue = 0.43 } )
-        , ( "7.5YR 6/6", { name = "7.5YR 6/6", hue = "7.5YR", value = 6, chroma = 6, red = 0.7451, green = 0.5451, blue = 0.3462 } )
-        , ( "7.5YR 6/8", { name = "7.5YR 6/8", hue = "7.5YR", value = 6, chroma = 8, red = 0.7819, green = 0.5326, blue = 0.2558 } )
-        , ( "7.5YR 7/10", { name = "7.5YR 7/10", hue = "7.5YR", value = 7, chroma = 10, red = 0.9244, green = 0.6261, blue = 0.257 } )
-        , ( "7.5YR 7/12", { name = "7.5YR 7/12", hue = "7.5YR", value = 7, chroma = 12, red = 0.9531, green = 0.615, blue = 0.1117 } )
-        , ( "7.5YR 7/2", { name = "7.5YR 7/2", hue = "7.5YR", value = 7, chroma = 2, red = 0.753, green = 0.6748, blue = 0.6064 } )
-        , ( "7.5YR 7/4", { name = "7.5YR 7/4", hue = "7.5YR", value = 7, chroma = 4, red = 0.8075, green = 0.6619, blue = 0.5266 } )
-        , ( "7.5YR 7/6", { name = "7.5YR 7/6", hue = "7.5YR", value = 7, chroma = 6, red = 0.8536, green = 0.6493, blue = 0.442 } )
-        , ( "7.5YR 7/8", { name = "7.5YR 7/8", hue = "7.5YR", value = 7, chroma = 8, red = 0.8917, green = 0.6374, blue = 0.356 } )
-        , ( "7.5YR 8/10", { name = "7.5YR 8/10", hue = "7.5YR", value = 8, chroma = 10, red = 1, green = 0.7303, blue = 0.3514 } )
-        , ( "7.5YR 8/12", { name = "7.5YR 8/12", hue = "7.5YR", value = 8, chroma = 12, red = 1, green = 0.7194, blue = 0.2336 } )
-        , ( "7.5YR 8/2", { name = "7.5YR 8/2", hue = "7.5YR", value = 8, chroma = 2, red = 0.8562, green = 0.7806, blue = 0.7086 } )
-        , ( "7.5YR 8/4", { name = "7.5YR 8/4", hue = "7.5YR", value = 8, chroma = 4, red = 0.9126, green = 0.768, blue = 0.6241 } )
-        , ( "7.5YR 8/6", { name = "7.5YR 8/6", hue = "7.5YR", value = 8, chroma = 6, red = 0.9628, green = 0.7547, blue = 0.5401 } )
-        , ( "7.5YR 8/8", { name = "7.5YR 8/8", hue = "7.5YR", value = 8, chroma = 8, red = 1, green = 0.7416, blue = 0.4458 } )
-        , ( "7.5YR 9/2", { name = "7.5YR 9/2", hue = "7.5YR", value = 9, chroma = 2, red = 0.966, green = 0.888, blue = 0.8076 } )
-        , ( "7.5YR 9/4", { name = "7.5YR 9/4", hue = "7.5YR", value = 9, chroma = 4, red = 1, green = 0.8744, blue = 0.7131 } )
-        , ( "7.5YR 9/6", { name = "7.5YR 9/6", hue = "7.5YR", value = 9, chroma = 6, red = 1, green = 0.8621, blue = 0.6252 } )
-        , ( "7.5YR 9/8", { name = "7.5YR 9/8", hue = "7.5YR", value = 9, chroma = 8, red = 1, green = 0.8496, blue = 0.532 } )
+        [ ( 1, ( 0, 3 ) )
+        , ( 2, ( 3, 4 ) )
+        , ( 3, ( 7, 5 ) )
+        , ( 4, ( 12, 7 ) )
+        , ( 5, ( 19, 8 ) )
+        , ( 6, ( 27, 9 ) )
+        , ( 7, ( 36, 8 ) )
+        , ( 8, ( 44, 5 ) )
+        , ( 9, ( 49, 3 ) )
+        , ( 251, ( 52, 3 ) )
+        , ( 252, ( 55, 4 ) )
+        , ( 253, ( 59, 5 ) )
+        , ( 254, ( 64, 7 ) )
+        , ( 255, ( 71, 8 ) )
+        , ( 256, ( 79, 9 ) )
+        , ( 257, ( 88, 8 ) )
+        , ( 258, ( 96, 5 ) )
+        , ( 259, ( 101, 3 ) )
+        , ( 501, ( 104, 2 ) )
+        , ( 502, ( 106, 4 ) )
+        , ( 503, ( 110, 5 ) )
+        , ( 504, ( 115, 7 ) )
+        , ( 505, ( 122, 9 ) )
+        , ( 506, ( 131, 9 ) )
+        , ( 507, ( 140, 7 ) )
+        , ( 508, ( 147, 5 ) )
+        , ( 509, ( 152, 3 ) )
+        , ( 751, ( 155, 2 ) )
+        , ( 752, ( 157, 4 ) )
+        , ( 753, ( 161, 5 ) )
+        , ( 754, ( 166, 7 ) )
+        , ( 755, ( 173, 9 ) )
+        , ( 756, ( 182, 9 ) )
+        , ( 757, ( 191, 8 ) )
+        , ( 758, ( 199, 5 ) )
+        , ( 759, ( 204, 3 ) )
+        , ( 1001, ( 207, 2 ) )
+        , ( 1002, ( 209, 4 ) )
+        , ( 1003, ( 213, 5 ) )
+        , ( 1004, ( 218, 6 ) )
+        , ( 1005, ( 224, 7 ) )
+        , ( 1006, ( 231, 8 ) )
+        , ( 1007, ( 239, 8 ) )
+        , ( 1008, ( 247, 5 ) )
+        , ( 1009, ( 252, 3 ) )
+        , ( 1251, ( 255, 3 ) )
+        , ( 1252, ( 258, 3 ) )
+        , ( 1253, ( 261, 4 ) )
+        , ( 1254, ( 265, 5 ) )
+        , ( 1255, ( 270, 6 ) )
+        , ( 1256, ( 276, 7 ) )
+        , ( 1257, ( 283, 7 ) )
+        , ( 1258, ( 290, 6 ) )
+        , ( 1259, ( 296, 3 ) )
+        , ( 1501, ( 299, 1 ) )
+        , ( 1502, ( 300, 3 ) )
+        , ( 1503, ( 303, 3 ) )
+        , ( 1504, ( 306, 4 ) )
+        , ( 1505, ( 310, 5 ) )
+        , ( 1506, ( 315, 6 ) )
+        , ( 1507, ( 321, 6 ) )
+        , ( 1508, ( 327, 7 ) )
+        , ( 1509, ( 334, 3 ) )
+        , ( 1751, ( 337, 1 ) )
+        , ( 1752, ( 338, 2 ) )
+        , ( 1753, ( 340, 3 ) )
+        , ( 1754, ( 343, 4 ) )
+        , ( 1755, ( 347, 4 ) )
+        , ( 1756, ( 351, 5 ) )
+        , ( 1757, ( 356, 6 ) )
+        , ( 1758, ( 362, 6 ) )
+        , ( 1759, ( 368, 4 ) )
+        , ( 2001, ( 372, 1 ) )
+        , ( 2002, ( 373, 2 ) )
+        , ( 2003, ( 375, 3 ) )
+        , ( 2004, ( 378, 3 ) )
+        , ( 2005, ( 381, 4 ) )
+        , ( 2006, ( 385, 5 ) )
+        , ( 2007, ( 390, 5 ) )
+        , ( 2008, ( 395, 6 ) )
+        , ( 2009, ( 401, 4 ) )
+        , ( 2251, ( 405, 1 ) )
+        , ( 2252, ( 406, 2 ) )
+        , ( 2253, ( 408, 2 ) )
+        , ( 2254, ( 410, 3 ) )
+        , ( 2255, ( 413, 4 ) )
+        , ( 2256, ( 417, 4 ) )
+        , ( 2257, ( 421, 5 ) )
+        , ( 2258, ( 426, 6 ) )
+        , ( 2259, ( 432, 6 ) )
+        , ( 2501, ( 438, 1 ) )
+        , ( 2502, ( 439, 2 ) )
+        , ( 2503, ( 441, 2 ) )
+        , ( 2504, ( 443, 3 ) )
+        , ( 2505, ( 446, 3 ) )
+        , ( 2506, ( 449, 4 ) )
+        , ( 2507, ( 453, 5 ) )
+        , ( 2508, ( 458, 5 ) )
+        , ( 2509, ( 463, 6 ) )
+        , ( 2751, ( 469, 1 ) )
+        , ( 2752, ( 470, 2 ) )
+        , ( 2753, ( 472, 2 ) )
+        , ( 2754, ( 474, 3 ) )
+        , ( 2755, ( 477, 3 ) )
+        , ( 2756, ( 480, 4 ) )
+        , ( 2757, ( 484, 4 ) )
+        , ( 2758, ( 488, 5 ) )
+        , ( 2759, ( 493, 6 ) )
+        , ( 3001, ( 499, 1 ) )
+        , ( 3002, ( 500, 2 ) )
+        , ( 3003, ( 502, 2 ) )
+        , ( 3004, ( 504, 3 ) )
+        , ( 3005, ( 507, 3 ) )
+        , ( 3006, ( 510, 4 ) )
+        , ( 3007, ( 514, 4 ) )
+        , ( 3008, ( 518, 5 ) )
+        , ( 3009, ( 523, 5 ) )
+        , ( 3251, ( 528, 1 ) )
+        , ( 3252, ( 529, 2 ) )
+        , ( 3253, ( 531, 2 ) )
+        , ( 3254, ( 533, 3 ) )
+        , ( 3255, ( 536, 3 ) )
+        , ( 3256, ( 539, 4 ) )
+        , ( 3257, ( 543, 5 ) )
+        , ( 3258, ( 548, 5 ) )
+        , ( 3259, ( 553, 6 ) )
+        , ( 3501, ( 559, 1 ) )
+        , ( 3502, ( 560, 2 ) )
+        , ( 3503, ( 562, 3 ) )
+        , ( 3504, ( 565, 3 ) )
+        , ( 3505, ( 568, 4 ) )
+        , ( 3506, ( 572, 4 ) )
+        , ( 3507, ( 576, 5 ) )
+        , ( 3508, ( 581, 5 ) )
+        , ( 3509, ( 586, 6 ) )
+        , ( 3751, ( 592, 2 ) )
+        , ( 3752, ( 594, 3 ) )
+        , ( 3753, ( 597, 3 ) )
+        , ( 3754, ( 600, 4 ) )
+        , ( 3755, ( 604, 5 ) )
+        , ( 3756, ( 609, 5 ) )
+        , ( 3757, ( 614, 6 ) )
+        , ( 3758, ( 620, 6 ) )
+        , ( 3759, ( 626, 7 ) )
+        , ( 4001, ( 633, 1 ) )
+        , ( 4002, ( 634, 3 ) )
+        , ( 4003, ( 637, 3 ) )
+        , ( 4004, ( 640, 4 ) )
+        , ( 4005, ( 644, 5 ) )
+        , ( 4006, ( 649, 6 ) )
+        , ( 4007, ( 655, 7 ) )
+        , ( 4008, ( 662, 8 ) )
+        , ( 4009, ( 670, 9 ) )
+        , ( 4251, ( 679, 1 ) )
+        , ( 4252, ( 680, 2 ) )
+        , ( 4253, ( 682, 3 ) )
+        , ( 4254, ( 685, 3 ) )
+        , ( 4255, ( 688, 4 ) )
+        , ( 4256, ( 692, 5 ) )
+        , ( 4257, ( 697, 5 ) )
+        , ( 4258, ( 702, 6 ) )
+        , ( 4259, ( 708, 6 ) )
+        , ( 4501, ( 714, 1 ) )
+        , ( 4502, ( 715, 2 ) )
+        , ( 4503, ( 717, 2 ) )
+        , ( 4504, ( 719, 3 ) )
+        , ( 4505, ( 722, 3 ) )
+        , ( 4506, ( 725, 4 ) )
+        , ( 4507, ( 729, 5 ) )
+        , ( 4508, ( 734, 5 ) )
+        , ( 4509, ( 739, 5 ) )
+        , ( 4751, ( 744, 1 ) )
+        , ( 4752, ( 745, 2 ) )
+        , ( 4753, ( 747, 2 ) )
+        , ( 4754, ( 749, 3 ) )
+        , ( 4755, ( 752, 3 ) )
+        , ( 4756, ( 755, 4 ) )
+        , ( 4757, ( 759, 4 ) )
+        , ( 4758, ( 763, 5 ) )
+        , ( 4759, ( 768, 5 ) )
+        , ( 5001, ( 773, 1 ) )
+        , ( 5002, ( 774, 2 ) )
+        , ( 5003, ( 776, 2 ) )
+        , ( 5004, ( 778, 2 ) )
+        , ( 5005, ( 780, 3 ) )
+        , ( 5006, ( 783, 4 ) )
+        , ( 5007, ( 787, 4 ) )
+        , ( 5008, ( 791, 5 ) )
+        , ( 5009, ( 796, 5 ) )
+        , ( 5251, ( 801, 1 ) )
+        , ( 5252, ( 802, 2 ) )
+        , ( 5253, ( 804, 2 ) )
+        , ( 5254, ( 806, 2 ) )
+        , ( 5255, ( 808, 3 ) )
+        , ( 5256, ( 811, 3 ) )
+        , ( 5257, ( 814, 4 ) )
+        , ( 5258, ( 818, 4 ) )
+        , ( 5259, ( 822, 5 ) )
+        , ( 5501, ( 827, 1 ) )
+        , ( 5502, ( 828, 1 ) )
+        , ( 5503, ( 829, 2 ) )
+        , ( 5504, ( 831, 2 ) )
+        , ( 5505, ( 833, 3 ) )
+        , ( 5506, ( 836, 3 ) )
+        , ( 5507, ( 839, 4 ) )
+        , ( 5508, ( 843, 4 ) )
+        , ( 5509, ( 847, 4 ) )
+        , ( 5751, ( 851, 1 ) )
+        , ( 5752, ( 852, 1 ) )
+        , ( 5753, ( 853, 2 ) )
+        , ( 5754, ( 855, 2 ) )
+        , ( 5755, ( 857, 3 ) )
+        , ( 5756, ( 860, 3 ) )
+        , ( 5757, ( 863, 4 ) )
+        , ( 5758, ( 867, 4 ) )
+        , ( 5759, ( 871, 4 ) )
+        , ( 6001, ( 875, 1 ) )
+        , ( 6002, ( 876, 1 ) )
+        , ( 6003, ( 877, 2 ) )
+        , ( 6004, ( 879, 2 ) )
+        , ( 6005, ( 881, 3 ) )
+        , ( 6006, ( 884, 3 ) )
+        , ( 6007, ( 887, 4 ) )
+        , ( 6008, ( 891, 4 ) )
+        , ( 6009, ( 895, 3 ) )
+        , ( 6251, ( 898, 1 ) )
+        , ( 6252, ( 899, 1 ) )
+        , ( 6253, ( 900, 2 ) )
+        , ( 6254, ( 902, 2 ) )
+        , ( 6255, ( 904, 3 ) )
+        , ( 6256, ( 907, 3 ) )
+        , ( 6257, ( 910, 4 ) )
+        , ( 6258, ( 914, 4 ) )
+        , ( 6259, ( 918, 2 ) )
+        , ( 6501, ( 920, 1 ) )
+        , ( 6502, ( 921, 1 ) )
+        , ( 6503, ( 922, 2 ) )
+        , ( 6504, ( 924, 2 ) )
+        , ( 6505, ( 926, 3 ) )
+        , ( 6506, ( 929, 3 ) )
+        , ( 6507, ( 932, 4 ) )
+        , ( 6508, ( 936, 4 ) )
+        , ( 6509, ( 940, 2 ) )
+        , ( 6751, ( 942, 1 ) )
+        , ( 6752, ( 943, 2 ) )
+        , ( 6753, ( 945, 2 ) )
+        , ( 6754, ( 947, 3 ) )
+        , ( 6755, ( 950, 3 ) )
+        , ( 6756, ( 953, 4 ) )
+        , ( 6757, ( 957, 4 ) )
+        , ( 6758, ( 961, 4 ) )
+        , ( 6759, ( 965, 2 ) )
+        , ( 7001, ( 967, 1 ) )
+        , ( 7002, ( 968, 2 ) )
+        , ( 7003, ( 970, 2 ) )
+        , ( 7004, ( 972, 3 ) )
+        , ( 7005, ( 975, 4 ) )
+        , ( 7006, ( 979, 4 ) )
+        , ( 7007, ( 983, 5 ) )
+        , ( 7008, ( 988, 4 ) )
+        , ( 7009, ( 992, 2 ) )
+        , ( 7251, ( 994, 1 ) )
+        , ( 7252, ( 995, 2 ) )
+        , ( 7253, ( 997, 3 ) )
+        , ( 7254, ( 1000, 4 ) )
+        , ( 7255, ( 1004, 5 ) )
+        , ( 7256, ( 1009, 5 ) )
+        , ( 7257, ( 1014, 5 ) )
+        , ( 7258, ( 1019, 3 ) )
+        , ( 7259, ( 1022, 1 ) )
+        , ( 7501, ( 1023, 2 ) )
+        , ( 7502, ( 1025, 3 ) )
+        , ( 7503, ( 1028, 4 ) )
+        , ( 7504, ( 1032, 5 ) )
+        , ( 7505, ( 1037, 6 ) )
+        , ( 7506, ( 1043, 7 ) )
+        , ( 7507, ( 1050, 5 ) )
+        , ( 7508, ( 1055, 3 ) )
+        , ( 7509, ( 1058, 1 ) )
+        , ( 7751, ( 1059, 6 ) )
+        , ( 7752, ( 1065, 9 ) )
+        , ( 7753, ( 1074, 12 ) )
+        , ( 7754, ( 1086, 13 ) )
+        , ( 7755, ( 1099, 10 ) )
+        , ( 7756, ( 1109, 7 ) )
+        , ( 7757, ( 1116, 5 ) )
+        , ( 7758, ( 1121, 3 ) )
+        , ( 7759, ( 1124, 1 ) )
+        , ( 8001, ( 1125, 5 ) )
+        , ( 8002, ( 1130, 7 ) )
+        , ( 8003, ( 1137, 10 ) )
+        , ( 8004, ( 1147, 13 ) )
+        , ( 8005, ( 1160, 11 ) )
+        , ( 8006, ( 1171, 8 ) )
+        , ( 8007, ( 1179, 6 ) )
+        , ( 8008, ( 1185, 4 ) )
+        , ( 8009, ( 1189, 2 ) )
+        , ( 8251, ( 1191, 4 ) )
+        , ( 8252, ( 1195, 6 ) )
+        , ( 8253, ( 1201, 9 ) )
+        , ( 8254, ( 1210, 11 ) )
+        , ( 8255, ( 1221, 13 ) )
+        , ( 8256, ( 1234, 9 ) )
+        , ( 8257, ( 1243, 6 ) )
+        , ( 8258, ( 1249, 4 ) )
+        , ( 8259, ( 1253, 2 ) )
+        , ( 8501, ( 1255, 4 ) )
+        , ( 8502, ( 1259, 6 ) )
+        , ( 8503, ( 1265, 8 ) )
+        , ( 8504, ( 1273, 10 ) )
+        , ( 8505, ( 1283, 13 ) )
+        , ( 8506, ( 1296, 10 ) )
+        , ( 8507, ( 1306, 7 ) )
+        , ( 8508, ( 1313, 5 ) )
+        , ( 8509, ( 1318, 2 ) )
+        , ( 8751, ( 1320, 3 ) )
+        , ( 8752, ( 1323, 5 ) )
+        , ( 8753, ( 1328, 7 ) )
+        , ( 8754, ( 1335, 9 ) )
+        , ( 8755, ( 1344, 11 ) )
+        , ( 8756, ( 1355, 12 ) )
+        , ( 8757, ( 1367, 9 ) )
+        , ( 8758, ( 1376, 6 ) )
+        , ( 8759, ( 1382, 3 ) )
+        , ( 9001, ( 1385, 3 ) )
+        , ( 9002, ( 1388, 5 ) )
+        , ( 9003, ( 1393, 6 ) )
+        , ( 9004, ( 1399, 8 ) )
+        , ( 9005, ( 1407, 10 ) )
+        , ( 9006, ( 1417, 12 ) )
+        , ( 9007, ( 1429, 11 ) )
+        , ( 9008, ( 1440, 7 ) )
+        , ( 9009, ( 1447, 3 ) )
+        , ( 9251, ( 1450, 3 ) )
+        , ( 9252, ( 1453, 5 ) )
+        , ( 9253, ( 1458, 6 ) )
+        , ( 9254, ( 1464, 8 ) )
+        , ( 9255, ( 1472, 10 ) )
+        , ( 9256, ( 1482, 11 ) )
+        , ( 9257, ( 1493, 10 ) )
+        , ( 9258, ( 1503, 7 ) )
+        , ( 9259, ( 1510, 3 ) )
+        , ( 9501, ( 1513, 3 ) )
+        , ( 9502, ( 1516, 4 ) )
+        , ( 9503, ( 1520, 5 ) )
+        , ( 9504, ( 1525, 7 ) )
+        , ( 9505, ( 1532, 9 ) )
+        , ( 9506, ( 1541, 11 ) )
+        , ( 9507, ( 1552, 9 ) )
+        , ( 9508, ( 1561, 6 ) )
+        , ( 9509, ( 1567, 3 ) )
+        , ( 9751, ( 1570, 3 ) )
+        , ( 9752, ( 1573, 4 ) )
+        , ( 9753, ( 1577, 5 ) )
+        , ( 9754, ( 1582, 7 ) )
+        , ( 9755, ( 1589, 9 ) )
+        , ( 9756, ( 1598, 10 ) )
+        , ( 9757, ( 1608, 8 ) )
+        , ( 9758, ( 1616, 6 ) )
+        , ( 9759, ( 1622, 3 ) )
+        ]
+
+
+packedChips : Array Int
+packedChips =
+    Array.fromList
+        [ 556537376
+        , 573902627
+        , 591135525
+        , 1094790194
+        , 1112286515
+        , 1129651764
+        , 1147080758
+        , 1633370694
+        , 1650998085
+        , 1668559683
+        , 1686120515
+        , 1703614274
+        , 2171820895
+        , 2189514076
+        , 2207141466
+        , 2224768345
+        , 2242263896
+        , 2259758423
+        , 2277250902
+        , 2710271608
+        , 2728095861
+        , 2745788787
+        , 2763481456
+        , 2781042798
+        , 2798668909
+        , 2816098412
+        , 2833657194
+        , 3248787602
+        , 3266611855
+        , 3284436108
+        , 3301997961
+        , 3319690631
+        , 3337317252
+        , 3354878339
+        , 3372176000
+        , 3388948863
+        , 3787369388
+        , 3805193641
+        , 3823017894
+        , 3840841634
+        , 3858534559
+        , 3875505564
+        , 3892280218
+        , 3909054103
+        , 4325885640
+        , 4343906499
+        , 4361796032
+        , 4378833340
+        , 4395608504
+        , 4864533219
+        , 4882160606
+        , 4898935769
+        , 9146537502
+        , 9163902495
+        , 9181200416
+        , 9684790320
+        , 9702286639
+        , 9719717166
+        , 9737211438
+        , 10223305284
+        , 10241063744
+        , 10258559805
+        , 10276186170
+        , 10293679927
+        , 10761755485
+        , 10779514200
+        , 10797207124
+        , 10814768465
+        , 10832329549
+        , 10849824074
+        , 10867316039
+        , 11300206199
+        , 11318095986
+        , 11335854445
+        , 11353481576
+        , 11371108452
+        , 11388734560
+        , 11406164061
+        , 11423722842
+        , 11838787728
+        , 11856677515
+        , 11874501766
+        , 11892129153
+        , 11909821820
+        , 11927448439
+        , 11944943988
+        , 11962110575
+        , 11978883180
+        , 12377369515
+        , 12395259301
+        , 12413083296
+        , 12430907290
+        , 12448599957
+        , 12465440143
+        , 12482214794
+        , 12498988677
+        , 12915820230
+        , 12933972159
+        , 12951861689
+        , 12968767923
+        , 12985543085
+        , 13454467810
+        , 13472094938
+        , 13488870354
+        , 17736472091
+        , 17753902619
+        , 18274724910
+        , 18292286763
+        , 18309717288
+        , 18327211558
+        , 18813305410
+        , 18830998332
+        , 18848560182
+        , 18866121008
+        , 18883615019
+        , 19351755610
+        , 19369514323
+        , 19387207245
+        , 19404768838
+        , 19422264384
+        , 19439759418
+        , 19457251892
+        , 19890206325
+        , 19908096109
+        , 19925854566
+        , 19943481695
+        , 19961108567
+        , 19978734929
+        , 19996164427
+        , 20013657924
+        , 20031211581
+        , 20428787855
+        , 20446677639
+        , 20464501887
+        , 20482129273
+        , 20499821937
+        , 20517448554
+        , 20535009635
+        , 20552045660
+        , 20568818773
+        , 20967369641
+        , 20985259425
+        , 21003148953
+        , 21020907410
+        , 21038600074
+        , 21055374978
+        , 21072149626
+        , 21505820356
+        , 21523972283
+        , 21541861811
+        , 21558702506
+        , 21575477665
+        , 22044533471
+        , 22062029525
+        , 22078804939
+        , 26326472217
+        , 26343902743
+        , 26864659500
+        , 26882221351
+        , 26899652130
+        , 26917146653
+        , 27403240000
+        , 27420933175
+        , 27438495024
+        , 27455990567
+        , 27473485086
+        , 27941690201
+        , 27959514448
+        , 27977141831
+        , 27994703421
+        , 28012199477
+        , 28029628971
+        , 28047057441
+        , 28480140915
+        , 28498030697
+        , 28515789151
+        , 28533482069
+        , 28551043403
+        , 28568604480
+        , 28586034230
+        , 28603528490
+        , 28620890142
+        , 29018787980
+        , 29036677762
+        , 29054436473
+        , 29072129391
+        , 29089822052
+        , 29107383641
+        , 29124879437
+        , 29141981249
+        , 29158755123
+        , 29557369767
+        , 29575325084
+        , 29593083794
+        , 29610973319
+        , 29628535164
+        , 29645310064
+        , 29662084964
+        , 29678859351
+        , 30095820482
+        , 30114037686
+        , 30131861931
+        , 30148637342
+        , 30165412498
+        , 30634533341
+        , 30651964111
+        , 30668739522
+        , 34916406807
+        , 34933837330
+        , 35454594090
+        , 35472156194
+        , 35489586970
+        , 35507016466
+        , 35993109310
+        , 36010802484
+        , 36028364329
+        , 36045860126
+        , 36063224337
+        , 36531625046
+        , 36549449290
+        , 36567011391
+        , 36584573234
+        , 36602003748
+        , 36619368466
+        , 37070141040
+        , 37087965283
+        , 37105723990
+        , 37123351625
+        , 37140847673
+        , 37158343720
+        , 37175643410
+        , 37608722570
+        , 37626612604
+        , 37644371312
+        , 37661998947
+        , 37679626323
+        , 37697122627
+        , 37714618671
+        , 37731918100
+        , 38147304356
+        , 38165259671
+        , 38183084169
+        , 38200842619
+        , 38218404717
+        , 38235245659
+        , 38252020809
+        , 38268795953
+        , 38685820608
+        , 38703972528
+        , 38721796769
+        , 38738572178
+        , 38755347843
+        , 39224467931
+        , 39241898697
+        , 39258674361
+        , 43506276116
+        , 43523772170
+        , 43541136130
+        , 44044463399
+        , 44062025501
+        , 44079456529
+        , 44583043899
+        , 44600606255
+        , 44618102816
+        , 44635468302
+        , 45121559635
+        , 45139253061
+        , 45156815415
+        , 45174246438
+        , 45191546639
+        , 45660075629
+        , 45677834591
+        , 45695528015
+        , 45713090109
+        , 45730455850
+        , 45747756047
+        , 46198722694
+        , 46216481912
+        , 46234175080
+        , 46251802968
+        , 46269299781
+        , 46286665263
+        , 46303965450
+        , 46737238945
+        , 46755128977
+        , 46772887936
+        , 46790581360
+        , 46808077919
+        , 46825181512
+        , 46841957164
+        , 47275820733
+        , 47293907370
+        , 47311666329
+        , 47328507527
+        , 47345283444
+        , 47362059103
+        , 47814533591
+        , 47831833538
+        , 47848609455
+        , 52096145424
+        , 52634332453
+        , 52651829527
+        , 52669195265
+        , 53172847673
+        , 53190410282
+        , 53207776025
+        , 53711428944
+        , 53729056832
+        , 53746488367
+        , 53763788827
+        , 54249944938
+        , 54267638617
+        , 54285200966
+        , 54302632498
+        , 54319932953
+        , 54788592003
+        , 54806285682
+        , 54823913823
+        , 54841410635
+        , 54858776629
+        , 54876011797
+        , 55327173534
+        , 55344932747
+        , 55362626424
+        , 55380123493
+        , 55397555023
+        , 55414986548
+        , 55865755320
+        , 55883645604
+        , 55901339281
+        , 55918443131
+        , 55935219302
+        , 55951995469
+        , 55968771627
+        , 56404468434
+        , 56421768635
+        , 56438544807
+        , 60686014733
+        , 61224201763
+        , 61241568018
+        , 61762716983
+        , 61780148774
+        , 61797383953
+        , 62301297998
+        , 62318860859
+        , 62336161576
+        , 62353331214
+        , 62839813992
+        , 62857442389
+        , 62874939711
+        , 62892240167
+        , 63378461313
+        , 63396089454
+        , 63413586776
+        , 63430953025
+        , 63448253732
+        , 63917042843
+        , 63934736774
+        , 63952299633
+        , 63969665883
+        , 63987032130
+        , 64004267292
+        , 64455624629
+        , 64473384095
+        , 64491012234
+        , 64508378482
+        , 64525154906
+        , 64541931324
+        , 64994337486
+        , 65011703734
+        , 65028480159
+        , 65045256584
+        , 69275818506
+        , 69814005537
+        , 69831306509
+        , 70352455222
+        , 70369821731
+        , 70386991368
+        , 70891036492
+        , 70908533814
+        , 70925769249
+        , 71429617765
+        , 71447115343
+        , 71464481591
+        , 71481717019
+        , 71968199550
+        , 71985696872
+        , 72003128912
+        , 72020429878
+        , 72037599760
+        , 72506846615
+        , 72524409728
+        , 72541841769
+        , 72559142480
+        , 72576377907
+        , 73045428401
+        , 73062991514
+        , 73080489090
+        , 73097855336
+        , 73115090765
+        , 73131867432
+        , 73584141258
+        , 73601638832
+        , 73618415512
+        , 73635192190
+        , 77865556743
+        , 78403743776
+        , 78420979207
+        , 78942193460
+        , 78959494687
+        , 79480774730
+        , 79498141235
+        , 79515311386
+        , 80019356004
+        , 80036722763
+        , 80054023728
+        , 80071128333
+        , 80557937788
+        , 80575369828
+        , 80592671050
+        , 80609840940
+        , 81096584853
+        , 81114017149
+        , 81131318115
+        , 81148553800
+        , 81165658403
+        , 81635232174
+        , 81652598934
+        , 81669965692
+        , 81687201121
+        , 81704436802
+        , 81721541386
+        , 82173879751
+        , 82191312044
+        , 82208350866
+        , 82225127799
+        , 82241904730
+        , 82258681396
+        , 86455360519
+        , 86993547552
+        , 87010717698
+        , 87531997236
+        , 87549101854
+        , 88070512969
+        , 88087748657
+        , 88104787733
+        , 88609094498
+        , 88626330185
+        , 88643500331
+        , 89147676026
+        , 89164911969
+        , 89182082117
+        , 89199186723
+        , 89686323092
+        , 89703493497
+        , 89720729438
+        , 89737834049
+        , 89754873359
+        , 90224970412
+        , 90242140818
+        , 90259311223
+        , 90276416090
+        , 90293520694
+        , 90763617989
+        , 90780853929
+        , 90798024333
+        , 90815063664
+        , 90831840592
+        , 90848617757
+        , 95045098761
+        , 95583351328
+        , 95600390656
+        , 96121735476
+        , 96138774813
+        , 96660316745
+        , 96677356080
+        , 96694329873
+        , 97198898274
+        , 97215937608
+        , 97232976937
+        , 97737479802
+        , 97754519136
+        , 97771558723
+        , 97788532509
+        , 98276061331
+        , 98293166456
+        , 98310205789
+        , 98327179581
+        , 98814708652
+        , 98831813777
+        , 98848853109
+        , 98865827158
+        , 98882800944
+        , 99353421764
+        , 99370461352
+        , 99387500684
+        , 99404540013
+        , 99421514060
+        , 99438487820
+        , 103634837004
+        , 104173089314
+        , 104189997828
+        , 104711473717
+        , 104728381981
+        , 105249923915
+        , 105266963504
+        , 105283806225
+        , 105788636259
+        , 105805545032
+        , 105822453290
+        , 106327218042
+        , 106344126561
+        , 106361035075
+        , 106377943325
+        , 106865865107
+        , 106882773625
+        , 106899682141
+        , 106916590653
+        , 107404512427
+        , 107421420945
+        , 107438329461
+        , 107455237974
+        , 107472146479
+        , 107943159748
+        , 107960134056
+        , 107977042572
+        , 107993951084
+        , 108010859594
+        , 112224574991
+        , 112762827556
+        , 112779539724
+        , 113301211702
+        , 113317923872
+        , 113839727692
+        , 113856439604
+        , 113873151767
+        , 114378308964
+        , 114395021132
+        , 114411733296
+        , 114916890748
+        , 114933668451
+        , 114950380360
+        , 114967092516
+        , 115455537812
+        , 115472249979
+        , 115489027682
+        , 115505739587
+        , 115522451723
+        , 115994250668
+        , 116010962835
+        , 116027675000
+        , 116044387164
+        , 116061099061
+        , 116532897989
+        , 116549675945
+        , 116566388110
+        , 116583100015
+        , 116599812174
+        , 116616524045
+        , 120814378770
+        , 121352631334
+        , 121369081363
+        , 121891015480
+        , 121907465509
+        , 121923915531
+        , 122429465678
+        , 122445981496
+        , 122462431520
+        , 122968047207
+        , 122984563025
+        , 123001013048
+        , 123017528599
+        , 123506628734
+        , 123523144551
+        , 123539660368
+        , 123556110386
+        , 124045276054
+        , 124061791871
+        , 124078307432
+        , 124094822989
+        , 124111338535
+        , 124583923374
+        , 124600504471
+        , 124617020286
+        , 124633535844
+        , 124650051652
+        , 125122636230
+        , 125139217580
+        , 125155733394
+        , 125172249206
+        , 125188764759
+        , 125205280297
+        , 129404116757
+        , 129419846402
+        , 129942369320
+        , 129958557466
+        , 129974483207
+        , 130480688188
+        , 130496876332
+        , 130512933147
+        , 131019138386
+        , 131035260993
+        , 131051383598
+        , 131067440659
+        , 131557654378
+        , 131573908057
+        , 131590030917
+        , 131606153263
+        , 131622144778
+        , 132096236161
+        , 132112424304
+        , 132128612445
+        , 132144735046
+        , 132160792107
+        , 132634817691
+        , 132651006088
+        , 132667259765
+        , 132683447904
+        , 132699504966
+        , 132715562021
+        , 133173399475
+        , 133189587871
+        , 133205841803
+        , 133222029941
+        , 133238152542
+        , 133254275135
+        , 133712047051
+        , 133728235446
+        , 133744423839
+        , 133760611976
+        , 133776734831
+        , 133792857171
+        , 133808914220
+        , 137993920279
+        , 138532172842
+        , 138548099104
+        , 138563238422
+        , 139070426175
+        , 139086352435
+        , 139102016294
+        , 139608876373
+        , 139624802632
+        , 139640466745
+        , 139655802921
+        , 140147392622
+        , 140163318880
+        , 140179179345
+        , 140194777921
+        , 140209917488
+        , 140685843078
+        , 140701834871
+        , 140717695592
+        , 140733425240
+        , 140748958024
+        , 140763900980
+        , 141224424863
+        , 141240416655
+        , 141256342913
+        , 141272138097
+        , 141287736416
+        , 141303072845
+        , 141317884471
+        , 141763006647
+        , 141778933160
+        , 141794793879
+        , 141810654600
+        , 141826318454
+        , 141841851491
+        , 141856991055
+        , 141871278646
+        , 142301588689
+        , 142317515199
+        , 142333179564
+        , 142349040284
+        , 142364704393
+        , 142380302200
+        , 142395572067
+        , 142410317643
+        , 142422900521
+        , 146583789592
+        , 147121976620
+        , 147137574950
+        , 147660229697
+        , 147675762746
+        , 147690247219
+        , 148198614617
+        , 148214147664
+        , 148229090888
+        , 148737065073
+        , 148752729448
+        , 148768131423
+        , 148782615638
+        , 149275581322
+        , 149291180160
+        , 149306713206
+        , 149321787501
+        , 149335354212
+        , 149814097571
+        , 149829761689
+        , 149845360527
+        , 149860631429
+        , 149875312506
+        , 150352679357
+        , 150368343730
+        , 150383745958
+        , 150399147932
+        , 150414222225
+        , 150428051334
+        , 150891195862
+        , 150906794698
+        , 150922066108
+        , 150937402545
+        , 150952411046
+        , 150966960027
+        , 155173593113
+        , 155711845678
+        , 155727247401
+        , 156250033475
+        , 156265369918
+        , 156788418139
+        , 156803754837
+        , 156818239312
+        , 157326868596
+        , 157342336366
+        , 157357410664
+        , 157865384845
+        , 157880721542
+        , 157895992448
+        , 157910411387
+        , 158403901095
+        , 158419368864
+        , 158434705305
+        , 158449583252
+        , 158462494862
+        , 158942417344
+        , 158957885113
+        , 158973025458
+        , 158987968683
+        , 159002125478
+        , 159480999386
+        , 159496336338
+        , 159511280074
+        , 159526092483
+        , 159540445117
+        , 163763462171
+        , 164301714735
+        , 164316919852
+        , 164839902533
+        , 164855042370
+        , 165378287197
+        , 165393492825
+        , 165406928726
+        , 165916737654
+        , 165932074354
+        , 165946886510
+        , 166455253903
+        , 166470459530
+        , 166485534087
+        , 166499428483
+        , 166993770153
+        , 167009106852
+        , 167024312224
+        , 167038862492
+        , 167532286403
+        , 167547623102
+        , 167562632377
+        , 167577444533
+        , 167590749361
+        , 168070802910
+        , 168086008792
+        , 168100821458
+        , 168115437261
+        , 168129265609
+        , 172353331228
+        , 172891583792
+        , 172906461487
+        , 173429771591
+        , 173444649285
+        , 173968156255
+        , 173983230813
+        , 174506606712
+        , 174521812342
+        , 174536493428
+        , 175045122962
+        , 175060197519
+        , 175075141005
+        , 175087790475
+        , 175583639212
+        , 175598910377
+        , 175613919398
+        , 175628141732
+        , 176122155462
+        , 176137426882
+        , 176152304832
+        , 176166854845
+        , 176178914491
+        , 176660671968
+        , 176675812317
+        , 176690493913
+        , 176704782038
+        , 176717823956
+        , 180943200286
+        , 181481452850
+        , 181495937075
+        , 182019640649
+        , 182034321738
+        , 182558025313
+        , 182572903266
+        , 183096475770
+        , 183111615866
+        , 183126100346
+        , 183634992020
+        , 183650001043
+        , 183664813459
+        , 184173508269
+        , 184188713901
+        , 184203657132
+        , 184217420972
+        , 184712024520
+        , 184727164870
+        , 184742108102
+        , 184756330693
+        , 185250606563
+        , 185265615841
+        , 185280166368
+        , 185294192351
+        , 185305399263
+        , 189533003808
+        , 190071321908
+        , 190609509707
+        , 190623863119
+        , 191147894372
+        , 191162706791
+        , 191686410365
+        , 191701419392
+        , 191715510658
+        , 192224861079
+        , 192239870105
+        , 192254289051
+        , 192763377328
+        , 192778517426
+        , 192793395124
+        , 192806503606
+        , 193301959115
+        , 193317033676
+        , 193331846093
+        , 193345609936
+        , 193840541157
+        , 193855419366
+        , 193869904360
+        , 193883471593
+        , 198122872866
+        , 198661256502
+        , 199199378765
+        , 199213535571
+        , 199737763430
+        , 199752575595
+        , 200276279424
+        , 200291353732
+        , 200304986505
+        , 200814795673
+        , 200829739166
+        , 200844092579
+        , 201353377203
+        , 201368386231
+        , 201383198651
+        , 201395979200
+        , 201891958990
+        , 201906968273
+        , 201921518550
+        , 201935151066
+        , 202430475497
+        , 202445353709
+        , 202459642097
+        , 202472685046
+        , 206712741924
+        , 207251125560
+        , 207789313104
+        , 207803469912
+        , 208327763560
+        , 208342510192
+        , 208866279554
+        , 208881288329
+        , 208894855313
+        , 209404795547
+        , 209419804579
+        , 209433961386
+        , 209943377334
+        , 209958386364
+        , 209973132995
+        , 209985585866
+        , 210481959120
+        , 210496902614
+        , 210511518429
+        , 210524888804
+        , 211020541163
+        , 211035288306
+        , 211049510905
+        , 215302676517
+        , 215841059897
+        , 216379247698
+        , 216393470044
+        , 216917697898
+        , 216932575604
+        , 217456279427
+        , 217471353741
+        , 217485182870
+        , 217994795677
+        , 218009935526
+        , 218024157872
+        , 218533377207
+        , 218548451776
+        , 218563263945
+        , 218576240851
+        , 219072024530
+        , 219086968027
+        , 219101583844
+        , 219115019758
+        , 219610606573
+        , 219625353720
+        , 223892610855
+        , 224431060027
+        , 224969247827
+        , 224983797599
+        , 225507763564
+        , 225522837623
+        , 226046345093
+        , 226061550224
+        , 226075968924
+        , 226584926623
+        , 226600197545
+        , 226614812854
+        , 227123508153
+        , 227138713540
+        , 227153591247
+        , 227167485659
+        , 227662155475
+        , 227677230047
+        , 227692042219
+        , 227705674745
+        , 228200737519
+        , 228215549949
+        , 232482676520
+        , 233021060156
+        , 233035806280
+        , 233559247701
+        , 233574321762
+        , 234097828973
+        , 234113230714
+        , 234127649158
+        , 234636410502
+        , 234651877779
+        , 234666820511
+        , 235174992032
+        , 235190524844
+        , 235205533369
+        , 235219624134
+        , 235713639354
+        , 235728975558
+        , 235744180691
+        , 235758664929
+        , 236252286420
+        , 236267557345
+        , 236282566127
+        , 236296657151
+        , 236790933999
+        , 236805877503
+        , 241072807466
+        , 241611125566
+        , 241626461514
+        , 242149378902
+        , 242164845668
+        , 242687959918
+        , 242703558011
+        , 242718762888
+        , 243226541447
+        , 243242205076
+        , 243257606561
+        , 243271959471
+        , 243765122976
+        , 243780852397
+        , 243796253884
+        , 243811196617
+        , 244303770298
+        , 244319433928
+        , 244334901206
+        , 244349909476
+        , 244363672564
+        , 244842417364
+        , 244857950180
+        , 244873286387
+        , 244887967231
+        , 245380999408
+        , 245396204799
+        , 249662938666
+        , 250201256511
+        , 250217050955
+        , 250739509847
+        , 250755369829
+        , 250770639730
+        , 251278090863
+        , 251294016636
+        , 251309745289
+        , 251324556695
+        , 251816672392
+        , 251832663701
+        , 251848392611
+        , 251863859377
+        , 251878212031
+        , 252355253921
+        , 252371310766
+        , 252387039677
+        , 252402703052
+        , 252417776602
+        , 252893901243
+        , 252909826761
+        , 252925687000
+        , 252941219303
+        , 252956293112
+        , 253432548309
+        , 253448408549
+        , 253464072181
+        , 253971195888
+        , 258253135147
+        , 258269191478
+        , 258791387455
+        , 258807575116
+        , 258823238233
+        , 259329706328
+        , 259345893734
+        , 259361753459
+        , 259377154431
+        , 259868287343
+        , 259884475005
+        , 259900531338
+        , 259916259992
+        , 259931529893
+        , 260406868872
+        , 260423056534
+        , 260439178404
+        , 260455103666
+        , 260470701504
+        , 260485578190
+        , 260945384865
+        , 260961638063
+        , 260977759934
+        , 260993750989
+        , 261009479643
+        , 261024684267
+        , 261038250235
+        , 261484032187
+        , 261500219849
+        , 261516276184
+        , 261532267240
+        , 261547930361
+        , 262022679509
+        , 262038801637
+        , 262054726903
+        , 262561326832
+        , 266843396907
+        , 266859977270
+        , 266876622657
+        , 266893464395
+        , 266910371412
+        , 266927342940
+        , 267381583936
+        , 267398164300
+        , 267414744408
+        , 267431324516
+        , 267447969904
+        , 267464811642
+        , 267481652868
+        , 267498624653
+        , 267515594903
+        , 267919968088
+        , 267936482918
+        , 267952997747
+        , 267969512319
+        , 267986026891
+        , 268002606743
+        , 268019317411
+        , 268036093359
+        , 268052934585
+        , 268069841346
+        , 268086812621
+        , 268103782103
+        , 268458418288
+        , 268474998653
+        , 268491513482
+        , 268508028311
+        , 268524411812
+        , 268540861105
+        , 268557375421
+        , 268573889738
+        , 268590534871
+        , 268607245029
+        , 268624086766
+        , 268640927738
+        , 268657833983
+        , 268996999816
+        , 269013514901
+        , 269030029732
+        , 269046544305
+        , 269062993598
+        , 269079377356
+        , 269095695322
+        , 269112013288
+        , 269128396279
+        , 269144845055
+        , 269535581345
+        , 269552096431
+        , 269568611262
+        , 269585060555
+        , 269601509849
+        , 269617827817
+        , 269634146041
+        , 270074163131
+        , 270090677961
+        , 270107127513
+        , 270123576808
+        , 270139960313
+        , 270612810453
+        , 270629259749
+        , 270645643766
+        , 271151457776
+        , 275433593387
+        , 275450500917
+        , 275467408446
+        , 275484315462
+        , 275501352527
+        , 275971780415
+        , 275988622667
+        , 276005530197
+        , 276022437472
+        , 276039344490
+        , 276056316787
+        , 276073353852
+        , 276510164568
+        , 276526941285
+        , 276543848816
+        , 276560690811
+        , 276577598087
+        , 276594505361
+        , 276611477660
+        , 276628514982
+        , 276645486511
+        , 276662522040
+        , 277048614768
+        , 277065391484
+        , 277082233736
+        , 277099075732
+        , 277115852448
+        , 277132759724
+        , 277149601463
+        , 277166574017
+        , 277183546316
+        , 277200583896
+        , 277217555680
+        , 277234592490
+        , 277251626996
+        , 277587130760
+        , 277603907732
+        , 277620749730
+        , 277637526447
+        , 277654302906
+        , 277671144903
+        , 277687986900
+        , 277704828640
+        , 277721735915
+        , 277738642935
+        , 277755680511
+        , 278125712545
+        , 278142489262
+        , 278159200444
+        , 278175977160
+        , 278192753877
+        , 278209530340
+        , 278226372338
+        , 278243213823
+        , 278664294074
+        , 278681005513
+        , 278697782231
+        , 278714493413
+        , 278731269877
+        , 278748046335
+        , 279202941396
+        , 279219652835
+        , 279236363764
+        , 279253074943
+        , 279741588719
+        , 279758234623
+        , 284023724330
+        , 284040762675
+        , 284057801018
+        , 284074838338
+        , 284561911358
+        , 284578884424
+        , 284595923025
+        , 284613026395
+        , 284630129764
+        , 284647232108
+        , 285100295511
+        , 285117334115
+        , 285134372461
+        , 285151410807
+        , 285168514177
+        , 285185552010
+        , 285202654867
+        , 285219756700
+        , 285236855973
+        , 285638745711
+        , 285655718778
+        , 285672757637
+        , 285689795983
+        , 285706834330
+        , 285723872420
+        , 285740975790
+        , 285758078903
+        , 285775181761
+        , 285792283595
+        , 285809319635
+        , 286177261959
+        , 286194235027
+        , 286211208095
+        , 286228246443
+        , 286245285045
+        , 286262323392
+        , 286279427018
+        , 286296464852
+        , 286313568222
+        , 286330671337
+        , 286347773939
+        , 286364875774
+        , 286382042367
+        , 286715777952
+        , 286732751020
+        , 286749724345
+        , 286766762693
+        , 286783735761
+        , 286800839644
+        , 286817877736
+        , 286835046900
+        , 286852084734
+        , 287254359738
+        , 287271332807
+        , 287288305875
+        , 287305278944
+        , 287322317294
+        , 287339355643
+        , 287793007059
+        , 287809914594
+        , 287826887664
+        , 287843860735
+        , 288331654383
+        , 288348561919
+        , 292613789737
+        , 292630893617
+        , 292647996984
+        , 292665099327
+        , 293151977021
+        , 293169146438
+        , 293186184781
+        , 293203418967
+        , 293220521823
+        , 293237688679
+        , 293690426454
+        , 293707595872
+        , 293724699753
+        , 293741868914
+        , 293759037563
+        , 293776205956
+        , 293793373580
+        , 293810538644
+        , 294228876909
+        , 294245980792
+        , 294263150209
+        , 294280254090
+        , 294297423252
+        , 294314592157
+        , 294331760806
+        , 294348928943
+        , 294366096568
+        , 294383262401
+        , 294767327365
+        , 294784497040
+        , 294801666459
+        , 294818835877
+        , 294835939503
+        , 294853108665
+        , 294870277570
+        , 294887446475
+        , 294904614868
+        , 294921783005
+        , 294938950119
+        , 294956181744
+        , 294973342201
+        , 295305908895
+        , 295323013034
+        , 295340182453
+        , 295357286591
+        , 295374455754
+        , 295391625172
+        , 295408794079
+        , 295425962985
+        , 295443131635
+        , 295460365566
+        , 295844490681
+        , 295861594820
+        , 295878698703
+        , 295895868379
+        , 295913037543
+        , 295930206706
+        , 295947441405
+        , 296383006930
+        , 296400176607
+        , 296417280492
+        , 296434515449
+        , 296451684607
+        , 296921654510
+        , 296938823933
+        , 301203855400
+        , 301221024559
+        , 301238127669
+        , 301742042428
+        , 301759277379
+        , 301776446538
+        , 301793680467
+        , 301810848346
+        , 302280557652
+        , 302297792348
+        , 302315027044
+        , 302332326765
+        , 302349495413
+        , 302366728573
+        , 302383959941
+        , 302819007851
+        , 302836242804
+        , 302853543036
+        , 302870777732
+        , 302888012172
+        , 302905246356
+        , 302922480028
+        , 302939778213
+        , 302957009581
+        , 303357458307
+        , 303374758796
+        , 303392124565
+        , 303409424798
+        , 303426659494
+        , 303443893678
+        , 303461193398
+        , 303478427326
+        , 303495660487
+        , 303512958671
+        , 303530254552
+        , 303896039837
+        , 303913340581
+        , 303930706351
+        , 303948006583
+        , 303965306816
+        , 303982606792
+        , 303999906513
+        , 304017206233
+        , 304034439906
+        , 304051803884
+        , 304069167093
+        , 304086463742
+        , 304434621622
+        , 304451987647
+        , 304469288136
+        , 304486653905
+        , 304504019419
+        , 304521319395
+        , 304538684653
+        , 304556049910
+        , 304573414655
+        , 304973137872
+        , 304990634969
+        , 305007935458
+        , 305025431789
+        , 305042863095
+        , 305060097279
+        , 305511850987
+        , 305529413366
+        , 305546647807
+        , 309793855271
+        , 309811089965
+        , 309828193075
+        , 310332108090
+        , 310349342785
+        , 310366577479
+        , 310383876686
+        , 310401109333
+        , 310870623057
+        , 310887988825
+        , 310905288800
+        , 310922653799
+        , 310939887470
+        , 310957250677
+        , 311409073257
+        , 311426504560
+        , 311443870327
+        , 311461170301
+        , 311478470020
+        , 311495769483
+        , 311513068177
+        , 311530365848
+        , 311947523969
+        , 311964955272
+        , 311982452111
+        , 311999882902
+        , 312017182877
+        , 312034548132
+        , 312051847338
+        , 312069211825
+        , 312086510008
+        , 312103871679
+        , 312486105499
+        , 312503537058
+        , 312521033641
+        , 312538399407
+        , 312555830454
+        , 312573195709
+        , 312590625988
+        , 312607990987
+        , 312625289938
+        , 312642718682
+        , 312660081121
+        , 312676916712
+        , 313024687284
+        , 313042184123
+        , 313059680962
+        , 313077177545
+        , 313094608593
+        , 313111974103
+        , 313129470175
+        , 313146703591
+        , 313163478254
+        , 313180252406
+        , 313197025535
+        , 313563203534
+        , 313580765909
+        , 313598328285
+        , 313615955685
+        , 313633255660
+        , 313650031092
+        , 313666806013
+        , 314101851113
+        , 314119609841
+        , 314136582137
+        , 318383920934
+        , 318401155371
+        , 318418323761
+        , 318922173496
+        , 318939473725
+        , 318956773698
+        , 318974137928
+        , 318991434573
+        , 319460688718
+        , 319478185300
+        , 319495550553
+        , 319512980830
+        , 319530345059
+        , 319547706985
+        , 319999138918
+        , 320016635755
+        , 320034132080
+        , 320051562869
+        , 320068927866
+        , 320086292351
+        , 320103656068
+        , 320121017481
+        , 320537589631
+        , 320555151748
+        , 320572713865
+        , 320590275726
+        , 320607640978
+        , 320625071255
+        , 320642501276
+        , 320659865249
+        , 320677227686
+        , 320694585259
+        , 321076171161
+        , 321093733533
+        , 321111295650
+        , 321128792230
+        , 321146288555
+        , 321163784624
+        , 321181280437
+        , 321198710202
+        , 321216139711
+        , 321233305540
+        , 321250077129
+        , 321614687410
+        , 321632315062
+        , 321650008251
+        , 321667570368
+        , 321685066692
+        , 321702628554
+        , 321719862222
+        , 321736636628
+        , 321753410522
+        , 321770183648
+        , 322153203660
+        , 322170962385
+        , 322188721109
+        , 322206414042
+        , 322223189471
+        , 322239964388
+        , 322256739306
+        , 322691916520
+        , 322709740780
+        , 322726516209
+        , 326973920804
+        , 326991220776
+        , 327008388909
+        , 327512239158
+        , 327529604665
+        , 327546904637
+        , 327564334146
+        , 328050688587
+        , 328068316238
+        , 328085812305
+        , 328103242581
+        , 328120671576
+        , 328589204579
+        , 328606766693
+        , 328624394088
+        , 328641890154
+        , 328659255149
+        , 328676749936
+        , 328694112883
+        , 329127655036
+        , 329145348222
+        , 329162975872
+        , 329180603010
+        , 329198099076
+        , 329215594631
+        , 329233089673
+        , 329250518412
+        , 329267944590
+        , 329666236566
+        , 329683864471
+        , 329701622937
+        , 329719185051
+        , 329736681372
+        , 329754242719
+        , 329771803809
+        , 329789298852
+        , 329806465446
+        , 329823236010
+        , 329840002220
+        , 330204752816
+        , 330222446257
+        , 330240270259
+        , 330257963188
+        , 330275525046
+        , 330293020856
+        , 330309795514
+        , 330326569661
+        , 330343343296
+        , 330743269323
+        , 330761093579
+        , 330778983117
+        , 330796348110
+        , 330813123536
+        , 330829897938
+        , 331281916646
+        , 331299675111
+        , 331316450536
+        , 335563920930
+        , 335581220646
+        , 335598519337
+        , 336102173748
+        , 336119604790
+        , 336136970041
+        , 336154399292
+        , 336640754249
+        , 336658381642
+        , 336675877963
+        , 336693438796
+        , 336710867534
+        , 337179204449
+        , 337196897633
+        , 337214525025
+        , 337232086625
+        , 337249516898
+        , 337266946147
+        , 337284439140
+        , 337717655162
+        , 337735413881
+        , 337753106809
+        , 337770733945
+        , 337788295545
+        , 337805856122
+        , 337823285883
+        , 337840779388
+        , 337858204029
+        , 338256171156
+        , 338273930131
+        , 338291754130
+        , 338309316242
+        , 338326943378
+        , 338344504722
+        , 338362065555
+        , 338379625619
+        , 338396398740
+        , 338413168790
+        , 338794752942
+        , 338812511917
+        , 338830335916
+        , 338848094380
+        , 338865721515
+        , 338882955179
+        , 338899729579
+        , 338916503468
+        , 339333269193
+        , 339351224519
+        , 339369114054
+        , 339386282438
+        , 339403057605
+        , 339419832261
+        , 339871916772
+        , 339889609698
+        , 339906384865
         ]
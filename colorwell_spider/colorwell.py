@@ -1,4 +1,4 @@
-import csv
+import argparse
 import os
 import re
 import sys
@@ -7,51 +7,16 @@ from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 
-from colour.notation import munsell as cnm
 import munsellkit as mkit
 
-hues = [
-    '2.5R',
-    '5.0R',
-    '7.5R',
-    '10.0R',
-    '2.5YR',
-    '5.0YR',
-    '7.5YR',
-    '10.0YR',
-    '2.5Y',
-    '5.0Y',
-    '7.5Y',
-    '10.0Y',
-    '2.5GY',
-    '5.0GY',
-    '7.5GY',
-    '10.0GY',
-    '2.5G',
-    '5.0G',
-    '7.5G',
-    '10.0G',
-    '2.5BG',
-    '5.0BG',
-    '7.5BG',
-    '10.0BG',
-    '2.5B',
-    '5.0B',
-    '7.5B',
-    '10.0B',
-    '2.5PB',
-    '5.0PB',
-    '7.5PB',
-    '10.0PB',
-    '2.5P',
-    '5.0P',
-    '7.5P',
-    '10.0P',
-    '2.5RP',
-    '5.0RP',
-    '7.5RP',
-    '10.0RP'
-]
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from columnar import FORMATS, catalog_writer, with_format
+from crawl_telemetry import CrawlTelemetry, timed_request
+from munsell_hues import N_PAGES, PAGE_STEP, hue_label
+from munsell_notation import parse_notation
+
+# colorwell.org hue pages, '2.5R' to '10.0RP'
+hues = [hue_label(page * PAGE_STEP, '{:.1f}') for page in range(1, N_PAGES + 1)]
 
 example_swatch = """
 <td data-id="112" class="N962189775837e69d2ae huePageSwatch">
@@ -128,34 +93,42 @@ COLUMNS = [
     'Pigments'
 ]
 
-def crawl(driver, filename):
-    with open(filename, 'a') as f:
-        csv_writer = csv.writer(f)
-        csv_writer.writerow(COLUMNS)
+# Added to the columnar catalog schema
+EXTRA_FIELDS = [('pigments', 'string')]
+
+def crawl(driver, filename, telemetry=None):
+    '''Appends to a CSV file, or writes a .parquet or .feather file.'''
+    with catalog_writer(filename, COLUMNS, extra_fields=EXTRA_FIELDS, mode='a') as csv_writer:
         for i, hue in enumerate(hues):
             url = 'http://colorwell.org/munsell/{}'.format(hue)
-            scrape_url(url, i, hue, driver, csv_writer)
+            scrape_url(url, i, hue, driver, csv_writer, telemetry)
 
 
-def scrape_url(url, i, hue, driver, csv_writer):
+def scrape_url(url, i, hue, driver, csv_writer, telemetry=None):
     print('getting {}'.format(url))
-    driver.get(url)
-    links = driver.find_elements_by_xpath("//td[contains(@class, 'huePageSwatch')]//a")
+    with timed_request(telemetry, url) as request:
+        driver.get(url)
+        request.fetched(bytes=len(driver.page_source.encode('utf-8')))
+        links = driver.find_elements_by_xpath("//td[contains(@class, 'huePageSwatch')]//a")
     if len(links) == 0:
         print(hue, 'has no associated colors')
         # csv_writer.writerow([i, hue, 'None', 'None', 'None', 'None'])
     else:
       # print('got links {}'.format(links))
-      for link in links:
+      for n, link in enumerate(links):
           if link.is_displayed():
-              scrape_link(link, i, driver, csv_writer)
+              # Each swatch opens a modal: record it as a request of its own
+              with timed_request(telemetry, f'{url}#{n}') as request:
+                  scrape_link(link, i, driver, csv_writer, request)
 
 
-def scrape_link(link, i, driver, csv_writer):
+def scrape_link(link, i, driver, csv_writer, request=None):
     link.click()
     time.sleep(0.5)
     # print('clicked link')
     card = driver.find_element_by_xpath("//div[contains(@class, 'modal-card')]")
+    if request is not None:
+        request.fetched(bytes=len(card.get_attribute('outerHTML').encode('utf-8')))
     if card.is_displayed():
         # print('got card {}'.format(card))
         dismiss = card.find_element_by_xpath("//button[@aria-label='close']")
@@ -173,7 +146,7 @@ def scrape_link(link, i, driver, csv_writer):
                 pigments = cells[2]
                 # method = cells[3]
                 notation = cells[4]
-                spec = cnm.munsell_colour_to_munsell_specification(notation)
+                spec = parse_notation(notation)
                 cleaned_notation, spec, hue = mkit.normalized_color(spec)
                 hue_shade, value, chroma, hue_index = spec
                 row = [
@@ -199,5 +172,22 @@ def escape_text(text):
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scrape colorwell.org Munsell hue pages to a CSV')
+    parser.add_argument('--telemetry', help='JSONL file to append per-request telemetry to')
+    parser.add_argument('--metrics-port', type=int,
+                        help='serve Prometheus metrics on this local port')
+    parser.add_argument('--format', choices=FORMATS, default='csv',
+                        help='output file format (parquet and feather are typed, columnar files)')
+    args = parser.parse_args()
+
+    telemetry = None
+    if args.telemetry or args.metrics_port:
+        telemetry = CrawlTelemetry('colorwell', args.telemetry)
+        if args.metrics_port:
+            telemetry.serve(args.metrics_port)
     driver = setup_driver()
-    crawl(driver, 'colorwell.csv')
+    try:
+        crawl(driver, with_format('colorwell.csv', args.format), telemetry)
+    finally:
+        if telemetry is not None:
+            telemetry.close()
@@ -1,12 +1,24 @@
 from abc import ABC
+from concurrent.futures import ProcessPoolExecutor
 import csv
+import functools
 import itertools
 import math
 import operator
+import os
+import sys
 
+import numpy as np
 from colour.notation import munsell as cnm
 from PIL import Image, ImageDraw, ImageFont
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from columnar import read_columns
+from munsell_hues import PAGE_LABELS, PAGE_STEP, hue_difference, hue_specification, page_of
+from paint_catalog import PaintStore
+from paint_index import PaintIndex
+from text_stamps import draw_text, draw_text_ralign
+
 
 VALUE_2_ROWS = [
     19,
@@ -35,66 +47,28 @@ CHROMA_COLS = [
 
 N_COLS = len(CHROMA_COLS)
 
-COLORLAB_HUE_NAMES = [
-    'B',  # hue_index  1, ASTM 60
-    'BG', # hue_index  2, ASTM 50
-    'G',  # hue_index  3, ASTM 40
-    'GY', # hue_index  4, ASTM 30
-    'Y',  # hue_index  5, ASTM 20
-    'YR', # hue_index  6, ASTM 10
-    'R',  # hue_index  7, ASTM  0
-    'RP', # hue_index  8, ASTM 90
-    'P',  # hue_index  9, ASTM 80
-    'PB'  # hue_index 10, ASTM 70
-]
+# Page p is ASTM hue p * 2.5; page 0 is 10RP
+HUES = PAGE_LABELS
 
-HUES = [
-    '10RP', # 0
-    '2.5R',
-    '5R',
-    '7.5R',
-    '10R', # 4
-    '2.5YR',
-    '5YR',
-    '7.5YR',
-    '10YR', # 8
-    '2.5Y',
-    '5Y',
-    '7.5Y',
-    '10Y', # 12
-    '2.5GY',
-    '5GY',
-    '7.5GY',
-    '10GY', # 16
-    '2.5G',
-    '5G',
-    '7.5G',
-    '10G', # 20
-    '2.5BG',
-    '5BG',
-    '7.5BG',
-    '10BG', # 24
-    '2.5B',
-    '5B',
-    '7.5B',
-    '10B', # 28
-    '2.5PB',
-    '5PB',
-    '7.5PB',
-    '10PB', # 32
-    '2.5P',
-    '5P',
-    '7.5P',
-    '10P', # 36
-    '2.5RP',
-    '5RP',
-    '7.5RP'
-]
+# Neutrals (NaN hue) go on their own page, printed first as page number 0,
+# with a single chroma 0 column.
+NEUTRAL_PAGE = -1
+NEUTRAL_HUE = 'N'
+NEUTRAL_CHROMAS = [0]
+
+# Page numbers 1 to 40 run from 2.5R to 10RP
+PAGE_NUMS = list(range(0, 41))
 
-def draw_text_ralign(draw, xy, text, font):
-    (w, h) = draw.textsize(text, font=font)
-    (x, y) = xy
-    draw.text((x - w, y), text, font=font, fill='#000000')
+def book_page(page_num):
+    return NEUTRAL_PAGE if page_num == 0 else page_num % 40
+
+def page_hue(page):
+    return NEUTRAL_HUE if page == NEUTRAL_PAGE else HUES[page]
+
+@functools.lru_cache(maxsize=None)
+def max_chroma(page, value):
+    shade, code = hue_specification(page * PAGE_STEP)
+    return cnm.maximum_chroma_from_renotation(float(shade), value, int(code))
 
 def value_label(value_2):
     value = value_2 / 2.
@@ -133,63 +107,75 @@ class MunsellPage:
     def __init__(self, source_name, page_num, hue, data):
         self.source_name = source_name
         self.page_num = page_num
-        self.astm_hue = (page_num % 40) * 2.5
+        self.page = book_page(page_num)
+        self.neutral = self.page == NEUTRAL_PAGE
+        self.chromas = NEUTRAL_CHROMAS if self.neutral else CHROMA_COLS
+        self.astm_hue = self.page * PAGE_STEP
         self.hue = hue
         self.data = data
         self.init_image()
 
+    # Static frames (value and chroma labels) shared by all pages,
+    # by chroma columns
+    frames = dict()
+
     def init_image(self):
-        self.img = Image.new(
-            'RGB', (self.image_w, self.image_h), color='white')
+        key = tuple(self.chromas)
+        if key not in MunsellPage.frames:
+            MunsellPage.frames[key] = self.build_frame()
+        self.img = MunsellPage.frames[key].copy()
         self.draw = ImageDraw.Draw(self.img)
 
-    def build_image(self):
-        x0 = self.patch_x0 + ((N_COLS - 1) * self.patch_w_stride) + self.patch_w
-        y0 = self.patch_y0 - (N_ROWS * self.patch_h_stride) + 10
-        draw_text_ralign(self.draw, (x0, y0), self.hue, self.large_font)
-        draw_text_ralign(self.draw, (x0, y0 + 40), f'p. {self.page_num}', self.small_font)
-        last_col = len(CHROMA_COLS) - 2
+    def build_frame(self):
+        img = Image.new(
+            'RGB', (self.image_w, self.image_h), color='white')
 
-        for x, chroma in enumerate(CHROMA_COLS):
+        for x, chroma in enumerate(self.chromas):
             label = chroma_label(chroma)
             x0 = self.patch_x0 + (x * self.patch_w_stride)
-            self.draw.text((x0, self.chroma_label_y0),
-                            label, font=self.small_font, fill='#000000', align='left')
+            draw_text(img, (x0, self.chroma_label_y0), label, self.small_font)
 
         for i, value_2 in enumerate(VALUE_2_ROWS):
-            value = value_2 / 2.
             y = N_ROWS - i - 1
             label = value_label(value_2)
             y0 = self.patch_y0 - self.patch_h - (y * self.patch_h_stride)
-            self.draw.text((self.value_label_x0, y0),
-                           label, font=self.small_font, fill='#000000', align='left')
+            draw_text(img, (self.value_label_x0, y0), label, self.small_font)
+        return img
 
-            for x, chroma in enumerate(CHROMA_COLS):
-                if i == 0 and x >= last_col:
+    def build_image(self):
+        x0 = self.patch_x0 + ((N_COLS - 1) * self.patch_w_stride) + self.patch_w
+        y0 = self.patch_y0 - (N_ROWS * self.patch_h_stride) + 10
+        draw_text_ralign(self.img, (x0, y0), self.hue, self.large_font)
+        if not self.neutral:
+            draw_text_ralign(self.img, (x0, y0 + 40), f'p. {self.page_num}', self.small_font)
+        last_col = len(CHROMA_COLS) - 2
+
+        for i, value_2 in enumerate(VALUE_2_ROWS):
+            value = value_2 / 2.
+            y = N_ROWS - i - 1
+
+            for x, chroma in enumerate(self.chromas):
+                if i == 0 and x >= last_col and not self.neutral:
                     continue
 
                 x0 = self.patch_x0 + (x * self.patch_w_stride)
                 y0 = self.patch_y0 - (y * self.patch_h_stride)
                 x1 = x0 + self.patch_w
                 y1 = y0 - self.patch_h
-                xy = [x0, y0, x1, y1]
+                xy = [x0, y1, x1, y0]
                 if chroma in self.data[value_2]:
                     self.draw.rectangle(xy, outline='black')
 
                     x1 = x0 + 6
                     y1 = y1 + 4
-                    colors = sorted(self.data[value_2][chroma], key=lambda row: color_distance(row, self.astm_hue, value, chroma))
+                    colors = self.data[value_2][chroma]
                     if len(colors) > 0:
                         for row in colors[:6]:
                             label = row['Identifier']
-                            self.draw.text((x1, y1),
-                                label, font=self.xsmall_font, fill='#000000', align='left')
+                            draw_text(self.img, (x1, y1), label, self.xsmall_font)
                             y1 = y1 + 14
                 else:
-                    munsell_color = f'{self.hue} {value}/{chroma}'
-                    spec = cnm.parse_munsell_colour(munsell_color)
-                    max_chroma = cnm.maximum_chroma_from_renotation(spec[0], spec[1], spec[3])
-                    if chroma <= max_chroma:
+                    if self.neutral or chroma <= max_chroma(self.page, value):
                         self.draw.rectangle(xy, outline='#666699')
                         # self.draw.line(xy, fill='#666666', width=1)
                         # self.draw.line([x0, y1, x1, y0], fill='#666666', width=1)
@@ -212,120 +198,289 @@ def rounded_chroma_1(chroma):
         return 2
     return int(round(chroma / 2) * 2)
 
-def make_book(args):
-    pages = dict()
-    with open('dunn_edwards.csv', 'rt') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row['Color Name']
-            value = float(row['Value'])
-            chroma = float(row['Chroma'])
-            astm_hue = float(row['ASTM Hue'])
-            astm_page = round(astm_hue / 2.5) % 40
-
-            row['Value'] = value
-            row['Chroma'] = chroma
-            row['ASTM Hue'] = astm_hue
-
-            if value > 8.:
-                value_2 = min(round(value * 2.), 19)
-            else:
-                value_2 = round(value) * 2
-
-            # value_2 is an int
-            if value_2 not in VALUE_2_ROWS:
-                if args.raise_exceptions:
-                    raise RuntimeError(f'{name}: value_2 {value_2} is out of range, value was {value}')
-                else:
-                    continue
+def value_2_rows(values):
+    """Vectorized value -> value_2: half steps above value 8, even below."""
+    values = np.asarray(values, dtype=float)
+    return np.where(values > 8., np.minimum(np.round(values * 2.), 19), np.round(values) * 2).astype(int)
 
-            chroma = rounded_chroma_1(chroma)
 
-            # chroma is now an int
-            if chroma not in CHROMA_COLS:
-                if args.raise_exceptions:
-                    raise RuntimeError(f'{name}: chroma {chroma} is out of range')
-                else:
-                    continue
+def rounded_chromas_1(chromas):
+    """Vectorized rounded_chroma_1."""
+    chromas = np.asarray(chromas, dtype=float)
+    return np.where(chromas < 0.5, 0,
+        np.where(chromas < 1.5, 1,
+            np.where(chromas <= 2, 2, np.round(chromas / 2) * 2))).astype(int)
+
+
+def lookup_table(keys, size):
+    """Array mapping each key to its position in `keys`, -1 elsewhere."""
+    table = np.full(size, -1, dtype=int)
+    table[keys] = np.arange(len(keys))
+    return table
+
+VALUE_2_INDEX = lookup_table(VALUE_2_ROWS, 64)
+CHROMA_INDEX = lookup_table(CHROMA_COLS, 256)
 
-            if astm_page not in pages:
-                page_rows = dict()
-                for v2 in VALUE_2_ROWS:
-                    page_rows[v2] = dict()
-                pages[astm_page] = page_rows
 
-            if chroma not in pages[astm_page][value_2]:
-                pages[astm_page][value_2][chroma] = []
+def _float(text):
+    """Parses a CSV number; empty fields (the hue of a neutral) are NaN."""
+    return float(text) if text and text.strip() else np.nan
 
-            pages[astm_page][value_2][chroma].append(row)
+
+def iter_catalog(path):
+    """Streams (brand, identifier, name, notation, astm_hue, value, chroma)
+    from a Munsell CSV written by dunn_edwards.py, colorwell.py or
+    pastel_data_to_csv.py. Neutrals have a NaN hue.
+    """
+    default_brand = os.path.splitext(os.path.basename(path))[0]
+    with open(path, 'rt', newline='') as f:
+        for row in csv.DictReader(f):
+            identifier = row.get('Identifier', '')
+            yield (
+                row.get('Brand Name') or default_brand,
+                identifier,
+                row.get('Color Name') or identifier,
+                row.get('Munsell Specification', ''),
+                _float(row['ASTM Hue']),
+                _float(row['Value']),
+                _float(row['Chroma'])
+            )
+
+
+def read_catalog(path, brands=None):
+    """Returns (brands, identifiers, names, notations) lists and
+    (astm_hues, values, chromas) arrays for a Munsell CSV, a Parquet or
+    Feather catalog (read as memory-mapped columns), or a paint_catalog.py
+    store directory (only the rows of `brands`, if given).
+    """
+    if os.path.isdir(path):
+        store = PaintStore(path)
+        rows = store.query(brands=brands)
+        identifiers = [i or '' for i in store.column('identifier')[rows]]
+        return (list(store.column('brand')[rows]), identifiers,
+                [n or i for n, i in zip(store.column('name')[rows], identifiers)],
+                [n or '' for n in store.column('notation')[rows]],
+                store.column('astm_hue')[rows].astype(np.float32),
+                store.column('value')[rows].astype(np.float32),
+                store.column('chroma')[rows].astype(np.float32))
+    if os.path.splitext(path)[1].lower() == '.csv':
+        rows = list(iter_catalog(path))
+        brands, identifiers, names, notations, hues, values, chromas = (
+            zip(*rows) if rows else [()] * 7)
+        return (list(brands), list(identifiers), list(names), list(notations),
+                np.array(hues, dtype=np.float32), np.array(values, dtype=np.float32),
+                np.array(chromas, dtype=np.float32))
+    default_brand = os.path.splitext(os.path.basename(path))[0]
+    columns = read_columns(path, ['brand', 'identifier', 'name', 'notation', 'astm_hue', 'value', 'chroma'])
+    identifiers = [i or '' for i in columns['identifier']]
+    return ([b or default_brand for b in columns['brand']], identifiers,
+            [n or i for n, i in zip(columns['name'], identifiers)],
+            [n or '' for n in columns['notation']],
+            columns['astm_hue'].astype(np.float32), columns['value'].astype(np.float32),
+            columns['chroma'].astype(np.float32))
+
+
+class PaintCatalog:
+    """Paints from any number of brand catalogs (Munsell CSV, Parquet or
+    Feather files, or paint_catalog.py stores), kept as NumPy columns.
+    Neutrals (NaN hue) have no hue to match, so they are indexed apart
+    from the chromatic paints and only fill the neutral page.
+    """
+
+    def __init__(self, paths, brands=None):
+        self.brands = []
+        brand_ids = dict()
+        hues, values, chromas, brand_col = [], [], [], []
+        self.identifiers, self.names, self.notations = [], [], []
+        for path in paths:
+            (row_brands, identifiers, names, notations,
+             path_hues, path_values, path_chromas) = read_catalog(path, brands)
+            keep = np.array([not brands or brand in brands for brand in row_brands], dtype=bool)
+            for brand in row_brands:
+                if brand not in brand_ids and (not brands or brand in brands):
+                    brand_ids[brand] = len(self.brands)
+                    self.brands.append(brand)
+            brand_col.append(np.array([brand_ids[b] for b, k in zip(row_brands, keep) if k], dtype=np.uint16))
+            hues.append(path_hues[keep])
+            values.append(path_values[keep])
+            chromas.append(path_chromas[keep])
+            self.identifiers += [v for v, k in zip(identifiers, keep) if k]
+            self.names += [v for v, k in zip(names, keep) if k]
+            self.notations += [v for v, k in zip(notations, keep) if k]
+        self.hues = np.concatenate(hues or [np.zeros(0, dtype=np.float32)])
+        self.values = np.concatenate(values or [np.zeros(0, dtype=np.float32)])
+        self.chromas = np.concatenate(chromas or [np.zeros(0, dtype=np.float32)])
+        self.brand_ids = np.concatenate(brand_col or [np.zeros(0, dtype=np.uint16)])
+        weights = (HUE_WEIGHT, VALUE_WEIGHT, CHROMA_WEIGHT)
+        chromatic = np.isfinite(self.hues)
+        self.chromatic_rows = np.flatnonzero(chromatic)
+        self.neutral_rows = np.flatnonzero(~chromatic)
+        self.index = PaintIndex(self.hues[chromatic], self.values[chromatic],
+                                self.chromas[chromatic], weights)
+        self.neutral_index = PaintIndex(np.zeros(len(self.neutral_rows)), self.values[~chromatic],
+                                        np.nan_to_num(self.chromas[~chromatic]), weights)
+
+    def __len__(self):
+        return len(self.hues)
+
+    def row(self, i):
+        return {
+            'Brand Name': self.brands[self.brand_ids[i]],
+            'Identifier': self.identifiers[i],
+            'Color Name': self.names[i],
+            'Munsell Specification': self.notations[i],
+            'ASTM Hue': float(self.hues[i]),
+            'Value': float(self.values[i]),
+            'Chroma': float(self.chromas[i])
+        }
+
+    def buckets(self):
+        """Returns (page, row, col) bucket indices of each paint, by
+        rounding, and a mask of paints that fall inside the book grid.
+        Neutrals (NaN hue) have page -1.
+        """
+        pages = page_of(self.hues)
+        value_2 = value_2_rows(self.values)
+        chroma = rounded_chromas_1(self.chromas)
+        rows = np.where((value_2 >= 0) & (value_2 < len(VALUE_2_INDEX)),
+                        VALUE_2_INDEX[np.clip(value_2, 0, len(VALUE_2_INDEX) - 1)], -1)
+        cols = np.where((chroma >= 0) & (chroma < len(CHROMA_INDEX)),
+                        CHROMA_INDEX[np.clip(chroma, 0, len(CHROMA_INDEX) - 1)], -1)
+        return (pages, rows, cols, (pages >= 0) & (rows >= 0) & (cols >= 0))
+
+    def check_ranges(self):
+        pages, rows, cols, _ = self.buckets()
+        for i in np.flatnonzero(rows < 0)[:1]:
+            raise RuntimeError(f'{self.names[i]}: value_2 {value_2_rows(self.values[i])} is out of range, value was {self.values[i]}')
+        for i in np.flatnonzero((cols < 0) & (pages >= 0))[:1]:
+            raise RuntimeError(f'{self.names[i]}: chroma {rounded_chromas_1(self.chromas[i])} is out of range')
+
+    def bucket_counts(self):
+        """Returns paint counts, shape (40, N_ROWS, N_COLS), and per-brand
+        bitmaps, shape (n_brands, 40, N_ROWS, N_COLS), of occupied buckets.
+        """
+        pages, rows, cols, valid = self.buckets()
+        counts = np.zeros((40, N_ROWS, N_COLS), dtype=np.int32)
+        np.add.at(counts, (pages[valid], rows[valid], cols[valid]), 1)
+        bitmaps = np.zeros((len(self.brands), 40, N_ROWS, N_COLS), dtype=bool)
+        bitmaps[self.brand_ids[valid], pages[valid], rows[valid], cols[valid]] = True
+        return (counts, bitmaps)
+
+    def pages(self, top):
+        """Collects up to `top` closest paints within MAX_DISTANCE for every
+        cell in the book, closest first. A paint close to a cell boundary
+        can appear in both neighboring cells. Neutrals are only listed on
+        the neutral page, pages[NEUTRAL_PAGE].
+        """
+        pages = dict()
+        for page in [NEUTRAL_PAGE] + list(range(40)):
+            pages[page] = dict()
+            for v2 in VALUE_2_ROWS:
+                pages[page][v2] = dict()
+
+        for index, rows, (cells, points) in [
+                (self.index, self.chromatic_rows, book_cells()),
+                (self.neutral_index, self.neutral_rows, neutral_cells())]:
+            nearest, _ = index.query(points, k=top, max_distance=MAX_DISTANCE)
+            for (page, value_2, chroma), row_indices in zip(cells, nearest):
+                colors = [self.row(rows[i]) for i in row_indices if i >= 0]
+                if len(colors) > 0:
+                    pages[page][value_2][chroma] = colors
+        return pages
+
+
+def book_cells():
+    '''Returns a list of (page, value_2, chroma) for every cell in the book,
+    and an array of shape (N, 3) with the (astm_hue, value, chroma) of each cell.
+    '''
+    cells = [(page, value_2, chroma)
+             for page in range(40)
+             for value_2 in VALUE_2_ROWS
+             for chroma in CHROMA_COLS]
+    points = np.array([(page * PAGE_STEP, value_2 / 2., chroma) for page, value_2, chroma in cells])
+    return (cells, points)
+
+
+def neutral_cells():
+    '''Returns the (page, value_2, chroma) cells of the neutral page, and
+    their (astm_hue, value, chroma) points for the neutral index, whose
+    hues are all 0.
+    '''
+    cells = [(NEUTRAL_PAGE, value_2, chroma)
+             for value_2 in VALUE_2_ROWS
+             for chroma in NEUTRAL_CHROMAS]
+    points = np.array([(0., value_2 / 2., chroma) for _, value_2, chroma in cells])
+    return (cells, points)
+
+
+def make_book(args):
+    catalog = PaintCatalog(args.catalog or ['dunn_edwards.csv'], args.brand)
+    print(f'Read {len(catalog)} paints from {len(catalog.brands)} brands')
+    if args.raise_exceptions:
+        catalog.check_ranges()
+    pages = catalog.pages(args.top)
 
     if args.book:
-        print_book(pages)
+        print_book(pages, args.prefix, args.jobs)
     else:
         print_text(pages)
 
     if args.verbose:
-        print_stats(pages)
+        print_stats(catalog)
+
+def render_page(source_name, page_num, data):
+    page_image = MunsellPage(source_name, page_num, page_hue(book_page(page_num)), data)
+    page_image.build_image()
+    page_image.print()
+    return page_num
 
-def print_book(pages):
-    stats = (N_ROWS * N_COLS) * [0]
-    for page_num in range(1, 41):
-        page = page_num % 40
-        page_image = MunsellPage('de', page_num, HUES[page], pages[page])
-        page_image.build_image()
-        page_image.print()
+def print_book(pages, source_name='de', jobs=None):
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        for page_num in executor.map(render_page, itertools.repeat(source_name),
+                                     PAGE_NUMS, [pages[book_page(n)] for n in PAGE_NUMS]):
+            print(f'Printed page {page_num}')
 
 
 def print_text(pages):
-    for page_num in range(1, 41):
-        page = page_num % 40
-        astm_hue = page * 2.5
-        hue = HUES[page]
+    for page_num in PAGE_NUMS:
+        page = book_page(page_num)
+        hue = page_hue(page)
         print(f'\nPage # {page_num} Hue {hue}')
         for i, value_2 in enumerate(VALUE_2_ROWS):
             value = value_2 / 2.
             row = pages[page][value_2]
             if len(row) > 0:
                 print(f' Value {value_label(value_2)}:')
-                for j, chroma in enumerate(CHROMA_COLS):
-                    bucket = i * N_COLS + j
+                for j, chroma in enumerate(NEUTRAL_CHROMAS if page == NEUTRAL_PAGE else CHROMA_COLS):
                     if chroma in pages[page][value_2]:
                         print(f'  Chroma {chroma_label(chroma)}:')
-                        colors = sorted(pages[page][value_2][chroma], key=lambda row: color_distance(row, astm_hue, value, chroma))
-                        for row in colors:
-                            dist = color_distance(row, astm_hue, value, chroma)
+                        for row in pages[page][value_2][chroma]:
                             print(f'''   {row['Identifier']} {row['Color Name']} {row['Munsell Specification']}''')
 
 
-def print_stats(pages):
+def print_stats(catalog):
     print('')
-    stats = (N_ROWS * N_COLS) * [0]
-    for page_num in range(1, 41):
-        page = page_num % 40
-        for i, value_2 in enumerate(VALUE_2_ROWS):
-            row = pages[page][value_2]
-            if len(row) > 0:
-                for j, chroma in enumerate(CHROMA_COLS):
-                    bucket = i * N_COLS + j
-                    if chroma in pages[page][value_2]:
-                        stats[bucket] = stats[bucket] + 1
-
+    counts, bitmaps = catalog.bucket_counts()
+    pages_filled = (counts > 0).sum(axis=0)
     for i, value_2 in enumerate(VALUE_2_ROWS):
         for j, chroma in enumerate(CHROMA_COLS):
-            bucket = i * N_COLS + j
-            print(f'{value_label(value_2)}/{chroma_label(chroma)}: {stats[bucket]} pages')
+            print(f'{value_label(value_2)}/{chroma_label(chroma)}: {pages_filled[i, j]} pages, {counts[:, i, j].sum()} paints')
+
+    print('')
+    total = bitmaps.any(axis=0).sum()
+    for brand, bitmap in zip(catalog.brands, bitmaps):
+        print(f'{brand}: {bitmap.sum()} of {total} occupied buckets')
 
 
 HUE_WEIGHT = 1.     # Max will be 1.25
 VALUE_WEIGHT = 10.  # Max will be 5.
 CHROMA_WEIGHT = 2.  # Max will be 2.
 
+# Paints farther than this from a cell are not listed in it.
+MAX_DISTANCE = HUE_WEIGHT * 1.25 + VALUE_WEIGHT * 0.5 + CHROMA_WEIGHT * 1.
+
 def color_distance(row, astm_hue, value, chroma):
-    dh = astm_hue - row['ASTM Hue']
-    if dh > 50.:
-        dh = dh - 100.
-    elif dh < -50.:
-        dh = dh + 100.
+    dh = hue_difference(astm_hue, row['ASTM Hue'])
     dv = value - row['Value']
     dc = chroma - row['Chroma']
     return HUE_WEIGHT * abs(dh) + VALUE_WEIGHT * abs(dv) + CHROMA_WEIGHT * abs(dc)
@@ -341,6 +496,16 @@ if __name__ == '__main__':
         '--book', help='print in book format', action='store_true')
     parser.add_argument(
         '--raise-exceptions', help='raise error if value or chroma out of range', action='store_true')
+    parser.add_argument(
+        '--top', help='number of closest paints listed in each cell', type=int, default=6)
+    parser.add_argument(
+        '--catalog', help='Munsell CSV, Parquet or Feather file, or paint_catalog.py store, to read, may be repeated (default: dunn_edwards.csv)', action='append', metavar='FILE')
+    parser.add_argument(
+        '--brand', help='only use paints from this brand, may be repeated', action='append')
+    parser.add_argument(
+        '--prefix', help='prefix for page file names', default='de')
+    parser.add_argument(
+        '--jobs', help='number of pages rendered in parallel', type=int, default=None)
     args = parser.parse_args()
 
     make_book(args)
@@ -1,17 +1,25 @@
-import csv
+import argparse
+import gzip
+import json
 import os
 import re
 import sys
 import time
+import urllib.request
+import xml.etree.ElementTree as ET
 from selenium import webdriver
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
 
-from colour.notation import munsell as cnm
 import munsellkit as mkit
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from columnar import FORMATS, catalog_writer, with_format
+from crawl_telemetry import CrawlTelemetry, timed_request
+from munsell_notation import parse_notation
+
 color_id_ranges = [
   ('DEA', 2, 2),
   ('DEA', 100, 195),
@@ -22,6 +30,35 @@ color_id_ranges = [
   ('DEC', 700, 799),
 ]
 
+SITE = 'https://www.dunnedwards.com'
+SITEMAP_URLS = [
+  f'{SITE}/sitemap_index.xml',
+  f'{SITE}/sitemap.xml',
+]
+LISTING_URLS = [
+  f'{SITE}/colors/browser/',
+]
+IDENTIFIER_RE = re.compile(r'/colors/browser/([a-z]+[0-9]+)/?(?:[?#].*)?$', re.IGNORECASE)
+LISTING_LINK_XPATH = "//a[contains(@href, '/colors/browser/')]"
+LISTING_NEXT_XPATH = "//link[@rel='next'] | //a[@rel='next'] | //a[contains(@class, 'next')]"
+LISTING_MORE_XPATH = "//button[contains(translate(., 'LOADMORE', 'loadmore'), 'load more')]"
+
+# Listing pages load more colors as they are scrolled (or a "load more"
+# button is clicked), and may be split into pages. A listing that still
+# grows after MAX_SCROLLS, or has more than MAX_LISTING_PAGES pages, is
+# treated as incomplete.
+MAX_SCROLLS = 50
+MAX_LISTING_PAGES = 200
+
+DISCOVERY_METHODS = ['sitemap', 'listing', 'probe']
+IDS_CACHE = 'dunn_edwards_ids.json'
+
+# Adaptive gap-skipping: after GAP_MISSES consecutive 404s the probe
+# stride doubles, up to MAX_STRIDE. A hit after a skip backfills the
+# numbers that were jumped over.
+GAP_MISSES = 4
+MAX_STRIDE = 8
+
 example_hero_footer = """
 <div class="color-detail-hero-footer">
   <a href="https://www.dunnedwards.com/colors/browser/de6356/">
@@ -210,23 +247,273 @@ def setup_driver():
     return driver
 
 
-def crawl(driver, filename):
-    with open(filename, 'at') as f:
-        csv_writer = csv.writer(f)
-        csv_writer.writerow(COLUMNS)
+def format_identifier(prefix, n):
+    return prefix + format(n, f'0{6 - len(prefix)}')
+
+
+def identifier_key(identifier):
+    m = re.match(r'([A-Z]+)([0-9]+)$', identifier)
+    return (m.group(1), int(m.group(2))) if m else (identifier, 0)
+
+
+def identifiers_in_urls(urls):
+    identifiers = set()
+    for url in urls:
+      m = IDENTIFIER_RE.search(url.strip())
+      if m:
+        identifiers.add(m.group(1).upper())
+    return identifiers
+
+
+def fetch(url):
+    request = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+    with urllib.request.urlopen(request, timeout=30) as response:
+      data = response.read()
+    if url.endswith('.gz'):
+      data = gzip.decompress(data)
+    return data
+
+
+def read_sitemap(url, identifiers, seen):
+    '''Adds the color identifiers in a sitemap (or, recursively, a sitemap
+    index) to identifiers. Returns False if the sitemap, or any sitemap
+    it lists, cannot be read.
+    '''
+    if url in seen:
+      return True
+    seen.add(url)
+    try:
+      root = ET.fromstring(fetch(url))
+    except Exception as e:
+      print(f'Sitemap {url} unavailable: {e}')
+      return False
+    print(f'Reading sitemap {url}')
+    locs = [(el.text or '').strip() for el in root.iter() if el.tag.rsplit('}', 1)[-1] == 'loc']
+    complete = True
+    if root.tag.rsplit('}', 1)[-1] == 'sitemapindex':
+      for loc in locs:
+        complete = read_sitemap(loc, identifiers, seen) and complete
+    else:
+      identifiers |= identifiers_in_urls(locs)
+    return complete
+
+
+def discover_from_sitemaps(sitemap_urls=SITEMAP_URLS):
+    '''Collects color identifiers from the first of sitemap_urls that lists
+    any, following sitemap indexes. Returns (identifiers, complete), where
+    complete is False if a sitemap could not be read.
+    '''
+    identifiers = set()
+    seen = set()
+    for url in sitemap_urls:
+      complete = read_sitemap(url, identifiers, seen)
+      if identifiers:
+        return (identifiers, complete)
+    return (identifiers, False)
+
+
+def scroll_listing(driver):
+    '''Scrolls to the bottom of the current listing page, clicking any
+    "load more" button, until no more color links load. Returns
+    (hrefs, complete), where complete is False if links were still
+    loading after MAX_SCROLLS scrolls.
+    '''
+    hrefs = []
+    for _ in range(MAX_SCROLLS):
+      hrefs = [link.get_attribute('href') or '' for link in driver.find_elements('xpath', LISTING_LINK_XPATH)]
+      driver.execute_script('window.scrollTo(0, document.body.scrollHeight);')
+      for button in driver.find_elements('xpath', LISTING_MORE_XPATH):
+        if button.is_displayed():
+          button.click()
+      time.sleep(1)
+      if len(driver.find_elements('xpath', LISTING_LINK_XPATH)) == len(hrefs):
+        return (hrefs, True)
+    return (hrefs, False)
+
 
-        for prefix, first, last in color_id_ranges:
-          precision = 6 - len(prefix)
-          fmt = f'0{precision}'
-          for n in range(first, last+1):
-            num_part = format(n, fmt)
-            identifier = prefix + num_part
-            scrape_detail(identifier, driver, csv_writer)
+def next_listing_page(driver):
+    '''The URL of the next page of the current listing, or None.'''
+    for link in driver.find_elements('xpath', LISTING_NEXT_XPATH):
+      href = link.get_attribute('href')
+      if href:
+        return href
+    return None
+
+
+def discover_from_listings(driver, listing_urls=LISTING_URLS):
+    '''Collects color identifiers from the links on the color browser
+    listing pages, scrolling each page and following its next-page links.
+    Returns (identifiers, complete), where complete is False if a page
+    could not be read or not all of a listing could be loaded.
+    '''
+    identifiers = set()
+    complete = True
+    for url in listing_urls:
+      seen = set()
+      while url and url not in seen:
+        if len(seen) >= MAX_LISTING_PAGES:
+          print(f'Listing has more than {MAX_LISTING_PAGES} pages, stopping at {url}')
+          complete = False
+          break
+        seen.add(url)
+        print(f'Reading listing {url}')
+        try:
+          driver.get(url)
+          driver.implicitly_wait(2) # seconds
+          hrefs, loaded = scroll_listing(driver)
+          identifiers |= identifiers_in_urls(hrefs)
+          if not loaded:
+            print(f'Listing {url} still loading after {MAX_SCROLLS} scrolls')
+            complete = False
+          url = next_listing_page(driver)
+        except Exception as e:
+          print(f'Listing {url} unavailable: {e}')
+          complete = False
+          break
+    return (identifiers, complete)
+
+
+def load_identifiers(cache_path):
+    try:
+      with open(cache_path, 'rt') as f:
+        cached = json.load(f)
+    except (OSError, ValueError):
+      return None
+    identifiers = cached.get('identifiers')
+    if not identifiers:
+      return None
+    print(f'Using {len(identifiers)} identifiers from {cache_path} ({cached.get("source")})')
+    return identifiers
+
+
+def save_identifiers(cache_path, identifiers, source):
+    with open(cache_path, 'wt') as f:
+      json.dump({
+        'source': source,
+        'discovered': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'identifiers': identifiers
+      }, f, indent=2)
+
+
+def discover(driver, cache_path=IDS_CACHE, methods=('sitemap', 'listing'), refresh=False):
+    '''Returns (identifiers, source, complete): the sorted list of color
+    identifiers from the cache file or the first discovery method that
+    finds any, the method, and whether the list is known to be whole.
+    Only whole lists are cached; crawl() completes a partial one by
+    probing. identifiers is None if no listing is available.
+    '''
+    if not refresh:
+      identifiers = load_identifiers(cache_path)
+      if identifiers:
+        return (identifiers, 'cache', True)
+    partial = None
+    for method in methods:
+      if method == 'sitemap':
+        found, complete = discover_from_sitemaps()
+      elif method == 'listing':
+        found, complete = discover_from_listings(driver)
+      else:
+        continue
+      if found and complete:
+        identifiers = sorted(found, key=identifier_key)
+        print(f'Discovered {len(identifiers)} identifiers from {method}')
+        save_identifiers(cache_path, identifiers, method)
+        return (identifiers, method, True)
+      if found and (partial is None or len(found) > len(partial[0])):
+        partial = (found, method)
+    if partial is not None:
+      found, method = partial
+      print(f'Discovered {len(found)} identifiers from an incomplete {method}, not caching them')
+      return (sorted(found, key=identifier_key), method, False)
+    return (None, None, False)
+
+
+def probe_ranges(driver, csv_writer, stats, telemetry=None, known=()):
+    '''Fallback when no listing is available, or when it is incomplete:
+    walks color_id_ranges, skipping ahead with a growing stride through
+    runs of missing pages, and returns the identifiers found. Identifiers
+    in known (already scraped) count as hits without being requested.
+    '''
+    known = set(known)
+
+    def hit(identifier):
+      if identifier in known:
+        return True
+      found = scrape_detail(identifier, driver, csv_writer, stats, telemetry)
+      time.sleep(0.2)
+      return found
+
+    found = []
+    for prefix, first, last in color_id_ranges:
+      n = first
+      misses = 0
+      stride = 1
+      last_probed = first - 1
+      while n <= last:
+        identifier = format_identifier(prefix, n)
+        if hit(identifier):
+          found.append(identifier)
+          if n - last_probed > 1:
+            # Backfill the numbers jumped over, nearest first.
+            for m in range(n - 1, last_probed, -1):
+              backfill = format_identifier(prefix, m)
+              if not hit(backfill):
+                break
+              found.append(backfill)
+          misses = 0
+          stride = 1
+        else:
+          misses += 1
+          if misses >= GAP_MISSES:
+            stride = min(stride * 2, MAX_STRIDE)
+        last_probed = n
+        n += stride
+    return sorted(found, key=identifier_key)
+
+
+def crawl(driver, filename, cache_path=IDS_CACHE, methods=DISCOVERY_METHODS, refresh=False,
+          telemetry=None):
+    '''Appends to a CSV file, or writes a .parquet or .feather file.'''
+    stats = {'requests': 0, 'found': 0, 'missing': 0}
+    start = time.time()
+    with catalog_writer(filename, COLUMNS, mode='at') as csv_writer:
+
+        identifiers, source, complete = discover(driver, cache_path, methods, refresh)
+        if identifiers is not None:
+          for identifier in identifiers:
+            scrape_detail(identifier, driver, csv_writer, stats, telemetry)
             time.sleep(0.2)
+        if not complete and 'probe' in methods:
+          if identifiers is None:
+            print('No color listing available, probing identifier ranges')
+            identifiers = probe_ranges(driver, csv_writer, stats, telemetry)
+            source = 'probe'
+          else:
+            print(f'Incomplete {source}, probing identifier ranges for the missing colors')
+            probed = probe_ranges(driver, csv_writer, stats, telemetry, known=identifiers)
+            identifiers = sorted(set(identifiers) | set(probed), key=identifier_key)
+            source = f'{source}+probe'
+          if identifiers:
+            save_identifiers(cache_path, identifiers, source)
+        elif identifiers is None:
+          print('No color listing available')
+
+    print(f"{stats['requests']} detail requests, {stats['found']} colors, "
+          f"{stats['missing']} not found, in {time.time() - start:.0f}s")
 
-def scrape_detail(identifier, driver, csv_writer):
+def scrape_detail(identifier, driver, csv_writer, stats=None, telemetry=None):
+    '''Scrapes one color page into csv_writer. Returns False if the page
+    does not exist.
+    '''
     url = f'https://www.dunnedwards.com/colors/browser/{identifier}'
+    with timed_request(telemetry, url) as request:
+      return scrape_page(url, identifier, driver, csv_writer, request, stats)
+
+def scrape_page(url, identifier, driver, csv_writer, request, stats=None):
     driver.get(url)
+    request.fetched(bytes=len(driver.page_source.encode('utf-8')))
+    if stats is not None:
+      stats['requests'] += 1
 
     print(f'Reading {url}')
     driver.implicitly_wait(1) # seconds
@@ -235,7 +522,10 @@ def scrape_detail(identifier, driver, csv_writer):
       is_404 = driver.find_element('xpath', "//*[@class='error404']")
       if is_404:
         print(f'Color page for {identifier} not found')
-        return
+        request.status = 404
+        if stats is not None:
+          stats['missing'] += 1
+        return False
     except:
       pass
 
@@ -280,7 +570,7 @@ def scrape_detail(identifier, driver, csv_writer):
       raise RuntimeError('failed to find Munsell p')
 
     notation = f'{raw_hue} {raw_value}/{raw_chroma}'
-    spec = cnm.munsell_colour_to_munsell_specification(notation)
+    spec = parse_notation(notation)
     hue_shade, value, chroma, hue_index = spec
     hue = mkit.hue_data(hue_index, hue_shade=hue_shade, decimals=2)
     row = [
@@ -297,11 +587,42 @@ def scrape_detail(identifier, driver, csv_writer):
     ]
     print(','.join([str(v) for v in row]))
     csv_writer.writerow(row)
+    if stats is not None:
+      stats['found'] += 1
+    return True
 
 def escape_text(text):
     return text.strip().replace('&#039;', '\'')
 
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Scrape Dunn-Edwards colors to a Munsell CSV')
+    parser.add_argument('--output', default='dunn_edwards.csv',
+                        help='CSV file to append to, or .parquet or .feather file to write')
+    parser.add_argument('--ids-cache', default=IDS_CACHE,
+                        help='JSON file caching the discovered color identifiers')
+    parser.add_argument('--refresh', action='store_true',
+                        help='rediscover identifiers instead of using the cache')
+    parser.add_argument('--discovery', action='append', choices=DISCOVERY_METHODS,
+                        help='discovery methods to try in order (default: sitemap, listing, probe)')
+    parser.add_argument('--format', choices=FORMATS,
+                        help='output file format, replacing the extension of --output '
+                        '(parquet and feather are typed, columnar files)')
+    parser.add_argument('--telemetry', help='JSONL file to append per-request telemetry to')
+    parser.add_argument('--metrics-port', type=int,
+                        help='serve Prometheus metrics on this local port')
+    args = parser.parse_args()
+
+    telemetry = None
+    if args.telemetry or args.metrics_port:
+      telemetry = CrawlTelemetry('dunn_edwards', args.telemetry)
+      if args.metrics_port:
+        telemetry.serve(args.metrics_port)
     driver = setup_driver()
-    crawl(driver, 'dunn_edwards.csv')
+    try:
+      output = with_format(args.output, args.format) if args.format else args.output
+      crawl(driver, output, args.ids_cache, args.discovery or DISCOVERY_METHODS, args.refresh,
+            telemetry)
+    finally:
+      if telemetry is not None:
+        telemetry.close()
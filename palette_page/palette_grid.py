@@ -3,26 +3,21 @@
 import csv
 import json
 import math
+import os
 import subprocess
+import sys
 import warnings
 from PIL import Image, ImageDraw, ImageFont
 
 import munsellkit as mkit
 
-HUES = [
-    ('10RP', 0),
-    ('5R', 5),
-    ('5YR', 15),
-    ('5Y', 25),
-    ('5GY', 35),
-    ('5G', 45),
-    ('5BG', 55),
-    ('5B', 65),
-    ('5PB', 75),
-    ('5P', 85),
-    ('5RP', 95),
-    ('10RP', 100)
-]
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from image_buffers import encode_image
+from munsell_hues import hue_label
+from paint_catalog import PaintStore
+
+# (label, ASTM hue) of the axis labels: the 5 hues, and 10RP at both ends
+HUES = [(hue_label(astm_hue), astm_hue) for astm_hue in [0] + list(range(5, 100, 10)) + [100]]
 
 class PaletteGrid:
     # Page parameters for PIL
@@ -52,8 +47,13 @@ class PaletteGrid:
     dot_r_outer = 40
     polar_value_max = 6.5
 
-    def __init__(self, polar=False):
+    def __init__(self, polar=False, store=None, query=None):
+        '''Plots my_colors.csv, or, given a paint_catalog.py store, the
+        paints matching `query` (keyword arguments of PaintStore.query).
+        '''
         self.polar = polar
+        self.store = store
+        self.query = query or dict()
         self.init_image()
 
     def init_image(self):
@@ -177,44 +177,56 @@ class PaletteGrid:
         xy = (x0, y0, x1, y1)
         self.draw.rectangle(xy, fill = self.get_fill(hue, value, chroma))
 
-    def draw_patches(self):
-        with open('my_colors.csv') as palette_file:
-            for row in csv.DictReader(palette_file):
-                astm_hue = row['ASTM Hue']
-                value = row['Value']
-                if astm_hue == '#N/A' or value == '':
+    def palette_rows(self):
+        '''Yields (label, label position, ASTM hue, hue, value, chroma).'''
+        if self.store is not None:
+            store = PaintStore(self.store)
+            for paint in store.rows(store.query(**self.query)):
+                if paint['astm_hue'] is None or paint['value'] is None:
                     continue
-                astm_hue = float(astm_hue)
-                hue = f'''{row['Hue Value']}{row['Hue Name']}'''
-                value = float(value)
-                chroma = float(row['Chroma']) 
-                if self.polar:
-                    self.draw_polar_patch(astm_hue, hue, value, chroma)
-                else:
-                    self.draw_cartesian_patch(astm_hue, hue, value, chroma)
-
+                yield (paint['identifier'], 'R', paint['astm_hue'], hue_label(paint['astm_hue']),
+                       paint['value'], paint['chroma'] or 0.)
+            return
         with open('my_colors.csv') as palette_file:
             for row in csv.DictReader(palette_file):
                 astm_hue = row['ASTM Hue']
                 value = row['Value']
                 if astm_hue == '#N/A' or value == '':
                     continue
-                astm_hue = float(astm_hue)
-                value = float(value)
-                if self.polar:
-                    self.draw_polar_label(row['Abbrev'], astm_hue, value)
-                else:
-                    self.draw_cartesian_label(row['Abbrev'], row['LPos'], astm_hue, value)
+                hue = f'''{row['Hue Value']}{row['Hue Name']}'''
+                yield (row['Abbrev'], row['LPos'], float(astm_hue), hue, float(value), float(row['Chroma']))
 
-    def print_page(self):
+    def draw_patches(self):
+        rows = list(self.palette_rows())
+        for label, lpos, astm_hue, hue, value, chroma in rows:
+            if self.polar:
+                self.draw_polar_patch(astm_hue, hue, value, chroma)
+            else:
+                self.draw_cartesian_patch(astm_hue, hue, value, chroma)
+
+        for label, lpos, astm_hue, hue, value, chroma in rows:
+            if self.polar:
+                self.draw_polar_label(label, astm_hue, value)
+            else:
+                self.draw_cartesian_label(label, lpos, astm_hue, value)
+
+    def render(self, format=None, **options):
+        '''Draws the grid and returns the image, or its bytes encoded as
+        `format` ('png', 'png8' or 'webp', see image_buffers.encode_image).
+        '''
+        self.init_image()
         if self.polar:
             self.draw_polar_grid()
-            self.draw_patches()
-            self.img.save('munsell_polar.png', dpi = (self.dpi, self.dpi))
         else:
             self.draw_grid()
-            self.draw_patches()
-            self.img.save('munsell_grid.png', dpi = (self.dpi, self.dpi))
+        self.draw_patches()
+        if format is None:
+            return self.img
+        return encode_image(self.img, format, dpi = (self.dpi, self.dpi), **options)
+
+    def print_page(self):
+        file_name = 'munsell_polar.png' if self.polar else 'munsell_grid.png'
+        self.render().save(file_name, dpi = (self.dpi, self.dpi))
 
 
 if __name__ == '__main__':
@@ -224,6 +236,22 @@ if __name__ == '__main__':
     parser.add_argument(
         '--polar', help='print a polar grid', action='store_true'
     )
+    parser.add_argument(
+        '--store', help='plot paints from a paint_catalog.py store instead of my_colors.csv'
+    )
+    parser.add_argument(
+        '--hue', nargs=2, metavar=('FROM', 'TO'), help='with --store, hue range, e.g. 7.5YR 2.5Y'
+    )
+    parser.add_argument(
+        '--value', nargs=2, type=float, metavar=('MIN', 'MAX'), help='with --store, value range'
+    )
+    parser.add_argument(
+        '--chroma', nargs=2, type=float, metavar=('MIN', 'MAX'), help='with --store, chroma range'
+    )
+    parser.add_argument(
+        '--brand', action='append', help='with --store, limit to a brand, may be repeated'
+    )
     args = parser.parse_args()
 
-    PaletteGrid(polar=args.polar).print_page()
+    query = dict(hue=args.hue, value=args.value, chroma=args.chroma, brands=args.brand)
+    PaletteGrid(polar=args.polar, store=args.store, query=query).print_page()
@@ -3,12 +3,17 @@
 import csv
 import json
 import math
+import os
 import subprocess
+import sys
 import warnings
 from PIL import Image, ImageDraw, ImageFont
 
 import munsellkit as mkit
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from image_buffers import encode_image
+
 PALETTE_COLS = [
     'Foxton Palette',
     'My Palette',
@@ -56,7 +61,7 @@ class PalettePage:
     def draw_patch(self, x0, y0, label, r, g, b):
         x1 = x0 + self.patch_w
         y1 = y0 - self.patch_h
-        xy = [x0, y0, x1, y1]
+        xy = [x0, y1, x1, y0]
         fill = f'#{r:02X}{g:02X}{b:02X}'
         self.draw.rectangle(xy, fill = fill)
         self.draw.text((x0, y0 + 5),
@@ -93,9 +98,18 @@ class PalettePage:
 
         print('stopped with count {}, x0 {}, y0 {}'.format(count, x0, y0))
 
-    def print_page(self):
+    def render(self, format=None, **options):
+        '''Draws the palette and returns the image, or its bytes encoded as
+        `format` ('png', 'png8' or 'webp', see image_buffers.encode_image).
+        '''
+        self.init_image()
         self.process_palette()
-        self.img.save('munsell_palette.png', dpi = (self.dpi, self.dpi))
+        if format is None:
+            return self.img
+        return encode_image(self.img, format, dpi = (self.dpi, self.dpi), **options)
+
+    def print_page(self):
+        self.render().save('munsell_palette.png', dpi = (self.dpi, self.dpi))
 
 
 if __name__ == '__main__':
@@ -1,5 +1,5 @@
-import csv
 import os
+import sys
 import colour
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -7,10 +7,21 @@ import munsellkit as mkit
 import munsellkit.minterpol as mint
 import munsellkit.lindbloom as mlin
 
-def sample_file(path, sample_size, max_search):
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'utilities'))
+from columnar import FORMATS, catalog_writer
+from munsell_cache import ALGORITHMS, get_converter
+from munsell_hues import astm_hue
+
+COLUMNS = ['i', 'j', 'x', 'y', 'munsell', 'hue_index', 'total_hue', 'value', 'chroma']
+
+# Sample grid position and pixel, added to the columnar catalog schema
+EXTRA_FIELDS = [('i', 'int32'), ('j', 'int32'), ('x', 'int32'), ('y', 'int32')]
+
+def sample_file(path, sample_size, max_search, cache_path=None, algorithm='minterpol', format='csv'):
+    converter = get_converter(algorithm, cache_path)
     with Image.open(path) as im:
         name, _ext = os.path.splitext(path)
-        with open(name + '.csv', 'w', newline='') as csvfile:
+        with catalog_writer(f'{name}.{format}', COLUMNS, format, EXTRA_FIELDS) as out:
             w = im.width
             h = im.height
             largest = max(w, h)
@@ -29,9 +40,7 @@ def sample_file(path, sample_size, max_search):
                 search_size = min(span_w // 3, max_search)
             print(f'{path}: {orientation}, h {h} w {w} span_h {span_h} span_w {span_w} search {search_size}')
 
-            out = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
-            out.writerow(['i', 'j', 'x', 'y', 'munsell', 'hue_index', 'total_hue', 'value', 'chroma'])
-
+            samples = []
             y = span_h // 2
             i = 1
             while y < h:
@@ -40,14 +49,28 @@ def sample_file(path, sample_size, max_search):
                 while x < w:
                     xp, yp, r, g, b, = find_most_saturated(im, x, y, search_size)
                     print(f'{i}, {j} ({xp}, {yp}): {r} {g} {b}')
-                    spec = mint.rgb_to_munsell_specification(r, g, b)
-                    munsell_color, spec, data = mkit.normalized_color(spec, rounding='renotation', out='all')
-                    out.writerow([i, j, xp, yp, munsell_color, spec[3]*10.0 + spec[0], data['total_hue'], spec[1], spec[2]])
+                    samples.append((i, j, xp, yp, r, g, b))
                     x += span_w
                     j += 1
                 y += span_h
                 i += 1
 
+            # Convert all the samples at once
+            specs = converter.rgb_to_munsell_specifications([sample[4:] for sample in samples])
+            for (i, j, xp, yp, r, g, b), spec in zip(samples, specs):
+                munsell_color, spec, data = mkit.normalized_color(spec, rounding='renotation', out='all')
+                if format == 'csv':
+                    out.writerow([i, j, xp, yp, munsell_color, spec[3]*10.0 + spec[0], data['total_hue'], spec[1], spec[2]])
+                else:
+                    out.writerow({
+                        'brand': os.path.basename(name), 'identifier': f'{i},{j}', 'notation': munsell_color,
+                        'hue_shade': spec[0], 'hue_code': spec[3], 'astm_hue': astm_hue(spec[0], spec[3]),
+                        'value': spec[1], 'chroma': spec[2], 'r': r, 'g': g, 'b': b,
+                        'i': i, 'j': j, 'x': xp, 'y': yp})
+    print(converter.format_stats())
+    # The converter is shared by the process: save its cache, but keep it open
+    converter.flush()
+
 def find_most_saturated(im, x, y, search_size):
     if search_size < 1:
         r, g, b = im.getpixel((x, y))
@@ -74,8 +97,15 @@ if __name__ == '__main__':
         '-n', '--num-samples', help='number of samples in longest dimension', type=int, default=12, metavar='SAMPLES')
     parser.add_argument(
         '-b', '--search-box', help='search box size for highest saturation', type=int, default=10, metavar='PIXELS')
+    parser.add_argument(
+        '--cache', help='SQLite file used to keep Munsell conversions between runs', metavar='DB')
+    parser.add_argument(
+        '--algorithm', help='RGB to Munsell conversion', choices=list(ALGORITHMS), default='minterpol')
+    parser.add_argument(
+        '--format', help='output file format (parquet and feather are typed, columnar files)',
+        choices=FORMATS, default='csv')
     parser.add_argument(
         'file', help='path to image file (.jpg, .png) to be sampled', metavar='FILE')
 
     args = parser.parse_args()
-    sample_file(args.file, args.num_samples, args.search_box)
+    sample_file(args.file, args.num_samples, args.search_box, args.cache, args.algorithm, args.format)
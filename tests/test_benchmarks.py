@@ -0,0 +1,262 @@
+'''Throughput, latency and accuracy benchmarks for the Munsell converters.
+
+Run with pytest-benchmark:
+
+    pytest tests/test_benchmarks.py --benchmark-only
+
+They are skipped by a plain `pytest` run, unless MUNSELL_BENCHMARKS=1
+is set.
+
+Input sizes default to 1 and 1000 colors; set MUNSELL_BENCHMARK_SIZES
+to include larger runs, e.g. MUNSELL_BENCHMARK_SIZES=1,1000,100000.
+Batches of 1000 or more colors are also timed across a process pool.
+
+The inputs are the colors of the real Munsell renotation data that lie
+inside the sRGB gamut, given to each converter as 8-bit sRGB, CIECAM02
+JCh, xyY or notations (repeated to fill the size). Accuracy is reported
+against the renotation data itself: CIEDE2000 against the renotation
+xyY, and the mean hue, value and chroma errors against the renotation
+specification, in each benchmark's extra_info and printed with -s.
+The per-color converters of munsellkit are benchmarked next to the
+batch converters (munsell_inversion, jch_batch and uplab), which take
+the whole array at once.
+'''
+
+import functools
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+import pytest
+import numpy as np
+
+pytest.importorskip('pytest_benchmark')
+
+import colour
+from colour.notation import munsell as cnm
+from colour.notation.datasets.munsell import MUNSELL_COLOURS_REAL
+import munsellkit as mkit
+import munsellkit.minterpol as mint
+import munsellkit.lindbloom as mlin
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from jch_batch import jch_to_munsell_specifications
+from munsell_hues import astm_hue, hue_difference
+from munsell_inversion import invert, result_specifications, rgb_to_munsell_specifications
+from uplab import rgb_to_uplab, uplab_to_specifications
+
+
+@pytest.fixture(autouse=True)
+def benchmarks_enabled(request):
+    '''Skips the benchmarks unless they were asked for.'''
+    if not (request.config.getoption('benchmark_only', False) or os.environ.get('MUNSELL_BENCHMARKS')):
+        pytest.skip('benchmarks run with --benchmark-only or MUNSELL_BENCHMARKS=1')
+
+
+SIZES = [int(n) for n in os.environ.get('MUNSELL_BENCHMARK_SIZES', '1,1000').split(',')]
+
+ILLUMINANT_C = colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['C']
+ILLUMINANT_D65 = colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+
+# Default CIECAM02 viewing conditions
+XYZ_W = colour.xy_to_XYZ(ILLUMINANT_D65) * 100
+L_A = 64 / np.pi * 0.2
+Y_B = 20
+
+
+def srgb_to_lab(rgb):
+    '''8-bit sRGB, shape (N, 3) -> CIE Lab (D65)'''
+    XYZ = colour.sRGB_to_XYZ(np.asarray(rgb, dtype=float) / 255.)
+    return colour.XYZ_to_Lab(XYZ, ILLUMINANT_D65)
+
+
+def C_to_D65(XYZ):
+    return colour.chromatic_adaptation(
+        XYZ, colour.xy_to_XYZ(ILLUMINANT_C), colour.xy_to_XYZ(ILLUMINANT_D65), method='Von Kries',
+        transform='Bradford')
+
+
+def xyY_to_lab(xyY):
+    '''xyY (illuminant C, Y from 0 to 1), shape (N, 3) -> CIE Lab (D65)'''
+    return colour.XYZ_to_Lab(C_to_D65(colour.xyY_to_XYZ(xyY)), ILLUMINANT_D65)
+
+
+def spec_to_xyY(spec):
+    try:
+        return cnm.munsell_specification_to_xyY(spec)
+    except (AssertionError, ValueError):
+        return np.full(3, np.nan)
+
+
+def specs_to_lab(specs):
+    '''Munsell specifications, shape (N, 4) -> CIE Lab (D65). Results
+    colour-science cannot convert (values outside 1 to 9, failed
+    conversions) give NaN and are left out of the accuracy.
+    '''
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        xyY = np.array([spec_to_xyY(spec) for spec in np.asarray(specs, dtype=float).reshape(-1, 4)])
+    return xyY_to_lab(xyY.reshape(-1, 3))
+
+
+def delta_E(lab1, lab2):
+    dE = colour.delta_E(lab1, lab2, method='CIE 2000')
+    dE = dE[np.isfinite(dE)]
+    return {
+        'n': int(dE.size),
+        'mean': float(np.mean(dE)) if dE.size else np.nan,
+        'p95': float(np.percentile(dE, 95)) if dE.size else np.nan,
+        'max': float(np.max(dE)) if dE.size else np.nan
+    }
+
+
+def spec_error(specs, reference):
+    '''Mean absolute ASTM hue, value and chroma errors of chromatic
+    results against the reference specifications.
+    '''
+    dh = hue_difference(astm_hue(specs[:, 0], specs[:, 3]), astm_hue(reference[:, 0], reference[:, 3]))
+    errors = np.abs(np.stack([dh, specs[:, 1] - reference[:, 1], specs[:, 2] - reference[:, 2]], axis=-1))
+    errors = errors[np.isfinite(errors).all(axis=1)]
+    mean = errors.mean(axis=0) if len(errors) else np.full(3, np.nan)
+    return {'n': len(errors), 'hue': float(mean[0]), 'value': float(mean[1]), 'chroma': float(mean[2])}
+
+
+def xyY_to_jch(xyY):
+    XYZ = C_to_D65(colour.xyY_to_XYZ(xyY)) * 100
+    cam = colour.XYZ_to_CIECAM02(XYZ, XYZ_W, L_A, Y_B)
+    return np.stack([cam.J, cam.C, cam.h], axis=-1)
+
+
+@functools.lru_cache(maxsize=None)
+def renotation_reference():
+    '''The real renotation colors inside the sRGB gamut, as a dict of
+    their notations, specifications and Lab, and the converter inputs
+    in each space: 'rgb' (8-bit sRGB), 'jch', 'xyY' (Y from 0 to 1)
+    and 'notation'.
+    '''
+    notations = np.array([f'{h} {v:g}/{c:g}' for (h, v, c), _ in MUNSELL_COLOURS_REAL])
+    xyY = np.array([xyY for _, xyY in MUNSELL_COLOURS_REAL], dtype=float) / [1., 1., 100.]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        srgb = colour.XYZ_to_sRGB(colour.xyY_to_XYZ(xyY), ILLUMINANT_C, chromatic_adaptation_transform='Bradford')
+        inside = ((srgb >= 0) & (srgb <= 1)).all(axis=1)
+        specs = np.array([cnm.munsell_colour_to_munsell_specification(s) for s in notations[inside]])
+    xyY = xyY[inside]
+    return {
+        'notation': list(notations[inside]),
+        'specs': specs,
+        'lab': xyY_to_lab(xyY),
+        'rgb': np.round(srgb[inside] * 255.),
+        'jch': xyY_to_jch(xyY),
+        'xyY': xyY
+    }
+
+
+def renotation_sample(n):
+    '''Indices of n renotation reference colors, repeating them as needed.'''
+    return np.arange(n) % len(renotation_reference()['specs'])
+
+
+# Per-color converters: name -> (input space, converter). Each takes one
+# input and returns a Munsell specification, except
+# 'mkit.munsell_color_to_rgb', which returns sRGB in 0..1.
+
+def uplab_to_specification(rgb):
+    '''RGB -> uplab -> specification.'''
+    lab = mlin.rgb_to_uplab(rgb[0], rgb[1], rgb[2])
+    return mlin.uplab_to_munsell_specification(lab)
+
+
+CONVERTERS = {
+    'mlin.rgb_to_munsell_specification': (
+        'rgb', lambda rgb: mlin.rgb_to_munsell_specification(rgb[0], rgb[1], rgb[2])),
+    'mint.rgb_to_munsell_specification': (
+        'rgb', lambda rgb: mint.rgb_to_munsell_specification(rgb[0], rgb[1], rgb[2])),
+    'mint.jch_to_munsell_specification': ('jch', mint.jch_to_munsell_specification),
+    'mkit.munsell_color_to_rgb': ('notation', mkit.munsell_color_to_rgb),
+    'mlin.uplab_to_munsell_specification': ('rgb', uplab_to_specification)
+}
+
+# Batch converters: name -> (input space, converter), taking an (N, 3)
+# array and returning (N, 4) specifications.
+BATCH_CONVERTERS = {
+    'munsell_inversion.invert': ('xyY', lambda xyY: result_specifications(invert(xyY))),
+    'munsell_inversion.rgb_to_munsell_specifications': (
+        'rgb', lambda rgbs: rgb_to_munsell_specifications(rgbs)[0]),
+    'jch_batch.jch_to_munsell_specifications': ('jch', lambda jch: jch_to_munsell_specifications(jch)[0]),
+    'uplab.uplab_to_specifications': ('rgb', lambda rgbs: uplab_to_specifications(rgb_to_uplab(rgbs)))
+}
+
+
+def make_inputs(name, n):
+    '''Returns the inputs of a converter for n renotation reference colors:
+    a list for the per-color converters, an array for the batch ones.
+    '''
+    space = (CONVERTERS.get(name) or BATCH_CONVERTERS[name])[0]
+    inputs = renotation_reference()[space]
+    if name in BATCH_CONVERTERS:
+        return inputs[renotation_sample(n)]
+    return [inputs[i] for i in renotation_sample(n)]
+
+
+def convert_all(name, inputs):
+    if name in BATCH_CONVERTERS:
+        return np.asarray(BATCH_CONVERTERS[name][1](inputs), dtype=float).reshape(-1, 4)
+    convert = CONVERTERS[name][1]
+    results = []
+    for x in inputs:
+        try:
+            results.append(np.asarray(convert(x), dtype=float))
+        except Exception:
+            results.append(np.full(3 if name == 'mkit.munsell_color_to_rgb' else 4, np.nan))
+    return np.array(results)
+
+
+def convert_parallel(name, inputs):
+    jobs = os.cpu_count() or 1
+    chunk = (len(inputs) + jobs - 1) // jobs
+    chunks = [inputs[i:i + chunk] for i in range(0, len(inputs), chunk)]
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        return np.concatenate(list(executor.map(convert_all, [name] * len(chunks), chunks)))
+
+
+def report(benchmark, name, n, results):
+    reference = renotation_reference()
+    sample = renotation_sample(n)
+    if name == 'mkit.munsell_color_to_rgb':
+        lab = srgb_to_lab(np.clip(results, 0, 1) * 255)
+    else:
+        lab = specs_to_lab(results)
+        benchmark.extra_info['spec_error'] = spec_error(results, reference['specs'][sample])
+    accuracy = delta_E(lab, reference['lab'][sample])
+    benchmark.extra_info['colors'] = n
+    benchmark.extra_info['delta_E_2000'] = accuracy
+    if benchmark.stats is not None:
+        mean_time = benchmark.stats.stats.mean
+        benchmark.extra_info['colors_per_second'] = n / mean_time
+        benchmark.extra_info['latency_per_color'] = mean_time / n
+    line = f'{name} n={n}: dE2000 mean {accuracy["mean"]:.3f} p95 {accuracy["p95"]:.3f} max {accuracy["max"]:.3f}'
+    if 'spec_error' in benchmark.extra_info:
+        error = benchmark.extra_info['spec_error']
+        line += f'; mean error hue {error["hue"]:.3f} value {error["value"]:.3f} chroma {error["chroma"]:.3f}'
+    print(line)
+
+
+ALL_CONVERTERS = list(CONVERTERS.keys()) + list(BATCH_CONVERTERS.keys())
+
+
+@pytest.mark.parametrize('n', SIZES)
+@pytest.mark.parametrize('name', ALL_CONVERTERS)
+def test_benchmark_converter(benchmark, name, n):
+    inputs = make_inputs(name, n)
+    rounds = 1 if n >= 1000 else 20
+    results = benchmark.pedantic(convert_all, args=(name, inputs), rounds=rounds, iterations=1)
+    report(benchmark, name, n, results)
+
+
+@pytest.mark.parametrize('n', [n for n in SIZES if n >= 1000])
+@pytest.mark.parametrize('name', ALL_CONVERTERS)
+def test_benchmark_converter_parallel(benchmark, name, n):
+    inputs = make_inputs(name, n)
+    results = benchmark.pedantic(convert_parallel, args=(name, inputs), rounds=1, iterations=1)
+    report(benchmark, name, n, results)
@@ -0,0 +1,37 @@
+import os
+import sys
+import pytest
+import numpy as np
+import pyarrow as pa
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from columnar import CatalogWriter, catalog_writer, read_columns, read_table
+
+
+COLUMNS = ['Brand Name', 'Identifier', 'Munsell Specification', 'Total Hue', 'Hue Prefix',
+           'Hue Letter(s)', 'ASTM Hue', 'Value', 'Chroma', 'Color Name', 'HTML RGB', 'Pigments']
+
+ROWS = [
+    ['Gamblin', 'G1', '5R 5/14', 75., 5., 'R', 5., 5., 14., 'Cadmium Red Medium', '#C0272D', '[PR108]'],
+    ['Gamblin', 'G2', 'N 9.5/', '', '', '', 'nan', 9.5, 0., 'Titanium White', '#F2F2F0', '[PW6]'],
+    ['Sennelier', 'S1', '7.5YR 6/8', 67.5, 7.5, 'YR', 17.5, 6., 8., 'Orange', '', ''],
+]
+
+
+@pytest.mark.parametrize('format', ['parquet', 'feather'])
+def test_round_trip(tmp_path, format):
+    path = str(tmp_path / f'catalog.{format}')
+    with catalog_writer(path, COLUMNS, extra_fields=[('pigments', pa.string())]) as writer:
+        assert isinstance(writer, CatalogWriter)
+        writer.batch_size = 2
+        writer.writerows(ROWS)
+
+    assert read_table(path).num_rows == 3
+    columns = read_columns(path)
+    assert columns['brand'].tolist() == ['Gamblin', 'Gamblin', 'Sennelier']
+    assert columns['name'][0] == 'Cadmium Red Medium'
+    np.testing.assert_allclose(columns['astm_hue'], [5., np.nan, 17.5])
+    np.testing.assert_allclose(columns['hue_code'], [7, np.nan, 6])
+    np.testing.assert_allclose(columns['value'], [5., 9.5, 6.])
+    np.testing.assert_allclose(columns['r'], [0xC0, 0xF2, np.nan])
+    assert columns['pigments'].tolist() == ['[PR108]', '[PW6]', '']
@@ -1,3 +1,5 @@
+import os
+import sys
 import warnings
 import pytest
 import numpy as np
@@ -7,6 +9,9 @@ import munsellkit as mkit
 import munsellkit.minterpol as mint
 import munsellkit.lindbloom as mlin
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from munsell_cache import MunsellConverter, PersistentCache, get_converter
+
 
 HARD_COLORS = [
     ('Black Green', '020202'),
@@ -65,3 +70,47 @@ def test_grays():
       spec_mlin = mlin.rgb_to_munsell_specification(r, g, b)
       color_mlin = mkit.normalized_color(spec_mlin, out='color')
       print(f'[{r} {g} {b}] -> {color_mlin}')
+
+
+def test_converter_cache(tmp_path):
+    cache_path = str(tmp_path / 'munsell_cache.db')
+    with MunsellConverter('lindbloom', cache_path=cache_path) as converter:
+        for name, hex in HARD_COLORS + HARD_COLORS:
+            r, g, b = [int(hex[i:i+2], 16) for i in range(0, 6, 2)]
+            spec = converter.rgb_to_munsell_specification(r, g, b)
+            np.testing.assert_array_equal(spec, mlin.rgb_to_munsell_specification(r, g, b))
+        stats = converter.stats()
+        assert stats['misses'] == len(HARD_COLORS)
+        assert stats['hits'] == len(HARD_COLORS)
+        print(converter.format_stats())
+
+    with MunsellConverter('lindbloom', cache_path=cache_path) as converter:
+        for name, hex in HARD_COLORS:
+            r, g, b = [int(hex[i:i+2], 16) for i in range(0, 6, 2)]
+            converter.rgb_to_munsell_specification(r, g, b)
+        assert converter.stats()['persistent_hits'] == len(HARD_COLORS)
+
+
+def test_shared_persistent_cache(tmp_path):
+    cache_path = str(tmp_path / 'munsell_cache.db')
+    first = PersistentCache(cache_path, commit_every=2)
+    second = PersistentCache(cache_path, commit_every=2)
+    # Pending puts hold no lock, so the other cache can write meanwhile
+    first.put('lindbloom', 1, [5., 4., 8., 7.])
+    second.put('lindbloom', 2, [5., 5., 8., 7.])
+    second.put('lindbloom', 3, [5., 6., 8., 7.])
+    np.testing.assert_array_equal(first.get('lindbloom', 3), [5., 6., 8., 7.])
+    np.testing.assert_array_equal(first.get('lindbloom', 1), [5., 4., 8., 7.])
+    assert second.get('lindbloom', 1) is None
+    first.close()
+    np.testing.assert_array_equal(second.get('lindbloom', 1), [5., 4., 8., 7.])
+    second.close()
+
+
+def test_get_converter_after_close(tmp_path):
+    cache_path = str(tmp_path / 'munsell_cache.db')
+    converter = get_converter('lindbloom', cache_path)
+    converter.close()
+    converter = get_converter('lindbloom', cache_path)
+    assert converter.persistent is not None
+    converter.close()
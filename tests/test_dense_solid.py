@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+import pytest
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'color_book'))
+from dense_solid import MANIFEST, DenseSolid, chunk_file, consolidate, grid_hues, grid_values
+
+
+# 4 hues (25, 50, 75, 100) x 3 values (1, 5, 9), chromas 2, 4, ...
+PARAMS = {'hue_step': 25., 'value_step': 4., 'chroma_step': 2., 'hues_per_chunk': 2}
+
+
+def write_chunks(out_dir, chunks):
+    '''Writes chunks whose specs are (hue, value, chroma, 0) and whose
+    rows hold (hue index + value index + 1) chromas.
+    '''
+    hues, values = grid_hues(PARAMS['hue_step']), grid_values(PARAMS['value_step'])
+    manifest = {'params': PARAMS, 'chunks': {}, 'consolidated': False}
+    for chunk in chunks:
+        chunk_hues = hues[2 * chunk:2 * chunk + 2]
+        counts = np.array([[2 * chunk + i + j + 1 for j in range(len(values))] for i in range(len(chunk_hues))])
+        specs = [(hue, value, PARAMS['chroma_step'] * (c + 1), 0)
+                 for hue, row in zip(chunk_hues, counts) for value, count in zip(values, row) for c in range(count)]
+        specs = np.array(specs, dtype=np.float32)
+        np.savez_compressed(chunk_file(out_dir, chunk), specs=specs, xyY=specs[:, :3], srgb=specs[:, :3],
+                            counts=counts)
+        manifest['chunks'][str(chunk)] = {'file': os.path.basename(chunk_file(out_dir, chunk)),
+                                          'hues': [float(chunk_hues[0]), float(chunk_hues[-1])],
+                                          'count': len(specs)}
+    with open(os.path.join(out_dir, MANIFEST), 'w') as f:
+        json.dump(manifest, f)
+
+
+def test_index(tmp_path):
+    write_chunks(tmp_path, [0, 1])
+    consolidate(tmp_path)
+    solid = DenseSolid(tmp_path)
+    assert solid.rows.shape == (4, 3, 2)
+    assert len(solid) == solid.rows[..., 1].sum()
+
+    hues = [25., 50.2, 75., 99.9, 0., 25., 25., 50.]
+    values = [1., 5., 9.1, 5., 1., 0., 5., 5.]
+    chromas = [2., 4., 8., 6., 8., 2., 0., 100.]
+    i = solid.index(hues, values, chromas)
+    # 0 and 99.9 are the 10RP (100) row, values are clipped to the grid
+    expected = [(25, 1, 2), (50, 5, 4), (75, 9, 8), (100, 5, 6), (100, 1, 8), (25, 1, 2)]
+    np.testing.assert_array_equal(solid.specs[i[:6], :3], expected)
+    # Chroma 0 and chromas past the gamut are not in the solid
+    np.testing.assert_array_equal(i[6:], -1)
+
+def test_consolidate_missing_chunk(tmp_path):
+    write_chunks(tmp_path, [0])
+    with pytest.raises(ValueError):
+        consolidate(tmp_path)
+    with pytest.raises(ValueError):
+        DenseSolid(tmp_path)
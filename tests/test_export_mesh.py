@@ -0,0 +1,65 @@
+import json
+import os
+import struct
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'color_book'))
+from export_mesh import INSTANCE_STRIDE, Z_SPACING, build_gltf, instance_buffer, write_glb
+
+
+CHIPS = [
+    (0, 5, 2, (120, 100, 110)),
+    (250, 3, 8, (150, 140, 20)),
+    (500, 8, 4, (80, 210, 120)),
+    (750, 1, 6, (20, 30, 160)),
+    (975, 9, 14, (250, 200, 220))
+]
+
+
+def read_glb(path):
+    with open(path, 'rb') as f:
+        data = f.read()
+    magic, version, length = struct.unpack_from('<4sII', data, 0)
+    assert (magic, version, length) == (b'glTF', 2, len(data))
+    json_length, json_type = struct.unpack_from('<I4s', data, 12)
+    assert json_type == b'JSON'
+    gltf = json.loads(data[20:20 + json_length])
+    bin_length, bin_type = struct.unpack_from('<I4s', data, 20 + json_length)
+    assert bin_type == b'BIN\x00'
+    assert 28 + json_length + bin_length == len(data)
+    return (gltf, data[28 + json_length:])
+
+
+def test_glb_structure(tmp_path):
+    gltf, buffer = build_gltf(instance_buffer(CHIPS))
+    gltf, chunk = read_glb(write_glb(gltf, buffer, str(tmp_path / 'solid')))
+
+    assert gltf['asset']['version'] == '2.0'
+    assert gltf['buffers'][0]['byteLength'] <= len(chunk)
+    assert chunk[:len(buffer)] == buffer
+    for view in gltf['bufferViews']:
+        assert view['byteOffset'] % 4 == 0
+        assert view['byteOffset'] + view['byteLength'] <= gltf['buffers'][0]['byteLength']
+    sizes = {'SCALAR': 1, 'VEC3': 3, 'VEC4': 4}
+    for accessor in gltf['accessors']:
+        view = gltf['bufferViews'][accessor['bufferView']]
+        item = sizes[accessor['type']] * (2 if accessor['componentType'] == 5123 else 4)
+        stride = view.get('byteStride', item)
+        assert accessor.get('byteOffset', 0) + (accessor['count'] - 1) * stride + item <= view['byteLength']
+
+    instancing = gltf['nodes'][0]['extensions']['EXT_mesh_gpu_instancing']['attributes']
+    assert {gltf['accessors'][i]['count'] for i in instancing.values()} == {len(CHIPS)}
+    assert gltf['bufferViews'][gltf['accessors'][instancing['TRANSLATION']]['bufferView']]['byteLength'] == \
+        len(CHIPS) * INSTANCE_STRIDE
+
+
+def test_y_up():
+    instances = instance_buffer(CHIPS)
+    # The value is the height, along +Y
+    np.testing.assert_allclose(instances[:, 1], [(c[1] - 5) * Z_SPACING / 100. for c in CHIPS], atol=1e-6)
+    # Rotations are about Y, turning each cube to face the neutral axis
+    np.testing.assert_array_equal(instances[:, [3, 5]], 0.)
+    theta = 2. * np.arctan2(instances[:, 4], instances[:, 6])
+    np.testing.assert_allclose(np.arctan2(-instances[:, 2], instances[:, 0]) % (2 * np.pi),
+                               theta % (2 * np.pi), atol=1e-5)
@@ -0,0 +1,60 @@
+import asyncio
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from http_loop import RequestError, serve_connection
+
+
+class Writer:
+    def __init__(self):
+        self.data = b''
+        self.closed = False
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def serve(requests, respond):
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(requests)
+        reader.feed_eof()
+        writer = Writer()
+        await serve_connection(reader, writer, respond)
+        return writer
+    return asyncio.run(run())
+
+
+async def respond(method, target, body):
+    if target == '/missing':
+        raise RequestError(404, 'No such path')
+    if target == '/broken':
+        raise KeyError(target)
+    return (200, 'text/plain', method.encode('latin-1') + b' ' + body)
+
+
+def test_keep_alive():
+    writer = serve(
+        b'GET /missing HTTP/1.1\r\n\r\n'
+        b'POST /echo HTTP/1.1\r\nContent-Length: 5\r\n\r\nhello'
+        b'GET /broken HTTP/1.1\r\nConnection: close\r\n\r\n'
+        b'GET /never HTTP/1.1\r\n\r\n', respond)
+    responses = writer.data.split(b'HTTP/1.1 ')[1:]
+    assert [response.split(b'\r\n')[0] for response in responses] == [
+        b'404 Not Found', b'200 OK', b'500 Internal Server Error']
+    assert responses[0].endswith(b'\r\n\r\nNo such path')
+    assert responses[1].endswith(b'\r\n\r\nPOST hello')
+    assert b'Connection: close' in responses[2]
+    assert writer.closed
+
+
+def test_malformed_request():
+    writer = serve(b'nonsense\r\n\r\n', respond)
+    assert writer.data == b'' and writer.closed
@@ -0,0 +1,78 @@
+import os
+import sys
+import warnings
+import pytest
+import numpy as np
+
+import colour
+from colour.notation import munsell as cnm
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from jch_batch import L_A, WHITE_D65, Y_B, jch_to_XYZ, jch_to_munsell_specifications, viewing_conditions
+from munsell_hues import astm_hue, hue_difference
+from munsell_inversion import invert, rgb_to_munsell_specifications, rgb_to_xyY, xyY_to_munsell_specifications
+
+
+def random_specifications(n, seed=0):
+    rng = np.random.default_rng(seed)
+    specs = []
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        while len(specs) < n:
+            shade, value, code = rng.uniform(0.5, 10.), rng.uniform(1., 9.), rng.integers(1, 11)
+            max_chroma = cnm.maximum_chroma_from_renotation([shade, value, code])
+            specs.append([shade, value, rng.uniform(1., max_chroma), code])
+    return np.array(specs)
+
+def test_matches_colour_science():
+    specs = random_specifications(100)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        xyY = np.array([cnm.munsell_specification_to_xyY(spec) for spec in specs])
+    result = invert(xyY)
+    assert result['converged'].mean() > 0.95
+    ok = result['converged']
+    dh = hue_difference(result['astm_hue'], astm_hue(specs[:, 0], specs[:, 3]))
+    np.testing.assert_allclose(dh[ok], 0., atol=0.01)
+    np.testing.assert_allclose(result['value'], specs[:, 1], atol=1e-6)
+    np.testing.assert_allclose(result['chroma'][ok], specs[ok, 2], atol=0.05)
+
+def test_pale_colors():
+    # Values between 9 and 10 are interpolated towards white, as in colour-science
+    specs, converged = rgb_to_munsell_specifications([[205, 248, 66], [245, 238, 214]])
+    assert converged.all()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        reference = np.array([cnm.xyY_to_munsell_specification(xyY)
+                              for xyY in rgb_to_xyY([[205, 248, 66], [245, 238, 214]])])
+    assert np.all(specs[:, 1] > 9)
+    np.testing.assert_allclose(specs, reference, atol=0.002)
+
+    # Chromatic colors darker than value 1 are outside the lattice
+    _, converged = rgb_to_munsell_specifications([[30, 10, 5]])
+    assert not converged[0]
+
+def test_neutrals_and_rgb():
+    specs, converged = xyY_to_munsell_specifications([[0.31006, 0.31616, 0.2]])
+    assert converged[0]
+    assert np.isnan(specs[0, 0]) and np.isnan(specs[0, 2])
+    assert specs[0, 1] == pytest.approx(cnm.munsell_value_ASTMD1535(20.), abs=1e-6)
+
+    specs, converged = rgb_to_munsell_specifications([[176, 27, 33], [0, 0, 0], [255, 255, 255]])
+    assert converged.all()
+    assert specs[0, 3] == 7  # R
+    assert specs[1, 1] == pytest.approx(0., abs=1e-3)
+    assert specs[2, 1] == pytest.approx(10., abs=0.01)
+
+def test_jch_matches_colour_science():
+    rgbs = np.random.default_rng(1).integers(0, 256, size=(500, 3))
+    XYZ = colour.sRGB_to_XYZ(rgbs / 255.) * 100.
+    XYZ_w = colour.xy_to_XYZ(np.array(WHITE_D65)) * 100.
+    cam = colour.XYZ_to_CIECAM02(XYZ, XYZ_w, L_A, Y_B)
+    jch = np.stack([cam.J, cam.C, cam.h], axis=-1)
+    np.testing.assert_allclose(jch_to_XYZ(jch), XYZ, atol=1e-8)
+    np.testing.assert_allclose(jch_to_XYZ(jch, viewing_conditions()), XYZ, atol=1e-8)
+
+    specs, converged = jch_to_munsell_specifications(jch)
+    expected, _ = rgb_to_munsell_specifications(rgbs)
+    np.testing.assert_allclose(specs[converged], expected[converged], atol=1e-6)
@@ -0,0 +1,52 @@
+import os
+import sys
+import pytest
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from munsell_hues import (N_PAGES, PAGE_FROM_LABEL, PAGE_LABELS, PAGE_STEP, astm_hue, hue_difference,
+                          hue_label, hue_ring, hue_specification, page_of, parse_hue)
+
+
+def test_10rp_wraps():
+    # 10RP is both ASTM hue 0 and 100, and 0R is 10RP
+    assert hue_specification(0.) == (10., 8.)
+    assert hue_specification(100.) == (10., 8.)
+    assert astm_hue(10., 8) == 0.
+    assert astm_hue(0., 7) == 0.
+    assert parse_hue('0R') == 0.
+    assert hue_label(100.) == '10RP'
+    np.testing.assert_array_equal(page_of([0., 99., 100., 1.2, 98.7]), [0, 0, 0, 0, 39])
+    assert hue_difference(1., 99.) == 2.
+    assert hue_difference(99., 1.) == -2.
+    np.testing.assert_array_equal(hue_ring(0, 2), [38, 39, 0, 1, 2])
+    np.testing.assert_array_equal(hue_ring(39, 1), [38, 39, 0])
+
+def test_round_trip():
+    astm = np.arange(N_PAGES) * PAGE_STEP + 1.25
+    shades, codes = hue_specification(astm)
+    np.testing.assert_allclose(astm_hue(shades, codes), astm)
+    np.testing.assert_array_equal([parse_hue(label) for label in PAGE_LABELS], np.arange(N_PAGES) * PAGE_STEP)
+
+def test_one_based_pages():
+    # Books and colorwell.org number their pages 1 to 40, from 2.5R to 10RP
+    labels = [hue_label(page_num * PAGE_STEP) for page_num in range(1, N_PAGES + 1)]
+    assert labels[:4] == ['2.5R', '5R', '7.5R', '10R']
+    assert labels[-1] == '10RP'
+    assert [PAGE_LABELS[page_num % N_PAGES] for page_num in range(1, N_PAGES + 1)] == labels
+    assert hue_label(N_PAGES * PAGE_STEP, '{:.1f}') == '10.0RP'
+    assert PAGE_FROM_LABEL['2.5R'] == 1
+    assert PAGE_FROM_LABEL['10.0RP'] == PAGE_FROM_LABEL['10RP'] == 0
+
+def test_neutrals():
+    assert np.isnan(astm_hue(np.nan, np.nan))
+    assert all(np.isnan(hue_specification(np.nan)))
+    assert page_of(np.nan) == -1
+    np.testing.assert_array_equal(page_of([np.nan, 5.]), [-1, 2])
+    assert hue_label([np.nan, 5.]) == ['N', '5R']
+    assert np.isnan(parse_hue('N'))
+    # A neutral has no hue difference with anything
+    assert np.isnan(hue_difference(np.nan, 5.))
+    assert np.isnan(hue_difference(np.nan, np.nan))
+    with pytest.raises(ValueError):
+        parse_hue('11R')
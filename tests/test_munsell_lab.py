@@ -0,0 +1,41 @@
+import os
+import sys
+import time
+import numpy as np
+
+from colour.notation.datasets.munsell import MUNSELL_COLOURS_ALL
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from munsell_hues import hue_specification, parse_hue
+from munsell_lab import mlab_to_specifications, mlab_to_xyY, specifications_to_mlab, xyY_to_mlab
+
+
+def test_batch_round_trip():
+    rows = [(hue, value, chroma, xyY) for (hue, value, chroma), xyY in MUNSELL_COLOURS_ALL
+            if 1 <= value <= 9]
+    shades, codes = hue_specification(np.array([parse_hue(row[0]) for row in rows]))
+    specs = np.column_stack([shades, [row[1] for row in rows], [row[2] for row in rows], codes])
+    xyY = np.array([row[3] for row in rows]) / [1., 1., 100.]
+
+    start = time.time()
+    lab = specifications_to_mlab(specs)
+    np.testing.assert_allclose(mlab_to_specifications(lab), specs, atol=1e-9)
+    np.testing.assert_allclose(mlab_to_xyY(lab)[:, :2], xyY[:, :2], atol=1e-9)
+    lab2, result = xyY_to_mlab(mlab_to_xyY(lab))
+    print(f'{len(rows)} renotation colors round-tripped in {time.time() - start:.2f}s, '
+          f'{result["converged"].mean():.1%} converged, '
+          f'median {np.median(result["iterations"]):g} iterations')
+
+    assert result['converged'].mean() > 0.95
+    ok = result['converged']
+    assert (result['residual'][ok] < 1e-6).all()
+    np.testing.assert_allclose(lab2[ok], lab[ok], atol=0.01)
+
+
+def test_chroma_and_value_steps():
+    specs = np.array([[5., 5., 4., 7.], [5., 5., 6., 7.], [5., 6., 4., 7.], [np.nan, 5., np.nan, np.nan]])
+    lab = specifications_to_mlab(specs)
+    np.testing.assert_allclose(np.hypot(lab[1, 1], lab[1, 2]) - np.hypot(lab[0, 1], lab[0, 2]), 10.)
+    assert lab[2, 0] > lab[0, 0]
+    np.testing.assert_allclose(lab[3, 1:], 0.)
+    np.testing.assert_allclose(lab[3, 0], lab[0, 0])
@@ -0,0 +1,46 @@
+import os
+import sys
+import warnings
+import pytest
+import numpy as np
+
+from colour.notation import munsell as cnm
+from colour.notation.datasets.munsell import MUNSELL_COLOURS_ALL
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from munsell_notation import match_notation, parse_notation, parse_notations
+
+
+def test_parse_renotation():
+    names = [f'{h} {v:g}/{c:g}' for (h, v, c), _ in MUNSELL_COLOURS_ALL]
+    specs, _, errors = parse_notations(names)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        expected = np.array([cnm.munsell_colour_to_munsell_specification(name) for name in names])
+    assert not errors.any()
+    np.testing.assert_array_equal(specs, expected)
+
+def test_parse_names_and_errors():
+    specs, names, errors = parse_notations([
+        'Cadmium Red: 7.5R 4/14', 'N 5', 'n5/', '0R 5/4', '10RP 5/0', 'bad', '', '11R 5/4'])
+    np.testing.assert_array_equal(errors, [False, False, False, False, False, True, True, True])
+    assert names[:3] == ['Cadmium Red', None, None]
+    np.testing.assert_array_equal(specs[0], [7.5, 4, 14, 7])
+    np.testing.assert_array_equal(specs[1], [np.nan, 5, np.nan, np.nan])
+    np.testing.assert_array_equal(specs[2], [np.nan, 5, np.nan, np.nan])
+    np.testing.assert_array_equal(specs[3], [10, 5, 4, 8])
+    np.testing.assert_array_equal(specs[4], [np.nan, 5, np.nan, np.nan])
+    assert np.isnan(specs[5:]).all()
+    with pytest.raises(ValueError):
+        parse_notation('bad')
+
+def test_match_notation():
+    assert match_notation('Cadmium Red: 7.5r 4/14') == ('Cadmium Red', '7.5R', 4., 14.)
+    assert match_notation('N 5') == (None, 'N', 5., None)
+    assert match_notation('10RP 5/0') == (None, 'N', 5., None)
+    assert match_notation('0R 5/4') == (None, '10RP', 5., 4.)
+    assert match_notation('bad') is None
+    assert match_notation('11R 5/4') is None
+    lines = ['Cadmium Red: 7.5R 4/14', 'N 5', 'n5/', '0R 5/4', 'bad', '', '11R 5/4', '5R4.5/6']
+    _, _, errors = parse_notations(lines)
+    np.testing.assert_array_equal(errors, [match_notation(line) is None for line in lines])
@@ -0,0 +1,45 @@
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from columnar import catalog_writer
+from paint_catalog import PaintStore, build_store
+
+
+COLUMNS = ['Brand Name', 'Identifier', 'Munsell Specification', 'ASTM Hue', 'Value', 'Chroma',
+           'Color Name', 'HTML RGB']
+
+ROWS = [
+    ['Gamblin', 'G1', '5R 5/14', 5., 5., 14., 'Cadmium Red Medium', '#C0272D'],
+    ['Gamblin', 'G2', 'N 9.5/', 'nan', 9.5, 0., 'Titanium White', '#F2F2F0'],
+    ['Gamblin', 'G3', '5RP 4/10', 95., 4., 10., 'Quinacridone Magenta', ''],
+    ['Sennelier', 'S1', '7.5YR 6/8', 17.5, 6., 8., 'Orange', ''],
+    ['Sennelier', 'S2', '2.5R 5/6', 2.5, 5., 6., 'Rose', ''],
+]
+
+
+def test_store_queries(tmp_path):
+    path = str(tmp_path / 'colors.csv')
+    with catalog_writer(path, COLUMNS) as writer:
+        writer.writerows(ROWS)
+    build_store([path], str(tmp_path / 'paints.store'))
+    store = PaintStore(str(tmp_path / 'paints.store'))
+
+    assert len(store) == 5
+    assert store.brands() == ['Gamblin', 'Sennelier']
+
+    def identifiers(rows):
+        return sorted(paint['identifier'] for paint in store.rows(rows))
+
+    # Wraps around 10RP, and skips the neutral
+    assert identifiers(store.query(hue=('2.5RP', '5R'))) == ['G1', 'G3', 'S2']
+    assert identifiers(store.query(hue=(90, 10), value=(5, None))) == ['G1', 'S2']
+    assert identifiers(store.query(value=(5, 9.5), chroma=(None, 8))) == ['G2', 'S1', 'S2']
+    assert identifiers(store.query(chroma=(6, None), brands=['Sennelier'])) == ['S1', 'S2']
+    assert len(store.query(brands=['Gamblin'])) == 3
+
+    i = store.find('Sennelier', 'S2')
+    assert store.rows([i])[0]['name'] == 'Rose'
+    assert store.find('Sennelier', 'G1') is None
+    np.testing.assert_allclose(store.column('chroma')[store.query(value=(6, 6))], [8.])
@@ -0,0 +1,49 @@
+import os
+import sys
+import numpy as np
+import pyarrow as pa
+import colour
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from columnar import CatalogBuffer
+from paint_equivalents import ciede2000, find_equivalents
+
+
+def make_table(n=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    buffer = CatalogBuffer()
+    for i in range(n):
+        neutral = i % 30 == 0
+        buffer.writerow({
+            'brand': f'B{i % 4}',
+            'identifier': f'P{i}',
+            'astm_hue': None if neutral else rng.uniform(0, 100),
+            'value': rng.uniform(3, 8),
+            'chroma': 0. if neutral else rng.uniform(0, 8)
+        })
+    return pa.Table.from_batches([buffer.take_batch()])
+
+
+def test_ciede2000():
+    rng = np.random.default_rng(1)
+    lab1 = rng.uniform([0, -100, -100], [100, 100, 100], (1000, 3))
+    lab2 = lab1 + rng.normal(0, 5, (1000, 3))
+    lab1[:10, 1:] = 0.
+    np.testing.assert_allclose(ciede2000(lab1, lab2), colour.delta_E(lab1, lab2, method='CIE 2000'), atol=1e-9)
+
+
+def test_blocked_pairs_match_all_pairs():
+    blocks, i, j, dE = find_equivalents(make_table(), max_delta_e=3.)
+    full = ciede2000(blocks.lab[:, np.newaxis], blocks.lab[np.newaxis])
+    full[blocks.brands[:, np.newaxis] == blocks.brands[np.newaxis]] = np.inf
+    expected = set(zip(*np.nonzero(np.triu(full <= 3., 1))))
+    assert len(expected) > 100
+    assert set(zip(np.minimum(i, j), np.maximum(i, j))) == expected
+    np.testing.assert_allclose(dE, full[i, j])
+    assert np.all(np.diff(dE) >= 0)
+
+    blocks, i, j, dE = find_equivalents(make_table(), max_delta_e=3., best=True)
+    pairs = set(zip(i, blocks.brands[j]))
+    assert len(pairs) == len(i)
+    for a, b, d in zip(i, j, dE):
+        assert d == full[a, blocks.brands == blocks.brands[b]].min()
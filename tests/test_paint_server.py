@@ -0,0 +1,96 @@
+import asyncio
+import json
+import os
+import sys
+import numpy as np
+import pyarrow as pa
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from columnar import CatalogBuffer
+from paint_server import PaintServer, PaintSpace, RequestError
+
+
+def make_space(n=500):
+    rng = np.random.default_rng(0)
+    buffer = CatalogBuffer()
+    for i in range(n):
+        buffer.writerow({
+            'brand': ['Gamblin', 'Sennelier', 'Unison'][i % 3],
+            'identifier': f'P{i}',
+            'astm_hue': rng.uniform(0, 100),
+            'value': rng.uniform(1, 9),
+            'chroma': rng.uniform(0, 14)
+        })
+    buffer.writerow({'brand': 'Unison', 'identifier': 'White', 'value': 9.5, 'chroma': 0.})
+    buffer.writerow({'brand': 'Unison', 'identifier': 'Unknown'})
+    return PaintSpace(pa.Table.from_batches([buffer.take_batch()]))
+
+
+def test_nearest_matches_brute_force():
+    space = make_space()
+    assert len(space) == 501
+    points = space.mlab[::7] + np.array([2., -3., 1.5])
+    brand_names = np.array(space.fields['brand'])
+    for brands in [None, ['Sennelier'], ['Gamblin', 'Unison']]:
+        indices, dists = space.nearest(points, 4, brands)
+        full = np.linalg.norm(space.mlab[np.newaxis] - points[:, np.newaxis], axis=2)
+        if brands:
+            full[:, ~np.isin(brand_names, brands)] = np.inf
+        np.testing.assert_allclose(dists, np.sort(full, axis=1)[:, :4])
+        assert np.all(np.isin(brand_names[indices], brands or list(space.trees)))
+
+    indices, dists = space.nearest(points[:1], 3, max_distance=0.)
+    assert indices.tolist() == [[-1, -1, -1]]
+
+
+def test_batch():
+    server = PaintServer(make_space())
+    body = json.dumps({'k': 2, 'brands': ['Unison'], 'queries': [
+        'N 9.5/', {'mlab': [50., 0., 0.]}, {'munsell': '5R 4/14'}, {'rgb': [1, 2]}, 'bad']})
+    results = server.batch(body)['results']
+    assert [paint['identifier'] for paint in results[0]][0] == 'White'
+    assert results[0][0]['distance'] == 0.
+    assert len(results[1]) == len(results[2]) == 2
+    assert all(paint['brand'] == 'Unison' for paint in results[1] + results[2])
+    assert 'error' in results[3] and 'error' in results[4]
+
+
+def test_invalid_input():
+    server = PaintServer(make_space())
+    for target in ['/nearest?rgb=nan,0,0', '/nearest?lab=50,inf,0', '/nearest?munsell=5R+4/14&max_distance=nan',
+                   '/nearest?munsell=5R+4/14&brand=Nobody']:
+        try:
+            server.respond('GET', target, b'')
+            assert False, target
+        except RequestError as e:
+            assert e.status == 400
+    for brands in [[['x']], 'Unison', [1]]:
+        try:
+            server.batch(json.dumps({'queries': ['5R 5/4'], 'brands': brands}))
+            assert False, brands
+        except RequestError as e:
+            assert e.status == 400
+    results = server.batch('{"queries": [{"rgb": [NaN, 0, 0]}, {"lab": [true, 0, 0]}, {"munsell": 5}]}')['results']
+    assert all('error' in result for result in results)
+
+
+def test_unexpected_error():
+    server = PaintServer(make_space())
+    server.respond = lambda method, target, body: 1 / 0
+
+    class Writer:
+        data = b''
+        def write(self, data):
+            self.data += data
+        async def drain(self):
+            pass
+        def close(self):
+            pass
+
+    reader = asyncio.StreamReader()
+    reader.feed_data(b'GET /stats HTTP/1.1\r\nConnection: close\r\n\r\n')
+    reader.feed_eof()
+    writer = Writer()
+    asyncio.run(server.handle(reader, writer))
+    assert writer.data.startswith(b'HTTP/1.1 500 Internal Server Error\r\n')
+    assert server.errors == 1
@@ -0,0 +1,53 @@
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'color_book'))
+import render_server
+from render_server import DATA_DIR, RenderServer, RequestError, card_request, render_card
+
+
+def test_unknown_hue():
+    with pytest.raises(RequestError) as e:
+        card_request('/hues', 'color=3R5/6')
+    assert e.value.status == 404
+    with pytest.raises(RequestError) as e:
+        card_request('/card', 'card=3R5')
+    assert e.value.status == 404
+
+
+def test_missing_chip(monkeypatch):
+    monkeypatch.chdir(DATA_DIR)
+    key, mode, color = card_request('/hues', 'color=5R4.5/6&source=rit')
+    assert render_card(key[0], mode, color) is None
+
+
+def test_shared_render(monkeypatch):
+    def slow_render(source_name, mode, color, format='png'):
+        time.sleep(0.2)
+        return b'card'
+
+    monkeypatch.setattr(render_server, 'render_card', slow_render)
+    server = RenderServer(workers=1)
+    server.executor.shutdown()
+    server.executor = ThreadPoolExecutor(2)
+    key, mode, color = card_request('/hues', 'color=5R4/6&source=rit')
+
+    async def requests():
+        first = asyncio.ensure_future(server.render(key, mode, color))
+        await asyncio.sleep(0.05)
+        second = asyncio.ensure_future(server.render(key, mode, color))
+        await asyncio.sleep(0.05)
+        # The first requester going away does not cancel the shared render
+        first.cancel()
+        assert await second == b'card'
+        assert await server.render(key, mode, color) == b'card'
+
+    asyncio.run(requests())
+    server.executor.shutdown()
+    stats = server.stats()
+    assert (stats['misses'], stats['shared'], stats['hits']) == (1, 1, 1)
+    assert stats['hit_rate'] == pytest.approx(2 / 3)
@@ -1,11 +1,19 @@
+import os
+import sys
+import time
 import warnings
 import pytest
 import numpy as np
 
 import colour
+from colour.notation.datasets.munsell import MUNSELL_COLOURS_ALL
 import munsellkit as mkit
 import munsellkit.lindbloom as mlin
 
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utilities'))
+from munsell_hues import hue_specification, parse_hue
+from uplab import rgb_to_uplab, specifications_to_uplab, uplab_to_specifications, xyY_to_uplab
+
 
 REALPAINT_COLORS = [
     ('5YR 4.79/4.23', {
@@ -67,3 +75,51 @@ def test_color():
         spec1, spec2 = mlin.rgb_to_munsell_specification(rgb[0], rgb[1], rgb[2], with_renotation=True)
         print_spec(name, spec1)
         print_spec(f'{name} RENOTATION', spec2)
+
+
+def renotation_set():
+    rows = [(hue, value, chroma, xyY) for (hue, value, chroma), xyY in MUNSELL_COLOURS_ALL
+            if 1 <= value <= 9]
+    shades, codes = hue_specification(np.array([parse_hue(row[0]) for row in rows]))
+    specs = np.column_stack([shades, [row[1] for row in rows], [row[2] for row in rows], codes])
+    xyY = np.array([row[3] for row in rows]) / [1., 1., 100.]
+    # The renotation Y predates the ASTM D1535 value scale used to invert
+    xyY[:, 2] = colour.notation.munsell.luminance_ASTMD1535(specs[:, 1]) / 100.
+    return (specs, xyY)
+
+
+def test_batch_matches_mlin():
+    specs, xyY = renotation_set()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        rgbs = colour.XYZ_to_sRGB(colour.xyY_to_XYZ(xyY), colour.CCS_ILLUMINANTS[
+            'CIE 1931 2 Degree Standard Observer']['C'], chromatic_adaptation_transform='Bradford')
+        rgbs = np.round(np.clip(rgbs, 0, 1) * 255)
+
+        start = time.time()
+        lab = specifications_to_uplab(specs)
+        lab_specs = uplab_to_specifications(lab)
+        rgb_lab = rgb_to_uplab(rgbs)
+        print(f'{len(specs)} renotation colors in {time.time() - start:.2f}s')
+
+        for n in range(len(specs)):
+            np.testing.assert_array_equal(lab[n], mlin.munsell_specification_to_uplab(specs[n]))
+            np.testing.assert_array_equal(lab_specs[n], mlin.uplab_to_munsell_specification(lab[n]))
+            np.testing.assert_array_equal(rgb_lab[n], mlin.rgb_to_uplab(*rgbs[n]))
+
+
+def test_batch_round_trip():
+    specs, xyY = renotation_set()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        start = time.time()
+        lab = specifications_to_uplab(specs)
+        lab2, result = xyY_to_uplab(xyY)
+    print(f'{len(specs)} renotation colors round-tripped in {time.time() - start:.2f}s, '
+          f'{result["converged"].mean():.1%} converged, '
+          f'median {np.median(result["iterations"]):g} iterations')
+
+    assert result['converged'].mean() > 0.95
+    ok = result['converged']
+    assert (result['residual'][ok] < 1e-6).all()
+    np.testing.assert_allclose(lab2[ok], lab[ok], atol=0.01)
@@ -0,0 +1,308 @@
+'''Typed columnar paint catalogs, as Parquet or Feather (Arrow IPC) files.
+
+All the Munsell catalog writers share one schema (CATALOG_SCHEMA), plus
+optional extra fields for data specific to a source (pigments, sample
+positions, spectra). Rows are buffered and written in record batches.
+Writers take either dicts keyed by field name, or the row lists of the
+existing CSV writers, with their CSV header as `columns`:
+
+    with CatalogWriter('dunn_edwards.parquet', columns=COLUMNS) as writer:
+        writer.writerow(['Dunn-Edwards', 'Sheet Metal', 'DE6356', ...])
+
+    # A csv.writer (header written) or a CatalogWriter, by format
+    with catalog_writer(with_format('colors.csv', format), COLUMNS) as writer:
+        writer.writerows(rows)
+
+    table = read_table('dunn_edwards.feather')   # pyarrow.Table
+    columns = read_columns('dunn_edwards.feather', ['astm_hue', 'value', 'chroma'])
+
+Readers memory-map the files. Feather files are written uncompressed, so
+their columns are used in place rather than read and parsed; Parquet
+columns (smaller files, with the brands dictionary-encoded) are decoded
+from the mapped file.
+
+pyarrow is only imported when a Parquet or Feather file is written or
+read, so CSV output through catalog_writer works without it. Extra
+fields can be given as pyarrow fields, or as (name, type name) pairs
+like ('pigments', 'string') to stay free of pyarrow.
+'''
+
+import contextlib
+import csv
+import functools
+import os
+
+import numpy as np
+
+from munsell_hues import HUE_CODES, hue_specification
+
+
+FORMATS = ['csv', 'parquet', 'feather']
+
+EXTENSIONS = {
+    'csv': '.csv',
+    'parquet': '.parquet',
+    'feather': '.feather'
+}
+
+# Rows buffered before a record batch is written.
+BATCH_SIZE = 4096
+
+# Fields of CATALOG_SCHEMA, with their pyarrow type names
+CATALOG_FIELDS = [
+    ('brand', 'string'),
+    ('identifier', 'string'),
+    ('name', 'string'),
+    ('notation', 'string'),
+    # Munsell specification, colour-science order; null hue for neutrals
+    ('hue_shade', 'float32'),
+    ('hue_code', 'int8'),
+    ('astm_hue', 'float32'),
+    ('value', 'float32'),
+    ('chroma', 'float32'),
+    ('r', 'uint8'),
+    ('g', 'uint8'),
+    ('b', 'uint8')
+]
+
+
+@functools.lru_cache(maxsize=None)
+def catalog_schema():
+    '''The pyarrow schema of CATALOG_FIELDS.'''
+    import pyarrow as pa
+
+    return pa.schema(CATALOG_FIELDS)
+
+
+def __getattr__(name):
+    # CATALOG_SCHEMA is built on first use, importing pyarrow
+    if name == 'CATALOG_SCHEMA':
+        return catalog_schema()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+# CSV header -> schema field, for the row lists of the CSV writers.
+# Columns not listed here are written if they name an extra field
+# (lowercased, spaces as underscores), and dropped otherwise.
+CSV_FIELDS = {
+    'Brand Name': 'brand',
+    'Identifier': 'identifier',
+    'Color Name': 'name',
+    'Munsell Specification': 'notation',
+    'Hue Prefix': 'hue_shade',
+    'Hue Letter(s)': 'hue_code',
+    'ASTM Hue': 'astm_hue',
+    'Value': 'value',
+    'Chroma': 'chroma',
+    'HTML RGB': 'rgb'
+}
+
+
+def format_of(path, format=None):
+    '''The output format given explicitly or by the file extension.'''
+    if format is None:
+        ext = os.path.splitext(path)[1].lower()
+        format = {'.pq': 'parquet', '.arrow': 'feather'}.get(ext, ext.lstrip('.'))
+    if format not in FORMATS:
+        raise ValueError(f'Unknown catalog format {format}, must be one of {", ".join(FORMATS)}')
+    return format
+
+
+def with_format(path, format):
+    '''path with the extension of format.'''
+    return os.path.splitext(path)[0] + EXTENSIONS[format]
+
+
+def _number(value):
+    if value is None or value == '':
+        return None
+    value = float(value)
+    return None if np.isnan(value) else value
+
+
+def _hue_code(value):
+    if value is None or value == '':
+        return None
+    if isinstance(value, str):
+        return HUE_CODES.get(value.strip().upper())
+    value = float(value)
+    return None if np.isnan(value) else int(value)
+
+
+class CatalogBuffer:
+    '''Buffers rows (dicts keyed by field name, or lists in `columns`
+    order) as typed columns, and returns them as record batches.
+    '''
+
+    def __init__(self, columns=None, extra_fields=()):
+        import pyarrow as pa
+
+        self.schema = catalog_schema()
+        for field in extra_fields:
+            self.schema = self.schema.append(field if isinstance(field, pa.Field) else pa.field(*field))
+        self.float_fields = {field.name for field in self.schema if pa.types.is_floating(field.type)}
+        self.columns = columns
+        self.buffer = {name: [] for name in self.schema.names}
+        self.count = 0
+
+    def __len__(self):
+        return len(self.buffer['brand'])
+
+    def _record(self, row):
+        if isinstance(row, dict):
+            return row
+        record = dict()
+        for header, value in zip(self.columns, row):
+            field = CSV_FIELDS.get(header, header.lower().replace(' ', '_'))
+            if field == 'rgb':
+                if value:
+                    html = value.lstrip('#')
+                    record['r'], record['g'], record['b'] = [int(html[i:i+2], 16) for i in range(0, 6, 2)]
+            else:
+                record[field] = value
+        return record
+
+    def writerow(self, row):
+        '''Buffers a dict keyed by field name, or a list in `columns` order.'''
+        record = self._record(row)
+        if _hue_code(record.get('hue_code')) is None and _number(record.get('astm_hue')) is not None:
+            record = dict(record)
+            record['hue_shade'], record['hue_code'] = hue_specification(float(record['astm_hue']))
+        for name in self.schema.names:
+            value = record.get(name)
+            if name == 'hue_code':
+                value = _hue_code(value)
+            elif name in self.float_fields:
+                value = _number(value)
+            elif isinstance(value, float) and np.isnan(value):
+                value = None
+            self.buffer[name].append(value)
+        self.count += 1
+
+    def writerows(self, rows):
+        for row in rows:
+            self.writerow(row)
+
+    def take_batch(self):
+        '''Returns the buffered rows as a RecordBatch, and empties the buffer.'''
+        import pyarrow as pa
+
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(self.buffer[field.name], type=field.type) for field in self.schema],
+            schema=self.schema)
+        for values in self.buffer.values():
+            values.clear()
+        return batch
+
+
+class CatalogWriter(CatalogBuffer):
+    def __init__(self, path, format=None, columns=None, extra_fields=(), batch_size=BATCH_SIZE):
+        super(CatalogWriter, self).__init__(columns, extra_fields)
+        self.path = path
+        self.format = format_of(path, format)
+        if self.format == 'csv':
+            raise ValueError('CatalogWriter writes Parquet or Feather files, use csv.writer for CSV')
+        self.batch_size = batch_size
+        if self.format == 'parquet':
+            import pyarrow.parquet as pq
+
+            self.writer = pq.ParquetWriter(path, self.schema)
+        else:
+            import pyarrow as pa
+
+            self.writer = pa.ipc.new_file(path, self.schema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def writerow(self, row):
+        '''Writes a dict keyed by field name, or a list in `columns` order.'''
+        super(CatalogWriter, self).writerow(row)
+        if len(self) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if len(self) == 0:
+            return
+        batch = self.take_batch()
+        if self.format == 'parquet':
+            import pyarrow as pa
+
+            self.writer.write_table(pa.Table.from_batches([batch]))
+        else:
+            self.writer.write_batch(batch)
+
+    def close(self):
+        if self.writer is not None:
+            self.flush()
+            self.writer.close()
+            self.writer = None
+
+
+@contextlib.contextmanager
+def catalog_writer(path, columns, format=None, extra_fields=(), mode='w'):
+    '''Yields a csv.writer with the `columns` header written, for CSV
+    files (opened with `mode`, e.g. 'a' to append), or a CatalogWriter
+    taking the same rows. Parquet and Feather files are always rewritten.
+    '''
+    format = format_of(path, format)
+    if format == 'csv':
+        with open(path, mode, newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            yield writer
+    else:
+        with CatalogWriter(path, format, columns, extra_fields) as writer:
+            yield writer
+
+
+def read_csv_catalog(path):
+    '''Reads a Munsell CSV, as written by the spiders and
+    pastel_data_to_csv.py, into a CATALOG_SCHEMA pyarrow.Table. Rows
+    without a brand get the file name as brand.
+    '''
+    import pyarrow as pa
+
+    with open(path, 'rt', newline='') as f:
+        reader = csv.reader(f)
+        buffer = CatalogBuffer(next(reader, []))
+        buffer.writerows(reader)
+    table = pa.Table.from_batches([buffer.take_batch()])
+    default_brand = os.path.splitext(os.path.basename(path))[0]
+    return table.set_column(0, 'brand', table.column('brand').fill_null(default_brand))
+
+
+def read_table(path, columns=None):
+    '''Memory-maps a Parquet or Feather catalog as a pyarrow.Table
+    (CSV catalogs are parsed with read_csv_catalog).
+    '''
+    format = format_of(path)
+    if format == 'csv':
+        table = read_csv_catalog(path)
+        return table.select(columns) if columns is not None else table
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+
+        return pq.read_table(path, columns=columns, memory_map=True)
+    import pyarrow.feather as feather
+
+    return feather.read_table(path, columns=columns, memory_map=True)
+
+
+def read_columns(path, columns=None):
+    '''Returns {field name: numpy array} for a Parquet or Feather catalog.
+    Numeric columns without nulls, stored in a single record batch, are
+    views of the mapped Arrow data; other numeric columns are
+    concatenated, with nulls as NaN. Strings give object arrays.
+    '''
+    import pyarrow as pa
+
+    table = read_table(path, columns)
+    result = dict()
+    for name, column in zip(table.column_names, table.columns):
+        if (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)) and column.null_count:
+            column = column.cast(pa.float64()).fill_null(np.nan)
+        result[name] = column.to_numpy()
+    return result
@@ -0,0 +1,256 @@
+'''Per-request crawl telemetry.
+
+Each request records its fetch latency, parse time, bytes, status and
+retries. Records are appended to a JSONL file (one object per line) and
+kept in a rolling window, from which pages/s, the error rate and the
+p50/p95 fetch and parse times are summarized. The summary can be printed
+every `summary_interval` seconds and served locally as Prometheus text
+(GET /metrics) or JSON (GET /summary).
+
+    telemetry = CrawlTelemetry('dunn_edwards', jsonl_path='crawl.jsonl')
+    telemetry.serve(9108)
+    with telemetry.request(url) as r:
+        driver.get(url)
+        r.fetched(status=200, bytes=len(driver.page_source))
+        ...parse...
+    telemetry.close()
+
+timed_request(telemetry, url) does the same, but also accepts None for
+crawls run without telemetry.
+
+Statuses are HTTP status codes where known; requests that raise are
+recorded with status 0 and the exception in 'error'. Statuses of 400
+and above also count as errors.
+'''
+
+import collections
+import contextlib
+import http.server
+import json
+import sys
+import threading
+import time
+
+
+WINDOW_SECONDS = 300.
+SUMMARY_INTERVAL = 60.
+QUANTILES = [0.5, 0.95]
+
+
+def quantile(sorted_values, q):
+    '''Linearly interpolated quantile of a sorted list (0 if empty).'''
+    if not sorted_values:
+        return 0.
+    pos = q * (len(sorted_values) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class RequestTimer:
+    '''Times one request. Call fetched() when the page has been loaded;
+    the rest of the `with` block is counted as parse time.
+    '''
+
+    def __init__(self, url):
+        self.url = url
+        self.start = time.perf_counter()
+        self.fetch_end = None
+        self.status = 200
+        self.bytes = 0
+        self.retries = 0
+        self.error = None
+
+    def fetched(self, status=None, bytes=None, retries=None):
+        self.fetch_end = time.perf_counter()
+        if status is not None:
+            self.status = status
+        if bytes is not None:
+            self.bytes = bytes
+        if retries is not None:
+            self.retries = retries
+
+
+class CrawlTelemetry:
+    def __init__(self, crawler, jsonl_path=None, window=WINDOW_SECONDS,
+                 summary_interval=SUMMARY_INTERVAL):
+        self.crawler = crawler
+        self.window = window
+        self.summary_interval = summary_interval
+        self.jsonl = open(jsonl_path, 'at') if jsonl_path else None
+        self.lock = threading.Lock()
+        # (time, fetch seconds, parse seconds, is error) within the window
+        self.recent = collections.deque()
+        self.started = time.time()
+        self.last_summary = time.monotonic()
+        self.requests = collections.Counter()  # by status
+        self.errors = 0
+        self.bytes = 0
+        self.retries = 0
+        self.fetch_seconds = 0.
+        self.parse_seconds = 0.
+        self.server = None
+
+    @contextlib.contextmanager
+    def request(self, url):
+        '''Context manager timing one request; yields a RequestTimer.
+        Exceptions are recorded and re-raised.
+        '''
+        timer = RequestTimer(url)
+        try:
+            yield timer
+        except Exception as e:
+            timer.status = 0
+            timer.error = f'{type(e).__name__}: {e}'
+            raise
+        finally:
+            end = time.perf_counter()
+            fetch_end = timer.fetch_end or end
+            self.record(url, timer.status, fetch_end - timer.start, end - fetch_end,
+                        timer.bytes, timer.retries, timer.error)
+
+    def record(self, url, status, fetch_seconds, parse_seconds=0., bytes=0, retries=0, error=None):
+        is_error = error is not None or status == 0 or status >= 400
+        now = time.time()
+        event = {
+            'time': round(now, 3),
+            'crawler': self.crawler,
+            'url': url,
+            'status': status,
+            'fetch_seconds': round(fetch_seconds, 6),
+            'parse_seconds': round(parse_seconds, 6),
+            'bytes': bytes,
+            'retries': retries
+        }
+        if error is not None:
+            event['error'] = error
+        with self.lock:
+            self.requests[status] += 1
+            self.errors += is_error
+            self.bytes += bytes
+            self.retries += retries
+            self.fetch_seconds += fetch_seconds
+            self.parse_seconds += parse_seconds
+            self.recent.append((now, fetch_seconds, parse_seconds, is_error))
+            self._expire(now)
+            if self.jsonl is not None:
+                self.jsonl.write(json.dumps(event) + '\n')
+                self.jsonl.flush()
+        if self.summary_interval and time.monotonic() - self.last_summary >= self.summary_interval:
+            self.last_summary = time.monotonic()
+            self.print_summary()
+
+    def _expire(self, now):
+        while self.recent and self.recent[0][0] < now - self.window:
+            self.recent.popleft()
+
+    def summary(self):
+        '''Rolling summary over the last `window` seconds, with totals.'''
+        now = time.time()
+        with self.lock:
+            self._expire(now)
+            recent = list(self.recent)
+            totals = {
+                'requests': sum(self.requests.values()),
+                'errors': self.errors,
+                'bytes': self.bytes,
+                'retries': self.retries,
+                'fetch_seconds': self.fetch_seconds,
+                'parse_seconds': self.parse_seconds,
+                'statuses': dict(self.requests)
+            }
+        span = min(self.window, now - self.started)
+        fetches = sorted(r[1] for r in recent)
+        parses = sorted(r[2] for r in recent)
+        summary = {
+            'crawler': self.crawler,
+            'window_seconds': self.window,
+            'pages': len(recent),
+            'pages_per_second': len(recent) / span if span > 0 else 0.,
+            'error_rate': sum(r[3] for r in recent) / len(recent) if recent else 0.
+        }
+        for q in QUANTILES:
+            summary[f'fetch_p{int(q * 100)}'] = quantile(fetches, q)
+            summary[f'parse_p{int(q * 100)}'] = quantile(parses, q)
+        summary['totals'] = totals
+        return summary
+
+    def print_summary(self, file=sys.stderr):
+        s = self.summary()
+        print(f"{s['crawler']}: {s['totals']['requests']} requests, {s['pages_per_second']:.2f} pages/s, "
+              f"{s['error_rate']:.1%} errors, fetch p50 {s['fetch_p50']:.3f}s p95 {s['fetch_p95']:.3f}s, "
+              f"parse p50 {s['parse_p50']:.3f}s p95 {s['parse_p95']:.3f}s", file=file)
+
+    def prometheus(self):
+        '''The summary in the Prometheus text exposition format.'''
+        s = self.summary()
+        t = s['totals']
+        label = f'crawler="{self.crawler}"'
+        lines = [
+            '# HELP crawl_requests_total Requests made, by status (0 = exception).',
+            '# TYPE crawl_requests_total counter'
+        ]
+        for status, count in sorted(t['statuses'].items()):
+            lines.append(f'crawl_requests_total{{{label},status="{status}"}} {count}')
+        for name, kind, help, value in [
+            ('crawl_errors_total', 'counter', 'Failed requests.', t['errors']),
+            ('crawl_bytes_total', 'counter', 'Bytes fetched.', t['bytes']),
+            ('crawl_retries_total', 'counter', 'Request retries.', t['retries']),
+            ('crawl_pages_per_second', 'gauge', 'Pages per second over the window.', s['pages_per_second']),
+            ('crawl_error_rate', 'gauge', 'Error fraction over the window.', s['error_rate'])
+        ]:
+            lines += [f'# HELP {name} {help}', f'# TYPE {name} {kind}', f'{name}{{{label}}} {value}']
+        for name, key, total in [('crawl_fetch_seconds', 'fetch', t['fetch_seconds']),
+                                 ('crawl_parse_seconds', 'parse', t['parse_seconds'])]:
+            lines += [f'# HELP {name} Per-request {key} time; quantiles over the window.',
+                      f'# TYPE {name} summary']
+            for q in QUANTILES:
+                lines.append(f'{name}{{{label},quantile="{q}"}} {s[f"{key}_p{int(q * 100)}"]}')
+            lines += [f'{name}_sum{{{label}}} {total}', f'{name}_count{{{label}}} {t["requests"]}']
+        return '\n'.join(lines) + '\n'
+
+    def serve(self, port, host='127.0.0.1'):
+        '''Serves /metrics (Prometheus text) and /summary (JSON) from a
+        daemon thread.
+        '''
+        telemetry = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, content_type = telemetry.prometheus().encode('utf-8'), 'text/plain; version=0.0.4'
+                elif self.path == '/summary':
+                    body, content_type = json.dumps(telemetry.summary()).encode('utf-8'), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        print(f'Serving crawl metrics on http://{host}:{self.server.server_address[1]}/metrics',
+              file=sys.stderr)
+        return self.server
+
+    def close(self):
+        self.print_summary()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server = None
+        if self.jsonl is not None:
+            self.jsonl.close()
+            self.jsonl = None
+
+
+def timed_request(telemetry, url):
+    '''telemetry.request(url), or an unrecorded timer if telemetry is None.'''
+    if telemetry is None:
+        return contextlib.nullcontext(RequestTimer(url))
+    return telemetry.request(url)
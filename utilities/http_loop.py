@@ -0,0 +1,105 @@
+'''Minimal HTTP/1.1 connection loop for the local asyncio servers.
+
+render_server.py and paint_server.py answer a handful of GET and POST
+paths from a long-running process. serve_connection() reads requests
+from a connection (with keep-alive), hands each to a
+`respond(method, target, body)` coroutine that returns
+(status, content type, body bytes), and writes the responses.
+RequestError becomes its status with the message as the body; any other
+exception is logged with its traceback and answered with a 500.
+
+    async def respond(method, target, body):
+        return (200, 'application/json', b'{}')
+
+    server = await asyncio.start_server(
+        lambda reader, writer: serve_connection(reader, writer, respond), host, port)
+'''
+
+import asyncio
+import sys
+import traceback
+
+
+MAX_HEADER_LINES = 100
+MAX_BODY_BYTES = 64 << 20
+
+REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    500: 'Internal Server Error'
+}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super(RequestError, self).__init__(message)
+        self.status = status
+
+
+async def read_request(reader, max_body_bytes=MAX_BODY_BYTES):
+    '''Returns (method, target, version, headers, body), or None at the
+    end of the connection or on a malformed request.
+    '''
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    headers = dict()
+    for _ in range(MAX_HEADER_LINES):
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        method, target, version = request_line.decode('latin-1').split()
+        length = int(headers.get('content-length', 0))
+    except ValueError:
+        return None
+    if not 0 <= length <= max_body_bytes:
+        return None
+    body = await reader.readexactly(length) if length else b''
+    return (method, target, version, headers, body)
+
+
+async def call_respond(respond, method, target, body):
+    '''Returns (status, content type, body) from respond, mapping errors
+    to their responses.
+    '''
+    try:
+        return await respond(method, target, body)
+    except RequestError as e:
+        return (e.status, 'text/plain', str(e).encode('utf-8'))
+    except Exception:
+        print(f'Error handling {method} {target}:', file=sys.stderr)
+        traceback.print_exc()
+        return (500, 'text/plain', b'Internal server error')
+
+
+async def serve_connection(reader, writer, respond, max_body_bytes=MAX_BODY_BYTES):
+    '''Answers the requests of one connection until it is closed.'''
+    try:
+        while True:
+            request = await read_request(reader, max_body_bytes)
+            if request is None:
+                break
+            method, target, version, headers, body = request
+            status, content_type, body = await call_respond(respond, method, target, body)
+
+            keep_alive = (headers.get('connection', '').lower() != 'close' and
+                          version == 'HTTP/1.1')
+            writer.write((
+                f'HTTP/1.1 {status} {REASONS.get(status, "")}\r\n'
+                f'Content-Type: {content_type}\r\n'
+                f'Content-Length: {len(body)}\r\n'
+                f'Connection: {"keep-alive" if keep_alive else "close"}\r\n'
+                '\r\n').encode('latin-1') + body)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
@@ -0,0 +1,50 @@
+'''Munsell hue labels and book pages, without numpy.
+
+The label tables behind munsell_hues, in plain Python, for scripts that
+only need to name and step through book pages and must start quickly
+(color_book.py --hues imports this instead of munsell_hues, which
+pulls in numpy). munsell_hues re-exports all of them.
+
+    PAGE_LABELS[7]                 # '7.5YR'
+    PAGE_FROM_LABEL['7.5YR']       # 7
+    page_ring(0, 2)                # [38, 39, 0, 1, 2]
+'''
+
+
+# Hue families in ASTM hue order: R runs from 0 (10RP) to 10 (10R).
+FAMILIES = ['R', 'YR', 'Y', 'GY', 'G', 'BG', 'B', 'PB', 'P', 'RP']
+
+HUE_CODES = {
+    'B': 1, 'BG': 2, 'G': 3, 'GY': 4, 'Y': 5,
+    'YR': 6, 'R': 7, 'RP': 8, 'P': 9, 'PB': 10
+}
+
+N_PAGES = 40
+PAGE_STEP = 100. / N_PAGES
+
+
+def astm_label(astm, shade_format='{:g}'):
+    '''One ASTM hue -> label like '2.5YR' or '10RP'.'''
+    family, shade = divmod(round(float(astm) % 100., 6), 10.)
+    if shade == 0:
+        family, shade = family - 1, 10.
+    return shade_format.format(shade) + FAMILIES[int(family) % 10]
+
+
+# Page p is labeled PAGE_LABELS[p]; PAGE_LABELS[0] is '10RP'.
+PAGE_LABELS = [astm_label(page * PAGE_STEP) for page in range(N_PAGES)]
+
+PAGE_FROM_LABEL = dict()
+for _page in range(N_PAGES):
+    for _format in ['{:g}', '{:.1f}']:
+        PAGE_FROM_LABEL[astm_label(_page * PAGE_STEP, _format)] = _page
+PAGE_FROM_LABEL['0R'] = 0
+
+
+def page_ring(page, radius):
+    '''The pages from `radius` steps before `page` to `radius` steps
+    after it, wrapping around 10RP, as a list.
+    '''
+    if not 0 <= radius <= N_PAGES // 2:
+        raise ValueError(f'Ring radius {radius} must be between 0 and {N_PAGES // 2}')
+    return [(page + k) % N_PAGES for k in range(-radius, radius + 1)]
@@ -0,0 +1,50 @@
+'''Encodes PIL images to PNG or WebP bytes in memory.
+
+Pages, cards and palettes are mostly flat swatches on white, so they
+usually fit a palette-mode PNG ('png8') of well under 256 colors,
+which is several times smaller than the RGB PNG.
+
+    png = encode_image(card.img, 'png8', dpi=(100, 100))
+    webp = encode_image(card.img, 'webp', quality=90)
+'''
+
+import io
+
+
+FORMATS = ['png', 'png8', 'webp']
+
+CONTENT_TYPES = {
+    'png': 'image/png',
+    'png8': 'image/png',
+    'webp': 'image/webp'
+}
+
+
+def to_palette(img, colors=256):
+    '''Converts an RGB image to palette mode. Median cut keeps images with
+    at most `colors` distinct colors exact, and quantizes the others.
+    '''
+    return img.quantize(colors=colors)
+
+
+def encode_image(img, format='png', dpi=None, compress_level=6, colors=256,
+                 quality=90, lossless=False):
+    '''Returns the encoded image bytes.
+
+    format is 'png', 'png8' (optimized palette-mode PNG, for flat
+    swatches) or 'webp'. compress_level (0 to 9) applies to PNG,
+    colors to 'png8', and quality and lossless to WebP.
+    '''
+    buffer = io.BytesIO()
+    options = dict()
+    if dpi is not None:
+        options['dpi'] = dpi
+    if format == 'png':
+        img.save(buffer, format='PNG', compress_level=compress_level, **options)
+    elif format == 'png8':
+        to_palette(img.convert('RGB'), colors).save(buffer, format='PNG', optimize=True, **options)
+    elif format == 'webp':
+        img.save(buffer, format='WEBP', quality=quality, lossless=lossless, method=6)
+    else:
+        raise ValueError(f'Unknown image format {format}, must be one of {", ".join(FORMATS)}')
+    return buffer.getvalue()
@@ -0,0 +1,134 @@
+'''Batch CIECAM02 JCh to Munsell conversion.
+
+The CIECAM02 inverse depends on terms derived from the viewing
+conditions only (luminance level adaptation, induction factors, the
+adapted white and its achromatic response). They are computed once per
+(white point, L_A, Y_b, surround) and cached, and whole arrays of JCh
+are then inverted to XYZ, adapted to illuminant C and converted to
+Munsell with munsell_inversion in one vectorized pass.
+
+The default viewing conditions are the ones used for the
+stilllifesmatter pigment data: a D65 white, L_A = 64 / pi * 0.2 cd/m2
+(a 64 lux room with a 20% gray background), Y_b = 20 and an average
+surround.
+
+    specs, converged = jch_to_munsell_specifications(jch)  # (N, 3) -> (N, 4), (N,)
+    XYZ = jch_to_XYZ(jch, viewing_conditions(L_A=100.))
+'''
+
+import collections
+import functools
+
+import numpy as np
+
+import colour
+from colour.appearance.ciecam02 import (CAT_CAT02, CAT_INVERSE_CAT02, MATRIX_HPE_TO_XYZ,
+                                        MATRIX_XYZ_TO_HPE, VIEWING_CONDITIONS_CIECAM02)
+
+from munsell_inversion import ILLUMINANT_C, XYZ_to_xyY, xyY_to_munsell_specifications
+
+
+WHITE_D65 = tuple(colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65'])
+L_A = 64. / np.pi * 0.2
+Y_B = 20.
+SURROUND = 'Average'
+
+# CAT02 adapted RGB -> Hunt-Pointer-Estevez RGB, and back
+_CAT02_TO_HPE = MATRIX_XYZ_TO_HPE @ CAT_INVERSE_CAT02
+_HPE_TO_CAT02 = CAT_CAT02 @ MATRIX_HPE_TO_XYZ
+
+ViewingConditions = collections.namedtuple('ViewingConditions', [
+    'XYZ_w', 'L_A', 'Y_b', 'surround',
+    'F_L', 'n', 'z', 'N_bb', 'N_cb', 'c', 'N_c', 'D_RGB', 'A_w', 't_scale'])
+
+
+def _post_adaptation(RGB, F_L):
+    x = (F_L * np.abs(RGB) / 100.) ** 0.42
+    return np.sign(RGB) * 400. * x / (27.13 + x) + 0.1
+
+
+@functools.lru_cache(maxsize=64)
+def viewing_conditions(white=WHITE_D65, L_A=L_A, Y_b=Y_B, surround=SURROUND):
+    '''Returns the derived viewing-condition terms for a white point
+    (xy chromaticity, scaled to Y = 100), adapting luminance L_A (cd/m2),
+    background luminance factor Y_b and surround ('Average', 'Dim' or
+    'Dark'). Results are cached, so pass hashable tuples.
+    '''
+    factors = VIEWING_CONDITIONS_CIECAM02[surround]
+    F, c, N_c = factors.F, factors.c, factors.N_c
+    XYZ_w = colour.xy_to_XYZ(np.array(white)) * 100.
+    Y_w = XYZ_w[1]
+
+    k = 1. / (5. * L_A + 1.)
+    F_L = 0.2 * k ** 4 * (5. * L_A) + 0.1 * (1. - k ** 4) ** 2 * (5. * L_A) ** (1. / 3.)
+    n = Y_b / Y_w
+    z = 1.48 + np.sqrt(n)
+    N_bb = N_cb = 0.725 * (1. / n) ** 0.2
+    D = np.clip(F * (1. - (1. / 3.6) * np.exp((-L_A - 42.) / 92.)), 0., 1.)
+
+    RGB_w = CAT_CAT02 @ XYZ_w
+    D_RGB = D * Y_w / RGB_w + 1. - D
+    RGB_aw = _post_adaptation(_CAT02_TO_HPE @ (D_RGB * RGB_w), F_L)
+    A_w = (2. * RGB_aw[0] + RGB_aw[1] + RGB_aw[2] / 20. - 0.305) * N_bb
+    t_scale = (1.64 - 0.29 ** n) ** 0.73
+    return ViewingConditions(XYZ_w, L_A, Y_b, surround,
+                             F_L, n, z, N_bb, N_cb, c, N_c, D_RGB, A_w, t_scale)
+
+
+def jch_to_XYZ(jch, conditions=None):
+    '''(N, 3) CIECAM02 JCh -> (N, 3) XYZ (0 to 100), relative to the
+    white of the viewing conditions (default: viewing_conditions()).
+    '''
+    vc = conditions or viewing_conditions()
+    jch = np.asarray(jch, dtype=float).reshape(-1, 3)
+    J, C, h = jch[:, 0], jch[:, 1], np.radians(jch[:, 2])
+    root_J = np.sqrt(np.maximum(J, 0.) / 100.)
+
+    t = (C / np.where(root_J > 0, root_J, np.inf) / vc.t_scale) ** (1. / 0.9)
+    e_t = 0.25 * (np.cos(h + 2.) + 3.8)
+    A = vc.A_w * (np.maximum(J, 0.) / 100.) ** (1. / (vc.c * vc.z))
+
+    # Opponent dimensions a and b
+    p1 = (50000. / 13.) * vc.N_c * vc.N_cb * e_t / np.where(t > 0, t, 1.)
+    p2 = A / vc.N_bb + 0.305
+    p3 = 21. / 20.
+    sin_h, cos_h = np.sin(h), np.cos(h)
+    use_sin = np.abs(sin_h) >= np.abs(cos_h)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        b_sin = (p2 * (2. + p3) * (460. / 1403.) /
+                 (p1 / sin_h + (2. + p3) * (220. / 1403.) * (cos_h / sin_h) - 27. / 1403. + p3 * (6300. / 1403.)))
+        a_cos = (p2 * (2. + p3) * (460. / 1403.) /
+                 (p1 / cos_h + (2. + p3) * (220. / 1403.) - (27. / 1403. - p3 * (6300. / 1403.)) * (sin_h / cos_h)))
+        a = np.where(use_sin, b_sin * cos_h / sin_h, a_cos)
+        b = np.where(use_sin, b_sin, a_cos * sin_h / cos_h)
+    achromatic = t <= 0
+    a = np.where(achromatic, 0., a)
+    b = np.where(achromatic, 0., b)
+
+    RGB_a = np.stack([
+        460. * p2 + 451. * a + 288. * b,
+        460. * p2 - 891. * a - 261. * b,
+        460. * p2 - 220. * a - 6300. * b], axis=-1) / 1403.
+    x = np.abs(RGB_a - 0.1)
+    RGB_p = np.sign(RGB_a - 0.1) * (100. / vc.F_L) * (27.13 * x / (400. - x)) ** (1. / 0.42)
+    RGB = (RGB_p @ _HPE_TO_CAT02.T) / vc.D_RGB
+    return RGB @ CAT_INVERSE_CAT02.T
+
+
+def XYZ_to_xyY_C(XYZ, white=WHITE_D65):
+    '''(N, 3) XYZ (0 to 100) under `white` -> (N, 3) xyY (Y from 0 to 1)
+    adapted to illuminant C (Bradford).
+    '''
+    XYZ = colour.chromatic_adaptation(
+        np.asarray(XYZ, dtype=float).reshape(-1, 3) / 100., colour.xy_to_XYZ(np.array(white)),
+        colour.xy_to_XYZ(ILLUMINANT_C), method='Von Kries', transform='Bradford')
+    return XYZ_to_xyY(XYZ)
+
+
+def jch_to_munsell_specifications(jch, white=WHITE_D65, L_A=L_A, Y_b=Y_B, surround=SURROUND):
+    '''Returns ((N, 4) Munsell specifications, (N,) converged mask) for
+    an (N, 3) array of CIECAM02 JCh.
+    '''
+    conditions = viewing_conditions(tuple(white), float(L_A), float(Y_b), surround)
+    XYZ = jch_to_XYZ(jch, conditions)
+    return xyY_to_munsell_specifications(XYZ_to_xyY_C(XYZ, white))
@@ -0,0 +1,256 @@
+'''Memoized RGB to Munsell conversions shared by the utilities.
+
+Paint catalogs repeat the same 8-bit RGB triples many times, within
+and across brands, so each converter keeps a bounded LRU cache of
+Munsell specifications keyed on (algorithm, RGB), and can also keep
+them in an SQLite file that survives between runs.
+
+    converter = get_converter('lindbloom', cache_path='munsell_cache.db')
+    spec = converter.rgb_to_munsell_specification(176, 27, 33)
+    specs = converter.rgb_to_munsell_specifications(rgbs)  # (N, 3) -> (N, 4)
+    print(converter.format_stats())
+'''
+
+import collections
+import sqlite3
+
+import numpy as np
+
+import munsellkit.lindbloom as mlin
+import munsellkit.minterpol as mint
+
+import munsell_inversion
+
+
+def lattice_rgb_to_munsell_specification(r, g, b):
+    specs, _ = munsell_inversion.rgb_to_munsell_specifications([[r, g, b]])
+    return specs[0]
+
+
+ALGORITHMS = {
+    'lindbloom': mlin.rgb_to_munsell_specification,
+    'minterpol': mint.rgb_to_munsell_specification,
+    'lattice': lattice_rgb_to_munsell_specification
+}
+
+# Algorithms that convert an (N, 3) RGB array at once, returning
+# ((N, 4) specifications, (N,) converged mask)
+BATCH_ALGORITHMS = {
+    'lattice': munsell_inversion.rgb_to_munsell_specifications
+}
+
+# Converts the colors a batch algorithm did not converge on
+FALLBACK_ALGORITHM = 'lindbloom'
+
+DEFAULT_MAXSIZE = 65536
+
+
+def rgb_key(r, g, b):
+    '''Packs an 8-bit RGB triple into a single int.'''
+    r, g, b = [min(255, max(0, int(round(float(v))))) for v in (r, g, b)]
+    return (r << 16) | (g << 8) | b
+
+
+def key_rgb(key):
+    return ((key >> 16) & 0xFF, (key >> 8) & 0xFF, key & 0xFF)
+
+
+class LRUCache:
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self.data = collections.OrderedDict()
+
+    def get(self, key):
+        value = self.data.get(key)
+        if value is not None:
+            self.data.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self.data[key] = value
+        self.data.move_to_end(key)
+        if len(self.data) > self.maxsize:
+            self.data.popitem(last=False)
+
+    def __len__(self):
+        return len(self.data)
+
+
+class PersistentCache:
+    '''Munsell specifications stored in an SQLite database.
+
+    The database is in WAL mode, so readers never wait for a writer,
+    and new specifications are kept in memory and written in one short
+    transaction every `commit_every` puts. Several processes can share
+    one file: each holds the write lock only while it flushes.
+    '''
+
+    def __init__(self, path, commit_every=1000):
+        self.path = path
+        self.commit_every = commit_every
+        self.pending = dict()
+        # Autocommit: reads take no lock, writes are explicit transactions
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('''CREATE TABLE IF NOT EXISTS specs (
+            algorithm TEXT NOT NULL,
+            rgb INTEGER NOT NULL,
+            hue REAL, value REAL, chroma REAL, code REAL,
+            PRIMARY KEY (algorithm, rgb))''')
+
+    def get(self, algorithm, key):
+        spec = self.pending.get((algorithm, key))
+        if spec is not None:
+            return np.array(spec, dtype=float)
+        row = self.conn.execute(
+            'SELECT hue, value, chroma, code FROM specs WHERE algorithm = ? AND rgb = ?',
+            (algorithm, key)).fetchone()
+        if row is None:
+            return None
+        return np.array(row, dtype=float)
+
+    def put(self, algorithm, key, spec):
+        self.pending[(algorithm, key)] = [float(v) for v in spec]
+        if len(self.pending) >= self.commit_every:
+            self.commit()
+
+    def commit(self):
+        '''Writes the pending specifications in one transaction.'''
+        if not self.pending:
+            return
+        with self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO specs VALUES (?, ?, ?, ?, ?, ?)',
+                [(algorithm, key, *spec) for (algorithm, key), spec in self.pending.items()])
+        self.pending.clear()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
+
+
+class MunsellConverter:
+    def __init__(self, algorithm='lindbloom', maxsize=DEFAULT_MAXSIZE, cache_path=None):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f'Unknown algorithm {algorithm}, must be one of {", ".join(ALGORITHMS)}')
+        self.algorithm = algorithm
+        self.convert = ALGORITHMS[algorithm]
+        self.cache = LRUCache(maxsize)
+        self.persistent = PersistentCache(cache_path) if cache_path else None
+        self.closed = False
+        self.hits = 0
+        self.persistent_hits = 0
+        self.misses = 0
+
+    def lookup(self, key):
+        '''Returns the cached specification for an RGB key, or None.'''
+        spec = self.cache.get(key)
+        if spec is not None:
+            self.hits += 1
+            return spec
+
+        if self.persistent is not None:
+            spec = self.persistent.get(self.algorithm, key)
+            if spec is not None:
+                self.persistent_hits += 1
+                self.cache.put(key, spec)
+                return spec
+        return None
+
+    def convert_keys(self, keys):
+        '''Converts RGB keys that are not in the caches, and caches them.'''
+        self.misses += len(keys)
+        batch = BATCH_ALGORITHMS.get(self.algorithm)
+        if batch is None:
+            specs = [np.array(self.convert(*key_rgb(key)), dtype=float) for key in keys]
+        else:
+            specs, converged = batch(np.array([key_rgb(key) for key in keys], dtype=float))
+            for i in np.flatnonzero(~converged):
+                specs[i] = ALGORITHMS[FALLBACK_ALGORITHM](*key_rgb(keys[i]))
+        for key, spec in zip(keys, specs):
+            self.cache.put(key, spec)
+            if self.persistent is not None:
+                self.persistent.put(self.algorithm, key, spec)
+        return specs
+
+    def rgb_to_munsell_specification(self, r, g, b):
+        '''Returns the Munsell specification for the 8-bit RGB color,
+        as a new float array of shape (4,).
+        '''
+        key = rgb_key(r, g, b)
+        spec = self.lookup(key)
+        if spec is None:
+            spec = self.convert_keys([key])[0]
+        return np.array(spec, dtype=float)
+
+    def rgb_to_munsell_specifications(self, rgbs):
+        '''Returns the Munsell specifications for an (N, 3) array of 8-bit
+        RGB colors, as a new float array of shape (N, 4). The cache misses
+        are converted together, in one call for batch algorithms.
+        '''
+        keys = [rgb_key(*rgb) for rgb in np.asarray(rgbs).reshape(-1, 3)]
+        specs = np.empty((len(keys), 4))
+        missing = dict()
+        for i, key in enumerate(keys):
+            if key in missing:
+                # Repeated in this batch: converted once, with the first
+                self.hits += 1
+                missing[key].append(i)
+                continue
+            spec = self.lookup(key)
+            if spec is None:
+                missing[key] = [i]
+            else:
+                specs[i] = spec
+        if missing:
+            for key, spec in zip(missing, self.convert_keys(list(missing))):
+                specs[missing[key]] = spec
+        return specs
+
+    def stats(self):
+        lookups = self.hits + self.persistent_hits + self.misses
+        return {
+            'algorithm': self.algorithm,
+            'lookups': lookups,
+            'hits': self.hits,
+            'persistent_hits': self.persistent_hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits + self.persistent_hits) / lookups if lookups else 0.,
+            'cached': len(self.cache)
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        return (f"{s['algorithm']}: {s['lookups']} lookups, {s['hits']} hits, "
+                f"{s['persistent_hits']} persistent hits, {s['misses']} misses "
+                f"({100. * s['hit_rate']:.1f}% hit rate)")
+
+    def flush(self):
+        '''Writes pending conversions to the persistent cache, if any.'''
+        if self.persistent is not None:
+            self.persistent.commit()
+
+    def close(self):
+        if self.persistent is not None:
+            self.persistent.close()
+            self.persistent = None
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+_converters = dict()
+
+def get_converter(algorithm='lindbloom', cache_path=None):
+    '''Returns the converter shared by everything in this process
+    (a new one if the last was closed).
+    '''
+    key = (algorithm, cache_path)
+    if key not in _converters or _converters[key].closed:
+        _converters[key] = MunsellConverter(algorithm, cache_path=cache_path)
+    return _converters[key]
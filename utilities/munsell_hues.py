@@ -0,0 +1,123 @@
+'''Munsell hues as numbers.
+
+A hue is an ASTM hue, a float running around the hue circle from 0 to
+100, with 0 (and 100) = 10RP, 2.5 = 2.5R, 10 = 10R, ... 97.5 = 7.5RP.
+The 40 hues of a Munsell book are pages 0 to 39 (page p is ASTM hue
+p * 2.5, so page 0 is 10RP), and labels are only made or parsed at the
+edges, through precomputed tables. All functions take scalars or numpy
+arrays.
+
+Specifications follow colour-science: (hue shade, value, chroma, hue
+code), with hue code 1 = B, 2 = BG, ... 10 = PB.
+
+    page = PAGE_FROM_LABEL['7.5YR']              # 7
+    shades, codes = hue_specification(astm_hues)
+    hue_label(12.5)                              # '2.5YR'
+    PAGE_LABELS[hue_ring(page, 2)]               # the 5 pages around 7.5YR
+    dh = hue_difference(astm_hues, 97.5)         # -50 to 50
+
+The label tables are built in hue_tables, which has no numpy import.
+'''
+
+import re
+
+import numpy as np
+
+import hue_tables
+from hue_tables import FAMILIES, HUE_CODES, N_PAGES, PAGE_FROM_LABEL, PAGE_STEP, astm_label
+
+# ASTM hue of shade 0 in each family, by hue code (index 0 unused).
+_CODE_ORIGINS = np.array([np.nan] + [((17 - code) % 10) * 10. for code in range(1, 11)])
+
+
+def _scalar(x):
+    '''Unwraps 0-d arrays, so scalar arguments give scalar results.'''
+    return x[()] if isinstance(x, np.ndarray) and x.ndim == 0 else x
+
+
+def astm_hue(shade, code):
+    '''(hue shade, hue code) -> ASTM hue, 0 to 100 (0 = 10RP).
+    NaN shades or codes (neutrals) give NaN.
+    '''
+    shade = np.asarray(shade, dtype=float)
+    code = np.asarray(code, dtype=float)
+    valid = (code >= 1) & (code <= 10)
+    origin = _CODE_ORIGINS[np.where(valid, code, 0).astype(np.int64)]
+    return _scalar((origin + shade) % 100.)
+
+
+def hue_specification(astm):
+    '''ASTM hue -> (hue shade, hue code), with shades in (0, 10], so
+    that 0 and 100 both give (10, 8), that is 10RP. NaN gives NaN.
+    '''
+    astm = np.asarray(astm, dtype=float) % 100.
+    family, shade = np.divmod(astm, 10.)
+    zero = shade == 0
+    family = np.where(zero, family - 1, family)
+    shade = np.where(zero, 10., shade)
+    code = (17 - family) % 10
+    code = np.where(code == 0, 10., code)
+    return (_scalar(shade), _scalar(code))
+
+
+def page_of(astm):
+    '''ASTM hue -> nearest book page, 0 to 39 (-1 for NaN).'''
+    astm = np.asarray(astm, dtype=float)
+    page = np.rint(np.nan_to_num(astm, nan=0.) / PAGE_STEP).astype(np.int64) % N_PAGES
+    return _scalar(np.where(np.isnan(astm), -1, page))
+
+
+def hue_label(astm, shade_format='{:g}'):
+    '''ASTM hue -> label like '2.5YR' or '10RP' ('N' for NaN).
+    shade_format '{:.1f}' gives labels like '5.0R'. Arrays give lists.
+    '''
+    labels = [astm_label(h, shade_format) if not np.isnan(h) else 'N'
+              for h in np.asarray(astm, dtype=float).reshape(-1)]
+    return labels if np.ndim(astm) > 0 else labels[0]
+
+
+# Page p is labeled PAGE_LABELS[p]; PAGE_LABELS[0] is '10RP'.
+PAGE_LABELS = np.array(hue_tables.PAGE_LABELS)
+
+HUE_RE = re.compile(r'^\s*([0-9]*\.?[0-9]+)\s*(RP|YR|GY|BG|PB|[BGPRY])\s*$')
+
+
+def parse_hue(label):
+    '''Label like '7.5YR' or '5.0R' -> ASTM hue. 'N' gives NaN.
+    Raises ValueError if the label cannot be parsed.
+    '''
+    page = PAGE_FROM_LABEL.get(label)
+    if page is not None:
+        return page * PAGE_STEP
+    label = label.strip().upper()
+    if label == 'N':
+        return np.nan
+    m = HUE_RE.match(label)
+    if m is None or float(m.group(1)) > 10.:
+        raise ValueError(f'"{label}" is not a valid Munsell hue')
+    return float(astm_hue(float(m.group(1)), HUE_CODES[m.group(2)]))
+
+
+# NEIGHBOR_PAGES[p, N_PAGES // 2 + k] is the page k steps from page p,
+# for k from -20 to 20.
+NEIGHBOR_PAGES = (np.arange(N_PAGES)[:, np.newaxis] +
+                  np.arange(-(N_PAGES // 2), N_PAGES // 2 + 1)[np.newaxis, :]) % N_PAGES
+
+
+def hue_ring(page, radius):
+    '''Pages from `radius` steps before `page` to `radius` steps after it,
+    wrapping around 10RP. page may be an array, giving one row per page.
+    '''
+    if not 0 <= radius <= N_PAGES // 2:
+        raise ValueError(f'Ring radius {radius} must be between 0 and {N_PAGES // 2}')
+    center = N_PAGES // 2
+    return NEIGHBOR_PAGES[np.asarray(page) % N_PAGES, center - radius:center + radius + 1]
+
+
+def hue_difference(h1, h2):
+    '''ASTM hue difference h1 - h2, wrapped to [-50, 50).
+    The difference with a neutral (NaN hue) is NaN: a neutral has no
+    hue to compare, so callers must handle neutrals separately.
+    '''
+    dh = (np.asarray(h1, dtype=float) - np.asarray(h2, dtype=float) + 50.) % 100. - 50.
+    return _scalar(dh)
@@ -0,0 +1,327 @@
+'''Batch xyY to Munsell inversion.
+
+The per-color solvers (colour-science, munsellkit's minterpol and
+lindbloom) run their convergence loop in Python for each color. Here
+the renotation data (colour-science's MUNSELL_COLOURS_ALL, values 1 to
+9, with white as value 10, as colour-science interpolates) is kept as a
+polar lattice around the illuminant C grey point, and every step works
+on whole arrays:
+
+1. The value comes straight from Y (ASTM D1535).
+2. Each color is seeded with a hue read from a precomputed hue angle
+   table of its value plane, and a chroma from the lattice radius at
+   that hue.
+3. Newton steps on the hue angle and ratio steps on the radius move
+   all the unconverged colors at once, with the lattice (radially
+   interpolated across hues, linearly across chromas and in Y across
+   values) as the forward model.
+
+Colors whose chromaticity is still farther than `tolerance` from the
+target after `iterations` steps, and chromatic colors with a value
+outside the lattice (below 1, or 10 and above), come back flagged in a
+mask, for a per-color solver to handle. Chromas
+beyond the renotation data are extrapolated from the last two chromas
+of each hue and value, and flagged as such in `invert()`.
+
+    specs, converged = xyY_to_munsell_specifications(xyY)
+    specs, converged = rgb_to_munsell_specifications(rgbs)  # 8-bit sRGB
+'''
+
+import functools
+
+import numpy as np
+
+import colour
+from colour.notation import munsell as cnm
+from colour.notation.datasets.munsell import MUNSELL_COLOURS_ALL
+
+from munsell_hues import N_PAGES, PAGE_STEP, hue_specification, parse_hue
+
+
+ILLUMINANT_C = colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['C']
+
+# Value planes of the lattice. As in colour-science, the value 10 plane
+# is the illuminant C grey point: colors between values 9 and 10 are
+# interpolated in Y between the value 9 plane and white.
+VALUES = np.arange(1., 11.)
+MAX_CHROMA = 50.
+CHROMA_STEP = 2.
+
+# Chromaticities closer than this to illuminant C are neutral.
+NEUTRAL_RHO = 1e-3
+
+# Hue samples of the seed table, in ASTM hue units
+SEED_HUE_STEP = 0.5
+SEED_CHROMA = 6.
+
+TWO_PI = 2. * np.pi
+
+
+def _wrap_angle(a):
+    return (a + np.pi) % TWO_PI - np.pi
+
+
+class MunsellLattice:
+    '''Polar renotation lattice, indexed by (hue page, value - 1, chroma / 2).
+    The last value plane (10) has radius 0 everywhere.
+    '''
+
+    def __init__(self):
+        n_values = len(VALUES)
+        n_chromas = int(MAX_CHROMA / CHROMA_STEP) + 1
+        xc, yc = ILLUMINANT_C
+        theta = np.full((N_PAGES, n_values, n_chromas), np.nan)
+        rho = np.full((N_PAGES, n_values, n_chromas), np.nan)
+        for (hue, value, chroma), (x, y, _) in MUNSELL_COLOURS_ALL:
+            if value not in VALUES[:-1]:
+                continue
+            page = int(round(parse_hue(hue) / PAGE_STEP)) % N_PAGES
+            v, c = int(value) - 1, int(round(chroma / CHROMA_STEP))
+            theta[page, v, c] = np.arctan2(y - yc, x - xc)
+            rho[page, v, c] = np.hypot(x - xc, y - yc)
+
+        # Chromas with renotation data, per page and value
+        known = ~np.isnan(rho)
+        known[:, :, 0] = False
+        self.max_chroma = np.where(known.any(axis=2),
+                                   (n_chromas - 1 - np.argmax(known[:, :, ::-1], axis=2)) * CHROMA_STEP, 0.)
+
+        # Fill chroma 0 (grey) and extrapolate past the data
+        for page in range(N_PAGES):
+            for v in range(n_values - 1):
+                cs = np.flatnonzero(known[page, v])
+                t = np.unwrap(theta[page, v, cs])
+                theta[page, v] = np.interp(np.arange(n_chromas), cs, t)
+                r = rho[page, v, cs]
+                slope = (r[-1] - r[-2]) / (cs[-1] - cs[-2]) if len(cs) > 1 else r[-1] / cs[-1]
+                rho[page, v] = np.interp(np.arange(n_chromas), np.concatenate([[0], cs]),
+                                         np.concatenate([[0.], r]))
+                beyond = np.arange(n_chromas) > cs[-1]
+                rho[page, v, beyond] = r[-1] + slope * (np.arange(n_chromas)[beyond] - cs[-1])
+        theta[:, -1] = theta[:, -2]
+        rho[:, -1] = 0.
+        self.theta = _wrap_angle(theta)
+        self.rho = rho
+        self.linear = self._interpolation_methods(known)
+
+        # Everything needed to interpolate from page p to page p + 1, by
+        # flat (p, value - 1, chroma / 2) index: start angle, angle change,
+        # start radius, radius change, start x, y, x and y changes, linear.
+        x, y = rho * np.cos(self.theta), rho * np.sin(self.theta)
+        following = lambda a: np.roll(a, -1, axis=0)
+        self.segments = np.stack([
+            self.theta, _wrap_angle(following(self.theta) - self.theta),
+            rho, following(rho) - rho,
+            x, y, following(x) - x, following(y) - y,
+            self.linear.astype(float)], axis=-1).reshape(-1, 9)
+        self.value_Y = cnm.luminance_ASTMD1535(VALUES) / 100.
+        self._build_seeds()
+
+    def _interpolation_methods(self, known):
+        '''True where colour-science interpolates linearly in xy (rather
+        than radially) between page p and page p + 1, by (p, value - 1,
+        chroma / 2), following Centore's ovoid rules. Past the data, the
+        method of the last chroma is kept.
+        '''
+        linear = np.zeros(known.shape, dtype=bool)
+        shades, codes = hue_specification((np.arange(N_PAGES) + 0.5) * PAGE_STEP)
+        for page in range(N_PAGES):
+            for v, value in enumerate(VALUES[:-1]):
+                last = max(np.flatnonzero(known[page, v]).max(),
+                           np.flatnonzero(known[(page + 1) % N_PAGES, v]).max())
+                for c in range(1, last + 1):
+                    method = cnm.interpolation_method_from_renotation_ovoid(
+                        [shades[page], value, c * CHROMA_STEP, codes[page]])
+                    linear[page, v, c] = method == 'Linear'
+                linear[page, v, last + 1:] = linear[page, v, last]
+        linear[:, -1] = linear[:, -2]
+        return linear
+
+    def _build_seeds(self):
+        '''Hue angle at SEED_CHROMA around each value plane, unwrapped to
+        increase with ASTM hue, for looking up seed hues.
+        '''
+        hues = np.arange(0., 100. + SEED_HUE_STEP / 2, SEED_HUE_STEP)
+        self.seed_hues = hues
+        self.seed_theta = np.zeros((len(VALUES) - 1, len(hues)))
+        for v, value in enumerate(VALUES[:-1]):
+            x, y = self.forward(hues, np.full(len(hues), value), np.full(len(hues), SEED_CHROMA))
+            self.seed_theta[v] = np.unwrap(np.arctan2(y - ILLUMINANT_C[1], x - ILLUMINANT_C[0]))
+
+    def forward(self, hues, values, chromas):
+        '''(ASTM hues, values, chromas) arrays -> (x, y) arrays.'''
+        p = (hues % 100.) / PAGE_STEP
+        p0 = np.floor(p).astype(np.int64) % N_PAGES
+        tp = p - np.floor(p)
+
+        vv = np.clip(values, VALUES[0], VALUES[-1])
+        v0 = np.clip(np.floor(vv).astype(np.int64) - 1, 0, len(VALUES) - 2)
+        v1 = v0 + 1
+        Y = cnm.luminance_ASTMD1535(vv) / 100.
+        tv = (Y - self.value_Y[v0]) / (self.value_Y[v1] - self.value_Y[v0])
+
+        cc = np.clip(chromas, 0., MAX_CHROMA) / CHROMA_STEP
+        c0 = np.clip(np.floor(cc).astype(np.int64), 0, self.rho.shape[2] - 2)
+        c1 = c0 + 1
+        tc = cc - c0
+
+        n_values, n_chromas = self.rho.shape[1:]
+
+        def hue_xy(v, c):
+            t0, dt, r0, dr, x0, y0, dx, dy, linear = self.segments[
+                (p0 * n_values + v) * n_chromas + c].T
+            # Radial: interpolate the angle and radius
+            theta = t0 + tp * dt
+            rho = r0 + tp * dr
+            return (np.where(linear > 0, x0 + tp * dx, rho * np.cos(theta)),
+                    np.where(linear > 0, y0 + tp * dy, rho * np.sin(theta)))
+
+        def chroma_xy(v):
+            x0, y0 = hue_xy(v, c0)
+            x1, y1 = hue_xy(v, c1)
+            return (x0 + tc * (x1 - x0), y0 + tc * (y1 - y0))
+
+        x0, y0 = chroma_xy(v0)
+        x1, y1 = chroma_xy(v1)
+        return (ILLUMINANT_C[0] + x0 + tv * (x1 - x0), ILLUMINANT_C[1] + y0 + tv * (y1 - y0))
+
+    def polar(self, hues, values, chromas):
+        x, y = self.forward(hues, values, chromas)
+        dx, dy = x - ILLUMINANT_C[0], y - ILLUMINANT_C[1]
+        return (np.arctan2(dy, dx), np.hypot(dx, dy), x, y)
+
+    def seed(self, theta, rho, values):
+        '''Seed ASTM hues and chromas for target hue angles and radii.'''
+        hues = np.zeros(len(theta))
+        planes = np.clip(np.rint(values).astype(np.int64) - 1, 0, len(VALUES) - 2)
+        for v in np.unique(planes):
+            mask = planes == v
+            table = self.seed_theta[v]
+            t = table[0] + (theta[mask] - table[0]) % TWO_PI
+            hues[mask] = np.interp(t, table, self.seed_hues)
+        hues %= 100.
+        _, rho_ref, _, _ = self.polar(hues, values, np.full(len(hues), SEED_CHROMA))
+        chromas = SEED_CHROMA * rho / np.maximum(rho_ref, 1e-9)
+        return (hues, np.clip(chromas, 0., MAX_CHROMA))
+
+    def max_chroma_at(self, hues, values):
+        '''Renotation data chroma limit, interpolated like the lattice.'''
+        p = (hues % 100.) / PAGE_STEP
+        p0 = np.floor(p).astype(np.int64) % N_PAGES
+        p1 = (p0 + 1) % N_PAGES
+        # Up to the last plane with data (value 9)
+        v0 = np.clip(np.floor(values).astype(np.int64) - 1, 0, len(VALUES) - 2)
+        v1 = np.clip(np.ceil(values).astype(np.int64) - 1, 0, len(VALUES) - 2)
+        return np.minimum.reduce([self.max_chroma[p, v] for p in (p0, p1) for v in (v0, v1)])
+
+
+@functools.lru_cache(maxsize=None)
+def get_lattice():
+    '''Returns the lattice shared by everything in this process.'''
+    return MunsellLattice()
+
+
+def invert(xyY, iterations=32, tolerance=1e-6, hue_delta=0.05):
+    '''Inverts an (N, 3) array of xyY (illuminant C, Y from 0 to 1).
+
+    Returns a dict of arrays: 'astm_hue', 'value', 'chroma', 'neutral',
+    'converged', 'extrapolated' (chroma past the renotation data),
+    'residual' (xy distance to the target) and 'iterations'.
+    '''
+    lattice = get_lattice()
+    xyY = np.asarray(xyY, dtype=float).reshape(-1, 3)
+    n = len(xyY)
+    x, y, Y = xyY[:, 0], xyY[:, 1], xyY[:, 2]
+    values = cnm.munsell_value_ASTMD1535(np.clip(Y, 0., None) * 100.)
+    dx, dy = x - ILLUMINANT_C[0], y - ILLUMINANT_C[1]
+    theta, rho = np.arctan2(dy, dx), np.hypot(dx, dy)
+    neutral = rho < NEUTRAL_RHO
+
+    hues = np.full(n, np.nan)
+    chromas = np.zeros(n)
+    residual = np.zeros(n)
+    steps = np.zeros(n, dtype=np.int64)
+    active = np.flatnonzero(~neutral & np.isfinite(rho))
+    if len(active):
+        hues[active], chromas[active] = lattice.seed(theta[active], rho[active], values[active])
+
+    for step in range(iterations + 1):
+        if len(active) == 0:
+            break
+        h, v, c = hues[active], values[active], chromas[active]
+        t, r, xa, ya = lattice.polar(h, v, c)
+        residual[active] = np.hypot(xa - x[active], ya - y[active])
+        steps[active] = step
+        moving = residual[active] >= tolerance
+        if step == iterations:
+            break
+        active, h, v, c, t, r = [a[moving] for a in (active, h, v, c, t, r)]
+
+        # Newton step on the hue angle, with a finite difference slope
+        t2, _, _, _ = lattice.polar(h + hue_delta, v, c)
+        slope = _wrap_angle(t2 - t) / hue_delta
+        slope = np.where(slope > 1e-4, slope, TWO_PI / 100.)
+        dh = np.clip(_wrap_angle(theta[active] - t) / slope, -5., 5.)
+        hues[active] = (h + dh) % 100.
+        chromas[active] = np.clip(c * rho[active] / np.maximum(r, 1e-9), 0., MAX_CHROMA)
+
+    in_lattice = neutral | ((values >= VALUES[0]) & (values < VALUES[-1]))
+    converged = (residual < tolerance) & np.isfinite(values) & in_lattice
+    chromatic = ~neutral
+    extrapolated = np.zeros(n, dtype=bool)
+    extrapolated[chromatic] = (chromas[chromatic] >
+                               lattice.max_chroma_at(hues[chromatic], values[chromatic]) + 1e-6)
+    return {
+        'astm_hue': hues,
+        'value': values,
+        'chroma': np.where(neutral, 0., chromas),
+        'neutral': neutral,
+        'converged': converged,
+        'extrapolated': extrapolated,
+        'residual': residual,
+        'iterations': steps
+    }
+
+
+def result_specifications(result):
+    '''colour-science style (N, 4) specifications from an `invert` result,
+    with neutrals as (nan, value, nan, nan).
+    '''
+    shades, codes = hue_specification(result['astm_hue'])
+    specs = np.stack([shades, result['value'], result['chroma'], codes], axis=-1)
+    specs[result['neutral']] = [np.nan, 0., np.nan, np.nan]
+    specs[result['neutral'], 1] = result['value'][result['neutral']]
+    return specs
+
+
+def xyY_to_munsell_specifications(xyY, iterations=32, tolerance=1e-6):
+    '''Returns ((N, 4) specifications, (N,) converged mask) for an
+    (N, 3) array of xyY (illuminant C, Y from 0 to 1).
+    '''
+    result = invert(xyY, iterations, tolerance)
+    return (result_specifications(result), result['converged'])
+
+
+def XYZ_to_xyY(XYZ):
+    '''(N, 3) XYZ -> (N, 3) xyY, with black at the illuminant C chromaticity.'''
+    XYZ = np.asarray(XYZ, dtype=float).reshape(-1, 3)
+    total = XYZ.sum(axis=1)
+    black = total <= 0
+    xy = np.where(black[:, np.newaxis], ILLUMINANT_C, XYZ[:, :2] / np.where(black, 1., total)[:, np.newaxis])
+    return np.column_stack([xy, XYZ[:, 1]])
+
+
+def rgb_to_xyY(rgbs):
+    '''(N, 3) 8-bit sRGB -> (N, 3) xyY, adapted from D65 to illuminant C
+    (Bradford), as the renotation data is measured under C.
+    '''
+    rgb = np.asarray(rgbs, dtype=float).reshape(-1, 3) / 255.
+    XYZ = colour.sRGB_to_XYZ(rgb, ILLUMINANT_C, chromatic_adaptation_transform='Bradford')
+    return XYZ_to_xyY(XYZ)
+
+
+def rgb_to_munsell_specifications(rgbs, iterations=32, tolerance=1e-6):
+    '''Returns ((N, 4) specifications, (N,) converged mask) for an
+    (N, 3) array of 8-bit sRGB colors.
+    '''
+    return xyY_to_munsell_specifications(rgb_to_xyY(rgbs), iterations, tolerance)
@@ -0,0 +1,100 @@
+'''Batch transforms to a polar Munsell Lab space (mlab).
+
+mlab is a Lab-like space built directly on Munsell specifications:
+Munsell hues are equally spaced radial lines, Munsell chromas equally
+spaced circles and the lightness is the CIE L* of the Munsell value, so
+Euclidean distances follow Munsell steps:
+
+    L = CIE L* of the value's luminance (ASTM D1535)
+    a = CHROMA_SCALE * chroma * cos(ASTM hue * 3.6 degrees)
+    b = CHROMA_SCALE * chroma * sin(ASTM hue * 3.6 degrees)
+
+It is the distance space of paint_server and paint_equivalents, and is
+not munsellkit.lindbloom's uplab; see uplab.py for batch uplab.
+
+Specifications and mlab convert both ways in closed form. Colors are
+taken to and from mlab through the renotation lattice of
+munsell_inversion, so xyY or RGB to mlab is the iterative direction,
+and it reports per-color iteration counts, residuals and convergence.
+
+    mlab = specifications_to_mlab(specs)
+    mlab, result = rgb_to_mlab(rgbs)  # result['converged'], ['iterations'], ['residual']
+    xyY = mlab_to_xyY(mlab)
+'''
+
+import numpy as np
+
+from colour.notation import munsell as cnm
+
+from munsell_hues import astm_hue, hue_specification
+from munsell_inversion import get_lattice, invert, result_specifications, rgb_to_xyY
+
+
+CHROMA_SCALE = 5.
+
+# mlab chroma below this is neutral
+NEUTRAL_CHROMA = 1e-6
+
+
+def _lightness(values):
+    '''Munsell values -> CIE L*.'''
+    Y = cnm.luminance_ASTMD1535(np.asarray(values, dtype=float)) / 100.
+    return np.where(Y > (6. / 29.) ** 3, 116. * np.cbrt(Y) - 16., Y * (29. / 3.) ** 3)
+
+
+def _value(L):
+    '''CIE L* -> Munsell values.'''
+    L = np.asarray(L, dtype=float)
+    Y = np.where(L > 8., ((L + 16.) / 116.) ** 3, L * (3. / 29.) ** 3)
+    return cnm.munsell_value_ASTMD1535(Y * 100.)
+
+
+def specifications_to_mlab(specs):
+    '''(N, 4) Munsell specifications -> (N, 3) mlab. Neutrals
+    (nan hue and chroma) have a = b = 0.
+    '''
+    specs = np.asarray(specs, dtype=float).reshape(-1, 4)
+    angle = np.radians(astm_hue(specs[:, 0], specs[:, 3]) * 3.6)
+    chroma = np.nan_to_num(specs[:, 2], nan=0.) * CHROMA_SCALE
+    return np.column_stack([
+        _lightness(specs[:, 1]),
+        np.nan_to_num(chroma * np.cos(angle), nan=0.),
+        np.nan_to_num(chroma * np.sin(angle), nan=0.)])
+
+
+def mlab_to_specifications(mlab):
+    '''(N, 3) mlab -> (N, 4) Munsell specifications.'''
+    mlab = np.asarray(mlab, dtype=float).reshape(-1, 3)
+    chromas = np.hypot(mlab[:, 1], mlab[:, 2]) / CHROMA_SCALE
+    shades, codes = hue_specification(np.degrees(np.arctan2(mlab[:, 2], mlab[:, 1])) / 3.6)
+    specs = np.column_stack([shades, _value(mlab[:, 0]), chromas, codes])
+    neutral = chromas < NEUTRAL_CHROMA
+    specs[neutral, 0] = specs[neutral, 2] = specs[neutral, 3] = np.nan
+    return specs
+
+
+def mlab_to_xyY(mlab):
+    '''(N, 3) mlab -> (N, 3) xyY (illuminant C, Y from 0 to 1), through
+    the renotation lattice. Chromas past the renotation data are
+    extrapolated.
+    '''
+    mlab = np.asarray(mlab, dtype=float).reshape(-1, 3)
+    chromas = np.hypot(mlab[:, 1], mlab[:, 2]) / CHROMA_SCALE
+    hues = (np.degrees(np.arctan2(mlab[:, 2], mlab[:, 1])) / 3.6) % 100.
+    values = _value(mlab[:, 0])
+    x, y = get_lattice().forward(hues, values, chromas)
+    return np.column_stack([x, y, cnm.luminance_ASTMD1535(values) / 100.])
+
+
+def xyY_to_mlab(xyY, iterations=32, tolerance=1e-6):
+    '''(N, 3) xyY (illuminant C, Y from 0 to 1) -> ((N, 3) mlab, result),
+    where result is the munsell_inversion.invert() dict, with the
+    per-color 'converged', 'iterations' and 'residual' (xy distance).
+    '''
+    result = invert(xyY, iterations, tolerance)
+    return (specifications_to_mlab(result_specifications(result)), result)
+
+
+def rgb_to_mlab(rgbs, iterations=32, tolerance=1e-6):
+    '''(N, 3) 8-bit sRGB -> ((N, 3) mlab, result), as for xyY_to_mlab.'''
+    return xyY_to_mlab(rgb_to_xyY(rgbs), iterations, tolerance)
@@ -0,0 +1,158 @@
+'''Bulk parsing of Munsell notations into specifications.
+
+Notations look like "5R 4/14", "2.5YR 6/8", "N 5" or "N5/", with an
+optional "name:" prefix as in the color_book chips files. The names are
+split off, each distinct notation is scanned once by one precompiled
+regular expression, and the numeric fields are converted by numpy.
+Measured on a single-core Xeon VM, a million lines of book notations
+(whole-step values, even chromas), with or without names, parse in
+about 1 s; a million distinct notations with two-decimal fields take
+about 4 s.
+
+Specifications follow colour-science: (hue shade, value, chroma, hue
+code), with hue code 1 = B, 2 = BG, ... 10 = PB, and neutrals as
+(nan, value, nan, nan).
+
+    specs, names, errors = parse_notations(['Cadmium Red: 7.5R 4/14', 'N 5', 'bad'])
+    spec = parse_notation('5R 4/14')
+
+match_notation() parses one notation with the same expression without
+numpy, which is only imported by the bulk functions, for scripts that
+must start quickly (color_book.py).
+
+    match_notation('Cadmium Red: 7.5R 4/14')  # ('Cadmium Red', '7.5R', 4.0, 14.0)
+'''
+
+import re
+
+from hue_tables import FAMILIES, HUE_CODES
+
+NUMBER_PATTERN = r'[0-9]*\.?[0-9]+'
+HUE_FAMILY_PATTERN = r'RP|YR|GY|BG|PB|[BGPRY]'
+
+# One upper-cased notation, without its name: groups are the neutral
+# value, or the hue shade, hue family, value and chroma.
+NOTATION_PATTERN = (
+    r'[ \t]*(?:N[ \t]*(' + NUMBER_PATTERN + r')[ \t]*(?:/[ \t]*(?:0*\.?0*)?)?'
+    r'|(' + NUMBER_PATTERN + r')[ \t]*(' + HUE_FAMILY_PATTERN + r')[ \t]*(' + NUMBER_PATTERN + r')'
+    r'[ \t]*[ /][ \t]*(' + NUMBER_PATTERN + r'))[ \t]*')
+
+NOTATION_RE = re.compile(NOTATION_PATTERN)
+
+# One line: either a valid notation, or anything else (an error). Every
+# line yields exactly one match, so results stay aligned with the input.
+NOTATION_LINE_RE = re.compile(r'^(?:' + NOTATION_PATTERN + r'$|.*)', re.MULTILINE)
+
+
+def _column(fields, i, convert):
+    '''Converts column i of the scanned fields to a float array.
+    Notations repeat the same few numbers, so each distinct string is
+    converted only once.
+    '''
+    import numpy as np
+
+    strings = [row[i] for row in fields]
+    table = {s: convert(s) for s in set(strings)}
+    return np.fromiter(map(table.__getitem__, strings), dtype=float, count=len(strings))
+
+
+def _number(s):
+    return float(s) if s else float('nan')
+
+
+def _split_name(notation):
+    '''Returns (name or None, notation text) for one line.'''
+    name, colon, text = notation.partition(':')
+    if not colon:
+        return (None, name)
+    return (name.strip() if name else None, text)
+
+
+def match_notation(notation):
+    '''Parses one notation without numpy.
+
+    Returns (name, hue, value, chroma), where name is the "name:" prefix
+    or None, hue is the hue as written, like '7.5R' (0R is returned as
+    10RP), or 'N' for neutrals, and chroma is None for neutrals. Returns
+    None if the notation cannot be parsed.
+    '''
+    name, text = _split_name(notation.replace('\n', ' '))
+    m = NOTATION_RE.fullmatch(text.upper())
+    if m is None:
+        return None
+    neutral_value, shade, family, value, chroma = m.groups()
+    if neutral_value is not None:
+        return (name, 'N', float(neutral_value), None)
+    if float(chroma) == 0:
+        return (name, 'N', float(value), None)
+    if float(shade) > 10:
+        return None
+    if float(shade) == 0:
+        shade, family = '10', FAMILIES[FAMILIES.index(family) - 1]
+    return (name, shade + family, float(value), float(chroma))
+
+
+def parse_notations(notations):
+    '''Parses an iterable of notation strings.
+
+    Returns (specs, names, errors): specs is an (N, 4) float array
+    (rows of nan where the notation could not be parsed), names is a
+    list of the "name:" prefixes (None where absent) and errors is an
+    (N,) bool mask of the notations that could not be parsed.
+    '''
+    import numpy as np
+
+    split = [_split_name(s.replace('\n', ' ')) for s in notations]
+    if len(split) == 0:
+        return (np.zeros((0, 4)), [], np.zeros(0, dtype=bool))
+
+    # Scan each distinct notation once
+    rows = dict.fromkeys(text for _, text in split)
+    for i, text in enumerate(rows):
+        rows[text] = i
+    inverse = np.fromiter((rows[text] for _, text in split), dtype=np.intp, count=len(split))
+
+    fields = NOTATION_LINE_RE.findall('\n'.join(rows).upper())
+    if len(fields) != len(rows):
+        raise RuntimeError(f'Notation scan out of step: {len(fields)} matches for {len(rows)} lines')
+
+    neutral_values = _column(fields, 0, _number)
+    shades = _column(fields, 1, _number)
+    codes = _column(fields, 2, lambda s: HUE_CODES.get(s, 0))
+    values = _column(fields, 3, _number)
+    chromas = _column(fields, 4, _number)
+
+    neutral = ~np.isnan(neutral_values) | (chromas == 0)
+    chromatic = (codes > 0) & ~neutral
+    errors = ~(neutral | chromatic) | (shades > 10)
+    chromatic &= ~errors
+
+    # 0R is 10RP, as colour-science normalizes it
+    zero = chromatic & (shades == 0)
+    shades[zero] = 10.
+    codes[zero] = codes[zero] % 10 + 1
+
+    specs = np.full((len(rows), 4), np.nan)
+    specs[chromatic] = np.stack([shades, values, chromas, codes], axis=-1)[chromatic]
+    specs[neutral, 1] = np.where(np.isnan(neutral_values), values, neutral_values)[neutral]
+    specs[errors] = np.nan
+
+    errors = errors[inverse]
+    names = [None if error else name for (name, _), error in zip(split, errors)]
+    return (specs[inverse], names, errors)
+
+
+def parse_notation(notation):
+    '''Parses one notation, returning a float array of shape (4,).
+    Raises ValueError if it cannot be parsed.
+    '''
+    specs, _, errors = parse_notations([notation])
+    if errors[0]:
+        raise ValueError(f'"{notation}" is not a valid Munsell notation')
+    return specs[0]
+
+
+def parse_notation_file(path):
+    '''Parses a file with one notation per line.'''
+    with open(path) as f:
+        return parse_notations(f.read().splitlines())
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+'''A unified paint catalog store with range-queryable indexes.
+
+The store merges any number of brand catalogs (Munsell CSVs, or the
+Parquet and Feather files of columnar.py) into a directory:
+
+    catalog.feather     all paints, CATALOG_SCHEMA, sorted by (brand, identifier)
+    keys.npy            sorted 'brand<US>identifier' keys, for lookups
+    <dim>_order.npy     row numbers sorted by astm_hue, value and chroma
+    <dim>_sorted.npy    the sorted astm_hue, value and chroma values
+
+Everything is memory-mapped when the store is opened, so opening is
+cheap and queries only touch the pages they read. A range query
+binary-searches each sorted index, starts from the dimension with the
+fewest matches and filters those rows on the other dimensions. Hue
+ranges may wrap around 10RP ('7.5RP' to '2.5R'); neutrals (no hue) only
+match queries without a hue range.
+
+    store = build_store(['dunn_edwards.csv', 'SennelierMunsell.parquet'], 'paints.store')
+    store = PaintStore('paints.store')
+    rows = store.query(hue=('7.5YR', '2.5Y'), value=(6, 7), chroma=(8, None))
+    paints = store.rows(rows)                  # list of dicts
+    i = store.find('Dunn-Edwards', 'DE6356')   # row number or None
+
+    python3 paint_catalog.py build paints.store dunn_edwards.csv SennelierMunsell.csv
+    python3 paint_catalog.py query paints.store --hue 7.5YR 2.5Y --value 6 7 --chroma 8
+'''
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from columnar import CATALOG_SCHEMA, read_table
+from munsell_hues import parse_hue
+
+
+DIMENSIONS = ['astm_hue', 'value', 'chroma']
+KEY_SEPARATOR = '\x1f'
+
+
+def paint_key(brand, identifier):
+    return f'{brand}{KEY_SEPARATOR}{identifier}'.encode('utf-8')
+
+
+def build_store(paths, store_path):
+    '''Merges catalogs into a store directory, replacing the files of any
+    previous store there, and returns the opened PaintStore.
+    '''
+    tables = [read_table(path, CATALOG_SCHEMA.names).cast(CATALOG_SCHEMA) for path in paths]
+    table = pa.concat_tables(tables) if tables else CATALOG_SCHEMA.empty_table()
+    brands = table.column('brand').to_pylist()
+    identifiers = [i or '' for i in table.column('identifier').to_pylist()]
+    keys = np.array([paint_key(b, i) for b, i in zip(brands, identifiers)], dtype=bytes)
+    order = np.argsort(keys, kind='stable')
+    table = table.take(pa.array(order))
+    keys = keys[order]
+
+    os.makedirs(store_path, exist_ok=True)
+    feather.write_feather(table, os.path.join(store_path, 'catalog.feather'), compression='uncompressed')
+    np.save(os.path.join(store_path, 'keys.npy'), keys)
+    for dim in DIMENSIONS:
+        values = table.column(dim).to_numpy(zero_copy_only=False).astype(np.float32)
+        dim_order = np.argsort(values, kind='stable').astype(np.int32)  # NaN last
+        np.save(os.path.join(store_path, f'{dim}_order.npy'), dim_order)
+        np.save(os.path.join(store_path, f'{dim}_sorted.npy'), values[dim_order])
+    return PaintStore(store_path)
+
+
+def _bound(value, parse=float):
+    return None if value is None else parse(value)
+
+
+def _hue(value):
+    return parse_hue(value) if isinstance(value, str) else float(value)
+
+
+class PaintStore:
+    def __init__(self, store_path):
+        self.path = store_path
+        self.table = feather.read_table(os.path.join(store_path, 'catalog.feather'), memory_map=True)
+        self.keys = np.load(os.path.join(store_path, 'keys.npy'), mmap_mode='r')
+        self.order = dict()
+        self.sorted = dict()
+        self.columns = dict()
+        for dim in DIMENSIONS:
+            self.order[dim] = np.load(os.path.join(store_path, f'{dim}_order.npy'), mmap_mode='r')
+            self.sorted[dim] = np.load(os.path.join(store_path, f'{dim}_sorted.npy'), mmap_mode='r')
+        self._brands = None
+
+    def __len__(self):
+        return self.table.num_rows
+
+    def column(self, name):
+        '''A catalog column as a numpy array (nulls as NaN for numbers).'''
+        array = self.columns.get(name)
+        if array is None:
+            column = self.table.column(name)
+            if pa.types.is_floating(column.type) or pa.types.is_integer(column.type):
+                if column.null_count:
+                    column = column.cast(pa.float64()).fill_null(np.nan)
+            array = self.columns[name] = column.to_numpy()
+        return array
+
+    def brands(self):
+        '''Brand names, in key order.'''
+        if self._brands is None:
+            self._brands = sorted(set(self.table.column('brand').unique().to_pylist()))
+        return self._brands
+
+    def find(self, brand, identifier):
+        '''Row number of a paint, or None.'''
+        key = paint_key(brand, identifier)
+        i = int(np.searchsorted(self.keys, key))
+        return i if i < len(self.keys) and self.keys[i] == key else None
+
+    def brand_range(self, brand):
+        '''(first, last + 1) row numbers of a brand, which are contiguous.'''
+        first = paint_key(brand, '')
+        after = first[:-1] + bytes([first[-1] + 1])
+        return (int(np.searchsorted(self.keys, first)), int(np.searchsorted(self.keys, after)))
+
+    def range_rows(self, dim, lo=None, hi=None):
+        '''Row numbers with lo <= dim <= hi (either may be None), in index
+        order. A hue range with lo > hi wraps around 100 (10RP).
+        '''
+        keys = self.sorted[dim]
+        n_valid = int(np.searchsorted(keys, np.inf, side='right'))  # NaNs sort last
+        if dim == 'astm_hue' and lo is not None and hi is not None and lo > hi:
+            return np.concatenate([self.range_rows(dim, lo, None), self.range_rows(dim, None, hi)])
+        start = 0 if lo is None else int(np.searchsorted(keys[:n_valid], lo, side='left'))
+        end = n_valid if hi is None else int(np.searchsorted(keys[:n_valid], hi, side='right'))
+        return self.order[dim][start:end]
+
+    def query(self, hue=None, value=None, chroma=None, brands=None):
+        '''Row numbers (sorted) of the paints within all the given ranges.
+
+        Each range is a (lo, hi) pair, inclusive, where either end may be
+        None. Hues are ASTM hues or labels like '7.5YR'. brands limits the
+        result to a list of brand names.
+        '''
+        ranges = []
+        for dim, bounds, parse in [('astm_hue', hue, _hue), ('value', value, float), ('chroma', chroma, float)]:
+            if bounds is not None:
+                lo, hi = bounds
+                ranges.append((dim, _bound(lo, parse), _bound(hi, parse)))
+
+        candidates = None
+        if brands:
+            candidates = np.concatenate(
+                [np.arange(*self.brand_range(brand)) for brand in brands] + [np.zeros(0, dtype=np.int64)])
+        if ranges:
+            rows = [self.range_rows(dim, lo, hi) for dim, lo, hi in ranges]
+            first = int(np.argmin([len(r) for r in rows]))
+            selected = np.asarray(rows[first])
+            if candidates is not None:
+                selected = np.intersect1d(selected, candidates)
+            for i, (dim, lo, hi) in enumerate(ranges):
+                if i == first:
+                    continue
+                x = self.column(dim)[selected]
+                if dim == 'astm_hue' and lo is not None and hi is not None and lo > hi:
+                    mask = (x >= lo) | (x <= hi)
+                else:
+                    mask = np.ones(len(selected), dtype=bool)
+                    if lo is not None:
+                        mask &= x >= lo
+                    if hi is not None:
+                        mask &= x <= hi
+                selected = selected[mask]
+            return np.sort(selected)
+        if candidates is not None:
+            return np.sort(candidates)
+        return np.arange(len(self))
+
+    def rows(self, indices):
+        '''Paints as dicts of catalog fields.'''
+        return self.table.take(pa.array(np.asarray(indices, dtype=np.int64))).to_pylist()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build or query a paint catalog store.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build = subparsers.add_parser('build', help='merge catalogs into a store')
+    build.add_argument('store', help='store directory')
+    build.add_argument('catalogs', nargs='+', help='Munsell CSV, Parquet or Feather files')
+    query = subparsers.add_parser('query', help='list the paints within ranges')
+    query.add_argument('store', help='store directory')
+    query.add_argument('--hue', nargs=2, metavar=('FROM', 'TO'), help="hue range, e.g. 7.5YR 2.5Y")
+    query.add_argument('--value', nargs='+', type=float, metavar='V', help='min [max] value')
+    query.add_argument('--chroma', nargs='+', type=float, metavar='C', help='min [max] chroma')
+    query.add_argument('--brand', action='append', help='limit to a brand, may be repeated')
+    args = parser.parse_args()
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        store = build_store(args.catalogs, args.store)
+        print(f'{len(store)} paints from {len(store.brands())} brands in {time.perf_counter() - start:.2f}s')
+    else:
+        store = PaintStore(args.store)
+        value = tuple(args.value) + (None,) * (2 - len(args.value)) if args.value else None
+        chroma = tuple(args.chroma) + (None,) * (2 - len(args.chroma)) if args.chroma else None
+        start = time.perf_counter()
+        rows = store.query(args.hue, value, chroma, args.brand)
+        elapsed = time.perf_counter() - start
+        for paint in store.rows(rows):
+            print(f"{paint['brand']},{paint['identifier']},{paint['name'] or ''},{paint['notation'] or ''},"
+                  f"{paint['astm_hue']},{paint['value']},{paint['chroma']}")
+        print(f'{len(rows)} paints in {elapsed * 1000.:.2f} ms')
@@ -0,0 +1,348 @@
+#!/usr/bin/env python3
+
+'''Cross-brand paint equivalents, by blocked pairwise CIEDE2000.
+
+Comparing every paint with every other one is O(n^2). Here the paints
+are first put in coarse Munsell blocks:
+
+    hue page (40 pages) x value (half steps) x chroma band (`reach` chromas)
+
+and CIEDE2000 is computed, as whole arrays, only between paints in the
+same or neighboring blocks: the next value bucket and chroma band on
+each side, and as many hue pages as `reach` chromas span at the lower
+chroma of the two bands. Paints below the first band (chromas under
+`reach`, and neutrals) share one block per value bucket whatever their
+hue, which neighbors the first band of every page. So every pair of
+paints whose values differ by less than 0.5 and chromas by less than
+`reach`, and whose hues are within `reach` chromas of each other around
+the hue circle, is compared; pairs farther apart never are. Within the
+neighboring blocks, bounds on the lightness and Lab distance skip most
+pairs that cannot be close enough before CIEDE2000 is computed.
+
+Paints are placed in CIE L*a*b* (D65) from their Munsell specification
+through the renotation lattice, or from their RGB if they have no
+specification. Pairs within `max_delta_e` and of different brands make
+the equivalence table:
+
+    python3 paint_equivalents.py SennelierMunsell.csv UnisonMunsell.csv NupastelMunsell.csv \\
+        colorwell.csv dunn_edwards.parquet -o equivalents.csv --max-delta-e 2 --best
+
+    equivalents = find_equivalents(read_paints(paths), max_delta_e=2.)
+'''
+
+import argparse
+import csv
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pyarrow as pa
+import colour
+
+from columnar import CATALOG_SCHEMA, read_table
+from munsell_hues import N_PAGES, PAGE_STEP, astm_hue, page_of
+from munsell_inversion import ILLUMINANT_C
+from paint_catalog import PaintStore
+from munsell_lab import mlab_to_specifications, mlab_to_xyY, rgb_to_mlab, specifications_to_mlab
+
+
+ILLUMINANT_D65 = colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+
+MAX_DELTA_E = 2.
+REACH = 2.
+
+# Number of paint pairs screened at once.
+BLOCK_ENTRIES = 1 << 22
+
+# Munsell value bucket size: pairs of values less than this apart are
+# always compared (a CIEDE2000 of 2 is at most about 0.4 of a value step).
+VALUE_STEP = 0.5
+
+# Bounds used to skip pairs that cannot be within max_delta_e:
+# CIEDE2000 >= |dL*| / MAX_SL, and since the rotation term is at most
+# 2 sin(60) in magnitude, CIEDE2000 >= MIN_CH_FORM * |d(a*, b*)| / SC,
+# where SC <= 1 + 0.045 * MAX_A_SCALE * (the larger Lab chroma).
+MAX_SL = 1.75
+MAX_A_SCALE = 1.5
+MIN_CH_FORM = math.sqrt(1. - math.sin(math.radians(60.)))
+
+COLUMNS = [
+    'Brand A',
+    'Identifier A',
+    'Color Name A',
+    'Munsell Specification A',
+    'Brand B',
+    'Identifier B',
+    'Color Name B',
+    'Munsell Specification B',
+    'Delta E'
+]
+
+
+def read_paints(paths):
+    '''Reads catalogs (files or paint_catalog.py store directories) into
+    one CATALOG_SCHEMA table.
+    '''
+    tables = []
+    for path in paths:
+        if os.path.isdir(path):
+            table = PaintStore(path).table
+        else:
+            table = read_table(path, CATALOG_SCHEMA.names).cast(CATALOG_SCHEMA)
+        tables.append(table.select(CATALOG_SCHEMA.names))
+    return pa.concat_tables(tables) if tables else CATALOG_SCHEMA.empty_table()
+
+
+def _numbers(table, name):
+    column = table.column(name)
+    if column.null_count:
+        column = column.cast(pa.float64()).fill_null(np.nan)
+    return column.to_numpy().astype(float)
+
+
+def xyY_to_lab(xyY):
+    '''(N, 3) xyY (illuminant C) -> (N, 3) CIE L*a*b* (D65).'''
+    XYZ = colour.xyY_to_XYZ(xyY)
+    XYZ = colour.chromatic_adaptation(
+        XYZ, colour.xy_to_XYZ(ILLUMINANT_C), colour.xy_to_XYZ(ILLUMINANT_D65), method='Von Kries')
+    return colour.XYZ_to_Lab(XYZ, ILLUMINANT_D65)
+
+
+def ciede2000(lab1, lab2):
+    '''CIEDE2000 differences between broadcastable (..., 3) Lab arrays.'''
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+    C_mean7 = ((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2.) ** 7
+    G = 0.5 * (1. - np.sqrt(C_mean7 / (C_mean7 + 25. ** 7)))
+    a1p = a1 * (1. + G)
+    a2p = a2 * (1. + G)
+    C1p = np.hypot(a1p, b1)
+    C2p = np.hypot(a2p, b2)
+    h1p = np.arctan2(b1, a1p) % (2. * np.pi)
+    h2p = np.arctan2(b2, a2p) % (2. * np.pi)
+
+    dLp = L2 - L1
+    dCp = C2p - C1p
+    chromatic = C1p * C2p != 0.
+    dhp = h2p - h1p
+    dhp = np.where(dhp > np.pi, dhp - 2. * np.pi, np.where(dhp < -np.pi, dhp + 2. * np.pi, dhp))
+    dhp = np.where(chromatic, dhp, 0.)
+    dHp = 2. * np.sqrt(C1p * C2p) * np.sin(dhp / 2.)
+
+    Lp = (L1 + L2) / 2.
+    Cp = (C1p + C2p) / 2.
+    hp = h1p + h2p
+    hp = np.where(np.abs(h1p - h2p) > np.pi, hp + np.where(hp < 2. * np.pi, 2. * np.pi, -2. * np.pi), hp) / 2.
+    hp = np.where(chromatic, hp, h1p + h2p)
+
+    T = (1. - 0.17 * np.cos(hp - np.radians(30.)) + 0.24 * np.cos(2. * hp) +
+         0.32 * np.cos(3. * hp + np.radians(6.)) - 0.20 * np.cos(4. * hp - np.radians(63.)))
+    Lp50 = (Lp - 50.) ** 2
+    SL = 1. + 0.015 * Lp50 / np.sqrt(20. + Lp50)
+    SC = 1. + 0.045 * Cp
+    SH = 1. + 0.015 * Cp * T
+    Cp7 = Cp ** 7
+    RT = (-2. * np.sqrt(Cp7 / (Cp7 + 25. ** 7)) *
+          np.sin(np.radians(60.) * np.exp(-((np.degrees(hp) - 275.) / 25.) ** 2)))
+    dL, dC, dH = dLp / SL, dCp / SC, dHp / SH
+    return np.sqrt(dL ** 2 + dC ** 2 + dH ** 2 + RT * dC * dH)
+
+
+class PaintBlocks:
+    '''Paints with their Lab colors, sorted into Munsell blocks.'''
+
+    def __init__(self, table, reach=REACH):
+        specs = np.column_stack([_numbers(table, name) for name in ['hue_shade', 'value', 'chroma', 'hue_code']])
+        # Paints without a Munsell value are placed by their RGB, if any
+        rgbs = np.column_stack([_numbers(table, name) for name in 'rgb'])
+        from_rgb = np.isnan(specs[:, 1]) & np.isfinite(rgbs).all(axis=1)
+        if from_rgb.any():
+            specs[from_rgb] = mlab_to_specifications(rgb_to_mlab(rgbs[from_rgb])[0])
+        lab = xyY_to_lab(mlab_to_xyY(specifications_to_mlab(specs)))
+        valid = np.isfinite(lab).all(axis=1)
+        specs = specs[valid]
+        astm_hues = astm_hue(specs[:, 0], specs[:, 3])
+        values = specs[:, 1]
+        chromas = np.nan_to_num(specs[:, 2], nan=0.)
+
+        self.reach = reach
+        self.table = table.filter(valid)
+        self.lab = lab[valid]
+        self.chroma = np.hypot(self.lab[:, 1], self.lab[:, 2])
+        brands = np.array([b or '' for b in self.table.column('brand').to_pylist()], dtype=object)
+        self.brand_names, self.brands = np.unique(brands, return_inverse=True)
+
+        bands = np.floor(chromas / reach).astype(np.int64)
+        pages = np.where((bands == 0) | np.isnan(astm_hues), -1, page_of(astm_hues))
+        bands[pages == -1] = 0
+        value_buckets = np.floor(values / VALUE_STEP).astype(np.int64)
+        self.value_buckets = int(value_buckets.max(initial=0)) + 2
+        self.max_band = int(bands.max(initial=0))
+        # Block number: page (-1 for the grey blocks) x value x band
+        keys = ((pages + 1) * self.value_buckets + value_buckets) * (self.max_band + 1) + bands
+        self.order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[self.order]
+        self.keys, starts = np.unique(sorted_keys, return_index=True)
+        self.starts = np.append(starts, len(sorted_keys))
+
+    def __len__(self):
+        return len(self.lab)
+
+    def key(self, page, value, band):
+        return ((page + 1) * self.value_buckets + value) * (self.max_band + 1) + band
+
+    def split_key(self, key):
+        key, band = divmod(int(key), self.max_band + 1)
+        page, value = divmod(key, self.value_buckets)
+        return (page - 1, value, band)
+
+    def hue_pages(self, band):
+        '''Hue pages on each side within `reach` chromas, at the lower
+        chroma of a band.
+        '''
+        angle = 2. * math.degrees(math.asin(min(1., 0.5 / band)))
+        return min(N_PAGES // 2, int(math.ceil(angle / (PAGE_STEP * 3.6))))
+
+    def neighbors(self, key):
+        '''Block numbers neighboring a block, including itself. The
+        relation is symmetric.
+        '''
+        page, value, band = self.split_key(key)
+        result = set()
+        for dv in (-1, 0, 1):
+            v = value + dv
+            if not 0 <= v < self.value_buckets:
+                continue
+            if band == 0:
+                result.add(self.key(-1, v, 0))
+                if self.max_band >= 1:
+                    result.update(self.key(p, v, 1) for p in range(N_PAGES))
+                continue
+            for b in (band - 1, band, band + 1):
+                if b == 0:
+                    result.add(self.key(-1, v, 0))
+                elif b <= self.max_band:
+                    reach = self.hue_pages(min(band, b))
+                    result.update(self.key((page + dp) % N_PAGES, v, b) for dp in range(-reach, reach + 1))
+        return result
+
+    def rows(self, block):
+        '''Paint numbers of the block at position `block` of self.keys.'''
+        return self.order[self.starts[block]:self.starts[block + 1]]
+
+    def block_pairs(self, block, max_delta_e):
+        '''Returns (i, j, delta E) arrays of the cross-brand pairs within
+        max_delta_e between a block and its neighbors with higher or
+        equal block numbers (each pair of paints is found once).
+        '''
+        key = self.keys[block]
+        others = [n for n in self.neighbors(key) if n >= key]
+        positions = np.searchsorted(self.keys, others)
+        found = positions < len(self.keys)
+        positions = positions[found][self.keys[positions[found]] == np.asarray(others)[found]]
+        a = self.rows(block)
+        b = np.concatenate([self.rows(p) for p in sorted(positions)])
+        pairs = []
+        step = max(1, BLOCK_ENTRIES // max(1, len(b)))
+        for start in range(0, len(a), step):
+            ai = a[start:start + step]
+            # Cheap necessary conditions first: lightness, brand, and each pair once
+            mask = np.abs(self.lab[ai, 0][:, np.newaxis] - self.lab[b, 0][np.newaxis]) <= max_delta_e * MAX_SL
+            mask &= self.brands[ai][:, np.newaxis] != self.brands[b][np.newaxis]
+            # b starts with the block itself
+            mask[:, :len(a)] &= np.arange(len(a))[np.newaxis] > np.arange(start, start + len(ai))[:, np.newaxis]
+            i, j = np.nonzero(mask)
+            i, j = ai[i], b[j]
+            distances = np.hypot(self.lab[i, 1] - self.lab[j, 1], self.lab[i, 2] - self.lab[j, 2])
+            near = distances <= max_delta_e * (1. + 0.045 * MAX_A_SCALE * np.maximum(self.chroma[i], self.chroma[j])) / MIN_CH_FORM
+            i, j = i[near], j[near]
+            dE = ciede2000(self.lab[i], self.lab[j])
+            within = dE <= max_delta_e
+            pairs.append((i[within], j[within], dE[within]))
+        return tuple(np.concatenate(column) for column in zip(*pairs))
+
+
+_blocks = None
+
+def init_worker(blocks):
+    global _blocks
+    _blocks = blocks
+
+
+def range_pairs(blocks, block_range, max_delta_e):
+    '''(i, j, delta E) of the pairs of a range of blocks, or None.'''
+    pairs = [blocks.block_pairs(block, max_delta_e) for block in block_range]
+    return tuple(np.concatenate(column) for column in zip(*pairs)) if pairs else None
+
+
+def worker_pairs(block_range, max_delta_e):
+    return range_pairs(_blocks, block_range, max_delta_e)
+
+
+def find_equivalents(table, max_delta_e=MAX_DELTA_E, reach=REACH, best=False, jobs=1):
+    '''Returns (blocks, i, j, delta E): the PaintBlocks, and the pairs of
+    paints (rows of blocks.table) of different brands within
+    max_delta_e, sorted by delta E. With `best`, only the closest paint
+    of each other brand is kept for each paint, and pairs appear in both
+    directions.
+    '''
+    blocks = PaintBlocks(table, reach)
+    n_blocks = len(blocks.keys)
+    if jobs == 1:
+        results = [range_pairs(blocks, range(n_blocks), max_delta_e)]
+    else:
+        chunks = [range(start, min(n_blocks, start + 64)) for start in range(0, n_blocks, 64)]
+        with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(blocks,)) as executor:
+            results = list(executor.map(worker_pairs, chunks, [max_delta_e] * len(chunks)))
+    results = [r for r in results if r is not None]
+    if results:
+        i, j, dE = (np.concatenate(column) for column in zip(*results))
+    else:
+        i, j, dE = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0))
+
+    if best:
+        i, j, dE = np.concatenate([i, j]), np.concatenate([j, i]), np.concatenate([dE, dE])
+        order = np.lexsort((dE, blocks.brands[j], i))
+        i, j, dE = i[order], j[order], dE[order]
+        first = np.ones(len(i), dtype=bool)
+        first[1:] = (i[1:] != i[:-1]) | (blocks.brands[j][1:] != blocks.brands[j][:-1])
+        i, j, dE = i[first], j[first], dE[first]
+    order = np.argsort(dE, kind='stable')
+    return (blocks, i[order], j[order], dE[order])
+
+
+def write_equivalents(path, blocks, i, j, dE):
+    fields = {name: blocks.table.column(name).to_pylist() for name in ['brand', 'identifier', 'name', 'notation']}
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(COLUMNS)
+        for a, b, d in zip(i.tolist(), j.tolist(), dE.tolist()):
+            writer.writerow([fields['brand'][a], fields['identifier'][a], fields['name'][a], fields['notation'][a],
+                             fields['brand'][b], fields['identifier'][b], fields['name'][b], fields['notation'][b],
+                             f'{d:.3f}'])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Find close paint equivalents across brands.')
+    parser.add_argument(
+        'catalogs', nargs='+', help='Munsell CSV, Parquet or Feather files, or paint_catalog.py stores')
+    parser.add_argument('-o', '--output', default='equivalents.csv', help='equivalence table CSV')
+    parser.add_argument(
+        '--max-delta-e', type=float, default=MAX_DELTA_E, help='largest CIEDE2000 difference of equivalents')
+    parser.add_argument(
+        '--reach', type=float, default=REACH,
+        help='chroma band width, and the chroma distance the blocks must cover')
+    parser.add_argument(
+        '--best', action='store_true', help='keep only the closest paint of each other brand for each paint')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='number of processes comparing blocks')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    table = read_paints(args.catalogs)
+    blocks, i, j, dE = find_equivalents(table, args.max_delta_e, args.reach, args.best, args.jobs)
+    print(f'{len(blocks)} paints of {len(blocks.brand_names)} brands in {len(blocks.keys)} blocks: '
+          f'{len(i)} equivalents in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+    write_equivalents(args.output, blocks, i, j, dE)
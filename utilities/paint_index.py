@@ -0,0 +1,78 @@
+'''Nearest-paint queries in (ASTM hue, value, chroma) space.
+
+The distance between two colors is the weighted sum
+
+    hue_weight * |dh| + value_weight * |dv| + chroma_weight * |dc|
+
+where dh is the ASTM hue difference taken the short way around the
+hue circle (ASTM hue runs from 0 to 100). Neutrals (NaN hue) have no
+hue difference, so they must be indexed apart, with a hue of 0.
+
+    index = PaintIndex(astm_hues, values, chromas, weights=(1., 10., 2.))
+    indices, distances = index.query(cells, k=6, max_distance=8.25)
+'''
+
+import numpy as np
+
+from munsell_hues import hue_difference
+
+
+# Number of distance entries computed at once by `query`.
+BLOCK_ENTRIES = 1 << 22
+
+
+class PaintIndex:
+    def __init__(self, astm_hues, values, chromas, weights=(1., 10., 2.)):
+        self.hues = np.asarray(astm_hues, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        self.chromas = np.asarray(chromas, dtype=float)
+        self.hue_weight, self.value_weight, self.chroma_weight = weights
+
+    def __len__(self):
+        return len(self.hues)
+
+    def distances(self, points):
+        '''Returns the (M, N) distances from M query points,
+        shape (M, 3) as (astm_hue, value, chroma), to all N paints.
+        '''
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        dh = hue_difference(points[:, 0:1], self.hues[np.newaxis, :])
+        dv = points[:, 1:2] - self.values[np.newaxis, :]
+        dc = points[:, 2:3] - self.chromas[np.newaxis, :]
+        return (self.hue_weight * np.abs(dh) + self.value_weight * np.abs(dv) +
+                self.chroma_weight * np.abs(dc))
+
+    def query(self, points, k=1, max_distance=None):
+        '''Finds the k closest paints to each query point.
+
+        Returns (indices, distances), both of shape (M, k), sorted by
+        increasing distance. Slots with no paint (fewer than k paints,
+        or farther than `max_distance`) have index -1 and distance inf.
+        '''
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        m = len(points)
+        n = len(self)
+        indices = np.full((m, k), -1, dtype=np.int64)
+        dists = np.full((m, k), np.inf)
+        if n == 0 or m == 0:
+            return (indices, dists)
+
+        kk = min(k, n)
+        block = max(1, BLOCK_ENTRIES // n)
+        for start in range(0, m, block):
+            d = self.distances(points[start:start + block])
+            if kk < n:
+                idx = np.argpartition(d, kk - 1, axis=1)[:, :kk]
+            else:
+                idx = np.broadcast_to(np.arange(n), d.shape)
+            dd = np.take_along_axis(d, idx, axis=1)
+            order = np.argsort(dd, axis=1, kind='stable')
+            idx = np.take_along_axis(idx, order, axis=1)
+            dd = np.take_along_axis(dd, order, axis=1)
+            if max_distance is not None:
+                far = dd > max_distance
+                idx = np.where(far, -1, idx)
+                dd = np.where(far, np.inf, dd)
+            indices[start:start + block, :kk] = idx
+            dists[start:start + block, :kk] = dd
+        return (indices, dists)
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+
+'''Local HTTP service answering nearest-paint queries.
+
+All the brand catalogs (Munsell CSVs, the Parquet and Feather files of
+columnar.py, or a paint_catalog.py store) are loaded once, placed in
+mlab (see munsell_lab.py, where distances follow Munsell steps: 10 per
+value step, 5 per chroma step) and indexed with one k-d tree per brand, so a
+query only searches the brands it asks for.
+
+    python3 paint_server.py dunn_edwards.csv SennelierMunsell.parquet --port 8766
+    python3 paint_server.py paints.store --socket /tmp/paints.sock
+
+    GET /nearest?munsell=5R+4/14&k=5           the 5 paints closest to a notation
+    GET /nearest?rgb=C0272D&brand=Gamblin      ...to an sRGB color, from one brand
+    GET /nearest?lab=45,62,40&brand=A&brand=B  ...to a CIE L*a*b* (D65) color
+    GET /nearest?mlab=45,60,30                 ...to mlab coordinates
+    &max_distance=20                           only paints within a distance
+    POST /batch                                many queries in one call, see below
+    GET /brands                                brands and their paint counts
+    GET /stats                                 request counts and times, as JSON
+
+The body of a /batch request is a JSON object like
+
+    {"k": 3, "brands": ["Gamblin"], "queries": ["5R 4/14", {"rgb": [192, 39, 45]}, {"lab": [45, 62, 40]}]}
+
+where a string query is a Munsell notation. The response has one result
+per query, in order: a list of paints, or {"error": ...}. The queries of
+each kind are converted together, and the trees searched once for all.
+
+Notations convert to mlab in closed form. RGB and Lab colors go
+through the iterative renotation inversion of munsell_inversion, which
+is the costly part of a single query; single conversions are cached.
+'''
+
+import argparse
+import asyncio
+import functools
+import json
+import os
+import sys
+import time
+import urllib.parse
+
+import numpy as np
+import pyarrow as pa
+import colour
+from scipy.spatial import cKDTree
+
+from columnar import CATALOG_SCHEMA, read_table
+from http_loop import RequestError, serve_connection
+from munsell_inversion import ILLUMINANT_C, XYZ_to_xyY
+from munsell_lab import rgb_to_mlab, specifications_to_mlab, xyY_to_mlab
+from munsell_notation import parse_notations
+from paint_catalog import PaintStore
+
+
+QUERY_KINDS = ['munsell', 'rgb', 'lab', 'mlab']
+DEFAULT_K = 5
+MAX_K = 100
+MAX_BATCH = 100000
+CONVERSION_CACHE_SIZE = 65536
+
+ILLUMINANT_D65 = colour.CCS_ILLUMINANTS['CIE 1931 2 Degree Standard Observer']['D65']
+
+PAINT_FIELDS = ['brand', 'identifier', 'name', 'notation']
+
+
+def read_paints(paths):
+    '''Reads catalogs (files or store directories) into one
+    CATALOG_SCHEMA table.
+    '''
+    tables = []
+    for path in paths:
+        if os.path.isdir(path):
+            table = PaintStore(path).table
+        else:
+            table = read_table(path, CATALOG_SCHEMA.names).cast(CATALOG_SCHEMA)
+        tables.append(table.select(CATALOG_SCHEMA.names))
+    return pa.concat_tables(tables) if tables else CATALOG_SCHEMA.empty_table()
+
+
+def _numbers(table, name):
+    column = table.column(name)
+    if column.null_count:
+        column = column.cast('float64').fill_null(np.nan)
+    return column.to_numpy().astype(float)
+
+
+def lab_to_xyY(labs):
+    '''(N, 3) CIE L*a*b* (D65) -> (N, 3) xyY adapted to illuminant C.'''
+    XYZ = colour.Lab_to_XYZ(np.asarray(labs, dtype=float).reshape(-1, 3), ILLUMINANT_D65)
+    XYZ = colour.chromatic_adaptation(
+        XYZ, colour.xy_to_XYZ(ILLUMINANT_D65), colour.xy_to_XYZ(ILLUMINANT_C), method='Von Kries',
+        transform='Bradford')
+    return XYZ_to_xyY(XYZ)
+
+
+@functools.lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def _cached_mlab(kind, color):
+    '''mlab of one color, as a tuple, for single queries.'''
+    return tuple(convert_colors(kind, [color])[0][0])
+
+
+def convert_colors(kind, colors):
+    '''Returns ((N, 3) mlab, (N,) bool mask of colors that could not
+    be converted) for a list of colors of one kind.
+    '''
+    if kind == 'munsell':
+        specs, _, errors = parse_notations([str(c) for c in colors])
+        mlab = specifications_to_mlab(np.where(errors[:, np.newaxis], 0., specs))
+        mlab[errors] = np.nan
+        return (mlab, errors)
+    points = np.asarray(colors, dtype=float).reshape(-1, 3)
+    if kind == 'mlab':
+        mlab = points
+    elif kind == 'rgb':
+        mlab, _ = rgb_to_mlab(np.clip(points, 0, 255))
+    else:
+        mlab, _ = xyY_to_mlab(lab_to_xyY(points))
+    return (mlab, ~np.isfinite(mlab).all(axis=1))
+
+
+def parse_color(kind, text):
+    '''Parses a query parameter: a notation, an RGB hex string or comma
+    separated numbers.
+    '''
+    if kind == 'munsell':
+        return text
+    text = text.strip().lstrip('#')
+    if kind == 'rgb' and len(text) == 6 and ',' not in text:
+        try:
+            return tuple(int(text[i:i+2], 16) for i in range(0, 6, 2))
+        except ValueError:
+            pass
+    try:
+        color = tuple(float(x) for x in text.split(','))
+    except ValueError:
+        color = ()
+    if len(color) != 3 or not np.isfinite(color).all():
+        raise RequestError(400, f'Cannot parse {kind} color {text}')
+    return color
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool) and np.isfinite(x)
+
+
+class PaintSpace:
+    '''Paints in mlab, with a k-d tree per brand.'''
+
+    def __init__(self, table):
+        specs = np.column_stack([_numbers(table, name) for name in ['hue_shade', 'value', 'chroma', 'hue_code']])
+        mlab = specifications_to_mlab(specs)
+        # Paints without a Munsell value are placed by their RGB, if any
+        rgbs = np.column_stack([_numbers(table, name) for name in 'rgb'])
+        from_rgb = np.isnan(specs[:, 1]) & np.isfinite(rgbs).all(axis=1)
+        if from_rgb.any():
+            mlab[from_rgb] = rgb_to_mlab(rgbs[from_rgb])[0]
+        valid = np.isfinite(mlab).all(axis=1)
+
+        self.table = table.filter(valid)
+        self.mlab = mlab[valid]
+        self.fields = {name: self.table.column(name).to_pylist() for name in PAINT_FIELDS}
+        brands = np.array([b or '' for b in self.fields['brand']], dtype=object)
+        self.brand_rows = dict()
+        self.trees = dict()
+        for brand in sorted(set(brands)):
+            rows = np.flatnonzero(brands == brand)
+            self.brand_rows[brand] = rows
+            self.trees[brand] = cKDTree(self.mlab[rows])
+        self.tree = cKDTree(self.mlab)
+
+    def __len__(self):
+        return len(self.mlab)
+
+    def brands(self):
+        return {brand: len(rows) for brand, rows in self.brand_rows.items()}
+
+    def nearest(self, points, k=DEFAULT_K, brands=None, max_distance=None):
+        '''Returns (indices, distances), both (M, k) and sorted by
+        distance, of the paints closest to (M, 3) mlab points. Missing
+        slots have index -1 and distance inf.
+        '''
+        points = np.asarray(points, dtype=float).reshape(-1, 3)
+        upper = np.inf if max_distance is None else max_distance
+        if not brands:
+            searches = [(self.tree, None)]
+        else:
+            if not all(isinstance(brand, str) for brand in brands):
+                raise RequestError(400, 'Brands must be strings')
+            unknown = [brand for brand in brands if brand not in self.trees]
+            if unknown:
+                raise RequestError(400, f'Unknown brand {unknown[0]}')
+            searches = [(self.trees[brand], self.brand_rows[brand]) for brand in brands]
+
+        indices, dists = [], []
+        for tree, rows in searches:
+            kk = min(k, tree.n)
+            if kk == 0:
+                continue
+            d, i = tree.query(points, k=kk, distance_upper_bound=upper)
+            d, i = d.reshape(len(points), kk), i.reshape(len(points), kk)
+            missing = i >= tree.n
+            i = np.where(missing, -1, i if rows is None else rows[np.minimum(i, tree.n - 1)])
+            indices.append(i)
+            dists.append(np.where(missing, np.inf, d))
+        if not indices:
+            return (np.full((len(points), k), -1), np.full((len(points), k), np.inf))
+
+        indices = np.concatenate(indices, axis=1)
+        dists = np.concatenate(dists, axis=1)
+        if len(searches) > 1:
+            order = np.argsort(dists, axis=1, kind='stable')[:, :k]
+            indices = np.take_along_axis(indices, order, axis=1)
+            dists = np.take_along_axis(dists, order, axis=1)
+        if indices.shape[1] < k:
+            pad = k - indices.shape[1]
+            indices = np.pad(indices, ((0, 0), (0, pad)), constant_values=-1)
+            dists = np.pad(dists, ((0, 0), (0, pad)), constant_values=np.inf)
+        return (indices, dists)
+
+    def paints(self, indices, dists):
+        '''The paints of one row of nearest() results, as dicts.'''
+        paints = []
+        for i, d in zip(indices.tolist(), dists.tolist()):
+            if i < 0:
+                break
+            paint = {name: self.fields[name][i] for name in PAINT_FIELDS}
+            paint['distance'] = round(d, 3)
+            paints.append(paint)
+        return paints
+
+
+def _int_param(params, name, default, lo, hi):
+    try:
+        value = int(params.get(name, [default])[0])
+    except (TypeError, ValueError):
+        raise RequestError(400, f'{name} must be an integer')
+    if not lo <= value <= hi:
+        raise RequestError(400, f'{name} must be from {lo} to {hi}')
+    return value
+
+
+def _float_param(value, name):
+    if value is None:
+        return None
+    try:
+        value = float(value)
+    except (TypeError, ValueError):
+        raise RequestError(400, f'{name} must be a number')
+    if not np.isfinite(value):
+        raise RequestError(400, f'{name} must be finite')
+    return value
+
+
+class PaintServer:
+    def __init__(self, space):
+        self.space = space
+        self.requests = 0
+        self.queries = 0
+        self.errors = 0
+        self.query_seconds = 0.
+
+    def stats(self):
+        info = _cached_mlab.cache_info()
+        return {
+            'paints': len(self.space),
+            'brands': len(self.space.trees),
+            'requests': self.requests,
+            'queries': self.queries,
+            'errors': self.errors,
+            'query_seconds': self.query_seconds,
+            'conversion_cache_hits': info.hits,
+            'conversion_cache_misses': info.misses
+        }
+
+    def nearest(self, params):
+        kinds = [kind for kind in QUERY_KINDS if kind in params]
+        if len(kinds) != 1:
+            raise RequestError(400, f'Give one of {", ".join(QUERY_KINDS)}')
+        kind = kinds[0]
+        color = parse_color(kind, params[kind][0])
+        point = _cached_mlab(kind, color)
+        if not np.isfinite(point).all():
+            raise RequestError(400, f'Cannot convert {kind} color {params[kind][0]}')
+        k = _int_param(params, 'k', DEFAULT_K, 1, MAX_K)
+        max_distance = _float_param(params.get('max_distance', [None])[0], 'max_distance')
+        indices, dists = self.space.nearest([point], k, params.get('brand'), max_distance)
+        self.queries += 1
+        return {'query': {kind: params[kind][0]}, 'mlab': [round(x, 3) for x in point],
+                'paints': self.space.paints(indices[0], dists[0])}
+
+    def batch(self, body):
+        try:
+            request = json.loads(body)
+        except ValueError as e:
+            raise RequestError(400, f'Invalid JSON: {e}')
+        if not isinstance(request, dict) or not isinstance(request.get('queries'), list):
+            raise RequestError(400, 'Expected an object with a "queries" list')
+        queries = request['queries']
+        if len(queries) > MAX_BATCH:
+            raise RequestError(400, f'At most {MAX_BATCH} queries per batch')
+        k = _int_param({'k': [request.get('k', DEFAULT_K)]}, 'k', DEFAULT_K, 1, MAX_K)
+        max_distance = _float_param(request.get('max_distance'), 'max_distance')
+        brands = request.get('brands')
+        if brands is not None and not (isinstance(brands, list) and
+                                       all(isinstance(brand, str) for brand in brands)):
+            raise RequestError(400, '"brands" must be a list of strings')
+
+        results = [None] * len(queries)
+        groups = {kind: ([], []) for kind in QUERY_KINDS}
+        for n, query in enumerate(queries):
+            if isinstance(query, str):
+                query = {'munsell': query}
+            kinds = [kind for kind in QUERY_KINDS if isinstance(query, dict) and kind in query]
+            if len(kinds) != 1:
+                results[n] = {'error': f'Give one of {", ".join(QUERY_KINDS)}'}
+                continue
+            color = query[kinds[0]]
+            if kinds[0] == 'munsell' and not isinstance(color, str):
+                results[n] = {'error': 'munsell must be a string'}
+                continue
+            if kinds[0] != 'munsell' and not (isinstance(color, list) and len(color) == 3 and
+                                              all(_is_number(x) for x in color)):
+                results[n] = {'error': f'{kinds[0]} must be a list of 3 finite numbers'}
+                continue
+            groups[kinds[0]][0].append(n)
+            groups[kinds[0]][1].append(color)
+
+        numbers, points = [], []
+        for kind, (kind_numbers, colors) in groups.items():
+            if not colors:
+                continue
+            mlab, errors = convert_colors(kind, colors)
+            for n, error in zip(kind_numbers, errors):
+                if error:
+                    results[n] = {'error': f'Cannot convert {kind} color {queries[n]}'}
+            numbers += [n for n, error in zip(kind_numbers, errors) if not error]
+            points.append(mlab[~errors])
+        if numbers:
+            indices, dists = self.space.nearest(np.concatenate(points), k, brands, max_distance)
+            for n, row_indices, row_dists in zip(numbers, indices, dists):
+                results[n] = self.space.paints(row_indices, row_dists)
+        self.queries += len(queries)
+        return {'results': results}
+
+    def respond(self, method, target, body):
+        '''Returns (status, content type, body).'''
+        url = urllib.parse.urlsplit(target)
+        if url.path == '/batch':
+            if method != 'POST':
+                raise RequestError(405, f'Method {method} not allowed')
+            result = self.batch(body)
+        elif method != 'GET':
+            raise RequestError(405, f'Method {method} not allowed')
+        elif url.path == '/nearest':
+            result = self.nearest(urllib.parse.parse_qs(url.query))
+        elif url.path == '/brands':
+            result = self.space.brands()
+        elif url.path == '/stats':
+            result = self.stats()
+        else:
+            raise RequestError(404, f'No such path {url.path}')
+        return (200, 'application/json', json.dumps(result).encode('utf-8'))
+
+    async def timed_respond(self, method, target, body):
+        '''respond(), counting requests, errors and time for /stats.'''
+        self.requests += 1
+        start = time.perf_counter()
+        try:
+            return self.respond(method, target, body)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self.query_seconds += time.perf_counter() - start
+
+    async def handle(self, reader, writer):
+        await serve_connection(reader, writer, self.timed_respond)
+
+    async def serve(self, host, port, socket_path=None):
+        if socket_path:
+            server = await asyncio.start_unix_server(self.handle, socket_path)
+            print(f'Serving {len(self.space)} paints on {socket_path}', file=sys.stderr)
+        else:
+            server = await asyncio.start_server(self.handle, host, port)
+            print(f'Serving {len(self.space)} paints on http://{host}:{port}/', file=sys.stderr)
+        async with server:
+            await server.serve_forever()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Serve nearest-paint queries.')
+    parser.add_argument(
+        'catalogs', nargs='+', help='Munsell CSV, Parquet or Feather files, or paint_catalog.py stores')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--socket', help='serve on a Unix socket instead of a TCP port')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    space = PaintSpace(read_paints(args.catalogs))
+    print(f'Indexed {len(space)} paints from {len(space.trees)} brands in '
+          f'{time.perf_counter() - start:.2f}s', file=sys.stderr)
+    try:
+        asyncio.run(PaintServer(space).serve(args.host, args.port, args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
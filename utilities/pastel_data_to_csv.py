@@ -1,13 +1,25 @@
 #!/usr/bin/env python3
 
-import colour
+import argparse
 import csv
+import itertools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
 
 import munsellkit as mkit
-import munsellkit.lindbloom as mlin
+
+from columnar import FORMATS, catalog_writer
+from munsell_cache import ALGORITHMS, get_converter
+
+
+DEFAULT_BRANDS = ['Sennelier', 'Unison', 'Nupastel']
+
+# Number of colors converted and written together.
+CHUNK_SIZE = 256
 
 
 class NamedColor:
@@ -18,16 +30,105 @@ class NamedColor:
 
 
 def read_jsonline(fname):
-    colors = []
+    '''Yields one dict per non-blank line of a .jsonl file.'''
     with open(fname) as f:
-        for line in f.readlines():
-            row = json.loads(line)
-            # cmyk = np.array([float(row[s])/100.0 for s in ['c', 'm', 'y', 'k']], dtype=float)
-            rgb = [min(255, max(0, int(row[s]))) for s in ['r', 'g', 'b']]
-            color = NamedColor(row['identifier'], [row['name']],
-                               rgb)
-            colors.append(color)
-        return colors
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_csv_rows(fname):
+    '''Yields one dict per data row of a .csv file.'''
+    with open(fname, newline='') as f:
+        yield from csv.DictReader(f)
+
+
+def read_rows(fname):
+    if os.path.splitext(fname)[1].lower() == '.csv':
+        return read_csv_rows(fname)
+    return read_jsonline(fname)
+
+
+def first_field(row, keys):
+    for key in keys:
+        value = row.get(key)
+        if value is not None and value != '':
+            return value
+    return None
+
+
+def parse_color(row):
+    '''Builds a NamedColor from a spider item (r, g, b fields) or a
+    CSV row (r, g, b or an HTML hex color).
+    '''
+    # cmyk = np.array([float(row[s])/100.0 for s in ['c', 'm', 'y', 'k']], dtype=float)
+    if all(first_field(row, [s, s.upper()]) is not None for s in ['r', 'g', 'b']):
+        rgb = [min(255, max(0, int(float(first_field(row, [s, s.upper()])))))
+               for s in ['r', 'g', 'b']]
+    else:
+        html = first_field(row, ['html', 'HTML RGB', 'hex'])
+        if html is None:
+            return None
+        html = html.lstrip('#')
+        rgb = [int(html[i:i+2], 16) for i in range(0, 6, 2)]
+    identifier = first_field(row, ['identifier', 'Identifier'])
+    name = first_field(row, ['name', 'Color Name'])
+    return NamedColor(identifier, [name], rgb)
+
+
+def parse_colors(rows):
+    for row in rows:
+        color = parse_color(row)
+        if color is None:
+            print(f'Skipping row without RGB data: {row}')
+            continue
+        yield color
+
+
+def batched(iterable, size):
+    it = iter(iterable)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def convert_batch(brand, colors, converter):
+    '''Returns CSV rows for a list of NamedColors.
+
+    Repeated RGB triples in the batch are converted only once.
+    '''
+    rgbs = np.array([color.rgb for color in colors], dtype=np.uint8)
+    unique_rgbs, inverse = np.unique(rgbs, axis=0, return_inverse=True)
+    normalized = [
+        mkit.normalized_color(spec, out='all')
+        for spec in converter.rgb_to_munsell_specifications(unique_rgbs.astype(int))]
+
+    rows = []
+    for color, rgb, ui in zip(colors, rgbs, inverse.reshape(-1)):
+        munsell_color, spec, hue = normalized[ui]
+        hue_shade, value, chroma, hue_index = spec
+        rows.append([
+            brand,
+            color.name,
+            munsell_color,
+            hue['total_hue'],
+            hue_shade,
+            hue['hue_name'],
+            hue['astm_hue'],
+            value,
+            chroma,
+            color.data[0],
+            f'#{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}'
+        ])
+    return rows
+
+
+def convert_colors(brand, colors, converter, chunk_size=CHUNK_SIZE):
+    for batch in batched(colors, chunk_size):
+        yield convert_batch(brand, batch, converter)
 
 
 COLUMNS = [
@@ -44,33 +145,66 @@ COLUMNS = [
     'HTML RGB'
 ]
 
-def generate_csv(brand):
-    colors = read_jsonline(f'{brand.lower()}.jsonl')
-    with open(f'{brand}Munsell.csv', 'w') as csvfile:
-        writer = csv.writer(csvfile)
-        writer.writerow(COLUMNS)
-        for ni, color in enumerate(colors):
-            hex = f'#{color.rgb[0]:02X}{color.rgb[1]:02X}{color.rgb[2]:02X}'
-            spec = mlin.rgb_to_munsell_specification(color.rgb[0], color.rgb[1], color.rgb[2])
-            munsell_color, spec, hue = mkit.normalized_color(spec, out='all')
-            hue_shade, value, chroma, hue_index = spec
-            row = [
-                brand,
-                color.name,
-                munsell_color,
-                hue['total_hue'],
-                hue_shade,
-                hue['hue_name'],
-                hue['astm_hue'],
-                value,
-                chroma,
-                color.data[0],
-                hex
-            ]
-            print(','.join([str(v) for v in row]))
-            writer.writerow(row)
+def generate_csv(brand, fname=None, chunk_size=CHUNK_SIZE, verbose=False, cache_path=None,
+                 algorithm='lindbloom', format='csv'):
+    '''Streams `fname` (default `<brand>.jsonl`) through the
+    read -> parse -> convert -> write pipeline into `<brand>Munsell.csv`
+    (or .parquet or .feather, by format). Returns the number of rows
+    written.
+    '''
+    if fname is None:
+        fname = f'{brand.lower()}.jsonl'
+    converter = get_converter(algorithm, cache_path)
+    count = 0
+    with catalog_writer(f'{brand}Munsell.{format}', COLUMNS, format) as writer:
+        colors = parse_colors(read_rows(fname))
+        for rows in convert_colors(brand, colors, converter, chunk_size):
+            if verbose:
+                for row in rows:
+                    print(','.join([str(v) for v in row]))
+            writer.writerows(rows)
+            count += len(rows)
+    print(f'{brand}: wrote {count} colors from {fname}')
+    print(f'{brand}: {converter.format_stats()}')
+    converter.flush()
+    return count
+
+
+def parse_brand(arg):
+    '''Parses "Brand" or "Brand=path/to/input.jsonl".'''
+    if '=' in arg:
+        brand, fname = arg.split('=', 1)
+        return (brand, fname)
+    return (arg, None)
+
 
 if __name__ == '__main__':
-    generate_csv('Sennelier')
-    generate_csv('Unison')
-    generate_csv('Nupastel')
+    parser = argparse.ArgumentParser(description='Convert spider color data to Munsell CSV files.')
+    parser.add_argument('brands', nargs='*', metavar='BRAND[=FILE]',
+                        help='brand name, optionally with a .jsonl or .csv input file (default: <brand>.jsonl)')
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE,
+                        help='number of colors converted per batch')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help='number of brands processed in parallel')
+    parser.add_argument('-v', '--verbose', action='store_true',
+                        help='print each converted row')
+    parser.add_argument('--cache', metavar='DB', default=None,
+                        help='SQLite file used to keep Munsell conversions between runs')
+    parser.add_argument('--algorithm', choices=list(ALGORITHMS), default='lindbloom',
+                        help='RGB to Munsell conversion ("lattice" converts each batch at once)')
+    parser.add_argument('--format', choices=FORMATS, default='csv',
+                        help='output file format (parquet and feather are typed, columnar files)')
+    args = parser.parse_args()
+
+    brands = [parse_brand(arg) for arg in (args.brands or DEFAULT_BRANDS)]
+    if args.jobs == 1 or len(brands) == 1:
+        for brand, fname in brands:
+            generate_csv(brand, fname, args.chunk_size, args.verbose, args.cache, args.algorithm,
+                         args.format)
+    else:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(generate_csv, brand, fname, args.chunk_size, args.verbose, args.cache,
+                                       args.algorithm, args.format)
+                       for brand, fname in brands]
+            for future in futures:
+                future.result()
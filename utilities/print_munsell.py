@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 
 import argparse
+import csv
+import itertools
+import json
+import sys
 import numpy as np
 
 import munsellkit as mkit
@@ -9,6 +13,11 @@ import munsellkit.lindbloom as mlin
 
 import colour
 
+from munsell_cache import get_converter
+from munsell_hues import hue_difference
+from jch_batch import jch_to_munsell_specifications
+from munsell_inversion import xyY_to_munsell_specifications
+
 
 # CIECAM JCh data from https://www.stilllifesmatter.com/single-post/2017/08/16/about-pigments
 
@@ -62,28 +71,268 @@ color_list = [
 ]
 
 
-def to_munsell(name, space, color):
+def convert(space, color):
     if space == 'rgb':
-        spec = mlin.rgb_to_munsell_specification(color[0], color[1], color[2])
+        return get_converter('lindbloom').rgb_to_munsell_specification(color[0], color[1], color[2])
+    elif space == 'rgb_mint':
+        return get_converter('minterpol').rgb_to_munsell_specification(color[0], color[1], color[2])
     elif space == 'jch_mint':
-        spec = mint.jch_to_munsell_specification(color)
+        return mint.jch_to_munsell_specification(color)
     elif space == 'jch_mlin':
-        spec = mlin.jch_to_munsell_specification(color)
+        return mlin.jch_to_munsell_specification(color)
     elif space == 'xyy':
-        spec = mint.xyY_to_munsell_specification(color)
+        return mint.xyY_to_munsell_specification(color)
+    elif space in BATCH_CONVERSIONS:
+        return convert_all(space, np.array([color]))[0]
+    raise ValueError(f'Unknown conversion {space}')
+
+
+# Conversions of a whole (N, 3) array at once
+BATCH_CONVERSIONS = ['rgb_lattice', 'jch_lattice', 'xyy_lattice']
+
+def convert_all(space, colors):
+    if space == 'rgb_lattice':
+        return get_converter('lattice').rgb_to_munsell_specifications(colors)
+    elif space == 'jch_lattice':
+        specs, _ = jch_to_munsell_specifications(colors)
+        return specs
+    elif space == 'xyy_lattice':
+        specs, _ = xyY_to_munsell_specifications(colors)
+        return specs
+    raise ValueError(f'Unknown batch conversion {space}')
+
+
+def to_munsell(name, space, color):
+    print_spec(name, space, convert(space, color))
+
+
+def print_spec(name, space, spec):
     munsell_color = mkit.normalized_color(spec, out='color')
     print(f'{name:10s} {space:8s} {munsell_color}')
 
 
+# Batch mode: rows of RGB, JCh or xyY read from CSV or JSONL files
+
+BATCH_SIZE = 256
+
+# Algorithms run by --compare
+COMPARE_ALGORITHMS = ['jch_mint', 'jch_mlin']
+
+INPUT_COLUMNS = {
+    'rgb': ['r', 'g', 'b'],
+    'jch': ['J', 'C', 'h'],
+    'xyy': ['x', 'y', 'Y']
+}
+
+ALGORITHMS = {
+    'rgb': ['rgb', 'rgb_mint', 'rgb_lattice'],
+    'jch': ['jch_mint', 'jch_mlin', 'jch_lattice'],
+    'xyy': ['xyy', 'xyy_lattice']
+}
+
+
+def batched(iterable, size):
+    it = iter(iterable)
+    while True:
+        batch = list(itertools.islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def open_inputs(paths):
+    for path in paths:
+        if path == '-':
+            yield (sys.stdin, path)
+        else:
+            with open(path, newline='') as f:
+                yield (f, path)
+
+
+def read_input_rows(paths, fmt=None):
+    '''Yields dict rows from CSV or JSONL files, or stdin for "-".
+    The format is taken from the file extension unless `fmt` is given.
+    '''
+    for f, path in open_inputs(paths):
+        row_fmt = fmt
+        if row_fmt is None:
+            row_fmt = 'jsonl' if path.endswith(('.jsonl', '.json')) else 'csv'
+        if row_fmt == 'jsonl':
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        else:
+            yield from csv.DictReader(f)
+
+
+def find_column(row, key):
+    for k in [key, key.lower(), key.upper()]:
+        if k in row and row[k] not in (None, ''):
+            return row[k]
+    return None
+
+
+def detect_space(row):
+    for space, keys in INPUT_COLUMNS.items():
+        if all(k in row for k in keys):
+            return space
+    if find_column(row, 'hex') is not None or find_column(row, 'html') is not None:
+        return 'rgb'
+    raise ValueError(f'Cannot find RGB, JCh or xyY columns in {list(row.keys())}')
+
+
+def parse_input_row(row, space, index):
+    '''Returns (name, array of shape (3,)) for an input row.'''
+    name = find_column(row, 'name') or find_column(row, 'identifier') or str(index)
+    if space == 'rgb' and not all(k in row for k in INPUT_COLUMNS['rgb']):
+        html = (find_column(row, 'hex') or find_column(row, 'html')).lstrip('#')
+        return (name, np.array([int(html[i:i+2], 16) for i in range(0, 6, 2)], dtype=float))
+    return (name, np.array([float(row[k]) for k in INPUT_COLUMNS[space]]))
+
+
+def convert_batch(colors, algorithms):
+    '''Converts an (N, 3) array through each algorithm.
+    Returns a dict of algorithm -> list of normalized (color, spec, hue) tuples.
+    Duplicate input rows are converted only once.
+    '''
+    unique, inverse = np.unique(colors, axis=0, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    results = dict()
+    for algorithm in algorithms:
+        if algorithm in BATCH_CONVERSIONS:
+            specs = convert_all(algorithm, unique)
+        else:
+            specs = [convert(algorithm, color) for color in unique]
+        normalized = [mkit.normalized_color(spec, out='all') for spec in specs]
+        results[algorithm] = [normalized[i] for i in inverse]
+    return results
+
+
+def compare_results(a, b):
+    '''Per-row disagreement between two normalized results.'''
+    _, spec_a, hue_a = a
+    _, spec_b, hue_b = b
+    h_a, h_b = float(hue_a['astm_hue']), float(hue_b['astm_hue'])
+    # Two neutrals agree on hue; a neutral and a chromatic color differ by NaN
+    dh = 0. if np.isnan(h_a) and np.isnan(h_b) else float(hue_difference(h_b, h_a))
+    dv = float(spec_b[1]) - float(spec_a[1])
+    dc = float(spec_b[2]) - float(spec_a[2])
+    return (dh, dv, dc)
+
+
+def output_columns(space, algorithms, compare):
+    columns = ['name'] + INPUT_COLUMNS[space]
+    for algorithm in algorithms:
+        columns += [algorithm, f'{algorithm}_astm_hue', f'{algorithm}_value', f'{algorithm}_chroma']
+    if compare:
+        columns += ['d_hue', 'd_value', 'd_chroma']
+    return columns
+
+
+def convert_rows(rows, space, algorithms, compare=False, batch_size=BATCH_SIZE):
+    '''Yields output rows (dicts) for the input rows.'''
+    index = 0
+    for batch in batched(rows, batch_size):
+        parsed = [parse_input_row(row, space, index + i) for i, row in enumerate(batch)]
+        index += len(batch)
+        colors = np.array([color for _, color in parsed])
+        results = convert_batch(colors, algorithms)
+        for i, (name, color) in enumerate(parsed):
+            out = {'name': name}
+            out.update(zip(INPUT_COLUMNS[space], color.tolist()))
+            for algorithm in algorithms:
+                munsell_color, spec, hue = results[algorithm][i]
+                out[algorithm] = munsell_color
+                out[f'{algorithm}_astm_hue'] = hue['astm_hue']
+                out[f'{algorithm}_value'] = spec[1]
+                out[f'{algorithm}_chroma'] = spec[2]
+            if compare:
+                out['d_hue'], out['d_value'], out['d_chroma'] = compare_results(
+                    results[COMPARE_ALGORITHMS[0]][i], results[COMPARE_ALGORITHMS[1]][i])
+            yield out
+
+
+def print_batch(paths, space=None, algorithms=None, compare=False, in_format=None,
+                out_format='csv', batch_size=BATCH_SIZE, out=sys.stdout):
+    rows = read_input_rows(paths, in_format)
+    first = next(rows, None)
+    if first is None:
+        return
+    if space is None:
+        space = detect_space(first)
+    if compare:
+        if space != 'jch':
+            raise ValueError('--compare requires JCh input')
+        if algorithms:
+            raise ValueError('--compare runs jch_mint and jch_mlin and cannot be combined with --algorithm')
+        algorithms = COMPARE_ALGORITHMS
+    elif not algorithms:
+        algorithms = ALGORITHMS[space][:1]
+    elif not all(algorithm in ALGORITHMS[space] for algorithm in algorithms):
+        raise ValueError(f'Algorithms for {space} input must be in {", ".join(ALGORITHMS[space])}')
+
+    columns = output_columns(space, algorithms, compare)
+    writer = None
+    if out_format == 'csv':
+        writer = csv.DictWriter(out, fieldnames=columns, lineterminator='\n')
+        writer.writeheader()
+
+    diffs = []
+    all_rows = itertools.chain([first], rows)
+    for row in convert_rows(all_rows, space, algorithms, compare, batch_size):
+        if writer:
+            writer.writerow(row)
+        else:
+            out.write(json.dumps({k: json_value(row[k]) for k in columns}) + '\n')
+        if compare:
+            diffs.append((row['d_hue'], row['d_value'], row['d_chroma']))
+
+    if compare and len(diffs) > 0:
+        diffs = np.abs(np.array(diffs))
+        for label, column in zip(['hue', 'value', 'chroma'], diffs.T):
+            print(f'jch_mint vs jch_mlin {label}: mean {column.mean():.3f} max {column.max():.3f}',
+                  file=sys.stderr)
+
+
+def json_value(v):
+    if isinstance(v, (np.floating, np.integer)):
+        v = v.item()
+    if isinstance(v, float) and np.isnan(v):
+        return None
+    return v
+
 
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Convert colors to Munsell.')
     parser.add_argument('name', type=str, nargs='?')
     parser.add_argument('space', type=str, nargs='?', help='jch or rgb only')
     parser.add_argument('spec', type=float, nargs='*')
+    parser.add_argument('-i', '--input', action='append', metavar='FILE',
+                        help='CSV or JSONL file of RGB, JCh or xyY rows, "-" for stdin; may be repeated')
+    parser.add_argument('--input-space', choices=list(INPUT_COLUMNS.keys()),
+                        help='input columns: r,g,b (or hex); J,C,h; or x,y,Y (default: detect)')
+    parser.add_argument('--input-format', choices=['csv', 'jsonl'],
+                        help='input file format (default: from file extension, csv for stdin)')
+    algorithm_group = parser.add_mutually_exclusive_group()
+    algorithm_group.add_argument('-a', '--algorithm', action='append',
+                        choices=['rgb', 'rgb_mint', 'rgb_lattice', 'jch_mint', 'jch_mlin', 'jch_lattice',
+                                 'xyy', 'xyy_lattice'],
+                        help='conversion to run on each input row; may be repeated')
+    algorithm_group.add_argument('--compare', action='store_true',
+                        help='report per-row disagreement between jch_mint and jch_mlin')
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv',
+                        help='output format for --input')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
     args = parser.parse_args()
 
-    if len(args.spec) == 3:
+    if args.input:
+        try:
+            print_batch(args.input, args.input_space, args.algorithm, args.compare,
+                        args.input_format, args.format, args.batch_size)
+        except ValueError as e:
+            parser.error(str(e))
+    elif len(args.spec) == 3:
         if args.name and args.space:
             to_munsell(args.name, args.space.lower(), np.array(args.spec))
         else:
@@ -0,0 +1,36 @@
+'''Draws text labels on PIL images from cached stamps.
+
+Page, card and book labels repeat across every image, so each (text,
+font) pair is rendered once into a mask, and drawing a label only
+pastes the mask.
+
+    draw_text(img, (x, y), '5R 4/14', font)
+    draw_text_ralign(img, (x, y), 'p. 3', font)  # right edge at x
+'''
+
+import functools
+
+from PIL import Image, ImageDraw
+
+
+@functools.lru_cache(maxsize=4096)
+def text_stamp(text, font):
+    '''Returns a mask with `text` rendered in `font`, and the offset of the
+    mask from the text origin.
+    '''
+    left, top, right, bottom = font.getbbox(text)
+    mask = Image.new('L', (max(1, right - left), max(1, bottom - top)), 0)
+    ImageDraw.Draw(mask).text((-left, -top), text, font=font, fill=255)
+    return (mask, (left, top))
+
+
+def draw_text(img, xy, text, font, fill='#000000'):
+    mask, (left, top) = text_stamp(text, font)
+    (x, y) = xy
+    img.paste(fill, (int(round(x)) + left, int(round(y)) + top), mask)
+
+
+def draw_text_ralign(img, xy, text, font):
+    w = font.getlength(text)
+    (x, y) = xy
+    draw_text(img, (x - w, y), text, font)
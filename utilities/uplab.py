@@ -0,0 +1,79 @@
+'''Batch uplab transforms.
+
+Array-in/array-out versions of munsellkit.lindbloom's uplab (Bruce
+Lindbloom's Uniform Perceptual Lab) conversions, giving the same values
+as the scalar functions:
+
+    uplab = rgb_to_uplab(rgbs)              # mlin.rgb_to_uplab, 8-bit sRGB
+    specs = uplab_to_specifications(uplab)  # mlin.uplab_to_munsell_specification
+    uplab = specifications_to_uplab(specs)  # mlin.munsell_specification_to_uplab
+
+Each distinct row is converted once by mlin and the results scattered
+back, so the repeated colors of catalogs and images cost nothing, and
+large arrays can be split across a process pool (workers).
+
+xyY_to_uplab is the vectorized inverse for measured colors: all the
+colors are inverted at once on the renotation lattice of
+munsell_inversion, which reports per-color convergence, iteration
+counts and residuals, and the specifications are then taken to uplab.
+
+    uplab, result = xyY_to_uplab(xyY)  # result['converged'], ['iterations'], ['residual']
+'''
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import munsellkit.lindbloom as mlin
+
+from munsell_inversion import invert, result_specifications
+
+
+# Rows per task when converting across a process pool
+CHUNK_SIZE = 1024
+
+
+def _rgb_to_uplab(rgb):
+    return mlin.rgb_to_uplab(rgb[0], rgb[1], rgb[2])
+
+
+def _map_unique(function, rows, width, workers=None):
+    '''Applies a scalar conversion to each distinct row of a 2-D array,
+    returning an (N, width) array.
+    '''
+    rows = np.asarray(rows, dtype=float)
+    rows = rows.reshape(-1, rows.shape[-1])
+    if len(rows) == 0:
+        return np.zeros((0, width))
+    unique, inverse = np.unique(rows, axis=0, return_inverse=True)
+    if workers and workers > 1 and len(unique) > CHUNK_SIZE:
+        with ProcessPoolExecutor(workers) as executor:
+            results = list(executor.map(function, unique, chunksize=CHUNK_SIZE))
+    else:
+        results = [function(row) for row in unique]
+    converted = np.array(results, dtype=float).reshape(-1, width)
+    return converted[inverse.reshape(-1)]
+
+
+def rgb_to_uplab(rgbs, workers=None):
+    '''(N, 3) sRGB, from 0 to 255 -> (N, 3) uplab.'''
+    return _map_unique(_rgb_to_uplab, rgbs, 3, workers)
+
+
+def uplab_to_specifications(uplab, workers=None):
+    '''(N, 3) uplab -> (N, 4) Munsell specifications.'''
+    return _map_unique(mlin.uplab_to_munsell_specification, uplab, 4, workers)
+
+
+def specifications_to_uplab(specs, workers=None):
+    '''(N, 4) Munsell specifications -> (N, 3) uplab.'''
+    return _map_unique(mlin.munsell_specification_to_uplab, specs, 3, workers)
+
+
+def xyY_to_uplab(xyY, iterations=32, tolerance=1e-6, workers=None):
+    '''(N, 3) xyY (illuminant C, Y from 0 to 1) -> ((N, 3) uplab, result),
+    where result is the munsell_inversion.invert() dict, with the
+    per-color 'converged', 'iterations' and 'residual' (xy distance).
+    '''
+    result = invert(xyY, iterations, tolerance)
+    return (specifications_to_uplab(result_specifications(result), workers), result)